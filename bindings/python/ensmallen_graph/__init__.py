@@ -1,8 +1,38 @@
-"""Module offering fast graph processing and graph datasets."""
-from .ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-from .ensmallen_graph import preprocessing  # pylint: disable=import-error
+"""Module offering fast graph processing and graph datasets.
+
+The compiled extension is loaded when one of its members is first
+accessed, so that importing the datasets sub-module alone stays cheap.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+    from .ensmallen_graph import preprocessing  # pylint: disable=import-error
 
 __all__ = [
     "EnsmallenGraph",
     "preprocessing"
 ]
+
+
+def __getattr__(name: str):
+    """Return the requested member of the compiled extension.
+
+    Parameters
+    -------------------
+    name: str,
+        The name of the member to retrieve.
+
+    Raises
+    -------------------
+    AttributeError,
+        If the requested member is not available.
+    """
+    if name not in __all__:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    value = getattr(import_module(".ensmallen_graph", __name__), name)
+    globals()[name] = value
+    return value
@@ -1 +1,8 @@
 """Module with datasets."""
+from .automatic_graph_retrieval import clear_cache
+from .graph_spec import GraphMetadata
+
+__all__ = [
+    "clear_cache",
+    "GraphMetadata"
+]
@@ -1,22 +1,141 @@
 import os
-from typing import Callable, List, Dict
-import compress_json
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Sequence, Tuple, TYPE_CHECKING
+import requests
 from downloaders import BaseDownloader
 
-from ..ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+from .graph_spec import get_graph_spec
+
+if TYPE_CHECKING:
+    from ..ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+# Directory where the graphs are stored by default. The retrieval methods
+# of the datasets store them in a sub-directory named after their dataset.
+DEFAULT_CACHE_DIRECTORY = "graphs"
+
+# Number of attempts to download the files of a graph, and delay in seconds
+# before the second attempt, doubled at each of the following ones.
+DOWNLOAD_ATTEMPTS = 3
+DOWNLOAD_RETRY_DELAY = 1.0
+# Errors of the download that are often transient, and are therefore retried.
+TRANSIENT_DOWNLOAD_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+# Maximum number of retrieved graphs kept in memory for reuse even after
+# they are no longer referenced elsewhere. Graphs can take gigabytes, so by
+# default none is kept: set it to a positive number to opt in, for instance
+# when the same graphs are repeatedly dropped and requested again.
+RETRIEVED_GRAPHS_CACHE_SIZE = 0
+
+# The graphs kept in memory, from the least to the most recently used.
+_retrieved_graphs: "OrderedDict[Tuple, EnsmallenGraph]" = OrderedDict()
+# The graphs retrieved so far that are still referenced somewhere, which are
+# released as soon as they are no longer referenced.
+_alive_retrieved_graphs: "weakref.WeakValueDictionary[Tuple, EnsmallenGraph]" = weakref.WeakValueDictionary()
+_retrieved_graphs_lock = threading.Lock()
+# Locks of the graphs currently being retrieved, so that concurrent requests
+# of the same graph wait for it to be built once instead of building it again.
+_retrieving_graphs_locks: Dict[Tuple, threading.Lock] = {}
+
+
+def clear_cache(graph_name: str = None, dataset: str = None):
+    """Remove the graphs retrieved so far from the in-memory cache.
+
+    The following requests rebuild the graphs from the files stored
+    in the cache path, without downloading them again.
+
+    Parameters
+    -------------------
+    graph_name: str = None,
+        The name of the graph to remove from the cache.
+        By default, the graphs are removed whatever their name.
+    dataset: str = None,
+        The dataset of the graphs to remove from the cache.
+        By default, the graphs are removed whatever their dataset.
+    """
+    with _retrieved_graphs_lock:
+        for cache in (_retrieved_graphs, _alive_retrieved_graphs):
+            for key in list(cache.keys()):
+                if (
+                    (graph_name is None or key[0] == graph_name) and
+                    (dataset is None or key[1] == dataset)
+                ):
+                    cache.pop(key, None)
+
+
+def advise_read_ahead(path: str):
+    """Advise the kernel that the given file is about to be read.
+
+    The file is then read ahead while the graph is being built, which
+    speeds up loading graphs whose files are not in the page cache.
+    The advice is skipped on platforms not supporting it.
+
+    Parameters
+    -------------------
+    path: str,
+        Path of the file to be read.
+    """
+    if not hasattr(os, "posix_fadvise") or not os.path.isfile(path):
+        return
+    file_descriptor = os.open(path, os.O_RDONLY)
+    try:
+        # Only the read ahead outlives the descriptor: access pattern
+        # advices would be limited to it.
+        os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(file_descriptor)
+
+
+def flush_to_disk(path: str):
+    """Flush to disk the given file, or the entries of the given directory.
+
+    The entries of a directory are flushed only on POSIX platforms, as the
+    others do not allow to open directories.
+
+    Parameters
+    -------------------
+    path: str,
+        Path of the file or of the directory to flush.
+    """
+    if os.name == "posix":
+        flags = os.O_RDONLY
+    elif os.path.isdir(path):
+        return
+    else:
+        flags = os.O_RDWR
+    file_descriptor = os.open(path, flags)
+    try:
+        os.fsync(file_descriptor)
+    finally:
+        os.close(file_descriptor)
 
 
 class AutomaticallyRetrievedGraph:
+    __slots__ = (
+        "_graph", "_directed", "_name", "_dataset", "_verbose", "_cache",
+        "_callbacks", "_additional_graph_kwargs", "_callbacks_arguments",
+        "_cache_path",
+    )
+
     def __init__(
         self,
         graph_name: str,
         dataset: str,
         directed: bool = False,
         verbose: int = 2,
-        cache_path: str = "graphs",
-        callbacks: List[Callable] = (),
-        callbacks_arguments: List[Dict] = (),
-        additional_graph_kwargs: Dict = None
+        cache_path: Optional[str] = DEFAULT_CACHE_DIRECTORY,
+        callbacks: Sequence[Callable] = (),
+        callbacks_arguments: Sequence[Dict] = (),
+        additional_graph_kwargs: Dict = None,
+        cache: bool = True
     ):
         """Create new automatically retrieved graph.
 
@@ -31,75 +150,279 @@ class AutomaticallyRetrievedGraph:
             By default false.
         verbose: int = 2,
             Wether to show loading bars.
-        cache_path: str = "graphs",
+        cache_path: Optional[str] = "graphs",
             Where to store the downloaded graphs.
-        callbacks: List[Callable] = (),
+            When None, the graphs are stored in `graphs/{dataset}`,
+            as done by the retrieval methods of the datasets.
+        callbacks: Sequence[Callable] = (),
             Eventual callbacks to call after download files.
-        callbacks_arguments: List[Dict] = (),
+        callbacks_arguments: Sequence[Dict] = (),
             Eventual arguments for callbacks.
         additional_graph_kwargs: Dict = None,
             Eventual additional kwargs for loading the graph.
+        cache: bool = True,
+            Wether to return the graph already retrieved with the same
+            parameters, if still in memory, and to keep the new graph for
+            reuse. The same instance is then shared by all such callers:
+            disable it to get a new instance of the graph, for instance
+            to modify it in place with `enable`.
 
         Raises
         -------------------
         ValueError,
             If the given graph name is not available.
         """
-        try:
-            self._graph = compress_json.local_load(os.path.join(
-                dataset,
-                "{}.json.gz".format(graph_name)
-            ))
-        except FileNotFoundError:
-            raise ValueError(
-                (
-                    "Requested graph `{}` is not currently available.\n"
-                    "Open an issue on the EnsmallenGraph repository to ask "
-                    "for this graph to be added."
-                ).format(graph_name)
+        self._graph = get_graph_spec(graph_name, dataset)
+        if cache_path is None:
+            cache_path = os.path.join(
+                DEFAULT_CACHE_DIRECTORY,
+                self._graph.dataset
             )
         self._directed = directed
-        self._name = graph_name
+        self._name = self._graph.name
+        self._dataset = self._graph.dataset
         self._verbose = verbose
+        self._cache = cache
         self._callbacks = callbacks
         if additional_graph_kwargs is None:
             additional_graph_kwargs = {}
         self._additional_graph_kwargs = additional_graph_kwargs
         self._callbacks_arguments = callbacks_arguments
-        self._cache_path = os.path.join(cache_path, graph_name)
-        self._downloader = BaseDownloader(
-            auto_extract=True,
-            target_directory=self._cache_path,
-            verbose=self._verbose,
-            process_number=1
-        )
+        self._cache_path = os.path.join(cache_path, self._name)
 
-    def __call__(self) -> EnsmallenGraph:
-        """Return EnsmallenGraph containing required graph."""
-        paths = self._graph.get("paths", None)
-        if paths is not None:
-            paths = [
-                os.path.join(self._cache_path, path)
-                for path in paths
-            ]
-        self._downloader.download(
-            self._graph["urls"],
-            paths
+    def _cache_key(self) -> Optional[Tuple]:
+        """Return key identifying the graph in the cache, if hashable.
+
+        The verbosity is not part of the key, as it does not change the
+        resulting graph.
+        """
+        key = (
+            self._name,
+            self._dataset,
+            self._directed,
+            os.path.abspath(self._cache_path),
+            tuple(sorted(self._additional_graph_kwargs.items())),
         )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __call__(self) -> "EnsmallenGraph":
+        """Return EnsmallenGraph containing required graph.
+
+        While a retrieved graph is still referenced somewhere, the following
+        calls with the same parameters return that very same instance,
+        until `clear_cache` is called: changes made to it, for instance
+        with `enable` or `set_name`, are seen by every caller. Once no longer
+        referenced, the graph is released and built again on the next call,
+        unless `RETRIEVED_GRAPHS_CACHE_SIZE` is set to keep it in memory.
+        Concurrent calls for the same graph wait for the first one to build
+        it. When the cache is disabled, a new graph is built on every call.
+        """
+        key = self._cache_key() if self._cache else None
+        if key is None:
+            return self._retrieve()
+        while True:
+            with _retrieved_graphs_lock:
+                graph = self._lookup(key)
+                if graph is not None:
+                    return graph
+                retrieving_lock = _retrieving_graphs_locks.setdefault(
+                    key,
+                    threading.Lock()
+                )
+            with retrieving_lock:
+                with _retrieved_graphs_lock:
+                    graph = self._lookup(key)
+                    is_current_lock = _retrieving_graphs_locks.get(
+                        key
+                    ) is retrieving_lock
+                if graph is not None:
+                    return graph
+                # The retrieval we were waiting for has failed and a newer
+                # request may already be retrieving the graph under its own
+                # lock, so we queue again on the current one.
+                if not is_current_lock:
+                    continue
+                try:
+                    graph = self._retrieve()
+                    with _retrieved_graphs_lock:
+                        self._store(key, graph)
+                        _alive_retrieved_graphs[key] = graph
+                finally:
+                    with _retrieved_graphs_lock:
+                        if _retrieving_graphs_locks.get(key) is retrieving_lock:
+                            del _retrieving_graphs_locks[key]
+                return graph
+
+    @classmethod
+    def _lookup(cls, key: Tuple) -> Optional["EnsmallenGraph"]:
+        """Return the graph already retrieved with the given key, if any.
+
+        Parameters
+        -------------------
+        key: Tuple,
+            Key identifying the graph in the cache.
+
+        Returns
+        -------------------
+        The graph, marked as the most recently used one, or None.
+        """
+        graph = _retrieved_graphs.get(key)
+        if graph is None:
+            graph = _alive_retrieved_graphs.get(key)
+        if graph is not None:
+            cls._store(key, graph)
+        return graph
+
+    @staticmethod
+    def _store(key: Tuple, graph: "EnsmallenGraph"):
+        """Store the graph as the most recently used one in the cache, if any.
+
+        Parameters
+        -------------------
+        key: Tuple,
+            Key identifying the graph in the cache.
+        graph: EnsmallenGraph,
+            The graph to store.
+        """
+        if RETRIEVED_GRAPHS_CACHE_SIZE <= 0:
+            return
+        _retrieved_graphs[key] = graph
+        _retrieved_graphs.move_to_end(key)
+        while len(_retrieved_graphs) > RETRIEVED_GRAPHS_CACHE_SIZE:
+            _retrieved_graphs.popitem(last=False)
+
+    def download(self):
+        """Download the files of the graph, if not already cached.
+
+        The files are downloaded and extracted into a temporary directory
+        next to the cache path, flushed to disk and only then renamed to the
+        cache path. A download interrupted in any way, even by a killed
+        process or a power loss, therefore never leaves a partial graph in
+        the cache path, which is considered complete whenever it exists.
+        The eventual callbacks are run on the downloaded files, so that
+        the graph can then be built without further I/O on the network.
+        """
+        if not os.path.isdir(self._cache_path):
+            parent_directory = os.path.dirname(os.path.abspath(self._cache_path))
+            os.makedirs(parent_directory, exist_ok=True)
+            download_directory = tempfile.mkdtemp(
+                prefix=".{}.".format(self._name),
+                suffix=".part",
+                dir=parent_directory
+            )
+            try:
+                self._download_files(download_directory)
+                for root, _, file_names in os.walk(download_directory):
+                    for file_name in file_names:
+                        flush_to_disk(os.path.join(root, file_name))
+                    flush_to_disk(root)
+                try:
+                    os.replace(download_directory, self._cache_path)
+                except OSError:
+                    # Another retrieval of the same graph may have completed
+                    # its download first, in which case we use its files.
+                    if not os.path.isdir(self._cache_path):
+                        raise
+                flush_to_disk(parent_directory)
+            finally:
+                shutil.rmtree(download_directory, ignore_errors=True)
         for callback, arguments in zip(self._callbacks, self._callbacks_arguments):
             callback(**{
                 key: os.path.join(self._cache_path, value)
                 if key.endswith("_path") else value
                 for key, value in arguments.items()
             })
+
+    def _download_files(self, directory: str):
+        """Download the files of the graph into the given directory.
+
+        The download is attempted again, after an increasing delay, when
+        it fails because of a connection error, a timeout or an interrupted
+        transfer, which are often transient. Any other error is raised
+        right away.
+
+        Parameters
+        -------------------
+        directory: str,
+            The directory where to download and extract the files.
+        """
+        paths = self._graph.paths
+        if paths is not None:
+            paths = [
+                os.path.join(directory, path)
+                for path in paths
+            ]
+        downloader = BaseDownloader(
+            auto_extract=True,
+            target_directory=directory,
+            verbose=self._verbose,
+            process_number=1
+        )
+        for attempt in range(DOWNLOAD_ATTEMPTS):
+            try:
+                downloader.download(list(self._graph.urls), paths)
+                break
+            except TRANSIENT_DOWNLOAD_ERRORS:
+                # The downloader removes the partially downloaded file, while
+                # the files already downloaded are not downloaded again.
+                if attempt == DOWNLOAD_ATTEMPTS - 1:
+                    raise
+                time.sleep(DOWNLOAD_RETRY_DELAY * 2 ** attempt)
+
+    def _retrieve(self) -> "EnsmallenGraph":
+        """Return EnsmallenGraph built from the downloaded files."""
+        # The compiled extension is only loaded once a graph is built.
+        from ..ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error,import-outside-toplevel
+        self.download()
+        arguments = {
+            key: os.path.join(self._cache_path, value)
+            if key.endswith("_path") else value
+            for key, value in self._graph.arguments
+        }
+        for key, value in arguments.items():
+            if key.endswith("_path"):
+                advise_read_ahead(value)
         return EnsmallenGraph.from_unsorted_csv(**{
-            **{
-                key: os.path.join(self._cache_path, value)
-                if key.endswith("_path") else value
-                for key, value in self._graph["arguments"].items()
-            },
+            **arguments,
             "directed": self._directed,
             "verbose": self._verbose > 0,
             "name": self._name,
             **self._additional_graph_kwargs,
         })
+
+
+def download_graph(
+    graph_name: str,
+    dataset: str,
+    verbose: int = 2,
+    cache_path: Optional[str] = None
+):
+    """Download the files of the requested graph without building it.
+
+    Parameters
+    -------------------
+    graph_name: str,
+        The name of the graph to download.
+    dataset: str,
+        Name of the dataset the graph belongs to.
+    verbose: int = 2,
+        Wether to show loading bars during the download.
+    cache_path: Optional[str] = None,
+        Where to store the downloaded graphs.
+        By default, the graphs are stored in `graphs/{dataset}`.
+
+    Raises
+    -------------------
+    ValueError,
+        If the given graph name is not available.
+    """
+    AutomaticallyRetrievedGraph(
+        graph_name=graph_name,
+        dataset=dataset,
+        verbose=verbose,
+        cache_path=cache_path
+    ).download()
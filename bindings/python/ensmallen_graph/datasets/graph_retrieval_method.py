@@ -0,0 +1,274 @@
+"""Callable retrieving a graph, documented on demand from its metadata."""
+import sys
+import textwrap
+from typing import Dict, Optional, TYPE_CHECKING
+
+from .automatic_graph_retrieval import (
+    AutomaticallyRetrievedGraph,
+    clear_cache,
+    download_graph
+)
+from .graph_spec import GraphMetadata, load_graph_metadata
+
+if TYPE_CHECKING:
+    from ..ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+
+DOCUMENTATION_MODEL = """Return new instance of the {graph_name} graph.
+
+The graph is automatically retrieved from the {repository_name} repository.
+
+Parameters
+-------------------
+directed: bool = False,
+    Wether to load the graph as directed or undirected.
+    By default false.
+verbose: int = 2,
+    Wether to show loading bars during the retrieval and building
+    of the graph.
+cache_path: str = None,
+    Where to store the downloaded graphs.
+    By default, the graphs are stored in `graphs/{dataset}`.
+cache: bool = True,
+    Wether to return the instance of the graph already retrieved with
+    the same parameters, if any. Disable it to get a new instance,
+    for instance to modify it in place with `enable`.
+additional_graph_kwargs: Dict,
+    Additional graph kwargs.
+
+Returns
+-----------------------
+Instace of {graph_name} graph.
+
+Report
+---------------------
+At the time of rendering these methods (please see datetime below), the graph
+had the following characteristics:
+
+Datetime: {datetime}
+
+{report}
+
+References
+---------------------
+Please cite the following if you use the data:
+
+{references}
+
+Usage example
+----------------------
+The usage of this graph is relatively straightforward:
+
+.. code:: python
+
+    # First import the function to retrieve the graph from the datasets
+    from ensmallen_graph.datasets.{dataset} import {graph_method_name}
+
+    # Then load the graph
+    graph = {graph_method_name}()
+
+    # Finally, you can do anything with it, for instance, compute its report:
+    print(graph)
+
+    # If you need to run a link prediction task with validation,
+    # you can split the graph using a connected holdout as follows:
+    train_graph, validation_graph = graph.connected_holdout(
+        # You can use an 80/20 split the holdout, for example.
+        train_size=0.8,
+        # The random state is used to reproduce the holdout.
+        random_state=42,
+        # Wether to show a loading bar.
+        verbose=True
+    )
+
+    # Remember that, if you need, you can enable the memory-time trade-offs:
+    train_graph.enable(
+        vector_sources=True,
+        vector_destinations=True,
+        vector_outbounds=True
+    )
+
+    # Consider using the methods made available in the Embiggen package
+    # to run graph embedding or link prediction tasks.
+"""
+
+
+class GraphDocumentation:
+    """Descriptor of the documentation of the graph retrieval methods.
+
+    When accessed on the class, it returns the class docstring, so that
+    `help` and `inspect.getdoc` keep working on the class itself, while
+    on an instance it returns the documentation of its graph.
+    """
+
+    def __init__(self, class_documentation: str):
+        """Create new graph documentation descriptor.
+
+        Parameters
+        -------------------
+        class_documentation: str,
+            The docstring of the class.
+        """
+        self._class_documentation = class_documentation
+
+    def __get__(
+        self,
+        instance: Optional["GraphRetrievalMethod"],
+        owner: type
+    ) -> str:
+        """Return the documentation of the class or of the instance graph."""
+        if instance is None:
+            return self._class_documentation
+        return instance._render_documentation()  # pylint: disable=protected-access
+
+
+class GraphRetrievalMethod:
+    """Callable retrieving a graph from one of the supported repositories.
+
+    The documentation of the graph, including its report, references and
+    usage example, is rendered from the graph metadata only when it is
+    requested, for instance by `help`, so that it is not kept in memory
+    for each of the available graphs.
+    """
+
+    __slots__ = ("_graph_method_name", "_dataset", "_repository_name")
+    __doc__ = GraphDocumentation(__doc__)
+
+    def __init__(
+        self,
+        graph_method_name: str,
+        dataset: str,
+        repository_name: str
+    ):
+        """Create new graph retrieval method.
+
+        Parameters
+        -------------------
+        graph_method_name: str,
+            The name of the graph to be retrieved and loaded.
+        dataset: str,
+            Name of the dataset to load data from.
+        repository_name: str,
+            Formatted name of the repository, used in the documentation.
+        """
+        # The names are interned, as they are used as keys of the
+        # specifications and graphs caches on each call.
+        self._graph_method_name = sys.intern(graph_method_name)
+        self._dataset = sys.intern(dataset)
+        self._repository_name = repository_name
+
+    def __call__(
+        self,
+        directed: bool = False,
+        verbose: int = 2,
+        cache_path: str = None,
+        cache: bool = True,
+        **additional_graph_kwargs: Dict
+    ) -> "EnsmallenGraph":
+        """Return new instance of the graph.
+
+        Parameters
+        -------------------
+        directed: bool = False,
+            Wether to load the graph as directed or undirected.
+            By default false.
+        verbose: int = 2,
+            Wether to show loading bars during the retrieval and building
+            of the graph.
+        cache_path: str = None,
+            Where to store the downloaded graphs.
+            By default, the graphs are stored in the `graphs` directory,
+            in a sub-directory named after the dataset.
+        cache: bool = True,
+            Wether to return the instance of the graph already retrieved
+            with the same parameters, if any. Disable it to get a new
+            instance, for instance to modify it in place with `enable`.
+        additional_graph_kwargs: Dict,
+            Additional graph kwargs.
+
+        Returns
+        -----------------------
+        Instace of the graph.
+        """
+        return AutomaticallyRetrievedGraph(
+            graph_name=self._graph_method_name,
+            dataset=self._dataset,
+            directed=directed,
+            verbose=verbose,
+            cache_path=cache_path,
+            cache=cache,
+            additional_graph_kwargs=additional_graph_kwargs
+        )()
+
+    def download(
+        self,
+        verbose: int = 2,
+        cache_path: str = None
+    ):
+        """Download the files of the graph without building it.
+
+        Parameters
+        -------------------
+        verbose: int = 2,
+            Wether to show loading bars during the download.
+        cache_path: str = None,
+            Where to store the downloaded graphs.
+            By default, the graphs are stored in the `graphs` directory,
+            in a sub-directory named after the dataset.
+        """
+        download_graph(
+            graph_name=self._graph_method_name,
+            dataset=self._dataset,
+            verbose=verbose,
+            cache_path=cache_path
+        )
+
+    def cache_clear(self):
+        """Remove the instances of this graph from the in-memory cache.
+
+        The following calls rebuild the graph from the files stored in the
+        cache path, for instance after these have been removed.
+        """
+        clear_cache(graph_name=self._graph_method_name, dataset=self._dataset)
+
+    @property
+    def __name__(self) -> str:
+        """Return the name of the graph retrieval method."""
+        return self._graph_method_name
+
+    def _load_metadata(self) -> Dict:
+        """Return the metadata stored for the graph."""
+        return load_graph_metadata(self._graph_method_name, self._dataset)
+
+    @property
+    def metadata(self) -> GraphMetadata:
+        """Return the statistics of the graph, as reported at rendering time.
+
+        The values are parsed from the stored report, so that for instance
+        `metadata.nodes_number` is an integer and `metadata.directed`
+        a boolean, without parsing the textual report.
+        """
+        return GraphMetadata.from_report(
+            self._load_metadata()["graph_json_report"]
+        )
+
+    def _render_documentation(self) -> str:
+        """Return the documentation of the graph, rendered from its metadata."""
+        metadata = self._load_metadata()
+        return DOCUMENTATION_MODEL.format(
+            graph_name=metadata["graph_name"],
+            graph_method_name=self._graph_method_name,
+            dataset=self._dataset,
+            repository_name=self._repository_name,
+            datetime=metadata["datetime"],
+            report=textwrap.fill(metadata["graph_textual_report"], width=75),
+            references="\n\n".join(metadata["citations"]),
+        )
+
+    def __repr__(self) -> str:
+        """Return representation of the graph retrieval method."""
+        return "{}(graph_method_name={!r}, dataset={!r})".format(
+            self.__class__.__name__,
+            self._graph_method_name,
+            self._dataset
+        )
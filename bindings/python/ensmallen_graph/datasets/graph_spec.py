@@ -0,0 +1,161 @@
+"""Description of where and how to retrieve one of the available graphs."""
+import os
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+import compress_json
+
+
+@dataclass(frozen=True)
+class GraphSpec:
+    """Files and loading arguments of one of the available graphs.
+
+    The specification does not depend on how the graph is requested, i.e.
+    on whether it is directed or on the cache path, so it is loaded once
+    from the stored metadata and shared by all the following requests.
+    Being shared, it is immutable and hashable: the loading arguments are
+    stored as a tuple of key and value pairs.
+    """
+
+    __slots__ = ("name", "dataset", "urls", "paths", "arguments")
+
+    name: str
+    dataset: str
+    urls: Tuple[str, ...]
+    paths: Optional[Tuple[str, ...]]
+    arguments: Tuple[Tuple[str, Any], ...]
+
+
+@dataclass(frozen=True)
+class GraphMetadata:
+    """Statistics of one of the available graphs, as reported at rendering time."""
+
+    name: str
+    directed: bool
+    has_weights: bool
+    has_node_types: bool
+    has_edge_types: bool
+    nodes_number: int
+    edges_number: int
+    undirected_edges_number: int
+    unique_node_types_number: int
+    unique_edge_types_number: int
+    self_loops_number: int
+    self_loops_rate: float
+    singletons: int
+    min_degree: int
+    max_degree: int
+    degree_mean: float
+    density: float
+
+    @classmethod
+    def from_report(cls, report: Dict[str, str]) -> "GraphMetadata":
+        """Return the metadata parsed from the given graph report.
+
+        Parameters
+        -------------------
+        report: Dict[str, str],
+            The report of the graph, with its values as strings.
+
+        Returns
+        -------------------
+        The metadata of the graph.
+        """
+        values = {}
+        for field in fields(cls):
+            value = report[field.name]
+            if field.type is bool:
+                value = value == "true"
+            else:
+                value = field.type(value)
+            values[field.name] = value
+        return cls(**values)
+
+
+def unavailable_graph_error(graph_name: str) -> ValueError:
+    """Return the error raised when the requested graph is not available.
+
+    Parameters
+    -------------------
+    graph_name: str,
+        The name of the requested graph.
+
+    Returns
+    -------------------
+    The error to raise.
+    """
+    return ValueError(
+        (
+            "Requested graph `{}` is not currently available.\n"
+            "Open an issue on the EnsmallenGraph repository to ask "
+            "for this graph to be added."
+        ).format(graph_name)
+    )
+
+
+@lru_cache(maxsize=128)
+def load_graph_metadata(graph_name: str, dataset: str) -> Dict:
+    """Return the metadata stored for the requested graph.
+
+    The most recently requested metadata are kept decompressed, as they
+    are used both to retrieve the graphs and to document them.
+
+    Parameters
+    -------------------
+    graph_name: str,
+        The name of the graph.
+    dataset: str,
+        Name of the dataset the graph belongs to.
+
+    Raises
+    -------------------
+    ValueError,
+        If the given graph name is not available.
+
+    Returns
+    -------------------
+    The metadata of the requested graph.
+    """
+    try:
+        return compress_json.local_load(os.path.join(
+            dataset,
+            "{}.json.gz".format(graph_name)
+        ))
+    except FileNotFoundError:
+        raise unavailable_graph_error(graph_name)
+
+
+@lru_cache(maxsize=None)
+def get_graph_spec(graph_name: str, dataset: str) -> GraphSpec:
+    """Return the specification of the requested graph.
+
+    Parameters
+    -------------------
+    graph_name: str,
+        The name of the graph to be retrieved and loaded.
+    dataset: str,
+        Name of the dataset to load data from.
+
+    Raises
+    -------------------
+    ValueError,
+        If the given graph name is not available.
+
+    Returns
+    -------------------
+    The specification of the requested graph.
+    """
+    graph = load_graph_metadata(graph_name, dataset)
+    paths = graph.get("paths", None)
+    # The dataset name is shared by every loader of the same repository,
+    # so we keep a single copy of it. The graph name belongs to a single
+    # loader, and is interned so that the specification shares the copy
+    # already interned by its retrieval method.
+    return GraphSpec(
+        name=sys.intern(graph_name),
+        dataset=sys.intern(dataset),
+        urls=tuple(graph["urls"]),
+        paths=None if paths is None else tuple(paths),
+        arguments=tuple(graph["arguments"].items()),
+    )
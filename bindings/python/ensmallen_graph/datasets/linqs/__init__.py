@@ -1,9 +1,88 @@
 """This sub-module offers methods to automatically retrieve the graphs from LINQS repository."""
+from typing import Dict, List, TYPE_CHECKING
 
+from ..parallel_graph_retrieval import load_many_graphs, prefetch_graphs
 from .citeseer import CiteSeer
 from .cora import Cora
 from .pubmeddiabetes import PubMedDiabetes
 
+if TYPE_CHECKING:
+    from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = None,
+    **kwargs: Dict
+) -> Dict[str, "EnsmallenGraph"]:
+    """Return dictionary with the requested graphs, retrieved in parallel.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to retrieve, for instance `["CiteSeer"]`.
+    max_workers: int = None,
+        Number of threads to use.
+        By default, one per graph up to the number of available CPUs.
+    **kwargs: Dict,
+        The kwargs to pass to each graph retrieval method.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+
+    Returns
+    -------------------
+    Dictionary with the retrieved graphs, by graph name.
+    """
+    return load_many_graphs(
+        {
+            graph_name: globals()[graph_name]
+            for graph_name in __all__
+        },
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = 6,
+    **kwargs: Dict
+):
+    """Download the files of the requested graphs in parallel.
+
+    The graphs are not built: the following calls to their retrieval
+    methods will find their files already in the cache path.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to download, for instance `["CiteSeer"]`.
+    max_workers: int = 6,
+        Number of concurrent downloads.
+    **kwargs: Dict,
+        The kwargs to pass to each graph download, such as the cache path.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+    """
+    prefetch_graphs(
+        "linqs",
+        AVAILABLE_GRAPHS,
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
 __all__ = [
 	"CiteSeer", "Cora", "PubMedDiabetes",
-]
\ No newline at end of file
+]
+
+# Names of the graphs available in this sub-module.
+AVAILABLE_GRAPHS = frozenset(__all__)
@@ -1,1195 +1,126 @@
-"""This sub-module offers methods to automatically retrieve the graphs from NetworkRepository repository."""
+"""This sub-module offers methods to automatically retrieve the graphs from NetworkRepository repository.
+
+The graph retrieval methods are built on first access from the names
+listed in `__all__` and the metadata stored alongside this file.
+"""
+from typing import Dict, List, TYPE_CHECKING
+
+from ..graph_retrieval_method import GraphRetrievalMethod
+from ..parallel_graph_retrieval import load_many_graphs, prefetch_graphs
+
+if TYPE_CHECKING:
+    from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+
+def __getattr__(name: str) -> GraphRetrievalMethod:
+    """Return the method to retrieve the graph with the given name.
+
+    Parameters
+    -------------------
+    name: str,
+        The name of the graph retrieval method, for instance `"Graph08blocks"`.
+
+    Raises
+    -------------------
+    AttributeError,
+        If the requested graph is not available.
+
+    Returns
+    -------------------
+    The method to retrieve the requested graph.
+    """
+    if name not in AVAILABLE_GRAPHS:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    graph_retrieval_method = GraphRetrievalMethod(
+        graph_method_name=name,
+        dataset="networkrepository",
+        repository_name="NetworkRepository"
+    )
+    # We store the method in the module so that the following accesses
+    # do not go through this function anymore.
+    globals()[name] = graph_retrieval_method
+    return graph_retrieval_method
+
+
+def __dir__() -> List[str]:
+    """Return the names available in this module."""
+    return sorted(set(globals()) | AVAILABLE_GRAPHS)
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = None,
+    **kwargs: Dict
+) -> Dict[str, "EnsmallenGraph"]:
+    """Return dictionary with the requested graphs, retrieved in parallel.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to retrieve, for instance `["Graph08blocks"]`.
+    max_workers: int = None,
+        Number of threads to use.
+        By default, one per graph up to the number of available CPUs.
+    **kwargs: Dict,
+        The kwargs to pass to each graph retrieval method.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+
+    Returns
+    -------------------
+    Dictionary with the retrieved graphs, by graph name.
+    """
+    return load_many_graphs(
+        {
+            # The methods already built are looked up in the module, so
+            # that they are not replaced by new instances.
+            graph_name: globals().get(graph_name) or __getattr__(graph_name)
+            for graph_name in graph_names
+            if graph_name in AVAILABLE_GRAPHS
+        },
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = 6,
+    **kwargs: Dict
+):
+    """Download the files of the requested graphs in parallel.
+
+    The graphs are not built: the following calls to their retrieval
+    methods will find their files already in the cache path.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to download, for instance `["Graph08blocks"]`.
+    max_workers: int = 6,
+        Number of concurrent downloads.
+    **kwargs: Dict,
+        The kwargs to pass to each graph download, such as the cache path.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+    """
+    prefetch_graphs(
+        "networkrepository",
+        AVAILABLE_GRAPHS,
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
 
-from .graph08blocks import Graph08blocks
-from .actor import Actor
-from .adaptive import Adaptive
-from .auto import Auto
-from .avessparrowsocial import AvesSparrowSocial
-from .avesweaversocial import AvesWeaverSocial
-from .aveswildbirdnetwork import AvesWildbirdNetwork
-from .biocecx import BioCeCx
-from .biocegn import BioCeGn
-from .biocegt import BioCeGt
-from .bioceht import BioCeHt
-from .biocelc import BioCeLc
-from .biocepg import BioCePg
-from .biocelegans import BioCelegans
-from .biocelegansdir import BioCelegansDir
-from .biocelegansneural import BioCelegansneural
-from .biodiseasome import BioDiseasome
-from .biodmcx import BioDmCx
-from .biodmht import BioDmHt
-from .biodmlc import BioDmLc
-from .biodmela import BioDmela
-from .biodrcx import BioDrCx
-from .biogridfissionyeast import BioGridFissionYeast
-from .biogridfruitfly import BioGridFruitfly
-from .biogridhuman import BioGridHuman
-from .biogridmouse import BioGridMouse
-from .biogridplant import BioGridPlant
-from .cacsphd import CaCsphd
-from .biogridyeast import BioGridYeast
-from .biohscx import BioHsCx
-from .biohsht import BioHsHt
-from .biohslc import BioHsLc
-from .biohumangene1 import BioHumanGene1
-from .biohumangene2 import BioHumanGene2
-from .biomousegene import BioMouseGene
-from .biosccc import BioScCc
-from .bioscgt import BioScGt
-from .bioscht import BioScHt
-from .biosclc import BioScLc
-from .bioscts import BioScTs
-from .biowormnetv3 import BioWormnetV3
-from .biowormnetv3benchmark import BioWormnetV3Benchmark
-from .bioyeast import BioYeast
-from .bioyeastproteininter import BioYeastProteinInter
-from .brock2001 import Brock2001
-from .brock2002 import Brock2002
-from .brock2003 import Brock2003
-from .brock2004 import Brock2004
-from .brock4001 import Brock4001
-from .brock4002 import Brock4002
-from .brock4003 import Brock4003
-from .brock4004 import Brock4004
-from .brock8001 import Brock8001
-from .brock8002 import Brock8002
-from .brock8003 import Brock8003
-from .brock8004 import Brock8004
-from .c10009 import C10009
-from .c1259 import C1259
-from .c20005 import C20005
-from .c20009 import C20009
-from .c2509 import C2509
-from .c40005 import C40005
-from .c5009 import C5009
-from .cfat2001 import CFat2001
-from .cfat2002 import CFat2002
-from .cfat2005 import CFat2005
-from .cfat5001 import CFat5001
-from .cfat50010 import CFat50010
-from .cfat5002 import CFat5002
-from .cfat5005 import CFat5005
-from .caaminer import CaAminer
-from .caastroph import CaAstroph
-from .caciteseer import CaCiteseer
-from .cacoauthorsdblp import CaCoauthorsDblp
-from .cacondmat import CaCondmat
-from .citpatent import CitPatent
-from .cadblp2010 import CaDblp2010
-from .cadblp2012 import CaDblp2012
-from .caerdos992 import CaErdos992
-from .cagrqc import CaGrqc
-from .cahepph import CaHepph
-from .cahollywood2009 import CaHollywood2009
-from .caimdb import CaImdb
-from .camathscinet import CaMathscinet
-from .biogridworm import BioGridWorm
-from .canetscience import CaNetscience
-from .channel500x100x100b050 import Channel500x100x100B050
-from .chesapeake import Chesapeake
-from .citdblp import CitDblp
-from .dbpedia import Dbpedia
-from .citationciteseer import Citationciteseer
-from .cl10k1d8l5 import Cl10k1d8L5
-from .cl10m1d8l5 import Cl10m1d8L5
-from .cnr2000 import Cnr2000
-from .coauthorsciteseer import Coauthorsciteseer
-from .connectus import Connectus
-from .copresenceinvs13 import CopresenceInvs13
-from .copresenceinvs15 import CopresenceInvs15
-from .copresencelh10 import CopresenceLh10
-from .copresencelyonschool import CopresenceLyonschool
-from .copresencesfhh import CopresenceSfhh
-from .copresencethiers13 import CopresenceThiers13
-from .cs4 import Cs4
-from .cti import Cti
-from .infeuroroad import InfEuroroad
-from .dd199 import Dd199
-from .dd21 import Dd21
-from .dd242 import Dd242
-from .dd349 import Dd349
-from .dd497 import Dd497
-from .dd6 import Dd6
-from .dd68 import Dd68
-from .dd687 import Dd687
-from .dsjc10005 import Dsjc10005
-from .dsjc5005 import Dsjc5005
-from .ecoeverglades import EcoEverglades
-from .ecoflorida import EcoFlorida
-from .ecofoodwebbaydry import EcoFoodwebBaydry
-from .ecofoodwebbaywet import EcoFoodwebBaywet
-from .ecomangwet import EcoMangwet
-from .ecostmarks import EcoStmarks
-from .econpsmigr2 import EconPsmigr2
-from .emaildnccorecipient import EmailDncCorecipient
-from .emailenron import EmailEnron
-from .emailenronlarge import EmailEnronLarge
-from .emailenrononly import EmailEnronOnly
-from .emaileu import EmailEu
-from .emailuniv import EmailUniv
-from .enzymes118 import Enzymes118
-from .enzymes123 import Enzymes123
-from .enzymes295 import Enzymes295
-from .enzymes296 import Enzymes296
-from .enzymes297 import Enzymes297
-from .enzymes8 import Enzymes8
-from .epinions import Epinions
-from .ermd import ErMd
-from .fbmessages import FbMessages
-from .fe4elt2 import Fe4elt2
-from .febody import FeBody
-from .feocean import FeOcean
-from .fesphere import FeSphere
-from .fetooth import FeTooth
-from .flickr import Flickr
-from .gen200p0944 import Gen200P0944
-from .gen200p0955 import Gen200P0955
-from .gen400p0955 import Gen400P0955
-from .gen400p0965 import Gen400P0965
-from .gen400p0975 import Gen400P0975
-from .hamming102 import Hamming102
-from .hamming104 import Hamming104
-from .hamming62 import Hamming62
-from .hamming64 import Hamming64
-from .hamming82 import Hamming82
-from .hamming84 import Hamming84
-from .hugetrace00000 import Hugetrace00000
-from .hugetrace00010 import Hugetrace00010
-from .hugetrace00020 import Hugetrace00020
-from .hugetric00000 import Hugetric00000
-from .hugetric00010 import Hugetric00010
-from .hugetric00020 import Hugetric00020
-from .imdb import Imdb
-from .chem97ztz import Chem97ztz
-from .infopenflights import InfOpenflights
-from .infpower import InfPower
-from .infroadnetca import InfRoadnetCa
-from .infroadnetpa import InfRoadnetPa
-from .infusair97 import InfUsair97
-from .johnson1624 import Johnson1624
-from .johnson3224 import Johnson3224
-from .johnson824 import Johnson824
-from .johnson844 import Johnson844
-from .keller4 import Keller4
-from .keller5 import Keller5
-from .keller6 import Keller6
-from .livejournal import Livejournal
-from .m14b import M14b
-from .manna27 import MannA27
-from .manna45 import MannA45
-from .manna81 import MannA81
-from .manna9 import MannA9
-from .orkut import Orkut
-from .phat10001 import PHat10001
-from .phat10002 import PHat10002
-from .phat10003 import PHat10003
-from .phat15001 import PHat15001
-from .phat15002 import PHat15002
-from .phat15003 import PHat15003
-from .phat3003 import PHat3003
-from .phat5001 import PHat5001
-from .phat5002 import PHat5002
-from .phat5003 import PHat5003
-from .phat7001 import PHat7001
-from .phat7002 import PHat7002
-from .phat7003 import PHat7003
-from .packing500x100x100b050 import Packing500x100x100B050
-from .polblogs import Polblogs
-from .san1000 import San1000
-from .san200071 import San200071
-from .san200072 import San200072
-from .san200091 import San200091
-from .san200092 import San200092
-from .san200093 import San200093
-from .san400051 import San400051
-from .san400071 import San400071
-from .san400072 import San400072
-from .san400073 import San400073
-from .san400091 import San400091
-from .sanr20007 import Sanr20007
-from .sanr20009 import Sanr20009
-from .sanr40005 import Sanr40005
-from .sanr40007 import Sanr40007
-from .sfhhconfsensor import SfhhConfSensor
-from .socepinions1 import SocEpinions1
-from .socsignbitcoinotc import SocSignBitcoinotc
-from .t60k import T60k
-from .techcaidarouterlevel import TechCaidarouterlevel
-from .venturilevel3 import Venturilevel3
-from .visualizeus import VisualizeUs
-from .wing import Wing
-from .yahoomsg import YahooMsg
-from .plc4030l5 import Plc4030L5
-from .plc6030l2 import Plc6030L2
-from .sw1000060d3l2 import Sw1000060d3L2
-from .sw1000060d3l5 import Sw1000060d3L5
-from .citeseer import Citeseer
-from .cora import Cora
-from .fbcmucarnegie49 import FbCmuCarnegie49
-from .gene import Gene
-from .iptrace import IpTrace
-from .proteinsall import ProteinsAll
-from .socblogcatalogasu import SocBlogcatalogAsu
-from .socflickrasu import SocFlickrAsu
-from .webspamdetection import WebSpamDetection
-from .webkbwisc import WebkbWisc
-from .afforkutuser2groups import AffOrkutUser2groups
-from .socfriendster import SocFriendster
-from .socorkutdir import SocOrkutDir
-from .socorkut import SocOrkut
-from .socsinaweibo import SocSinaweibo
-from .soctwitter2010 import SocTwitter2010
-from .soctwittermpisws import SocTwitterMpiSws
-from .techp2p import TechP2p
-from .erdos982 import Erdos982
-from .erdos991 import Erdos991
-from .csphd import Csphd
-from .epa import Epa
-from .webindochina2004all import WebIndochina2004All
-from .webit2004all import WebIt2004All
-from .websk2005all import WebSk2005All
-from .webuk2002all import WebUk2002All
-from .webuk2005all import WebUk2005All
-from .webwebbase2001all import WebWebbase2001All
-from .graph12month1 import Graph12month1
-from .graph130bit import Graph130bit
-from .graph145bit import Graph145bit
-from .graph162bit import Graph162bit
-from .graph176bit import Graph176bit
-from .graph192bit import Graph192bit
-from .graph208bit import Graph208bit
-from .graph3elt import Graph3elt
-from .cities import Cities
-from .eva import Eva
-from .ex1 import Ex1
-from .ex2 import Ex2
-from .erdos02 import Erdos02
-from .erdos971 import Erdos971
-from .erdos972 import Erdos972
-from .erdos981 import Erdos981
-from .netscience import Netscience
-from .rgg010 import Rgg010
-from .erdos992 import Erdos992
-from .g14 import G14
-from .g15 import G15
-from .g16 import G16
-from .g17 import G17
-from .g48 import G48
-from .g49 import G49
-from .g50 import G50
-from .g51 import G51
-from .g52 import G52
-from .g53 import G53
-from .g54 import G54
-from .glossgt import Glossgt
-from .harvard500 import Harvard500
-from .ig56 import Ig56
-from .ig57 import Ig57
-from .ig58 import Ig58
-from .ig59 import Ig59
-from .journals import Journals
-from .l import L
-from .ragusa16 import Ragusa16
-from .ragusa18 import Ragusa18
-from .roget import Roget
-from .smagri import Smagri
-from .smallw import Smallw
-from .tf10 import Tf10
-from .tf11 import Tf11
-from .tf12 import Tf12
-from .trec10 import Trec10
-from .trec4 import Trec4
-from .trec5 import Trec5
-from .trec6 import Trec6
-from .trec7 import Trec7
-from .trec8 import Trec8
-from .trec9 import Trec9
-from .usair97 import Usair97
-from .uspowergrid import Uspowergrid
-from .abb313 import Abb313
-from .adjnoun import Adjnoun
-from .arenasjazz import ArenasJazz
-from .arenasmeta import ArenasMeta
-from .ash219 import Ash219
-from .ash292 import Ash292
-from .ash331 import Ash331
-from .ash608 import Ash608
-from .ash85 import Ash85
-from .ash958 import Ash958
-from .bcspwr01 import Bcspwr01
-from .bcspwr02 import Bcspwr02
-from .bcspwr03 import Bcspwr03
-from .bcspwr04 import Bcspwr04
-from .bcspwr05 import Bcspwr05
-from .bcspwr06 import Bcspwr06
-from .bcspwr07 import Bcspwr07
-from .bcspwr08 import Bcspwr08
-from .bcspwr09 import Bcspwr09
-from .bcspwr10 import Bcspwr10
-from .bcsstm02 import Bcsstm02
-from .bcsstm05 import Bcsstm05
-from .bcsstm06 import Bcsstm06
-from .bcsstm08 import Bcsstm08
-from .bcsstm09 import Bcsstm09
-from .bcsstm11 import Bcsstm11
-from .bcsstm19 import Bcsstm19
-from .bcsstm20 import Bcsstm20
-from .bcsstm21 import Bcsstm21
-from .bcsstm22 import Bcsstm22
-from .bcsstm23 import Bcsstm23
-from .bcsstm24 import Bcsstm24
-from .bcsstm26 import Bcsstm26
-from .blckhole import Blckhole
-from .cage import Cage
-from .cage3 import Cage3
-from .cage4 import Cage4
-from .cage5 import Cage5
-from .cage6 import Cage6
-from .cage7 import Cage7
-from .celegansneural import Celegansneural
-from .contiguoususa import ContiguousUsa
-from .curtis54 import Curtis54
-from .diag import Diag
-from .divorce import Divorce
-from .dolphins import Dolphins
-from .egofacebook import EgoFacebook
-from .email import Email
-from .eris1176 import Eris1176
-from .farm import Farm
-from .foodwebbaydry import FoodwebBaydry
-from .foodwebbaywet import FoodwebBaywet
-from .football import Football
-from .gent113 import Gent113
-from .grid1 import Grid1
-from .grid2 import Grid2
-from .ibm32 import Ibm32
-from .infcontiguoususa import InfContiguousUsa
-from .jagmesh1 import Jagmesh1
-from .jagmesh2 import Jagmesh2
-from .jagmesh3 import Jagmesh3
-from .jagmesh4 import Jagmesh4
-from .jagmesh5 import Jagmesh5
-from .jagmesh6 import Jagmesh6
-from .jagmesh7 import Jagmesh7
-from .jagmesh8 import Jagmesh8
-from .jagmesh9 import Jagmesh9
-from .jazz import Jazz
-from .jgl009 import Jgl009
-from .jgl011 import Jgl011
-from .karate import Karate
-from .kleemin import Kleemin
-from .lesmis import Lesmis
-from .lop163 import Lop163
-from .lshp1009 import Lshp1009
-from .lshp1270 import Lshp1270
-from .lshp1561 import Lshp1561
-from .lshp1882 import Lshp1882
-from .lshp2233 import Lshp2233
-from .lshp2614 import Lshp2614
-from .lshp3025 import Lshp3025
-from .m3plates import M3plates
-from .maayanstelzl import MaayanStelzl
-from .maayanfaa import MaayanFaa
-from .maayanfigeys import MaayanFigeys
-from .maayanfoodweb import MaayanFoodweb
-from .maayanpdzbase import MaayanPdzbase
-from .maayanvidal import MaayanVidal
-from .minnesota import Minnesota
-from .miscfootball import MiscFootball
-from .misclesmis import MiscLesmis
-from .roadeuroroad import RoadEuroroad
-from .netz4504 import Netz4504
-from .odepb400 import Odepb400
-from .opsahlpowergrid import OpsahlPowergrid
-from .opsahlsouthernwomen import OpsahlSouthernwomen
-from .polbooks import Polbooks
-from .power import Power
-from .rajat02 import Rajat02
-from .rw136 import Rw136
-from .rw496 import Rw496
-from .sphere2 import Sphere2
-from .sphere3 import Sphere3
-from .stufe import Stufe
-from .techarenasjazz import TechArenasJazz
-from .techarenasmeta import TechArenasMeta
-from .ucidatagama import UcidataGama
-from .ucidatazachary import UcidataZachary
-from .uk import Uk
-from .ukerbe1 import Ukerbe1
-from .powerusgrid import PowerUsGrid
-from .powerbcspwr09 import PowerBcspwr09
-from .powerbcspwr10 import PowerBcspwr10
-from .powereris1176 import PowerEris1176
-from .infectdublin import InfectDublin
-from .infecthyper import InfectHyper
-from .cl10001d7trial1 import Cl10001d7Trial1
-from .cl10001d7trial2 import Cl10001d7Trial2
-from .cl10001d7trial3 import Cl10001d7Trial3
-from .cl10001d8trial1 import Cl10001d8Trial1
-from .cl10001d8trial2 import Cl10001d8Trial2
-from .cl10001d8trial3 import Cl10001d8Trial3
-from .cl10001d9trial1 import Cl10001d9Trial1
-from .cl10001d9trial2 import Cl10001d9Trial2
-from .cl10001d9trial3 import Cl10001d9Trial3
-from .cl10002d0trial1 import Cl10002d0Trial1
-from .cl10002d0trial2 import Cl10002d0Trial2
-from .cl10002d0trial3 import Cl10002d0Trial3
-from .cl10002d1trial1 import Cl10002d1Trial1
-from .cl10002d1trial2 import Cl10002d1Trial2
-from .cl10002d1trial3 import Cl10002d1Trial3
-from .sw10030d1trial1 import Sw10030d1Trial1
-from .sw10030d1trial2 import Sw10030d1Trial2
-from .sw10030d1trial3 import Sw10030d1Trial3
-from .sw10030d2trial1 import Sw10030d2Trial1
-from .sw10030d2trial2 import Sw10030d2Trial2
-from .sw10030d2trial3 import Sw10030d2Trial3
-from .sw10030d3trial1 import Sw10030d3Trial1
-from .sw10030d3trial2 import Sw10030d3Trial2
-from .sw10030d3trial3 import Sw10030d3Trial3
-from .sw10040d1trial1 import Sw10040d1Trial1
-from .sw10040d1trial2 import Sw10040d1Trial2
-from .sw10040d1trial3 import Sw10040d1Trial3
-from .sw10040d2trial1 import Sw10040d2Trial1
-from .sw10040d2trial2 import Sw10040d2Trial2
-from .sw10040d2trial3 import Sw10040d2Trial3
-from .sw10040d3trial1 import Sw10040d3Trial1
-from .sw10040d3trial2 import Sw10040d3Trial2
-from .sw10040d3trial3 import Sw10040d3Trial3
-from .sw10050d1trial1 import Sw10050d1Trial1
-from .sw10050d1trial2 import Sw10050d1Trial2
-from .sw10050d1trial3 import Sw10050d1Trial3
-from .sw10050d2trial1 import Sw10050d2Trial1
-from .sw10050d2trial2 import Sw10050d2Trial2
-from .sw10050d2trial3 import Sw10050d2Trial3
-from .sw10050d3trial1 import Sw10050d3Trial1
-from .sw10050d3trial2 import Sw10050d3Trial2
-from .sw10050d3trial3 import Sw10050d3Trial3
-from .sw10060d1trial1 import Sw10060d1Trial1
-from .sw10060d1trial2 import Sw10060d1Trial2
-from .sw10060d1trial3 import Sw10060d1Trial3
-from .sw10060d2trial1 import Sw10060d2Trial1
-from .sw10060d2trial2 import Sw10060d2Trial2
-from .sw10060d2trial3 import Sw10060d2Trial3
-from .sw10060d3trial1 import Sw10060d3Trial1
-from .sw10060d3trial2 import Sw10060d3Trial2
-from .sw10060d3trial3 import Sw10060d3Trial3
-from .sw100030d1trial1 import Sw100030d1Trial1
-from .sw100030d1trial2 import Sw100030d1Trial2
-from .sw100030d1trial3 import Sw100030d1Trial3
-from .sw100030d2trial1 import Sw100030d2Trial1
-from .sw100030d2trial2 import Sw100030d2Trial2
-from .sw100030d2trial3 import Sw100030d2Trial3
-from .sw100030d3trial1 import Sw100030d3Trial1
-from .sw100030d3trial2 import Sw100030d3Trial2
-from .sw100030d3trial3 import Sw100030d3Trial3
-from .sw100040d1trial1 import Sw100040d1Trial1
-from .sw100040d1trial2 import Sw100040d1Trial2
-from .sw100040d1trial3 import Sw100040d1Trial3
-from .sw100040d2trial1 import Sw100040d2Trial1
-from .sw100040d2trial2 import Sw100040d2Trial2
-from .sw100040d2trial3 import Sw100040d2Trial3
-from .sw100040d3trial1 import Sw100040d3Trial1
-from .sw100040d3trial2 import Sw100040d3Trial2
-from .sw100040d3trial3 import Sw100040d3Trial3
-from .sw100050d1trial1 import Sw100050d1Trial1
-from .sw100050d1trial2 import Sw100050d1Trial2
-from .sw100050d1trial3 import Sw100050d1Trial3
-from .sw100050d2trial1 import Sw100050d2Trial1
-from .sw100050d2trial2 import Sw100050d2Trial2
-from .sw100050d2trial3 import Sw100050d2Trial3
-from .sw100050d3trial1 import Sw100050d3Trial1
-from .sw100050d3trial2 import Sw100050d3Trial2
-from .sw100050d3trial3 import Sw100050d3Trial3
-from .sw100060d1trial1 import Sw100060d1Trial1
-from .sw100060d1trial2 import Sw100060d1Trial2
-from .sw100060d1trial3 import Sw100060d1Trial3
-from .sw100060d2trial1 import Sw100060d2Trial1
-from .sw100060d2trial2 import Sw100060d2Trial2
-from .sw100060d2trial3 import Sw100060d2Trial3
-from .sw100060d3trial1 import Sw100060d3Trial1
-from .sw100060d3trial2 import Sw100060d3Trial2
-from .sw100060d3trial3 import Sw100060d3Trial3
-from .roadchesapeake import RoadChesapeake
-from .roadminnesota import RoadMinnesota
-from .rtretweet import RtRetweet
-from .rttwittercopen import RtTwitterCopen
-from .socdolphins import SocDolphins
-from .socfirmhitech import SocFirmHiTech
-from .sockarate import SocKarate
-from .socstudentcoop import SocStudentCoop
-from .soctribes import SocTribes
-from .socwikivote import SocWikiVote
-from .socfbnipsego import SocfbNipsEgo
-from .techroutersrf import TechRoutersRf
-from .webepa import WebEpa
-from .webedu import WebEdu
-from .webpolblogs import WebPolblogs
-from .aa01 import Aa01
-from .alemdar import Alemdar
-from .california import California
-from .chem97zt import Chem97zt
-from .ex4 import Ex4
-from .fa import Fa
-from .g1 import G1
-from .g10 import G10
-from .g2 import G2
-from .g22 import G22
-from .g23 import G23
-from .g24 import G24
-from .g25 import G25
-from .g26 import G26
-from .g27 import G27
-from .g29 import G29
-from .g3 import G3
-from .g30 import G30
-from .g31 import G31
-from .g35 import G35
-from .g36 import G36
-from .g37 import G37
-from .g38 import G38
-from .g39 import G39
-from .g4 import G4
-from .g40 import G40
-from .g41 import G41
-from .g42 import G42
-from .g43 import G43
-from .g44 import G44
-from .g45 import G45
-from .g46 import G46
-from .g47 import G47
-from .g5 import G5
-from .g55 import G55
-from .g56 import G56
-from .g58 import G58
-from .g59 import G59
-from .g6 import G6
-from .g60 import G60
-from .g61 import G61
-from .g62 import G62
-from .g63 import G63
-from .g64 import G64
-from .g65 import G65
-from .g66 import G66
-from .g67 import G67
-from .g7 import G7
-from .g8 import G8
-from .g9 import G9
-from .ig510 import Ig510
-from .ig511 import Ig511
-from .ig512 import Ig512
-from .ig513 import Ig513
-from .kohonen import Kohonen
-from .l9 import L9
-from .lederberg import Lederberg
-from .odlis import Odlis
-from .oregon1 import Oregon1
-from .oregon2 import Oregon2
-from .pgpgiantcompo import Pgpgiantcompo
-from .scimet import Scimet
-from .tf13 import Tf13
-from .tf14 import Tf14
-from .tf15 import Tf15
-from .trec11 import Trec11
-from .aa03 import Aa03
-from .aa3 import Aa3
-from .aa4 import Aa4
-from .aa5 import Aa5
-from .aa6 import Aa6
-from .advogato import Advogato
-from .air02 import Air02
-from .air03 import Air03
-from .air04 import Air04
-from .air05 import Air05
-from .air06 import Air06
-from .airfoil1 import Airfoil1
-from .appu import Appu
-from .arenaspgp import ArenasPgp
-from .as22july06 import As22july06
-from .as735 import As735
-from .ascaida20071105 import AsCaida20071105
-from .as20000102 import As20000102
-from .barth import Barth
-from .barth4 import Barth4
-from .barth5 import Barth5
-from .bcsstm25 import Bcsstm25
-from .bcsstm39 import Bcsstm39
-from .bfly import Bfly
-from .biplane9 import Biplane9
-from .cahepth import CaHepth
-from .caopsahlcollaboration import CaOpsahlCollaboration
-from .cage8 import Cage8
-from .cage9 import Cage9
-from .cca import Cca
-from .ccc import Ccc
-from .cegb3024 import Cegb3024
-from .cegb3306 import Cegb3306
-from .coater1 import Coater1
-from .condmat import CondMat
-from .copter1 import Copter1
-from .crack import Crack
-from .crew1 import Crew1
-from .crystm01 import Crystm01
-from .data import Data
-from .dblpcite import DblpCite
-from .df2177 import Df2177
-from .dictionary28 import Dictionary28
-from .egogplus import EgoGplus
-from .egotwitter import EgoTwitter
-from .ford1 import Ford1
-from .fsfa import FsFa
-from .geom import Geom
-from .hepth import HepTh
-from .lasagnespanishbook import LasagneSpanishbook
-from .lock1074 import Lock1074
-from .lock2232 import Lock2232
-from .lock3491 import Lock3491
-from .lshp3466 import Lshp3466
-from .nasa4704 import Nasa4704
-from .opsahlopenflights import OpsahlOpenflights
-from .opsahlusairport import OpsahlUsairport
-from .p2pgnutella04 import P2pGnutella04
-from .p2pgnutella05 import P2pGnutella05
-from .p2pgnutella06 import P2pGnutella06
-from .p2pgnutella08 import P2pGnutella08
-from .p2pgnutella09 import P2pGnutella09
-from .p2pgnutella24 import P2pGnutella24
-from .p2pgnutella25 import P2pGnutella25
-from .p2pgnutella30 import P2pGnutella30
-from .pds10 import Pds10
-from .petsterfriendshipshamster import PetsterFriendshipsHamster
-from .petsterhamster import PetsterHamster
-from .pf2177 import Pf2177
-from .rajat01 import Rajat01
-from .rajat06 import Rajat06
-from .rajat07 import Rajat07
-from .rajat08 import Rajat08
-from .rajat09 import Rajat09
-from .rajat10 import Rajat10
-from .rw5151 import Rw5151
-from .se import Se
-from .shock9 import Shock9
-from .skirt import Skirt
-from .sstmodel import Sstmodel
-from .stufe10 import Stufe10
-from .techarenaspgp import TechArenasPgp
-from .techas22july06 import TechAs22july06
-from .techas735 import TechAs735
-from .wbcsstanford import WbCsStanford
-from .hospitalwardproximity import HospitalWardProximity
-from .cl100001d7trial1 import Cl100001d7Trial1
-from .cl100001d7trial2 import Cl100001d7Trial2
-from .cl100001d7trial3 import Cl100001d7Trial3
-from .cl100001d8trial1 import Cl100001d8Trial1
-from .cl100001d8trial2 import Cl100001d8Trial2
-from .cl100001d8trial3 import Cl100001d8Trial3
-from .cl100001d9trial1 import Cl100001d9Trial1
-from .cl100001d9trial2 import Cl100001d9Trial2
-from .cl100001d9trial3 import Cl100001d9Trial3
-from .cl100002d0trial1 import Cl100002d0Trial1
-from .cl100002d0trial2 import Cl100002d0Trial2
-from .cl100002d0trial3 import Cl100002d0Trial3
-from .cl100002d1trial1 import Cl100002d1Trial1
-from .cl100002d1trial2 import Cl100002d1Trial2
-from .cl100002d1trial3 import Cl100002d1Trial3
-from .sw1000030d1trial1 import Sw1000030d1Trial1
-from .sw1000030d1trial2 import Sw1000030d1Trial2
-from .sw1000030d1trial3 import Sw1000030d1Trial3
-from .sw1000030d2trial1 import Sw1000030d2Trial1
-from .sw1000030d2trial2 import Sw1000030d2Trial2
-from .sw1000030d2trial3 import Sw1000030d2Trial3
-from .sw1000030d3trial1 import Sw1000030d3Trial1
-from .sw1000030d3trial2 import Sw1000030d3Trial2
-from .sw1000030d3trial3 import Sw1000030d3Trial3
-from .sw1000040d1trial1 import Sw1000040d1Trial1
-from .sw1000040d1trial2 import Sw1000040d1Trial2
-from .sw1000040d1trial3 import Sw1000040d1Trial3
-from .sw1000040d2trial1 import Sw1000040d2Trial1
-from .sw1000040d2trial2 import Sw1000040d2Trial2
-from .sw1000040d2trial3 import Sw1000040d2Trial3
-from .sw1000040d3trial1 import Sw1000040d3Trial1
-from .sw1000040d3trial2 import Sw1000040d3Trial2
-from .sw1000040d3trial3 import Sw1000040d3Trial3
-from .sw1000050d1trial1 import Sw1000050d1Trial1
-from .sw1000050d1trial2 import Sw1000050d1Trial2
-from .sw1000050d1trial3 import Sw1000050d1Trial3
-from .sw1000050d2trial1 import Sw1000050d2Trial1
-from .sw1000050d2trial2 import Sw1000050d2Trial2
-from .sw1000050d2trial3 import Sw1000050d2Trial3
-from .sw1000050d3trial1 import Sw1000050d3Trial1
-from .sw1000050d3trial2 import Sw1000050d3Trial2
-from .sw1000050d3trial3 import Sw1000050d3Trial3
-from .sw1000060d1trial1 import Sw1000060d1Trial1
-from .sw1000060d1trial2 import Sw1000060d1Trial2
-from .sw1000060d1trial3 import Sw1000060d1Trial3
-from .sw1000060d2trial1 import Sw1000060d2Trial1
-from .sw1000060d2trial2 import Sw1000060d2Trial2
-from .sw1000060d2trial3 import Sw1000060d2Trial3
-from .sw1000060d3trial1 import Sw1000060d3Trial1
-from .sw1000060d3trial2 import Sw1000060d3Trial2
-from .sw1000060d3trial3 import Sw1000060d3Trial3
-from .socadvogato import SocAdvogato
-from .socanybeat import SocAnybeat
-from .sochamsterster import SocHamsterster
-from .socfbamherst41 import SocfbAmherst41
-from .socfbbowdoin47 import SocfbBowdoin47
-from .socfbcaltech36 import SocfbCaltech36
-from .socfbhamilton46 import SocfbHamilton46
-from .socfbhaverford76 import SocfbHaverford76
-from .socfbmich67 import SocfbMich67
-from .socfboberlin44 import SocfbOberlin44
-from .socfbreed98 import SocfbReed98
-from .socfbsimmons81 import SocfbSimmons81
-from .socfbsmith60 import SocfbSmith60
-from .socfbswarthmore42 import SocfbSwarthmore42
-from .socfbusfca72 import SocfbUsfca72
-from .socfbwellesley22 import SocfbWellesley22
-from .techwhois import TechWhois
-from .techpgp import TechPgp
-from .techascaida2007 import TechAsCaida2007
-from .techinternetas import TechInternetAs
-from .webindochina2004 import WebIndochina2004
-from .webspam import WebSpam
-from .webwebbase2001 import WebWebbase2001
-from .camathscinetdir import CaMathscinetDir
-from .ex5 import Ex5
-from .ex6 import Ex6
-from .hepthnew import HepThNew
-from .ig514 import Ig514
-from .ig515 import Ig515
-from .ig516 import Ig516
-from .reuters911 import Reuters911
-from .tf16 import Tf16
-from .tf17 import Tf17
-from .trec12 import Trec12
-from .trec13 import Trec13
-from .affdbpediausers2country import AffDbpediaUsers2country
-from .affgithubuser2project import AffGithubUser2project
-from .ascaida import AsCaida
-from .astroph import AstroPh
-from .bas1lp import Bas1lp
-from .bcsstk29 import Bcsstk29
-from .bcsstk31 import Bcsstk31
-from .bcsstk32 import Bcsstk32
-from .bcsstk33 import Bcsstk33
-from .brack2 import Brack2
-from .cage10 import Cage10
-from .cage11 import Cage11
-from .caidarouterlevel import Caidarouterlevel
-from .cegb2802 import Cegb2802
-from .cegb2919 import Cegb2919
-from .cfindergoogle import CfinderGoogle
-from .cithepth2007 import CitHepth2007
-from .coauthorsdblp import Coauthorsdblp
-from .coater2 import Coater2
-from .comamazon import ComAmazon
-from .comyoutube import ComYoutube
-from .condmat2003 import CondMat2003
-from .copter2 import Copter2
-from .crplat2 import Crplat2
-from .crystm02 import Crystm02
-from .crystm03 import Crystm03
-from .cvxbqp1 import Cvxbqp1
-from .cyl6 import Cyl6
-from .dblp2010 import Dblp2010
-from .dbpediacountry import DbpediaCountry
-from .dbpediagenre import DbpediaGenre
-from .dbpedialocation import DbpediaLocation
-from .dbpediaoccupation import DbpediaOccupation
-from .dbpediaproducer import DbpediaProducer
-from .dbpediarecordlabel import DbpediaRecordlabel
-from .dbpediastarring import DbpediaStarring
-from .dbpediawriter import DbpediaWriter
-from .dixmaanl import Dixmaanl
-from .eat import Eat
-from .emaileuall import EmailEuall
-from .enron import Enron
-from .finance256 import Finance256
-from .foldoc import Foldoc
-from .ford2 import Ford2
-from .g3rmt3m3 import G3rmt3m3
-from .github import Github
-from .internet import Internet
-from .kl02 import Kl02
-from .linux import Linux
-from .lp1 import Lp1
-from .lpl1 import Lpl1
-from .miscreuters911 import MiscReuters911
-from .miscjungcodedep import MiscJungCodeDep
-from .mri1 import Mri1
-from .mri2 import Mri2
-from .net25 import Net25
-from .net50 import Net50
-from .net75 import Net75
-from .nw14 import Nw14
-from .opt1 import Opt1
-from .p2pgnutella31 import P2pGnutella31
-from .pcrystk02 import Pcrystk02
-from .pcrystk03 import Pcrystk03
-from .pfinan512 import Pfinan512
-from .pkustk01 import Pkustk01
-from .pkustk02 import Pkustk02
-from .pkustk09 import Pkustk09
-from .pli import Pli
-from .pwt import Pwt
-from .qa8fm import Qa8fm
-from .socslashdot0811 import SocSlashdot0811
-from .socslashdot0902 import SocSlashdot0902
-from .struct3 import Struct3
-from .struct4 import Struct4
-from .t03314l import T03314l
-from .t520 import T520
-from .techascaida import TechAsCaida
-from .tomographic1 import Tomographic1
-from .trdheim import Trdheim
-from .tube1 import Tube1
-from .tube2 import Tube2
-from .us04 import Us04
-from .usroads48 import Usroads48
-from .usroads import Usroads
-from .primaryschoolproximity import PrimarySchoolProximity
-from .cl1000001d7trial1 import Cl1000001d7Trial1
-from .cl1000001d7trial2 import Cl1000001d7Trial2
-from .cl1000001d7trial3 import Cl1000001d7Trial3
-from .cl1000001d8trial1 import Cl1000001d8Trial1
-from .cl1000001d8trial2 import Cl1000001d8Trial2
-from .cl1000001d8trial3 import Cl1000001d8Trial3
-from .cl1000001d9trial1 import Cl1000001d9Trial1
-from .cl1000001d9trial2 import Cl1000001d9Trial2
-from .cl1000001d9trial3 import Cl1000001d9Trial3
-from .cl1000002d0trial1 import Cl1000002d0Trial1
-from .cl1000002d0trial2 import Cl1000002d0Trial2
-from .cl1000002d0trial3 import Cl1000002d0Trial3
-from .cl1000002d1trial1 import Cl1000002d1Trial1
-from .cl1000002d1trial2 import Cl1000002d1Trial2
-from .cl1000002d1trial3 import Cl1000002d1Trial3
-from .roadluxembourgosm import RoadLuxembourgOsm
-from .roadusroads48 import RoadUsroads48
-from .roadusroads import RoadUsroads
-from .rthiggs import RtHiggs
-from .socbrightkite import SocBrightkite
-from .socdouban import SocDouban
-from .socepinions import SocEpinions
-from .socgowalla import SocGowalla
-from .socgplus import SocGplus
-from .socslashdottrustall import SocSlashdotTrustAll
-from .socslashdot import SocSlashdot
-from .soctwitterfollowsmun import SocTwitterFollowsMun
-from .soctwitterfollows import SocTwitterFollows
-from .socfbamerican75 import SocfbAmerican75
-from .socfbauburn71 import SocfbAuburn71
-from .socfbbc17 import SocfbBc17
-from .socfbbu10 import SocfbBu10
-from .socfbbaylor93 import SocfbBaylor93
-from .socfbberkeley13 import SocfbBerkeley13
-from .socfbbingham82 import SocfbBingham82
-from .socfbbrandeis99 import SocfbBrandeis99
-from .socfbbrown11 import SocfbBrown11
-from .socfbbucknell39 import SocfbBucknell39
-from .socfbcmu import SocfbCmu
-from .socfbcal65 import SocfbCal65
-from .socfbcarnegie49 import SocfbCarnegie49
-from .socfbcolgate88 import SocfbColgate88
-from .socfbcolumbia2 import SocfbColumbia2
-from .socfbcornell5 import SocfbCornell5
-from .socfbdartmouth6 import SocfbDartmouth6
-from .socfbduke14 import SocfbDuke14
-from .socfbemory27 import SocfbEmory27
-from .socfbgwu54 import SocfbGwu54
-from .socfbgeorgetown15 import SocfbGeorgetown15
-from .socfbharvard1 import SocfbHarvard1
-from .socfbhoward90 import SocfbHoward90
-from .socfbjmu79 import SocfbJmu79
-from .socfbjohnshopkins55 import SocfbJohnshopkins55
-from .socfblehigh96 import SocfbLehigh96
-from .socfbmit import SocfbMit
-from .socfbmit8 import SocfbMit8
-from .socfbmu78 import SocfbMu78
-from .socfbmaine59 import SocfbMaine59
-from .socfbmaryland58 import SocfbMaryland58
-from .socfbmiddlebury45 import SocfbMiddlebury45
-from .socfbmississippi66 import SocfbMississippi66
-from .socfbnyu9 import SocfbNyu9
-from .socfbnortheastern19 import SocfbNortheastern19
-from .socfbnorthwestern25 import SocfbNorthwestern25
-from .socfbnotredame57 import SocfbNotredame57
-from .socfbor import SocfbOr
-from .socfboklahoma97 import SocfbOklahoma97
-from .socfbpepperdine86 import SocfbPepperdine86
-from .socfbprinceton12 import SocfbPrinceton12
-from .socfbrice31 import SocfbRice31
-from .socfbrochester38 import SocfbRochester38
-from .socfbrutgers89 import SocfbRutgers89
-from .socfbsanta74 import SocfbSanta74
-from .socfbstanford3 import SocfbStanford3
-from .socfbsyracuse56 import SocfbSyracuse56
-from .socfbtemple83 import SocfbTemple83
-from .socfbtennessee95 import SocfbTennessee95
-from .socfbtrinity100 import SocfbTrinity100
-from .socfbtufts18 import SocfbTufts18
-from .socfbtulane29 import SocfbTulane29
-from .socfbuc33 import SocfbUc33
-from .socfbuc61 import SocfbUc61
-from .socfbuc64 import SocfbUc64
-from .socfbucf52 import SocfbUcf52
-from .socfbucla import SocfbUcla
-from .socfbucla26 import SocfbUcla26
-from .socfbucsb37 import SocfbUcsb37
-from .socfbucsc68 import SocfbUcsc68
-from .socfbucsd34 import SocfbUcsd34
-from .socfbuchicago30 import SocfbUchicago30
-from .socfbuconn import SocfbUconn
-from .socfbuconn91 import SocfbUconn91
-from .socfbumass92 import SocfbUmass92
-from .socfbunc28 import SocfbUnc28
-from .socfbupenn7 import SocfbUpenn7
-from .socfbusc35 import SocfbUsc35
-from .socfbusf51 import SocfbUsf51
-from .socfbuva16 import SocfbUva16
-from .socfbvanderbilt48 import SocfbVanderbilt48
-from .socfbvassar85 import SocfbVassar85
-from .socfbvermont70 import SocfbVermont70
-from .socfbvillanova62 import SocfbVillanova62
-from .socfbvirginia63 import SocfbVirginia63
-from .socfbwake73 import SocfbWake73
-from .socfbwashu32 import SocfbWashu32
-from .socfbwesleyan43 import SocfbWesleyan43
-from .socfbwilliam77 import SocfbWilliam77
-from .socfbwilliams40 import SocfbWilliams40
-from .socfbwisconsin87 import SocfbWisconsin87
-from .socfbyale4 import SocfbYale4
-from .techrlcaida import TechRlCaida
-from .techp2pgnutella import TechP2pGnutella
-from .websk2005 import WebSk2005
-from .copapersdblp import CoPapersDblp
-from .ig517 import Ig517
-from .ig518 import Ig518
-from .stanford import Stanford
-from .tf18 import Tf18
-from .tf19 import Tf19
-from .trec14 import Trec14
-from .actorcollaboration import ActorCollaboration
-from .actormovie import ActorMovie
-from .affamazoncopurchases import AffAmazonCopurchases
-from .affflickrusergroups import AffFlickrUserGroups
-from .affwikienarticlecat import AffWikiEnArticleCat
-from .affwikiwordbypage import AffWikiWordbypage
-from .amazon2008 import Amazon2008
-from .amazon0302 import Amazon0302
-from .amazon0312 import Amazon0312
-from .amazon0505 import Amazon0505
-from .amazon0601 import Amazon0601
-from .bcsstk30 import Bcsstk30
-from .caactorcollaboration import CaActorCollaboration
-from .cage12 import Cage12
-from .cage13 import Cage13
-from .citeuliketi import CiteulikeTi
-from .citeulikeui import CiteulikeUi
-from .citeulikeut import CiteulikeUt
-from .comdblp import ComDblp
-from .copapersciteseer import CoPapersCiteseer
-from .dblpauthor import DblpAuthor
-from .dbpediateam import DbpediaTeam
-from .debr import Debr
-from .engine import Engine
-from .fcondp2 import Fcondp2
-from .flickrgroupmemberships import FlickrGroupmemberships
-from .flickrlinks import FlickrLinks
-from .flickredges import Flickredges
-from .fullb import Fullb
-from .gearbox import Gearbox
-from .gottronexcellent import GottronExcellent
-from .gupta1 import Gupta1
-from .gupta2 import Gupta2
-from .gupta3 import Gupta3
-from .halfb import Halfb
-from .ins2 import Ins2
-from .mip1 import Mip1
-from .miscimdbbi import MiscImdbBi
-from .net100 import Net100
-from .net125 import Net125
-from .net150 import Net150
-from .net41 import Net41
-from .pattern1 import Pattern1
-from .pct20stif import Pct20stif
-from .petstercarnivore import PetsterCarnivore
-from .pkustk03 import Pkustk03
-from .pkustk04 import Pkustk04
-from .pkustk05 import Pkustk05
-from .pkustk06 import Pkustk06
-from .pkustk07 import Pkustk07
-from .pkustk08 import Pkustk08
-from .pkustk10 import Pkustk10
-from .pkustk11 import Pkustk11
-from .pkustk12 import Pkustk12
-from .pkustk13 import Pkustk13
-from .pkustk14 import Pkustk14
-from .rail2586 import Rail2586
-from .ramage02 import Ramage02
-from .roadnetca import RoadnetCa
-from .roadnetpa import RoadnetPa
-from .roadnettx import RoadnetTx
-from .s4dkt3m2 import S4dkt3m2
-from .sls import Sls
-from .srb1 import Srb1
-from .troll import Troll
-from .tsyl201 import Tsyl201
-from .wave import Wave
-from .webberkstan import WebBerkstan
-from .webgoogle import WebGoogle
-from .webnotredame import WebNotredame
-from .webstanford import WebStanford
-from .webbase1m import Webbase1m
-from .cl10000001d7trial1 import Cl10000001d7Trial1
-from .cl10000001d7trial2 import Cl10000001d7Trial2
-from .cl10000001d7trial3 import Cl10000001d7Trial3
-from .cl10000001d8trial1 import Cl10000001d8Trial1
-from .cl10000001d8trial2 import Cl10000001d8Trial2
-from .cl10000001d8trial3 import Cl10000001d8Trial3
-from .cl10000001d9trial1 import Cl10000001d9Trial1
-from .cl10000001d9trial2 import Cl10000001d9Trial2
-from .cl10000001d9trial3 import Cl10000001d9Trial3
-from .cl10000002d0trial1 import Cl10000002d0Trial1
-from .cl10000002d0trial2 import Cl10000002d0Trial2
-from .cl10000002d0trial3 import Cl10000002d0Trial3
-from .cl10000002d1trial1 import Cl10000002d1Trial1
-from .cl10000002d1trial2 import Cl10000002d1Trial2
-from .cl10000002d1trial3 import Cl10000002d1Trial3
-from .roadbelgiumosm import RoadBelgiumOsm
-from .roadgreatbritainosm import RoadGreatBritainOsm
-from .roaditalyosm import RoadItalyOsm
-from .roadnetherlandsosm import RoadNetherlandsOsm
-from .roadroadnetca import RoadRoadnetCa
-from .roadroadnetpa import RoadRoadnetPa
-from .rtretweetcrawl import RtRetweetCrawl
-from .scmsdoor import ScMsdoor
-from .scnasasrb import ScNasasrb
-from .scpkustk11 import ScPkustk11
-from .scpkustk13 import ScPkustk13
-from .scpwtk import ScPwtk
-from .scshipsec1 import ScShipsec1
-from .scshipsec5 import ScShipsec5
-from .socblogcatalog import SocBlogcatalog
-from .socfoursquare import SocFoursquare
-from .soclivemocha import SocLivemocha
-from .socacademia import SocAcademia
-from .socbuzznet import SocBuzznet
-from .soccatster import SocCatster
-from .socdelicious import SocDelicious
-from .socdigg import SocDigg
-from .socdogster import SocDogster
-from .socflickr import SocFlickr
-from .socflixster import SocFlixster
-from .socgoogleplus import SocGooglePlus
-from .soclastfm import SocLastfm
-from .soclocbrightkite import SocLocBrightkite
-from .socthemarker import SocThemarker
-from .socwikitalkdir import SocWikiTalkDir
-from .socyoutubesnap import SocYoutubeSnap
-from .socyoutube import SocYoutube
-from .socfbfsu53 import SocfbFsu53
-from .socfbindiana import SocfbIndiana
-from .socfbindiana69 import SocfbIndiana69
-from .socfbmsu24 import SocfbMsu24
-from .socfbmichigan23 import SocfbMichigan23
-from .socfbpenn94 import SocfbPenn94
-from .socfbtexas80 import SocfbTexas80
-from .socfbtexas84 import SocfbTexas84
-from .socfbuf import SocfbUf
-from .socfbuf21 import SocfbUf21
-from .socfbuga50 import SocfbUga50
-from .socfbuillinois import SocfbUillinois
-from .socfbuillinois20 import SocfbUillinois20
-from .webberkstandir import WebBerkstanDir
-from .webarabic2005 import WebArabic2005
-from .webbaidubaikerelated import WebBaiduBaikeRelated
-from .webgoogledir import WebGoogleDir
-from .webit2004 import WebIt2004
-from .webitalycnr2000 import WebItalycnr2000
-from .webwikichinternal import WebWikiChInternal
-from .webwikipedia2009 import WebWikipedia2009
-from .webclueweb09 import WebClueweb09
-from .petsterfriendshipscat import PetsterFriendshipsCat
-from .petsterfriendshipsdog import PetsterFriendshipsDog
-from .rail4284 import Rail4284
-from .reactome import Reactome
-from .roadasiaosm import RoadAsiaOsm
-from .roadgermanyosm import RoadGermanyOsm
-from .scldoor import ScLdoor
-from .sk2005 import Sk2005
-from .slashdotzoo import SlashdotZoo
-from .socflickrund import SocFlickrUnd
-from .sochighschoolmoreno import SocHighschoolMoreno
-from .soclivejournal07 import SocLivejournal07
-from .soclivejournal1 import SocLivejournal1
-from .techascaida20071105 import TechAsCaida20071105
-from .techip import TechIp
-from .twitter import Twitter
-from .uk2002 import Uk2002
-from .uk2005 import Uk2005
-from .webbaidubaike import WebBaiduBaike
-from .webclueweb0950m import WebClueweb0950m
-from .wikisignedk2 import WikisignedK2
-from .wordnetwords import WordnetWords
-from .youtubegroupmemberships import YoutubeGroupmemberships
-from .youtubelinks import YoutubeLinks
-from .zhishibaiduinternallink import ZhishiBaiduInternallink
-from .zhishibaidurelatedpages import ZhishiBaiduRelatedpages
-from .zhishihudonginternallink import ZhishiHudongInternallink
-from .zhishihudongrelatedpages import ZhishiHudongRelatedpages
-from .zhishizhwikiinternallink import ZhishiZhwikiInternallink
-from .arabic2005 import Arabic2005
-from .asskitter import AsSkitter
-from .cage15 import Cage15
-from .eu2005 import Eu2005
-from .graph598a import Graph598a
-from .indochina2004 import Indochina2004
-from .soclivejournalusergroups import SocLivejournalUserGroups
-from .socljournal2008 import SocLjournal2008
-from .socpokec import SocPokec
-from .socpokecrelationships import SocPokecRelationships
-from .socslashdotzoo import SocSlashdotZoo
-from .soctwitterhiggs import SocTwitterHiggs
-from .socfbaanon import SocfbAAnon
-from .socfbbanon import SocfbBAnon
-from .socfbkonect import SocfbKonect
-from .socfbuciuni import SocfbUciUni
-from .techasskitter import TechAsSkitter
-from .trecwt10g import TrecWt10g
-from .wbedu import WbEdu
-from .webcc12payleveldomain import WebCc12Payleveldomain
-from .webhudong import WebHudong
-from .webuk2005 import WebUk2005
-from .wikiencat import WikiEnCat
-from .wikitalk import WikiTalk
-from .affdigg import AffDigg
-from .cage14 import Cage14
-from .copapersdblp import CoPapersDblp
-from .dbpediaall import DbpediaAll
-from .it2004 import It2004
-from .livejournallinks import LivejournalLinks
-from .friendster import Friendster
-from .ljournal2008 import Ljournal2008
-from .orkutgroupmemberships import OrkutGroupmemberships
-from .orkutlinks import OrkutLinks
-from .patentcite import Patentcite
-from .patents import Patents
-from .screl9 import ScRel9
-from .hollywood2009 import Hollywood2009
-from .hugebubbles00000 import Hugebubbles00000
-from .in2004 import In2004
-from .livejournalgroupmemberships import LivejournalGroupmemberships
-from .socanuresidence import SocAnuResidence
-from .soclivejournal import SocLivejournal
-from .socphysicians import SocPhysicians
-from .copapersciteseer import CoPapersCiteseer
-from .dbpedialink import DbpediaLink
-from .graph144 import Graph144
-from .hugebubbles00010 import Hugebubbles00010
-from .roadroadusa import RoadRoadUsa
-from .citpatents import CitPatents
-from .libimseti import Libimseti
-from .graph3dtube import Graph3dtube
 
 __all__ = [
 	"Graph08blocks", "Actor", "Adaptive", "Auto", "AvesSparrowSocial", "AvesWeaverSocial",
@@ -1412,4 +343,7 @@ __all__ = [
 	"SocAnuResidence", "SocLivejournal", "SocPhysicians", "CoPapersCiteseer",
 	"DbpediaLink", "Graph144", "Hugebubbles00010", "RoadRoadUsa", "CitPatents",
 	"Libimseti", "Graph3dtube",
-]
\ No newline at end of file
+]
+
+# Names of the graphs available in this sub-module.
+AVAILABLE_GRAPHS = frozenset(__all__)
@@ -0,0 +1,1210 @@
+"""Type stubs of the methods to retrieve the graphs from NetworkRepository repository."""
+from typing import Dict, FrozenSet, List
+
+from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+from ..graph_retrieval_method import GraphRetrievalMethod
+
+AVAILABLE_GRAPHS: FrozenSet[str]
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = ...,
+    **kwargs: Dict
+) -> Dict[str, EnsmallenGraph]: ...
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = ...,
+    **kwargs: Dict
+) -> None: ...
+
+Aa01: GraphRetrievalMethod
+Aa03: GraphRetrievalMethod
+Aa3: GraphRetrievalMethod
+Aa4: GraphRetrievalMethod
+Aa5: GraphRetrievalMethod
+Aa6: GraphRetrievalMethod
+Abb313: GraphRetrievalMethod
+Actor: GraphRetrievalMethod
+ActorCollaboration: GraphRetrievalMethod
+ActorMovie: GraphRetrievalMethod
+Adaptive: GraphRetrievalMethod
+Adjnoun: GraphRetrievalMethod
+Advogato: GraphRetrievalMethod
+AffAmazonCopurchases: GraphRetrievalMethod
+AffDbpediaUsers2country: GraphRetrievalMethod
+AffDigg: GraphRetrievalMethod
+AffFlickrUserGroups: GraphRetrievalMethod
+AffGithubUser2project: GraphRetrievalMethod
+AffOrkutUser2groups: GraphRetrievalMethod
+AffWikiEnArticleCat: GraphRetrievalMethod
+AffWikiWordbypage: GraphRetrievalMethod
+Air02: GraphRetrievalMethod
+Air03: GraphRetrievalMethod
+Air04: GraphRetrievalMethod
+Air05: GraphRetrievalMethod
+Air06: GraphRetrievalMethod
+Airfoil1: GraphRetrievalMethod
+Alemdar: GraphRetrievalMethod
+Amazon0302: GraphRetrievalMethod
+Amazon0312: GraphRetrievalMethod
+Amazon0505: GraphRetrievalMethod
+Amazon0601: GraphRetrievalMethod
+Amazon2008: GraphRetrievalMethod
+Appu: GraphRetrievalMethod
+Arabic2005: GraphRetrievalMethod
+ArenasJazz: GraphRetrievalMethod
+ArenasMeta: GraphRetrievalMethod
+ArenasPgp: GraphRetrievalMethod
+As20000102: GraphRetrievalMethod
+As22july06: GraphRetrievalMethod
+As735: GraphRetrievalMethod
+AsCaida: GraphRetrievalMethod
+AsCaida20071105: GraphRetrievalMethod
+AsSkitter: GraphRetrievalMethod
+Ash219: GraphRetrievalMethod
+Ash292: GraphRetrievalMethod
+Ash331: GraphRetrievalMethod
+Ash608: GraphRetrievalMethod
+Ash85: GraphRetrievalMethod
+Ash958: GraphRetrievalMethod
+AstroPh: GraphRetrievalMethod
+Auto: GraphRetrievalMethod
+AvesSparrowSocial: GraphRetrievalMethod
+AvesWeaverSocial: GraphRetrievalMethod
+AvesWildbirdNetwork: GraphRetrievalMethod
+Barth: GraphRetrievalMethod
+Barth4: GraphRetrievalMethod
+Barth5: GraphRetrievalMethod
+Bas1lp: GraphRetrievalMethod
+Bcspwr01: GraphRetrievalMethod
+Bcspwr02: GraphRetrievalMethod
+Bcspwr03: GraphRetrievalMethod
+Bcspwr04: GraphRetrievalMethod
+Bcspwr05: GraphRetrievalMethod
+Bcspwr06: GraphRetrievalMethod
+Bcspwr07: GraphRetrievalMethod
+Bcspwr08: GraphRetrievalMethod
+Bcspwr09: GraphRetrievalMethod
+Bcspwr10: GraphRetrievalMethod
+Bcsstk29: GraphRetrievalMethod
+Bcsstk30: GraphRetrievalMethod
+Bcsstk31: GraphRetrievalMethod
+Bcsstk32: GraphRetrievalMethod
+Bcsstk33: GraphRetrievalMethod
+Bcsstm02: GraphRetrievalMethod
+Bcsstm05: GraphRetrievalMethod
+Bcsstm06: GraphRetrievalMethod
+Bcsstm08: GraphRetrievalMethod
+Bcsstm09: GraphRetrievalMethod
+Bcsstm11: GraphRetrievalMethod
+Bcsstm19: GraphRetrievalMethod
+Bcsstm20: GraphRetrievalMethod
+Bcsstm21: GraphRetrievalMethod
+Bcsstm22: GraphRetrievalMethod
+Bcsstm23: GraphRetrievalMethod
+Bcsstm24: GraphRetrievalMethod
+Bcsstm25: GraphRetrievalMethod
+Bcsstm26: GraphRetrievalMethod
+Bcsstm39: GraphRetrievalMethod
+Bfly: GraphRetrievalMethod
+BioCeCx: GraphRetrievalMethod
+BioCeGn: GraphRetrievalMethod
+BioCeGt: GraphRetrievalMethod
+BioCeHt: GraphRetrievalMethod
+BioCeLc: GraphRetrievalMethod
+BioCePg: GraphRetrievalMethod
+BioCelegans: GraphRetrievalMethod
+BioCelegansDir: GraphRetrievalMethod
+BioCelegansneural: GraphRetrievalMethod
+BioDiseasome: GraphRetrievalMethod
+BioDmCx: GraphRetrievalMethod
+BioDmHt: GraphRetrievalMethod
+BioDmLc: GraphRetrievalMethod
+BioDmela: GraphRetrievalMethod
+BioDrCx: GraphRetrievalMethod
+BioGridFissionYeast: GraphRetrievalMethod
+BioGridFruitfly: GraphRetrievalMethod
+BioGridHuman: GraphRetrievalMethod
+BioGridMouse: GraphRetrievalMethod
+BioGridPlant: GraphRetrievalMethod
+BioGridWorm: GraphRetrievalMethod
+BioGridYeast: GraphRetrievalMethod
+BioHsCx: GraphRetrievalMethod
+BioHsHt: GraphRetrievalMethod
+BioHsLc: GraphRetrievalMethod
+BioHumanGene1: GraphRetrievalMethod
+BioHumanGene2: GraphRetrievalMethod
+BioMouseGene: GraphRetrievalMethod
+BioScCc: GraphRetrievalMethod
+BioScGt: GraphRetrievalMethod
+BioScHt: GraphRetrievalMethod
+BioScLc: GraphRetrievalMethod
+BioScTs: GraphRetrievalMethod
+BioWormnetV3: GraphRetrievalMethod
+BioWormnetV3Benchmark: GraphRetrievalMethod
+BioYeast: GraphRetrievalMethod
+BioYeastProteinInter: GraphRetrievalMethod
+Biplane9: GraphRetrievalMethod
+Blckhole: GraphRetrievalMethod
+Brack2: GraphRetrievalMethod
+Brock2001: GraphRetrievalMethod
+Brock2002: GraphRetrievalMethod
+Brock2003: GraphRetrievalMethod
+Brock2004: GraphRetrievalMethod
+Brock4001: GraphRetrievalMethod
+Brock4002: GraphRetrievalMethod
+Brock4003: GraphRetrievalMethod
+Brock4004: GraphRetrievalMethod
+Brock8001: GraphRetrievalMethod
+Brock8002: GraphRetrievalMethod
+Brock8003: GraphRetrievalMethod
+Brock8004: GraphRetrievalMethod
+C10009: GraphRetrievalMethod
+C1259: GraphRetrievalMethod
+C20005: GraphRetrievalMethod
+C20009: GraphRetrievalMethod
+C2509: GraphRetrievalMethod
+C40005: GraphRetrievalMethod
+C5009: GraphRetrievalMethod
+CFat2001: GraphRetrievalMethod
+CFat2002: GraphRetrievalMethod
+CFat2005: GraphRetrievalMethod
+CFat5001: GraphRetrievalMethod
+CFat50010: GraphRetrievalMethod
+CFat5002: GraphRetrievalMethod
+CFat5005: GraphRetrievalMethod
+CaActorCollaboration: GraphRetrievalMethod
+CaAminer: GraphRetrievalMethod
+CaAstroph: GraphRetrievalMethod
+CaCiteseer: GraphRetrievalMethod
+CaCoauthorsDblp: GraphRetrievalMethod
+CaCondmat: GraphRetrievalMethod
+CaCsphd: GraphRetrievalMethod
+CaDblp2010: GraphRetrievalMethod
+CaDblp2012: GraphRetrievalMethod
+CaErdos992: GraphRetrievalMethod
+CaGrqc: GraphRetrievalMethod
+CaHepph: GraphRetrievalMethod
+CaHepth: GraphRetrievalMethod
+CaHollywood2009: GraphRetrievalMethod
+CaImdb: GraphRetrievalMethod
+CaMathscinet: GraphRetrievalMethod
+CaMathscinetDir: GraphRetrievalMethod
+CaNetscience: GraphRetrievalMethod
+CaOpsahlCollaboration: GraphRetrievalMethod
+Cage: GraphRetrievalMethod
+Cage10: GraphRetrievalMethod
+Cage11: GraphRetrievalMethod
+Cage12: GraphRetrievalMethod
+Cage13: GraphRetrievalMethod
+Cage14: GraphRetrievalMethod
+Cage15: GraphRetrievalMethod
+Cage3: GraphRetrievalMethod
+Cage4: GraphRetrievalMethod
+Cage5: GraphRetrievalMethod
+Cage6: GraphRetrievalMethod
+Cage7: GraphRetrievalMethod
+Cage8: GraphRetrievalMethod
+Cage9: GraphRetrievalMethod
+Caidarouterlevel: GraphRetrievalMethod
+California: GraphRetrievalMethod
+Cca: GraphRetrievalMethod
+Ccc: GraphRetrievalMethod
+Cegb2802: GraphRetrievalMethod
+Cegb2919: GraphRetrievalMethod
+Cegb3024: GraphRetrievalMethod
+Cegb3306: GraphRetrievalMethod
+Celegansneural: GraphRetrievalMethod
+CfinderGoogle: GraphRetrievalMethod
+Channel500x100x100B050: GraphRetrievalMethod
+Chem97zt: GraphRetrievalMethod
+Chem97ztz: GraphRetrievalMethod
+Chesapeake: GraphRetrievalMethod
+CitDblp: GraphRetrievalMethod
+CitHepth2007: GraphRetrievalMethod
+CitPatent: GraphRetrievalMethod
+CitPatents: GraphRetrievalMethod
+Citationciteseer: GraphRetrievalMethod
+Citeseer: GraphRetrievalMethod
+CiteulikeTi: GraphRetrievalMethod
+CiteulikeUi: GraphRetrievalMethod
+CiteulikeUt: GraphRetrievalMethod
+Cities: GraphRetrievalMethod
+Cl10000001d7Trial1: GraphRetrievalMethod
+Cl10000001d7Trial2: GraphRetrievalMethod
+Cl10000001d7Trial3: GraphRetrievalMethod
+Cl10000001d8Trial1: GraphRetrievalMethod
+Cl10000001d8Trial2: GraphRetrievalMethod
+Cl10000001d8Trial3: GraphRetrievalMethod
+Cl10000001d9Trial1: GraphRetrievalMethod
+Cl10000001d9Trial2: GraphRetrievalMethod
+Cl10000001d9Trial3: GraphRetrievalMethod
+Cl10000002d0Trial1: GraphRetrievalMethod
+Cl10000002d0Trial2: GraphRetrievalMethod
+Cl10000002d0Trial3: GraphRetrievalMethod
+Cl10000002d1Trial1: GraphRetrievalMethod
+Cl10000002d1Trial2: GraphRetrievalMethod
+Cl10000002d1Trial3: GraphRetrievalMethod
+Cl1000001d7Trial1: GraphRetrievalMethod
+Cl1000001d7Trial2: GraphRetrievalMethod
+Cl1000001d7Trial3: GraphRetrievalMethod
+Cl1000001d8Trial1: GraphRetrievalMethod
+Cl1000001d8Trial2: GraphRetrievalMethod
+Cl1000001d8Trial3: GraphRetrievalMethod
+Cl1000001d9Trial1: GraphRetrievalMethod
+Cl1000001d9Trial2: GraphRetrievalMethod
+Cl1000001d9Trial3: GraphRetrievalMethod
+Cl1000002d0Trial1: GraphRetrievalMethod
+Cl1000002d0Trial2: GraphRetrievalMethod
+Cl1000002d0Trial3: GraphRetrievalMethod
+Cl1000002d1Trial1: GraphRetrievalMethod
+Cl1000002d1Trial2: GraphRetrievalMethod
+Cl1000002d1Trial3: GraphRetrievalMethod
+Cl100001d7Trial1: GraphRetrievalMethod
+Cl100001d7Trial2: GraphRetrievalMethod
+Cl100001d7Trial3: GraphRetrievalMethod
+Cl100001d8Trial1: GraphRetrievalMethod
+Cl100001d8Trial2: GraphRetrievalMethod
+Cl100001d8Trial3: GraphRetrievalMethod
+Cl100001d9Trial1: GraphRetrievalMethod
+Cl100001d9Trial2: GraphRetrievalMethod
+Cl100001d9Trial3: GraphRetrievalMethod
+Cl100002d0Trial1: GraphRetrievalMethod
+Cl100002d0Trial2: GraphRetrievalMethod
+Cl100002d0Trial3: GraphRetrievalMethod
+Cl100002d1Trial1: GraphRetrievalMethod
+Cl100002d1Trial2: GraphRetrievalMethod
+Cl100002d1Trial3: GraphRetrievalMethod
+Cl10001d7Trial1: GraphRetrievalMethod
+Cl10001d7Trial2: GraphRetrievalMethod
+Cl10001d7Trial3: GraphRetrievalMethod
+Cl10001d8Trial1: GraphRetrievalMethod
+Cl10001d8Trial2: GraphRetrievalMethod
+Cl10001d8Trial3: GraphRetrievalMethod
+Cl10001d9Trial1: GraphRetrievalMethod
+Cl10001d9Trial2: GraphRetrievalMethod
+Cl10001d9Trial3: GraphRetrievalMethod
+Cl10002d0Trial1: GraphRetrievalMethod
+Cl10002d0Trial2: GraphRetrievalMethod
+Cl10002d0Trial3: GraphRetrievalMethod
+Cl10002d1Trial1: GraphRetrievalMethod
+Cl10002d1Trial2: GraphRetrievalMethod
+Cl10002d1Trial3: GraphRetrievalMethod
+Cl10k1d8L5: GraphRetrievalMethod
+Cl10m1d8L5: GraphRetrievalMethod
+Cnr2000: GraphRetrievalMethod
+CoPapersCiteseer: GraphRetrievalMethod
+CoPapersDblp: GraphRetrievalMethod
+Coater1: GraphRetrievalMethod
+Coater2: GraphRetrievalMethod
+Coauthorsciteseer: GraphRetrievalMethod
+Coauthorsdblp: GraphRetrievalMethod
+ComAmazon: GraphRetrievalMethod
+ComDblp: GraphRetrievalMethod
+ComYoutube: GraphRetrievalMethod
+CondMat: GraphRetrievalMethod
+CondMat2003: GraphRetrievalMethod
+Connectus: GraphRetrievalMethod
+ContiguousUsa: GraphRetrievalMethod
+CopresenceInvs13: GraphRetrievalMethod
+CopresenceInvs15: GraphRetrievalMethod
+CopresenceLh10: GraphRetrievalMethod
+CopresenceLyonschool: GraphRetrievalMethod
+CopresenceSfhh: GraphRetrievalMethod
+CopresenceThiers13: GraphRetrievalMethod
+Copter1: GraphRetrievalMethod
+Copter2: GraphRetrievalMethod
+Cora: GraphRetrievalMethod
+Crack: GraphRetrievalMethod
+Crew1: GraphRetrievalMethod
+Crplat2: GraphRetrievalMethod
+Crystm01: GraphRetrievalMethod
+Crystm02: GraphRetrievalMethod
+Crystm03: GraphRetrievalMethod
+Cs4: GraphRetrievalMethod
+Csphd: GraphRetrievalMethod
+Cti: GraphRetrievalMethod
+Curtis54: GraphRetrievalMethod
+Cvxbqp1: GraphRetrievalMethod
+Cyl6: GraphRetrievalMethod
+Data: GraphRetrievalMethod
+Dblp2010: GraphRetrievalMethod
+DblpAuthor: GraphRetrievalMethod
+DblpCite: GraphRetrievalMethod
+Dbpedia: GraphRetrievalMethod
+DbpediaAll: GraphRetrievalMethod
+DbpediaCountry: GraphRetrievalMethod
+DbpediaGenre: GraphRetrievalMethod
+DbpediaLink: GraphRetrievalMethod
+DbpediaLocation: GraphRetrievalMethod
+DbpediaOccupation: GraphRetrievalMethod
+DbpediaProducer: GraphRetrievalMethod
+DbpediaRecordlabel: GraphRetrievalMethod
+DbpediaStarring: GraphRetrievalMethod
+DbpediaTeam: GraphRetrievalMethod
+DbpediaWriter: GraphRetrievalMethod
+Dd199: GraphRetrievalMethod
+Dd21: GraphRetrievalMethod
+Dd242: GraphRetrievalMethod
+Dd349: GraphRetrievalMethod
+Dd497: GraphRetrievalMethod
+Dd6: GraphRetrievalMethod
+Dd68: GraphRetrievalMethod
+Dd687: GraphRetrievalMethod
+Debr: GraphRetrievalMethod
+Df2177: GraphRetrievalMethod
+Diag: GraphRetrievalMethod
+Dictionary28: GraphRetrievalMethod
+Divorce: GraphRetrievalMethod
+Dixmaanl: GraphRetrievalMethod
+Dolphins: GraphRetrievalMethod
+Dsjc10005: GraphRetrievalMethod
+Dsjc5005: GraphRetrievalMethod
+Eat: GraphRetrievalMethod
+EcoEverglades: GraphRetrievalMethod
+EcoFlorida: GraphRetrievalMethod
+EcoFoodwebBaydry: GraphRetrievalMethod
+EcoFoodwebBaywet: GraphRetrievalMethod
+EcoMangwet: GraphRetrievalMethod
+EcoStmarks: GraphRetrievalMethod
+EconPsmigr2: GraphRetrievalMethod
+EgoFacebook: GraphRetrievalMethod
+EgoGplus: GraphRetrievalMethod
+EgoTwitter: GraphRetrievalMethod
+Email: GraphRetrievalMethod
+EmailDncCorecipient: GraphRetrievalMethod
+EmailEnron: GraphRetrievalMethod
+EmailEnronLarge: GraphRetrievalMethod
+EmailEnronOnly: GraphRetrievalMethod
+EmailEu: GraphRetrievalMethod
+EmailEuall: GraphRetrievalMethod
+EmailUniv: GraphRetrievalMethod
+Engine: GraphRetrievalMethod
+Enron: GraphRetrievalMethod
+Enzymes118: GraphRetrievalMethod
+Enzymes123: GraphRetrievalMethod
+Enzymes295: GraphRetrievalMethod
+Enzymes296: GraphRetrievalMethod
+Enzymes297: GraphRetrievalMethod
+Enzymes8: GraphRetrievalMethod
+Epa: GraphRetrievalMethod
+Epinions: GraphRetrievalMethod
+ErMd: GraphRetrievalMethod
+Erdos02: GraphRetrievalMethod
+Erdos971: GraphRetrievalMethod
+Erdos972: GraphRetrievalMethod
+Erdos981: GraphRetrievalMethod
+Erdos982: GraphRetrievalMethod
+Erdos991: GraphRetrievalMethod
+Erdos992: GraphRetrievalMethod
+Eris1176: GraphRetrievalMethod
+Eu2005: GraphRetrievalMethod
+Eva: GraphRetrievalMethod
+Ex1: GraphRetrievalMethod
+Ex2: GraphRetrievalMethod
+Ex4: GraphRetrievalMethod
+Ex5: GraphRetrievalMethod
+Ex6: GraphRetrievalMethod
+Fa: GraphRetrievalMethod
+Farm: GraphRetrievalMethod
+FbCmuCarnegie49: GraphRetrievalMethod
+FbMessages: GraphRetrievalMethod
+Fcondp2: GraphRetrievalMethod
+Fe4elt2: GraphRetrievalMethod
+FeBody: GraphRetrievalMethod
+FeOcean: GraphRetrievalMethod
+FeSphere: GraphRetrievalMethod
+FeTooth: GraphRetrievalMethod
+Finance256: GraphRetrievalMethod
+Flickr: GraphRetrievalMethod
+FlickrGroupmemberships: GraphRetrievalMethod
+FlickrLinks: GraphRetrievalMethod
+Flickredges: GraphRetrievalMethod
+Foldoc: GraphRetrievalMethod
+FoodwebBaydry: GraphRetrievalMethod
+FoodwebBaywet: GraphRetrievalMethod
+Football: GraphRetrievalMethod
+Ford1: GraphRetrievalMethod
+Ford2: GraphRetrievalMethod
+Friendster: GraphRetrievalMethod
+FsFa: GraphRetrievalMethod
+Fullb: GraphRetrievalMethod
+G1: GraphRetrievalMethod
+G10: GraphRetrievalMethod
+G14: GraphRetrievalMethod
+G15: GraphRetrievalMethod
+G16: GraphRetrievalMethod
+G17: GraphRetrievalMethod
+G2: GraphRetrievalMethod
+G22: GraphRetrievalMethod
+G23: GraphRetrievalMethod
+G24: GraphRetrievalMethod
+G25: GraphRetrievalMethod
+G26: GraphRetrievalMethod
+G27: GraphRetrievalMethod
+G29: GraphRetrievalMethod
+G3: GraphRetrievalMethod
+G30: GraphRetrievalMethod
+G31: GraphRetrievalMethod
+G35: GraphRetrievalMethod
+G36: GraphRetrievalMethod
+G37: GraphRetrievalMethod
+G38: GraphRetrievalMethod
+G39: GraphRetrievalMethod
+G3rmt3m3: GraphRetrievalMethod
+G4: GraphRetrievalMethod
+G40: GraphRetrievalMethod
+G41: GraphRetrievalMethod
+G42: GraphRetrievalMethod
+G43: GraphRetrievalMethod
+G44: GraphRetrievalMethod
+G45: GraphRetrievalMethod
+G46: GraphRetrievalMethod
+G47: GraphRetrievalMethod
+G48: GraphRetrievalMethod
+G49: GraphRetrievalMethod
+G5: GraphRetrievalMethod
+G50: GraphRetrievalMethod
+G51: GraphRetrievalMethod
+G52: GraphRetrievalMethod
+G53: GraphRetrievalMethod
+G54: GraphRetrievalMethod
+G55: GraphRetrievalMethod
+G56: GraphRetrievalMethod
+G58: GraphRetrievalMethod
+G59: GraphRetrievalMethod
+G6: GraphRetrievalMethod
+G60: GraphRetrievalMethod
+G61: GraphRetrievalMethod
+G62: GraphRetrievalMethod
+G63: GraphRetrievalMethod
+G64: GraphRetrievalMethod
+G65: GraphRetrievalMethod
+G66: GraphRetrievalMethod
+G67: GraphRetrievalMethod
+G7: GraphRetrievalMethod
+G8: GraphRetrievalMethod
+G9: GraphRetrievalMethod
+Gearbox: GraphRetrievalMethod
+Gen200P0944: GraphRetrievalMethod
+Gen200P0955: GraphRetrievalMethod
+Gen400P0955: GraphRetrievalMethod
+Gen400P0965: GraphRetrievalMethod
+Gen400P0975: GraphRetrievalMethod
+Gene: GraphRetrievalMethod
+Gent113: GraphRetrievalMethod
+Geom: GraphRetrievalMethod
+Github: GraphRetrievalMethod
+Glossgt: GraphRetrievalMethod
+GottronExcellent: GraphRetrievalMethod
+Graph08blocks: GraphRetrievalMethod
+Graph12month1: GraphRetrievalMethod
+Graph130bit: GraphRetrievalMethod
+Graph144: GraphRetrievalMethod
+Graph145bit: GraphRetrievalMethod
+Graph162bit: GraphRetrievalMethod
+Graph176bit: GraphRetrievalMethod
+Graph192bit: GraphRetrievalMethod
+Graph208bit: GraphRetrievalMethod
+Graph3dtube: GraphRetrievalMethod
+Graph3elt: GraphRetrievalMethod
+Graph598a: GraphRetrievalMethod
+Grid1: GraphRetrievalMethod
+Grid2: GraphRetrievalMethod
+Gupta1: GraphRetrievalMethod
+Gupta2: GraphRetrievalMethod
+Gupta3: GraphRetrievalMethod
+Halfb: GraphRetrievalMethod
+Hamming102: GraphRetrievalMethod
+Hamming104: GraphRetrievalMethod
+Hamming62: GraphRetrievalMethod
+Hamming64: GraphRetrievalMethod
+Hamming82: GraphRetrievalMethod
+Hamming84: GraphRetrievalMethod
+Harvard500: GraphRetrievalMethod
+HepTh: GraphRetrievalMethod
+HepThNew: GraphRetrievalMethod
+Hollywood2009: GraphRetrievalMethod
+HospitalWardProximity: GraphRetrievalMethod
+Hugebubbles00000: GraphRetrievalMethod
+Hugebubbles00010: GraphRetrievalMethod
+Hugetrace00000: GraphRetrievalMethod
+Hugetrace00010: GraphRetrievalMethod
+Hugetrace00020: GraphRetrievalMethod
+Hugetric00000: GraphRetrievalMethod
+Hugetric00010: GraphRetrievalMethod
+Hugetric00020: GraphRetrievalMethod
+Ibm32: GraphRetrievalMethod
+Ig510: GraphRetrievalMethod
+Ig511: GraphRetrievalMethod
+Ig512: GraphRetrievalMethod
+Ig513: GraphRetrievalMethod
+Ig514: GraphRetrievalMethod
+Ig515: GraphRetrievalMethod
+Ig516: GraphRetrievalMethod
+Ig517: GraphRetrievalMethod
+Ig518: GraphRetrievalMethod
+Ig56: GraphRetrievalMethod
+Ig57: GraphRetrievalMethod
+Ig58: GraphRetrievalMethod
+Ig59: GraphRetrievalMethod
+Imdb: GraphRetrievalMethod
+In2004: GraphRetrievalMethod
+Indochina2004: GraphRetrievalMethod
+InfContiguousUsa: GraphRetrievalMethod
+InfEuroroad: GraphRetrievalMethod
+InfOpenflights: GraphRetrievalMethod
+InfPower: GraphRetrievalMethod
+InfRoadnetCa: GraphRetrievalMethod
+InfRoadnetPa: GraphRetrievalMethod
+InfUsair97: GraphRetrievalMethod
+InfectDublin: GraphRetrievalMethod
+InfectHyper: GraphRetrievalMethod
+Ins2: GraphRetrievalMethod
+Internet: GraphRetrievalMethod
+IpTrace: GraphRetrievalMethod
+It2004: GraphRetrievalMethod
+Jagmesh1: GraphRetrievalMethod
+Jagmesh2: GraphRetrievalMethod
+Jagmesh3: GraphRetrievalMethod
+Jagmesh4: GraphRetrievalMethod
+Jagmesh5: GraphRetrievalMethod
+Jagmesh6: GraphRetrievalMethod
+Jagmesh7: GraphRetrievalMethod
+Jagmesh8: GraphRetrievalMethod
+Jagmesh9: GraphRetrievalMethod
+Jazz: GraphRetrievalMethod
+Jgl009: GraphRetrievalMethod
+Jgl011: GraphRetrievalMethod
+Johnson1624: GraphRetrievalMethod
+Johnson3224: GraphRetrievalMethod
+Johnson824: GraphRetrievalMethod
+Johnson844: GraphRetrievalMethod
+Journals: GraphRetrievalMethod
+Karate: GraphRetrievalMethod
+Keller4: GraphRetrievalMethod
+Keller5: GraphRetrievalMethod
+Keller6: GraphRetrievalMethod
+Kl02: GraphRetrievalMethod
+Kleemin: GraphRetrievalMethod
+Kohonen: GraphRetrievalMethod
+L: GraphRetrievalMethod
+L9: GraphRetrievalMethod
+LasagneSpanishbook: GraphRetrievalMethod
+Lederberg: GraphRetrievalMethod
+Lesmis: GraphRetrievalMethod
+Libimseti: GraphRetrievalMethod
+Linux: GraphRetrievalMethod
+Livejournal: GraphRetrievalMethod
+LivejournalGroupmemberships: GraphRetrievalMethod
+LivejournalLinks: GraphRetrievalMethod
+Ljournal2008: GraphRetrievalMethod
+Lock1074: GraphRetrievalMethod
+Lock2232: GraphRetrievalMethod
+Lock3491: GraphRetrievalMethod
+Lop163: GraphRetrievalMethod
+Lp1: GraphRetrievalMethod
+Lpl1: GraphRetrievalMethod
+Lshp1009: GraphRetrievalMethod
+Lshp1270: GraphRetrievalMethod
+Lshp1561: GraphRetrievalMethod
+Lshp1882: GraphRetrievalMethod
+Lshp2233: GraphRetrievalMethod
+Lshp2614: GraphRetrievalMethod
+Lshp3025: GraphRetrievalMethod
+Lshp3466: GraphRetrievalMethod
+M14b: GraphRetrievalMethod
+M3plates: GraphRetrievalMethod
+MaayanFaa: GraphRetrievalMethod
+MaayanFigeys: GraphRetrievalMethod
+MaayanFoodweb: GraphRetrievalMethod
+MaayanPdzbase: GraphRetrievalMethod
+MaayanStelzl: GraphRetrievalMethod
+MaayanVidal: GraphRetrievalMethod
+MannA27: GraphRetrievalMethod
+MannA45: GraphRetrievalMethod
+MannA81: GraphRetrievalMethod
+MannA9: GraphRetrievalMethod
+Minnesota: GraphRetrievalMethod
+Mip1: GraphRetrievalMethod
+MiscFootball: GraphRetrievalMethod
+MiscImdbBi: GraphRetrievalMethod
+MiscJungCodeDep: GraphRetrievalMethod
+MiscLesmis: GraphRetrievalMethod
+MiscReuters911: GraphRetrievalMethod
+Mri1: GraphRetrievalMethod
+Mri2: GraphRetrievalMethod
+Nasa4704: GraphRetrievalMethod
+Net100: GraphRetrievalMethod
+Net125: GraphRetrievalMethod
+Net150: GraphRetrievalMethod
+Net25: GraphRetrievalMethod
+Net41: GraphRetrievalMethod
+Net50: GraphRetrievalMethod
+Net75: GraphRetrievalMethod
+Netscience: GraphRetrievalMethod
+Netz4504: GraphRetrievalMethod
+Nw14: GraphRetrievalMethod
+Odepb400: GraphRetrievalMethod
+Odlis: GraphRetrievalMethod
+OpsahlOpenflights: GraphRetrievalMethod
+OpsahlPowergrid: GraphRetrievalMethod
+OpsahlSouthernwomen: GraphRetrievalMethod
+OpsahlUsairport: GraphRetrievalMethod
+Opt1: GraphRetrievalMethod
+Oregon1: GraphRetrievalMethod
+Oregon2: GraphRetrievalMethod
+Orkut: GraphRetrievalMethod
+OrkutGroupmemberships: GraphRetrievalMethod
+OrkutLinks: GraphRetrievalMethod
+P2pGnutella04: GraphRetrievalMethod
+P2pGnutella05: GraphRetrievalMethod
+P2pGnutella06: GraphRetrievalMethod
+P2pGnutella08: GraphRetrievalMethod
+P2pGnutella09: GraphRetrievalMethod
+P2pGnutella24: GraphRetrievalMethod
+P2pGnutella25: GraphRetrievalMethod
+P2pGnutella30: GraphRetrievalMethod
+P2pGnutella31: GraphRetrievalMethod
+PHat10001: GraphRetrievalMethod
+PHat10002: GraphRetrievalMethod
+PHat10003: GraphRetrievalMethod
+PHat15001: GraphRetrievalMethod
+PHat15002: GraphRetrievalMethod
+PHat15003: GraphRetrievalMethod
+PHat3003: GraphRetrievalMethod
+PHat5001: GraphRetrievalMethod
+PHat5002: GraphRetrievalMethod
+PHat5003: GraphRetrievalMethod
+PHat7001: GraphRetrievalMethod
+PHat7002: GraphRetrievalMethod
+PHat7003: GraphRetrievalMethod
+Packing500x100x100B050: GraphRetrievalMethod
+Patentcite: GraphRetrievalMethod
+Patents: GraphRetrievalMethod
+Pattern1: GraphRetrievalMethod
+Pcrystk02: GraphRetrievalMethod
+Pcrystk03: GraphRetrievalMethod
+Pct20stif: GraphRetrievalMethod
+Pds10: GraphRetrievalMethod
+PetsterCarnivore: GraphRetrievalMethod
+PetsterFriendshipsCat: GraphRetrievalMethod
+PetsterFriendshipsDog: GraphRetrievalMethod
+PetsterFriendshipsHamster: GraphRetrievalMethod
+PetsterHamster: GraphRetrievalMethod
+Pf2177: GraphRetrievalMethod
+Pfinan512: GraphRetrievalMethod
+Pgpgiantcompo: GraphRetrievalMethod
+Pkustk01: GraphRetrievalMethod
+Pkustk02: GraphRetrievalMethod
+Pkustk03: GraphRetrievalMethod
+Pkustk04: GraphRetrievalMethod
+Pkustk05: GraphRetrievalMethod
+Pkustk06: GraphRetrievalMethod
+Pkustk07: GraphRetrievalMethod
+Pkustk08: GraphRetrievalMethod
+Pkustk09: GraphRetrievalMethod
+Pkustk10: GraphRetrievalMethod
+Pkustk11: GraphRetrievalMethod
+Pkustk12: GraphRetrievalMethod
+Pkustk13: GraphRetrievalMethod
+Pkustk14: GraphRetrievalMethod
+Plc4030L5: GraphRetrievalMethod
+Plc6030L2: GraphRetrievalMethod
+Pli: GraphRetrievalMethod
+Polblogs: GraphRetrievalMethod
+Polbooks: GraphRetrievalMethod
+Power: GraphRetrievalMethod
+PowerBcspwr09: GraphRetrievalMethod
+PowerBcspwr10: GraphRetrievalMethod
+PowerEris1176: GraphRetrievalMethod
+PowerUsGrid: GraphRetrievalMethod
+PrimarySchoolProximity: GraphRetrievalMethod
+ProteinsAll: GraphRetrievalMethod
+Pwt: GraphRetrievalMethod
+Qa8fm: GraphRetrievalMethod
+Ragusa16: GraphRetrievalMethod
+Ragusa18: GraphRetrievalMethod
+Rail2586: GraphRetrievalMethod
+Rail4284: GraphRetrievalMethod
+Rajat01: GraphRetrievalMethod
+Rajat02: GraphRetrievalMethod
+Rajat06: GraphRetrievalMethod
+Rajat07: GraphRetrievalMethod
+Rajat08: GraphRetrievalMethod
+Rajat09: GraphRetrievalMethod
+Rajat10: GraphRetrievalMethod
+Ramage02: GraphRetrievalMethod
+Reactome: GraphRetrievalMethod
+Reuters911: GraphRetrievalMethod
+Rgg010: GraphRetrievalMethod
+RoadAsiaOsm: GraphRetrievalMethod
+RoadBelgiumOsm: GraphRetrievalMethod
+RoadChesapeake: GraphRetrievalMethod
+RoadEuroroad: GraphRetrievalMethod
+RoadGermanyOsm: GraphRetrievalMethod
+RoadGreatBritainOsm: GraphRetrievalMethod
+RoadItalyOsm: GraphRetrievalMethod
+RoadLuxembourgOsm: GraphRetrievalMethod
+RoadMinnesota: GraphRetrievalMethod
+RoadNetherlandsOsm: GraphRetrievalMethod
+RoadRoadUsa: GraphRetrievalMethod
+RoadRoadnetCa: GraphRetrievalMethod
+RoadRoadnetPa: GraphRetrievalMethod
+RoadUsroads: GraphRetrievalMethod
+RoadUsroads48: GraphRetrievalMethod
+RoadnetCa: GraphRetrievalMethod
+RoadnetPa: GraphRetrievalMethod
+RoadnetTx: GraphRetrievalMethod
+Roget: GraphRetrievalMethod
+RtHiggs: GraphRetrievalMethod
+RtRetweet: GraphRetrievalMethod
+RtRetweetCrawl: GraphRetrievalMethod
+RtTwitterCopen: GraphRetrievalMethod
+Rw136: GraphRetrievalMethod
+Rw496: GraphRetrievalMethod
+Rw5151: GraphRetrievalMethod
+S4dkt3m2: GraphRetrievalMethod
+San1000: GraphRetrievalMethod
+San200071: GraphRetrievalMethod
+San200072: GraphRetrievalMethod
+San200091: GraphRetrievalMethod
+San200092: GraphRetrievalMethod
+San200093: GraphRetrievalMethod
+San400051: GraphRetrievalMethod
+San400071: GraphRetrievalMethod
+San400072: GraphRetrievalMethod
+San400073: GraphRetrievalMethod
+San400091: GraphRetrievalMethod
+Sanr20007: GraphRetrievalMethod
+Sanr20009: GraphRetrievalMethod
+Sanr40005: GraphRetrievalMethod
+Sanr40007: GraphRetrievalMethod
+ScLdoor: GraphRetrievalMethod
+ScMsdoor: GraphRetrievalMethod
+ScNasasrb: GraphRetrievalMethod
+ScPkustk11: GraphRetrievalMethod
+ScPkustk13: GraphRetrievalMethod
+ScPwtk: GraphRetrievalMethod
+ScRel9: GraphRetrievalMethod
+ScShipsec1: GraphRetrievalMethod
+ScShipsec5: GraphRetrievalMethod
+Scimet: GraphRetrievalMethod
+Se: GraphRetrievalMethod
+SfhhConfSensor: GraphRetrievalMethod
+Shock9: GraphRetrievalMethod
+Sk2005: GraphRetrievalMethod
+Skirt: GraphRetrievalMethod
+SlashdotZoo: GraphRetrievalMethod
+Sls: GraphRetrievalMethod
+Smagri: GraphRetrievalMethod
+Smallw: GraphRetrievalMethod
+SocAcademia: GraphRetrievalMethod
+SocAdvogato: GraphRetrievalMethod
+SocAnuResidence: GraphRetrievalMethod
+SocAnybeat: GraphRetrievalMethod
+SocBlogcatalog: GraphRetrievalMethod
+SocBlogcatalogAsu: GraphRetrievalMethod
+SocBrightkite: GraphRetrievalMethod
+SocBuzznet: GraphRetrievalMethod
+SocCatster: GraphRetrievalMethod
+SocDelicious: GraphRetrievalMethod
+SocDigg: GraphRetrievalMethod
+SocDogster: GraphRetrievalMethod
+SocDolphins: GraphRetrievalMethod
+SocDouban: GraphRetrievalMethod
+SocEpinions: GraphRetrievalMethod
+SocEpinions1: GraphRetrievalMethod
+SocFirmHiTech: GraphRetrievalMethod
+SocFlickr: GraphRetrievalMethod
+SocFlickrAsu: GraphRetrievalMethod
+SocFlickrUnd: GraphRetrievalMethod
+SocFlixster: GraphRetrievalMethod
+SocFoursquare: GraphRetrievalMethod
+SocFriendster: GraphRetrievalMethod
+SocGooglePlus: GraphRetrievalMethod
+SocGowalla: GraphRetrievalMethod
+SocGplus: GraphRetrievalMethod
+SocHamsterster: GraphRetrievalMethod
+SocHighschoolMoreno: GraphRetrievalMethod
+SocKarate: GraphRetrievalMethod
+SocLastfm: GraphRetrievalMethod
+SocLivejournal: GraphRetrievalMethod
+SocLivejournal07: GraphRetrievalMethod
+SocLivejournal1: GraphRetrievalMethod
+SocLivejournalUserGroups: GraphRetrievalMethod
+SocLivemocha: GraphRetrievalMethod
+SocLjournal2008: GraphRetrievalMethod
+SocLocBrightkite: GraphRetrievalMethod
+SocOrkut: GraphRetrievalMethod
+SocOrkutDir: GraphRetrievalMethod
+SocPhysicians: GraphRetrievalMethod
+SocPokec: GraphRetrievalMethod
+SocPokecRelationships: GraphRetrievalMethod
+SocSignBitcoinotc: GraphRetrievalMethod
+SocSinaweibo: GraphRetrievalMethod
+SocSlashdot: GraphRetrievalMethod
+SocSlashdot0811: GraphRetrievalMethod
+SocSlashdot0902: GraphRetrievalMethod
+SocSlashdotTrustAll: GraphRetrievalMethod
+SocSlashdotZoo: GraphRetrievalMethod
+SocStudentCoop: GraphRetrievalMethod
+SocThemarker: GraphRetrievalMethod
+SocTribes: GraphRetrievalMethod
+SocTwitter2010: GraphRetrievalMethod
+SocTwitterFollows: GraphRetrievalMethod
+SocTwitterFollowsMun: GraphRetrievalMethod
+SocTwitterHiggs: GraphRetrievalMethod
+SocTwitterMpiSws: GraphRetrievalMethod
+SocWikiTalkDir: GraphRetrievalMethod
+SocWikiVote: GraphRetrievalMethod
+SocYoutube: GraphRetrievalMethod
+SocYoutubeSnap: GraphRetrievalMethod
+SocfbAAnon: GraphRetrievalMethod
+SocfbAmerican75: GraphRetrievalMethod
+SocfbAmherst41: GraphRetrievalMethod
+SocfbAuburn71: GraphRetrievalMethod
+SocfbBAnon: GraphRetrievalMethod
+SocfbBaylor93: GraphRetrievalMethod
+SocfbBc17: GraphRetrievalMethod
+SocfbBerkeley13: GraphRetrievalMethod
+SocfbBingham82: GraphRetrievalMethod
+SocfbBowdoin47: GraphRetrievalMethod
+SocfbBrandeis99: GraphRetrievalMethod
+SocfbBrown11: GraphRetrievalMethod
+SocfbBu10: GraphRetrievalMethod
+SocfbBucknell39: GraphRetrievalMethod
+SocfbCal65: GraphRetrievalMethod
+SocfbCaltech36: GraphRetrievalMethod
+SocfbCarnegie49: GraphRetrievalMethod
+SocfbCmu: GraphRetrievalMethod
+SocfbColgate88: GraphRetrievalMethod
+SocfbColumbia2: GraphRetrievalMethod
+SocfbCornell5: GraphRetrievalMethod
+SocfbDartmouth6: GraphRetrievalMethod
+SocfbDuke14: GraphRetrievalMethod
+SocfbEmory27: GraphRetrievalMethod
+SocfbFsu53: GraphRetrievalMethod
+SocfbGeorgetown15: GraphRetrievalMethod
+SocfbGwu54: GraphRetrievalMethod
+SocfbHamilton46: GraphRetrievalMethod
+SocfbHarvard1: GraphRetrievalMethod
+SocfbHaverford76: GraphRetrievalMethod
+SocfbHoward90: GraphRetrievalMethod
+SocfbIndiana: GraphRetrievalMethod
+SocfbIndiana69: GraphRetrievalMethod
+SocfbJmu79: GraphRetrievalMethod
+SocfbJohnshopkins55: GraphRetrievalMethod
+SocfbKonect: GraphRetrievalMethod
+SocfbLehigh96: GraphRetrievalMethod
+SocfbMaine59: GraphRetrievalMethod
+SocfbMaryland58: GraphRetrievalMethod
+SocfbMich67: GraphRetrievalMethod
+SocfbMichigan23: GraphRetrievalMethod
+SocfbMiddlebury45: GraphRetrievalMethod
+SocfbMississippi66: GraphRetrievalMethod
+SocfbMit: GraphRetrievalMethod
+SocfbMit8: GraphRetrievalMethod
+SocfbMsu24: GraphRetrievalMethod
+SocfbMu78: GraphRetrievalMethod
+SocfbNipsEgo: GraphRetrievalMethod
+SocfbNortheastern19: GraphRetrievalMethod
+SocfbNorthwestern25: GraphRetrievalMethod
+SocfbNotredame57: GraphRetrievalMethod
+SocfbNyu9: GraphRetrievalMethod
+SocfbOberlin44: GraphRetrievalMethod
+SocfbOklahoma97: GraphRetrievalMethod
+SocfbOr: GraphRetrievalMethod
+SocfbPenn94: GraphRetrievalMethod
+SocfbPepperdine86: GraphRetrievalMethod
+SocfbPrinceton12: GraphRetrievalMethod
+SocfbReed98: GraphRetrievalMethod
+SocfbRice31: GraphRetrievalMethod
+SocfbRochester38: GraphRetrievalMethod
+SocfbRutgers89: GraphRetrievalMethod
+SocfbSanta74: GraphRetrievalMethod
+SocfbSimmons81: GraphRetrievalMethod
+SocfbSmith60: GraphRetrievalMethod
+SocfbStanford3: GraphRetrievalMethod
+SocfbSwarthmore42: GraphRetrievalMethod
+SocfbSyracuse56: GraphRetrievalMethod
+SocfbTemple83: GraphRetrievalMethod
+SocfbTennessee95: GraphRetrievalMethod
+SocfbTexas80: GraphRetrievalMethod
+SocfbTexas84: GraphRetrievalMethod
+SocfbTrinity100: GraphRetrievalMethod
+SocfbTufts18: GraphRetrievalMethod
+SocfbTulane29: GraphRetrievalMethod
+SocfbUc33: GraphRetrievalMethod
+SocfbUc61: GraphRetrievalMethod
+SocfbUc64: GraphRetrievalMethod
+SocfbUcf52: GraphRetrievalMethod
+SocfbUchicago30: GraphRetrievalMethod
+SocfbUciUni: GraphRetrievalMethod
+SocfbUcla: GraphRetrievalMethod
+SocfbUcla26: GraphRetrievalMethod
+SocfbUconn: GraphRetrievalMethod
+SocfbUconn91: GraphRetrievalMethod
+SocfbUcsb37: GraphRetrievalMethod
+SocfbUcsc68: GraphRetrievalMethod
+SocfbUcsd34: GraphRetrievalMethod
+SocfbUf: GraphRetrievalMethod
+SocfbUf21: GraphRetrievalMethod
+SocfbUga50: GraphRetrievalMethod
+SocfbUillinois: GraphRetrievalMethod
+SocfbUillinois20: GraphRetrievalMethod
+SocfbUmass92: GraphRetrievalMethod
+SocfbUnc28: GraphRetrievalMethod
+SocfbUpenn7: GraphRetrievalMethod
+SocfbUsc35: GraphRetrievalMethod
+SocfbUsf51: GraphRetrievalMethod
+SocfbUsfca72: GraphRetrievalMethod
+SocfbUva16: GraphRetrievalMethod
+SocfbVanderbilt48: GraphRetrievalMethod
+SocfbVassar85: GraphRetrievalMethod
+SocfbVermont70: GraphRetrievalMethod
+SocfbVillanova62: GraphRetrievalMethod
+SocfbVirginia63: GraphRetrievalMethod
+SocfbWake73: GraphRetrievalMethod
+SocfbWashu32: GraphRetrievalMethod
+SocfbWellesley22: GraphRetrievalMethod
+SocfbWesleyan43: GraphRetrievalMethod
+SocfbWilliam77: GraphRetrievalMethod
+SocfbWilliams40: GraphRetrievalMethod
+SocfbWisconsin87: GraphRetrievalMethod
+SocfbYale4: GraphRetrievalMethod
+Sphere2: GraphRetrievalMethod
+Sphere3: GraphRetrievalMethod
+Srb1: GraphRetrievalMethod
+Sstmodel: GraphRetrievalMethod
+Stanford: GraphRetrievalMethod
+Struct3: GraphRetrievalMethod
+Struct4: GraphRetrievalMethod
+Stufe: GraphRetrievalMethod
+Stufe10: GraphRetrievalMethod
+Sw1000030d1Trial1: GraphRetrievalMethod
+Sw1000030d1Trial2: GraphRetrievalMethod
+Sw1000030d1Trial3: GraphRetrievalMethod
+Sw1000030d2Trial1: GraphRetrievalMethod
+Sw1000030d2Trial2: GraphRetrievalMethod
+Sw1000030d2Trial3: GraphRetrievalMethod
+Sw1000030d3Trial1: GraphRetrievalMethod
+Sw1000030d3Trial2: GraphRetrievalMethod
+Sw1000030d3Trial3: GraphRetrievalMethod
+Sw1000040d1Trial1: GraphRetrievalMethod
+Sw1000040d1Trial2: GraphRetrievalMethod
+Sw1000040d1Trial3: GraphRetrievalMethod
+Sw1000040d2Trial1: GraphRetrievalMethod
+Sw1000040d2Trial2: GraphRetrievalMethod
+Sw1000040d2Trial3: GraphRetrievalMethod
+Sw1000040d3Trial1: GraphRetrievalMethod
+Sw1000040d3Trial2: GraphRetrievalMethod
+Sw1000040d3Trial3: GraphRetrievalMethod
+Sw1000050d1Trial1: GraphRetrievalMethod
+Sw1000050d1Trial2: GraphRetrievalMethod
+Sw1000050d1Trial3: GraphRetrievalMethod
+Sw1000050d2Trial1: GraphRetrievalMethod
+Sw1000050d2Trial2: GraphRetrievalMethod
+Sw1000050d2Trial3: GraphRetrievalMethod
+Sw1000050d3Trial1: GraphRetrievalMethod
+Sw1000050d3Trial2: GraphRetrievalMethod
+Sw1000050d3Trial3: GraphRetrievalMethod
+Sw1000060d1Trial1: GraphRetrievalMethod
+Sw1000060d1Trial2: GraphRetrievalMethod
+Sw1000060d1Trial3: GraphRetrievalMethod
+Sw1000060d2Trial1: GraphRetrievalMethod
+Sw1000060d2Trial2: GraphRetrievalMethod
+Sw1000060d2Trial3: GraphRetrievalMethod
+Sw1000060d3L2: GraphRetrievalMethod
+Sw1000060d3L5: GraphRetrievalMethod
+Sw1000060d3Trial1: GraphRetrievalMethod
+Sw1000060d3Trial2: GraphRetrievalMethod
+Sw1000060d3Trial3: GraphRetrievalMethod
+Sw100030d1Trial1: GraphRetrievalMethod
+Sw100030d1Trial2: GraphRetrievalMethod
+Sw100030d1Trial3: GraphRetrievalMethod
+Sw100030d2Trial1: GraphRetrievalMethod
+Sw100030d2Trial2: GraphRetrievalMethod
+Sw100030d2Trial3: GraphRetrievalMethod
+Sw100030d3Trial1: GraphRetrievalMethod
+Sw100030d3Trial2: GraphRetrievalMethod
+Sw100030d3Trial3: GraphRetrievalMethod
+Sw100040d1Trial1: GraphRetrievalMethod
+Sw100040d1Trial2: GraphRetrievalMethod
+Sw100040d1Trial3: GraphRetrievalMethod
+Sw100040d2Trial1: GraphRetrievalMethod
+Sw100040d2Trial2: GraphRetrievalMethod
+Sw100040d2Trial3: GraphRetrievalMethod
+Sw100040d3Trial1: GraphRetrievalMethod
+Sw100040d3Trial2: GraphRetrievalMethod
+Sw100040d3Trial3: GraphRetrievalMethod
+Sw100050d1Trial1: GraphRetrievalMethod
+Sw100050d1Trial2: GraphRetrievalMethod
+Sw100050d1Trial3: GraphRetrievalMethod
+Sw100050d2Trial1: GraphRetrievalMethod
+Sw100050d2Trial2: GraphRetrievalMethod
+Sw100050d2Trial3: GraphRetrievalMethod
+Sw100050d3Trial1: GraphRetrievalMethod
+Sw100050d3Trial2: GraphRetrievalMethod
+Sw100050d3Trial3: GraphRetrievalMethod
+Sw100060d1Trial1: GraphRetrievalMethod
+Sw100060d1Trial2: GraphRetrievalMethod
+Sw100060d1Trial3: GraphRetrievalMethod
+Sw100060d2Trial1: GraphRetrievalMethod
+Sw100060d2Trial2: GraphRetrievalMethod
+Sw100060d2Trial3: GraphRetrievalMethod
+Sw100060d3Trial1: GraphRetrievalMethod
+Sw100060d3Trial2: GraphRetrievalMethod
+Sw100060d3Trial3: GraphRetrievalMethod
+Sw10030d1Trial1: GraphRetrievalMethod
+Sw10030d1Trial2: GraphRetrievalMethod
+Sw10030d1Trial3: GraphRetrievalMethod
+Sw10030d2Trial1: GraphRetrievalMethod
+Sw10030d2Trial2: GraphRetrievalMethod
+Sw10030d2Trial3: GraphRetrievalMethod
+Sw10030d3Trial1: GraphRetrievalMethod
+Sw10030d3Trial2: GraphRetrievalMethod
+Sw10030d3Trial3: GraphRetrievalMethod
+Sw10040d1Trial1: GraphRetrievalMethod
+Sw10040d1Trial2: GraphRetrievalMethod
+Sw10040d1Trial3: GraphRetrievalMethod
+Sw10040d2Trial1: GraphRetrievalMethod
+Sw10040d2Trial2: GraphRetrievalMethod
+Sw10040d2Trial3: GraphRetrievalMethod
+Sw10040d3Trial1: GraphRetrievalMethod
+Sw10040d3Trial2: GraphRetrievalMethod
+Sw10040d3Trial3: GraphRetrievalMethod
+Sw10050d1Trial1: GraphRetrievalMethod
+Sw10050d1Trial2: GraphRetrievalMethod
+Sw10050d1Trial3: GraphRetrievalMethod
+Sw10050d2Trial1: GraphRetrievalMethod
+Sw10050d2Trial2: GraphRetrievalMethod
+Sw10050d2Trial3: GraphRetrievalMethod
+Sw10050d3Trial1: GraphRetrievalMethod
+Sw10050d3Trial2: GraphRetrievalMethod
+Sw10050d3Trial3: GraphRetrievalMethod
+Sw10060d1Trial1: GraphRetrievalMethod
+Sw10060d1Trial2: GraphRetrievalMethod
+Sw10060d1Trial3: GraphRetrievalMethod
+Sw10060d2Trial1: GraphRetrievalMethod
+Sw10060d2Trial2: GraphRetrievalMethod
+Sw10060d2Trial3: GraphRetrievalMethod
+Sw10060d3Trial1: GraphRetrievalMethod
+Sw10060d3Trial2: GraphRetrievalMethod
+Sw10060d3Trial3: GraphRetrievalMethod
+T03314l: GraphRetrievalMethod
+T520: GraphRetrievalMethod
+T60k: GraphRetrievalMethod
+TechArenasJazz: GraphRetrievalMethod
+TechArenasMeta: GraphRetrievalMethod
+TechArenasPgp: GraphRetrievalMethod
+TechAs22july06: GraphRetrievalMethod
+TechAs735: GraphRetrievalMethod
+TechAsCaida: GraphRetrievalMethod
+TechAsCaida2007: GraphRetrievalMethod
+TechAsCaida20071105: GraphRetrievalMethod
+TechAsSkitter: GraphRetrievalMethod
+TechCaidarouterlevel: GraphRetrievalMethod
+TechInternetAs: GraphRetrievalMethod
+TechIp: GraphRetrievalMethod
+TechP2p: GraphRetrievalMethod
+TechP2pGnutella: GraphRetrievalMethod
+TechPgp: GraphRetrievalMethod
+TechRlCaida: GraphRetrievalMethod
+TechRoutersRf: GraphRetrievalMethod
+TechWhois: GraphRetrievalMethod
+Tf10: GraphRetrievalMethod
+Tf11: GraphRetrievalMethod
+Tf12: GraphRetrievalMethod
+Tf13: GraphRetrievalMethod
+Tf14: GraphRetrievalMethod
+Tf15: GraphRetrievalMethod
+Tf16: GraphRetrievalMethod
+Tf17: GraphRetrievalMethod
+Tf18: GraphRetrievalMethod
+Tf19: GraphRetrievalMethod
+Tomographic1: GraphRetrievalMethod
+Trdheim: GraphRetrievalMethod
+Trec10: GraphRetrievalMethod
+Trec11: GraphRetrievalMethod
+Trec12: GraphRetrievalMethod
+Trec13: GraphRetrievalMethod
+Trec14: GraphRetrievalMethod
+Trec4: GraphRetrievalMethod
+Trec5: GraphRetrievalMethod
+Trec6: GraphRetrievalMethod
+Trec7: GraphRetrievalMethod
+Trec8: GraphRetrievalMethod
+Trec9: GraphRetrievalMethod
+TrecWt10g: GraphRetrievalMethod
+Troll: GraphRetrievalMethod
+Tsyl201: GraphRetrievalMethod
+Tube1: GraphRetrievalMethod
+Tube2: GraphRetrievalMethod
+Twitter: GraphRetrievalMethod
+UcidataGama: GraphRetrievalMethod
+UcidataZachary: GraphRetrievalMethod
+Uk: GraphRetrievalMethod
+Uk2002: GraphRetrievalMethod
+Uk2005: GraphRetrievalMethod
+Ukerbe1: GraphRetrievalMethod
+Us04: GraphRetrievalMethod
+Usair97: GraphRetrievalMethod
+Uspowergrid: GraphRetrievalMethod
+Usroads: GraphRetrievalMethod
+Usroads48: GraphRetrievalMethod
+Venturilevel3: GraphRetrievalMethod
+VisualizeUs: GraphRetrievalMethod
+Wave: GraphRetrievalMethod
+WbCsStanford: GraphRetrievalMethod
+WbEdu: GraphRetrievalMethod
+WebArabic2005: GraphRetrievalMethod
+WebBaiduBaike: GraphRetrievalMethod
+WebBaiduBaikeRelated: GraphRetrievalMethod
+WebBerkstan: GraphRetrievalMethod
+WebBerkstanDir: GraphRetrievalMethod
+WebCc12Payleveldomain: GraphRetrievalMethod
+WebClueweb09: GraphRetrievalMethod
+WebClueweb0950m: GraphRetrievalMethod
+WebEdu: GraphRetrievalMethod
+WebEpa: GraphRetrievalMethod
+WebGoogle: GraphRetrievalMethod
+WebGoogleDir: GraphRetrievalMethod
+WebHudong: GraphRetrievalMethod
+WebIndochina2004: GraphRetrievalMethod
+WebIndochina2004All: GraphRetrievalMethod
+WebIt2004: GraphRetrievalMethod
+WebIt2004All: GraphRetrievalMethod
+WebItalycnr2000: GraphRetrievalMethod
+WebNotredame: GraphRetrievalMethod
+WebPolblogs: GraphRetrievalMethod
+WebSk2005: GraphRetrievalMethod
+WebSk2005All: GraphRetrievalMethod
+WebSpam: GraphRetrievalMethod
+WebSpamDetection: GraphRetrievalMethod
+WebStanford: GraphRetrievalMethod
+WebUk2002All: GraphRetrievalMethod
+WebUk2005: GraphRetrievalMethod
+WebUk2005All: GraphRetrievalMethod
+WebWebbase2001: GraphRetrievalMethod
+WebWebbase2001All: GraphRetrievalMethod
+WebWikiChInternal: GraphRetrievalMethod
+WebWikipedia2009: GraphRetrievalMethod
+Webbase1m: GraphRetrievalMethod
+WebkbWisc: GraphRetrievalMethod
+WikiEnCat: GraphRetrievalMethod
+WikiTalk: GraphRetrievalMethod
+WikisignedK2: GraphRetrievalMethod
+Wing: GraphRetrievalMethod
+WordnetWords: GraphRetrievalMethod
+YahooMsg: GraphRetrievalMethod
+YoutubeGroupmemberships: GraphRetrievalMethod
+YoutubeLinks: GraphRetrievalMethod
+ZhishiBaiduInternallink: GraphRetrievalMethod
+ZhishiBaiduRelatedpages: GraphRetrievalMethod
+ZhishiHudongInternallink: GraphRetrievalMethod
+ZhishiHudongRelatedpages: GraphRetrievalMethod
+ZhishiZhwikiInternallink: GraphRetrievalMethod
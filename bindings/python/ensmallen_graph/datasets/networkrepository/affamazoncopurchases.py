@@ -1,204 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph aff-amazon-copurchases.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-06 11:58:29.466631
-
-The undirected graph aff-amazon-copurchases has 403394 nodes and 2443408
-weighted edges, of which none are self-loops. The graph is extremely sparse
-as it has a density of 0.00003 and has 7 connected components, where the
-component with most nodes has 403364 nodes and the component with the least
-nodes has 2 nodes. The graph median node degree is 10, the mean node degree
-is 12.11, and the node degree mode is 10. The top 5 most central nodes
-are 195 (degree 2752), 183 (degree 2487), 34 (degree 2281), 1322 (degree
-1512) and 1857 (degree 1174).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-@article{leskovec2007dynamics,
-        title={The dynamics of viral marketing},
-        author={Leskovec, Jure and Adamic, Lada A and Huberman, Bernardo A},
-        journal={ACM Transactions on the Web (TWEB)},
-        volume={1},
-        number={1},
-        pages={5},
-        year={2007},
-        publisher={ACM}
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import AffAmazonCopurchases
-
-    # Then load the graph
-    graph = AffAmazonCopurchases()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def AffAmazonCopurchases(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the aff-amazon-copurchases graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of aff-amazon-copurchases graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-06 11:58:29.466631
-	
-	The undirected graph aff-amazon-copurchases has 403394 nodes and 2443408
-	weighted edges, of which none are self-loops. The graph is extremely sparse
-	as it has a density of 0.00003 and has 7 connected components, where the
-	component with most nodes has 403364 nodes and the component with the least
-	nodes has 2 nodes. The graph median node degree is 10, the mean node degree
-	is 12.11, and the node degree mode is 10. The top 5 most central nodes
-	are 195 (degree 2752), 183 (degree 2487), 34 (degree 2281), 1322 (degree
-	1512) and 1857 (degree 1174).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-	@article{leskovec2007dynamics,
-	        title={The dynamics of viral marketing},
-	        author={Leskovec, Jure and Adamic, Lada A and Huberman, Bernardo A},
-	        journal={ACM Transactions on the Web (TWEB)},
-	        volume={1},
-	        number={1},
-	        pages={5},
-	        year={2007},
-	        publisher={ACM}
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import AffAmazonCopurchases
-	
-	    # Then load the graph
-	    graph = AffAmazonCopurchases()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="AffAmazonCopurchases",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
@@ -1,210 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph bio-celegansneural.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-03 23:01:34.429012
-
-The undirected graph bio-celegansneural has 297 nodes and 2148 weighted
-edges, of which none are self-loops. The graph is dense as it has a density
-of 0.04887 and is connected, as it has a single component. The graph median
-node degree is 12, the mean node degree is 14.46 and the node degree mode
-is 11. The top 5 most central nodes are 45 (degree 134), 13 (degree 77),
-3 (degree 74), 5 (degree 54) and 87 (degree 53).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-@article{duch2005community,
-        title={Community identification using Extremal Optimization Phys},
-        author={Duch, J. and Arenas, A.},
-        journal={Rev. E},
-        volume={72},
-        pages={027104},
-        year={2005}
-}
-
-@inproceedings{bader2012graph,
-        title={Graph Partitioning and Graph Clustering},
-        author={Bader, David A and Meyerhenke, Henning and Sanders, Peter and Wagner, Dorothea},
-        booktitle={10th DIMACS Implementation Challenge Workshop},
-        year={2012}
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import BioCelegansneural
-
-    # Then load the graph
-    graph = BioCelegansneural()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def BioCelegansneural(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the bio-celegansneural graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of bio-celegansneural graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-03 23:01:34.429012
-	
-	The undirected graph bio-celegansneural has 297 nodes and 2148 weighted
-	edges, of which none are self-loops. The graph is dense as it has a density
-	of 0.04887 and is connected, as it has a single component. The graph median
-	node degree is 12, the mean node degree is 14.46 and the node degree mode
-	is 11. The top 5 most central nodes are 45 (degree 134), 13 (degree 77),
-	3 (degree 74), 5 (degree 54) and 87 (degree 53).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-	@article{duch2005community,
-	        title={Community identification using Extremal Optimization Phys},
-	        author={Duch, J. and Arenas, A.},
-	        journal={Rev. E},
-	        volume={72},
-	        pages={027104},
-	        year={2005}
-	}
-	
-	@inproceedings{bader2012graph,
-	        title={Graph Partitioning and Graph Clustering},
-	        author={Bader, David A and Meyerhenke, Henning and Sanders, Peter and Wagner, Dorothea},
-	        booktitle={10th DIMACS Implementation Challenge Workshop},
-	        year={2012}
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import BioCelegansneural
-	
-	    # Then load the graph
-	    graph = BioCelegansneural()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="BioCelegansneural",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
@@ -1,188 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph CL-10M-1d8-L5.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-04 08:11:51.879593
-
-The undirected graph CL-10M-1d8-L5 has 10000000 nodes with 5 different
-node types: 4 (nodes number 2000000), 5 (nodes number 2000000), 2 (nodes
-number 2000000), 1 (nodes number 2000000) and 3 (nodes number 2000000),
-of which 761939 are singletons, and 43985070 unweighted edges, of which
-31 are self-loops. The graph is extremely sparse as it has a density of
-0.00000 and has 776818 connected components, where the component with most
-nodes has 9207648 nodes and the component with the least nodes has a single
-node. The graph median node degree is 3, the mean node degree is 8.80 and
-the node degree mode is 2. The top 5 most central nodes are 3405344 (degree
-250), 117000 (degree 248), 7581806 (degree 245), 181533 (degree 245) and
-264999 (degree 244).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import Cl10m1d8L5
-
-    # Then load the graph
-    graph = Cl10m1d8L5()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def Cl10m1d8L5(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the CL-10M-1d8-L5 graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of CL-10M-1d8-L5 graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-04 08:11:51.879593
-	
-	The undirected graph CL-10M-1d8-L5 has 10000000 nodes with 5 different
-	node types: 4 (nodes number 2000000), 5 (nodes number 2000000), 2 (nodes
-	number 2000000), 1 (nodes number 2000000) and 3 (nodes number 2000000),
-	of which 761939 are singletons, and 43985070 unweighted edges, of which
-	31 are self-loops. The graph is extremely sparse as it has a density of
-	0.00000 and has 776818 connected components, where the component with most
-	nodes has 9207648 nodes and the component with the least nodes has a single
-	node. The graph median node degree is 3, the mean node degree is 8.80 and
-	the node degree mode is 2. The top 5 most central nodes are 3405344 (degree
-	250), 117000 (degree 248), 7581806 (degree 245), 181533 (degree 245) and
-	264999 (degree 244).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import Cl10m1d8L5
-	
-	    # Then load the graph
-	    graph = Cl10m1d8L5()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="Cl10m1d8L5",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
@@ -1,214 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph email-enron.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-03 23:12:18.981665
-
-The undirected graph email-enron has 69244 nodes, of which 227 are singletons
-(all have self-loops), and 255984 unweighted edges, of which 1535 are self-loops.
-The graph is quite sparse as it has a density of 0.00011 and has 781 connected
-components, where the component with most nodes has 67521 nodes and the
-component with the least nodes has a single node. The graph median node
-degree is 1, the mean node degree is 7.37 and the node degree mode is 1.
-The top 5 most central nodes are 46050 (degree 1635), 30335 (degree 1604),
-45536 (degree 1488), 46022 (degree 1458) and 30043 (degree 1400).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-@        Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Name = Enron Email CommunicationsCategory = 	Collection = 	Tags = 	directed graphData source = 	Author = 	L. Kaelbling,
-M. Gervasio,         W. CohenDate = 	2003Short = 	Vertex type = Enron Employees / individualsEdge type = Email communications between individualsFormat = 	Edge weights = 	UnweightedMetadata = 	directed graphDescription = 	Email communication network from Enronbibtex = 	 emails sent between employees of Enron. Nodes in the network are individual employees and edges are individual emails.bibtex =,
-
-@inproceedings{bader2012graph,
-        title={Graph Partitioning and Graph Clustering},
-        author={Bader, David A and Meyerhenke, Henning and Sanders, Peter and Wagner, Dorothea},
-        booktitle={10th DIMACS Implementation Challenge Workshop},
-        year={2012}
-}
-
-@misc{cohen2005enron,
-        title={Enron email dataset},
-        author={Cohen, W.},
-        note={http://www.cs.cmu.edu/~enron/}
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import EmailEnron
-
-    # Then load the graph
-    graph = EmailEnron()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def EmailEnron(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the email-enron graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of email-enron graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-03 23:12:18.981665
-	
-	The undirected graph email-enron has 69244 nodes, of which 227 are singletons
-	(all have self-loops), and 255984 unweighted edges, of which 1535 are self-loops.
-	The graph is quite sparse as it has a density of 0.00011 and has 781 connected
-	components, where the component with most nodes has 67521 nodes and the
-	component with the least nodes has a single node. The graph median node
-	degree is 1, the mean node degree is 7.37 and the node degree mode is 1.
-	The top 5 most central nodes are 46050 (degree 1635), 30335 (degree 1604),
-	45536 (degree 1488), 46022 (degree 1458) and 30043 (degree 1400).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-	@        Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Category 	= Collection 	= Tags 		= Data source 	=	Short 		=Vertex type 	=	Edge type 	=	Format 		=Edge weights 	=Metadata 	=Description 	=bibtex =Name = Enron Email CommunicationsCategory = 	Collection = 	Tags = 	directed graphData source = 	Author = 	L. Kaelbling,
-	M. Gervasio,         W. CohenDate = 	2003Short = 	Vertex type = Enron Employees / individualsEdge type = Email communications between individualsFormat = 	Edge weights = 	UnweightedMetadata = 	directed graphDescription = 	Email communication network from Enronbibtex = 	 emails sent between employees of Enron. Nodes in the network are individual employees and edges are individual emails.bibtex =,
-	
-	@inproceedings{bader2012graph,
-	        title={Graph Partitioning and Graph Clustering},
-	        author={Bader, David A and Meyerhenke, Henning and Sanders, Peter and Wagner, Dorothea},
-	        booktitle={10th DIMACS Implementation Challenge Workshop},
-	        year={2012}
-	}
-	
-	@misc{cohen2005enron,
-	        title={Enron email dataset},
-	        author={Cohen, W.},
-	        note={http://www.cs.cmu.edu/~enron/}
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import EmailEnron
-	
-	    # Then load the graph
-	    graph = EmailEnron()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="EmailEnron",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
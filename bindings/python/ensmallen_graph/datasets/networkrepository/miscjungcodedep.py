@@ -1,198 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph misc-jung-code-dep.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-06 11:17:34.418845
-
-The undirected graph misc-jung-code-dep has 6120 nodes and 50290 weighted
-edges, of which none are self-loops. The graph is sparse as it has a density
-of 0.00269 and is connected, as it has a single component. The graph median
-node degree is 7, the mean node degree is 16.43, and the node degree mode
-is 4. The top 5 most central nodes are 5 (degree 5655), 13 (degree 5557),
-21 (degree 5380), 15 (degree 643) and 14 (degree 625).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-@inproceedings{jung-code-dep,
-        author = {\v{S}ubelj,
-Lovro and Bajec, Marko},
-        title = {Software Systems through Complex Networks Science: Review, Analysis and Applications},
-        booktitle = {Proc. Int. Workshop on Software Mining},
-        year = {2012},
-        isbn = {978-1-4503-1560-9},
-        pages = {9--16},
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import MiscJungCodeDep
-
-    # Then load the graph
-    graph = MiscJungCodeDep()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def MiscJungCodeDep(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the misc-jung-code-dep graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of misc-jung-code-dep graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-06 11:17:34.418845
-	
-	The undirected graph misc-jung-code-dep has 6120 nodes and 50290 weighted
-	edges, of which none are self-loops. The graph is sparse as it has a density
-	of 0.00269 and is connected, as it has a single component. The graph median
-	node degree is 7, the mean node degree is 16.43, and the node degree mode
-	is 4. The top 5 most central nodes are 5 (degree 5655), 13 (degree 5557),
-	21 (degree 5380), 15 (degree 643) and 14 (degree 625).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-	@inproceedings{jung-code-dep,
-	        author = {\v{S}ubelj,
-	Lovro and Bajec, Marko},
-	        title = {Software Systems through Complex Networks Science: Review, Analysis and Applications},
-	        booktitle = {Proc. Int. Workshop on Software Mining},
-	        year = {2012},
-	        isbn = {978-1-4503-1560-9},
-	        pages = {9--16},
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import MiscJungCodeDep
-	
-	    # Then load the graph
-	    graph = MiscJungCodeDep()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="MiscJungCodeDep",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
@@ -1,196 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph soc-brightkite.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-06 11:44:28.366093
-
-The undirected graph soc-brightkite has 56739 nodes and 212945 unweighted
-edges, of which none are self-loops. The graph is quite sparse as it has
-a density of 0.00013 and is connected, as it has a single component. The
-graph median node degree is 2, the mean node degree is 7.51, and the node
-degree mode is 1. The top 5 most central nodes are 41 (degree 1134), 45
-(degree 1055), 109 (degree 854), 117 (degree 838) and 160 (degree 833).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-@inproceedings{cho2011friendship,
-        title={Friendship and mobility: user movement in location-based social networks},
-        author={Cho, Eunjoon and Myers, Seth A and Leskovec, Jure},
-        booktitle={Proceedings of the 17th ACM SIGKDD international conference on Knowledge discovery and data mining},
-        pages={1082--1090},
-        year={2011},
-        organization={ACM}
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import SocBrightkite
-
-    # Then load the graph
-    graph = SocBrightkite()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def SocBrightkite(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the soc-brightkite graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of soc-brightkite graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-06 11:44:28.366093
-	
-	The undirected graph soc-brightkite has 56739 nodes and 212945 unweighted
-	edges, of which none are self-loops. The graph is quite sparse as it has
-	a density of 0.00013 and is connected, as it has a single component. The
-	graph median node degree is 2, the mean node degree is 7.51, and the node
-	degree mode is 1. The top 5 most central nodes are 41 (degree 1134), 45
-	(degree 1055), 109 (degree 854), 117 (degree 838) and 160 (degree 833).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-	@inproceedings{cho2011friendship,
-	        title={Friendship and mobility: user movement in location-based social networks},
-	        author={Cho, Eunjoon and Myers, Seth A and Leskovec, Jure},
-	        booktitle={Proceedings of the 17th ACM SIGKDD international conference on Knowledge discovery and data mining},
-	        pages={1082--1090},
-	        year={2011},
-	        organization={ACM}
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import SocBrightkite
-	
-	    # Then load the graph
-	    graph = SocBrightkite()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="SocBrightkite",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
@@ -1,206 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph soc-google-plus.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-06 12:30:09.851245
-
-The undirected graph soc-google-plus has 211187 nodes, of which 1 are singletons
-(all have self-loops), and 1143411 unweighted edges, of which 1761 are
-self-loops. The graph is extremely sparse as it has a density of 0.00005
-and has 1706 connected components, where the component with most nodes
-has 201949 nodes and the component with the least nodes has a single node.
-The graph median node degree is 2, the mean node degree is 10.82, and the
-node degree mode is 2. The top 5 most central nodes are 136198 (degree
-1790), 5381 (degree 1519), 116002 (degree 1499), 145647 (degree 1400) and
-66836 (degree 1363).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-@article{Fire2013,
-        title={Computationally Efficient Link Prediction in Variety of Social Networks},
-        author={Fire, M., and Tenenboim, R., and Puzis, R., and Lesser, O., and Rokach, L., and Elovici, Y. },
-        journal={ACM Transactions on Intelligent Systems and Technology (TIST)},
-        volume={5},
-        number={1},
-        pages={10},
-        year={2013},
-        publisher={ACM}
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import SocGooglePlus
-
-    # Then load the graph
-    graph = SocGooglePlus()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def SocGooglePlus(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the soc-google-plus graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of soc-google-plus graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-06 12:30:09.851245
-	
-	The undirected graph soc-google-plus has 211187 nodes, of which 1 are singletons
-	(all have self-loops), and 1143411 unweighted edges, of which 1761 are
-	self-loops. The graph is extremely sparse as it has a density of 0.00005
-	and has 1706 connected components, where the component with most nodes
-	has 201949 nodes and the component with the least nodes has a single node.
-	The graph median node degree is 2, the mean node degree is 10.82, and the
-	node degree mode is 2. The top 5 most central nodes are 136198 (degree
-	1790), 5381 (degree 1519), 116002 (degree 1499), 145647 (degree 1400) and
-	66836 (degree 1363).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-	@article{Fire2013,
-	        title={Computationally Efficient Link Prediction in Variety of Social Networks},
-	        author={Fire, M., and Tenenboim, R., and Puzis, R., and Lesser, O., and Rokach, L., and Elovici, Y. },
-	        journal={ACM Transactions on Intelligent Systems and Technology (TIST)},
-	        volume={5},
-	        number={1},
-	        pages={10},
-	        year={2013},
-	        publisher={ACM}
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import SocGooglePlus
-	
-	    # Then load the graph
-	    graph = SocGooglePlus()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="SocGooglePlus",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
@@ -1,200 +0,0 @@
-"""
-This file offers the methods to automatically retrieve the graph soc-twitter-higgs.
-
-The graph is automatically retrieved from the NetworkRepository repository. 
-
-
-
-Report
----------------------
-At the time of rendering these methods (please see datetime below), the graph
-had the following characteristics:
-
-Datetime: 2021-02-07 16:24:36.403839
-
-The undirected graph soc-twitter-higgs has 456631 nodes and 12508465 unweighted
-edges, of which 23 are self-loops. The graph is quite sparse as it has
-a density of 0.00012 and has 157 connected components, where the component
-with most nodes has 456293 nodes and the component with the least nodes
-has 2 nodes. The graph median node degree is 18, the mean node degree is
-54.79, and the node degree mode is 1. The top 5 most central nodes are
-5152 (degree 51386), 1828 (degree 48430), 28423 (degree 45250), 703 (degree
-44188) and 6059 (degree 40146).
-
-
-References
----------------------
-Please cite the following if you use the data:
-
-@inproceedings{nr,
-    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-    author={Ryan A. Rossi and Nesreen K. Ahmed},
-    booktitle = {AAAI},
-    url={http://networkrepository.com},
-    year={2015}
-}
-
-@article{de2013anatomy,
-        title={The anatomy of a scientific rumor},
-        author={De Domenico, Manlio and Lima, Antonio and Mougel, Paul and Musolesi, Mirco},
-        journal={Scientific reports},
-        volume={3},
-        year={2013},
-        publisher={Nature Publishing Group}
-}
-
-
-Usage example
-----------------------
-The usage of this graph is relatively straightforward:
-
-.. code:: python
-
-    # First import the function to retrieve the graph from the datasets
-    from ensmallen_graph.datasets.networkrepository import SocTwitterHiggs
-
-    # Then load the graph
-    graph = SocTwitterHiggs()
-
-    # Finally, you can do anything with it, for instance, compute its report:
-    print(graph)
-
-    # If you need to run a link prediction task with validation,
-    # you can split the graph using a connected holdout as follows:
-    train_graph, validation_graph = graph.connected_holdout(
-        # You can use an 80/20 split the holdout, for example.
-        train_size=0.8,
-        # The random state is used to reproduce the holdout.
-        random_state=42,
-        # Wether to show a loading bar.
-        verbose=True
-    )
-
-    # Remember that, if you need, you can enable the memory-time trade-offs:
-    train_graph.enable(
-        vector_sources=True,
-        vector_destinations=True,
-        vector_outbounds=True
-    )
-
-    # Consider using the methods made available in the Embiggen package
-    # to run graph embedding or link prediction tasks.
-"""
-from typing import Dict
-
-from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
-
-
-def SocTwitterHiggs(
-    directed: bool = False,
-    verbose: int = 2,
-    cache_path: str = "graphs/networkrepository",
-    **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
-    """Return new instance of the soc-twitter-higgs graph.
-
-    The graph is automatically retrieved from the NetworkRepository repository. 
-
-	
-
-    Parameters
-    -------------------
-    directed: bool = False,
-        Wether to load the graph as directed or undirected.
-        By default false.
-    verbose: int = 2,
-        Wether to show loading bars during the retrieval and building
-        of the graph.
-    cache_path: str = "graphs",
-        Where to store the downloaded graphs.
-    additional_graph_kwargs: Dict,
-        Additional graph kwargs.
-
-    Returns
-    -----------------------
-    Instace of soc-twitter-higgs graph.
-
-	Report
-	---------------------
-	At the time of rendering these methods (please see datetime below), the graph
-	had the following characteristics:
-	
-	Datetime: 2021-02-07 16:24:36.403839
-	
-	The undirected graph soc-twitter-higgs has 456631 nodes and 12508465 unweighted
-	edges, of which 23 are self-loops. The graph is quite sparse as it has
-	a density of 0.00012 and has 157 connected components, where the component
-	with most nodes has 456293 nodes and the component with the least nodes
-	has 2 nodes. The graph median node degree is 18, the mean node degree is
-	54.79, and the node degree mode is 1. The top 5 most central nodes are
-	5152 (degree 51386), 1828 (degree 48430), 28423 (degree 45250), 703 (degree
-	44188) and 6059 (degree 40146).
-	
-
-	References
-	---------------------
-	Please cite the following if you use the data:
-	
-	@inproceedings{nr,
-	    title = {The Network Data Repository with Interactive Graph Analytics and Visualization},
-	    author={Ryan A. Rossi and Nesreen K. Ahmed},
-	    booktitle = {AAAI},
-	    url={http://networkrepository.com},
-	    year={2015}
-	}
-	
-	@article{de2013anatomy,
-	        title={The anatomy of a scientific rumor},
-	        author={De Domenico, Manlio and Lima, Antonio and Mougel, Paul and Musolesi, Mirco},
-	        journal={Scientific reports},
-	        volume={3},
-	        year={2013},
-	        publisher={Nature Publishing Group}
-	}
-	
-
-	Usage example
-	----------------------
-	The usage of this graph is relatively straightforward:
-	
-	.. code:: python
-	
-	    # First import the function to retrieve the graph from the datasets
-	    from ensmallen_graph.datasets.networkrepository import SocTwitterHiggs
-	
-	    # Then load the graph
-	    graph = SocTwitterHiggs()
-	
-	    # Finally, you can do anything with it, for instance, compute its report:
-	    print(graph)
-	
-	    # If you need to run a link prediction task with validation,
-	    # you can split the graph using a connected holdout as follows:
-	    train_graph, validation_graph = graph.connected_holdout(
-	        # You can use an 80/20 split the holdout, for example.
-	        train_size=0.8,
-	        # The random state is used to reproduce the holdout.
-	        random_state=42,
-	        # Wether to show a loading bar.
-	        verbose=True
-	    )
-	
-	    # Remember that, if you need, you can enable the memory-time trade-offs:
-	    train_graph.enable(
-	        vector_sources=True,
-	        vector_destinations=True,
-	        vector_outbounds=True
-	    )
-	
-	    # Consider using the methods made available in the Embiggen package
-	    # to run graph embedding or link prediction tasks.
-    """
-    return AutomaticallyRetrievedGraph(
-        graph_name="SocTwitterHiggs",
-        dataset="networkrepository",
-        directed=directed,
-        verbose=verbose,
-        cache_path=cache_path,
-        additional_graph_kwargs=additional_graph_kwargs
-    )()
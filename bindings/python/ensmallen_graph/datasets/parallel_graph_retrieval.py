@@ -0,0 +1,114 @@
+"""Utility to retrieve multiple graphs in parallel."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, FrozenSet, List, TYPE_CHECKING
+
+from .automatic_graph_retrieval import download_graph
+from .graph_spec import unavailable_graph_error
+
+if TYPE_CHECKING:
+    from ..ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+
+def load_many_graphs(
+    graph_retrieval_methods: Dict[str, Callable],
+    graph_names: List[str],
+    max_workers: int = None,
+    **kwargs: Dict
+) -> Dict[str, "EnsmallenGraph"]:
+    """Return dictionary with the requested graphs, retrieved in parallel.
+
+    The graphs are downloaded and built on a pool of threads: the download
+    is I/O bound and the graph construction releases the GIL, so the graphs
+    are retrieved in about the time required by the slowest one.
+
+    Parameters
+    -------------------
+    graph_retrieval_methods: Dict[str, Callable],
+        The methods available to retrieve the graphs, by graph name.
+    graph_names: List[str],
+        The names of the graphs to retrieve.
+    max_workers: int = None,
+        Number of threads to use.
+        By default, one per graph up to the number of available CPUs.
+    **kwargs: Dict,
+        The kwargs to pass to each graph retrieval method.
+        Unless specified otherwise, the loading bars are disabled since
+        they would be interleaved between the threads.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+
+    Returns
+    -------------------
+    Dictionary with the retrieved graphs, by graph name.
+    """
+    for graph_name in graph_names:
+        if graph_name not in graph_retrieval_methods:
+            raise unavailable_graph_error(graph_name)
+    # Each graph is retrieved once, even when requested more than once.
+    graph_names = list(dict.fromkeys(graph_names))
+    if not graph_names:
+        return {}
+    if max_workers is None:
+        max_workers = min(len(graph_names), os.cpu_count() or 1)
+    kwargs.setdefault("verbose", 0)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(
+            graph_names,
+            executor.map(
+                lambda graph_name: graph_retrieval_methods[graph_name](
+                    **kwargs
+                ),
+                graph_names
+            )
+        ))
+
+
+def prefetch_graphs(
+    dataset: str,
+    available_graphs: FrozenSet[str],
+    graph_names: List[str],
+    max_workers: int = 6,
+    **kwargs: Dict
+):
+    """Download the files of the requested graphs in parallel.
+
+    The graphs are not built: the following calls to their retrieval
+    methods will find their files already in the cache path. The eventual
+    callbacks processing the downloaded files are run when the graphs
+    are then retrieved.
+
+    Parameters
+    -------------------
+    dataset: str,
+        Name of the dataset the graphs belong to.
+    available_graphs: FrozenSet[str],
+        The names of the graphs available in the dataset.
+    graph_names: List[str],
+        The names of the graphs to download.
+    max_workers: int = 6,
+        Number of concurrent downloads.
+    **kwargs: Dict,
+        The kwargs to pass to each graph download, such as the cache path.
+        Unless specified otherwise, the loading bars are disabled since
+        they would be interleaved between the threads.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+    """
+    load_many_graphs(
+        {
+            graph_name: partial(download_graph, graph_name, dataset)
+            for graph_name in graph_names
+            if graph_name in available_graphs
+        },
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
@@ -1,5095 +1,126 @@
-"""This sub-module offers methods to automatically retrieve the graphs from STRING repository."""
+"""This sub-module offers methods to automatically retrieve the graphs from STRING repository.
+
+The graph retrieval methods are built on first access from the names
+listed in `__all__` and the metadata stored alongside this file.
+"""
+from typing import Dict, List, TYPE_CHECKING
+
+from ..graph_retrieval_method import GraphRetrievalMethod
+from ..parallel_graph_retrieval import load_many_graphs, prefetch_graphs
+
+if TYPE_CHECKING:
+    from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+
+def __getattr__(name: str) -> GraphRetrievalMethod:
+    """Return the method to retrieve the graph with the given name.
+
+    Parameters
+    -------------------
+    name: str,
+        The name of the graph retrieval method, for instance `"PseudomonasAeruginosa"`.
+
+    Raises
+    -------------------
+    AttributeError,
+        If the requested graph is not available.
+
+    Returns
+    -------------------
+    The method to retrieve the requested graph.
+    """
+    if name not in AVAILABLE_GRAPHS:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    graph_retrieval_method = GraphRetrievalMethod(
+        graph_method_name=name,
+        dataset="string",
+        repository_name="STRING"
+    )
+    # We store the method in the module so that the following accesses
+    # do not go through this function anymore.
+    globals()[name] = graph_retrieval_method
+    return graph_retrieval_method
+
+
+def __dir__() -> List[str]:
+    """Return the names available in this module."""
+    return sorted(set(globals()) | AVAILABLE_GRAPHS)
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = None,
+    **kwargs: Dict
+) -> Dict[str, "EnsmallenGraph"]:
+    """Return dictionary with the requested graphs, retrieved in parallel.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to retrieve, for instance `["PseudomonasAeruginosa"]`.
+    max_workers: int = None,
+        Number of threads to use.
+        By default, one per graph up to the number of available CPUs.
+    **kwargs: Dict,
+        The kwargs to pass to each graph retrieval method.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+
+    Returns
+    -------------------
+    Dictionary with the retrieved graphs, by graph name.
+    """
+    return load_many_graphs(
+        {
+            # The methods already built are looked up in the module, so
+            # that they are not replaced by new instances.
+            graph_name: globals().get(graph_name) or __getattr__(graph_name)
+            for graph_name in graph_names
+            if graph_name in AVAILABLE_GRAPHS
+        },
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = 6,
+    **kwargs: Dict
+):
+    """Download the files of the requested graphs in parallel.
+
+    The graphs are not built: the following calls to their retrieval
+    methods will find their files already in the cache path.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to download, for instance `["PseudomonasAeruginosa"]`.
+    max_workers: int = 6,
+        Number of concurrent downloads.
+    **kwargs: Dict,
+        The kwargs to pass to each graph download, such as the cache path.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+    """
+    prefetch_graphs(
+        "string",
+        AVAILABLE_GRAPHS,
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
 
-from .pseudomonasaeruginosa import PseudomonasAeruginosa
-from .burkholderiacepacia import BurkholderiaCepacia
-from .pseudomonasoleovorans import PseudomonasOleovorans
-from .xanthomonascampestriscampestris import XanthomonasCampestrisCampestris
-from .agrobacteriumrhizogenes import AgrobacteriumRhizogenes
-from .sinorhizobiumfrediingr234 import SinorhizobiumFrediiNgr234
-from .acinetobacterbaumannii import AcinetobacterBaumannii
-from .alcaligenesfaecalis import AlcaligenesFaecalis
-from .pantoeaagglomerans import PantoeaAgglomerans
-from .klebsiellaoxytoca import KlebsiellaOxytoca
-from .klebsiellapneumoniae import KlebsiellaPneumoniae
-from .proteusvulgaris import ProteusVulgaris
-from .yersiniapseudotuberculosis import YersiniaPseudotuberculosis
-from .vibriovulnificus import VibrioVulnificus
-from .pasteurellamultocida import PasteurellaMultocida
-from .pasteurellapneumotropica import PasteurellaPneumotropica
-from .chlamydiatrachomatis import ChlamydiaTrachomatis
-from .campylobacterureolyticus import CampylobacterUreolyticus
-from .desulfovibriovulgarishildenborough import DesulfovibrioVulgarisHildenborough
-from .desulfovibriovulgarismiyazaki import DesulfovibrioVulgarisMiyazaki
-from .flavobacteriumhydatis import FlavobacteriumHydatis
-from .erythrobacterlongus import ErythrobacterLongus
-from .synechococcuselongatuspcc7942 import SynechococcusElongatusPcc7942
-from .accumulibacterspba93 import AccumulibacterSpBa93
-from .achromobactersprta import AchromobacterSpRta
-from .leuconostoclactis import LeuconostocLactis
-from .dermacoccusnishinomiyaensis import DermacoccusNishinomiyaensis
-from .staphylococcusaureus import StaphylococcusAureus
-from .staphylococcusxylosus import StaphylococcusXylosus
-from .streptococcuspyogenes import StreptococcusPyogenes
-from .streptococcusiniae import StreptococcusIniae
-from .bacilluscereus import BacillusCereus
-from .bacillusmycoides import BacillusMycoides
-from .acidobacteriumsppmmr2 import AcidobacteriumSpPmmr2
-from .clostridiumsticklandii import ClostridiumSticklandii
-from .lactobacillusanimalis import LactobacillusAnimalis
-from .bifidobacteriumadolescentis import BifidobacteriumAdolescentis
-from .bifidobacteriumcoryneforme import BifidobacteriumCoryneforme
-from .bifidobacteriumcuniculi import BifidobacteriumCuniculi
-from .bifidobacteriumpseudolongumglobosum import BifidobacteriumPseudolongumGlobosum
-from .bifidobacteriummagnum import BifidobacteriumMagnum
-from .bifidobacteriumminimum import BifidobacteriumMinimum
-from .oerskoviaturbata import OerskoviaTurbata
-from .corynebacteriumpseudotuberculosis import CorynebacteriumPseudotuberculosis
-from .rhodococcusfascians import RhodococcusFascians
-from .actinoplanesutahensis import ActinoplanesUtahensis
-from .streptomycesaureofaciens import StreptomycesAureofaciens
-from .streptomycesbikiniensis import StreptomycesBikiniensis
-from .streptomycesfradiae import StreptomycesFradiae
-from .streptomycesglaucescens import StreptomycesGlaucescens
-from .streptomyceshalstedii import StreptomycesHalstedii
-from .streptomycessclerotialus import StreptomycesSclerotialus
-from .streptomycesvirginiae import StreptomycesVirginiae
-from .streptomycescellulosae import StreptomycesCellulosae
-from .microtetrasporaglauca import MicrotetrasporaGlauca
-from .streptosporangiumamethystogenes import StreptosporangiumAmethystogenes
-from .pimelobactersimplex import PimelobacterSimplex
-from .gordoniaterrae import GordoniaTerrae
-from .pseudonocardiaautotrophica import PseudonocardiaAutotrophica
-from .mycoplasmaagalactiae import MycoplasmaAgalactiae
-from .mycoplasmacalifornicum import MycoplasmaCalifornicum
-from .thermoanaerobacterkivui import ThermoanaerobacterKivui
-from .solemyavelum import SolemyaVelum
-from .sodalispierantonius import SodalisPierantonius
-from .fervidobacteriumislandicum import FervidobacteriumIslandicum
-from .citrussinensis import CitrusSinensis
-from .synergistesjonesii import SynergistesJonesii
-from .phaeodactylumtricornutum import PhaeodactylumTricornutum
-from .ectocarpussiliculosus import EctocarpusSiliculosus
-from .emilianiahuxleyi import EmilianiaHuxleyi
-from .chlamydomonasreinhardtii import ChlamydomonasReinhardtii
-from .volvoxcarteri import VolvoxCarteri
-from .auxenochlorellaprotothecoides import AuxenochlorellaProtothecoides
-from .physcomitrellapatens import PhyscomitrellaPatens
-from .theobromacacao import TheobromaCacao
-from .caricapapaya import CaricaPapaya
-from .cucumismelo import CucumisMelo
-from .cucumissativus import CucumisSativus
-from .populustrichocarpa import PopulusTrichocarpa
-from .arabidopsisthaliana import ArabidopsisThaliana
-from .brassicarapa import BrassicaRapa
-from .brassicaoleracea import BrassicaOleracea
-from .malusdomestica import MalusDomestica
-from .prunuspersica import PrunusPersica
-from .cicerarietinum import CicerArietinum
-from .glycinemax import GlycineMax
-from .medicagotruncatula import MedicagoTruncatula
-from .phaseolusvulgaris import PhaseolusVulgaris
-from .manihotesculenta import ManihotEsculenta
-from .ricinuscommunis import RicinusCommunis
-from .linumusitatissimum import LinumUsitatissimum
-from .solanumlycopersicum import SolanumLycopersicum
-from .nicotianasylvestris import NicotianaSylvestris
-from .nicotianatomentosiformis import NicotianaTomentosiformis
-from .solanumtuberosum import SolanumTuberosum
-from .erythrantheguttata import ErythrantheGuttata
-from .nelumbonucifera import NelumboNucifera
-from .hordeumvulgare import HordeumVulgare
-from .oryzarufipogon import OryzaRufipogon
-from .oryzasativa import OryzaSativa
-from .oryzabrachyantha import OryzaBrachyantha
-from .oryzanivara import OryzaNivara
-from .oryzapunctata import OryzaPunctata
-from .oryzaglaberrima import OryzaGlaberrima
-from .setariaitalica import SetariaItalica
-from .sorghumbicolor import SorghumBicolor
-from .triticumaestivum import TriticumAestivum
-from .triticumurartu import TriticumUrartu
-from .zeamays import ZeaMays
-from .musaacuminata import MusaAcuminata
-from .phytophthorainfestans import PhytophthoraInfestans
-from .phytophthoraparasitica import PhytophthoraParasitica
-from .schizosaccharomycespombe import SchizosaccharomycesPombe
-from .schizosaccharomycesjaponicus import SchizosaccharomycesJaponicus
-from .schizosaccharomycesoctosporus import SchizosaccharomycesOctosporus
-from .pichiakudriavzevii import PichiaKudriavzevii
-from .millerozymafarinosa import MillerozymaFarinosa
-from .komagataellapastoris import KomagataellaPastoris
-from .scheffersomycesstipitis import ScheffersomycesStipitis
-from .meyerozymaguilliermondii import MeyerozymaGuilliermondii
-from .saccharomycescerevisiae import SaccharomycesCerevisiae
-from .torulasporadelbrueckii import TorulasporaDelbrueckii
-from .yarrowialipolytica import YarrowiaLipolytica
-from .zygosaccharomycesrouxii import ZygosaccharomycesRouxii
-from .debaryomyceshansenii import DebaryomycesHansenii
-from .taphrinadeformans import TaphrinaDeformans
-from .bipolarismaydis import BipolarisMaydis
-from .bipolariszeicola import BipolarisZeicola
-from .leptosphaeriamaculans import LeptosphaeriaMaculans
-from .histoplasmacapsulatum import HistoplasmaCapsulatum
-from .blastomycesdermatitidis import BlastomycesDermatitidis
-from .aspergillusclavatus import AspergillusClavatus
-from .aspergillusflavus import AspergillusFlavus
-from .aspergillusniger import AspergillusNiger
-from .aspergillusoryzae import AspergillusOryzae
-from .clavicepspurpurea import ClavicepsPurpurea
-from .fusariumfujikuroi import FusariumFujikuroi
-from .neurosporacrassa import NeurosporaCrassa
-from .podosporaanserina import PodosporaAnserina
-from .sordariamacrospora import SordariaMacrospora
-from .sclerotiniasclerotiorum import SclerotiniaSclerotiorum
-from .cryptococcusneoformans import CryptococcusNeoformans
-from .tremellamesenterica import TremellaMesenterica
-from .ustilagomaydis import UstilagoMaydis
-from .rhodosporidiumtoruloides import RhodosporidiumToruloides
-from .pucciniagraminis import PucciniaGraminis
-from .schizophyllumcommune import SchizophyllumCommune
-from .agaricusbisporus import AgaricusBisporus
-from .coprinopsiscinerea import CoprinopsisCinerea
-from .colletotrichumorbiculare import ColletotrichumOrbiculare
-from .candidaalbicans import CandidaAlbicans
-from .candidaglabrata import CandidaGlabrata
-from .candidamaltosa import CandidaMaltosa
-from .candidaparapsilosis import CandidaParapsilosis
-from .candidatropicalis import CandidaTropicalis
-from .coccidioidesimmitis import CoccidioidesImmitis
-from .fusariumoxysporum import FusariumOxysporum
-from .fusariumgraminearum import FusariumGraminearum
-from .trichophytonrubrum import TrichophytonRubrum
-from .leishmaniamajor import LeishmaniaMajor
-from .leishmaniainfantum import LeishmaniaInfantum
-from .leishmaniapanamensis import LeishmaniaPanamensis
-from .trypanosomabrucei import TrypanosomaBrucei
-from .trypanosomacruzi import TrypanosomaCruzi
-from .trichomonasvaginalis import TrichomonasVaginalis
-from .giardiaintestinalis import GiardiaIntestinalis
-from .entamoebahistolytica import EntamoebaHistolytica
-from .naegleriagruberi import NaegleriaGruberi
-from .dictyosteliumpurpureum import DictyosteliumPurpureum
-from .cryptosporidiummuris import CryptosporidiumMuris
-from .toxoplasmagondii import ToxoplasmaGondii
-from .plasmodiumberghei import PlasmodiumBerghei
-from .plasmodiumchabaudi import PlasmodiumChabaudi
-from .plasmodiumcynomolgi import PlasmodiumCynomolgi
-from .plasmodiumfalciparum import PlasmodiumFalciparum
-from .plasmodiumknowlesi import PlasmodiumKnowlesi
-from .plasmodiumvivax import PlasmodiumVivax
-from .plasmodiumvinckei import PlasmodiumVinckei
-from .babesiabovis import BabesiaBovis
-from .babesiaequi import BabesiaEqui
-from .theileriaannulata import TheileriaAnnulata
-from .theileriaparva import TheileriaParva
-from .parameciumtetraurelia import ParameciumTetraurelia
-from .tetrahymenathermophila import TetrahymenaThermophila
-from .ichthyophthiriusmultifiliis import IchthyophthiriusMultifiliis
-from .exophialadermatitidis import ExophialaDermatitidis
-from .hydravulgaris import HydraVulgaris
-from .schistosomamansoni import SchistosomaMansoni
-from .echinococcusmultilocularis import EchinococcusMultilocularis
-from .caenorhabditisbriggsae import CaenorhabditisBriggsae
-from .caenorhabditiselegans import CaenorhabditisElegans
-from .bursaphelenchusxylophilus import BursaphelenchusXylophilus
-from .trichinellaspiralis import TrichinellaSpiralis
-from .helobdellarobusta import HelobdellaRobusta
-from .aplysiacalifornica import AplysiaCalifornica
-from .daphniapulex import DaphniaPulex
-from .acyrthosiphonpisum import AcyrthosiphonPisum
-from .triboliumcastaneum import TriboliumCastaneum
-from .bombyxmori import BombyxMori
-from .aedesaegypti import AedesAegypti
-from .anophelesgambiae import AnophelesGambiae
-from .culexquinquefasciatus import CulexQuinquefasciatus
-from .loaloa import LoaLoa
-from .ceratitiscapitata import CeratitisCapitata
-from .drosophilaananassae import DrosophilaAnanassae
-from .drosophilaerecta import DrosophilaErecta
-from .drosophilagrimshawi import DrosophilaGrimshawi
-from .drosophilamelanogaster import DrosophilaMelanogaster
-from .drosophilamojavensis import DrosophilaMojavensis
-from .drosophilapersimilis import DrosophilaPersimilis
-from .drosophilapseudoobscura import DrosophilaPseudoobscura
-from .drosophilavirilis import DrosophilaVirilis
-from .drosophilayakuba import DrosophilaYakuba
-from .drosophilawillistoni import DrosophilaWillistoni
-from .muscadomestica import MuscaDomestica
-from .nasoniavitripennis import NasoniaVitripennis
-from .apismellifera import ApisMellifera
-from .strongylocentrotuspurpuratus import StrongylocentrotusPurpuratus
-from .cionaintestinalis import CionaIntestinalis
-from .branchiostomafloridae import BranchiostomaFloridae
-from .latimeriachalumnae import LatimeriaChalumnae
-from .lepisosteusoculatus import LepisosteusOculatus
-from .daniorerio import DanioRerio
-from .astyanaxmexicanus import AstyanaxMexicanus
-from .esoxlucius import EsoxLucius
-from .gadusmorhua import GadusMorhua
-from .poeciliareticulata import PoeciliaReticulata
-from .xiphophorusmaculatus import XiphophorusMaculatus
-from .oryziaslatipes import OryziasLatipes
-from .oreochromisniloticus import OreochromisNiloticus
-from .haplochromisburtoni import HaplochromisBurtoni
-from .xenopustropicalis import XenopusTropicalis
-from .cheloniamydas import CheloniaMydas
-from .chrysemyspicta import ChrysemysPicta
-from .alligatormississippiensis import AlligatorMississippiensis
-from .columbalivia import ColumbaLivia
-from .gallusgallus import GallusGallus
-from .ornithorhynchusanatinus import OrnithorhynchusAnatinus
-from .sarcophilusharrisii import SarcophilusHarrisii
-from .macropuseugenii import MacropusEugenii
-from .dasypusnovemcinctus import DasypusNovemcinctus
-from .erinaceuseuropaeus import ErinaceusEuropaeus
-from .echinopstelfairi import EchinopsTelfairi
-from .pteropusalecto import PteropusAlecto
-from .tarsiussyrichta import TarsiusSyrichta
-from .callithrixjacchus import CallithrixJacchus
-from .macacafascicularis import MacacaFascicularis
-from .macacamulatta import MacacaMulatta
-from .papioanubis import PapioAnubis
-from .gorillagorilla import GorillaGorilla
-from .panpaniscus import PanPaniscus
-from .pantroglodytes import PanTroglodytes
-from .pongoabelii import PongoAbelii
-from .homosapiens import HomoSapiens
-from .canislupus import CanisLupus
-from .ailuropodamelanoleuca import AiluropodaMelanoleuca
-from .mustelaputorius import MustelaPutorius
-from .feliscatus import FelisCatus
-from .pantheratigris import PantheraTigris
-from .odobenusrosmarus import OdobenusRosmarus
-from .leptonychotesweddellii import LeptonychotesWeddellii
-from .orcinusorca import OrcinusOrca
-from .tursiopstruncatus import TursiopsTruncatus
-from .balaenopteraacutorostrata import BalaenopteraAcutorostrata
-from .trichechusmanatus import TrichechusManatus
-from .loxodontaafricana import LoxodontaAfricana
-from .orycteropusafer import OrycteropusAfer
-from .susscrofa import SusScrofa
-from .bostaurus import BosTaurus
-from .ovisaries import OvisAries
-from .ochotonaprinceps import OchotonaPrinceps
-from .oryctolaguscuniculus import OryctolagusCuniculus
-from .cricetulusgriseus import CricetulusGriseus
-from .mesocricetusauratus import MesocricetusAuratus
-from .peromyscusmaniculatus import PeromyscusManiculatus
-from .musmusculus import MusMusculus
-from .rattusnorvegicus import RattusNorvegicus
-from .caviaporcellus import CaviaPorcellus
-from .octodondegus import OctodonDegus
-from .heterocephalusglaber import HeterocephalusGlaber
-from .saccoglossuskowalevskii import SaccoglossusKowalevskii
-from .trichoplaxadhaerens import TrichoplaxAdhaerens
-from .attacephalotes import AttaCephalotes
-from .dactylococcopsissalina import DactylococcopsisSalina
-from .danausplexippus import DanausPlexippus
-from .rhodniusprolixus import RhodniusProlixus
-from .amborellatrichopoda import AmborellaTrichopoda
-from .arthrobotrysoligospora import ArthrobotrysOligospora
-from .monodelphisdomestica import MonodelphisDomestica
-from .parastagonosporanodorum import ParastagonosporaNodorum
-from .sphingomonaspaucimobilis import SphingomonasPaucimobilis
-from .sphingobiumyanoikuyae import SphingobiumYanoikuyae
-from .pelodiscussinensis import PelodiscusSinensis
-from .brachypodiumdistachyon import BrachypodiumDistachyon
-from .naumovozymacastellii import NaumovozymaCastellii
-from .naumovozymadairenensis import NaumovozymaDairenensis
-from .verticilliumdahliae import VerticilliumDahliae
-from .saimiriboliviensis import SaimiriBoliviensis
-from .mnemiopsisleidyi import MnemiopsisLeidyi
-from .saccharopolysporarectivirgula import SaccharopolysporaRectivirgula
-from .acinetobacterspadp1 import AcinetobacterSpAdp1
-from .porphyromonasmacacae import PorphyromonasMacacae
-from .yersiniakristensenii import YersiniaKristensenii
-from .photodesmuskatoptron import PhotodesmusKatoptron
-from .colwelliapsychrerythraea import ColwelliaPsychrerythraea
-from .cobetiamarina import CobetiaMarina
-from .anoliscarolinensis import AnolisCarolinensis
-from .herbidosporacretacea import HerbidosporaCretacea
-from .tarenayahassleriana import TarenayaHassleriana
-from .talaromycesstipitatus import TalaromycesStipitatus
-from .allomycesmacrogynus import AllomycesMacrogynus
-from .elephantulusedwardii import ElephantulusEdwardii
-from .kluyveromyceslactis import KluyveromycesLactis
-from .ursusmaritimus import UrsusMaritimus
-from .eptesicusfuscus import EptesicusFuscus
-from .neosporacaninum import NeosporaCaninum
-from .streptomycesgriseoluteus import StreptomycesGriseoluteus
-from .yersiniaruckeri import YersiniaRuckeri
-from .vibrionavarrensis import VibrioNavarrensis
-from .natrialbaasiatica import NatrialbaAsiatica
-from .janthinobacteriumlividum import JanthinobacteriumLividum
-from .gossypiumraimondii import GossypiumRaimondii
-from .vitisvinifera import VitisVinifera
-from .gaeumannomycesgraminis import GaeumannomycesGraminis
-from .trichodermavirens import TrichodermaVirens
-from .sporothrixschenckii import SporothrixSchenckii
-from .otolemurgarnettii import OtolemurGarnettii
-from .takifugurubripes import TakifuguRubripes
-from .caenorhabditisremanei import CaenorhabditisRemanei
-from .colletotrichumgraminicola import ColletotrichumGraminicola
-from .bifidobacteriumpseudolongum import BifidobacteriumPseudolongum
-from .clavibactermichiganensissepedonicus import ClavibacterMichiganensisSepedonicus
-from .campylobactersputorum import CampylobacterSputorum
-from .pseudomonasstutzeriatcc14405 import PseudomonasStutzeriAtcc14405
-from .acidovoraxspjhl9 import AcidovoraxSpJhl9
-from .acidovoraxspjs42 import AcidovoraxSpJs42
-from .acidovoraxspmrs7 import AcidovoraxSpMrs7
-from .tetranychusurticae import TetranychusUrticae
-from .neolamprologusbrichardi import NeolamprologusBrichardi
-from .blautiaproducta import BlautiaProducta
-from .eremotheciumgossypii import EremotheciumGossypii
-from .aspergillusterreus import AspergillusTerreus
-from .uncinocarpusreesii import UncinocarpusReesii
-from .catenuloplanesjaponicus import CatenuloplanesJaponicus
-from .streptomycesgalbus import StreptomycesGalbus
-from .bifidobacteriumthermophilum import BifidobacteriumThermophilum
-from .paracoccusversutus import ParacoccusVersutus
-from .mixiaosmundae import MixiaOsmundae
-from .blumeriagraminis import BlumeriaGraminis
-from .strongyloidesratti import StrongyloidesRatti
-from .heliconiusmelpomene import HeliconiusMelpomene
-from .chinchillalanigera import ChinchillaLanigera
-from .thalassiosirapseudonana import ThalassiosiraPseudonana
-from .citrobacteramalonaticus import CitrobacterAmalonaticus
-from .thielaviaterrestris import ThielaviaTerrestris
-from .macrophominaphaseolina import MacrophominaPhaseolina
-from .dactylosporangiumaurantiacum import DactylosporangiumAurantiacum
-from .bifidobacteriumchoerinum import BifidobacteriumChoerinum
-from .bacillusthermoamylovorans import BacillusThermoamylovorans
-from .vanderwaltozymapolyspora import VanderwaltozymaPolyspora
-from .mucorcircinelloides import MucorCircinelloides
-from .pythiumirregulare import PythiumIrregulare
-from .neosartoryafischeri import NeosartoryaFischeri
-from .penicilliumdigitatum import PenicilliumDigitatum
-from .mycobacteriumabscessus import MycobacteriumAbscessus
-from .acidovoraxspkks102 import AcidovoraxSpKks102
-from .porphyromonascangingivalis import PorphyromonasCangingivalis
-from .porphyromonascanoris import PorphyromonasCanoris
-from .lodderomyceselongisporus import LodderomycesElongisporus
-from .clostridiumalgidicarnis import ClostridiumAlgidicarnis
-from .aegilopstauschii import AegilopsTauschii
-from .phytoplasmamali import PhytoplasmaMali
-from .talaromycesmarneffei import TalaromycesMarneffei
-from .rhodococcusopacus import RhodococcusOpacus
-from .chaetomiumglobosum import ChaetomiumGlobosum
-from .alligatorsinensis import AlligatorSinensis
-from .panicumvirgatum import PanicumVirgatum
-from .micromonaspusilla import MicromonasPusilla
-from .tubermelanosporum import TuberMelanosporum
-from .streptococcusequi import StreptococcusEqui
-from .neurosporatetrasperma import NeurosporaTetrasperma
-from .oryzaglumipatula import OryzaGlumipatula
-from .oryzameridionalis import OryzaMeridionalis
-from .acinetobacterjunii import AcinetobacterJunii
-from .aciduliprofundumspmar08339 import AciduliprofundumSpMar08339
-from .aspergilluskawachii import AspergillusKawachii
-from .fomitopsispinicola import FomitopsisPinicola
-from .stereumhirsutum import StereumHirsutum
-from .botrytiscinerea import BotrytisCinerea
-from .lentzeaalbidocapillata import LentzeaAlbidocapillata
-from .acinetobactersphr7 import AcinetobacterSpHr7
-from .bathycoccusprasinos import BathycoccusPrasinos
-from .pneumocystisjirovecii import PneumocystisJirovecii
-from .pythiumvexans import PythiumVexans
-from .sorexaraneus import SorexAraneus
-from .rubrobacterradiotolerans import RubrobacterRadiotolerans
-from .phoenixdactylifera import PhoenixDactylifera
-from .candidadubliniensis import CandidaDubliniensis
-from .halomonassalina import HalomonasSalina
-from .anophelesdarlingi import AnophelesDarlingi
-from .ictidomystridecemlineatus import IctidomysTridecemlineatus
-from .caproniaepimyces import CaproniaEpimyces
-from .caproniacoronata import CaproniaCoronata
-from .prauserellarugosa import PrauserellaRugosa
-from .streptomyceswedmorensis import StreptomycesWedmorensis
-from .acinetobacterspanc4105 import AcinetobacterSpAnc4105
-from .aureococcusanophagefferens import AureococcusAnophagefferens
-from .streptomycesmegasporus import StreptomycesMegasporus
-from .paenibacillusdurus import PaenibacillusDurus
-from .mycobacteriumaviumavium import MycobacteriumAviumAvium
-from .dictyosteliumdiscoideum import DictyosteliumDiscoideum
-from .bipolarissorokiniana import BipolarisSorokiniana
-from .pyrenophoratriticirepentis import PyrenophoraTriticirepentis
-from .cyanidioschyzonmerolae import CyanidioschyzonMerolae
-from .eremotheciumcymbalariae import EremotheciumCymbalariae
-from .nematostellavectensis import NematostellaVectensis
-from .mycoplasmaconjunctivae import MycoplasmaConjunctivae
-from .candidatenuis import CandidaTenuis
-from .afipiasp1nls2 import AfipiaSp1nls2
-from .weissellahellenica import WeissellaHellenica
-from .sphingobiumchlorophenolicum import SphingobiumChlorophenolicum
-from .entamoebadispar import EntamoebaDispar
-from .streptomycesolivaceus import StreptomycesOlivaceus
-from .streptomyceslydicus import StreptomycesLydicus
-from .mycobacteriumtriplex import MycobacteriumTriplex
-from .poeciliaformosa import PoeciliaFormosa
-from .arabisalpina import ArabisAlpina
-from .helicobactertrogontum import HelicobacterTrogontum
-from .jaculusjaculus import JaculusJaculus
-from .trichodermareesei import TrichodermaReesei
-from .cionasavignyi import CionaSavignyi
-from .acinetobacterspp838 import AcinetobacterSpP838
-from .haliaeetusleucocephalus import HaliaeetusLeucocephalus
-from .pyrenophorateres import PyrenophoraTeres
-from .pectobacteriumbetavasculorum import PectobacteriumBetavasculorum
-from .guillardiatheta import GuillardiaTheta
-from .vibrioanguillarum import VibrioAnguillarum
-from .streptomycestoyocaensis import StreptomycesToyocaensis
-from .cylindrospermumstagnale import CylindrospermumStagnale
-from .oscillatoriaacuminata import OscillatoriaAcuminata
-from .syntrophusaciditrophicus import SyntrophusAciditrophicus
-from .fragariavesca import FragariaVesca
-from .spirillosporaalbida import SpirillosporaAlbida
-from .streptomycescelluloflavus import StreptomycesCelluloflavus
-from .rickettsiellagrylli import RickettsiellaGrylli
-from .fibrobactersuccinogenes import FibrobacterSuccinogenes
-from .myotislucifugus import MyotisLucifugus
-from .pantholopshodgsonii import PantholopsHodgsonii
-from .arabidopsislyrata import ArabidopsisLyrata
-from .phytoplasmaaustraliense import PhytoplasmaAustraliense
-from .ficedulaalbicollis import FicedulaAlbicollis
-from .prochlorococcusmarinuspastoris import ProchlorococcusMarinusPastoris
-from .prochlorococcusmarinusmit9107 import ProchlorococcusMarinusMit9107
-from .prochlorococcusmarinusgp2 import ProchlorococcusMarinusGp2
-from .prochlorococcusmarinussb import ProchlorococcusMarinusSb
-from .acinetobacterspatcc27244 import AcinetobacterSpAtcc27244
-from .lactobacillusparaplantarum import LactobacillusParaplantarum
-from .chlorocebussabaeus import ChlorocebusSabaeus
-from .ophiostomapiceae import OphiostomaPiceae
-from .coniosporiumapollinis import ConiosporiumApollinis
-from .rhinopithecusroxellana import RhinopithecusRoxellana
-from .pluralibactergergoviae import PluralibacterGergoviae
-from .nomascusleucogenys import NomascusLeucogenys
-from .acinetobacterspanc3789 import AcinetobacterSpAnc3789
-from .afipiaspp5210 import AfipiaSpP5210
-from .arthrodermabenhamiae import ArthrodermaBenhamiae
-from .microsporumgypseum import MicrosporumGypseum
-from .arthrodermaotae import ArthrodermaOtae
-from .trichophytonequinum import TrichophytonEquinum
-from .trichodermaatroviride import TrichodermaAtroviride
-from .nostocpunctiforme import NostocPunctiforme
-from .mycosphaerellapini import MycosphaerellaPini
-from .acinetobacterspcip102129 import AcinetobacterSpCip102129
-from .pythiumultimum import PythiumUltimum
-from .acinetobacterspanc3862 import AcinetobacterSpAnc3862
-from .anabaenasp90 import AnabaenaSp90
-from .oryzabarthii import OryzaBarthii
-from .actinoalloteichuscyanogriseus import ActinoalloteichusCyanogriseus
-from .piriformosporaindica import PiriformosporaIndica
-from .pantoeastewartii import PantoeaStewartii
-from .streptomycesniger import StreptomycesNiger
-from .streptomycesviolens import StreptomycesViolens
-from .streptomycesroseoverticillatus import StreptomycesRoseoverticillatus
-from .bacillusclausii import BacillusClausii
-from .streptomycesatroolivaceus import StreptomycesAtroolivaceus
-from .streptomycesbicolor import StreptomycesBicolor
-from .streptomycescatenulae import StreptomycesCatenulae
-from .streptomycesgriseorubens import StreptomycesGriseorubens
-from .streptomycesalbusalbus import StreptomycesAlbusAlbus
-from .streptomycesalboflavus import StreptomycesAlboflavus
-from .streptomycesaureocirculatus import StreptomycesAureocirculatus
-from .streptomycescalifornicus import StreptomycesCalifornicus
-from .streptomyceslavenduligriseus import StreptomycesLavenduligriseus
-from .streptomycesmutabilis import StreptomycesMutabilis
-from .streptomycespurpeofuscus import StreptomycesPurpeofuscus
-from .streptomycesresistomycificus import StreptomycesResistomycificus
-from .streptomycesvarsoviensis import StreptomycesVarsoviensis
-from .phytophthorasojae import PhytophthoraSojae
-from .lechevalieriaaerocolonigenes import LechevalieriaAerocolonigenes
-from .streptomycesdurhamensis import StreptomycesDurhamensis
-from .streptomycesflavochromogenes import StreptomycesFlavochromogenes
-from .streptomycesiakyrus import StreptomycesIakyrus
-from .streptomyceskatrae import StreptomycesKatrae
-from .streptomycespyridomyceticus import StreptomycesPyridomyceticus
-from .streptomycesalbulus import StreptomycesAlbulus
-from .theileriaorientalis import TheileriaOrientalis
-from .thermococcuskodakarensis import ThermococcusKodakarensis
-from .acinetobacterspniph2100 import AcinetobacterSpNiph2100
-from .aquamicrobiumdefluvii import AquamicrobiumDefluvii
-from .gasterosteusaculeatus import GasterosteusAculeatus
-from .microplitisdemolitor import MicroplitisDemolitor
-from .acinetobacterspver3 import AcinetobacterSpVer3
-from .caulobacterhenricii import CaulobacterHenricii
-from .penicilliumoxalicum import PenicilliumOxalicum
-from .ostreococcustauri import OstreococcusTauri
-from .pyrococcushorikoshii import PyrococcusHorikoshii
-from .eucalyptusgrandis import EucalyptusGrandis
-from .haemophilusinfluenzae import HaemophilusInfluenzae
-from .bosmutus import BosMutus
-from .sphaeroformaarctica import SphaeroformaArctica
-from .ophiocordycepssinensis import OphiocordycepsSinensis
-from .sporisoriumreilianum import SporisoriumReilianum
-from .boecherastricta import BoecheraStricta
-from .eutremasalsugineum import EutremaSalsugineum
-from .streptomycesseoulensis import StreptomycesSeoulensis
-from .cordycepsmilitaris import CordycepsMilitaris
-from .prochlorococcusmarinusmit9302 import ProchlorococcusMarinusMit9302
-from .prochlorococcusmarinusmit9312 import ProchlorococcusMarinusMit9312
-from .prochlorococcusmarinusmit9313 import ProchlorococcusMarinusMit9313
-from .thiomonasintermedia import ThiomonasIntermedia
-from .aromatoleumaromaticum import AromatoleumAromaticum
-from .mycetocolasaprophilus import MycetocolaSaprophilus
-from .pseudomonasputidagb1 import PseudomonasPutidaGb1
-from .leersiaperrieri import LeersiaPerrieri
-from .bifidobacteriumsubtile import BifidobacteriumSubtile
-from .xanthobacterautotrophicus import XanthobacterAutotrophicus
-from .bifidobacteriumgallinarum import BifidobacteriumGallinarum
-from .bifidobacteriummerycicum import BifidobacteriumMerycicum
-from .bifidobacteriumruminantium import BifidobacteriumRuminantium
-from .pectobacteriumcarotovorumodoriferum import PectobacteriumCarotovorumOdoriferum
-from .myceliophthorathermophila import MyceliophthoraThermophila
-from .mortierellaverticillata import MortierellaVerticillata
-from .microtusochrogaster import MicrotusOchrogaster
-from .coniophoraputeana import ConiophoraPuteana
-from .colletotrichumhigginsianum import ColletotrichumHigginsianum
-from .monosigabrevicollis import MonosigaBrevicollis
-from .capsellarubella import CapsellaRubella
-from .trichosporonasahii import TrichosporonAsahii
-from .acinetobacterspniph758 import AcinetobacterSpNiph758
-from .serratiagrimesii import SerratiaGrimesii
-from .serratiaplymuthica import SerratiaPlymuthica
-from .sulfitobactermediterraneus import SulfitobacterMediterraneus
-from .mycobacteriumtuberculosish37rv import MycobacteriumTuberculosisH37rv
-from .pseudocercosporafijiensis import PseudocercosporaFijiensis
-from .gammaproteobacteriabacteriumhdn1 import GammaproteobacteriaBacteriumHdn1
-from .lysobacterantibioticus import LysobacterAntibioticus
-from .acinetobacterspniph809 import AcinetobacterSpNiph809
-from .pseudozymaflocculosa import PseudozymaFlocculosa
-from .actinobaculumspf0552 import ActinobaculumSpF0552
-from .citrusclementina import CitrusClementina
-from .sphaerulinamusiva import SphaerulinaMusiva
-from .helicobacterpylori26695 import HelicobacterPylori26695
-from .helicobacterpylorij99 import HelicobacterPyloriJ99
-from .serpulalacrymans import SerpulaLacrymans
-from .cladophialophoracarrionii import CladophialophoraCarrionii
-from .endosymbiontofacanthamoeba import EndosymbiontOfAcanthamoeba
-from .clostridiumpasteurianumbc1 import ClostridiumPasteurianumBc1
-from .pseudoalteromonastunicata import PseudoalteromonasTunicata
-from .selaginellamoellendorffii import SelaginellaMoellendorffii
-from .roseovariusnubinhibens import RoseovariusNubinhibens
-from .bubalusbubalis import BubalusBubalis
-from .salmonellaentericatyphimurium import SalmonellaEntericaTyphimurium
-from .camelinasativa import CamelinaSativa
-from .acinetobacterspcipa165 import AcinetobacterSpCipa165
-from .acinetobacterspnctc7422 import AcinetobacterSpNctc7422
-from .acinetobacterspniph899 import AcinetobacterSpNiph899
-from .paracaedibacteracanthamoebae import ParacaedibacterAcanthamoebae
-from .metarhiziumacridum import MetarhiziumAcridum
-from .prochlorococcusmarinusmit9201 import ProchlorococcusMarinusMit9201
-from .prochlorococcusmarinusmit9211 import ProchlorococcusMarinusMit9211
-from .pandoraeapnomenusa import PandoraeaPnomenusa
-from .prochlorococcusmarinusmit9215 import ProchlorococcusMarinusMit9215
-from .setosphaeriaturcica import SetosphaeriaTurcica
-from .actinomycessps6spd3 import ActinomycesSpS6spd3
-from .bordetellapetrii import BordetellaPetrii
-from .actinoplanesspn902109 import ActinoplanesSpN902109
-from .desulfococcusoleovorans import DesulfococcusOleovorans
-from .eutypalata import EutypaLata
-from .acinetobacterspruh2624 import AcinetobacterSpRuh2624
-from .actinomycesspf0330 import ActinomycesSpF0330
-from .actinoplanesspse50110 import ActinoplanesSpSe50110
-from .fischerellathermalis import FischerellaThermalis
-from .hammondiahammondi import HammondiaHammondi
-from .aeromonasspae122 import AeromonasSpAe122
-from .streptomycescoelicolor import StreptomycesCoelicolor
-from .afipiaspohsuic4 import AfipiaSpOhsuic4
-from .fusariumpseudograminearum import FusariumPseudograminearum
-from .bipolarisoryzae import BipolarisOryzae
-from .rhodococcusjostii import RhodococcusJostii
-from .glarealozoyensis import GlareaLozoyensis
-from .acinetobacterspniph973 import AcinetobacterSpNiph973
-from .actinokineosporaspeg49 import ActinokineosporaSpEg49
-from .actinomycesspf0384 import ActinomycesSpF0384
-from .acromyrmexechinatior import AcromyrmexEchinatior
-from .agrobacteriumsph133 import AgrobacteriumSpH133
-from .saccharothrixsyringae import SaccharothrixSyringae
-from .gloeophyllumtrabeum import GloeophyllumTrabeum
-from .ahrensiasp13gom1096m import AhrensiaSp13gom1096m
-from .streptacidiphilusneutrinimicus import StreptacidiphilusNeutrinimicus
-from .streptacidiphiluscarbonis import StreptacidiphilusCarbonis
-from .streptacidiphilusalbus import StreptacidiphilusAlbus
-from .nitrosococcuswatsonii import NitrosococcusWatsonii
-from .ahrensiaspr2a130 import AhrensiaSpR2a130
-from .maylandiazebra import MaylandiaZebra
-from .acinetobacterbereziniae import AcinetobacterBereziniae
-from .actinomycesspf0332 import ActinomycesSpF0332
-from .alcanivoraxsp19m6 import AlcanivoraxSp19m6
-from .buchneraaphidicolaaps import BuchneraAphidicolaAps
-from .myotisbrandtii import MyotisBrandtii
-from .spizellomycespunctatus import SpizellomycesPunctatus
-from .batrachochytriumdendrobatidis import BatrachochytriumDendrobatidis
-from .alcanivoraxspdg881 import AlcanivoraxSpDg881
-from .gregarinaniphandrodes import GregarinaNiphandrodes
-from .actinomycesspf0310 import ActinomycesSpF0310
-from .actinomycesspf0386 import ActinomycesSpF0386
-from .porphyromonasgulae import PorphyromonasGulae
-from .stanieriacyanosphaera import StanieriaCyanosphaera
-from .actinomycesspf0400 import ActinomycesSpF0400
-from .saprolegniadiclina import SaprolegniaDiclina
-from .geminocystisherdmanii import GeminocystisHerdmanii
-from .actinomycessphpa0247 import ActinomycesSpHpa0247
-from .tetrapisisporaphaffii import TetrapisisporaPhaffii
-from .actinomycesspicm39 import ActinomycesSpIcm39
-from .prunusmume import PrunusMume
-from .chlamydophilapneumoniaear39 import ChlamydophilaPneumoniaeAr39
-from .chlamydophilapneumoniaecwl029 import ChlamydophilaPneumoniaeCwl029
-from .fusariumverticillioides import FusariumVerticillioides
-from .chrysiogenesarsenatis import ChrysiogenesArsenatis
-from .actinomycesspf0337 import ActinomycesSpF0337
-from .alcanivoraxspp2s70 import AlcanivoraxSpP2s70
-from .nodosilineanodulosa import NodosilineaNodulosa
-from .coleofasciculuschthonoplastes import ColeofasciculusChthonoplastes
-from .actinomycesspicm47 import ActinomycesSpIcm47
-from .lipotesvexillifer import LipotesVexillifer
-from .ustilagohordei import UstilagoHordei
-from .pediculushumanus import PediculusHumanus
-from .paracoccidioidesbrasiliensis import ParacoccidioidesBrasiliensis
-from .persephonellamarina import PersephonellaMarina
-from .bordetellatrematum import BordetellaTrematum
-from .strigamiamaritima import StrigamiaMaritima
-from .nipponianippon import NipponiaNippon
-from .galdieriasulphuraria import GaldieriaSulphuraria
-from .bombusimpatiens import BombusImpatiens
-from .pteropusvampyrus import PteropusVampyrus
-from .actinomycesspph3 import ActinomycesSpPh3
-from .caenorhabditisbrenneri import CaenorhabditisBrenneri
-from .zootermopsisnevadensis import ZootermopsisNevadensis
-from .kocuriapolaris import KocuriaPolaris
-from .aliihoefleasp2ww import AliihoefleaSp2ww
-from .desulfitobacteriumhafniense import DesulfitobacteriumHafniense
-from .nectriahaematococca import NectriaHaematococca
-from .lachnobacteriumbovis import LachnobacteriumBovis
-from .zobelliauliginosa import ZobelliaUliginosa
-from .stegastespartitus import StegastesPartitus
-from .prochlorococcusmarinusas9601 import ProchlorococcusMarinusAs9601
-from .streptomycesgriseofuscus import StreptomycesGriseofuscus
-from .magnaporthiopsispoae import MagnaporthiopsisPoae
-from .lactobacilluskunkeei import LactobacillusKunkeei
-from .wallemiasebi import WallemiaSebi
-from .kozakiabaliensis import KozakiaBaliensis
-from .sporocytophagamyxococcoides import SporocytophagaMyxococcoides
-from .actinomycesspf0311 import ActinomycesSpF0311
-from .actinomycessps4c9 import ActinomycesSpS4c9
-from .escherichiacolio157h7 import EscherichiaColiO157h7
-from .alteromonadalesbacteriumtw7 import AlteromonadalesBacteriumTw7
-from .magnetococcusmarinus import MagnetococcusMarinus
-from .corynebacteriumimitans import CorynebacteriumImitans
-from .aphanomycesinvadans import AphanomycesInvadans
-from .pseudomonascremoricolorata import PseudomonasCremoricolorata
-from .sphaerochaetaglobosa import SphaerochaetaGlobosa
-from .sphaerochaetapleomorpha import SphaerochaetaPleomorpha
-from .novosphingobiumresinovorum import NovosphingobiumResinovorum
-from .bifidobacteriumscardovii import BifidobacteriumScardovii
-from .cedeceaneteri import CedeceaNeteri
-from .dechloromonasaromatica import DechloromonasAromatica
-from .burkholderiasacchari import BurkholderiaSacchari
-from .thalassiosiraoceanica import ThalassiosiraOceanica
-from .pseudomonasputidakt2440 import PseudomonasPutidaKt2440
-from .xylellafastidiosa9a5c import XylellaFastidiosa9a5c
-from .paenibacillusborealis import PaenibacillusBorealis
-from .auriculariadelicata import AuriculariaDelicata
-from .thermodesulfobacteriumhydrogeniphilum import ThermodesulfobacteriumHydrogeniphilum
-from .anaerococcussp9402080 import AnaerococcusSp9402080
-from .betavulgaris import BetaVulgaris
-from .aspergillusnidulans import AspergillusNidulans
-from .alkalibacteriumspak22 import AlkalibacteriumSpAk22
-from .anaerococcusspph9 import AnaerococcusSpPh9
-from .phytophthoraramorum import PhytophthoraRamorum
-from .actinosporangiumspnrrlb3428 import ActinosporangiumSpNrrlb3428
-from .alistipessp627 import AlistipesSp627
-from .alteromonasspalt199 import AlteromonasSpAlt199
-from .prochlorococcusmarinusccmp1375 import ProchlorococcusMarinusCcmp1375
-from .prochlorococcusmarinusmit9515 import ProchlorococcusMarinusMit9515
-from .prochlorococcusmarinusmit9301 import ProchlorococcusMarinusMit9301
-from .prochlorococcusmarinusmit9314 import ProchlorococcusMarinusMit9314
-from .prochlorococcusmarinusmit9322 import ProchlorococcusMarinusMit9322
-from .prochlorococcusmarinusnatl1a import ProchlorococcusMarinusNatl1a
-from .listeriamonocytogenesegde import ListeriaMonocytogenesEgde
-from .streptococcuspneumoniaetigr4 import StreptococcusPneumoniaeTigr4
-from .streptococcuspneumoniaer6 import StreptococcusPneumoniaeR6
-from .oceanobacilluspicturae import OceanobacillusPicturae
-from .elizabethkingiamiricola import ElizabethkingiaMiricola
-from .anaerosalibacterspnd1 import AnaerosalibacterSpNd1
-from .streptococcussinensis import StreptococcusSinensis
-from .beauveriabassiana import BeauveriaBassiana
-from .staphylococcusepidermidisrp62a import StaphylococcusEpidermidisRp62a
-from .staphylococcusepidermidisatcc12228 import StaphylococcusEpidermidisAtcc12228
-from .agrobacteriumfabrum import AgrobacteriumFabrum
-from .pythonbivittatus import PythonBivittatus
-from .francisellatularensisschus4 import FrancisellaTularensisSchus4
-from .desulfobacteriumautotrophicum import DesulfobacteriumAutotrophicum
-from .desulfotaleapsychrophila import DesulfotaleaPsychrophila
-from .pyrobaculumaerophilum import PyrobaculumAerophilum
-from .acetobactermalorum import AcetobacterMalorum
-from .oscillatorianigroviridis import OscillatoriaNigroviridis
-from .anaerotruncusspg3 import AnaerotruncusSpG3
-from .robinsoniellapeoriensis import RobinsoniellaPeoriensis
-from .pseudopodoceshumilis import PseudopodocesHumilis
-from .chlamydophilapneumoniaetw183 import ChlamydophilaPneumoniaeTw183
-from .helicobactercetorummit007128 import HelicobacterCetorumMit007128
-from .chrysochlorisasiatica import ChrysochlorisAsiatica
-from .baumanniacicadellinicola import BaumanniaCicadellinicola
-from .pyrococcusfuriosus import PyrococcusFuriosus
-from .alkalilimnicolaehrlichii import AlkalilimnicolaEhrlichii
-from .alistipessphgb5 import AlistipesSpHgb5
-from .alteromonassplor import AlteromonasSpLor
-from .paenibacillusgraminis import PaenibacillusGraminis
-from .paenibacillusodorifer import PaenibacillusOdorifer
-from .anaerovibriosprm50 import AnaerovibrioSpRm50
-from .fusobacteriumnucleatumatcc25586 import FusobacteriumNucleatumAtcc25586
-from .xanthomonasaxonopodiscitri import XanthomonasAxonopodisCitri
-from .caulobactercrescentuscb15 import CaulobacterCrescentusCb15
-from .corynebacteriumatypicum import CorynebacteriumAtypicum
-from .campylobacterjejuninctc11168 import CampylobacterJejuniNctc11168
-from .capsasporaowczarzaki import CapsasporaOwczarzaki
-from .methanosarcinamazei import MethanosarcinaMazei
-from .chlorobiumtepidum import ChlorobiumTepidum
-from .alteromonasspsn2 import AlteromonasSpSn2
-from .clostridiumperfringensatcc13124 import ClostridiumPerfringensAtcc13124
-from .haematobactermassiliensis import HaematobacterMassiliensis
-from .alcanivoraxsp43bgom46m import AlcanivoraxSp43bgom46m
-from .aminobacterspj41 import AminobacterSpJ41
-from .thermococcusnautili import ThermococcusNautili
-from .aquabacteriumspnj1 import AquabacteriumSpNj1
-from .corynebacteriumefficiens import CorynebacteriumEfficiens
-from .burkholderiasordidicola import BurkholderiaSordidicola
-from .anabaenasppcc7108 import AnabaenaSpPcc7108
-from .corynebacteriumglutamicum import CorynebacteriumGlutamicum
-from .thermosynechococcuselongatus import ThermosynechococcusElongatus
-from .bacillusanthracisames import BacillusAnthracisAmes
-from .shigellaflexneri import ShigellaFlexneri
-from .anoxybacillusgonensis import AnoxybacillusGonensis
-from .dickeyadadantii3937 import DickeyaDadantii3937
-from .buchneraaphidicolasg import BuchneraAphidicolaSg
-from .coccidioidesposadasii import CoccidioidesPosadasii
-from .escherichiacolicft073 import EscherichiaColiCft073
-from .punctulariastrigosozonata import PunctulariaStrigosozonata
-from .listeriaivanoviilondoniensis import ListeriaIvanoviiLondoniensis
-from .acinetobactergerneri import AcinetobacterGerneri
-from .acinetobactertandoii import AcinetobacterTandoii
-from .acinetobactertjernbergiae import AcinetobacterTjernbergiae
-from .acinetobactertowneri import AcinetobacterTowneri
-from .ruminiclostridiumthermocellum import RuminiclostridiumThermocellum
-from .leuconostocmesenteroides import LeuconostocMesenteroides
-from .saccharophagusdegradans import SaccharophagusDegradans
-from .oenococcusoeni import OenococcusOeni
-from .trichodesmiumerythraeum import TrichodesmiumErythraeum
-from .tropherymawhipplei import TropherymaWhipplei
-from .tannerellaforsythia import TannerellaForsythia
-from .blochmanniafloridanus import BlochmanniaFloridanus
-from .melampsoralaricipopulina import MelampsoraLaricipopulina
-from .sulfurihydrogenibiumazorense import SulfurihydrogenibiumAzorense
-from .koribacterversatilis import KoribacterVersatilis
-from .herminiimonasarsenicoxydans import HerminiimonasArsenicoxydans
-from .haemophilussomnus import HaemophilusSomnus
-from .pseudomonassyringaeb728a import PseudomonasSyringaeB728a
-from .ehrlichiachaffeensis import EhrlichiaChaffeensis
-from .pseudomonasfluorescenspf01 import PseudomonasFluorescensPf01
-from .desulfovibrioalaskensis import DesulfovibrioAlaskensis
-from .neptuniibactercaesariensis import NeptuniibacterCaesariensis
-from .amycolatopsisjaponica import AmycolatopsisJaponica
-from .amycolatopsisvancoresmycina import AmycolatopsisVancoresmycina
-from .arcobacterspaf1028 import ArcobacterSpAf1028
-from .fomitiporiamediterranea import FomitiporiaMediterranea
-from .chaetomiumthermophilum import ChaetomiumThermophilum
-from .streptococcusmutansua159 import StreptococcusMutansUa159
-from .streptococcusagalactiaenem316 import StreptococcusAgalactiaeNem316
-from .allokutzneriaalbata import AllokutzneriaAlbata
-from .chlorogloeopsisfritschii import ChlorogloeopsisFritschii
-from .shewanellaoneidensis import ShewanellaOneidensis
-from .anaplasmaphagocytophilum import AnaplasmaPhagocytophilum
-from .yersiniapestisco92 import YersiniaPestisCo92
-from .larimichthyscrocea import LarimichthysCrocea
-from .enhygromyxasalina import EnhygromyxaSalina
-from .pseudomonasrhizosphaerae import PseudomonasRhizosphaerae
-from .croceibacteratlanticus import CroceibacterAtlanticus
-from .burkholderiacenocepacia import BurkholderiaCenocepacia
-from .mycobacteriummarinum import MycobacteriumMarinum
-from .pseudomonasfluorescenssbw25 import PseudomonasFluorescensSbw25
-from .rhizobiumleguminosarum3841 import RhizobiumLeguminosarum3841
-from .bifidobacteriumlongum import BifidobacteriumLongum
-from .bifidobacteriumpsychraerophilum import BifidobacteriumPsychraerophilum
-from .bacillusvietnamensis import BacillusVietnamensis
-from .pectobacteriumatrosepticum import PectobacteriumAtrosepticum
-from .salmonellabongorinctc12419 import SalmonellaBongoriNctc12419
-from .streptococcusuberis import StreptococcusUberis
-from .chlamydophilaabortus import ChlamydophilaAbortus
-from .aquilegiacoerulea import AquilegiaCoerulea
-from .aquilunaspimcc13023 import AquilunaSpImcc13023
-from .salmonellaentericact18 import SalmonellaEntericaCt18
-from .pseudomonasprotegenspf5 import PseudomonasProtegensPf5
-from .lactobacillusplantarum import LactobacillusPlantarum
-from .treponemaputidum import TreponemaPutidum
-from .moniliophthoraroreri import MoniliophthoraRoreri
-from .oceanobacillusiheyensis import OceanobacillusIheyensis
-from .mastigocladopsisrepens import MastigocladopsisRepens
-from .anaeromyxobacterspfw1095 import AnaeromyxobacterSpFw1095
-from .aquimarinasp22iis11z7 import AquimarinaSp22iis11z7
-from .mannheimiasucciniciproducens import MannheimiaSucciniciproducens
-from .arcobacterspaf1440 import ArcobacterSpAf1440
-from .neorickettsiasennetsu import NeorickettsiaSennetsu
-from .natrinemaaltunense import NatrinemaAltunense
-from .kocuriamarina import KocuriaMarina
-from .togniniaminima import TogniniaMinima
-from .pseudomonassyringaetomato import PseudomonasSyringaeTomato
-from .vibrioparahaemolyticus import VibrioParahaemolyticus
-from .bacillussubtilis import BacillusSubtilis
-from .aquifexaeolicus import AquifexAeolicus
-from .archaeoglobusfulgidus import ArchaeoglobusFulgidus
-from .aquimarinaspsw150 import AquimarinaSpSw150
-from .bradyrhizobiumdiazoefficiens import BradyrhizobiumDiazoefficiens
-from .brucellamelitensis import BrucellaMelitensis
-from .buchneraaphidicolabp import BuchneraAphidicolaBp
-from .pyrusxbretschneideri import PyrusXBretschneideri
-from .myotisdavidii import MyotisDavidii
-from .shewanellapiezotolerans import ShewanellaPiezotolerans
-from .marinobacteradhaerens import MarinobacterAdhaerens
-from .enterococcusfaecalisv583 import EnterococcusFaecalisV583
-from .bacteroidesthetaiotaomicron import BacteroidesThetaiotaomicron
-from .grosmanniaclavigera import GrosmanniaClavigera
-from .bigelowiellanatans import BigelowiellaNatans
-from .coxiellaburnetii import CoxiellaBurnetii
-from .pythiumiwayamai import PythiumIwayamai
-from .chlamydophilacaviae import ChlamydophilaCaviae
-from .actinobacilluspleuropneumoniae14074 import ActinobacillusPleuropneumoniae14074
-from .hyphomonasneptunium import HyphomonasNeptunium
-from .nitrosomonaseuropaea import NitrosomonasEuropaea
-from .beijerinckiamobilis import BeijerinckiaMobilis
-from .halomonasalkaliantarctica import HalomonasAlkaliantarctica
-from .hippeaspkm1 import HippeaSpKm1
-from .arcanobacteriumsps3pf19 import ArcanobacteriumSpS3pf19
-from .arthrobactersp31y import ArthrobacterSp31y
-from .haemophilusducreyi import HaemophilusDucreyi
-from .solibacterusitatus import SolibacterUsitatus
-from .rhodococcuserythropolis import RhodococcusErythropolis
-from .anaplasmamarginalemaries import AnaplasmaMarginaleMaries
-from .arcobacterspl import ArcobacterSpL
-from .helicobacterhepaticus import HelicobacterHepaticus
-from .geobacilluskaustophilus import GeobacillusKaustophilus
-from .streptacidiphilusjiangxiensis import StreptacidiphilusJiangxiensis
-from .arthrobactersp35w import ArthrobacterSp35w
-from .chryseobacteriumformosense import ChryseobacteriumFormosense
-from .scalinduabrodae import ScalinduaBrodae
-from .pseudomonasalkylphenolia import PseudomonasAlkylphenolia
-from .arthrobacterspa3 import ArthrobacterSpA3
-from .acidobacteriumcapsulatum import AcidobacteriumCapsulatum
-from .verrucomicrobiumspinosum import VerrucomicrobiumSpinosum
-from .anabaenavariabilis import AnabaenaVariabilis
-from .halobacillusdabanensis import HalobacillusDabanensis
-from .ostreococcuslucimarinus import OstreococcusLucimarinus
-from .porphyromonasgingivalisw83 import PorphyromonasGingivalisW83
-from .rhodopirellulabaltica import RhodopirellulaBaltica
-from .acidithiobacillusferrooxidansatcc23270 import AcidithiobacillusFerrooxidansAtcc23270
-from .burkholderiamallei import BurkholderiaMallei
-from .chlamydiamuridarum import ChlamydiaMuridarum
-from .dehalococcoidesmccartyi195 import DehalococcoidesMccartyi195
-from .deinococcusradiodurans import DeinococcusRadiodurans
-from .geobactersulfurreducens import GeobacterSulfurreducens
-from .methanocaldococcusjannaschii import MethanocaldococcusJannaschii
-from .methylococcuscapsulatus import MethylococcusCapsulatus
-from .photorhabdusluminescens import PhotorhabdusLuminescens
-from .mycoplasmaarthritidis import MycoplasmaArthritidis
-from .mycoplasmagenitalium import MycoplasmaGenitalium
-from .thermotogamaritima import ThermotogaMaritima
-from .treponemadenticola import TreponemaDenticola
-from .treponemapallidum import TreponemaPallidum
-from .vibriocholeraeo1 import VibrioCholeraeO1
-from .chromobacteriumviolaceum import ChromobacteriumViolaceum
-from .pseudomonaslutea import PseudomonasLutea
-from .cynoglossussemilaevis import CynoglossusSemilaevis
-from .caedibacteracanthamoebae import CaedibacterAcanthamoebae
-from .paracaedibactersymbiosus import ParacaedibacterSymbiosus
-from .wallemiaichthyophaga import WallemiaIchthyophaga
-from .carboxydothermushydrogenoformans import CarboxydothermusHydrogenoformans
-from .dichelobacternodosus import DichelobacterNodosus
-from .mycobacteriumsmegmatismc2155 import MycobacteriumSmegmatisMc2155
-from .myxococcusxanthus import MyxococcusXanthus
-from .ruminococcusalbus8 import RuminococcusAlbus8
-from .ruegeriapomeroyi import RuegeriaPomeroyi
-from .streptococcusmitisnctc12261 import StreptococcusMitisNctc12261
-from .tupaiachinensis import TupaiaChinensis
-from .arthrobacterspakyn10 import ArthrobacterSpAkyn10
-from .nocardiafarcinica import NocardiaFarcinica
-from .planctomyceteksu1 import PlanctomyceteKsu1
-from .gammaproteobacteriabacteriumhtcc2143 import GammaproteobacteriaBacteriumHtcc2143
-from .gammaproteobacteriabacteriumhtcc2148 import GammaproteobacteriaBacteriumHtcc2148
-from .gammaproteobacteriabacteriumhtcc2080 import GammaproteobacteriaBacteriumHtcc2080
-from .coccomyxasubellipsoidea import CoccomyxaSubellipsoidea
-from .gloeobacterviolaceus import GloeobacterViolaceus
-from .chroococcidiopsisthermalis import ChroococcidiopsisThermalis
-from .oceanicolabatsensis import OceanicolaBatsensis
-from .arthrobacterspbr18 import ArthrobacterSpBr18
-from .ehrlichiaruminantium import EhrlichiaRuminantium
-from .dehalococcoidesmccartyicbdb1 import DehalococcoidesMccartyiCbdb1
-from .bordetellabronchiseptica import BordetellaBronchiseptica
-from .bordetellapertussistohama import BordetellaPertussisTohama
-from .lactobacillusjohnsonii import LactobacillusJohnsonii
-from .rickettsiatyphi import RickettsiaTyphi
-from .kitasatosporaarboriphila import KitasatosporaArboriphila
-from .mycobacteriumcosmeticum import MycobacteriumCosmeticum
-from .rhodopseudomonaspalustriscga009 import RhodopseudomonasPalustrisCga009
-from .psychrobacterarcticus import PsychrobacterArcticus
-from .bacillusanthracissterne import BacillusAnthracisSterne
-from .arthrobacterspfb24 import ArthrobacterSpFb24
-from .buchneraaphidicolactu import BuchneraAphidicolaCtu
-from .mycobacteriumaviumparatuberculosis import MycobacteriumAviumParatuberculosis
-from .exiguobacteriumsibiricum import ExiguobacteriumSibiricum
-from .mycoplasmahyopneumoniaej import MycoplasmaHyopneumoniaeJ
-from .mycoplasmasynoviae import MycoplasmaSynoviae
-from .thermusthermophilushb27 import ThermusThermophilusHb27
-from .phytoplasmaonionyellows import PhytoplasmaOnionYellows
-from .verrucosisporamaris import VerrucosisporaMaris
-from .pneumocystismurina import PneumocystisMurina
-from .picrophilustorridus import PicrophilusTorridus
-from .ralstoniaeutrophajmp134 import RalstoniaEutrophaJmp134
-from .streptococcusthermophiluslmg18311 import StreptococcusThermophilusLmg18311
-from .protochlamydiaamoebophila import ProtochlamydiaAmoebophila
-from .chlamydophilafelis import ChlamydophilaFelis
-from .zymomonasmobiliszm4 import ZymomonasMobilisZm4
-from .capsellagrandiflora import CapsellaGrandiflora
-from .bacilluscibi import BacillusCibi
-from .bdellovibriobacteriovorushd100 import BdellovibrioBacteriovorusHd100
-from .pseudomonassyringaephaseolicola import PseudomonasSyringaePhaseolicola
-from .prevotellaruminicola import PrevotellaRuminicola
-from .moorellathermoacetica import MoorellaThermoacetica
-from .byssochlamysspectabilis import ByssochlamysSpectabilis
-from .methylobacillusflagellatus import MethylobacillusFlagellatus
-from .mesoplasmaflorum import MesoplasmaFlorum
-from .rubrobacterxylanophilus import RubrobacterXylanophilus
-from .cupriavidusmetallidurans import CupriavidusMetallidurans
-from .burkholderiaxenovorans import BurkholderiaXenovorans
-from .chryseobacteriumantarcticum import ChryseobacteriumAntarcticum
-from .porphyromonasgingivicanis import PorphyromonasGingivicanis
-from .arthrobactersph14 import ArthrobacterSpH14
-from .thalassobacterstenotrophicus import ThalassobacterStenotrophicus
-from .sinorhizobiummeliloti import SinorhizobiumMeliloti
-from .mesorhizobiumlotimaff303099 import MesorhizobiumLotiMaff303099
-from .kineococcusradiotolerans import KineococcusRadiotolerans
-from .methanococcusmaripaludiss2 import MethanococcusMaripaludisS2
-from .ralstoniasolanacearumgmi1000 import RalstoniaSolanacearumGmi1000
-from .propionibacteriumacneskpa171202 import PropionibacteriumAcnesKpa171202
-from .mycoplasmamobile import MycoplasmaMobile
-from .paenibacilluswynnii import PaenibacillusWynnii
-from .natronomonasmoolapensis import NatronomonasMoolapensis
-from .synechococcuselongatuspcc6301 import SynechococcusElongatusPcc6301
-from .burkholderiavietnamiensis import BurkholderiaVietnamiensis
-from .ehrlichiacanis import EhrlichiaCanis
-from .rhodospirillumrubrum import RhodospirillumRubrum
-from .methanosarcinabarkeri import MethanosarcinaBarkeri
-from .cytophagahutchinsonii import CytophagaHutchinsonii
-from .geobactermetallireducens import GeobacterMetallireducens
-from .thermobifidafusca import ThermobifidaFusca
-from .arthrobacterspman2 import ArthrobacterSpMan2
-from .anabaenacylindrica import AnabaenaCylindrica
-from .leptolyngbyaboryana import LeptolyngbyaBoryana
-from .aggregatibacteractinomycetemcomitanshk1651 import AggregatibacterActinomycetemcomitansHk1651
-from .aeropyrumpernix import AeropyrumPernix
-from .bacillushalodurans import BacillusHalodurans
-from .bacteroidesfragilisnctc9343 import BacteroidesFragilisNctc9343
-from .burkholderiapseudomalleik96243 import BurkholderiaPseudomalleiK96243
-from .clostridiumacetobutylicum import ClostridiumAcetobutylicum
-from .peptoclostridiumdifficile630 import PeptoclostridiumDifficile630
-from .gluconacetobacterdiazotrophicus import GluconacetobacterDiazotrophicus
-from .haloarculamarismortui import HaloarculaMarismortui
-from .lactobacillusacidophilusncfm import LactobacillusAcidophilusNcfm
-from .lactococcuslactisil1403 import LactococcusLactisIl1403
-from .legionellapneumophilaphiladelphia import LegionellaPneumophilaPhiladelphia
-from .listeriainnocua import ListeriaInnocua
-from .methylobacteriumextorquensam1 import MethylobacteriumExtorquensAm1
-from .mycobacteriumleprae import MycobacteriumLeprae
-from .mycoplasmamycoides import MycoplasmaMycoides
-from .mycoplasmapenetrans import MycoplasmaPenetrans
-from .mycoplasmapulmonis import MycoplasmaPulmonis
-from .pyrococcusabyssi import PyrococcusAbyssi
-from .rhodobactercapsulatus import RhodobacterCapsulatus
-from .rhodobactersphaeroides241 import RhodobacterSphaeroides241
-from .rickettsiaprowazekii import RickettsiaProwazekii
-from .rickettsiasibirica import RickettsiaSibirica
-from .hyaloperonosporaarabidopsidis import HyaloperonosporaArabidopsidis
-from .sulfolobussolfataricus import SulfolobusSolfataricus
-from .sulfolobustokodaii import SulfolobusTokodaii
-from .caldanaerobactersubterraneus import CaldanaerobacterSubterraneus
-from .thermoplasmaacidophilum import ThermoplasmaAcidophilum
-from .thermoplasmavolcanium import ThermoplasmaVolcanium
-from .ureaplasmaparvum import UreaplasmaParvum
-from .wolinellasuccinogenes import WolinellaSuccinogenes
-from .candidaorthopsilosis import CandidaOrthopsilosis
-from .serratiamarcescensdb11 import SerratiaMarcescensDb11
-from .microbacteriumoleivorans import MicrobacteriumOleivorans
-from .pediococcuspentosaceus import PediococcusPentosaceus
-from .diplosphaeracolitermitum import DiplosphaeraColitermitum
-from .acidobacteriaceaebacteriumtaa166 import AcidobacteriaceaeBacteriumTaa166
-from .bacilluslicheniformis import BacillusLicheniformis
-from .novosphingobiumaromaticivorans import NovosphingobiumAromaticivorans
-from .pseudogulbenkianiaferrooxidans import PseudogulbenkianiaFerrooxidans
-from .staphylococcushaemolyticus import StaphylococcusHaemolyticus
-from .leifsoniaxylictcb07 import LeifsoniaXyliCtcb07
-from .caenorhabditisjaponica import CaenorhabditisJaponica
-from .bartonellaquintana import BartonellaQuintana
-from .bartonellahenselae import BartonellaHenselae
-from .arthrobactersp161mfsha21 import ArthrobacterSp161mfsha21
-from .idiomarinaloihiensis import IdiomarinaLoihiensis
-from .streptomycesflavovariabilis import StreptomycesFlavovariabilis
-from .streptomycesxylophagus import StreptomycesXylophagus
-from .streptomycesfulvoviolaceus import StreptomycesFulvoviolaceus
-from .amycolatopsisrifamycinica import AmycolatopsisRifamycinica
-from .arthrobactersp135mfcol51 import ArthrobacterSp135mfcol51
-from .renibacteriumsalmoninarum import RenibacteriumSalmoninarum
-from .thermodesulfovibrioyellowstonii import ThermodesulfovibrioYellowstonii
-from .thermodesulfobacteriumcommune import ThermodesulfobacteriumCommune
-from .mycoplasmabovis import MycoplasmaBovis
-from .chlorobiumlimicola import ChlorobiumLimicola
-from .chlorobiumphaeobacteroidesdsm266 import ChlorobiumPhaeobacteroidesDsm266
-from .chlorobiumphaeovibrioides import ChlorobiumPhaeovibrioides
-from .arthrobacteraurescens import ArthrobacterAurescens
-from .anaeromyxobacterdehalogenans import AnaeromyxobacterDehalogenans
-from .chromohalobactersalexigens import ChromohalobacterSalexigens
-from .arthrobactersp9mfcol31 import ArthrobacterSp9mfcol31
-from .bacillusspff3 import BacillusSpFf3
-from .clostridiumbeijerinckii import ClostridiumBeijerinckii
-from .borreliagarinii import BorreliaGarinii
-from .prosthecochlorisaestuarii import ProsthecochlorisAestuarii
-from .gluconobacteroxydans621h import GluconobacterOxydans621h
-from .photorhabdusasymbiotica import PhotorhabdusAsymbiotica
-from .blochmanniapennsylvanicus import BlochmanniaPennsylvanicus
-from .erythrobactervulgaris import ErythrobacterVulgaris
-from .asticcacaulisspac402 import AsticcacaulisSpAc402
-from .thiobacillusdenitrificansatcc25259 import ThiobacillusDenitrificansAtcc25259
-from .symbiobacteriumthermophilum import SymbiobacteriumThermophilum
-from .cyanobacteriumstanieri import CyanobacteriumStanieri
-from .cyanobiumgracile import CyanobiumGracile
-from .asticcacaulisspac460 import AsticcacaulisSpAc460
-from .cyphellophoraeuropaea import CyphellophoraEuropaea
-from .rickettsiacanadensis import RickettsiaCanadensis
-from .rickettsiaakari import RickettsiaAkari
-from .alkaliphilusmetalliredigens import AlkaliphilusMetalliredigens
-from .mycoplasmahyopneumoniae232 import MycoplasmaHyopneumoniae232
-from .arthrobacterspm2012083 import ArthrobacterSpM2012083
-from .bacillusspff4 import BacillusSpFf4
-from .streptomycesavermitilis import StreptomycesAvermitilis
-from .photobacteriumprofundum import PhotobacteriumProfundum
-from .arthrobactersp162mfsha11 import ArthrobacterSp162mfsha11
-from .arthromitusspsfbmousejapan import ArthromitusSpSfbmousejapan
-from .thermusthermophilushb8 import ThermusThermophilusHb8
-from .pundamilianyererei import PundamiliaNyererei
-from .methanocellapaludicola import MethanocellaPaludicola
-from .bacillusspg2 import BacillusSpG2
-from .endozoicomonaselysicola import EndozoicomonasElysicola
-from .campylobacterlari import CampylobacterLari
-from .campylobacterupsaliensis import CampylobacterUpsaliensis
-from .fischerellamuscicola import FischerellaMuscicola
-from .corynebacteriumjeikeium import CorynebacteriumJeikeium
-from .chryseobacteriumvrystaatense import ChryseobacteriumVrystaatense
-from .coprothermobacterproteolyticus import CoprothermobacterProteolyticus
-from .dictyoglomusthermophilum import DictyoglomusThermophilum
-from .haloferaxvolcanii import HaloferaxVolcanii
-from .thermomicrobiumroseum import ThermomicrobiumRoseum
-from .thermotoganeapolitana import ThermotogaNeapolitana
-from .salinibacterruber import SalinibacterRuber
-from .neofusicoccumparvum import NeofusicoccumParvum
-from .agrobacteriumvitis import AgrobacteriumVitis
-from .agrobacteriumradiobacter import AgrobacteriumRadiobacter
-from .dehalococcoidesmccartyivs import DehalococcoidesMccartyiVs
-from .polynucleobacternecessariusasymbioticus import PolynucleobacterNecessariusAsymbioticus
-from .actinobacteriumphsc20c1 import ActinobacteriumPhsc20c1
-from .vibriofischeri import VibrioFischeri
-from .arthrobactersppao19 import ArthrobacterSpPao19
-from .asticcacaulisspac466 import AsticcacaulisSpAc466
-from .polaribacterirgensii import PolaribacterIrgensii
-from .psychroflexustorquis import PsychroflexusTorquis
-from .robiginitaleabiformata import RobiginitaleaBiformata
-from .arthrobactersptb23 import ArthrobacterSpTb23
-from .atopobiumspbs2 import AtopobiumSpBs2
-from .microscillamarina import MicroscillaMarina
-from .atopobiumspbv3ac4 import AtopobiumSpBv3ac4
-from .nodulariaspumigena import NodulariaSpumigena
-from .atopobiumspf0209 import AtopobiumSpF0209
-from .lentisphaeraaraneosa import LentisphaeraAraneosa
-from .erythrobacterlitoralis import ErythrobacterLitoralis
-from .blastopirellulamarina import BlastopirellulaMarina
-from .fulvimarinapelagi import FulvimarinaPelagi
-from .loktanellavestfoldensisska53 import LoktanellaVestfoldensisSka53
-from .arthromitusspsfbmousenl import ArthromitusSpSfbmousenl
-from .oceanicolagranulosus import OceanicolaGranulosus
-from .parvularculabermudensis import ParvularculaBermudensis
-from .arthrobacterspunc362mftsu51 import ArthrobacterSpUnc362mftsu51
-from .bacillusspj33 import BacillusSpJ33
-from .pelagibacabermudensis import PelagibacaBermudensis
-from .atopobiumspf0494 import AtopobiumSpF0494
-from .rhodobacteraceaebacteriumhtcc2083 import RhodobacteraceaeBacteriumHtcc2083
-from .maritimibacteralkaliphilus import MaritimibacterAlkaliphilus
-from .alteromonasmacleodiideep import AlteromonasMacleodiiDeep
-from .nitrococcusmobilis import NitrococcusMobilis
-from .aureispiraspccbqb1 import AureispiraSpCcbqb1
-from .congregibacterlitoralis import CongregibacterLitoralis
-from .gammaproteobacteriabacteriumhtcc2207 import GammaproteobacteriaBacteriumHtcc2207
-from .photobacteriumangustum import PhotobacteriumAngustum
-from .lactobacillussakei import LactobacillusSakei
-from .mariprofundusferrooxydans import MariprofundusFerrooxydans
-from .betaproteobacteriumkb13 import BetaProteobacteriumKb13
-from .borreliahermsii import BorreliaHermsii
-from .frankiaalni import FrankiaAlni
-from .borreliaturicatae import BorreliaTuricatae
-from .rickettsiafelis import RickettsiaFelis
-from .bacillusweihenstephanensis import BacillusWeihenstephanensis
-from .bacilluscytotoxicus import BacillusCytotoxicus
-from .bacilluspumilus import BacillusPumilus
-from .rhodopseudomonaspalustrisbisa53 import RhodopseudomonasPalustrisBisa53
-from .rhodopseudomonaspalustrisbisb18 import RhodopseudomonasPalustrisBisb18
-from .rhodopseudomonaspalustrisbisb5 import RhodopseudomonasPalustrisBisb5
-from .rhodopseudomonaspalustrishaa2 import RhodopseudomonasPalustrisHaa2
-from .geobacterdaltonii import GeobacterDaltonii
-from .xanthomonascampestrisvesicatoria import XanthomonasCampestrisVesicatoria
-from .herpetosiphonaurantiacus import HerpetosiphonAurantiacus
-from .aliivibriosalmonicida import AliivibrioSalmonicida
-from .azoarcusspbh72 import AzoarcusSpBh72
-from .bacillussp123mfchir2 import BacillusSp123mfchir2
-from .escherichiacolik12w3110 import EscherichiaColiK12W3110
-from .xanthomonasaxonopodisphaseoli import XanthomonasAxonopodisPhaseoli
-from .thiomicrospiracrunogena import ThiomicrospiraCrunogena
-from .prochlorothrixhollandica import ProchlorothrixHollandica
-from .sphingopyxisalaskensis import SphingopyxisAlaskensis
-from .bacillusspdw54 import BacillusSpDw54
-from .shewanelladenitrificans import ShewanellaDenitrificans
-from .shewanellafrigidimarina import ShewanellaFrigidimarina
-from .mycobacteriumrufum import MycobacteriumRufum
-from .clostridiumsulfidigenes import ClostridiumSulfidigenes
-from .paracoccusdenitrificans import ParacoccusDenitrificans
-from .magnaportheoryzae import MagnaportheOryzae
-from .arthromitusspsfbratyit import ArthromitusSpSfbratyit
-from .bacillussp2a57ct2 import BacillusSp2a57ct2
-from .shewanellaputrefaciens import ShewanellaPutrefaciens
-from .chlorobiumluteolum import ChlorobiumLuteolum
-from .nonlabenssediminis import NonlabensSediminis
-from .deinococcusgeothermalis import DeinococcusGeothermalis
-from .anaplasmamarginaleflorida import AnaplasmaMarginaleFlorida
-from .azoarcusspkh32c import AzoarcusSpKh32c
-from .bacillussp1nla3e import BacillusSp1nla3e
-from .pseudomonassimiae import PseudomonasSimiae
-from .brevibacteriumlinens import BrevibacteriumLinens
-from .phytoplasmawheatblue import PhytoplasmaWheatBlue
-from .phytoplasmaasteryellows import PhytoplasmaAsterYellows
-from .streptococcusthermophiluslmd9 import StreptococcusThermophilusLmd9
-from .azotobactervinelandii import AzotobacterVinelandii
-from .nitrobacterhamburgensis import NitrobacterHamburgensis
-from .nitrobacterwinogradskyi import NitrobacterWinogradskyi
-from .methanospirillumhungatei import MethanospirillumHungatei
-from .nitrosococcusoceani import NitrosococcusOceani
-from .nitrosospiramultiformis import NitrosospiraMultiformis
-from .shewanellaloihica import ShewanellaLoihica
-from .bacillusspeb01 import BacillusSpEb01
-from .chloroflexusaurantiacus import ChloroflexusAurantiacus
-from .lactobacillusgasseri import LactobacillusGasseri
-from .pelodictyonphaeoclathratiforme import PelodictyonPhaeoclathratiforme
-from .phytophthorakernoviae import PhytophthoraKernoviae
-from .xanthomonasaxonopodisvasculorum import XanthomonasAxonopodisVasculorum
-from .shewanellaamazonensis import ShewanellaAmazonensis
-from .sulfurimonasdenitrificans import SulfurimonasDenitrificans
-from .bacillusamyloliquefaciens import BacillusAmyloliquefaciens
-from .lactobacillushelveticuscnrz32 import LactobacillusHelveticusCnrz32
-from .bifidobacteriumbreve import BifidobacteriumBreve
-from .chloroflexusaggregans import ChloroflexusAggregans
-from .pseudoalteromonashaloplanktistac125 import PseudoalteromonasHaloplanktisTac125
-from .pseudozymahubeiensis import PseudozymaHubeiensis
-from .bifidobacteriumcrudilactis import BifidobacteriumCrudilactis
-from .acaryochlorismarina import AcaryochlorisMarina
-from .amycolatopsisjejuensis import AmycolatopsisJejuensis
-from .nitrospiradefluvii import NitrospiraDefluvii
-from .sulfolobusacidocaldarius import SulfolobusAcidocaldarius
-from .bacillusspj37 import BacillusSpJ37
-from .simkanianegevensis import SimkaniaNegevensis
-from .chlamydophilapecorum import ChlamydophilaPecorum
-from .chlamydiapsittaci6bc import ChlamydiaPsittaci6bc
-from .chlorobiumphaeobacteroidesbs1 import ChlorobiumPhaeobacteroidesBs1
-from .alphaproteobacteriumbal199 import AlphaProteobacteriumBal199
-from .clostridiumdrakei import ClostridiumDrakei
-from .bacillusokhensis import BacillusOkhensis
-from .lactobacillusfermentumifo3956 import LactobacillusFermentumIfo3956
-from .finegoldiamagnaatcc29328 import FinegoldiaMagnaAtcc29328
-from .rickettsiatamurae import RickettsiaTamurae
-from .nitrosomonaseutropha import NitrosomonasEutropha
-from .psychrobactercryohalolentis import PsychrobacterCryohalolentis
-from .syntrophomonaswolfei import SyntrophomonasWolfei
-from .syntrophobacterfumaroxidans import SyntrophobacterFumaroxidans
-from .bacillussp37ma import BacillusSp37ma
-from .pelagibacterubiquehtcc1062 import PelagibacterUbiqueHtcc1062
-from .rickettsiabelliirml369c import RickettsiaBelliiRml369c
-from .pyronemaomphalodes import PyronemaOmphalodes
-from .bacillusspjce import BacillusSpJce
-from .pelobactercarbinolicus import PelobacterCarbinolicus
-from .pelobacterpropionicus import PelobacterPropionicus
-from .rhodoferaxferrireducens import RhodoferaxFerrireducens
-from .burkholderiaambifaria import BurkholderiaAmbifaria
-from .actinobacillussuccinogenes import ActinobacillusSuccinogenes
-from .methanosphaerastadtmanae import MethanosphaeraStadtmanae
-from .thermoanaerobacterpseudethanolicus import ThermoanaerobacterPseudethanolicus
-from .spathasporapassalidarum import SpathasporaPassalidarum
-from .chlorobiumchlorochromatii import ChlorobiumChlorochromatii
-from .burkholderiaoklahomensis import BurkholderiaOklahomensis
-from .staphylococcussaprophyticus import StaphylococcusSaprophyticus
-from .pseudoalteromonasatlantica import PseudoalteromonasAtlantica
-from .bacillusspl1 import BacillusSpL1
-from .sodalisglossinidius import SodalisGlossinidius
-from .planctomycesmaris import PlanctomycesMaris
-from .vibriocholeraeo395 import VibrioCholeraeO395
-from .bacilluscoagulans36d1 import BacillusCoagulans36d1
-from .bacillusspm313 import BacillusSpM313
-from .mycoplasmahominis import MycoplasmaHominis
-from .rhizobiumetlicfn42 import RhizobiumEtliCfn42
-from .natronomonaspharaonis import NatronomonasPharaonis
-from .bacillusspmb2021 import BacillusSpMb2021
-from .rhodobactersphaeroidesatcc17025 import RhodobacterSphaeroidesAtcc17025
-from .bacillusspmt2 import BacillusSpMt2
-from .lactobacillusreuteri10023 import LactobacillusReuteri10023
-from .halorhodospirahalophila import HalorhodospiraHalophila
-from .desulfotomaculumreducens import DesulfotomaculumReducens
-from .acidiphiliumcryptum import AcidiphiliumCryptum
-from .leuconostoccitreum import LeuconostocCitreum
-from .paenibacilluspolymyxae681 import PaenibacillusPolymyxaE681
-from .hahellachejuensis import HahellaChejuensis
-from .akkermansiamuciniphila import AkkermansiaMuciniphila
-from .yersiniaintermedia import YersiniaIntermedia
-from .yersiniafrederiksenii import YersiniaFrederiksenii
-from .mycobacteriumgilvum import MycobacteriumGilvum
-from .mycobacteriumvanbaalenii import MycobacteriumVanbaalenii
-from .alkaliphilusoremlandii import AlkaliphilusOremlandii
-from .bacillusspnsp222 import BacillusSpNsp222
-from .methanocellaarvoryzae import MethanocellaArvoryzae
-from .marinobacterhydrocarbonoclasticus import MarinobacterHydrocarbonoclasticus
-from .acidothermuscellulolyticus import AcidothermusCellulolyticus
-from .caldicellulosiruptorsaccharolyticus import CaldicellulosiruptorSaccharolyticus
-from .pseudomonasputidaf1 import PseudomonasPutidaF1
-from .pyramidobacterpiscolens import PyramidobacterPiscolens
-from .lactobacillusdelbrueckii2038 import LactobacillusDelbrueckii2038
-from .campylobacterjejuni81176 import CampylobacterJejuni81176
-from .bifidobacteriumtsurumiense import BifidobacteriumTsurumiense
-from .micromonosporachokoriensis import MicromonosporaChokoriensis
-from .orientiatsutsugamushi import OrientiaTsutsugamushi
-from .bacteroidesdorei import BacteroidesDorei
-from .psychromonasingrahamii import PsychromonasIngrahamii
-from .bacillusspsjs import BacillusSpSjs
-from .lachnoclostridiumphytofermentans import LachnoclostridiumPhytofermentans
-from .bacillusspts2 import BacillusSpTs2
-from .halobiformalacisalsi import HalobiformaLacisalsi
-from .brevibacillusbrevisnbrc100599 import BrevibacillusBrevisNbrc100599
-from .streptomycesolindensis import StreptomycesOlindensis
-from .xanthomonasoryzaepxo99a import XanthomonasOryzaePxo99a
-from .bartonellabacilliformis import BartonellaBacilliformis
-from .campylobacterconcisus13826 import CampylobacterConcisus13826
-from .campylobacterfetus8240 import CampylobacterFetus8240
-from .campylobacterhominis import CampylobacterHominis
-from .bordetellaavium import BordetellaAvium
-from .bacillusspjcm19046 import BacillusSpJcm19046
-from .mycobacteriumulcerans import MycobacteriumUlcerans
-from .flavobacteriumreichenbachii import FlavobacteriumReichenbachii
-from .escherichiacoli536 import EscherichiaColi536
-from .haloquadratumwalsbyidsm16790 import HaloquadratumWalsbyiDsm16790
-from .lawsoniaintracellularis import LawsoniaIntracellularis
-from .endocarponpusillum import EndocarponPusillum
-from .polaromonasnaphthalenivorans import PolaromonasNaphthalenivorans
-from .ramlibactertataouinensis import RamlibacterTataouinensis
-from .bacteriovoraxspbal6x import BacteriovoraxSpBal6x
-from .streptococcusmitisb6 import StreptococcusMitisB6
-from .sinorhizobiummedicae import SinorhizobiumMedicae
-from .bacteriovoraxspseq25v import BacteriovoraxSpSeq25v
-from .xanthomonasfuscans import XanthomonasFuscans
-from .phycicoccusjejuensis import PhycicoccusJejuensis
-from .rhodobacteralesbacteriumhtcc2255 import RhodobacteralesBacteriumHtcc2255
-from .arcobacterbutzlerirm4018 import ArcobacterButzleriRm4018
-from .methanoculleusmarisnigri import MethanoculleusMarisnigri
-from .thermofilumpendens import ThermofilumPendens
-from .salinisporatropica import SalinisporaTropica
-from .pelotomaculumthermopropionicum import PelotomaculumThermopropionicum
-from .erwiniatypographi import ErwiniaTypographi
-from .bacteriumspjkg1 import BacteriumSpJkg1
-from .buchneraaphidicolabcc import BuchneraAphidicolaBcc
-from .streptococcuspneumoniaed39 import StreptococcusPneumoniaeD39
-from .halothermothrixorenii import HalothermothrixOrenii
-from .bacteriumsplf3 import BacteriumSpLf3
-from .korarchaeumcryptofilum import KorarchaeumCryptofilum
-from .bacillusspkw12 import BacillusSpKw12
-from .roseobacterdenitrificans import RoseobacterDenitrificans
-from .francisellatularensisholarctica import FrancisellaTularensisHolarctica
-from .flavobacteriumjohnsoniae import FlavobacteriumJohnsoniae
-from .paracoccushalophilus import ParacoccusHalophilus
-from .teredinibacterturneraet7901 import TeredinibacterTurneraeT7901
-from .kocuriarhizophiladc2201 import KocuriaRhizophilaDc2201
-from .stigmatellaaurantiaca import StigmatellaAurantiaca
-from .gemmatimonasaurantiaca import GemmatimonasAurantiaca
-from .pseudomonasstutzeria1501 import PseudomonasStutzeriA1501
-from .xanthomonasalbilineans import XanthomonasAlbilineans
-from .acidithiobacillusferrooxidansatcc53993 import AcidithiobacillusFerrooxidansAtcc53993
-from .aeromonashydrophilaatcc7966 import AeromonasHydrophilaAtcc7966
-from .bacteriumspol1 import BacteriumSpOl1
-from .lachanceathermotolerans import LachanceaThermotolerans
-from .ralstoniaeutrophah16 import RalstoniaEutrophaH16
-from .fervidobacteriumnodosum import FervidobacteriumNodosum
-from .aeromonassalmonicida import AeromonasSalmonicida
-from .verrucomicrobiaebacteriumdg1235 import VerrucomicrobiaeBacteriumDg1235
-from .helicobacteracinonychis import HelicobacterAcinonychis
-from .bartonellatribocorum import BartonellaTribocorum
-from .roseiflexuscastenholzii import RoseiflexusCastenholzii
-from .bacteroidesspd20 import BacteroidesSpD20
-from .xanthomonasoryzaeoryzicola import XanthomonasOryzaeOryzicola
-from .pyrobaculumislandicum import PyrobaculumIslandicum
-from .pseudomonasentomophila import PseudomonasEntomophila
-from .labrenziaaggregata import LabrenziaAggregata
-from .thermophagusxiamenensis import ThermophagusXiamenensis
-from .listeriawelshimeri import ListeriaWelshimeri
-from .clostridiumnovyint import ClostridiumNovyiNt
-from .methanobacteriumarcticum import MethanobacteriumArcticum
-from .bacillusspunc438cl73tsus30 import BacillusSpUnc438cl73tsus30
-from .bacteroidesspga6a2 import BacteroidesSpGa6a2
-from .lactobacillusbrevisatcc367 import LactobacillusBrevisAtcc367
-from .archaeoglobussulfaticallidus import ArchaeoglobusSulfaticallidus
-from .bartonellaspdb56 import BartonellaSpDb56
-from .sagittulastellata import SagittulaStellata
-from .rhodobacteraceaebacteriumhtcc2150 import RhodobacteraceaeBacteriumHtcc2150
-from .algoriphagusmachipongonensis import AlgoriphagusMachipongonensis
-from .planktothrixagardhii import PlanktothrixAgardhii
-from .bartonellaspr4 import BartonellaSpR4
-from .streptococcussanguinissk36 import StreptococcusSanguinisSk36
-from .pseudomonasputidaw619 import PseudomonasPutidaW619
-from .borreliaafzelii import BorreliaAfzelii
-from .lactobacillusdelbrueckiiatcc11842 import LactobacillusDelbrueckiiAtcc11842
-from .thermotogapetrophila import ThermotogaPetrophila
-from .actinocatenisporasera import ActinocatenisporaSera
-from .stenotrophomonasmaltophiliar5513 import StenotrophomonasMaltophiliaR5513
-from .thermosiphomelanesiensis import ThermosiphoMelanesiensis
-from .bifidobacteriumsp7101 import BifidobacteriumSp7101
-from .salinisporaarenicola import SalinisporaArenicola
-from .burkholderiaphymatum import BurkholderiaPhymatum
-from .granulibacterbethesdensis import GranulibacterBethesdensis
-from .streptococcussuis05zyh33 import StreptococcusSuis05zyh33
-from .kordiaalgicida import KordiaAlgicida
-from .bacteriovoraxspbsw11iv import BacteriovoraxSpBsw11iv
-from .boseasp117 import BoseaSp117
-from .roseobacterlitoralis import RoseobacterLitoralis
-from .bifidobacteriumspa11 import BifidobacteriumSpA11
-from .flavobacteriabacteriumbal38 import FlavobacteriaBacteriumBal38
-from .blastomonasspaap53 import BlastomonasSpAap53
-from .flavobacterialesbacteriumalc1 import FlavobacterialesBacteriumAlc1
-from .bacteriumspms4 import BacteriumSpMs4
-from .blattabacteriumspbge import BlattabacteriumSpBge
-from .gammaproteobacteriabacteriumhtcc5015 import GammaproteobacteriaBacteriumHtcc5015
-from .octadecabacterarcticus import OctadecabacterArcticus
-from .phaeobacterinhibens import PhaeobacterInhibens
-from .thermococcusbarophilus import ThermococcusBarophilus
-from .oceanibulbusindolifex import OceanibulbusIndolifex
-from .plesiocystispacifica import PlesiocystisPacifica
-from .octadecabacterantarcticus import OctadecabacterAntarcticus
-from .verminephrobactereiseniae import VerminephrobacterEiseniae
-from .rickettsiabelliiosu85389 import RickettsiaBelliiOsu85389
-from .nitratireductorpacificus import NitratireductorPacificus
-from .sphingomonaswittichii import SphingomonasWittichii
-from .shewanellawoodyi import ShewanellaWoodyi
-from .pestalotiopsisfici import PestalotiopsisFici
-from .yersiniaenterocolitica8081 import YersiniaEnterocolitica8081
-from .fusobacteriumnucleatumpolymorphum import FusobacteriumNucleatumPolymorphum
-from .alcanivoraxborkumensis import AlcanivoraxBorkumensis
-from .porphyromonascrevioricanis import PorphyromonasCrevioricanis
-from .maricaulismaris import MaricaulisMaris
-from .clostridiumcellulolyticum import ClostridiumCellulolyticum
-from .burkholderiamultivorans import BurkholderiaMultivorans
-from .rhizobiumleguminosarumwsm2304 import RhizobiumLeguminosarumWsm2304
-from .beggiatoaalba import BeggiatoaAlba
-from .gallionellacapsiferriformans import GallionellaCapsiferriformans
-from .leptothrixcholodnii import LeptothrixCholodnii
-from .blattabacteriumspbgi import BlattabacteriumSpBgi
-from .beijerinckiaindica import BeijerinckiaIndica
-from .methylocapsaacidiphila import MethylocapsaAcidiphila
-from .methylocellasilvestris import MethylocellaSilvestris
-from .brachybacteriumphenoliresistens import BrachybacteriumPhenoliresistens
-from .staphylococcuscarnosus import StaphylococcusCarnosus
-from .thioalkalivibriosulfidiphilus import ThioalkalivibrioSulfidiphilus
-from .blattabacteriumspbpaa import BlattabacteriumSpBpaa
-from .marmoricolaaequoreus import MarmoricolaAequoreus
-from .lachnospiraceaebacterium284 import LachnospiraceaeBacterium284
-from .lachnospiraceaebacterium31 import LachnospiraceaeBacterium31
-from .lachnospiraceaebacteriuma2 import LachnospiraceaeBacteriumA2
-from .lachnospiraceaebacteriuma4 import LachnospiraceaeBacteriumA4
-from .acidovoraxcitrulli import AcidovoraxCitrulli
-from .caldivirgamaquilingensis import CaldivirgaMaquilingensis
-from .bacilluspseudofirmus import BacillusPseudofirmus
-from .pseudobacteroidescellulosolvens import PseudobacteroidesCellulosolvens
-from .bifidobacteriumbifidumncimb41171 import BifidobacteriumBifidumNcimb41171
-from .bradyrhizobiumelkaniiusda76 import BradyrhizobiumElkaniiUsda76
-from .burkholderiaphytofirmans import BurkholderiaPhytofirmans
-from .delftiaacidovorans import DelftiaAcidovorans
-from .shewanellapealeana import ShewanellaPealeana
-from .dinoroseobactershibae import DinoroseobacterShibae
-from .leeuwenhoekiellablandensis import LeeuwenhoekiellaBlandensis
-from .geobacterlovleyi import GeobacterLovleyi
-from .metallosphaerasedula import MetallosphaeraSedula
-from .staphylothermusmarinus import StaphylothermusMarinus
-from .pseudomonasmendocinaymp import PseudomonasMendocinaYmp
-from .serratiaproteamaculans import SerratiaProteamaculans
-from .blattabacteriumspcpu import BlattabacteriumSpCpu
-from .comamonastestosteronikf1 import ComamonasTestosteroniKf1
-from .blattabacteriumspnci import BlattabacteriumSpNci
-from .amphimedonqueenslandica import AmphimedonQueenslandica
-from .terriglobussaanensis import TerriglobusSaanensis
-from .bifidobacteriumdentium import BifidobacteriumDentium
-from .thermosinuscarboxydivorans import ThermosinusCarboxydivorans
-from .flavobacteriumpsychrophilum import FlavobacteriumPsychrophilum
-from .ralstoniapickettii12j import RalstoniaPickettii12j
-from .kamptonemaformosum import KamptonemaFormosum
-from .methanococcusmaripaludisc5 import MethanococcusMaripaludisC5
-from .parvibaculumlavamentivorans import ParvibaculumLavamentivorans
-from .petrotogamobilis import PetrotogaMobilis
-from .geobacterbemidjiensis import GeobacterBemidjiensis
-from .blastococcusspurhd0036 import BlastococcusSpUrhd0036
-from .lactobacillushelveticusdpc4571 import LactobacillusHelveticusDpc4571
-from .saccharopolysporaerythraea import SaccharopolysporaErythraea
-from .bordetellaspfb8 import BordetellaSpFb8
-from .methanococcusvannielii import MethanococcusVannielii
-from .boseasplc85 import BoseaSpLc85
-from .xenorhabdusnematophila import XenorhabdusNematophila
-from .xenorhabdusbovienii import XenorhabdusBovienii
-from .nocardioidaceaebacteriumbroad1 import NocardioidaceaeBacteriumBroad1
-from .methanocorpusculumlabreanum import MethanocorpusculumLabreanum
-from .pyrobaculumcalidifontis import PyrobaculumCalidifontis
-from .gramellaforsetii import GramellaForsetii
-from .ruminococcusobeumatcc29174 import RuminococcusObeumAtcc29174
-from .ruminococcustorquesatcc27756 import RuminococcusTorquesAtcc27756
-from .doreaformicigeneransatcc27755 import DoreaFormicigeneransAtcc27755
-from .dorealongicatenadsm13814 import DoreaLongicatenaDsm13814
-from .eubacteriumventriosum import EubacteriumVentriosum
-from .desulfovibriopiger import DesulfovibrioPiger
-from .parvimonasmicra import ParvimonasMicra
-from .actinomycesodontolyticus import ActinomycesOdontolyticus
-from .pseudoflavonifractorcapillosus import PseudoflavonifractorCapillosus
-from .clostridiumscindens import ClostridiumScindens
-from .eubacteriumhallii import EubacteriumHallii
-from .ruminococcusgnavus import RuminococcusGnavus
-from .subdoligranulumvariabile import SubdoligranulumVariabile
-from .ruminococcuscallidus import RuminococcusCallidus
-from .coprococcuseutactus import CoprococcusEutactus
-from .bacteroidesovatus import BacteroidesOvatus
-from .parabacteroidesmerdae import ParabacteroidesMerdae
-from .bacteroidesuniformis import BacteroidesUniformis
-from .faecalibacteriumprausnitziia2165 import FaecalibacteriumPrausnitziiA2165
-from .boseaspunc402clcol import BoseaSpUnc402clcol
-from .anaerostipescaccae import AnaerostipesCaccae
-from .hoefleaphototrophica import HoefleaPhototrophica
-from .bacteroidescaccae import BacteroidesCaccae
-from .clostridiumbolteae import ClostridiumBolteae
-from .borreliaduttonii import BorreliaDuttonii
-from .bradyrhizobiumgenosp import BradyrhizobiumGenosp
-from .vesicomyosociusokutanii import VesicomyosociusOkutanii
-from .ruthiamagnifica import RuthiaMagnifica
-from .halorubrumhalophilum import HalorubrumHalophilum
-from .rhodospirillumcentenum import RhodospirillumCentenum
-from .actinopolysporaerythraea import ActinopolysporaErythraea
-from .hyperthermusbutylicus import HyperthermusButylicus
-from .actinobacilluspleuropneumoniae5bl20 import ActinobacillusPleuropneumoniae5bL20
-from .halorubrumlacusprofundi import HalorubrumLacusprofundi
-from .thermotogalettingae import ThermotogaLettingae
-from .lactococcuslactiscremoris import LactococcusLactisCremoris
-from .methylobacteriumextorquenspa1 import MethylobacteriumExtorquensPa1
-from .methanococcusaeolicus import MethanococcusAeolicus
-from .mycobacteriumtuberculosish37ra import MycobacteriumTuberculosisH37ra
-from .geobacillusthermodenitrificans import GeobacillusThermodenitrificans
-from .methanobrevibactersmithiiatcc35061 import MethanobrevibacterSmithiiAtcc35061
-from .microvirgalupini import MicrovirgaLupini
-from .methylibiumpetroleiphilum import MethylibiumPetroleiphilum
-from .lactococcusgarvieaelg2 import LactococcusGarvieaeLg2
-from .acinetobacterrudis import AcinetobacterRudis
-from .epilithonimonaslactis import EpilithonimonasLactis
-from .chryseobacteriumluteum import ChryseobacteriumLuteum
-from .shewanellasediminis import ShewanellaSediminis
-from .bradyrhizobiumsparr65 import BradyrhizobiumSpArr65
-from .thiomonasarsenitoxydans import ThiomonasArsenitoxydans
-from .bradyrhizobiumspbtai1 import BradyrhizobiumSpBtai1
-from .methylobacteriumradiotolerans import MethylobacteriumRadiotolerans
-from .methanococcusmaripaludisc7 import MethanococcusMaripaludisC7
-from .nocardiarhamnosiphila import NocardiaRhamnosiphila
-from .clostridiumleptum import ClostridiumLeptum
-from .clostridiumspiroforme import ClostridiumSpiroforme
-from .eubacteriumdolichum import EubacteriumDolichum
-from .ammonifexdegensii import AmmonifexDegensii
-from .dactylellinahaptotyla import DactylellinaHaptotyla
-from .baudoiniacompniacensis import BaudoiniaCompniacensis
-from .clostridiumkluyveri import ClostridiumKluyveri
-from .porphyromonasgingivalisatcc33277 import PorphyromonasGingivalisAtcc33277
-from .kazachstaniaafricana import KazachstaniaAfricana
-from .neorickettsiaristicii import NeorickettsiaRisticii
-from .bacteroidesvulgatus import BacteroidesVulgatus
-from .parabacteroidesdistasonis import ParabacteroidesDistasonis
-from .actinomycesgraevenitzii import ActinomycesGraevenitzii
-from .neisseriamucosac102 import NeisseriaMucosaC102
-from .staphylococcushominisc80 import StaphylococcusHominisC80
-from .staphylococcuscapitis import StaphylococcusCapitis
-from .bradyrhizobiumspdfci1 import BradyrhizobiumSpDfci1
-from .idiomarinasalinarum import IdiomarinaSalinarum
-from .bradyrhizobiumspai1a2 import BradyrhizobiumSpAi1a2
-from .streptacidiphilusjeojiense import StreptacidiphilusJeojiense
-from .nitrosopumilusmaritimus import NitrosopumilusMaritimus
-from .acinetobacteroleivorans import AcinetobacterOleivorans
-from .azorhizobiumcaulinodans import AzorhizobiumCaulinodans
-from .desulfatibacillumalkenivorans import DesulfatibacillumAlkenivorans
-from .bacillusselenitireducens import BacillusSelenitireducens
-from .ochrobactrumanthropi import OchrobactrumAnthropi
-from .aciduliprofundumboonei import AciduliprofundumBoonei
-from .bradyrhizobiumspcp53 import BradyrhizobiumSpCp53
-from .rhodobacteralesbacteriumy4i import RhodobacteralesBacteriumY4i
-from .blattabacteriumspbplan import BlattabacteriumSpBplan
-from .devosiasplc5 import DevosiaSpLc5
-from .methylobacteriumpopuli import MethylobacteriumPopuli
-from .acholeplasmalaidlawii import AcholeplasmaLaidlawii
-from .bacilluscoahuilensis import BacillusCoahuilensis
-from .blattabacteriumspmadar import BlattabacteriumSpMadar
-from .dickeyasp2b12 import DickeyaSp2b12
-from .marinobacteralgicola import MarinobacterAlgicola
-from .amycolicicoccussubflavus import AmycolicicoccusSubflavus
-from .marinitogapiezophila import MarinitogaPiezophila
-from .streptomycesclavuligerus import StreptomycesClavuligerus
-from .bradyrhizobiumspdoa9 import BradyrhizobiumSpDoa9
-from .clavibactermichiganensisncppb382 import ClavibacterMichiganensisNcppb382
-from .pyrobaculumneutrophilum import PyrobaculumNeutrophilum
-from .methanococcusmaripaludisc6 import MethanococcusMaripaludisC6
-from .clostridiumbotulinumnctc2916 import ClostridiumBotulinumNctc2916
-from .chryseobacteriumsoli import ChryseobacteriumSoli
-from .alistipesputredinis import AlistipesPutredinis
-from .anaerofustisstercorihominis import AnaerofustisStercorihominis
-from .anaerotruncuscolihominis import AnaerotruncusColihominis
-from .intestinibacterbartlettii import IntestinibacterBartlettii
-from .erysipelatoclostridiumramosum import ErysipelatoclostridiumRamosum
-from .collinsellastercoris import CollinsellaStercoris
-from .borreliavalaisianavs116 import BorreliaValaisianaVs116
-from .actinosynnemamirum import ActinosynnemaMirum
-from .brachybacteriumfaecium import BrachybacteriumFaecium
-from .cellulomonasflavigena import CellulomonasFlavigena
-from .nocardiopsisdassonvillei import NocardiopsisDassonvillei
-from .sanguibacterkeddieii import SanguibacterKeddieii
-from .stackebrandtianassauensis import StackebrandtiaNassauensis
-from .xylanimonascellulosilytica import XylanimonasCellulosilytica
-from .sorangiumcellulosumsoce56 import SorangiumCellulosumSoCe56
-from .microcystisaeruginosa import MicrocystisAeruginosa
-from .bacteroidesstercoris import BacteroidesStercoris
-from .microbacteriumprofundi import MicrobacteriumProfundi
-from .phenylobacteriumzucineum import PhenylobacteriumZucineum
-from .amoebophilusasiaticus import AmoebophilusAsiaticus
-from .opitutusterrae import OpitutusTerrae
-from .polynucleobacternecessariusstir1 import PolynucleobacterNecessariusStir1
-from .kitasatosporasetae import KitasatosporaSetae
-from .rickettsiarickettsii import RickettsiaRickettsii
-from .sphingobiumjaponicumut26s import SphingobiumJaponicumUt26s
-from .arthrobacterchlorophenolicus import ArthrobacterChlorophenolicus
-from .ignicoccushospitalis import IgnicoccusHospitalis
-from .xanthomonasarboricola import XanthomonasArboricola
-from .bradyrhizobiumspec33 import BradyrhizobiumSpEc33
-from .streptomycesgriseus import StreptomycesGriseus
-from .methanococcusvoltae import MethanococcusVoltae
-from .doreasp52 import DoreaSp52
-from .methanoregulaboonei import MethanoregulaBoonei
-from .bradyrhizobiumspohsuiii import BradyrhizobiumSpOhsuiii
-from .bradyrhizobiumsptv2a2 import BradyrhizobiumSpTv2a2
-from .fusobacteriumnucleatumanimalis import FusobacteriumNucleatumAnimalis
-from .bradyrhizobiumspors278 import BradyrhizobiumSpOrs278
-from .brenneriaspenid312 import BrenneriaSpEnid312
-from .clostridialesbacterium1747faa import ClostridialesBacterium1747faa
-from .bacteroidesfragilis3112 import BacteroidesFragilis3112
-from .streptomycesalbusj1074 import StreptomycesAlbusJ1074
-from .streptomycespristinaespiralis import StreptomycesPristinaespiralis
-from .natranaerobiusthermophilus import NatranaerobiusThermophilus
-from .macrococcuscaseolyticus import MacrococcusCaseolyticus
-from .shewanellahalifaxensis import ShewanellaHalifaxensis
-from .cloacimonasacidaminovorans import CloacimonasAcidaminovorans
-from .arthrospiraplatensisc1 import ArthrospiraPlatensisC1
-from .methylobacteriumnodulans import MethylobacteriumNodulans
-from .streptomycessviceus import StreptomycesSviceus
-from .micrococcusluteusnctc2665 import MicrococcusLuteusNctc2665
-from .brevibacteriumspvcm10 import BrevibacteriumSpVcm10
-from .erwiniatasmaniensis import ErwiniaTasmaniensis
-from .pelagibacterubiquehtcc8051 import PelagibacterUbiqueHtcc8051
-from .brevundimonasspbal3 import BrevundimonasSpBal3
-from .streptomycesgriseoflavus import StreptomycesGriseoflavus
-from .rhodobacteraceaebacteriumklh11 import RhodobacteraceaeBacteriumKlh11
-from .streptococcusgordonii import StreptococcusGordonii
-from .pedobacteroryzae import PedobacterOryzae
-from .gordoniakroppenstedtii import GordoniaKroppenstedtii
-from .escherichiacolibl21 import EscherichiaColiBl21
-from .thermobisporabispora import ThermobisporaBispora
-from .cryptobacteriumcurtum import CryptobacteriumCurtum
-from .dethiosulfovibriopeptidovorans import DethiosulfovibrioPeptidovorans
-from .halogeometricumborinquense import HalogeometricumBorinquense
-from .conexibacterwoeseidsm14684 import ConexibacterWoeseiDsm14684
-from .bradyrhizobiumsps23321 import BradyrhizobiumSpS23321
-from .ehrlichiasphf import EhrlichiaSpHf
-from .fusobacteriumnucleatumvincentii3136a2 import FusobacteriumNucleatumVincentii3136a2
-from .fusobacteriumnucleatumvincentii4113 import FusobacteriumNucleatumVincentii4113
-from .bradyrhizobiumspthb2 import BradyrhizobiumSpThb2
-from .burkholderialesbacterium1147 import BurkholderialesBacterium1147
-from .fusobacteriumgonidiaformans import FusobacteriumGonidiaformans
-from .fusobacteriummortiferum import FusobacteriumMortiferum
-from .fusobacteriumulcerans import FusobacteriumUlcerans
-from .fusobacteriumvarium import FusobacteriumVarium
-from .bacteroidescoprocola import BacteroidesCoprocola
-from .cladophialophorayegresii import CladophialophoraYegresii
-from .burkholderiasp9120 import BurkholderiaSp9120
-from .thermomonosporacurvata import ThermomonosporaCurvata
-from .beutenbergiacavernae import BeutenbergiaCavernae
-from .dyadobacterfermentans import DyadobacterFermentans
-from .slackiaheliotrinireducens import SlackiaHeliotrinireducens
-from .jonesiadenitrificans import JonesiaDenitrificans
-from .saccharomonosporaviridis import SaccharomonosporaViridis
-from .bacteroidesintestinalis import BacteroidesIntestinalis
-from .providenciastuartii import ProvidenciaStuartii
-from .ruminococcuslactaris import RuminococcusLactaris
-from .proteuspenneri import ProteusPenneri
-from .nitratireductorbasaltis import NitratireductorBasaltis
-from .nitrosococcushalophilus import NitrosococcusHalophilus
-from .colletotrichumgloeosporioides import ColletotrichumGloeosporioides
-from .blautiahydrogenotrophica import BlautiaHydrogenotrophica
-from .achromobacterarsenitoxydans import AchromobacterArsenitoxydans
-from .pseudomonasstutzerits44 import PseudomonasStutzeriTs44
-from .modestobactermarinus import ModestobacterMarinus
-from .desulforudisaudaxviator import DesulforudisAudaxviator
-from .verrucomicrobiabacteriumlp2a import VerrucomicrobiaBacteriumLp2a
-from .marvinbryantiaformatexigens import MarvinbryantiaFormatexigens
-from .kytococcussedentarius import KytococcusSedentarius
-from .nakamurellamultipartita import NakamurellaMultipartita
-from .streptosporangiumroseum import StreptosporangiumRoseum
-from .catenulisporaacidiphila import CatenulisporaAcidiphila
-from .sphaerobacterthermophilus import SphaerobacterThermophilus
-from .kribbellaflavida import KribbellaFlavida
-from .veillonellaparvula import VeillonellaParvula
-from .eggerthellalenta import EggerthellaLenta
-from .methylacidiphiluminfernorum import MethylacidiphilumInfernorum
-from .escherichiacoliatcc8739 import EscherichiaColiAtcc8739
-from .streptococcuscanis import StreptococcusCanis
-from .galeopterusvariegatus import GaleopterusVariegatus
-from .bacteroidesfinegoldii import BacteroidesFinegoldii
-from .bacteroideseggerthii import BacteroidesEggerthii
-from .bacteroidespectinophilus import BacteroidesPectinophilus
-from .myxococcusfulvus import MyxococcusFulvus
-from .bacteroidesplebeius import BacteroidesPlebeius
-from .thermosiphoafricanus import ThermosiphoAfricanus
-from .francisellaphilomiragia import FrancisellaPhilomiragia
-from .burkholderiaspjpy347 import BurkholderiaSpJpy347
-from .ktedonobacterracemifer import KtedonobacterRacemifer
-from .halomicrobiummukohataei import HalomicrobiumMukohataei
-from .desulfohalobiumretbaense import DesulfohalobiumRetbaense
-from .desulfotomaculumacetoxidans import DesulfotomaculumAcetoxidans
-from .pedobacterheparinus import PedobacterHeparinus
-from .chitinophagapinensis import ChitinophagaPinensis
-from .acinetobactersoli import AcinetobacterSoli
-from .mycobacteriumintracellulare import MycobacteriumIntracellulare
-from .flavobacteriabacteriumms0242a import FlavobacteriaBacteriumMs0242a
-from .puniceispirillummarinum import PuniceispirillumMarinum
-from .neisserialactamica import NeisseriaLactamica
-from .mooreaproducens import MooreaProducens
-from .desulfurococcuskamchatkensis import DesulfurococcusKamchatkensis
-from .chryseobacteriumhispalense import ChryseobacteriumHispalense
-from .anoxybacillusflavithermuswk1 import AnoxybacillusFlavithermusWk1
-from .rhizobiumetliciat652 import RhizobiumEtliCiat652
-from .marinomonasposidonica import MarinomonasPosidonica
-from .rhizobiumalamii import RhizobiumAlamii
-from .glaciecolaarctica import GlaciecolaArctica
-from .bradyrhizobiumspurhd0069 import BradyrhizobiumSpUrhd0069
-from .ensifersptw10 import EnsiferSpTw10
-from .mycoplasmafermentans import MycoplasmaFermentans
-from .chthoniobacterflavus import ChthoniobacterFlavus
-from .burkholderiaspk24 import BurkholderiaSpK24
-from .cellvibriojaponicus import CellvibrioJaponicus
-from .borreliaspielmanii import BorreliaSpielmanii
-from .heliobacteriummodesticaldum import HeliobacteriumModesticaldum
-from .thermusaquaticus import ThermusAquaticus
-from .streptomycesavicenniae import StreptomycesAvicenniae
-from .tyzzerellanexilis import TyzzerellaNexilis
-from .clostridiumhiranonis import ClostridiumHiranonis
-from .mitsuokellamultacida import MitsuokellaMultacida
-from .providenciarustigianii import ProvidenciaRustigianii
-from .citrobacteryoungae import CitrobacterYoungae
-from .burkholderiasplig30 import BurkholderiaSpLig30
-from .haliangiumochraceum import HaliangiumOchraceum
-from .escherichiaalbertiitw07627 import EscherichiaAlbertiiTw07627
-from .burkholderiaspmp1 import BurkholderiaSpMp1
-from .spirosomalinguale import SpirosomaLinguale
-from .corynebacteriumurealyticum import CorynebacteriumUrealyticum
-from .jejuiapallidilutea import JejuiaPallidilutea
-from .meiothermusruber import MeiothermusRuber
-from .oligotrophacarboxidovorans import OligotrophaCarboxidovorans
-from .burkholderiaspwsm2230 import BurkholderiaSpWsm2230
-from .caulobactersegnis import CaulobacterSegnis
-from .acetivibriocellulolyticus import AcetivibrioCellulolyticus
-from .burkholderiaspyi23 import BurkholderiaSpYi23
-from .caldisericumexile import CaldisericumExile
-from .butyrivibriospae2015 import ButyrivibrioSpAe2015
-from .escherichiacolik12mg1655 import EscherichiaColiK12Mg1655
-from .lactobacillusbuchnerinrrlb30929 import LactobacillusBuchneriNrrlb30929
-from .butyrivibriocrossotus import ButyrivibrioCrossotus
-from .azobacteroidespseudotrichonymphae import AzobacteroidesPseudotrichonymphae
-from .mycoplasmacrocodyli import MycoplasmaCrocodyli
-from .actinoplanesmissouriensis import ActinoplanesMissouriensis
-from .riesiapediculicola import RiesiaPediculicola
-from .eubacteriumeligens import EubacteriumEligens
-from .butyrivibrioproteoclasticusb316 import ButyrivibrioProteoclasticusB316
-from .dictyoglomusturgidum import DictyoglomusTurgidum
-from .chlorobaculumparvum import ChlorobaculumParvum
-from .chloroherpetonthalassium import ChloroherpetonThalassium
-from .bradyrhizobiumspwsm1253 import BradyrhizobiumSpWsm1253
-from .formosaspak20 import FormosaSpAk20
-from .bifidobacteriumangulatum import BifidobacteriumAngulatum
-from .holdemanellabiformis import HoldemanellaBiformis
-from .rhodothermusmarinus import RhodothermusMarinus
-from .streptobacillusmoniliformis import StreptobacillusMoniliformis
-from .halorhabdusutahensis import HalorhabdusUtahensis
-from .bradyrhizobiumspurha0002 import BradyrhizobiumSpUrha0002
-from .bradyrhizobiumspwsm1743 import BradyrhizobiumSpWsm1743
-from .providenciaalcalifaciens import ProvidenciaAlcalifaciens
-from .providenciarettgeridsm1131 import ProvidenciaRettgeriDsm1131
-from .collinsellaintestinalis import CollinsellaIntestinalis
-from .borreliabissettii import BorreliaBissettii
-from .methanosphaerulapalustris import MethanosphaerulaPalustris
-from .kosmotogaolearia import KosmotogaOlearia
-from .atopobiumparvulum import AtopobiumParvulum
-from .tsukamurellapaurometabola import TsukamurellaPaurometabola
-from .capnocytophagaochraceadsm7271 import CapnocytophagaOchraceaDsm7271
-from .alicyclobacillusacidocaldariusdsm446 import AlicyclobacillusAcidocaldariusDsm446
-from .actinomycestimonensis import ActinomycesTimonensis
-from .caldicellulosiruptorbescii import CaldicellulosiruptorBescii
-from .planctomyceslimnophilus import PlanctomycesLimnophilus
-from .pseudomonascaeni import PseudomonasCaeni
-from .accumulibacterphosphatis import AccumulibacterPhosphatis
-from .stenotrophomonasmaltophiliak279a import StenotrophomonasMaltophiliaK279a
-from .denitrovibrioacetiphilus import DenitrovibrioAcetiphilus
-from .kangiellakoreensis import KangiellaKoreensis
-from .leptotrichiabuccalis import LeptotrichiaBuccalis
-from .haloferaxmediterranei import HaloferaxMediterranei
-from .methanothermococcusthermolithotrophicus import MethanothermococcusThermolithotrophicus
-from .thermococcusonnurineus import ThermococcusOnnurineus
-from .desulfovibriodesulfuricansatcc27774 import DesulfovibrioDesulfuricansAtcc27774
-from .bradyrhizobiumspwsm2793 import BradyrhizobiumSpWsm2793
-from .actinomycescoleocanis import ActinomycesColeocanis
-from .actinomycesurogenitalisdsm15434 import ActinomycesUrogenitalisDsm15434
-from .anaerococcuslactolyticusatcc51172 import AnaerococcusLactolyticusAtcc51172
-from .anaerococcustetradius import AnaerococcusTetradius
-from .atopobiumvaginaedsm15829 import AtopobiumVaginaeDsm15829
-from .chryseobacteriumgleum import ChryseobacteriumGleum
-from .corynebacteriumaccolens import CorynebacteriumAccolens
-from .corynebacteriumlipophiloflavum import CorynebacteriumLipophiloflavum
-from .corynebacteriumpseudogenitalium import CorynebacteriumPseudogenitalium
-from .corynebacteriumstriatum import CorynebacteriumStriatum
-from .finegoldiamagnaatcc53516 import FinegoldiaMagnaAtcc53516
-from .lactobacillusantri import LactobacillusAntri
-from .lactobacillusbuchneriatcc11577 import LactobacillusBuchneriAtcc11577
-from .lactobacillusultunensis import LactobacillusUltunensis
-from .listeriagrayi import ListeriaGrayi
-from .mycobacteriumparascrofulaceum import MycobacteriumParascrofulaceum
-from .sphingobacteriumspiritivorum import SphingobacteriumSpiritivorum
-from .staphylococcuscaprae import StaphylococcusCaprae
-from .streptococcusequinus import StreptococcusEquinus
-from .desulfomicrobiumbaculatum import DesulfomicrobiumBaculatum
-from .sulfurospirillumdeleyianum import SulfurospirillumDeleyianum
-from .thermanaerovibrioacidaminovorans import ThermanaerovibrioAcidaminovorans
-from .thermobaculumterrenum import ThermobaculumTerrenum
-from .acidimicrobiumferrooxidans import AcidimicrobiumFerrooxidans
-from .anaerococcusprevotiidsm20548 import AnaerococcusPrevotiiDsm20548
-from .sebaldellatermitidis import SebaldellaTermitidis
-from .desulfovibriosalexigens import DesulfovibrioSalexigens
-from .brachyspiramurdochii import BrachyspiraMurdochii
-from .geodermatophilusobscurus import GeodermatophilusObscurus
-from .gordoniabronchialis import GordoniaBronchialis
-from .meiothermussilvanus import MeiothermusSilvanus
-from .yersiniaaldovae import YersiniaAldovae
-from .proteusmirabilis import ProteusMirabilis
-from .pyrococcusyayanosii import PyrococcusYayanosii
-from .thecamonastrahens import ThecamonasTrahens
-from .rhodolunalacicola import RhodolunaLacicola
-from .pirellulastaleyi import PirellulaStaleyi
-from .flavobacteriaceaebacterium351910 import FlavobacteriaceaeBacterium351910
-from .cylindrospermopsisraciborskii import CylindrospermopsisRaciborskii
-from .raphidiopsisbrookii import RaphidiopsisBrookii
-from .acidovoraxebreus import AcidovoraxEbreus
-from .mesorhizobiumopportunistum import MesorhizobiumOpportunistum
-from .clostridiumcarboxidivorans import ClostridiumCarboxidivorans
-from .clostridiumbotulinuma2kyoto import ClostridiumBotulinumA2Kyoto
-from .clostridiumbotulinume1bont import ClostridiumBotulinumE1Bont
-from .blautiahansenii import BlautiaHansenii
-from .prevotellacopri import PrevotellaCopri
-from .clostridiummethylpentosum import ClostridiumMethylpentosum
-from .liberibacterasiaticuspsy62 import LiberibacterAsiaticusPsy62
-from .helicobactercanadensis import HelicobacterCanadensis
-from .helicobactercinaediccug18818 import HelicobacterCinaediCcug18818
-from .helicobacterpullorum import HelicobacterPullorum
-from .haloterrigenaturkmenica import HaloterrigenaTurkmenica
-from .actinoplanessubtropicus import ActinoplanesSubtropicus
-from .variovoraxparadoxuss110 import VariovoraxParadoxusS110
-from .lactobacilluscaseibl23 import LactobacillusCaseiBl23
-from .betaproteobacteriumcb import BetaProteobacteriumCb
-from .clostridiumarbusti import ClostridiumArbusti
-from .bradyrhizobiumspwsm3983 import BradyrhizobiumSpWsm3983
-from .burkholderiaspccge1001 import BurkholderiaSpCcge1001
-from .bacillusmegateriumqmb1551 import BacillusMegateriumQmB1551
-from .treponemaprimitiazas2 import TreponemaPrimitiaZas2
-from .treponemaazotonutricium import TreponemaAzotonutricium
-from .holdemaniafiliformis import HoldemaniaFiliformis
-from .clostridiumcelatum import ClostridiumCelatum
-from .neisseriacinerea import NeisseriaCinerea
-from .neisseriaflavescensnrl30031h210 import NeisseriaFlavescensNrl30031h210
-from .neisseriamucosaatcc25996 import NeisseriaMucosaAtcc25996
-from .neisseriapolysaccharea import NeisseriaPolysaccharea
-from .neisseriasubflava import NeisseriaSubflava
-from .filifactoralocis import FilifactorAlocis
-from .gemellahaemolysansatcc10379 import GemellaHaemolysansAtcc10379
-from .selenomonassputigena import SelenomonasSputigena
-from .veillonelladispar import VeillonellaDispar
-from .eikenellacorrodensatcc23834 import EikenellaCorrodensAtcc23834
-from .fusobacteriumperiodonticum import FusobacteriumPeriodonticum
-from .deinococcusdeserti import DeinococcusDeserti
-from .bacteroidescoprophilus import BacteroidesCoprophilus
-from .bifidobacteriumpseudocatenulatum import BifidobacteriumPseudocatenulatum
-from .neisseriasicca import NeisseriaSicca
-from .butyrivibriospae3004 import ButyrivibrioSpAe3004
-from .mycobacteriumvulneris import MycobacteriumVulneris
-from .natrialbamagadii import NatrialbaMagadii
-from .corynebacteriumaurimucosum import CorynebacteriumAurimucosum
-from .corynebacteriumglucuronolyticum import CorynebacteriumGlucuronolyticum
-from .mobiluncuscurtisiiatcc43063 import MobiluncusCurtisiiAtcc43063
-from .ferrimonasbalearica import FerrimonasBalearica
-from .nostocazollae import NostocAzollae
-from .hirschiamaritima import HirschiaMaritima
-from .ponticauliskoreensis import PonticaulisKoreensis
-from .erysipelotrichaceaebacterium5254faa import ErysipelotrichaceaeBacterium5254faa
-from .ruminococcaceaebacteriumd16 import RuminococcaceaeBacteriumD16
-from .cryptococcusgattii import CryptococcusGattii
-from .bifidobacteriumanimalis import BifidobacteriumAnimalis
-from .dehalogenimonaslykanthroporepellens import DehalogenimonasLykanthroporepellens
-from .prevotellabiviajcvihmp010 import PrevotellaBiviaJcvihmp010
-from .prevotellamelaninogenica import PrevotellaMelaninogenica
-from .porphyromonasendodontalis import PorphyromonasEndodontalis
-from .capnocytophagasputigena import CapnocytophagaSputigena
-from .capnocytophagagingivalis import CapnocytophagaGingivalis
-from .atopobiumrimae import AtopobiumRimae
-from .corynebacteriumamycolatum import CorynebacteriumAmycolatum
-from .corynebacteriummatruchotii import CorynebacteriumMatruchotii
-from .enhydrobacteraerosaccus import EnhydrobacterAerosaccus
-from .campylobacterrectus import CampylobacterRectus
-from .campylobactershowaerm3277 import CampylobacterShowaeRm3277
-from .campylobactergracilis import CampylobacterGracilis
-from .cobetiacrustatorum import CobetiaCrustatorum
-from .clostridiumhylemonae import ClostridiumHylemonae
-from .chlorellavariabilis import ChlorellaVariabilis
-from .thermosediminibacteroceani import ThermosediminibacterOceani
-from .dethiobacteralkaliphilus import DethiobacterAlkaliphilus
-from .zymomonasmobilisatcc10988 import ZymomonasMobilisAtcc10988
-from .galbibactermarinus import GalbibacterMarinus
-from .halothiobacillusneapolitanus import HalothiobacillusNeapolitanus
-from .desulfonatronospirathiodismutans import DesulfonatronospiraThiodismutans
-from .burkholderiaspccge1003 import BurkholderiaSpCcge1003
-from .butyrivibriospae3006 import ButyrivibrioSpAe3006
-from .fusobacteriumnecrophorumd12 import FusobacteriumNecrophorumD12
-from .helicobacterwinghamensis import HelicobacterWinghamensis
-from .oxalobacterformigeneshoxbls import OxalobacterFormigenesHoxbls
-from .oxalobacterformigenesoxcc13 import OxalobacterFormigenesOxcc13
-from .lactobacillusreuteridsm20016 import LactobacillusReuteriDsm20016
-from .laribacterhongkongensis import LaribacterHongkongensis
-from .mycobacteriumkansasiiatcc12478 import MycobacteriumKansasiiAtcc12478
-from .chryseobacteriumpiperi import ChryseobacteriumPiperi
-from .lentibacillusjeotgali import LentibacillusJeotgali
-from .corynebacteriumdoosanense import CorynebacteriumDoosanense
-from .butyrivibriospae3009 import ButyrivibrioSpAe3009
-from .actinomaduraflavalba import ActinomaduraFlavalba
-from .anaerococcushydrogenalis import AnaerococcusHydrogenalis
-from .bifidobacteriumgallicum import BifidobacteriumGallicum
-from .dickeyazeae import DickeyaZeae
-from .pectobacteriumcarotovorumpc1 import PectobacteriumCarotovorumPc1
-from .pectobacteriumwasabiae import PectobacteriumWasabiae
-from .amphibacillusjilinensis import AmphibacillusJilinensis
-from .kyrpidiatusciae import KyrpidiaTusciae
-from .actinomycesviscosus import ActinomycesViscosus
-from .gemellahaemolysansm341 import GemellaHaemolysansM341
-from .gemellamorbillorum import GemellaMorbillorum
-from .gemellasanguinis import GemellaSanguinis
-from .prevotellaorisc735 import PrevotellaOrisC735
-from .burkholderiaspccge1002 import BurkholderiaSpCcge1002
-from .burkholderiaceaespmortierella import BurkholderiaceaeSpMortierella
-from .sulfurimonasautotrophica import SulfurimonasAutotrophica
-from .bilophilawadsworthia316 import BilophilaWadsworthia316
-from .geoglobusacetivorans import GeoglobusAcetivorans
-from .brachyspirahyodysenteriae import BrachyspiraHyodysenteriae
-from .luminiphilussyltensis import LuminiphilusSyltensis
-from .ureaplasmaurealyticum import UreaplasmaUrealyticum
-from .legionellapneumophilaparis import LegionellaPneumophilaParis
-from .enterococcuscasseliflavus import EnterococcusCasseliflavus
-from .enterococcusfaeciumc68 import EnterococcusFaeciumC68
-from .streptomycesghanaensis import StreptomycesGhanaensis
-from .gammaproteobacteriabacteriumnor53 import GammaproteobacteriaBacteriumNor53
-from .bifidobacteriumcatenulatum import BifidobacteriumCatenulatum
-from .metarhiziumrobertsii import MetarhiziumRobertsii
-from .lactobacillusrhamnosus import LactobacillusRhamnosus
-from .bordetellapertussis18323 import BordetellaPertussis18323
-from .butyrivibriospfc2001 import ButyrivibrioSpFc2001
-from .acidaminococcusintestini import AcidaminococcusIntestini
-from .serratiasymbiotica import SerratiaSymbiotica
-from .nocardiopsispotens import NocardiopsisPotens
-from .butyrivibriospfcs014 import ButyrivibrioSpFcs014
-from .fodinicurvatasediminis import FodinicurvataSediminis
-from .fodinicurvatafenggangensis import FodinicurvataFenggangensis
-from .sedimentitaleananhaiensis import SedimentitaleaNanhaiensis
-from .hamiltonelladefensa import HamiltonellaDefensa
-from .allochromatiumvinosum import AllochromatiumVinosum
-from .vulcanisaetadistributa import VulcanisaetaDistributa
-from .halanaerobiumpraevalens import HalanaerobiumPraevalens
-from .arcobacternitrofigilis import ArcobacterNitrofigilis
-from .ilyobacterpolytropus import IlyobacterPolytropus
-from .archaeoglobusprofundus import ArchaeoglobusProfundus
-from .aminobacteriumcolombiense import AminobacteriumColombiense
-from .clostridiumcellulovorans import ClostridiumCellulovorans
-from .methanocaldococcusinfernus import MethanocaldococcusInfernus
-from .methanocaldococcusfervens import MethanocaldococcusFervens
-from .asticcacaulisexcentricus import AsticcacaulisExcentricus
-from .desulfovibriomagneticusrs1 import DesulfovibrioMagneticusRs1
-from .bacillusgaemokensis import BacillusGaemokensis
-from .spirochaetasmaragdinae import SpirochaetaSmaragdinae
-from .butyrivibriospvcd2006 import ButyrivibrioSpVcd2006
-from .acetohalobiumarabaticum import AcetohalobiumArabaticum
-from .bacillusmanliponensis import BacillusManliponensis
-from .anaplasmacentrale import AnaplasmaCentrale
-from .halomonaszhanjiangensis import HalomonasZhanjiangensis
-from .isosphaerapallida import IsosphaeraPallida
-from .butyrivibriospwcd2001 import ButyrivibrioSpWcd2001
-from .acinetobacterjohnsonii import AcinetobacterJohnsonii
-from .acinetobacterlwoffiish145 import AcinetobacterLwoffiiSh145
-from .acinetobacterradioresistens import AcinetobacterRadioresistens
-from .bacteroidetesf0058 import BacteroidetesF0058
-from .lachnospiraceaef0167 import LachnospiraceaeF0167
-from .lactobacilluscoleohominis import LactobacillusColeohominis
-from .lactobacillusjensenii1153chn import LactobacillusJensenii1153chn
-from .lactobacillusjensenii272chn import LactobacillusJensenii272chn
-from .butyrivibriospmc2013 import ButyrivibrioSpMc2013
-from .butyrivibriospwcd3002 import ButyrivibrioSpWcd3002
-from .vibriotasmaniensis import VibrioTasmaniensis
-from .methanocaldococcusvulcanius import MethanocaldococcusVulcanius
-from .zymomonasmobilispomaceae import ZymomonasMobilisPomaceae
-from .dickeyadadantiiech703 import DickeyaDadantiiEch703
-from .thermoanaerobacteriumthermosaccharolyticum import ThermoanaerobacteriumThermosaccharolyticum
-from .thermoanaerobacteritalicus import ThermoanaerobacterItalicus
-from .sideroxydanslithotrophicus import SideroxydansLithotrophicus
-from .thermovirgalienii import ThermovirgaLienii
-from .hirschiabaltica import HirschiaBaltica
-from .rubidibacterlacunae import RubidibacterLacunae
-from .methylovorusglucosetrophus import MethylovorusGlucosetrophus
-from .hyphomicrobiumdenitrificansatcc51888 import HyphomicrobiumDenitrificansAtcc51888
-from .methyloteneramobilisjlw8 import MethyloteneraMobilisJlw8
-from .coraliomargaritaakajimensis import CoraliomargaritaAkajimensis
-from .aminomonaspaucivorans import AminomonasPaucivorans
-from .mobiluncuscurtisiiatcc35241 import MobiluncusCurtisiiAtcc35241
-from .mobiluncusmulierisatcc35243 import MobiluncusMulierisAtcc35243
-from .streptococcusmitissk321 import StreptococcusMitisSk321
-from .streptococcusmitissk564 import StreptococcusMitisSk564
-from .streptococcusmitissk597 import StreptococcusMitisSk597
-from .roseburiahominis import RoseburiaHominis
-from .butyrivibriosplc3010 import ButyrivibrioSpLc3010
-from .butyrivibriospvcb2006 import ButyrivibrioSpVcb2006
-from .oribacteriumsinus import OribacteriumSinus
-from .prevotellabergensis import PrevotellaBergensis
-from .selenomonasnoxiaatcc43541 import SelenomonasNoxiaAtcc43541
-from .weissellaparamesenteroides import WeissellaParamesenteroides
-from .lactobacillusamylolyticus import LactobacillusAmylolyticus
-from .corynebacteriumgenitalium import CorynebacteriumGenitalium
-from .brevibacteriummcbrellneri import BrevibacteriumMcbrellneri
-from .aeromicrobiummarinum import AeromicrobiumMarinum
-from .butyrivibriospxbb1001 import ButyrivibrioSpXbb1001
-from .oceanobacillusmanasiensis import OceanobacillusManasiensis
-from .terribacillusaidingensis import TerribacillusAidingensis
-from .pseudomonaschlororaphis import PseudomonasChlororaphis
-from .clostridiumpapyrosolvens import ClostridiumPapyrosolvens
-from .rhizophagusirregularis import RhizophagusIrregularis
-from .kazachstanianaganishii import KazachstaniaNaganishii
-from .brevundimonasnaejangsanensis import BrevundimonasNaejangsanensis
-from .desulfurivibrioalkaliphilus import DesulfurivibrioAlkaliphilus
-from .alteromonasaustralica import AlteromonasAustralica
-from .ferroglobusplacidus import FerroglobusPlacidus
-from .dickeyadadantiiech586 import DickeyaDadantiiEch586
-from .cellulomonasfimi import CellulomonasFimi
-from .acidaminococcusfermentans import AcidaminococcusFermentans
-from .staphylothermushellenicus import StaphylothermusHellenicus
-from .actinobacillusminor202 import ActinobacillusMinor202
-from .butyrivibriospmc2021 import ButyrivibrioSpMc2021
-from .butyrivibriospxpd2006 import ButyrivibrioSpXpd2006
-from .streptomycesviridochromogenes import StreptomycesViridochromogenes
-from .streptomycespratensis import StreptomycesPratensis
-from .abiotrophiadefectiva import AbiotrophiaDefectiva
-from .anaerobaculumhydrogeniformans import AnaerobaculumHydrogeniformans
-from .catonellamorbi import CatonellaMorbi
-from .clostridiumbotulinumd1873 import ClostridiumBotulinumD1873
-from .dialisterinvisus import DialisterInvisus
-from .nonlabensdokdonensis import NonlabensDokdonensis
-from .eubacteriumsaphenum import EubacteriumSaphenum
-from .butyrivibriospnc3005 import ButyrivibrioSpNc3005
-from .frankiaspcci3 import FrankiaSpCci3
-from .thermococcusgammatolerans import ThermococcusGammatolerans
-from .methanoregulaformicica import MethanoregulaFormicica
-from .cellvibriogilvus import CellvibrioGilvus
-from .caloramatorspald01 import CaloramatorSpAld01
-from .tolumonasauensis import TolumonasAuensis
-from .methylosinustrichosporium import MethylosinusTrichosporium
-from .variovoraxparadoxuseps import VariovoraxParadoxusEps
-from .calothrixsp3363 import CalothrixSp3363
-from .desulfovibriofructosivorans import DesulfovibrioFructosivorans
-from .calothrixsppcc6303 import CalothrixSpPcc6303
-from .alicycliphilusdenitrificansbc import AlicycliphilusDenitrificansBc
-from .alicycliphilusdenitrificansk601 import AlicycliphilusDenitrificansK601
-from .olsenellauli import OlsenellaUli
-from .peptostreptococcusstomatis import PeptostreptococcusStomatis
-from .staphylococcuswarneril37603 import StaphylococcusWarneriL37603
-from .neisseriaflavescenssk114 import NeisseriaFlavescensSk114
-from .leptotrichiagoodfellowii import LeptotrichiaGoodfellowii
-from .treponemavincentii import TreponemaVincentii
-from .porphyromonasuenonis603 import PorphyromonasUenonis603
-from .mobiluncusmulieris281 import MobiluncusMulieris281
-from .peptostreptococcusanaerobius653l import PeptostreptococcusAnaerobius653l
-from .peptoniphiluslacrimalis import PeptoniphilusLacrimalis
-from .capnocytophagaspf0234 import CapnocytophagaSpF0234
-from .nautiliaprofundicola import NautiliaProfundicola
-from .campylobacterspcit045 import CampylobacterSpCit045
-from .meiothermusrufus import MeiothermusRufus
-from .thermococcussibiricus import ThermococcusSibiricus
-from .caldicellulosiruptorobsidiansis import CaldicellulosiruptorObsidiansis
-from .capnocytophagaspf0381 import CapnocytophagaSpF0381
-from .hydrogenobacterthermophilus import HydrogenobacterThermophilus
-from .clostridiumsaccharolyticumwm1 import ClostridiumSaccharolyticumWm1
-from .helicobacterbilis import HelicobacterBilis
-from .rhodoferaxsaidenbachensis import RhodoferaxSaidenbachensis
-from .arenibacteralgicola import ArenibacterAlgicola
-from .vibriosplendidus import VibrioSplendidus
-from .capnocytophagaspf0382 import CapnocytophagaSpF0382
-from .aquimarinaagarilytica import AquimarinaAgarilytica
-from .capnocytophagaspf0517 import CapnocytophagaSpF0517
-from .roseburiainulinivorans import RoseburiaInulinivorans
-from .campylobacterspmit975078 import CampylobacterSpMit975078
-from .granulicatellaelegans import GranulicatellaElegans
-from .burkholderiaglumae import BurkholderiaGlumae
-from .prevotellatannerae import PrevotellaTannerae
-from .shuttleworthiasatelles import ShuttleworthiaSatelles
-from .marinobacternanhaiticus import MarinobacterNanhaiticus
-from .phascolarctobacteriumsuccinatutens import PhascolarctobacteriumSuccinatutens
-from .carnobacteriumsp174 import CarnobacteriumSp174
-from .pseudomonassyringaemaculicola import PseudomonasSyringaeMaculicola
-from .staphylococcushominissk119 import StaphylococcusHominisSk119
-from .capnocytophagaspf0087 import CapnocytophagaSpF0087
-from .shimwelliablattae import ShimwelliaBlattae
-from .caulobacterspk31 import CaulobacterSpK31
-from .lutibaculumbaratangense import LutibaculumBaratangense
-from .clostridiumbutyricum import ClostridiumButyricum
-from .caldicellulosiruptorhydrothermalis import CaldicellulosiruptorHydrothermalis
-from .caldicellulosiruptorkristjanssonii import CaldicellulosiruptorKristjanssonii
-from .caldicellulosiruptorowensensis import CaldicellulosiruptorOwensensis
-from .cellulomonassphzm import CellulomonasSpHzm
-from .thermosphaeraaggregans import ThermosphaeraAggregans
-from .brevundimonassubvibrioides import BrevundimonasSubvibrioides
-from .eubacteriumcellulosolvens6 import EubacteriumCellulosolvens6
-from .aggregatibacteraphrophilus import AggregatibacterAphrophilus
-from .komagataeibactermedellinensis import KomagataeibacterMedellinensis
-from .acetobacterpasteurianusifo328301 import AcetobacterPasteurianusIfo328301
-from .haloarculahispanica import HaloarculaHispanica
-from .methanobrevibacterruminantium import MethanobrevibacterRuminantium
-from .erwiniapyrifoliae import ErwiniaPyrifoliae
-from .erwiniabillingiae import ErwiniaBillingiae
-from .bartonellagrahamii import BartonellaGrahamii
-from .geobacillusthermoglucosidasius import GeobacillusThermoglucosidasius
-from .leptotrichiahofstadii import LeptotrichiaHofstadii
-from .thermincolapotens import ThermincolaPotens
-from .acidithiobacilluscaldus import AcidithiobacillusCaldus
-from .acidithiobacillusthiooxidans import AcidithiobacillusThiooxidans
-from .shewanellaviolacea import ShewanellaViolacea
-from .citrobacterrodentium import CitrobacterRodentium
-from .actinobacillusminornm305 import ActinobacillusMinorNm305
-from .granulicatellaadiacens import GranulicatellaAdiacens
-from .selenomonasflueggei import SelenomonasFlueggei
-from .thermocrinisalbus import ThermocrinisAlbus
-from .acidobacteriabacteriumkbs146 import AcidobacteriaBacteriumKbs146
-from .deferribacterdesulfuricans import DeferribacterDesulfuricans
-from .starkeyanovella import StarkeyaNovella
-from .dechlorosomasuillum import DechlorosomaSuillum
-from .segniliparusrotundus import SegniliparusRotundus
-from .calothrixsppcc7103 import CalothrixSpPcc7103
-from .calothrixsppcc7507 import CalothrixSpPcc7507
-from .campylobactersp1485e import CampylobacterSp1485e
-from .enterobacterasburiaelf7a import EnterobacterAsburiaeLf7a
-from .cellulomonasspkrmcy2 import CellulomonasSpKrmcy2
-from .ruminococcusflavefaciensfd1 import RuminococcusFlavefaciensFd1
-from .capnocytophagagranulosa import CapnocytophagaGranulosa
-from .scardoviainopinata import ScardoviaInopinata
-from .simonsiellamuelleri import SimonsiellaMuelleri
-from .cellvibriospbr import CellvibrioSpBr
-from .desulfovibriodesulfuricansnd132 import DesulfovibrioDesulfuricansNd132
-from .cyclobacteriumqasimii import CyclobacteriumQasimii
-from .winogradskyellapsychrotolerans import WinogradskyellaPsychrotolerans
-from .tatumellamorbirosei import TatumellaMorbirosei
-from .clostridiumlentocellum import ClostridiumLentocellum
-from .chelativoransspbnc1 import ChelativoransSpBnc1
-from .desulfovibrioaespoeensis import DesulfovibrioAespoeensis
-from .syntrophothermuslipocalidus import SyntrophothermusLipocalidus
-from .marivirgatractuosa import MarivirgaTractuosa
-from .cellulomonasspurhe0023 import CellulomonasSpUrhe0023
-from .silicibacterlacuscaerulensis import SilicibacterLacuscaerulensis
-from .chelativoransspj32 import ChelativoransSpJ32
-from .desulfarculusbaarsii import DesulfarculusBaarsii
-from .micromonosporaaurantiaca import MicromonosporaAurantiaca
-from .arcanobacteriumhaemolyticum import ArcanobacteriumHaemolyticum
-from .gordonianeofelifaecis import GordoniaNeofelifaecis
-from .pseudomonasstutzerirch2 import PseudomonasStutzeriRch2
-from .thermaerobactermarianensis import ThermaerobacterMarianensis
-from .chelatococcusspgw1 import ChelatococcusSpGw1
-from .corynebacteriumkroppenstedtii import CorynebacteriumKroppenstedtii
-from .chloroflexusspmsg import ChloroflexusSpMsg
-from .jonquetellaanthropie333e1 import JonquetellaAnthropiE333e1
-from .syntrophobotulusglycolicus import SyntrophobotulusGlycolicus
-from .desulfosporosinusacidiphilus import DesulfosporosinusAcidiphilus
-from .methanothermococcusokinawensis import MethanothermococcusOkinawensis
-from .rhodomicrobiumvannielii import RhodomicrobiumVannielii
-from .chlamydiaspdiamant import ChlamydiaSpDiamant
-from .thermovibrioammonificans import ThermovibrioAmmonificans
-from .leadbetterellabyssophila import LeadbetterellaByssophila
-from .trueperaradiovictrix import TrueperaRadiovictrix
-from .bacilluscellulosilyticus import BacillusCellulosilyticus
-from .chloroflexusspy3961 import ChloroflexusSpY3961
-from .aneurinibacillusaneurinilyticus import AneurinibacillusAneurinilyticus
-from .corynebacteriumammoniagenes import CorynebacteriumAmmoniagenes
-from .prevotellaveroralisf0319 import PrevotellaVeroralisF0319
-from .slackiaexigua import SlackiaExigua
-from .chlamydiasprubis import ChlamydiaSpRubis
-from .erysipelothrixrhusiopathiae import ErysipelothrixRhusiopathiae
-from .rhodopseudomonaspalustrisdx1 import RhodopseudomonasPalustrisDx1
-from .streptomycesviolaceusniger import StreptomycesViolaceusniger
-from .chryseobacteriumspjm1 import ChryseobacteriumSpJm1
-from .desulfurispirillumindicum import DesulfurispirillumIndicum
-from .albugolaibachii import AlbugoLaibachii
-from .anaerococcusvaginalis import AnaerococcusVaginalis
-from .aerococcusviridansatcc11563 import AerococcusViridansAtcc11563
-from .streptococcusoralisatcc35037 import StreptococcusOralisAtcc35037
-from .zunongwangiaprofunda import ZunongwangiaProfunda
-from .pseudogymnoascusdestructans import PseudogymnoascusDestructans
-from .frankiasymbiont import FrankiaSymbiont
-from .halanaerobiumhydrogeniformans import HalanaerobiumHydrogeniformans
-from .bacteroidesxylanisolvens import BacteroidesXylanisolvens
-from .faecalibacteriumprausnitziisl33 import FaecalibacteriumPrausnitziiSl33
-from .lachnospiraceaebacterium3157faact1 import LachnospiraceaeBacterium3157faact1
-from .lachnospiraceaebacterium9143bfaa import LachnospiraceaeBacterium9143bfaa
-from .liberibactersolanacearum import LiberibacterSolanacearum
-from .legionelladrancourtii import LegionellaDrancourtii
-from .citreicellasp357 import CitreicellaSp357
-from .lachnospiraceaebacterium1456faa import LachnospiraceaeBacterium1456faa
-from .erysipelotrichaceaebacterium3153 import ErysipelotrichaceaeBacterium3153
-from .mesotogaprima import MesotogaPrima
-from .citreicellaspse45 import CitreicellaSpSe45
-from .legionellalongbeachae import LegionellaLongbeachae
-from .fimbriimonasginsengisoli import FimbriimonasGinsengisoli
-from .haloferaxmucosum import HaloferaxMucosum
-from .corynebacteriumresistens import CorynebacteriumResistens
-from .ethanoligenensharbinense import EthanoligenensHarbinense
-from .regiellainsecticola import RegiellaInsecticola
-from .methylocapsaaurea import MethylocapsaAurea
-from .acetobacteracetiatcc23746 import AcetobacterAcetiAtcc23746
-from .streptococcusdysgalactiaeatcc27957 import StreptococcusDysgalactiaeAtcc27957
-from .erwiniaamylovora import ErwiniaAmylovora
-from .spirochaetathermophila import SpirochaetaThermophila
-from .streptomycesviridosporus import StreptomycesViridosporus
-from .chlorobiumspgbchlb import ChlorobiumSpGbchlb
-from .lachnospiraceaebacterium3146faa import LachnospiraceaeBacterium3146faa
-from .bacillussmithii import BacillusSmithii
-from .carnobacteriumspwn1359 import CarnobacteriumSpWn1359
-from .citricoccusspch26a import CitricoccusSpCh26a
-from .planktomarinatemperata import PlanktomarinaTemperata
-from .acidilobussaccharovorans import AcidilobusSaccharovorans
-from .methyloteneraversatilis import MethyloteneraVersatilis
-from .citrobactersp302 import CitrobacterSp302
-from .rhodanobacterdenitrificans import RhodanobacterDenitrificans
-from .citrobactersps77 import CitrobacterSpS77
-from .thermodesulfatatorindicus import ThermodesulfatatorIndicus
-from .bacteroidessalanitronis import BacteroidesSalanitronis
-from .edwardsiellatardaatcc15947 import EdwardsiellaTardaAtcc15947
-from .clostridialesgenomosp import ClostridialesGenomosp
-from .mannheimiahaemolyticabovine import MannheimiaHaemolyticaBovine
-from .profftellaarmatura import ProfftellaArmatura
-from .microvirgaaerilata import MicrovirgaAerilata
-from .hyphomicrobiumdenitrificans1nes1 import HyphomicrobiumDenitrificans1nes1
-from .oceanithermusprofundus import OceanithermusProfundus
-from .metallosphaerayellowstonensis import MetallosphaeraYellowstonensis
-from .methylomirabilisoxyfera import MethylomirabilisOxyfera
-from .caulobacterspunc358mftsu51 import CaulobacterSpUnc358mftsu51
-from .babelamassiliensis import BabelaMassiliensis
-from .vibrioalginolyticus40b import VibrioAlginolyticus40b
-from .pseudonocardiadioxanivorans import PseudonocardiaDioxanivorans
-from .vibriomimicus import VibrioMimicus
-from .grimontiahollisae import GrimontiaHollisae
-from .vibriometschnikovii import VibrioMetschnikovii
-from .vibriocoralliilyticus import VibrioCoralliilyticus
-from .clostridiumsp7243faa import ClostridiumSp7243faa
-from .vibrioorientalis import VibrioOrientalis
-from .photobacteriumdamselae import PhotobacteriumDamselae
-from .francisellatularensisnovicida import FrancisellaTularensisNovicida
-from .prevotellatimonensiscris5cb1 import PrevotellaTimonensisCris5cb1
-from .prevotellabuccalisatcc35310 import PrevotellaBuccalisAtcc35310
-from .prevotellaamnii import PrevotellaAmnii
-from .bulleidiaextructa import BulleidiaExtructa
-from .segniliparusrugosus import SegniliparusRugosus
-from .alloprevotellarava import AlloprevotellaRava
-from .johnsonellaignava import JohnsonellaIgnava
-from .selenomonasinfelix import SelenomonasInfelix
-from .helicobactermustelae import HelicobacterMustelae
-from .methanoplanuspetrolearius import MethanoplanusPetrolearius
-from .alistipesfinegoldii import AlistipesFinegoldii
-from .bacteroidescoprosuis import BacteroidesCoprosuis
-from .streptomycesscabiei import StreptomycesScabiei
-from .rothiamucilaginosa import RothiaMucilaginosa
-from .granulicellamallensis import GranulicellaMallensis
-from .campylobacterjejuni414 import CampylobacterJejuni414
-from .listeriaseeligeri12b import ListeriaSeeligeri12b
-from .alphaproteobacteriumhimb114 import AlphaProteobacteriumHimb114
-from .clostridiumspadety import ClostridiumSpAdety
-from .citromicrobiumbathyomarinum import CitromicrobiumBathyomarinum
-from .rhodococcusequi import RhodococcusEqui
-from .citromicrobiumspjlt1363 import CitromicrobiumSpJlt1363
-from .bartonellarochalimae import BartonellaRochalimae
-from .methylomicrobiumalbum import MethylomicrobiumAlbum
-from .clostridiumspasbs410 import ClostridiumSpAsbs410
-from .comamonastestosteronicnb2 import ComamonasTestosteroniCnb2
-from .prevotellamultisaccharivorax import PrevotellaMultisaccharivorax
-from .thermotogathermarum import ThermotogaThermarum
-from .cellulophagaalgicola import CellulophagaAlgicola
-from .clostridiumspasf356 import ClostridiumSpAsf356
-from .rhizobiumvignae import RhizobiumVignae
-from .pseudomonasfluorescensnz007 import PseudomonasFluorescensNz007
-from .desulfovibrioafricanus import DesulfovibrioAfricanus
-from .fonticulaalba import FonticulaAlba
-from .enterobacteriaceaebacteriumstrain import EnterobacteriaceaeBacteriumStrain
-from .archaeoglobusveneficus import ArchaeoglobusVeneficus
-from .oscillibactervalericigenes import OscillibacterValericigenes
-from .deinococcusproteolyticus import DeinococcusProteolyticus
-from .bacteroideshelcogenes import BacteroidesHelcogenes
-from .methylobacteriumoryzae import MethylobacteriumOryzae
-from .paludibacterpropionicigenes import PaludibacterPropionicigenes
-from .pyrolobusfumarii import PyrolobusFumarii
-from .natronococcusoccultus import NatronococcusOccultus
-from .desulfurellaacetivorans import DesulfurellaAcetivorans
-from .methanomicrobiummobile import MethanomicrobiumMobile
-from .aggregatibacteractinomycetemcomitansd7s1 import AggregatibacterActinomycetemcomitansD7s1
-from .bartonellaclarridgeiae import BartonellaClarridgeiae
-from .desulfotomaculumruminis import DesulfotomaculumRuminis
-from .desulfotomaculumnigrificans import DesulfotomaculumNigrificans
-from .arthrospiraplatensisnies39 import ArthrospiraPlatensisNies39
-from .actinobacillussuis import ActinobacillusSuis
-from .mahellaaustraliensis import MahellaAustraliensis
-from .methylobactertundripaludum import MethylobacterTundripaludum
-from .paenibacilluslarvae import PaenibacillusLarvae
-from .thermoanaerobacterwiegelii import ThermoanaerobacterWiegelii
-from .ruminococcusalbus7 import RuminococcusAlbus7
-from .marssoninabrunnea import MarssoninaBrunnea
-from .staphylococcuslugdunensishku0901 import StaphylococcusLugdunensisHku0901
-from .pyrobaculumoguniense import PyrobaculumOguniense
-from .amphibacillusxylanus import AmphibacillusXylanus
-from .rhizobiumtropici import RhizobiumTropici
-from .virgibacillusalimentarius import VirgibacillusAlimentarius
-from .gardnerellavaginalis6119v5 import GardnerellaVaginalis6119v5
-from .corynebacteriumdiphtheriae import CorynebacteriumDiphtheriae
-from .chryseobacteriumspcf284 import ChryseobacteriumSpCf284
-from .clostridiumspasf502 import ClostridiumSpAsf502
-from .streptococcusratti import StreptococcusRatti
-from .coriobacteriumglomerans import CoriobacteriumGlomerans
-from .mycobacteriumneoaurum import MycobacteriumNeoaurum
-from .niastellakoreensis import NiastellaKoreensis
-from .frankiaspcn3 import FrankiaSpCn3
-from .enterobacterlignolyticus import EnterobacterLignolyticus
-from .pediococcusclaussenii import PediococcusClaussenii
-from .clostridiumsp01 import ClostridiumSp01
-from .selenomonasnoxiaf0398 import SelenomonasNoxiaF0398
-from .prevotellaoulorumf0390 import PrevotellaOulorumF0390
-from .turicibactersanguinis import TuricibacterSanguinis
-from .bifidobacteriumbifidumprl2010 import BifidobacteriumBifidumPrl2010
-from .pantoeaananatislmg20103 import PantoeaAnanatisLmg20103
-from .solobacteriummooreif0204 import SolobacteriumMooreiF0204
-from .megasphaeramicronuciformis import MegasphaeraMicronuciformis
-from .clostridiumsp12 import ClostridiumSp12
-from .streptococcusanginosusf0211 import StreptococcusAnginosusF0211
-from .clostridiumspcl6 import ClostridiumSpCl6
-from .desulfomoniletiedjei import DesulfomonileTiedjei
-from .mycoplasmagallisepticumf import MycoplasmaGallisepticumF
-from .sulfuricurvumkujiense import SulfuricurvumKujiense
-from .bradyrhizobiaceaebacteriumsg6c import BradyrhizobiaceaeBacteriumSg6c
-from .deinococcusmaricopensis import DeinococcusMaricopensis
-from .odoribactersplanchnicus import OdoribacterSplanchnicus
-from .frankiaspqa3 import FrankiaSpQa3
-from .colletotrichumfioriniae import ColletotrichumFioriniae
-from .helicobactersuis import HelicobacterSuis
-from .mycobacteriumchubuense import MycobacteriumChubuense
-from .mycobacteriumrhodesiaenbb3 import MycobacteriumRhodesiaeNbb3
-from .mycobacteriumsmegmatisjs623 import MycobacteriumSmegmatisJs623
-from .mycobacteriumtusciae import MycobacteriumTusciae
-from .intrasporangiumcalvum import IntrasporangiumCalvum
-from .clostridiumspd5 import ClostridiumSpD5
-from .pantoeavagans import PantoeaVagans
-from .thioalkalivibriothiocyanodenitrificans import ThioalkalivibrioThiocyanodenitrificans
-from .thioalkalivibriothiocyanoxidansarh4 import ThioalkalivibrioThiocyanoxidansArh4
-from .lactobacillusiners import LactobacillusIners
-from .leucobacterchromiiresistens import LeucobacterChromiiresistens
-from .lactobacillussanfranciscensis import LactobacillusSanfranciscensis
-from .mucilaginibacterpaludis import MucilaginibacterPaludis
-from .lysinibacillusfusiformis import LysinibacillusFusiformis
-from .asticcacaulisbiprosthecum import AsticcacaulisBiprosthecum
-from .clostridiumspdlviii import ClostridiumSpDlviii
-from .enterobactercloacaeatcc13047 import EnterobacterCloacaeAtcc13047
-from .waddliachondrophila import WaddliaChondrophila
-from .ensifersojae import EnsiferSojae
-from .flexistipessinusarabici import FlexistipesSinusarabici
-from .thermobacilluscomposti import ThermobacillusComposti
-from .paenibacilluscurdlanolyticus import PaenibacillusCurdlanolyticus
-from .thioalkalimicrobiumaerophilum import ThioalkalimicrobiumAerophilum
-from .thioalkalimicrobiumcyclicum import ThioalkalimicrobiumCyclicum
-from .marinomonasmediterranea import MarinomonasMediterranea
-from .clostridiumsphgf2 import ClostridiumSpHgf2
-from .faecalibacteriumprausnitziil26 import FaecalibacteriumPrausnitziiL26
-from .clostridiumclariflavum import ClostridiumClariflavum
-from .bacillusatrophaeus import BacillusAtrophaeus
-from .pseudoalteromonashaloplanktisant505 import PseudoalteromonasHaloplanktisAnt505
-from .mycoplasmapneumoniae import MycoplasmaPneumoniae
-from .idiomarinaxiamenensis import IdiomarinaXiamenensis
-from .clostridiumsphmp27 import ClostridiumSpHmp27
-from .achromobacterpiechaudiiatcc43553 import AchromobacterPiechaudiiAtcc43553
-from .clostridiumspjcc import ClostridiumSpJcc
-from .lachnospiraceaebacterium2146faa import LachnospiraceaeBacterium2146faa
-from .alistipesindistinctus import AlistipesIndistinctus
-from .barnesiellaintestinihominis import BarnesiellaIntestinihominis
-from .bacteroidesoleiciplenus import BacteroidesOleiciplenus
-from .clostridiumcitroniae import ClostridiumCitroniae
-from .clostridiumclostridioforme import ClostridiumClostridioforme
-from .clostridiumorbiscindens import ClostridiumOrbiscindens
-from .clostridiumsymbiosumwal14163 import ClostridiumSymbiosumWal14163
-from .clostridiumsymbiosumwal14673 import ClostridiumSymbiosumWal14673
-from .collinsellatanakaei import CollinsellaTanakaei
-from .dialistersuccinatiphilus import DialisterSuccinatiphilus
-from .doreaformicigenerans4653afaa import DoreaFormicigenerans4653afaa
-from .dysgonomonasgadei import DysgonomonasGadei
-from .dysgonomonasmossii import DysgonomonasMossii
-from .odoribacterlaneus import OdoribacterLaneus
-from .slackiapiriformis import SlackiaPiriformis
-from .sutterellawadsworthensis3145b import SutterellaWadsworthensis3145b
-from .sutterellawadsworthensis2159bfaa import SutterellaWadsworthensis2159bfaa
-from .acidithiobacillusferrivorans import AcidithiobacillusFerrivorans
-from .thermusscotoductus import ThermusScotoductus
-from .isoptericolavariabilis import IsoptericolaVariabilis
-from .paenibacilluslactis import PaenibacillusLactis
-from .pseudomonasfulva import PseudomonasFulva
-from .pseudoxanthomonassuwonensis111 import PseudoxanthomonasSuwonensis111
-from .clostridiumspbnl1100 import ClostridiumSpBnl1100
-from .clostridiumspkle1755 import ClostridiumSpKle1755
-from .mycoplasmaputrefaciensks1 import MycoplasmaPutrefaciensKs1
-from .mycoplasmabovoculi import MycoplasmaBovoculi
-from .moraxellabovoculi import MoraxellaBovoculi
-from .treponemacaldaria import TreponemaCaldaria
-from .clostridiumspcl2 import ClostridiumSpCl2
-from .clostridiumspknhs205 import ClostridiumSpKnhs205
-from .alphaproteobacteriumhimb59 import AlphaProteobacteriumHimb59
-from .gammaproteobacteriabacteriumhimb55 import GammaproteobacteriaBacteriumHimb55
-from .clostridiumspatcc29733 import ClostridiumSpAtcc29733
-from .clostridiumspknhs209 import ClostridiumSpKnhs209
-from .gallaecimonasxiamenensis import GallaecimonasXiamenensis
-from .clostridiumspknhs214 import ClostridiumSpKnhs214
-from .deinococcusgobiensis import DeinococcusGobiensis
-from .aspergillusfumigatus import AspergillusFumigatus
-from .aequorivitasublithincola import AequorivitaSublithincola
-from .thermodesulfobiumnarugense import ThermodesulfobiumNarugense
-from .mycoplasmaalligatoris import MycoplasmaAlligatoris
-from .faecalibacteriumprausnitziikle1255 import FaecalibacteriumPrausnitziiKle1255
-from .clostridiumspl250 import ClostridiumSpL250
-from .clostridiumsplf2 import ClostridiumSpLf2
-from .halobacteroideshalobius import HalobacteroidesHalobius
-from .clostridiumspm240 import ClostridiumSpM240
-from .lactobacilluscrispatus import LactobacillusCrispatus
-from .clostridiumljungdahlii import ClostridiumLjungdahlii
-from .nitratifractorsalsuginis import NitratifractorSalsuginis
-from .streptomycesbingchenggensis import StreptomycesBingchenggensis
-from .amycolatopsismediterranei import AmycolatopsisMediterranei
-from .clostridiumspmste9 import ClostridiumSpMste9
-from .thermusoshimai import ThermusOshimai
-from .gammaproteobacteriabacteriumhimb30 import GammaproteobacteriaBacteriumHimb30
-from .treponemaphagedenis import TreponemaPhagedenis
-from .mesorhizobiumaustralicum import MesorhizobiumAustralicum
-from .propionibacteriumfreudenreichii import PropionibacteriumFreudenreichii
-from .clostridiumspsy8519 import ClostridiumSpSy8519
-from .photobacteriumaphoticum import PhotobacteriumAphoticum
-from .methylophaganitratireducenticrescens import MethylophagaNitratireducenticrescens
-from .methylophagafrappieri import MethylophagaFrappieri
-from .cyanobacteriumaponinum import CyanobacteriumAponinum
-from .collinsellasp4847faa import CollinsellaSp4847faa
-from .fluviicolataffensis import FluviicolaTaffensis
-from .microcoleusvaginatus import MicrocoleusVaginatus
-from .planctomycesbrasiliensis import PlanctomycesBrasiliensis
-from .desulfitobacteriumdehalogenans import DesulfitobacteriumDehalogenans
-from .haloferacalesarchaeondl31 import HaloferacalesArchaeonDl31
-from .herbaspirillumseropedicae import HerbaspirillumSeropedicae
-from .ketogulonicigeniumvulgare import KetogulonicigeniumVulgare
-from .streptococcusdysgalactiaeequisimilis import StreptococcusDysgalactiaeEquisimilis
-from .brachyspirapilosicoli import BrachyspiraPilosicoli
-from .sphaerochaetacoccoides import SphaerochaetaCoccoides
-from .massiliaconsociata import MassiliaConsociata
-from .hippeamaritima import HippeaMaritima
-from .sulfurospirillumbarnesii import SulfurospirillumBarnesii
-from .haliscomenobacterhydrossis import HaliscomenobacterHydrossis
-from .desulfotomaculumkuznetsovii import DesulfotomaculumKuznetsovii
-from .runellaslithyformis import RunellaSlithyformis
-from .leuconostockimchii import LeuconostocKimchii
-from .bifidobacteriumstellenboschense import BifidobacteriumStellenboschense
-from .achromobacterxylosoxidansa8 import AchromobacterXylosoxidansA8
-from .leuconostocgasicomitatum import LeuconostocGasicomitatum
-from .pedobactersaltans import PedobacterSaltans
-from .rothiadentocariosa import RothiaDentocariosa
-from .coprobacillussp291 import CoprobacillusSp291
-from .parasutterellaexcrementihominis import ParasutterellaExcrementihominis
-from .paraprevotellaclara import ParaprevotellaClara
-from .paraprevotellaxylaniphila import ParaprevotellaXylaniphila
-from .succinatimonashippei import SuccinatimonasHippei
-from .bacteroidesclarus import BacteroidesClarus
-from .bacteroidesfluxus import BacteroidesFluxus
-from .streptococcusurinalis228597 import StreptococcusUrinalis228597
-from .streptococcusmacacae import StreptococcusMacacae
-from .streptococcusictaluri import StreptococcusIctaluri
-from .propionibacteriumacneshl037pa2 import PropionibacteriumAcnesHl037pa2
-from .desulfurococcusmucosus import DesulfurococcusMucosus
-from .oscillochloristrichoides import OscillochlorisTrichoides
-from .mesorhizobiumciceribiovar import MesorhizobiumCiceriBiovar
-from .bdellovibriobacteriovorusw import BdellovibrioBacteriovorusW
-from .marichromatiumpurpuratum import MarichromatiumPurpuratum
-from .thiocystisviolascens import ThiocystisViolascens
-from .thioflavicoccusmobilis import ThioflavicoccusMobilis
-from .thiorhodococcusdrewsii import ThiorhodococcusDrewsii
-from .thiorhodospirasibirica import ThiorhodospiraSibirica
-from .parachlamydiaacanthamoebae import ParachlamydiaAcanthamoebae
-from .corynebacteriumspgd7 import CorynebacteriumSpGd7
-from .propionibacteriumpropionicum import PropionibacteriumPropionicum
-from .prevotelladenticola import PrevotellaDenticola
-from .frateuriaaurantia import FrateuriaAurantia
-from .desulfotomaculumgibsoniae import DesulfotomaculumGibsoniae
-from .halomonaselongata import HalomonasElongata
-from .enterococcushirae import EnterococcusHirae
-from .calditerrivibrionitroreducens import CalditerrivibrioNitroreducens
-from .thiocapsamarina import ThiocapsaMarina
-from .desulfurococcusfermentans import DesulfurococcusFermentans
-from .thermoproteustenax import ThermoproteusTenax
-from .desulfosporosinusmeridiei import DesulfosporosinusMeridiei
-from .desulfosporosinusorientis import DesulfosporosinusOrientis
-from .desulfosporosinusyoungiae import DesulfosporosinusYoungiae
-from .streptococcusmitis2f0392 import StreptococcusMitis2F0392
-from .fervidobacteriumpennivorans import FervidobacteriumPennivorans
-from .clostridiumspmaddingley import ClostridiumSpMaddingley
-from .opitutaceaebacteriumtav5 import OpitutaceaeBacteriumTav5
-from .thermodesulfobacteriumgeofontis import ThermodesulfobacteriumGeofontis
-from .corynebacteriumspjcb import CorynebacteriumSpJcb
-from .halalkalicoccusjeotgali import HalalkalicoccusJeotgali
-from .cupriavidusspamp6 import CupriavidusSpAmp6
-from .bacillusmethanolicusmga3 import BacillusMethanolicusMga3
-from .vibriocaribbeanicus import VibrioCaribbeanicus
-from .peptostreptococcaceaebacteriumcm5 import PeptostreptococcaceaeBacteriumCm5
-from .stomatobaculumlongum import StomatobaculumLongum
-from .oribacteriumparvum import OribacteriumParvum
-from .halosimplexcarlsbadense import HalosimplexCarlsbadense
-from .haladaptatuspaucihalophilus import HaladaptatusPaucihalophilus
-from .halopigerxanaduensis import HalopigerXanaduensis
-from .halostagnicolalarsenii import HalostagnicolaLarsenii
-from .halovivaxruber import HalovivaxRuber
-from .natrinemapellirubrum import NatrinemaPellirubrum
-from .natronobacteriumgregoryi import NatronobacteriumGregoryi
-from .lactobacillusparafarraginis import LactobacillusParafarraginis
-from .spiroplasmamirum import SpiroplasmaMirum
-from .micavibrioaeruginosavorusarl13 import MicavibrioAeruginosavorusArl13
-from .methylomonasmethanica import MethylomonasMethanica
-from .scardoviawiggsiae import ScardoviaWiggsiae
-from .caloramatoraustralicus import CaloramatorAustralicus
-from .moraxellacatarrhalis import MoraxellaCatarrhalis
-from .thermoanaerobacteriumxylanolyticum import ThermoanaerobacteriumXylanolyticum
-from .corynebacteriumvariabile import CorynebacteriumVariabile
-from .mycoplasmahaemofelis import MycoplasmaHaemofelis
-from .alphaproteobacteriumhimb5 import AlphaProteobacteriumHimb5
-from .ralstoniasolanacearumpsi07 import RalstoniaSolanacearumPsi07
-from .capnocytophagacanimorsus import CapnocytophagaCanimorsus
-from .cupriavidusspbis7 import CupriavidusSpBis7
-from .gemmatimonadetesbacteriumkbs708 import GemmatimonadetesBacteriumKbs708
-from .arthrobacterarilaitensis import ArthrobacterArilaitensis
-from .anaeroglobusgeminatus import AnaeroglobusGeminatus
-from .curtobacteriumsps6 import CurtobacteriumSpS6
-from .lachnospiraceaebacteriumf0431 import LachnospiraceaeBacteriumF0431
-from .commensalibacterspmx01 import CommensalibacterSpMx01
-from .hoefleasp108 import HoefleaSp108
-from .pediococcusacidilacticidsm20284 import PediococcusAcidilacticiDsm20284
-from .prevotellamarshii import PrevotellaMarshii
-from .peptoniphilusduerdenii import PeptoniphilusDuerdenii
-from .corynebacteriumspatcc6931 import CorynebacteriumSpAtcc6931
-from .bacteriovoraxmarinus import BacteriovoraxMarinus
-from .haemophilusparainfluenzae import HaemophilusParainfluenzae
-from .streptococcusintermedius import StreptococcusIntermedius
-from .streptococcusconstellatuspharyngisc1050 import StreptococcusConstellatusPharyngisC1050
-from .streptococcusanginosusc1051 import StreptococcusAnginosusC1051
-from .streptococcusanginosusc238 import StreptococcusAnginosusC238
-from .corynebacteriumnuruki import CorynebacteriumNuruki
-from .xanthomonashortorum import XanthomonasHortorum
-from .burkholderialesbacteriumjoshi001 import BurkholderialesBacteriumJoshi001
-from .microvirgalotononidis import MicrovirgaLotononidis
-from .herbaspirillumfrisingense import HerbaspirillumFrisingense
-from .cyanobiumspcaciam14 import CyanobiumSpCaciam14
-from .parascardoviadenticolensdsm10105 import ParascardoviaDenticolensDsm10105
-from .eubacteriumyurii import EubacteriumYurii
-from .streptococcusmitisatcc6249 import StreptococcusMitisAtcc6249
-from .corynebacteriumspkpl1859 import CorynebacteriumSpKpl1859
-from .oscillatorialescyanobacterium import OscillatorialesCyanobacterium
-from .clostridiumultunense import ClostridiumUltunense
-from .gillisialimnaea import GillisiaLimnaea
-from .weeksellavirosa import WeeksellaVirosa
-from .belliellabaltica import BelliellaBaltica
-from .schizosaccharomycescryophilus import SchizosaccharomycesCryophilus
-from .prevotelladisiensfb03509an import PrevotellaDisiensFb03509an
-from .atopobiumvaginaepb189t14 import AtopobiumVaginaePb189t14
-from .aerococcusurinae import AerococcusUrinae
-from .veillonellaatypicaacs049vsch6 import VeillonellaAtypicaAcs049vsch6
-from .halobacillushalophilus import HalobacillusHalophilus
-from .cyanobiumsppcc7001 import CyanobiumSpPcc7001
-from .cellulophagalytica import CellulophagaLytica
-from .ornithobacteriumrhinotracheale import OrnithobacteriumRhinotracheale
-from .thermaerobactersubterraneus import ThermaerobacterSubterraneus
-from .methanobacteriumpaludis import MethanobacteriumPaludis
-from .desulfotomaculumcarboxydivorans import DesulfotomaculumCarboxydivorans
-from .desulfurobacteriumthermolithotrophum import DesulfurobacteriumThermolithotrophum
-from .treponemasuccinifaciens import TreponemaSuccinifaciens
-from .marinithermushydrothermalis import MarinithermusHydrothermalis
-from .cytophagafermentans import CytophagaFermentans
-from .thiothrixnivea import ThiothrixNivea
-from .vibrioscophthalmi import VibrioScophthalmi
-from .acinetobactercalcoaceticus import AcinetobacterCalcoaceticus
-from .desulfitobacteriumdichloroeliminans import DesulfitobacteriumDichloroeliminans
-from .desulfitobacteriummetallireducens import DesulfitobacteriumMetallireducens
-from .streptococcusparauberisncfd2020 import StreptococcusParauberisNcfd2020
-from .streptococcusporcinus import StreptococcusPorcinus
-from .streptococcuscriceti import StreptococcusCriceti
-from .prevotellabuccaeatcc33574 import PrevotellaBuccaeAtcc33574
-from .capnocytophagaochraceaf0287 import CapnocytophagaOchraceaF0287
-from .prevotellaoralisatcc33269 import PrevotellaOralisAtcc33269
-from .corynebacteriumspkpl1860 import CorynebacteriumSpKpl1860
-from .peptoniphilusrhinitidis import PeptoniphilusRhinitidis
-from .gammaproteobacteriabacteriumimcc3088 import GammaproteobacteriaBacteriumImcc3088
-from .methyloferulastellata import MethyloferulaStellata
-from .cyanothecespatcc51142 import CyanotheceSpAtcc51142
-from .clostridialesbacteriumnk3b98 import ClostridialesBacteriumNk3b98
-from .erysipelotrichaceaebacteriumnk3d112 import ErysipelotrichaceaeBacteriumNk3d112
-from .treponemabryantii import TreponemaBryantii
-from .lachnospiraceaebacteriumnk4a136 import LachnospiraceaeBacteriumNk4a136
-from .lachnospiraceaebacteriumnk4a144 import LachnospiraceaeBacteriumNk4a144
-from .lachnospiraceaebacteriumnk4a179 import LachnospiraceaeBacteriumNk4a179
-from .methanobacteriumlacus import MethanobacteriumLacus
-from .desulfobacterpostgatei import DesulfobacterPostgatei
-from .porphyromonasasaccharolytica import PorphyromonasAsaccharolytica
-from .anaerococcusprevotiiacs065vcol13 import AnaerococcusPrevotiiAcs065vcol13
-from .corynebacteriumspkpl1989 import CorynebacteriumSpKpl1989
-from .cyanothecespccy0110 import CyanotheceSpCcy0110
-from .knoelliaflava import KnoelliaFlava
-from .cyclobacteriummarinum import CyclobacteriumMarinum
-from .flexibacterlitoralis import FlexibacterLitoralis
-from .desulfobaccaacetoxidans import DesulfobaccaAcetoxidans
-from .caldithrixabyssi import CaldithrixAbyssi
-from .barnesiellaviscericola import BarnesiellaViscericola
-from .mycoplasmaleachii import MycoplasmaLeachii
-from .rikenellamicrofusus import RikenellaMicrofusus
-from .listeriaivanoviipam55 import ListeriaIvanoviiPam55
-from .saccharomonosporacyanea import SaccharomonosporaCyanea
-from .saccharomonosporamarina import SaccharomonosporaMarina
-from .saccharomonosporaxinjiangensis import SaccharomonosporaXinjiangensis
-from .burkholderiarhizoxinica import BurkholderiaRhizoxinica
-from .actinobaculummassiliae import ActinobaculumMassiliae
-from .actinobaculumschaalii import ActinobaculumSchaalii
-from .actinomyceseuropaeus import ActinomycesEuropaeus
-from .actinomycesturicensis import ActinomycesTuricensis
-from .afipiabroomeae import AfipiaBroomeae
-from .afipiafelis import AfipiaFelis
-from .alloiococcusotitis import AlloiococcusOtitis
-from .bergeyellazoohelcum import BergeyellaZoohelcum
-from .dolosigranulumpigrum import DolosigranulumPigrum
-from .eubacteriuminfirmum import EubacteriumInfirmum
-from .facklamiahominis import FacklamiaHominis
-from .facklamiaignava import FacklamiaIgnava
-from .facklamialanguida import FacklamiaLanguida
-from .helcococcuskunzii import HelcococcusKunzii
-from .massiliatimonae import MassiliaTimonae
-from .veillonellaratti import VeillonellaRatti
-from .prevotellamicans import PrevotellaMicans
-from .streptococcusurinalisfb127cna2 import StreptococcusUrinalisFb127cna2
-from .turicellaotitidis import TuricellaOtitidis
-from .jonquetellaanthropidsm22815 import JonquetellaAnthropiDsm22815
-from .fukomysdamarensis import FukomysDamarensis
-from .singulisphaeraacidiphila import SingulisphaeraAcidiphila
-from .muricaudaruestringensis import MuricaudaRuestringensis
-from .anaerophagathermohalophila import AnaerophagaThermohalophila
-from .paenibacilluspolymyxasc2 import PaenibacillusPolymyxaSc2
-from .hylemonellagracilisatcc19624 import HylemonellaGracilisAtcc19624
-from .lachnoanaerobaculumsaburreumdsm3986 import LachnoanaerobaculumSaburreumDsm3986
-from .kingellakingae import KingellaKingae
-from .lautropiamirabilis import LautropiaMirabilis
-from .pseudoramibacteralactolyticus import PseudoramibacterAlactolyticus
-from .streptococcusparasanguinisatcc903 import StreptococcusParasanguinisAtcc903
-from .streptococcusoralisatcc49296 import StreptococcusOralisAtcc49296
-from .actinomycescardiffensis import ActinomycesCardiffensis
-from .cyanothecesppcc7424 import CyanotheceSpPcc7424
-from .leptotrichiawadei import LeptotrichiaWadei
-from .corynebacteriumspkpl2004 import CorynebacteriumSpKpl2004
-from .cyanothecesppcc7425 import CyanotheceSpPcc7425
-from .centipedaperiodontii import CentipedaPeriodontii
-from .dialistermicraerophilus import DialisterMicraerophilus
-from .enterococcusitalicus import EnterococcusItalicus
-from .actinomycesneuiibvs029a5 import ActinomycesNeuiiBvs029a5
-from .eubacteriumsulci import EubacteriumSulci
-from .prevotellamultiformis import PrevotellaMultiformis
-from .streptococcusperoris import StreptococcusPeroris
-from .streptococcussanguinissk49 import StreptococcusSanguinisSk49
-from .streptococcussanguinissk355 import StreptococcusSanguinisSk355
-from .streptococcussanguinissk1057 import StreptococcusSanguinisSk1057
-from .prevotellasalivae import PrevotellaSalivae
-from .streptococcusaustralis import StreptococcusAustralis
-from .streptococcuscristatus import StreptococcusCristatus
-from .streptococcusinfantisatcc700779 import StreptococcusInfantisAtcc700779
-from .spirochaetaafricana import SpirochaetaAfricana
-from .lactobacillusacidophilus30sc import LactobacillusAcidophilus30sc
-from .anaerobaculummobile import AnaerobaculumMobile
-from .plautiastali import PlautiaStali
-from .moranellaendobia import MoranellaEndobia
-from .eubacteriumlimosum import EubacteriumLimosum
-from .holophagafoetida import HolophagaFoetida
-from .gardnerellavaginalis101 import GardnerellaVaginalis101
-from .streptococcusdownei import StreptococcusDownei
-from .cyanobacteriumsppcc7702 import CyanobacteriumSpPcc7702
-from .kurthiaspjc8e import KurthiaSpJc8e
-from .streptococcusvestibularis import StreptococcusVestibularis
-from .staphylococcuspettenkoferi import StaphylococcusPettenkoferi
-from .nonlabensulvanivorans import NonlabensUlvanivorans
-from .treponemabrennaborense import TreponemaBrennaborense
-from .helicobacterpylorisouthafrica7 import HelicobacterPyloriSouthafrica7
-from .leuconostocfallax import LeuconostocFallax
-from .treponemasaccharophilum import TreponemaSaccharophilum
-from .eremococcuscoleocolaacs139vcol8 import EremococcusColeocolaAcs139vcol8
-from .peptoniphilusharei import PeptoniphilusHarei
-from .lactobacillusorispb013t23 import LactobacillusOrisPb013t23
-from .deinococcussprl import DeinococcusSpRl
-from .desulfosarcinaspbus5 import DesulfosarcinaSpBus5
-from .prevotelladentalis import PrevotellaDentalis
-from .desulfobaculaspts import DesulfobaculaSpTs
-from .syntrophorhabdusaromaticivorans import SyntrophorhabdusAromaticivorans
-from .alphaproteobacteriumsar116 import AlphaproteobacteriumSar116
-from .streptococcuspseudoporcinus import StreptococcusPseudoporcinus
-from .dialistermicroaerophilus import DialisterMicroaerophilus
-from .ewingellaamericana import EwingellaAmericana
-from .leclerciaadecarboxylata import LeclerciaAdecarboxylata
-from .desulfosporosinusspot import DesulfosporosinusSpOt
-from .weissellacibaria import WeissellaCibaria
-from .desulfovibriosp31syn3 import DesulfovibrioSp31syn3
-from .lysobacterarseniciresistens import LysobacterArseniciresistens
-from .lactobacilluscoryniformiskctc3167 import LactobacillusCoryniformisKctc3167
-from .deinococcussp2009 import DeinococcusSp2009
-from .desmosporasp8437 import DesmosporaSp8437
-from .xanthomonasvesicatoria import XanthomonasVesicatoria
-from .adhaeribacteraquaticus import AdhaeribacterAquaticus
-from .caldilineaaerophila import CaldilineaAerophila
-from .capnocytophagacynodegmi import CapnocytophagaCynodegmi
-from .deinococcuspimensis import DeinococcusPimensis
-from .echinicolavietnamensis import EchinicolaVietnamensis
-from .joostellamarina import JoostellaMarina
-from .meiothermuschliarophilus import MeiothermusChliarophilus
-from .oreniamarismortui import OreniaMarismortui
-from .owenweeksiahongkongensis import OwenweeksiaHongkongensis
-from .promicromonosporakroppenstedtii import PromicromonosporaKroppenstedtii
-from .terriglobusroseus import TerriglobusRoseus
-from .thermanaerovibriovelox import ThermanaerovibrioVelox
-from .anaerolineathermophila import AnaerolineaThermophila
-from .haloplanusnatans import HaloplanusNatans
-from .halonatronumsaccharophilum import HalonatronumSaccharophilum
-from .alkaliflexusimshenetskii import AlkaliflexusImshenetskii
-from .streptococcusoralisuo5 import StreptococcusOralisUo5
-from .desulfonauticusspa7a import DesulfonauticusSpA7a
-from .leuconostocgelidumkctc3527 import LeuconostocGelidumKctc3527
-from .selenomonasruminantiumlactilytica import SelenomonasRuminantiumLactilytica
-from .desulfovibriospu5l import DesulfovibrioSpU5l
-from .saccharomonosporaglauca import SaccharomonosporaGlauca
-from .clostridiumbotulinumbkt015925 import ClostridiumBotulinumBkt015925
-from .solitaleacanadensis import SolitaleaCanadensis
-from .sulfurimonasgotlandica import SulfurimonasGotlandica
-from .emticiciaoligotrophica import EmticiciaOligotrophica
-from .flectobacillusmajor import FlectobacillusMajor
-from .myroidesodoratus import MyroidesOdoratus
-from .patulibacterminatonensis import PatulibacterMinatonensis
-from .niabellasoli import NiabellaSoli
-from .bartonellasenegalensis import BartonellaSenegalensis
-from .pseudomonasbrassicacearum import PseudomonasBrassicacearum
-from .alcanivoraxdieselolei import AlcanivoraxDieselolei
-from .arthrobacterphenanthrenivorans import ArthrobacterPhenanthrenivorans
-from .sulfolobusislandicus import SulfolobusIslandicus
-from .fructobacillusfructosus import FructobacillusFructosus
-from .clostridiumsaccharoperbutylacetonicum import ClostridiumSaccharoperbutylacetonicum
-from .halococcusmorrhuae import HalococcusMorrhuae
-from .acetobacteriumwoodii import AcetobacteriumWoodii
-from .mycobacteriumrhodesiaejs60 import MycobacteriumRhodesiaeJs60
-from .desulfovibriospx2 import DesulfovibrioSpX2
-from .pantoeaananatisaj13355 import PantoeaAnanatisAj13355
-from .thermocrinisruber import ThermocrinisRuber
-from .planococcusdonghaensis import PlanococcusDonghaensis
-from .desulfuromonassptf import DesulfuromonasSpTf
-from .acidianushospitalis import AcidianusHospitalis
-from .devosiasp172e8 import DevosiaSp172e8
-from .mesorhizobiumlotir88b import MesorhizobiumLotiR88b
-from .sinorhizobiumarboris import SinorhizobiumArboris
-from .paracoccuspantotrophus import ParacoccusPantotrophus
-from .pseudoxanthomonassuwonensisj43 import PseudoxanthomonasSuwonensisJ43
-from .deinococcusspyim77859 import DeinococcusSpYim77859
-from .dickeyaspdw0440 import DickeyaSpDw0440
-from .cellulosimicrobiumcellulans import CellulosimicrobiumCellulans
-from .cyanothecesppcc7822 import CyanotheceSpPcc7822
-from .cyanothecesppcc8801 import CyanotheceSpPcc8801
-from .dehalobacterspcf import DehalobacterSpCf
-from .dermabactersphfh0086 import DermabacterSpHfh0086
-from .dickeyaspncppb569 import DickeyaSpNcppb569
-from .caldanaerobiuspolysaccharolyticus import CaldanaerobiusPolysaccharolyticus
-from .rhizopusdelemar import RhizopusDelemar
-from .rhizobiumleguminosarum248 import RhizobiumLeguminosarum248
-from .lactobacillusfarciminis import LactobacillusFarciminis
-from .streptococcusparauberiskctc11537 import StreptococcusParauberisKctc11537
-from .helicobacterfelis import HelicobacterFelis
-from .defluviimonassp20v17 import DefluviimonasSp20v17
-from .dehalobacterspfth1 import DehalobacterSpFth1
-from .dermacoccusspellin185 import DermacoccusSpEllin185
-from .desulfosporosinussphmp52 import DesulfosporosinusSpHmp52
-from .desulfovibriosp6146afaa import DesulfovibrioSp6146afaa
-from .desulfovibriospfw1012b import DesulfovibrioSpFw1012b
-from .desulfovibriospl21syrab import DesulfovibrioSpL21syrab
-from .dietziaspucdthp import DietziaSpUcdthp
-from .dongiaspurhe0060 import DongiaSpUrhe0060
-from .taylorellaequigenitalis import TaylorellaEquigenitalis
-from .deinococcusperaridilitoris import DeinococcusPeraridilitoris
-from .clostridialesbacterium9400853 import ClostridialesBacterium9400853
-from .clostridialesbacterium9401234 import ClostridialesBacterium9401234
-from .clostridialesbacterium9403326 import ClostridialesBacterium9403326
-from .ectothiorhodospiraspphs1 import EctothiorhodospiraSpPhs1
-from .bacteroidetesbacteriumscgcaaa027n21 import BacteroidetesBacteriumScgcAaa027n21
-from .acetobacterpasteurianus3p3 import AcetobacterPasteurianus3p3
-from .enterobactersp638 import EnterobacterSp638
-from .bacilluscoagulans26 import BacillusCoagulans26
-from .lactobacillusfructivorans import LactobacillusFructivorans
-from .thermobrachiumcelere import ThermobrachiumCelere
-from .eggerthellaspyy7918 import EggerthellaSpYy7918
-from .hippeajasoniae import HippeaJasoniae
-from .hippeaalviniae import HippeaAlviniae
-from .myxococcussp import MyxococcusSp
-from .arcobacterbutzleried1 import ArcobacterButzleriEd1
-from .dokdoniasp4h375 import DokdoniaSp4h375
-from .enterobacterspr4368 import EnterobacterSpR4368
-from .lactobacillusorisf0423 import LactobacillusOrisF0423
-from .dokdoniaspmed134 import DokdoniaSpMed134
-from .epilithonimonasspfh1 import EpilithonimonasSpFh1
-from .tetragenococcushalophilus import TetragenococcusHalophilus
-from .vibriobrasiliensis import VibrioBrasiliensis
-from .vibriosinaloensis import VibrioSinaloensis
-from .corynebacteriumulcerans import CorynebacteriumUlcerans
-from .ignavibacteriumalbum import IgnavibacteriumAlbum
-from .imtechellahalotolerans import ImtechellaHalotolerans
-from .oceanobacillusmassiliensis import OceanobacillusMassiliensis
-from .salpingoecarosetta import SalpingoecaRosetta
-from .symbiobactermobilis import SymbiobacterMobilis
-from .burkholderiadilworthii import BurkholderiaDilworthii
-from .avibacteriumparagallinarum72 import AvibacteriumParagallinarum72
-from .streptomycesvenezuelae import StreptomycesVenezuelae
-from .cupriavidustaiwanensis import CupriavidusTaiwanensis
-from .microbacteriumtestaceum import MicrobacteriumTestaceum
-from .flavobacteriaceaebacteriumhqm9 import FlavobacteriaceaeBacteriumHqm9
-from .morusnotabilis import MorusNotabilis
-from .ensiferspbr816 import EnsiferSpBr816
-from .acinetobacterlwoffiinctc5866 import AcinetobacterLwoffiiNctc5866
-from .acinetobacterursingii import AcinetobacterUrsingii
-from .streptacidiphilusrugosus import StreptacidiphilusRugosus
-from .ornithinibacillusscapharcae import OrnithinibacillusScapharcae
-from .ruegeriaconchae import RuegeriaConchae
-from .campylobacterfetusvenerealis import CampylobacterFetusVenerealis
-from .desulfurobacteriumsptc51 import DesulfurobacteriumSpTc51
-from .dokdoniasppro95 import DokdoniaSpPro95
-from .pantoeaspa4 import PantoeaSpA4
-from .rubrivivaxgelatinosus import RubrivivaxGelatinosus
-from .novosphingobiumnitrogenifigens import NovosphingobiumNitrogenifigens
-from .saprospiragrandis import SaprospiraGrandis
-from .staphylococcuspseudintermedius import StaphylococcusPseudintermedius
-from .heterobasidionirregulare import HeterobasidionIrregulare
-from .vulcanisaetamoutnovskia import VulcanisaetaMoutnovskia
-from .ruegeriahalocynthiae import RuegeriaHalocynthiae
-from .erythrobacterspjl475 import ErythrobacterSpJl475
-from .paenibacillusterrae import PaenibacillusTerrae
-from .staphylococcusagnetis import StaphylococcusAgnetis
-from .odyssellathessalonicensis import OdyssellaThessalonicensis
-from .caldalkalibacillusthermarum import CaldalkalibacillusThermarum
-from .rubrivivaxbenzoatilyticus import RubrivivaxBenzoatilyticus
-from .erythrobacterspnap1 import ErythrobacterSpNap1
-from .rhizobiumgrahamii import RhizobiumGrahamii
-from .polymorphumgilvum import PolymorphumGilvum
-from .riemerellaanatipestifer import RiemerellaAnatipestifer
-from .saccharopolysporaspinosa import SaccharopolysporaSpinosa
-from .youngiibacterfragilis import YoungiibacterFragilis
-from .streptococcussuisr61 import StreptococcusSuisR61
-from .streptomycesgriseoaurantiacus import StreptomycesGriseoaurantiacus
-from .bacillusmethanolicuspb1 import BacillusMethanolicusPb1
-from .erythrobacterspsd21 import ErythrobacterSpSd21
-from .peptoniphilusindolicus import PeptoniphilusIndolicus
-from .prevotellanigrescens import PrevotellaNigrescens
-from .prevotellapallens import PrevotellaPallens
-from .ensiferspwsm1721 import EnsiferSpWsm1721
-from .streptococcusinfantisx import StreptococcusInfantisX
-from .bacteroidesnordii import BacteroidesNordii
-from .aeromonasveronii import AeromonasVeronii
-from .leucothrixmucor import LeucothrixMucor
-from .escherichiasptw09308 import EscherichiaSpTw09308
-from .clostridiumcolicanis import ClostridiumColicanis
-from .clostridiuminnocuum import ClostridiumInnocuum
-from .eggerthiacatenaformis import EggerthiaCatenaformis
-from .parabacteroidesjohnsonii import ParabacteroidesJohnsonii
-from .eubacteriumsp142 import EubacteriumSp142
-from .gordoniasputi import GordoniaSputi
-from .fischerellasppcc9605 import FischerellaSpPcc9605
-from .burkholderiagladioli import BurkholderiaGladioli
-from .leisingeradaeponensis import LeisingeraDaeponensis
-from .leisingeracaerulea import LeisingeraCaerulea
-from .pseudophaeobacterarcticus import PseudophaeobacterArcticus
-from .leisingeraaquimarina import LeisingeraAquimarina
-from .thermoproteusuzoniensis import ThermoproteusUzoniensis
-from .methyloversatilisuniversalisfam5 import MethyloversatilisUniversalisFam5
-from .falsirhodobacterspalg1 import FalsirhodobacterSpAlg1
-from .streptococcusanginosussk52 import StreptococcusAnginosusSk52
-from .streptococcusmitis2sk95 import StreptococcusMitis2Sk95
-from .cryobacteriumroopkundense import CryobacteriumRoopkundense
-from .photobacteriumleiognathimandapamensis import PhotobacteriumLeiognathiMandapamensis
-from .pseudomonasmendocinank01 import PseudomonasMendocinaNk01
-from .exiguobacteriumspab2 import ExiguobacteriumSpAb2
-from .flavobacteriumsp83 import FlavobacteriumSp83
-from .prevotellastercorea import PrevotellaStercorea
-from .ferriphaselusspr1 import FerriphaselusSpR1
-from .helicobacterbizzozeronii import HelicobacterBizzozeronii
-from .solibacillussilvestris import SolibacillusSilvestris
-from .streptomycescattleya import StreptomycesCattleya
-from .achromobacterinsuavis import AchromobacterInsuavis
-from .fischerellasppcc9339 import FischerellaSpPcc9339
-from .alteromonasmacleodiiblack import AlteromonasMacleodiiBlack
-from .collimonasfungivorans import CollimonasFungivorans
-from .buchneraaphidicolaua import BuchneraAphidicolaUa
-from .gallibacteriumanatis import GallibacteriumAnatis
-from .buchneraaphidicolaak import BuchneraAphidicolaAk
-from .pseudomonasputidacsv86 import PseudomonasPutidaCsv86
-from .streptococcusoralissk255 import StreptococcusOralisSk255
-from .streptococcusinfantissk1076 import StreptococcusInfantisSk1076
-from .ogataeaparapolymorpha import OgataeaParapolymorpha
-from .trabulsiellaguamensis import TrabulsiellaGuamensis
-from .tatumellaptyseos import TatumellaPtyseos
-from .leminorellagrimontii import LeminorellaGrimontii
-from .kluyveraascorbata import KluyveraAscorbata
-from .buttiauxellaagrestis import ButtiauxellaAgrestis
-from .metallosphaeracuprina import MetallosphaeraCuprina
-from .mycoplasmagallisepticums6 import MycoplasmaGallisepticumS6
-from .oscillibacterruminantium import OscillibacterRuminantium
-from .paenibacilluselgii import PaenibacillusElgii
-from .exiguobacteriumspat1b import ExiguobacteriumSpAt1b
-from .flavobacteriumspcf136 import FlavobacteriumSpCf136
-from .streptococcusmitissk1080 import StreptococcusMitisSk1080
-from .myroidesinjenensis import MyroidesInjenensis
-from .taylorellaasinigenitalis import TaylorellaAsinigenitalis
-from .acetonemalongum import AcetonemaLongum
-from .buchneraaphidicolag002 import BuchneraAphidicolaG002
-from .methylophagaaminisulfidivorans import MethylophagaAminisulfidivorans
-from .nannospalaxgalili import NannospalaxGalili
-from .endozoicomonasmontiporae import EndozoicomonasMontiporae
-from .sporosarcinanewyorkensis import SporosarcinaNewyorkensis
-from .gordoniaalkanivorans import GordoniaAlkanivorans
-from .listeriamonocytogenesscott import ListeriaMonocytogenesScott
-from .enterobacteraerogenes import EnterobacterAerogenes
-from .neorhizobiumgalegaeorientalis import NeorhizobiumGalegaeOrientalis
-from .neorhizobiumgalegaeofficinalis import NeorhizobiumGalegaeOfficinalis
-from .haemophilushaemolyticusm19501 import HaemophilusHaemolyticusM19501
-from .haemophilushaemolyticusm21621 import HaemophilusHaemolyticusM21621
-from .haemophilushaemolyticusm21639 import HaemophilusHaemolyticusM21639
-from .eubacteriumspab3007 import EubacteriumSpAb3007
-from .fischerellasppcc9431 import FischerellaSpPcc9431
-from .kocuriarhizophilap74 import KocuriaRhizophilaP74
-from .exiguobacteriumspmh3 import ExiguobacteriumSpMh3
-from .flavobacteriumspf52 import FlavobacteriumSpF52
-from .ralstoniasolanacearumpo82 import RalstoniaSolanacearumPo82
-from .microlunatusphosphovorus import MicrolunatusPhosphovorus
-from .aeromicrobiummassiliense import AeromicrobiumMassiliense
-from .alistipessenegalensis import AlistipesSenegalensis
-from .anaerococcussenegalensis import AnaerococcusSenegalensis
-from .bacillustimonensis import BacillusTimonensis
-from .brevibacteriumsenegalense import BrevibacteriumSenegalense
-from .clostridiumsenegalense import ClostridiumSenegalense
-from .flavobacteriumspfl import FlavobacteriumSpFl
-from .kurthiamassiliensis import KurthiaMassiliensis
-from .flavobacteriumspkjj import FlavobacteriumSpKjj
-from .paenibacillussenegalensis import PaenibacillusSenegalensis
-from .peptoniphilussenegalensis import PeptoniphilusSenegalensis
-from .salinisphaerashabanensis import SalinisphaeraShabanensis
-from .halorhabdustiamatea import HalorhabdusTiamatea
-from .haloplasmacontractile import HaloplasmaContractile
-from .lactobacilluskefiranofaciens import LactobacillusKefiranofaciens
-from .rhizobiumleguminosarumcb782 import RhizobiumLeguminosarumCb782
-from .senegalimassiliaanaerobia import SenegalimassiliaAnaerobia
-from .bacillusmassiliosenegalensis import BacillusMassiliosenegalensis
-from .flavobacteriumspwg21 import FlavobacteriumSpWg21
-from .flavobacteriumbranchiophilum import FlavobacteriumBranchiophilum
-from .mycoplasmaanatis import MycoplasmaAnatis
-from .staphylococcuslugdunensisn920143 import StaphylococcusLugdunensisN920143
-from .legionellamassiliensis import LegionellaMassiliensis
-from .streptococcusmitissk569 import StreptococcusMitisSk569
-from .streptococcusconstellatuspharyngissk1060 import StreptococcusConstellatusPharyngisSk1060
-from .streptococcusinfantissk970 import StreptococcusInfantisSk970
-from .brevundimonasdiminuta4704 import BrevundimonasDiminuta4704
-from .francisellaspw121067 import FrancisellaSpW121067
-from .corynebacteriumdurum import CorynebacteriumDurum
-from .peptostreptococcusanaerobiusvpi4330 import PeptostreptococcusAnaerobiusVpi4330
-from .francisellasptx077308 import FrancisellaSpTx077308
-from .frankiaspiso899 import FrankiaSpIso899
-from .haemophilussputorum import HaemophilusSputorum
-from .fusobacteriumspf0437 import FusobacteriumSpF0437
-from .bradyrhizobiumjaponicumusda6 import BradyrhizobiumJaponicumUsda6
-from .mycoplasmacolumbinum import MycoplasmaColumbinum
-from .azorhizobiumdoebereinerae import AzorhizobiumDoebereinerae
-from .bradyrhizobiumelkaniiwsm1741 import BradyrhizobiumElkaniiWsm1741
-from .bradyrhizobiumelkaniiwsm2783 import BradyrhizobiumElkaniiWsm2783
-from .bradyrhizobiumjaponicumusda124 import BradyrhizobiumJaponicumUsda124
-from .flavobacteriumspem1308 import FlavobacteriumSpEm1308
-from .frankiaspbcu110501 import FrankiaSpBcu110501
-from .burkholderiamimosarum import BurkholderiaMimosarum
-from .pseudomonasfluorescensq287 import PseudomonasFluorescensQ287
-from .mesorhizobiumloticj3sym import MesorhizobiumLotiCj3sym
-from .mesorhizobiumlotiusda3471 import MesorhizobiumLotiUsda3471
-from .flavobacteriumspacam123 import FlavobacteriumSpAcam123
-from .flavobacteriumspem1321 import FlavobacteriumSpEm1321
-from .frankiaspbmg512 import FrankiaSpBmg512
-from .rhizobiumgallicum import RhizobiumGallicum
-from .rhizobiumgiardinii import RhizobiumGiardinii
-from .rhizobiumleguminosarumgb30 import RhizobiumLeguminosarumGb30
-from .rhizobiumsullae import RhizobiumSullae
-from .rhizobiumleucaenae import RhizobiumLeucaenae
-from .francisellaspfsc1006 import FrancisellaSpFsc1006
-from .frankiaspean1pec import FrankiaSpEan1pec
-from .mycobacteriumcolombiense import MycobacteriumColombiense
-from .wickerhamomycesciferrii import WickerhamomycesCiferrii
-from .flavobacteriumcolumnare import FlavobacteriumColumnare
-from .methanocellaconradii import MethanocellaConradii
-from .geitlerinemasppcc7407 import GeitlerinemaSpPcc7407
-from .brevibacilluslaterosporuslmg15441 import BrevibacillusLaterosporusLmg15441
-from .pseudomonasfluorescenshk44 import PseudomonasFluorescensHk44
-from .gemmataspiil30 import GemmataSpIil30
-from .marinobacteriumstanieri import MarinobacteriumStanieri
-from .flavobacteriaceaebacteriums85 import FlavobacteriaceaeBacteriumS85
-from .microbulbiferagarilyticus import MicrobulbiferAgarilyticus
-from .pseudomonasputidas16 import PseudomonasPutidaS16
-from .gemmatimonasspap64 import GemmatimonasSpAp64
-from .serinicoccusprofundi import SerinicoccusProfundi
-from .lysinimicrobiummangrovi import LysinimicrobiumMangrovi
-from .oenococcuskitaharae import OenococcusKitaharae
-from .geobacillusspg1w1 import GeobacillusSpG1w1
-from .weissellakoreensis import WeissellaKoreensis
-from .pseudoxanthomonasspadix import PseudoxanthomonasSpadix
-from .enterobactercloacaeecwsu1 import EnterobacterCloacaeEcwsu1
-from .brachyspiraintermedia import BrachyspiraIntermedia
-from .acinetobacterlwoffiiwj10621 import AcinetobacterLwoffiiWj10621
-from .bizioniaargentinensis import BizioniaArgentinensis
-from .streptococcussalivarius57i import StreptococcusSalivarius57i
-from .gayadomonasjoobiniege import GayadomonasJoobiniege
-from .marinobacterlipolyticusbf04cf4 import MarinobacterLipolyticusBf04cf4
-from .aminicenantesbacteriumaaa252a02 import AminicenantesBacteriumAaa252a02
-from .zymoseptoriatritici import ZymoseptoriaTritici
-from .sporichthyapolymorpha import SporichthyaPolymorpha
-from .frankiaspeui1c import FrankiaSpEui1c
-from .mycoplasmaiowae import MycoplasmaIowae
-from .alicyclobacillusacidocaldariustc41 import AlicyclobacillusAcidocaldariusTc41
-from .anditaleaandensis import AnditaleaAndensis
-from .endosymbiontoftevnia import EndosymbiontOfTevnia
-from .allobaculumstercoricanis import AllobaculumStercoricanis
-from .actinopolysporamortivallis import ActinopolysporaMortivallis
-from .propionibacteriumacnessk182bjcvi import PropionibacteriumAcnesSk182bjcvi
-from .bacillusmojavensis import BacillusMojavensis
-from .verticilliumalfalfae import VerticilliumAlfalfae
-from .sulfobacillusacidophilus import SulfobacillusAcidophilus
-from .vibriotubiashii import VibrioTubiashii
-from .neisseriaweaveri import NeisseriaWeaveri
-from .paenibacilluspolymyxam1 import PaenibacillusPolymyxaM1
-from .acetobacteraceaebacteriumat5844 import AcetobacteraceaeBacteriumAt5844
-from .thermoplasmatalesarchaeon import ThermoplasmatalesArchaeon
-from .streptococcuspseudopneumoniae import StreptococcusPseudopneumoniae
-from .streptomycespurpureus import StreptomycesPurpureus
-from .geobacillusspjf8 import GeobacillusSpJf8
-from .caldisphaeralagunensis import CaldisphaeraLagunensis
-from .grimontiaindica import GrimontiaIndica
-from .geobacillusspwch70 import GeobacillusSpWch70
-from .teredinibacterturneraet7902 import TeredinibacterTurneraeT7902
-from .geobacterspm18 import GeobacterSpM18
-from .megasphaeraelsdenii import MegasphaeraElsdenii
-from .brachybacteriumparaconglomeratum import BrachybacteriumParaconglomeratum
-from .amycolatopsismethanolica import AmycolatopsisMethanolica
-from .amycolatopsisnigrescens import AmycolatopsisNigrescens
-from .pantoeaspab import PantoeaSpAb
-from .succinispiramobilis import SuccinispiraMobilis
-from .streptococcusinfantarius import StreptococcusInfantarius
-from .lactobacillusruminisatcc27782 import LactobacillusRuminisAtcc27782
-from .glomeribactergigasporarum import GlomeribacterGigasporarum
-from .geomicrobiumspjcm19037 import GeomicrobiumSpJcm19037
-from .pantoeaspat9b import PantoeaSpAt9b
-from .haloarchaeon3a1dgr import Haloarchaeon3a1dgr
-from .tetrapisisporablattae import TetrapisisporaBlattae
-from .lactobacillusbuchnericd034 import LactobacillusBuchneriCd034
-from .burkholderiagrimmiae import BurkholderiaGrimmiae
-from .basileapsittacipulmonis import BasileaPsittacipulmonis
-from .cronobactercondimenti import CronobacterCondimenti
-from .lactobacilluscurvatus import LactobacillusCurvatus
-from .brachybacteriumsquillarum import BrachybacteriumSquillarum
-from .geovibriospl21acebes import GeovibrioSpL21acebes
-from .gordoniaamarae import GordoniaAmarae
-from .glaciecolasp4h37ye5 import GlaciecolaSp4h37ye5
-from .pantoearwandensis import PantoeaRwandensis
-from .dietziaalimentaria import DietziaAlimentaria
-from .bacteroidesfaecis import BacteroidesFaecis
-from .arthrobacterglobiformis import ArthrobacterGlobiformis
-from .gordoniaeffusa import GordoniaEffusa
-from .mycobacteriumthermoresistibile import MycobacteriumThermoresistibile
-from .gallibacteriumgenomosp import GallibacteriumGenomosp
-from .gillisiaspcal575 import GillisiaSpCal575
-from .rhizobiummongolense import RhizobiumMongolense
-from .streptomyceschartreusis import StreptomycesChartreusis
-from .glaciecolasphtcc2999 import GlaciecolaSpHtcc2999
-from .sphingomonaselodea import SphingomonasElodea
-from .gloeocapsasppcc73106 import GloeocapsaSpPcc73106
-from .lonsdaleaquercina import LonsdaleaQuercina
-from .pelagibacteriumhalotolerans import PelagibacteriumHalotolerans
-from .agrobacteriumtumefaciensccnwgs0286 import AgrobacteriumTumefaciensCcnwgs0286
-from .mesorhizobiumamorphae import MesorhizobiumAmorphae
-from .glaciecolanitratireducens import GlaciecolaNitratireducens
-from .flavobacteriumfrigoris import FlavobacteriumFrigoris
-from .exiguobacteriumantarcticum import ExiguobacteriumAntarcticum
-from .paenibacilluspeoriae import PaenibacillusPeoriae
-from .novosphingobiumpentaromativorans import NovosphingobiumPentaromativorans
-from .commensalibacterintestini import CommensalibacterIntestini
-from .gluconobactermorbifer import GluconobacterMorbifer
-from .fangiahongkongensis import FangiaHongkongensis
-from .aggregatibacteractinomycetemcomitansrhaa1 import AggregatibacterActinomycetemcomitansRhaa1
-from .mobilicoccuspelagius import MobilicoccusPelagius
-from .amycolatopsisbenzoatilytica import AmycolatopsisBenzoatilytica
-from .amycolatopsisbalhimycina import AmycolatopsisBalhimycina
-from .actinopolysporahalophila import ActinopolysporaHalophila
-from .rudanellalutea import RudanellaLutea
-from .thermicanusaegyptius import ThermicanusAegyptius
-from .haloglycomycesalbus import HaloglycomycesAlbus
-from .salisaetalonga import SalisaetaLonga
-from .geminicoccusroseus import GeminicoccusRoseus
-from .rhodovibriosalinarum import RhodovibrioSalinarum
-from .thermacetogeniumphaeum import ThermacetogeniumPhaeum
-from .sphingomonasphyllosphaerae52 import SphingomonasPhyllosphaerae52
-from .sphingomonasphyllosphaeraefa2 import SphingomonasPhyllosphaeraeFa2
-from .sphingomonasmelonis import SphingomonasMelonis
-from .xanthomonascampestrismusacearum import XanthomonasCampestrisMusacearum
-from .flavobacteriumindicum import FlavobacteriumIndicum
-from .bartonellaaustralis import BartonellaAustralis
-from .bartonellabovis import BartonellaBovis
-from .bartonellaschoenbuchensis import BartonellaSchoenbuchensis
-from .bartonellavinsoniiberkhoffii import BartonellaVinsoniiBerkhoffii
-from .thermoanaerobacteriumsaccharolyticum import ThermoanaerobacteriumSaccharolyticum
-from .bartonellaalsatica import BartonellaAlsatica
-from .bartonelladoshiae import BartonellaDoshiae
-from .bartonellarattimassiliensis import BartonellaRattimassiliensis
-from .bartonellamelophagi import BartonellaMelophagi
-from .bartonellatamiae import BartonellaTamiae
-from .bartonellataylorii import BartonellaTaylorii
-from .bartonellavinsoniiarupensis import BartonellaVinsoniiArupensis
-from .bartonellawashoensis import BartonellaWashoensis
-from .fluoribacterdumoffii import FluoribacterDumoffii
-from .gloeocapsasppcc7428 import GloeocapsaSpPcc7428
-from .methanolobuspsychrophilus import MethanolobusPsychrophilus
-from .geomicrobiumspjcm19038 import GeomicrobiumSpJcm19038
-from .pantoeaspimh import PantoeaSpImh
-from .streptococcusmitissk579 import StreptococcusMitisSk579
-from .streptococcusoralissk1074 import StreptococcusOralisSk1074
-from .haemophilusparaphrohaemolyticus import HaemophilusParaphrohaemolyticus
-from .fusobacteriumnecrophorumfunduliforme import FusobacteriumNecrophorumFunduliforme
-from .pasteurellabettyae import PasteurellaBettyae
-from .lachnoanaerobaculumsaburreumf0468 import LachnoanaerobaculumSaburreumF0468
-from .gordoniaspktr9 import GordoniaSpKtr9
-from .cellulomonasmassiliensis import CellulomonasMassiliensis
-from .herbaspirillummassiliense import HerbaspirillumMassiliense
-from .peptoniphilustimonensis import PeptoniphilusTimonensis
-from .timonellasenegalensis import TimonellaSenegalensis
-from .geobacterspm21 import GeobacterSpM21
-from .gillisiaspheli29 import GillisiaSpHeli29
-from .pelagibacterubiquehimb083 import PelagibacterUbiqueHimb083
-from .novosphingobiumlindaniclasticum import NovosphingobiumLindaniclasticum
-from .glycomycesspnrrlb16210 import GlycomycesSpNrrlb16210
-from .haemophilusspff7 import HaemophilusSpFf7
-from .halobacillusspbab2008 import HalobacillusSpBab2008
-from .halobacteriumspdl1 import HalobacteriumSpDl1
-from .halomonassp23gom1509m import HalomonasSp23gom1509m
-from .halomonassphl48 import HalomonasSpHl48
-from .halonotiusspj07hn4 import HalonotiusSpJ07hn4
-from .pantoeaspsc1 import PantoeaSpSc1
-from .methylophilaceaebacterium11 import MethylophilaceaeBacterium11
-from .herbaspirillumspcf444 import HerbaspirillumSpCf444
-from .enterococcusfaeciumnrrlb2354 import EnterococcusFaeciumNrrlb2354
-from .halomonassptd01 import HalomonasSpTd01
-from .herbaspirillumspgw103 import HerbaspirillumSpGw103
-from .rickettsiaaustralis import RickettsiaAustralis
-from .paenirhodobacterenshiensis import PaenirhodobacterEnshiensis
-from .flavobacteriumenshiense import FlavobacteriumEnshiense
-from .gordoniarhizosphera import GordoniaRhizosphera
-from .penicilliumrubens import PenicilliumRubens
-from .pseudomonasstutzerisdmlac import PseudomonasStutzeriSdmlac
-from .tistrellamobilis import TistrellaMobilis
-from .nocardiaasteroides import NocardiaAsteroides
-from .halococcussp197a import HalococcusSp197a
-from .halomonasspbjgmmb45 import HalomonasSpBjgmmb45
-from .halomonasspko116 import HalomonasSpKo116
-from .halopigerspiih2 import HalopigerSpIih2
-from .coriobacteriaceaebacteriumbv3ac1 import CoriobacteriaceaeBacteriumBv3ac1
-from .herbaspirillumspyr522 import HerbaspirillumSpYr522
-from .alicyclobacilluspomorum import AlicyclobacillusPomorum
-from .budviciaaquatica import BudviciaAquatica
-from .corynebacteriumsputi import CorynebacteriumSputi
-from .flavobacteriumantarcticum import FlavobacteriumAntarcticum
-from .ignatzschinerialarvae import IgnatzschineriaLarvae
-from .gordoniapolyisoprenivorans import GordoniaPolyisoprenivorans
-from .halothecesppcc7418 import HalotheceSpPcc7418
-from .sphingomonasechinoides import SphingomonasEchinoides
-from .halomonassppbn3 import HalomonasSpPbn3
-from .halopigerspiih3 import HalopigerSpIih3
-from .pseudomonaspsychrotolerans import PseudomonasPsychrotolerans
-from .hoefleaspbal378 import HoefleaSpBal378
-from .natronorubrumtibetense import NatronorubrumTibetense
-from .citrobacterfarmeri import CitrobacterFarmeri
-from .saccharomonosporaazurea import SaccharomonosporaAzurea
-from .sphingobiumbaderi import SphingobiumBaderi
-from .streptococcusparasanguinisfw213 import StreptococcusParasanguinisFw213
-from .pseudomonasfluorescensf113 import PseudomonasFluorescensF113
-from .lactobacillusrossiae import LactobacillusRossiae
-from .escherichiahermannii import EscherichiaHermannii
-from .escherichiavulneris import EscherichiaVulneris
-from .hydrogenobaculumspho import HydrogenobaculumSpHo
-from .actinomycesnaeslundii import ActinomycesNaeslundii
-from .streptococcusmacedonicus import StreptococcusMacedonicus
-from .streptomycesacidiscabies import StreptomycesAcidiscabies
-from .ruegeriaspr11 import RuegeriaSpR11
-from .methyloglobulusmorosus import MethyloglobulusMorosus
-from .paenibacillusalvei import PaenibacillusAlvei
-from .pseudoalteromonascitrea import PseudoalteromonasCitrea
-from .pseudoalteromonashaloplanktisatcc14393 import PseudoalteromonasHaloplanktisAtcc14393
-from .pseudoalteromonasrubra import PseudoalteromonasRubra
-from .pseudoalteromonasspongiae import PseudoalteromonasSpongiae
-from .bacillusbataviensis import BacillusBataviensis
-from .mycoplasmacanis import MycoplasmaCanis
-from .simiduiaagarivorans import SimiduiaAgarivorans
-from .sinorhizobiumfrediihh103 import SinorhizobiumFrediiHh103
-from .pseudomonasextremaustralis import PseudomonasExtremaustralis
-from .brevibacillusmassiliensis import BrevibacillusMassiliensis
-from .hymenobacterspapr13 import HymenobacterSpApr13
-from .peptoniphilusgrossensis import PeptoniphilusGrossensis
-from .hyphomicrobiumspmc1 import HyphomicrobiumSpMc1
-from .kallipygamassiliensis import KallipygaMassiliensis
-from .enormamassiliensis import EnormaMassiliensis
-from .hyphomonassp25b141 import HyphomonasSp25b141
-from .stenotrophomonasmaltophiliapml168 import StenotrophomonasMaltophiliaPml168
-from .mycoplasmahyorhinissk76 import MycoplasmaHyorhinisSk76
-from .haloferulaspbvorr071 import HaloferulaSpBvorr071
-from .halomonasspgfaj1 import HalomonasSpGfaj1
-from .halomonassptg39a import HalomonasSpTg39a
-from .hyphomonasspbhbn044 import HyphomonasSpBhbn044
-from .acaricomesphytoseiuli import AcaricomesPhytoseiuli
-from .acetobacternitrogenifigens import AcetobacterNitrogenifigens
-from .acinetobacterbouvetii import AcinetobacterBouvetii
-from .actinobacilluscapsulatus import ActinobacillusCapsulatus
-from .actinobaculumurinale import ActinobaculumUrinale
-from .actinokineosporaenzanensis import ActinokineosporaEnzanensis
-from .actinomaduraatramentaria import ActinomaduraAtramentaria
-from .actinomycesdentalis import ActinomycesDentalis
-from .actinomycesgeorgiae import ActinomycesGeorgiae
-from .actinomycesisraelii import ActinomycesIsraelii
-from .actinomycesneuiidsm8576 import ActinomycesNeuiiDsm8576
-from .actinomycessuimastitidis import ActinomycesSuimastitidis
-from .actinomycesvaccimaxillae import ActinomycesVaccimaxillae
-from .actinomycetosporachiangmaiensis import ActinomycetosporaChiangmaiensis
-from .actinoplanesglobisporus import ActinoplanesGlobisporus
-from .actinopolymorphaalba import ActinopolymorphaAlba
-from .aequorivitacapsosiphonis import AequorivitaCapsosiphonis
-from .aestuariibactersalexigens import AestuariibacterSalexigens
-from .aestuariimicrobiumkwangyangense import AestuariimicrobiumKwangyangense
-from .afifellapfennigii import AfifellaPfennigii
-from .agrococcuslahaulensis import AgrococcusLahaulensis
-from .agromycesitalicus import AgromycesItalicus
-from .agromycessubbeticus import AgromycesSubbeticus
-from .algicolasagamiensis import AlgicolaSagamiensis
-from .algoriphagusmannitolivorans import AlgoriphagusMannitolivorans
-from .algoriphagusmarincoladsm16067 import AlgoriphagusMarincolaDsm16067
-from .algoriphagusvanfongensis import AlgoriphagusVanfongensis
-from .aliagarivoranstaiwanensis import AliagarivoransTaiwanensis
-from .alicyclobacilluscontaminans import AlicyclobacillusContaminans
-from .alicyclobacillusherbarius import AlicyclobacillusHerbarius
-from .alicyclobacilluspohliae import AlicyclobacillusPohliae
-from .alkanindigesillinoisensis import AlkanindigesIllinoisensis
-from .allofustisseminis import AllofustisSeminis
-from .alloscardoviaomnicolens import AlloscardoviaOmnicolens
-from .alysiellacrassa import AlysiellaCrassa
-from .amorphuscoralli import AmorphusCoralli
-from .anaeroarcusburkinensis import AnaeroarcusBurkinensis
-from .anaerobiospirillumsucciniciproducens import AnaerobiospirillumSucciniciproducens
-from .anaerovoraxodorimutans import AnaerovoraxOdorimutans
-from .andreprevotiachitinilytica import AndreprevotiaChitinilytica
-from .aquaspirillumserpens import AquaspirillumSerpens
-from .aquimarinamuelleri import AquimarinaMuelleri
-from .arenibactercertesii import ArenibacterCertesii
-from .arenibacterlatericius import ArenibacterLatericius
-from .arenimonascomposti import ArenimonasComposti
-from .arenimonasoryziterrae import ArenimonasOryziterrae
-from .arsenicicoccusbolidensis import ArsenicicoccusBolidensis
-from .arthrobactercastelli import ArthrobacterCastelli
-from .arthrobactersanguinis import ArthrobacterSanguinis
-from .asticcacaulisbenevestitus import AsticcacaulisBenevestitus
-from .atopococcustabaci import AtopococcusTabaci
-from .aureimonasureilytica import AureimonasUreilytica
-from .azospirillumhalopraeferens import AzospirillumHalopraeferens
-from .azovibriorestrictus import AzovibrioRestrictus
-from .bacillusaidingensis import BacillusAidingensis
-from .bacilluschagannorensis import BacillusChagannorensis
-from .bacillusfordii import BacillusFordii
-from .bacillusgelatini import BacillusGelatini
-from .bacteroidesbarnesiae import BacteroidesBarnesiae
-from .bacteroidesgraminisolvens import BacteroidesGraminisolvens
-from .bacteroidesmassiliensisb84634 import BacteroidesMassiliensisB84634
-from .bacteroidespyogenesdsm20611 import BacteroidesPyogenesDsm20611
-from .bacteroidessalyersiae import BacteroidesSalyersiae
-from .balneolavulgaris import BalneolaVulgaris
-from .bavariicoccusseileri import BavariicoccusSeileri
-from .belnapiamoabensis import BelnapiaMoabensis
-from .blautiawexlerae import BlautiaWexlerae
-from .brachymonaschironomi import BrachymonasChironomi
-from .brevibacilluslaterosporusdsm25 import BrevibacillusLaterosporusDsm25
-from .brevundimonasaveniformis import BrevundimonasAveniformis
-from .brevundimonasbacteroides import BrevundimonasBacteroides
-from .burkholderianodosa import BurkholderiaNodosa
-from .butyricimonassynergistica import ButyricimonasSynergistica
-from .campylobactercuniculorum import CampylobacterCuniculorum
-from .gemmobacternectariphilus import GemmobacterNectariphilus
-from .catelliglobosisporakoreensis import CatelliglobosisporaKoreensis
-from .chryseobacteriumcaeni import ChryseobacteriumCaeni
-from .chryseobacteriumdaeguense import ChryseobacteriumDaeguense
-from .chryseobacteriumgregarium import ChryseobacteriumGregarium
-from .chryseobacteriumpalustre import ChryseobacteriumPalustre
-from .clostridiisalibacterpaucivorans import ClostridiisalibacterPaucivorans
-from .clostridiumaminophilum import ClostridiumAminophilum
-from .clostridiumlitorale import ClostridiumLitorale
-from .clostridiumsaccharogumia import ClostridiumSaccharogumia
-from .clostridiumsporosphaeroides import ClostridiumSporosphaeroides
-from .clostridiumstercorarium import ClostridiumStercorarium
-from .clostridiumtyrobutyricum import ClostridiumTyrobutyricum
-from .clostridiumviride import ClostridiumViride
-from .cohnellalaeviribosi import CohnellaLaeviribosi
-from .conchiformibiuskuhniae import ConchiformibiusKuhniae
-from .conchiformibiussteedae import ConchiformibiusSteedae
-from .corynebacteriumcallunae import CorynebacteriumCallunae
-from .corynebacteriumcapitovis import CorynebacteriumCapitovis
-from .corynebacteriumcaspium import CorynebacteriumCaspium
-from .corynebacteriumciconiae import CorynebacteriumCiconiae
-from .corynebacteriumfreiburgense import CorynebacteriumFreiburgense
-from .corynebacteriumhalotolerans import CorynebacteriumHalotolerans
-from .corynebacteriumlubricantis import CorynebacteriumLubricantis
-from .corynebacteriummassiliense import CorynebacteriumMassiliense
-from .corynebacteriummastitidis import CorynebacteriumMastitidis
-from .corynebacteriumpilosum import CorynebacteriumPilosum
-from .corynebacteriumpropinquum import CorynebacteriumPropinquum
-from .corynebacteriumulceribovis import CorynebacteriumUlceribovis
-from .gryllotalpicolaginsengisoli import GryllotalpicolaGinsengisoli
-from .cytophagaaurantiaca import CytophagaAurantiaca
-from .dasaniamarina import DasaniaMarina
-from .deinococcusapachensis import DeinococcusApachensis
-from .deinococcusaquatilis import DeinococcusAquatilis
-from .deinococcusfrigens import DeinococcusFrigens
-from .deinococcusmarmoris import DeinococcusMarmoris
-from .deinococcusmisasensis import DeinococcusMisasensis
-from .demetriaterragena import DemetriaTerragena
-from .desulfobactercurvatus import DesulfobacterCurvatus
-from .desulfobulbusjaponicus import DesulfobulbusJaponicus
-from .desulfococcusmultivorans import DesulfococcusMultivorans
-from .desulfocurvusvexinensis import DesulfocurvusVexinensis
-from .desulfonatronovibriohydrogenovorans import DesulfonatronovibrioHydrogenovorans
-from .desulfotomaculumalcoholivorax import DesulfotomaculumAlcoholivorax
-from .desulfotomaculumalkaliphilum import DesulfotomaculumAlkaliphilum
-from .desulfotomaculumhydrothermale import DesulfotomaculumHydrothermale
-from .desulfotomaculumthermocisternum import DesulfotomaculumThermocisternum
-from .desulfovibrioacrylicus import DesulfovibrioAcrylicus
-from .desulfovibrioalcoholivorans import DesulfovibrioAlcoholivorans
-from .desulfovibrioalkalitolerans import DesulfovibrioAlkalitolerans
-from .desulfovibrioaminophilus import DesulfovibrioAminophilus
-from .desulfovibriobastinii import DesulfovibrioBastinii
-from .desulfovibriodesulfuricansdsm642 import DesulfovibrioDesulfuricansDsm642
-from .desulfovibriofrigidus import DesulfovibrioFrigidus
-from .desulfovibriogigas import DesulfovibrioGigas
-from .desulfovibriohydrothermalis import DesulfovibrioHydrothermalis
-from .desulfovibriolongus import DesulfovibrioLongus
-from .desulfovibriooxyclinae import DesulfovibrioOxyclinae
-from .desulfovirgulathermocuniculi import DesulfovirgulaThermocuniculi
-from .desulfurisporathermophila import DesulfurisporaThermophila
-from .donghicolaxiamenensis import DonghicolaXiamenensis
-from .dyadobacteralkalitolerans import DyadobacterAlkalitolerans
-from .echinicolapacifica import EchinicolaPacifica
-from .elioraeatepidiphila import ElioraeaTepidiphila
-from .enterococcuscecorum import EnterococcusCecorum
-from .enterococcuscolumbae import EnterococcusColumbae
-from .enterorhabdusmucosicola import EnterorhabdusMucosicola
-from .epilithonimonastenax import EpilithonimonasTenax
-from .eremococcuscoleocoladsm15696 import EremococcusColeocolaDsm15696
-from .erysipelothrixtonsillarum import ErysipelothrixTonsillarum
-from .eudoraeaadriatica import EudoraeaAdriatica
-from .ferrimicrobiumacidiphilum import FerrimicrobiumAcidiphilum
-from .ferrimonasfuttsuensis import FerrimonasFuttsuensis
-from .flavobacteriumdaejeonense import FlavobacteriumDaejeonense
-from .flavobacteriumfilum import FlavobacteriumFilum
-from .flavobacteriumfrigidarium import FlavobacteriumFrigidarium
-from .flavobacteriumrivuli import FlavobacteriumRivuli
-from .flavobacteriumsasangense import FlavobacteriumSasangense
-from .flavobacteriumsoli import FlavobacteriumSoli
-from .flavobacteriumsubsaxonicum import FlavobacteriumSubsaxonicum
-from .flavobacteriumsuncheonense import FlavobacteriumSuncheonense
-from .flexithrixdorotheae import FlexithrixDorotheae
-from .gelidibactermesophilus import GelidibacterMesophilus
-from .gemellacuniculi import GemellaCuniculi
-from .geopsychrobacterelectrodiphilus import GeopsychrobacterElectrodiphilus
-from .geothrixfermentans import GeothrixFermentans
-from .gilvimarinuschinensis import GilvimarinusChinensis
-from .glaciecolapunicea import GlaciecolaPunicea
-from .glaciibactersuperstes import GlaciibacterSuperstes
-from .glycomycesarizonensis import GlycomycesArizonensis
-from .gordoniahirsuta import GordoniaHirsuta
-from .gordoniashandongensis import GordoniaShandongensis
-from .gracilibacilluslacisalsi import GracilibacillusLacisalsi
-from .gracilimonastropica import GracilimonasTropica
-from .gramellaechinicola import GramellaEchinicola
-from .granulicoccusphenolivorans import GranulicoccusPhenolivorans
-from .gulosibactermolinativorax import GulosibacterMolinativorax
-from .hahellaganghwensis import HahellaGanghwensis
-from .halalkalibacillushalophilus import HalalkalibacillusHalophilus
-from .halieasalexigens import HalieaSalexigens
-from .halobacilluskuroshimensis import HalobacillusKuroshimensis
-from .halomonasanticariensis import HalomonasAnticariensis
-from .halomonashalocynthiae import HalomonasHalocynthiae
-from .halomonaslutea import HalomonasLutea
-from .halorubrumezzemoulense import HalorubrumEzzemoulense
-from .hamadaeatsunoensis import HamadaeaTsunoensis
-from .helcococcussueciensis import HelcococcusSueciensis
-from .helleabalneolensis import HelleaBalneolensis
-from .henriciellamarina import HenriciellaMarina
-from .humibacteralbus import HumibacterAlbus
-from .hymenobacternorwichensis import HymenobacterNorwichensis
-from .jeotgalicoccusmarinus import JeotgalicoccusMarinus
-from .jeotgalicoccuspsychrophilus import JeotgalicoccusPsychrophilus
-from .jonesiaquinghaiensis import JonesiaQuinghaiensis
-from .kaistiagranuli import KaistiaGranuli
-from .kangiellaaquimarina import KangiellaAquimarina
-from .kiloniellalaminariae import KiloniellaLaminariae
-from .kordiimonasgwangyangensis import KordiimonasGwangyangensis
-from .kribbellacatacumbae import KribbellaCatacumbae
-from .kushneriaaurantia import KushneriaAurantia
-from .lacticigeniumnaphtae import LacticigeniumNaphtae
-from .lactobacillusceti import LactobacillusCeti
-from .lactobacillusharbinensis import LactobacillusHarbinensis
-from .lactobacillusmalefermentans import LactobacillusMalefermentans
-from .lactobacilluspsittaci import LactobacillusPsittaci
-from .legionellalansingensis import LegionellaLansingensis
-from .legionellamoravica import LegionellaMoravica
-from .legionellashakespearei import LegionellaShakespearei
-from .leptotrichiashahii import LeptotrichiaShahii
-from .leptotrichiatrevisanii import LeptotrichiaTrevisanii
-from .leucobacterchironomi import LeucobacterChironomi
-from .lewinellacohaerens import LewinellaCohaerens
-from .lewinellapersica import LewinellaPersica
-from .loktanellahongkongensis import LoktanellaHongkongensis
-from .longisporaalbida import LongisporaAlbida
-from .lysobacterconcretionis import LysobacterConcretionis
-from .marinimicrobiumagarilyticum import MarinimicrobiumAgarilyticum
-from .marinobacterdaepoensis import MarinobacterDaepoensis
-from .marinobacteriumlitorale import MarinobacteriumLitorale
-from .marinomonasushuaiensis import MarinomonasUshuaiensis
-from .marinospirilluminsulare import MarinospirillumInsulare
-from .marinospirillumminutulum import MarinospirillumMinutulum
-from .martelellamediterranea import MartelellaMediterranea
-from .megamonashypermegale import MegamonasHypermegale
-from .megamonasrupellensis import MegamonasRupellensis
-from .meganemaperideroedes import MeganemaPerideroedes
-from .meiothermuscerbereus import MeiothermusCerbereus
-from .meiothermustaiwanensis import MeiothermusTaiwanensis
-from .meiothermustimidus import MeiothermusTimidus
-from .helicobacterspmit016451 import HelicobacterSpMit016451
-from .mesoniamobilis import MesoniaMobilis
-from .metascardoviacriceti import MetascardoviaCriceti
-from .methylophilusmethylotrophus import MethylophilusMethylotrophus
-from .microbacteriumgubbeenense import MicrobacteriumGubbeenense
-from .microbacteriumindicum import MicrobacteriumIndicum
-from .microbacteriumluticocti import MicrobacteriumLuticocti
-from .moraxellaboevrei import MoraxellaBoevrei
-from .moraxellacaprae import MoraxellaCaprae
-from .mycobacteriumhassiacum import MycobacteriumHassiacum
-from .neptunomonasjaponica import NeptunomonasJaponica
-from .nesterenkoniaalba import NesterenkoniaAlba
-from .nevskiaramosa import NevskiaRamosa
-from .nevskiasoli import NevskiaSoli
-from .niabellaaurantiaca import NiabellaAurantiaca
-from .nocardioideshalotolerans import NocardioidesHalotolerans
-from .nonomuraeacoxensis import NonomuraeaCoxensis
-from .novosphingobiumacidiphilum import NovosphingobiumAcidiphilum
-from .oceanicaulisalexandrii import OceanicaulisAlexandrii
-from .oceanicolananhaiensis import OceanicolaNanhaiensis
-from .oligellaureolytica import OligellaUreolytica
-from .olivibactersitiensis import OlivibacterSitiensis
-from .ornithinimicrobiumpekingense import OrnithinimicrobiumPekingense
-from .paenibacillusalginolyticus import PaenibacillusAlginolyticus
-from .paenibacillusdaejeonensis import PaenibacillusDaejeonensis
-from .paenibacillusfonticola import PaenibacillusFonticola
-from .paenibacillusginsengihumi import PaenibacillusGinsengihumi
-from .paenibacillusmassiliensis import PaenibacillusMassiliensis
-from .paenibacillussanguinis import PaenibacillusSanguinis
-from .paenibacillusterrigena import PaenibacillusTerrigena
-from .pannonibacterphragmitetus import PannonibacterPhragmitetus
-from .parabacteroidesgordonii import ParabacteroidesGordonii
-from .paraoerskoviamarina import ParaoerskoviaMarina
-from .patulibacteramericanus import PatulibacterAmericanus
-from .pelosinusfermentans import PelosinusFermentans
-from .perlucidibacapiscinae import PerlucidibacaPiscinae
-from .pleomorphomonaskoreensis import PleomorphomonasKoreensis
-from .pleomorphomonasoryzae import PleomorphomonasOryzae
-from .porphyrobactercryptus import PorphyrobacterCryptus
-from .porphyromonasbennonis import PorphyromonasBennonis
-from .porphyromonaslevii import PorphyromonasLevii
-from .porphyromonassomerae import PorphyromonasSomerae
-from .prevotellaalbensis import PrevotellaAlbensis
-from .prevotellacorporis import PrevotellaCorporis
-from .prevotellafalsenii import PrevotellaFalsenii
-from .prevotellaloescheii import PrevotellaLoescheii
-from .prevotellamaculosa import PrevotellaMaculosa
-from .prevotellaorisdsm18711 import PrevotellaOrisDsm18711
-from .prevotellapaludivivens import PrevotellaPaludivivens
-from .prevotellashahii import PrevotellaShahii
-from .prevotellatimonensis4401737 import PrevotellaTimonensis4401737
-from .prevotellaveroralisdsm19559 import PrevotellaVeroralisDsm19559
-from .propionibacteriumacidifaciens import PropionibacteriumAcidifaciens
-from .propionibacteriumjensenii import PropionibacteriumJensenii
-from .propionibacteriumthoenii import PropionibacteriumThoenii
-from .proteiniphilumacetatigenes import ProteiniphilumAcetatigenes
-from .proteocatellasphenisci import ProteocatellaSphenisci
-from .pseudoclavibactersoli import PseudoclavibacterSoli
-from .pseudomonasresinovoransdsm21078 import PseudomonasResinovoransDsm21078
-from .pseudonocardiaacaciae import PseudonocardiaAcaciae
-from .pseudonocardiaasaccharolytica import PseudonocardiaAsaccharolytica
-from .psychrobacterlutiphocae import PsychrobacterLutiphocae
-from .psychrobacterphenylpyruvicus import PsychrobacterPhenylpyruvicus
-from .psychroflexustropicus import PsychroflexusTropicus
-from .psychroserpensburtonensis import PsychroserpensBurtonensis
-from .rathayibactertoxicus import RathayibacterToxicus
-from .rheinheimerabaltica import RheinheimeraBaltica
-from .rheinheimeraperlucida import RheinheimeraPerlucida
-from .rhodonellumpsychrophilum import RhodonellumPsychrophilum
-from .riemerellacolumbina import RiemerellaColumbina
-from .robiginitomaculumantarcticum import RobiginitomaculumAntarcticum
-from .roseomonasaerilata import RoseomonasAerilata
-from .ruaniaalbidiflava import RuaniaAlbidiflava
-from .rubritaleamarina import RubritaleaMarina
-from .rubritepidaflocculans import RubritepidaFlocculans
-from .rudaeacellulosilytica import RudaeaCellulosilytica
-from .ruminococcusgauvreauii import RuminococcusGauvreauii
-from .saccharibacilluskuerlensis import SaccharibacillusKuerlensis
-from .saccharibacterfloricola import SaccharibacterFloricola
-from .saccharospirillumimpatiens import SaccharospirillumImpatiens
-from .salinarimonasrosea import SalinarimonasRosea
-from .salinicoccusalbus import SalinicoccusAlbus
-from .salinimicrobiumterrae import SalinimicrobiumTerrae
-from .salinimonaschungwhensis import SalinimonasChungwhensis
-from .salipigermucosus import SalipigerMucosus
-from .salsuginibacilluskocurii import SalsuginibacillusKocurii
-from .sandarakinorhabduslimnophila import SandarakinorhabdusLimnophila
-from .schlesneriapaludicola import SchlesneriaPaludicola
-from .sediminimonasqiaohouensis import SediminimonasQiaohouensis
-from .segetibacterkoreensis import SegetibacterKoreensis
-from .selenomonasbovis import SelenomonasBovis
-from .serinicoccusmarinus import SerinicoccusMarinus
-from .shimazuellakribbensis import ShimazuellaKribbensis
-from .silanimonaslenta import SilanimonasLenta
-from .simplicispirapsychrophila import SimplicispiraPsychrophila
-from .solimonasvariicoloris import SolimonasVariicoloris
-from .solimonasflava import SolimonasFlava
-from .smaragdicoccusniigatensis import SmaragdicoccusNiigatensis
-from .solimonassoli import SolimonasSoli
-from .solobacteriummooreidsm22971 import SolobacteriumMooreiDsm22971
-from .sphingomonasastaxanthinifaciens import SphingomonasAstaxanthinifaciens
-from .sphingomonassanxanigenens import SphingomonasSanxanigenens
-from .sphingopyxisbaekryungensis import SphingopyxisBaekryungensis
-from .spirochaetabajacaliforniensis import SpirochaetaBajacaliforniensis
-from .spirosomaluteum import SpirosomaLuteum
-from .spirosomapanaciterrae import SpirosomaPanaciterrae
-from .spirosomaspitsbergense import SpirosomaSpitsbergense
-from .spongiibactertropicus import SpongiibacterTropicus
-from .sporolactobacillusvineae import SporolactobacillusVineae
-from .sporomusaovata import SporomusaOvata
-from .sporosarcinaureae import SporosarcinaUreae
-from .stenoxybacteracetivorans import StenoxybacterAcetivorans
-from .streptococcuscaballi import StreptococcusCaballi
-from .streptococcuscastoreus import StreptococcusCastoreus
-from .streptococcusdevriesei import StreptococcusDevriesei
-from .streptococcusdidelphis import StreptococcusDidelphis
-from .streptococcusentericus import StreptococcusEntericus
-from .streptococcusferus import StreptococcusFerus
-from .streptococcushenryi import StreptococcusHenryi
-from .streptococcusmarimammalium import StreptococcusMarimammalium
-from .streptococcusmassiliensis import StreptococcusMassiliensis
-from .streptococcusmerionis import StreptococcusMerionis
-from .streptococcusminor import StreptococcusMinor
-from .streptococcusorisratti import StreptococcusOrisratti
-from .streptococcusovis import StreptococcusOvis
-from .faecalicoccuspleomorphus import FaecalicoccusPleomorphus
-from .streptococcusplurextorum import StreptococcusPlurextorum
-from .streptococcusporci import StreptococcusPorci
-from .streptococcusthoraltensis import StreptococcusThoraltensis
-from .streptomycesflavidovirens import StreptomycesFlavidovirens
-from .streptomycesscabrisporus import StreptomycesScabrisporus
-from .streptomycessulphureus import StreptomycesSulphureus
-from .streptomycesvitaminophilus import StreptomycesVitaminophilus
-from .sulfurihydrogenibiumsubterraneum import SulfurihydrogenibiumSubterraneum
-from .sulfurospirillumarcachonense import SulfurospirillumArcachonense
-from .tepidiphilusmargaritifer import TepidiphilusMargaritifer
-from .terasakiellapusilla import TerasakiellaPusilla
-from .tetragenococcusmuriaticus import TetragenococcusMuriaticus
-from .thalassobacterarenae import ThalassobacterArenae
-from .thalassospiraxiamenensis import ThalassospiraXiamenensis
-from .thaueralinaloolentis import ThaueraLinaloolentis
-from .thermithiobacillustepidarius import ThermithiobacillusTepidarius
-from .thermodesulfatatoratlanticus import ThermodesulfatatorAtlanticus
-from .thermodesulfobacteriumhveragerdense import ThermodesulfobacteriumHveragerdense
-from .thermodesulfobacteriumthermophilum import ThermodesulfobacteriumThermophilum
-from .thermodesulfovibriothiophilus import ThermodesulfovibrioThiophilus
-from .thermomonasfusca import ThermomonasFusca
-from .thermusantranikianii import ThermusAntranikianii
-from .thermusigniterrae import ThermusIgniterrae
-from .thermusislandicus import ThermusIslandicus
-from .thiobacillusdenitrificansdsm12475 import ThiobacillusDenitrificansDsm12475
-from .thiobacillusthioparus import ThiobacillusThioparus
-from .thiothrixdisciformis import ThiothrixDisciformis
-from .thiothrixflexilis import ThiothrixFlexilis
-from .thiothrixlacustris import ThiothrixLacustris
-from .tuberibacilluscalidus import TuberibacillusCalidus
-from .uliginosibacteriumgangwonense import UliginosibacteriumGangwonense
-from .veillonellamagna import VeillonellaMagna
-from .varibaculumcambriensedsm15806 import VaribaculumCambrienseDsm15806
-from .vitreoscillastercoraria import VitreoscillaStercoraria
-from .weissellahalotolerans import WeissellaHalotolerans
-from .wenxiniamarina import WenxiniaMarina
-from .wohlfahrtiimonaschitiniclastica import WohlfahrtiimonasChitiniclastica
-from .woodsholeamaritima import WoodsholeaMaritima
-from .xenophilusazovorans import XenophilusAzovorans
-from .yaniellahalotolerans import YaniellaHalotolerans
-from .zavarzinellaformosa import ZavarzinellaFormosa
-from .zymophilusraffinosivorans import ZymophilusRaffinosivorans
-from .thiomicrospiraarctica import ThiomicrospiraArctica
-from .thiomicrospirapelophila import ThiomicrospiraPelophila
-from .lacinutrixsp5h374 import LacinutrixSp5h374
-from .pseudomonasstutzeridsm10701 import PseudomonasStutzeriDsm10701
-from .nafulsellaturpanensis import NafulsellaTurpanensis
-from .lacinutrixsppamc27137 import LacinutrixSpPamc27137
-from .pseudomonasprotegenscha0 import PseudomonasProtegensCha0
-from .morganellamorganii import MorganellaMorganii
-from .treponemamaltophilum import TreponemaMaltophilum
-from .treponemamedium import TreponemaMedium
-from .treponemasocranskiiparedis import TreponemaSocranskiiParedis
-from .olsenellaprofusa import OlsenellaProfusa
-from .actinomycesmassiliensis import ActinomycesMassiliensis
-from .treponemasocranskiivpidr56br1116 import TreponemaSocranskiiVpidr56br1116
-from .corynebacteriumpyruviciproducens import CorynebacteriumPyruviciproducens
-from .deferrisomacamini import DeferrisomaCamini
-from .amycolatopsisorientalis import AmycolatopsisOrientalis
-from .jeotgalicoccussp13mg44air import JeotgalicoccusSp13mg44air
-from .weissellaconfusa import WeissellaConfusa
-from .nocardiacyriacigeorgica import NocardiaCyriacigeorgica
-from .glaciecolalipolytica import GlaciecolaLipolytica
-from .idiomarinaspmccc1a10513 import IdiomarinaSpMccc1a10513
-from .lactobacillusspasf360 import LactobacillusSpAsf360
-from .porphyromonascatoniae import PorphyromonasCatoniae
-from .veillonellaatypicakon import VeillonellaAtypicaKon
-from .clostridiumacidurici import ClostridiumAcidurici
-from .lactobacillusspwkb10 import LactobacillusSpWkb10
-from .filamentouscyanobacterium import FilamentousCyanobacterium
-from .glaciecolamesophila import GlaciecolaMesophila
-from .spiroplasmamelliferum import SpiroplasmaMelliferum
-from .mycoplasmahyorhinisgdl1 import MycoplasmaHyorhinisGdl1
-from .alishewanellajeotgali import AlishewanellaJeotgali
-from .glaciecolapsychrophila import GlaciecolaPsychrophila
-from .janibactersphtcc2649 import JanibacterSpHtcc2649
-from .lachnoanaerobaculumspmsx33 import LachnoanaerobaculumSpMsx33
-from .xanthomonasfragariae import XanthomonasFragariae
-from .lactobacillusspwkb8 import LactobacillusSpWkb8
-from .nitrosomonascryotolerans import NitrosomonasCryotolerans
-from .bacillusvireti import BacillusVireti
-from .helicobacterspmit115569 import HelicobacterSpMit115569
-from .hyphomonasspcy54118 import HyphomonasSpCy54118
-from .hyphomonasspl53140 import HyphomonasSpL53140
-from .jannaschiaspccs1 import JannaschiaSpCcs1
-from .lebetimonasspjs170 import LebetimonasSpJs170
-from .halococcushamelinensis import HalococcusHamelinensis
-from .leifsoniasp109 import LeifsoniaSp109
-from .methyloteneramobilis13 import MethyloteneraMobilis13
-from .lactobacillusvini import LactobacillusVini
-from .nocardiabrasiliensis import NocardiaBrasiliensis
-from .streptomyceshygroscopicus import StreptomycesHygroscopicus
-from .serratiaspag1 import SerratiaSpAg1
-from .streptomycessomaliensis import StreptomycesSomaliensis
-from .leisingeraspang1 import LeisingeraSpAng1
-from .bartonellakoehlerae import BartonellaKoehlerae
-from .methylocystisparvus import MethylocystisParvus
-from .pseudomonasfragi import PseudomonasFragi
-from .vibriocyclitrophicus import VibrioCyclitrophicus
-from .lactobacilluspentosus import LactobacillusPentosus
-from .salinisporapacifica import SalinisporaPacifica
-from .hydrogenobaculumspy04aas1 import HydrogenobaculumSpY04aas1
-from .hyphomonasspt16b2 import HyphomonasSpT16b2
-from .janthinobacteriumsphh01 import JanthinobacteriumSpHh01
-from .serratiaspdd3 import SerratiaSpDd3
-from .endozoicomonasnumazuensis import EndozoicomonasNumazuensis
-from .lactobacilluscurieae import LactobacillusCurieae
-from .enterococcusdispar import EnterococcusDispar
-from .enterococcussaccharolyticus import EnterococcusSaccharolyticus
-from .enterococcusdurans import EnterococcusDurans
-from .enterococcusavium import EnterococcusAvium
-from .enterococcussulfureus import EnterococcusSulfureus
-from .staphylococcusintermedius import StaphylococcusIntermedius
-from .providenciaburhodogranariea import ProvidenciaBurhodogranariea
-from .providenciarettgeridmel1 import ProvidenciaRettgeriDmel1
-from .phycisphaeramikurensis import PhycisphaeraMikurensis
-from .kutzneriasp744 import KutzneriaSp744
-from .chlamydiagallinacea import ChlamydiaGallinacea
-from .corallococcuscoralloides import CorallococcusCoralloides
-from .hyphomonassp22ii122f38 import HyphomonasSp22ii122f38
-from .idiomarinaspa28l import IdiomarinaSpA28l
-from .janthinobacteriumspmarseille import JanthinobacteriumSpMarseille
-from .serratiasph1n import SerratiaSpH1n
-from .enterococcusgallinarum import EnterococcusGallinarum
-from .kurthiaspdielmo import KurthiaSpDielmo
-from .kutzneriaalbida import KutzneriaAlbida
-from .leucobacterspph1c import LeucobacterSpPh1c
-from .luteibactersp9135 import LuteibacterSp9135
-from .mangrovibacterspmfb070 import MangrovibacterSpMfb070
-from .marmoricolaspurhb0036 import MarmoricolaSpUrhb0036
-from .acinetobacterspcip562 import AcinetobacterSpCip562
-from .rickettsiahelvetica import RickettsiaHelvetica
-from .pelagibacterubiquehimb058 import PelagibacterUbiqueHimb058
-from .lysinibacillusvarians import LysinibacillusVarians
-from .blastococcussaxobsidens import BlastococcusSaxobsidens
-from .bifidobacteriumasteroides import BifidobacteriumAsteroides
-from .pseudomonaspseudoalcaligeneskf707 import PseudomonasPseudoalcaligenesKf707
-from .maricaulisspjl2009 import MaricaulisSpJl2009
-from .massiliasp9096 import MassiliaSp9096
-from .rhodospirillumphotometricum import RhodospirillumPhotometricum
-from .mesoaciditogalauensis import MesoaciditogaLauensis
-from .mycobacteriumphlei import MycobacteriumPhlei
-from .arcticibactersvalbardensis import ArcticibacterSvalbardensis
-from .sulfurospirillummultivorans import SulfurospirillumMultivorans
-from .phaeospirillummolischianum import PhaeospirillumMolischianum
-from .micromonosporalupini import MicromonosporaLupini
-from .megasphaeragenomosp import MegasphaeraGenomosp
-from .rahnellaaquatilishx2 import RahnellaAquatilisHx2
-from .thermococcuszilligii import ThermococcusZilligii
-from .luteibactersp9143 import LuteibacterSp9143
-from .maribacterspheli7 import MaribacterSpHeli7
-from .marinobacteriumspak27 import MarinobacteriumSpAk27
-from .microbacteriumparaoxydans77mftsu32 import MicrobacteriumParaoxydans77mftsu32
-from .pseudomonasmandelii36mfcvi11 import PseudomonasMandelii36mfcvi11
-from .peptoclostridiumdifficilecd160 import PeptoclostridiumDifficileCd160
-from .leuconostocpseudomesenteroides import LeuconostocPseudomesenteroides
-from .streptococcusagalactiaelmg14747 import StreptococcusAgalactiaeLmg14747
-from .luteimonasspj29 import LuteimonasSpJ29
-from .maribactersphtcc2170 import MaribacterSpHtcc2170
-from .marinomonasspd104 import MarinomonasSpD104
-from .achromobacterpiechaudiihle import AchromobacterPiechaudiiHle
-from .agrobacteriumalbertimagni import AgrobacteriumAlbertimagni
-from .methylacidiphilumfumariolicum import MethylacidiphilumFumariolicum
-from .tumebacillusflagellatus import TumebacillusFlagellatus
-from .leptolyngbyasppcc7375 import LeptolyngbyaSpPcc7375
-from .leptotrichiaspf0557 import LeptotrichiaSpF0557
-from .leptotrichiaspw9775 import LeptotrichiaSpW9775
-from .limnohabitanssprim47 import LimnohabitansSpRim47
-from .magnetospirillumspso1 import MagnetospirillumSpSo1
-from .marinobacterspes1 import MarinobacterSpEs1
-from .megasphaeraspbv3c161 import MegasphaeraSpBv3c161
-from .variovoraxparadoxus110b import VariovoraxParadoxus110b
-from .leeuwenhoekiellaspheli48 import LeeuwenhoekiellaSpHeli48
-from .leeuwenhoekiellaspmar2009132 import LeeuwenhoekiellaSpMar2009132
-from .leptolyngbyaspheron import LeptolyngbyaSpHeron
-from .leptolyngbyaspjsc1 import LeptolyngbyaSpJsc1
-from .leptolyngbyaspkiost1 import LeptolyngbyaSpKiost1
-from .leptolyngbyasppcc6406 import LeptolyngbyaSpPcc6406
-from .leptolyngbyasppcc7376 import LeptolyngbyaSpPcc7376
-from .leptotrichiaspf0581 import LeptotrichiaSpF0581
-from .limnohabitanssprim28 import LimnohabitansSpRim28
-from .lysinibacillusspbf4 import LysinibacillusSpBf4
-from .marinobacterspelb17 import MarinobacterSpElb17
-from .massiliasplc238 import MassiliaSpLc238
-from .enterococcusmalodoratus import EnterococcusMalodoratus
-from .enterococcusraffinosus import EnterococcusRaffinosus
-from .enterococcusvillorum import EnterococcusVillorum
-from .enterococcusasini import EnterococcusAsini
-from .enterococcuspallens import EnterococcusPallens
-from .enterococcushaemoperoxidus import EnterococcusHaemoperoxidus
-from .enterococcusmoraviensis import EnterococcusMoraviensis
-from .enterococcusphoeniculicola import EnterococcusPhoeniculicola
-from .enterococcuscaccae import EnterococcusCaccae
-from .enterococcusgilvus import EnterococcusGilvus
-from .lyngbyasppcc8106 import LyngbyaSpPcc8106
-from .maribiusspmola401 import MaribiusSpMola401
-from .marinomonasspmwyl1 import MarinomonasSpMwyl1
-from .staphylococcusequorum import StaphylococcusEquorum
-from .marinobactersphl58 import MarinobacterSpHl58
-from .megasphaeraspnm10 import MegasphaeraSpNm10
-from .ureibacillusthermosphaericus import UreibacillusThermosphaericus
-from .streptomycesauratus import StreptomycesAuratus
-from .ruminococcusbicirculans import RuminococcusBicirculans
-from .marinobacterspmctg268 import MarinobacterSpMctg268
-from .megasphaeraspnp3 import MegasphaeraSpNp3
-from .eubacteriumnodatum import EubacteriumNodatum
-from .leptospirillumferrooxidans import LeptospirillumFerrooxidans
-from .phytoplasmapeanutwitchesbroom import PhytoplasmaPeanutWitchesbroom
-from .francisellanoatunensis import FrancisellaNoatunensis
-from .megasphaeraspupii135e import MegasphaeraSpUpii135e
-from .rhodanobacterspathiphylli import RhodanobacterSpathiphylli
-from .rhodanobacterfulvus import RhodanobacterFulvus
-from .rhodanobacterthiooxydans import RhodanobacterThiooxydans
-from .sulfuricelladenitrificans import SulfuricellaDenitrificans
-from .methylobacteriumsp10 import MethylobacteriumSp10
-from .fervidicoccusfontis import FervidicoccusFontis
-from .helicobactercetorummit995656 import HelicobacterCetorumMit995656
-from .richeliaintracellularis import RicheliaIntracellularis
-from .mesorhizobiumspwsm3224 import MesorhizobiumSpWsm3224
-from .methylobacteriumsp88a import MethylobacteriumSp88a
-from .methylosinussplw3 import MethylosinusSpLw3
-from .fibrellaaestuarina import FibrellaAestuarina
-from .methylosinussplw4 import MethylosinusSpLw4
-from .halomonasxinjiangensis import HalomonasXinjiangensis
-from .desulfocapsasulfexigens import DesulfocapsaSulfexigens
-from .staphylococcusvitulinus import StaphylococcusVitulinus
-from .draconibacteriumorientale import DraconibacteriumOrientale
-from .xanthobacteraceaebacterium501b import XanthobacteraceaeBacterium501b
-from .gammaproteobacteriabacteriumbdw918 import GammaproteobacteriaBacteriumBdw918
-from .thiomicrospirakuenenii import ThiomicrospiraKuenenii
-from .marinilabiliasalmonicolor import MarinilabiliaSalmonicolor
-from .burkholderiabryophila import BurkholderiaBryophila
-from .mesorhizobiumspurha0056 import MesorhizobiumSpUrha0056
-from .methanobrevibacterspabm4 import MethanobrevibacterSpAbm4
-from .methylocystisspsb2 import MethylocystisSpSb2
-from .propionibacteriumavidum import PropionibacteriumAvidum
-from .methylosinussppw1 import MethylosinusSpPw1
-from .propionibacteriumacidipropionici import PropionibacteriumAcidipropionici
-from .mesoflavibacterzeaxanthdsm18436 import MesoflavibacterZeaxanthDsm18436
-from .mesoflavibacterzeaxanths86 import MesoflavibacterZeaxanthS86
-from .mesorhizobiumsplnjc398b00 import MesorhizobiumSpLnjc398b00
-from .mesorhizobiumspstm4661 import MesorhizobiumSpStm4661
-from .mesorhizobiumspwsm3626 import MesorhizobiumSpWsm3626
-from .methylobacteriumspmb200 import MethylobacteriumSpMb200
-from .helicobactercinaedipagu611 import HelicobacterCinaediPagu611
-from .chamaesiphonminutus import ChamaesiphonMinutus
-from .methylophilusspoh31 import MethylophilusSpOh31
-from .crinaliumepipsammum import CrinaliumEpipsammum
-from .mesorhizobiumspl2c084a000 import MesorhizobiumSpL2c084a000
-from .mesorhizobiumspnbimcp2c3 import MesorhizobiumSpNbimcp2c3
-from .mesorhizobiumspurhc0008 import MesorhizobiumSpUrhc0008
-from .methanocaldococcusspfs40622 import MethanocaldococcusSpFs40622
-from .methylocystisspsc2 import MethylocystisSpSc2
-from .nocardianova import NocardiaNova
-from .spirulinasubsalsa import SpirulinaSubsalsa
-from .methylobacteriumsp446 import MethylobacteriumSp446
-from .methylophilussp5 import MethylophilusSp5
-from .colletotrichumsublineola import ColletotrichumSublineola
-from .bacilluspsychrosaccharolyticus import BacillusPsychrosaccharolyticus
-from .methylotenerasp73s import MethyloteneraSp73s
-from .liberibacterasiaticusgxpsy import LiberibacterAsiaticusGxpsy
-from .methylobacteriumsp77 import MethylobacteriumSp77
-from .methylopilasp73b import MethylopilaSp73b
-from .aerococcusviridansll1 import AerococcusViridansLl1
-from .brevibacteriummassiliense import BrevibacteriumMassiliense
-from .methyloteneraspl2l1 import MethyloteneraSpL2l1
-from .alcanivoraxhongdengensis import AlcanivoraxHongdengensis
-from .alcanivoraxjadensis import AlcanivoraxJadensis
-from .microbacteriumsp292mf import MicrobacteriumSp292mf
-from .thalassospiraprofundimaris import ThalassospiraProfundimaris
-from .microbacteriumspc448 import MicrobacteriumSpC448
-from .bacillusxiamenensis import BacillusXiamenensis
-from .microbacteriumspcrk20 import MicrobacteriumSpCrk20
-from .arenitalealutea import ArenitaleaLutea
-from .photodesmusblepharus import PhotodesmusBlepharus
-from .staphylococcuslentus import StaphylococcusLentus
-from .saccharothrixespanaensis import SaccharothrixEspanaensis
-from .methylobacteriumspgxf4 import MethylobacteriumSpGxf4
-from .thauerasp27 import ThaueraSp27
-from .cladophialophorapsammophila import CladophialophoraPsammophila
-from .pseudomonaspseudoalcaligenescect5344 import PseudomonasPseudoalcaligenesCect5344
-from .microbacteriumspcrk32 import MicrobacteriumSpCrk32
-from .gloeobacterkilaueensis import GloeobacterKilaueensis
-from .thermogladiuscellulolyticus import ThermogladiusCellulolyticus
-from .bdellovibrioexovorus import BdellovibrioExovorus
-from .austwickiachelonae import AustwickiaChelonae
-from .kineosphaeralimosa import KineosphaeraLimosa
-from .sinorhizobiumfrediiusda257 import SinorhizobiumFrediiUsda257
-from .planococcusantarcticus import PlanococcusAntarcticus
-from .thioclavadalianensis import ThioclavaDalianensis
-from .fibrisomalimi import FibrisomaLimi
-from .methanobacteriumspmaddingley import MethanobacteriumSpMaddingley
-from .methylocystisspatcc49242 import MethylocystisSpAtcc49242
-from .mycoplasmaauris import MycoplasmaAuris
-from .mycoplasmaalkalescens import MycoplasmaAlkalescens
-from .mycoplasmabovigenitalium import MycoplasmaBovigenitalium
-from .mycoplasmaarginini import MycoplasmaArginini
-from .mycoplasmaovipneumoniae import MycoplasmaOvipneumoniae
-from .mycoplasmayeatsii import MycoplasmaYeatsii
-from .ureaplasmadiversum import UreaplasmaDiversum
-from .vibriorumoiensis import VibrioRumoiensis
-from .rhodovulumsulfidophilum import RhodovulumSulfidophilum
-from .indibacteralkaliphilus import IndibacterAlkaliphilus
-from .psychroflexusgondwanensis import PsychroflexusGondwanensis
-from .methylopilaspm107 import MethylopilaSpM107
-from .enterovibrionorvegicus import EnterovibrioNorvegicus
-from .enterovibriocalviensis import EnterovibrioCalviensis
-from .vibriokanaloae import VibrioKanaloae
-from .acinetobactervenetianus import AcinetobacterVenetianus
-from .melioribacterroseus import MelioribacterRoseus
-from .chondromycesapiculatus import ChondromycesApiculatus
-from .mycobacteriumspumwwy import MycobacteriumSpUmwwy
-from .sphingobiumxenophagum import SphingobiumXenophagum
-from .pseudaminobactersalicylatoxidans import PseudaminobacterSalicylatoxidans
-from .parascardoviadenticolensipla20019 import ParascardoviaDenticolensIpla20019
-from .tetrasphaeraelongata import TetrasphaeraElongata
-from .endolissoclinumfaulkneril2 import EndolissoclinumFaulkneriL2
-from .microbacteriumyannicii import MicrobacteriumYannicii
-from .staphylococcuswarnerisg1 import StaphylococcusWarneriSg1
-from .mycobacteriumvaccae import MycobacteriumVaccae
-from .clostridiumtermitidis import ClostridiumTermitidis
-from .alishewanellaagri import AlishewanellaAgri
-from .virgibacillushalodenitrificans import VirgibacillusHalodenitrificans
-from .bacillusendophyticus import BacillusEndophyticus
-from .bacillusoceanisediminis import BacillusOceanisediminis
-from .snodgrassellaalvi import SnodgrassellaAlvi
-from .gilliamellaapicola import GilliamellaApicola
-from .micromonassprcc299 import MicromonasSpRcc299
-from .mycobacteriumsp155 import MycobacteriumSp155
-from .bacillusmacauensis import BacillusMacauensis
-from .pseudomonasstutzericcug29243 import PseudomonasStutzeriCcug29243
-from .mycoplasmaspg5847 import MycoplasmaSpG5847
-from .mangrovimonasyunxiaonensis import MangrovimonasYunxiaonensis
-from .mycobacteriumsp360mftsu51 import MycobacteriumSp360mftsu51
-from .salmonellabongorin26808 import SalmonellaBongoriN26808
-from .afipiabirgiae import AfipiaBirgiae
-from .granulicellatundricola import GranulicellaTundricola
-from .cycloclasticuszancles import CycloclasticusZancles
-from .aeropyrumcamini import AeropyrumCamini
-from .mycobacteriumspjdm601 import MycobacteriumSpJdm601
-from .streptococcusmutansgs5 import StreptococcusMutansGs5
-from .corynebacteriumterpenotabidum import CorynebacteriumTerpenotabidum
-from .mogibacteriumspcm50 import MogibacteriumSpCm50
-from .myxosarcinaspgi1 import MyxosarcinaSpGi1
-from .brevibacillusbrevisx23 import BrevibacillusBrevisX23
-from .bartonellabirtlesii import BartonellaBirtlesii
-from .micromonosporaspatcc39149 import MicromonosporaSpAtcc39149
-from .natrinemaspj72 import NatrinemaSpJ72
-from .enterococcusfaecalisatcc29212 import EnterococcusFaecalisAtcc29212
-from .moritelladasanensis import MoritellaDasanensis
-from .neisseriaspf0314 import NeisseriaSpF0314
-from .halopigersalifodinae import HalopigerSalifodinae
-from .moritellamarina import MoritellaMarina
-from .lactobacillusingluviei import LactobacillusIngluviei
-from .corynebacteriumtimonense import CorynebacteriumTimonense
-from .prevotellaoralishga0225 import PrevotellaOralisHga0225
-from .sutterellawadsworthensishga0223 import SutterellaWadsworthensisHga0223
-from .microbacteriumspkrocy2 import MicrobacteriumSpKrocy2
-from .microbacteriumspmrs1 import MicrobacteriumSpMrs1
-from .microbacteriumspunccl10 import MicrobacteriumSpUnccl10
-from .microbacteriumspurha0036 import MicrobacteriumSpUrha0036
-from .microbulbifersphz11 import MicrobulbiferSpHz11
-from .mitsuokellaspw9106 import MitsuokellaSpW9106
-from .mycobacteriumspjls import MycobacteriumSpJls
-from .butyricicoccuspullicaecorum import ButyricicoccusPullicaecorum
-from .alistipesonderdonkii import AlistipesOnderdonkii
-from .microcoleussppcc7113 import MicrocoleusSpPcc7113
-from .mycobacteriumsp141 import MycobacteriumSp141
-from .reyranellamassiliensis import ReyranellaMassiliensis
-from .bartonellarattaustraliani import BartonellaRattaustraliani
-from .yersiniamassiliensis import YersiniaMassiliensis
-from .xanthomonastranslucens import XanthomonasTranslucens
-from .vibriobreoganii import VibrioBreoganii
-from .nocardiopsisalba import NocardiopsisAlba
-from .nesterenkoniaspf import NesterenkoniaSpF
-from .nocardiaaobensis import NocardiaAobensis
-from .nocardiabrevicatena import NocardiaBrevicatena
-from .nocardiacarnea import NocardiaCarnea
-from .nocardiaexalbida import NocardiaExalbida
-from .nocardiahigoensis import NocardiaHigoensis
-from .nocardiajiangxiensis import NocardiaJiangxiensis
-from .nocardiaotitidiscaviarum import NocardiaOtitidiscaviarum
-from .nocardianiigatensis import NocardiaNiigatensis
-from .nocardiatakedensis import NocardiaTakedensis
-from .nocardiapneumoniae import NocardiaPneumoniae
-from .nocardiatestacea import NocardiaTestacea
-from .nocardiaconcava import NocardiaConcava
-from .nocardiaveterana import NocardiaVeterana
-from .nocardiatransvalensis import NocardiaTransvalensis
-from .microchaetesppcc7126 import MicrochaeteSpPcc7126
-from .muricaudaspmar201075 import MuricaudaSpMar201075
-from .nesterenkoniaspnp1 import NesterenkoniaSpNp1
-from .oceanibaculumindicum import OceanibaculumIndicum
-from .nitratiruptorspsb1552 import NitratiruptorSpSb1552
-from .pseudomonasluteola import PseudomonasLuteola
-from .nitrosomonasspal212 import NitrosomonasSpAl212
-from .celeribacterbaekdonensis import CeleribacterBaekdonensis
-from .mycobacteriumspumwgj import MycobacteriumSpUmwgj
-from .kinetoplastibacteriumcrithidii import KinetoplastibacteriumCrithidii
-from .kinetoplastibacteriumdesouzaii import KinetoplastibacteriumDesouzaii
-from .kinetoplastibacteriumoncopeltii import KinetoplastibacteriumOncopeltii
-from .kinetoplastibacteriumgalatii import KinetoplastibacteriumGalatii
-from .kinetoplastibacteriumblastocrithidii import KinetoplastibacteriumBlastocrithidii
-from .cellvibriomixtus import CellvibrioMixtus
-from .mycobacteriummageritense import MycobacteriumMageritense
-from .tepidanaerobacteracetatoxydans import TepidanaerobacterAcetatoxydans
-from .nocardioidesspjs614 import NocardioidesSpJs614
-from .janibacterhoylei import JanibacterHoylei
-from .nocardiopsisspcnt312 import NocardiopsisSpCnt312
-from .halogranumsalarium import HalogranumSalarium
-from .lysinibacillusmassiliensis import LysinibacillusMassiliensis
-from .pseudomonaspsychrophila import PseudomonasPsychrophila
-from .nocardiaspbmg51109 import NocardiaSpBmg51109
-from .nocardioidesspj54 import NocardioidesSpJ54
-from .pseudomonasputidanbrc14164 import PseudomonasPutidaNbrc14164
-from .rhizobiummesoamericanum import RhizobiumMesoamericanum
-from .alistipesmarseilloanorexicus import AlistipesMarseilloanorexicus
-from .bacillusmassilioanorexius import BacillusMassilioanorexius
-from .blastococcusmassiliensis import BlastococcusMassiliensis
-from .clostridiumanorexicamassiliense import ClostridiumAnorexicamassiliense
-from .holdemaniamassiliensis import HoldemaniaMassiliensis
-from .stoquefichusmassiliensis import StoquefichusMassiliensis
-from .pseudomonasstutzerinf13 import PseudomonasStutzeriNf13
-from .enterobacteriaceaebacteriumb14 import EnterobacteriaceaeBacteriumB14
-from .streptomycesdavawensis import StreptomycesDavawensis
-from .streptococcussuis865192 import StreptococcusSuis865192
-from .streptococcussuis22083 import StreptococcusSuis22083
-from .streptococcussuisys72 import StreptococcusSuisYs72
-from .streptomycescollinus import StreptomycesCollinus
-from .pseudomonasalcaligenesnbrc14159 import PseudomonasAlcaligenesNbrc14159
-from .pseudomonasparafulva import PseudomonasParafulva
-from .liberibactercrescens import LiberibacterCrescens
-from .lactococcusraffinolactis import LactococcusRaffinolactis
-from .pseudoalteromonasruthenica import PseudoalteromonasRuthenica
-from .fusobacteriumhwasookii import FusobacteriumHwasookii
-from .nosocomiicoccusspnp2 import NosocomiicoccusSpNp2
-from .edwardsiellahoshinae import EdwardsiellaHoshinae
-from .elizabethkingiameningoseptica import ElizabethkingiaMeningoseptica
-from .achromobacterxylosoxidansnbrc15126 import AchromobacterXylosoxidansNbrc15126
-from .acinetobacterbeijerinckii import AcinetobacterBeijerinckii
-from .acinetobacterbrisouii import AcinetobacterBrisouii
-from .acinetobacterguillouiae import AcinetobacterGuillouiae
-from .acinetobactergyllenbergii import AcinetobacterGyllenbergii
-from .mycobacteriumspunc280mftsu51 import MycobacteriumSpUnc280mftsu51
-from .mycobacteriumspurhb0044 import MycobacteriumSpUrhb0044
-from .mycobacteriumspurhd0025 import MycobacteriumSpUrhd0025
-from .nitrosomonasspis79a3 import NitrosomonasSpIs79a3
-from .nitrosospiraspapg3 import NitrosospiraSpApg3
-from .nocardiasp348mftsu51 import NocardiaSp348mftsu51
-from .nocardioidesspcf8 import NocardioidesSpCf8
-from .thauerasp63 import ThaueraSp63
-from .acinetobacterbohemicus import AcinetobacterBohemicus
-from .nocardiaspcny236 import NocardiaSpCny236
-from .nostocsppcc7107 import NostocSpPcc7107
-from .burkholderiaacidipaludis import BurkholderiaAcidipaludis
-from .burkholderiabannensis import BurkholderiaBannensis
-from .burkholderiaferrariae import BurkholderiaFerrariae
-from .burkholderiaterrae import BurkholderiaTerrae
-from .citrobactersedlakii import CitrobacterSedlakii
-from .chryseobacteriumindologenes import ChryseobacteriumIndologenes
-from .empedobacterbrevis import EmpedobacterBrevis
-from .bacillusalcalophilus import BacillusAlcalophilus
-from .pseudomonasstutzerikos6 import PseudomonasStutzeriKos6
-from .comamonasaquatica import ComamonasAquatica
-from .novosphingobiumtardaugens import NovosphingobiumTardaugens
-from .sphingobiumherbicidovorans import SphingobiumHerbicidovorans
-from .sphingomonasparapaucimobilis import SphingomonasParapaucimobilis
-from .vibrioproteolyticus import VibrioProteolyticus
-from .vibriohalioticoli import VibrioHalioticoli
-from .vibrioalginolyticusnbrc15630 import VibrioAlginolyticusNbrc15630
-from .vibrioazureus import VibrioAzureus
-from .vibrioezurae import VibrioEzurae
-from .thermotogahypogea import ThermotogaHypogea
-from .xanthomonascassavae import XanthomonasCassavae
-from .nitrosopumilusspar2 import NitrosopumilusSpAr2
-from .nitrospinaspab629b18 import NitrospinaSpAb629b18
-from .nocardiaspbmg111209 import NocardiaSpBmg111209
-from .nocardioidesspiso805n import NocardioidesSpIso805n
-from .alphaproteobacteriumimcc14465 import AlphaProteobacteriumImcc14465
-from .staphylococcuschromogenes import StaphylococcusChromogenes
-from .rhizobiumrubi import RhizobiumRubi
-from .gordoniaaichiensis import GordoniaAichiensis
-from .lysinibacillusodysseyi import LysinibacillusOdysseyi
-from .pseudomonasfluorescensncimb11764 import PseudomonasFluorescensNcimb11764
-from .lactobacillusflorum import LactobacillusFlorum
-from .altibacterlentus import AltibacterLentus
-from .comamonasgranuli import ComamonasGranuli
-from .streptomycesmobaraensis import StreptomycesMobaraensis
-from .gordoniamalaquae import GordoniaMalaquae
-from .gordoniasihwensis import GordoniaSihwensis
-from .gordoniaparaffinivorans import GordoniaParaffinivorans
-from .gordoniasoli import GordoniaSoli
-from .enterobacteriaceaebacteriumlsjc7 import EnterobacteriaceaeBacteriumLsjc7
-from .corynebacteriummaris import CorynebacteriumMaris
-from .corynebacteriumvitaeruminis import CorynebacteriumVitaeruminis
-from .oscillatoriasppcc10802 import OscillatoriaSpPcc10802
-from .gluconobacteroxydansh24 import GluconobacterOxydansH24
-from .oceanicaulissphl87 import OceanicaulisSpHl87
-from .oceanicolaspmctg156 import OceanicolaSpMctg156
-from .oribacteriumspf0263 import OribacteriumSpF0263
-from .paenibacillusspd14 import PaenibacillusSpD14
-from .pseudomonasnitroreducenstx1 import PseudomonasNitroreducensTx1
-from .nostocsppcc7120 import NostocSpPcc7120
-from .nostocsppcc7524 import NostocSpPcc7524
-from .novosphingobiumspap12 import NovosphingobiumSpAp12
-from .novosphingobiumsprr217 import NovosphingobiumSpRr217
-from .oceanicolasp22iis11g import OceanicolaSp22iis11g
-from .oceanobacillussps5 import OceanobacillusSpS5
-from .oribacteriumspfc2011 import OribacteriumSpFc2011
-from .viridibacillusarenosi import ViridibacillusArenosi
-from .haloarculajaponica import HaloarculaJaponica
-from .halobiformanitratireducens import HalobiformaNitratireducens
-from .halococcusthailandensis import HalococcusThailandensis
-from .halorubrumsaccharovorum import HalorubrumSaccharovorum
-from .halosarcinapallida import HalosarcinaPallida
-from .haloterrigenasalina import HaloterrigenaSalina
-from .natrinemapallidum import NatrinemaPallidum
-from .natronococcusamylolyticus import NatronococcusAmylolyticus
-from .natronolimnobiusinnermongolicus import NatronolimnobiusInnermongolicus
-from .natronorubrumbangense import NatronorubrumBangense
-from .hymenobacterswuensis import HymenobacterSwuensis
-from .paenibacillusspgd11 import PaenibacillusSpGd11
-from .actinobacteriumllx17 import ActinobacteriumLlx17
-from .alphaproteobacteriuml41a import AlphaProteobacteriumL41a
-from .burkholderiaphenoliruptrix import BurkholderiaPhenoliruptrix
-from .oscillibactersp13 import OscillibacterSp13
-from .gammaproteobacteriabacteriumwg36 import GammaproteobacteriaBacteriumWg36
-from .oribacteriumspf0262 import OribacteriumSpF0262
-from .oscillibactersper4 import OscillibacterSpEr4
-from .lactococcusgarvieaei113 import LactococcusGarvieaeI113
-from .oscillibacterspkle1728 import OscillibacterSpKle1728
-from .leuconostocgelidumjb7 import LeuconostocGelidumJb7
-from .leuconostoccarnosum import LeuconostocCarnosum
-from .microthrixparvicella import MicrothrixParvicella
-from .brevibacteriumcasei import BrevibacteriumCasei
-from .staphylococcusmassiliensis import StaphylococcusMassiliensis
-from .chlamydiaavium import ChlamydiaAvium
-from .paenibacillussphw567 import PaenibacillusSpHw567
-from .moraxellamacacae import MoraxellaMacacae
-from .paenibacillusspj14 import PaenibacillusSpJ14
-from .clostridiumtetanomorphum import ClostridiumTetanomorphum
-from .legionellaanisa import LegionellaAnisa
-from .haloterrigenalimicola import HaloterrigenaLimicola
-from .natronorubrumsulfidifaciens import NatronorubrumSulfidifaciens
-from .olleyaspvcsm12 import OlleyaSpVcsm12
-from .oribacteriumspnk2b42 import OribacteriumSpNk2b42
-from .nitratireductoraquibiodomus import NitratireductorAquibiodomus
-from .nitratireductorindicus import NitratireductorIndicus
-from .paenibacillusspjdr2 import PaenibacillusSpJdr2
-from .lactobacillusshenzhenensis import LactobacillusShenzhenensis
-from .lactococcusgarvieaedcc43 import LactococcusGarvieaeDcc43
-from .pusillimonasnoertemannii import PusillimonasNoertemannii
-from .oceaniovalibusguishaninsula import OceaniovalibusGuishaninsula
-from .cardiniumendosymbiontceper1 import CardiniumEndosymbiontCeper1
-from .novosphingobiumsppp1y import NovosphingobiumSpPp1y
-from .oceanicaulissphtcc2633 import OceanicaulisSpHtcc2633
-from .oceanimonasspgk1 import OceanimonasSpGk1
-from .oribacteriumspf0425 import OribacteriumSpF0425
-from .thaueraspmz1t import ThaueraSpMz1t
-from .coriobacteriaceaebacteriumgd5 import CoriobacteriaceaeBacteriumGd5
-from .paenibacillusspmaepy2 import PaenibacillusSpMaepy2
-from .clostridialesbacteriumve20213 import ClostridialesBacteriumVe20213
-from .paenibacillusspa9 import PaenibacillusSpA9
-from .clostridialesbacteriumve20209 import ClostridialesBacteriumVe20209
-from .clostridialesbacteriumve20208 import ClostridialesBacteriumVe20208
-from .clostridialesbacteriumve20214 import ClostridialesBacteriumVe20214
-from .clostridialesbacteriumve20221 import ClostridialesBacteriumVe20221
-from .staphylococcussciuri import StaphylococcusSciuri
-from .oceanicolasphl35 import OceanicolaSpHl35
-from .olsenellaspf0356 import OlsenellaSpF0356
-from .oribacteriumspp6a1 import OribacteriumSpP6a1
-from .dyellaginsengisoli import DyellaGinsengisoli
-from .catellicoccusmarimammalium import CatellicoccusMarimammalium
-from .paenibacillusspmst1 import PaenibacillusSpMst1
-from .alphaproteobacteriumjlt2015 import AlphaProteobacteriumJlt2015
-from .geobacilluscaldoxylosilyticus import GeobacillusCaldoxylosilyticus
-from .carnobacteriummaltaromaticum import CarnobacteriumMaltaromaticum
-from .bhargavaeacecembensis import BhargavaeaCecembensis
-from .paenibacillussposyse import PaenibacillusSpOsyse
-from .salinicoccuscarnicancri import SalinicoccusCarnicancri
-from .bacteroidesmassiliensisdnlkv3 import BacteroidesMassiliensisDnlkv3
-from .paenibacillussptca20 import PaenibacillusSpTca20
-from .lachnospiraceaebacteriumm181 import LachnospiraceaeBacteriumM181
-from .lachnospiraceaebacteriumcoe1 import LachnospiraceaeBacteriumCoe1
-from .enterorhabduscaecimuris import EnterorhabdusCaecimuris
-from .firmicutesbacteriumm102 import FirmicutesBacteriumM102
-from .paenisporosarcinasphgh0030 import PaenisporosarcinaSpHgh0030
-from .lachnospiraceaebacterium32 import LachnospiraceaeBacterium32
-from .lachnospiraceaebacterium101 import LachnospiraceaeBacterium101
-from .lactobacillusmurinus import LactobacillusMurinus
-from .eubacteriumplexicaudatum import EubacteriumPlexicaudatum
-from .pantoeasppsnih1 import PantoeaSpPsnih1
-from .prevotelladisiensjcm6334 import PrevotellaDisiensJcm6334
-from .bacteroidespyogenesjcm10003 import BacteroidesPyogenesJcm10003
-from .prevotellaenoeca import PrevotellaEnoeca
-from .paracoccussp4681 import ParacoccusSp4681
-from .halyomorphahalys import HalyomorphaHalys
-from .prevotellapleuritidis import PrevotellaPleuritidis
-from .prevotellaoulorumjcm14966 import PrevotellaOulorumJcm14966
-from .acetobacterokinawensis import AcetobacterOkinawensis
-from .prevotellahisticola import PrevotellaHisticola
-from .prevotellaaurantiaca import PrevotellaAurantiaca
-from .bacteroidesstercorirosoris import BacteroidesStercorirosoris
-from .prevotellafusca import PrevotellaFusca
-from .prevotellascopos import PrevotellaScopos
-from .shewanellahaliotis import ShewanellaHaliotis
-from .shewanellamarina import ShewanellaMarina
-from .methanomethylophilusalvus import MethanomethylophilusAlvus
-from .nocardiopsisbaichengensis import NocardiopsisBaichengensis
-from .paracoccusspj39 import ParacoccusSpJ39
-from .methylobacillusglycogenes import MethylobacillusGlycogenes
-from .bacillusakibai import BacillusAkibai
-from .paenibacilluspini import PaenibacillusPini
-from .fulvivirgaimtechensis import FulvivirgaImtechensis
-from .nocardiopsisganjiahuensis import NocardiopsisGanjiahuensis
-from .caenispirillumsalinarum import CaenispirillumSalinarum
-from .oceanobacilluskimchii import OceanobacillusKimchii
-from .leucobactersalsicius import LeucobacterSalsicius
-from .halomonasjeotgali import HalomonasJeotgali
-from .chlamydiapsittaci10139811 import ChlamydiaPsittaci10139811
-from .haloquadratumwalsbyij07hqw2 import HaloquadratumWalsbyiJ07hqw2
-from .vibrionigripulchritudo import VibrioNigripulchritudo
-from .paracoccusspn5 import ParacoccusSpN5
-from .mariniradiussaccharolyticus import MariniradiusSaccharolyticus
-from .rhodococcusruber import RhodococcusRuber
-from .pseudomonasputidamtcc5279 import PseudomonasPutidaMtcc5279
-from .cystobacterfuscus import CystobacterFuscus
-from .campylobacterconcisusatcc51562 import CampylobacterConcisusAtcc51562
-from .vibriospejy3 import VibrioSpEjy3
-from .campylobactershowaecsunswcd import CampylobacterShowaeCsunswcd
-from .campylobacterfetustestudinum import CampylobacterFetusTestudinum
-from .paenibacillusspfslr7277 import PaenibacillusSpFslr7277
-from .paracoccussppamc22219 import ParacoccusSpPamc22219
-from .bradyrhizobiumoligotrophicum import BradyrhizobiumOligotrophicum
-from .pseudomonasresinovoransnbrc106553 import PseudomonasResinovoransNbrc106553
-from .nocardiopsisprasina import NocardiopsisPrasina
-from .nocardiopsiskunsanensis import NocardiopsisKunsanensis
-from .nocardiopsisvalliformis import NocardiopsisValliformis
-from .paracoccussptrp import ParacoccusSpTrp
-from .nocardiopsisxinjiangensis import NocardiopsisXinjiangensis
-from .pantoeasppsnih2 import PantoeaSpPsnih2
-from .bacilluslehensis import BacillusLehensis
-from .mycoplasmacynos import MycoplasmaCynos
-from .actinoplanesfriuliensis import ActinoplanesFriuliensis
-from .arsenophonusendosymbiont import ArsenophonusEndosymbiont
-from .bordetellaholmesii import BordetellaHolmesii
-from .advenellamimigardefordensis import AdvenellaMimigardefordensis
-from .parvularculaoceani import ParvularculaOceani
-from .photobacteriumleiognathilrivu41 import PhotobacteriumLeiognathiLrivu41
-from .paenibacillusspfslh70737 import PaenibacillusSpFslh70737
-from .paenibacillusspfslp40081 import PaenibacillusSpFslp40081
-from .paenibacillusspfslr70273 import PaenibacillusSpFslr70273
-from .paenibacillusspunc451mf import PaenibacillusSpUnc451mf
-from .parvimonasspf0440 import ParvimonasSpF0440
-from .serratiamarcescensfgi94 import SerratiaMarcescensFgi94
-from .paenibacillusspfslh70357 import PaenibacillusSpFslh70357
-from .paenibacillusspfslh7689 import PaenibacillusSpFslh7689
-from .paenibacillusspfslr50345 import PaenibacillusSpFslr50345
-from .paenibacillusspfslr70331 import PaenibacillusSpFslr70331
-from .paenisporosarcinasptg14 import PaenisporosarcinaSpTg14
-from .sorangiumcellulosumso01572 import SorangiumCellulosumSo01572
-from .thioalkalivibrionitratireducens import ThioalkalivibrioNitratireducens
-from .eubacteriumramulus import EubacteriumRamulus
-from .coprothermobacterplatensis import CoprothermobacterPlatensis
-from .spiribactersalinus import SpiribacterSalinus
-from .enterococcusfaecalis13sdw01 import EnterococcusFaecalis13sdw01
-from .liberibacteramericanus import LiberibacterAmericanus
-from .halarchaeumacidiphilum import HalarchaeumAcidiphilum
-from .clostridiumpasteurianumdsm525 import ClostridiumPasteurianumDsm525
-from .pandoraeaspsd62 import PandoraeaSpSd62
-from .bibersteiniatrehalosi import BibersteiniaTrehalosi
-from .pleurocapsasppcc7327 import PleurocapsaSpPcc7327
-from .mycobacteriumasiaticum import MycobacteriumAsiaticum
-from .haliearubra import HalieaRubra
-from .polaribactersphel13349 import PolaribacterSpHel13349
-from .caldimonasmanganoxidans import CaldimonasManganoxidans
-from .colwelliapiezophila import ColwelliaPiezophila
-from .desulfospirajoergensenii import DesulfospiraJoergensenii
-from .succinimonasamylolytica import SuccinimonasAmylolytica
-from .pelagibacterubiquehtcc9022 import PelagibacterUbiqueHtcc9022
-from .listeriaweihenstephanensis import ListeriaWeihenstephanensis
-from .peptoniphilusspbv3c26 import PeptoniphilusSpBv3c26
-from .peptoniphilusspf0436 import PeptoniphilusSpF0436
-from .persephonellaspkm09lau8 import PersephonellaSpKm09lau8
-from .pleurocapsasppcc7319 import PleurocapsaSpPcc7319
-from .nitrosospirabriensis import NitrosospiraBriensis
-from .paracoccuszeaxanthinifaciens import ParacoccusZeaxanthinifaciens
-from .lactobacillusparabrevis import LactobacillusParabrevis
-from .hyphomicrobiumzavarzinii import HyphomicrobiumZavarzinii
-from .polaribactersphel185 import PolaribacterSpHel185
-from .acidobacteriaceaebacteriumkbs83 import AcidobacteriaceaeBacteriumKbs83
-from .acidobacteriaceaebacteriumkbs89 import AcidobacteriaceaeBacteriumKbs89
-from .acidobacteriaceaebacteriumkbs96 import AcidobacteriaceaeBacteriumKbs96
-from .anoxybacillusflavithermustno09006 import AnoxybacillusFlavithermusTno09006
-from .planococcussppamc21323 import PlanococcusSpPamc21323
-from .paenibacillussabinae import PaenibacillusSabinae
-from .aeromonasdiversa import AeromonasDiversa
-from .pseudoalteromonasluteoviolacea import PseudoalteromonasLuteoviolacea
-from .bacteroidescellulosilyticus import BacteroidesCellulosilyticus
-from .phascolarctobacteriumspcag266 import PhascolarctobacteriumSpCag266
-from .vibriosper1a import VibrioSpEr1a
-from .legionellaoakridgensis import LegionellaOakridgensis
-from .peptoniphilusspchdc import PeptoniphilusSpChdc
-from .peptostreptococcusspmv1 import PeptostreptococcusSpMv1
-from .phyllobacteriumspunc302mfcol52 import PhyllobacteriumSpUnc302mfcol52
-from .rhodococcusrhodnii import RhodococcusRhodnii
-from .planomicrobiumglaciei import PlanomicrobiumGlaciei
-from .polaromonasspcg912 import PolaromonasSpCg912
-from .hepatobacterpenaei import HepatobacterPenaei
-from .bacillussonorensis import BacillusSonorensis
-from .spiroplasmataiwanense import SpiroplasmaTaiwanense
-from .spiroplasmadiminutum import SpiroplasmaDiminutum
-from .spiroplasmachrysopicola import SpiroplasmaChrysopicola
-from .spiroplasmasyrphidicola import SpiroplasmaSyrphidicola
-from .spiroplasmaculicicola import SpiroplasmaCulicicola
-from .spiroplasmasabaudiense import SpiroplasmaSabaudiense
-from .spiroplasmaapis import SpiroplasmaApis
-from .polaromonasspjs666 import PolaromonasSpJs666
-from .arthrobactergangotriensis import ArthrobacterGangotriensis
-from .myxococcusstipitatus import MyxococcusStipitatus
-from .rhodococcustriatomae import RhodococcusTriatomae
-from .acholeplasmagranularum import AcholeplasmaGranularum
-from .fusobacteriumrussii import FusobacteriumRussii
-from .psychromonasossibalaenae import PsychromonasOssibalaenae
-from .zimmermannellafaecalis import ZimmermannellaFaecalis
-from .amphriteajaponica import AmphriteaJaponica
-from .acholeplasmaaxanthum import AcholeplasmaAxanthum
-from .avibacteriumparagallinarum221 import AvibacteriumParagallinarum221
-from .cesiribacterandamanensis import CesiribacterAndamanensis
-from .oceanimonassmirnovii import OceanimonasSmirnovii
-from .microbulbifervariabilis import MicrobulbiferVariabilis
-from .thioalkalivibriothiocyanoxidansarh2 import ThioalkalivibrioThiocyanoxidansArh2
-from .novispirillumitersonii import NovispirillumItersonii
-from .vibriojasicida import VibrioJasicida
-from .polaribacterspheli88 import PolaribacterSpHeli88
-from .paenibacillaceaebacteriumg5 import PaenibacillaceaeBacteriumG5
-from .parabacteroidesspasf519 import ParabacteroidesSpAsf519
-from .paracoccidioidessplutzii import ParacoccidioidesSpLutzii
-from .paucisalibacillusspeb02 import PaucisalibacillusSpEb02
-from .pectobacteriumspscc3193 import PectobacteriumSpScc3193
-from .pedobacterspbal39 import PedobacterSpBal39
-from .pedobacterspr2019 import PedobacterSpR2019
-from .pedobacterspv48 import PedobacterSpV48
-from .pelagibactersphtcc7211 import PelagibacterSpHtcc7211
-from .pelagibacterspimcc9063 import PelagibacterSpImcc9063
-from .pelosinusspufo1 import PelosinusSpUfo1
-from .peptoniphilusspf0131 import PeptoniphilusSpF0131
-from .persephonellaspif05l8 import PersephonellaSpIf05l8
-from .phyllobacteriumspyr531 import PhyllobacteriumSpYr531
-from .vibriospn418 import VibrioSpN418
-from .pseudobutyrivibrioruminiscf1b import PseudobutyrivibrioRuminisCf1b
-from .clostridiumparaputrificum import ClostridiumParaputrificum
-from .clostridiumcadaveris import ClostridiumCadaveris
-from .pseudobutyrivibrioruminisad2017 import PseudobutyrivibrioRuminisAd2017
-from .butyrivibriofibrisolvensnd3005 import ButyrivibrioFibrisolvensNd3005
-from .dorealongicatenaagr2136 import DoreaLongicatenaAgr2136
-from .selenomonasruminantiumatcc12561 import SelenomonasRuminantiumAtcc12561
-from .phascolarctobacteriumspcag207 import PhascolarctobacteriumSpCag207
-from .polaribacterspmed152 import PolaribacterSpMed152
-from .prevotellasp10 import PrevotellaSp10
-from .prevotellaspf0295 import PrevotellaSpF0295
-from .prochlorococcusspmit0602 import ProchlorococcusSpMit0602
-from .hyphomonasadhaerens import HyphomonasAdhaerens
-from .hyphomonasjohnsonii import HyphomonasJohnsonii
-from .hyphomonasjannaschiana import HyphomonasJannaschiana
-from .hyphomonasoceanitis import HyphomonasOceanitis
-from .hyphomonaspolymorpha import HyphomonasPolymorpha
-from .agrobacteriumtumefacienscherry import AgrobacteriumTumefaciensCherry
-from .pseudomonaspoae import PseudomonasPoae
-from .prevotellaspc561 import PrevotellaSpC561
-from .prevotellaspma2016 import PrevotellaSpMa2016
-from .pseudomonassp20bn import PseudomonasSp20bn
-from .streptococcustigurinusaz3a import StreptococcusTigurinusAz3a
-from .streptococcustigurinus1366 import StreptococcusTigurinus1366
-from .alphaproteobacteriummf105b01 import AlphaProteobacteriumMf105b01
-from .lachnospiramultiparaatcc19207 import LachnospiraMultiparaAtcc19207
-from .prevotellaspagr2160 import PrevotellaSpAgr2160
-from .prevotellaspf0472 import PrevotellaSpF0472
-from .prochlorococcusspmit0604 import ProchlorococcusSpMit0604
-from .conexibacterwoeseiiso977n import ConexibacterWoeseiIso977n
-from .methylohalobiuscrimeensis import MethylohalobiusCrimeensis
-from .pseudomonasspant303 import PseudomonasSpAnt303
-from .actinomycesurogenitaliss6c4 import ActinomycesUrogenitalisS6c4
-from .pseudomonasspbay1663 import PseudomonasSpBay1663
-from .anaerococcuslactolyticuss7113 import AnaerococcusLactolyticusS7113
-from .clostridialesbacteriums714 import ClostridialesBacteriumS714
-from .pseudomonasspcf149 import PseudomonasSpCf149
-from .corynebacteriumcasei import CorynebacteriumCasei
-from .lysinibacillussphaericusot4b31 import LysinibacillusSphaericusOt4b31
-from .pseudomonasspchol1 import PseudomonasSpChol1
-from .methylophagalonarensis import MethylophagaLonarensis
-from .raoultellaornithinolytica import RaoultellaOrnithinolytica
-from .eubacteriumacidaminophilum import EubacteriumAcidaminophilum
-from .sphaerotilusnatans import SphaerotilusNatans
-from .zhouiaamylolytica import ZhouiaAmylolytica
-from .prevotellaspf0108 import PrevotellaSpF0108
-from .prochlorococcusspmit0601 import ProchlorococcusSpMit0601
-from .corynebacteriumfreneyi import CorynebacteriumFreneyi
-from .prevotellabiviadnf00188 import PrevotellaBiviaDnf00188
-from .prevotellaspf0040 import PrevotellaSpF0040
-from .prevotellaspp6b1 import PrevotellaSpP6b1
-from .pseudomonasspg5 import PseudomonasSpG5
-from .roseovariusmucosus import RoseovariusMucosus
-from .deinococcuswulumuqiensis import DeinococcusWulumuqiensis
-from .pseudomonasspgm21 import PseudomonasSpGm21
-from .marinobactersantoriniensis import MarinobacterSantoriniensis
-from .cyclobacteriaceaebacteriumak24 import CyclobacteriaceaeBacteriumAk24
-from .brachyspirahampsonii import BrachyspiraHampsonii
-from .pseudomonassph2 import PseudomonasSpH2
-from .clostridiumjosui import ClostridiumJosui
-from .lactobacillusoryzae import LactobacillusOryzae
-from .pseudomonassphys import PseudomonasSpHys
-from .mycoplasmaputrefaciensmput9231 import MycoplasmaPutrefaciensMput9231
-from .caulobactercrescentusor37 import CaulobacterCrescentusOr37
-from .clostridiumsordellii import ClostridiumSordellii
-from .propionibacteriumgranulosum import PropionibacteriumGranulosum
-from .prevotellasps718 import PrevotellaSpS718
-from .pseudomonassplz4w import PseudomonasSpLz4w
-from .halanaerobiumsaccharolyticum import HalanaerobiumSaccharolyticum
-from .lactobacillusequicursoris import LactobacillusEquicursoris
-from .clostridiumintestinale import ClostridiumIntestinale
-from .pseudomonasdenitrificans import PseudomonasDenitrificans
-from .bacillusboroniphilus import BacillusBoroniphilus
-from .roseibacteriumelongatum import RoseibacteriumElongatum
-from .geobacillusstearothermophilus import GeobacillusStearothermophilus
-from .pseudomonasspm1 import PseudomonasSpM1
-from .aquimarinamegaterium import AquimarinaMegaterium
-from .komagataeibacterxylinus import KomagataeibacterXylinus
-from .streptococcusdentisani7746 import StreptococcusDentisani7746
-from .mesorhizobiummetallidurans import MesorhizobiumMetallidurans
-from .prochlorococcusspmit0701 import ProchlorococcusSpMit0701
-from .anoxybacillusflavithermusak1 import AnoxybacillusFlavithermusAk1
-from .intestinimonasbutyriciproducens import IntestinimonasButyriciproducens
-from .vibriosprc586 import VibrioSpRc586
-from .streptococcusdentisani7747 import StreptococcusDentisani7747
-from .prevotellasphun102 import PrevotellaSpHun102
-from .prochlorococcusspmit0801 import ProchlorococcusSpMit0801
-from .thalassolituusoleivorans import ThalassolituusOleivorans
-from .gracilibacillusboraciitolerans import GracilibacillusBoraciitolerans
-from .porphyrobacterspaap82 import PorphyrobacterSpAap82
-from .porphyrobactersphl46 import PorphyrobacterSpHl46
-from .porphyromonasspcot239oh1446 import PorphyromonasSpCot239oh1446
-from .porphyromonasspcot290oh860 import PorphyromonasSpCot290oh860
-from .porphyromonasspkle1280 import PorphyromonasSpKle1280
-from .porphyromonasspw7784 import PorphyromonasSpW7784
-from .prevotellaspf0091 import PrevotellaSpF0091
-from .prevotellasps7ms2 import PrevotellaSpS7Ms2
-from .desulfotomaculumguttoideum import DesulfotomaculumGuttoideum
-from .mycobacteriumkansasii732 import MycobacteriumKansasii732
-from .knoelliasinensis import KnoelliaSinensis
-from .chryseobacteriumoranimense import ChryseobacteriumOranimense
-from .enterococcusmundtii import EnterococcusMundtii
-from .lysobacterdokdonensis import LysobacterDokdonensis
-from .sulfitobacterdonghicola import SulfitobacterDonghicola
-from .pseudomonasknackmussii import PseudomonasKnackmussii
-from .pseudomonassptkp import PseudomonasSpTkp
-from .lactobacillusnamurensis import LactobacillusNamurensis
-from .borreliamiyamotoi import BorreliaMiyamotoi
-from .streptococcusoligofermentans import StreptococcusOligofermentans
-from .chthonomonascalidirosea import ChthonomonasCalidirosea
-from .streptomycesfulvissimus import StreptomycesFulvissimus
-from .salinisphaerahydrothermalis import SalinisphaeraHydrothermalis
-from .clostridiaceaebacteriuml21thd2 import ClostridiaceaeBacteriumL21thd2
-from .pseudoalteromonasspbsw20308 import PseudoalteromonasSpBsw20308
-from .desulfovibriomagneticusifrc170 import DesulfovibrioMagneticusIfrc170
-from .aminiphiluscircumscriptus import AminiphilusCircumscriptus
-from .aminobacteriummobile import AminobacteriumMobile
-from .arthrobacternicotinovorans import ArthrobacterNicotinovorans
-from .bradyrhizobiumjaponicum22 import BradyrhizobiumJaponicum22
-from .bradyrhizobiumjaponicumin8p8 import BradyrhizobiumJaponicumIn8p8
-from .caldicoprobacteroshimai import CaldicoprobacterOshimai
-from .chlamydiasuis import ChlamydiaSuis
-from .dechloromonasagitata import DechloromonasAgitata
-from .desulforegulaconservatrix import DesulforegulaConservatrix
-from .prochlorococcusspscb241528o2 import ProchlorococcusSpScb241528o2
-from .pseudoalteromonasspocn003 import PseudoalteromonasSpOcn003
-from .algoriphagusmarincolahl49 import AlgoriphagusMarincolaHl49
-from .pseudomonasspml96 import PseudomonasSpMl96
-from .kineosporiaaurantiaca import KineosporiaAurantiaca
-from .streptomycesthermolilacinus import StreptomycesThermolilacinus
-from .candidatedivisiontm6 import CandidateDivisionTm6
-from .pseudomonasspuw4 import PseudomonasSpUw4
-from .bacillusfirmus import BacillusFirmus
-from .pseudoalteromonasagarivorans import PseudoalteromonasAgarivorans
-from .pseudanabaenasppcc7367 import PseudanabaenaSpPcc7367
-from .pseudomonassprit357 import PseudomonasSpRit357
-from .gluconobacterfrateurii import GluconobacterFrateurii
-from .gracilibacillushalophilus import GracilibacillusHalophilus
-from .pseudoalteromonasspsm9913 import PseudoalteromonasSpSm9913
-from .ilumatobactercoccineus import IlumatobacterCoccineus
-from .pseudomonasspvlb120 import PseudomonasSpVlb120
-from .borreliacoriaceae import BorreliaCoriaceae
-from .hafniaalvei import HafniaAlvei
-from .borreliaanserina import BorreliaAnserina
-from .borreliaparkeri import BorreliaParkeri
-from .thermonemarossianum import ThermonemaRossianum
-from .chitinivibrioalkaliphilus import ChitinivibrioAlkaliphilus
-from .prochlorococcusspscb245a520k10 import ProchlorococcusSpScb245a520k10
-from .pseudobutyrivibriospmd2005 import PseudobutyrivibrioSpMd2005
-from .pseudomonascorrugata import PseudomonasCorrugata
-from .mannheimiahaemolyticam42548 import MannheimiaHaemolyticaM42548
-from .phaeospirillumfulvum import PhaeospirillumFulvum
-from .propionibacteriumspf0372 import PropionibacteriumSpF0372
-from .pseudobutyrivibriosplb2011 import PseudobutyrivibrioSpLb2011
-from .mycoplasmagirerdii import MycoplasmaGirerdii
-from .marinobacterlipolyticussm19 import MarinobacterLipolyticusSm19
-from .cetobacteriumsomerae import CetobacteriumSomerae
-from .pseudomonassprl import PseudomonasSpRl
-from .streptococcussuisea183292 import StreptococcusSuisEa183292
-from .propionimicrobiumspbv2f7 import PropionimicrobiumSpBv2f7
-from .pseudogulbenkianiaspnh8b import PseudogulbenkianiaSpNh8b
-from .clostridialesbacteriumf0540 import ClostridialesBacteriumF0540
-from .pseudanabaenasppcc6802 import PseudanabaenaSpPcc6802
-from .pseudomonasspm47t1 import PseudomonasSpM47t1
-from .peptostreptococcaceaebacteriumw5053 import PeptostreptococcaceaeBacteriumW5053
-from .pseudovibriospfobeg1 import PseudovibrioSpFobeg1
-from .eubacteriumbrachy import EubacteriumBrachy
-from .treponemalecithinolyticum import TreponemaLecithinolyticum
-from .gemellabergeriae import GemellaBergeriae
-from .desulfovibriopiezophilus import DesulfovibrioPiezophilus
-from .rhodococcusdefluvii import RhodococcusDefluvii
-from .pseudomonaspelagia import PseudomonasPelagia
-from .halobonumtyrrellensis import HalobonumTyrrellensis
-from .helicobacterfennelliae import HelicobacterFennelliae
-from .catenovulumagarivoransds2 import CatenovulumAgarivoransDs2
-from .weissellaoryzae import WeissellaOryzae
-from .thermoactinomycesdaqus import ThermoactinomycesDaqus
-from .thermuscaliditerrae import ThermusCaliditerrae
-from .sphingobiumlactosutens import SphingobiumLactosutens
-from .acinetobacterhaemolyticus import AcinetobacterHaemolyticus
-from .serratiafonticolaauap2c import SerratiaFonticolaAuap2c
-from .pseudoalteromonashaloplanktistb64 import PseudoalteromonasHaloplanktisTb64
-from .pseudomonassps9 import PseudomonasSpS9
-from .pseudomonasstutzerimf28 import PseudomonasStutzeriMf28
-from .alphaproteobacteriumma2 import AlphaProteobacteriumMa2
-from .kurthiahuakuii import KurthiaHuakuii
-from .laceyellasacchari import LaceyellaSacchari
-from .psychromonasspcnpt3 import PsychromonasSpCnpt3
-from .rhizobiumspcf080 import RhizobiumSpCf080
-from .roseomonasgilardii import RoseomonasGilardii
-from .shewanellawaksmanii import ShewanellaWaksmanii
-from .atopobacterphocae import AtopobacterPhocae
-from .rhizobiumselenitireducens import RhizobiumSelenitireducens
-from .pseudomonasflectens import PseudomonasFlectens
-from .eubacteriumxylanophilum import EubacteriumXylanophilum
-from .microvirgaflocculans import MicrovirgaFlocculans
-from .carnimonasnigrificans import CarnimonasNigrificans
-from .rhizobiumlarrymoorei import RhizobiumLarrymoorei
-from .rahnellaaquatiliscip7865 import RahnellaAquatilisCip7865
-from .loktanellacinnabarina import LoktanellaCinnabarina
-from .rhizobiumspcf097 import RhizobiumSpCf097
-from .elizabethkingiaanophelis import ElizabethkingiaAnophelis
-from .rahnellaspy9602 import RahnellaSpY9602
-from .bryobacteraggregatus import BryobacterAggregatus
-from .lactobacillusapodemi import LactobacillusApodemi
-from .flavobacteriumsaliperosum import FlavobacteriumSaliperosum
-from .ruminococcusflavefaciens007c import RuminococcusFlavefaciens007c
-from .flavobacteriumlimnosediminis import FlavobacteriumLimnosediminis
-from .mycobacteriumsepticum import MycobacteriumSepticum
-from .acinetobacterindicus import AcinetobacterIndicus
-from .bifidobacteriumbombi import BifidobacteriumBombi
-from .pseudomonasspurmo17wk12i8 import PseudomonasSpUrmo17wk12i8
-from .psychrobactersppamc21119 import PsychrobacterSpPamc21119
-from .pyrococcusspna2 import PyrococcusSpNa2
-from .palaeococcuspacificus import PalaeococcusPacificus
-from .streptomycesrapamycinicus import StreptomycesRapamycinicus
-from .rhizobiumspcf122 import RhizobiumSpCf122
-from .exiguobacteriumpavilionensis import ExiguobacteriumPavilionensis
-from .helicobacterpylorisa213a import HelicobacterPyloriSa213a
-from .clostridiumsaccharobutylicum import ClostridiumSaccharobutylicum
-from .rhizobiumspcf394 import RhizobiumSpCf394
-from .sphingobacteriumpaucimobilis import SphingobacteriumPaucimobilis
-from .sphingobiumummariense import SphingobiumUmmariense
-from .psychrobactersptb15 import PsychrobacterSpTb15
-from .ralstoniaspau1208 import RalstoniaSpAu1208
-from .formosaagariphila import FormosaAgariphila
-from .psychrobactersp1501 import PsychrobacterSp1501
-from .psychrobactersptb67 import PsychrobacterSpTb67
-from .ralstoniasppba import RalstoniaSpPba
-from .bacteroidaceaebacteriumms4 import BacteroidaceaeBacteriumMs4
-from .rheinheimeraspa13l import RheinheimeraSpA13l
-from .leifsoniarubra import LeifsoniaRubra
-from .cellulophagabaltica import CellulophagaBaltica
-from .vibriodiazotrophicus import VibrioDiazotrophicus
-from .thaueraterpenica import ThaueraTerpenica
-from .corynebacteriumargentoratense import CorynebacteriumArgentoratense
-from .kitasatosporacheerisanensis import KitasatosporaCheerisanensis
-from .bacillusmegateriummsp201 import BacillusMegateriumMsp201
-from .clostridialesbacteriumve20218 import ClostridialesBacteriumVe20218
-from .tenacibaculummaritimum import TenacibaculumMaritimum
-from .rhizobiumspibun import RhizobiumSpIbun
-from .coprobacterfastidiosus import CoprobacterFastidiosus
-from .streptomycesniveus import StreptomycesNiveus
-from .olleyamarilimosa import OlleyaMarilimosa
-from .psychrobacterspjcm18900 import PsychrobacterSpJcm18900
-from .psychroserpenssppamc27130 import PsychroserpensSpPamc27130
-from .thioclavapacifica import ThioclavaPacifica
-from .rhizobiumsplpu83 import RhizobiumSpLpu83
-from .psychrobacteraquaticus import PsychrobacterAquaticus
-from .cardiniumendosymbiontcbtq1 import CardiniumEndosymbiontCbtq1
-from .pseudoxanthomonasspgw2 import PseudoxanthomonasSpGw2
-from .psychrobacterspprwf1 import PsychrobacterSpPrwf1
-from .pyrococcusspst04 import PyrococcusSpSt04
-from .alicyclobacillusacidoterrestris import AlicyclobacillusAcidoterrestris
-from .pseudomonassyringaecc1417 import PseudomonasSyringaeCc1417
-from .pseudomonassyringaecc1513 import PseudomonasSyringaeCc1513
-from .pseudomonassyringaecc1557 import PseudomonasSyringaeCc1557
-from .helicobactercanis import HelicobacterCanis
-from .helicobactermacacae import HelicobacterMacacae
-from .sphingobacteriumantarcticus import SphingobacteriumAntarcticus
-from .rhizobiumspok494 import RhizobiumSpOk494
-from .rhodobacteraceaebacteriumhimb11 import RhodobacteraceaeBacteriumHimb11
-from .ralstoniapickettiidtp0602 import RalstoniaPickettiiDtp0602
-from .campylobactercoli76339 import CampylobacterColi76339
-from .paracoccusaminophilus import ParacoccusAminophilus
-from .pusillimonasspt77 import PusillimonasSpT77
-from .rhizobiumspr1200b2 import RhizobiumSpR1200b2
-from .rhizobiumundicola import RhizobiumUndicola
-from .mycobacteriumiranicum import MycobacteriumIranicum
-from .firmicutesbacteriumasf500 import FirmicutesBacteriumAsf500
-from .pyrobaculumsp1860 import PyrobaculumSp1860
-from .rhizobiumspyr295 import RhizobiumSpYr295
-from .candidatedivisionzixi import CandidateDivisionZixi
-from .rhizobiumsp2mfcol31 import RhizobiumSp2mfcol31
-from .mucispirillumschaedleri import MucispirillumSchaedleri
-from .rhizobiumspccge510 import RhizobiumSpCcge510
-from .geodermatophilaceaebacteriumurhb0048 import GeodermatophilaceaeBacteriumUrhb0048
-from .rhodobacterspsw2 import RhodobacterSpSw2
-from .rhodococcusspunc23mfcrub11 import RhodococcusSpUnc23mfcrub11
-from .rhodovulumspni22 import RhodovulumSpNi22
-from .roseiflexussprs1 import RoseiflexusSpRs1
-from .roseobacterspgai101 import RoseobacterSpGai101
-from .ruegeriasptm1040 import RuegeriaSpTm1040
-from .salimicrobiumspmj3 import SalimicrobiumSpMj3
-from .intrasporangiaceaebacteriumurhb0013 import IntrasporangiaceaeBacteriumUrhb0013
-from .rhodovulumspph10 import RhodovulumSpPh10
-from .roseivivaxsp22iis10s import RoseivivaxSp22iis10s
-from .roseobacterspmed193 import RoseobacterSpMed193
-from .ruminobactersprm87 import RuminobacterSpRm87
-from .solirubrobacteralesbacteriumurhd0059 import SolirubrobacteralesBacteriumUrhd0059
-from .sciscionellaspse31 import SciscionellaSpSe31
-from .geodermatophilaceaebacteriumurha0031 import GeodermatophilaceaeBacteriumUrha0031
-from .rhodospirillalesbacteriumurhd0088 import RhodospirillalesBacteriumUrhd0088
-from .anoxybacillusflavithermusyunnanensis import AnoxybacillusFlavithermusYunnanensis
-from .flaviramulusichthyoenteri import FlaviramulusIchthyoenteri
-from .paenibacillusdarwinianus import PaenibacillusDarwinianus
-from .roseovariussp217 import RoseovariusSp217
-from .ruminococcussphun007 import RuminococcusSpHun007
-from .asaiaplatycodisf21 import AsaiaPlatycodiSf21
-from .caulobacteraceaebacteriumpmmr1 import CaulobacteraceaeBacteriumPmmr1
-from .alicyclobacillusmacrosporangiidus import AlicyclobacillusMacrosporangiidus
-from .roseovariusspmctg156 import RoseovariusSpMctg156
-from .ruminococcusspnk3a76 import RuminococcusSpNk3a76
-from .geobacillusvulcani import GeobacillusVulcani
-from .saccharibacterspam169 import SaccharibacterSpAm169
-from .anoxybacillustepidamans import AnoxybacillusTepidamans
-from .saccharomonosporaspcnq490 import SaccharomonosporaSpCnq490
-from .lysinibacillusmanganicus import LysinibacillusManganicus
-from .arenimonasmalthae import ArenimonasMalthae
-from .arenimonasmetalli import ArenimonasMetalli
-from .lysinibacillussinduriensis import LysinibacillusSinduriensis
-from .ruminococcusalbusad2013 import RuminococcusAlbusAd2013
-from .ruminococcusflavefaciensae3010 import RuminococcusFlavefaciensAe3010
-from .adlercreutziaequolifaciens import AdlercreutziaEquolifaciens
-from .sediminibacteriumspc3 import SediminibacteriumSpC3
-from .pontibacillushalophilus import PontibacillusHalophilus
-from .pontibacillusmarinus import PontibacillusMarinus
-from .pontibacilluslitoralis import PontibacillusLitoralis
-from .pontibacilluschungwhensis import PontibacillusChungwhensis
-from .pontibacillusyanchengensis import PontibacillusYanchengensis
-from .lysobacterdefluvii import LysobacterDefluvii
-from .lysobacterdaejeonensis import LysobacterDaejeonensis
-from .knoelliaaerolata import KnoelliaAerolata
-from .knoelliasubterranea import KnoelliaSubterranea
-from .lactobacilluscomposti import LactobacillusComposti
-from .selenomonassp67h29bp import SelenomonasSp67h29bp
-from .intrasporangiumoryzae import IntrasporangiumOryzae
-from .gordoniaamicalis import GordoniaAmicalis
-from .schmidhempeliabombi import SchmidhempeliaBombi
-from .selenomonasspae3005 import SelenomonasSpAe3005
-from .pseudomonasmosselii import PseudomonasMosselii
-from .leifsoniaxylicynodontis import LeifsoniaXyliCynodontis
-from .pseudomonasmendocinaegdaq5 import PseudomonasMendocinaEgdaq5
-from .clostridiumbifermentans import ClostridiumBifermentans
-from .selenomonasspf0426 import SelenomonasSpF0426
-from .pseudozymabrasiliensis import PseudozymaBrasiliensis
-from .rhodococcusspunc363mftsu51 import RhodococcusSpUnc363mftsu51
-from .rivulariasppcc7116 import RivulariaSpPcc7116
-from .roseobacterspazwk3b import RoseobacterSpAzwk3b
-from .roseobacterspsk20926 import RoseobacterSpSk20926
-from .ruminococcussp5139bfaa import RuminococcusSp5139bfaa
-from .ruminococcaceaebacteriumae2021 import RuminococcaceaeBacteriumAe2021
-from .lachnospiraceaebacteriumac2031 import LachnospiraceaeBacteriumAc2031
-from .maribacterforsetii import MaribacterForsetii
-from .selenomonasruminantiumac2024 import SelenomonasRuminantiumAc2024
-from .selenomonasruminantiumab3002 import SelenomonasRuminantiumAb3002
-from .acinetobacternectaris import AcinetobacterNectaris
-from .bordetellahinzii import BordetellaHinzii
-from .roseovariussptm1035 import RoseovariusSpTm1035
-from .saccharothrixspnrrlb16314 import SaccharothrixSpNrrlb16314
-from .actinomaduramadurae import ActinomaduraMadurae
-from .sporolactobacilluslaevolacticus import SporolactobacillusLaevolacticus
-from .pseudomonasmoraviensis import PseudomonasMoraviensis
-from .pseudomonastaeanensis import PseudomonasTaeanensis
-from .rhizobiumspyr519 import RhizobiumSpYr519
-from .rhizobiumspys1r import RhizobiumSpYs1r
-from .rhodococcusspaw25m09 import RhodococcusSpAw25m09
-from .rhodopirellulaspswk7 import RhodopirellulaSpSwk7
-from .roseibiumsptrichskd4 import RoseibiumSpTrichskd4
-from .roseobacterspccs2 import RoseobacterSpCcs2
-from .roseomonasspb5 import RoseomonasSpB5
-from .ruminococcusspfc2018 import RuminococcusSpFc2018
-from .alphaproteobacteriumrs24 import AlphaProteobacteriumRs24
-from .exiguobacteriumundae import ExiguobacteriumUndae
-from .exiguobacteriummarinum import ExiguobacteriumMarinum
-from .exiguobacteriumoxidotolerans import ExiguobacteriumOxidotolerans
-from .borreliavalaisianatom4006 import BorreliaValaisianaTom4006
-from .shinellaspdd12 import ShinellaSpDd12
-from .holosporaobtusa import HolosporaObtusa
-from .enterobactercloacaejd6301 import EnterobacterCloacaeJd6301
-from .lactobacillusfabifermentans import LactobacillusFabifermentans
-from .pelagibacterubiquehtcc7214 import PelagibacterUbiqueHtcc7214
-from .pelagibacterubiquehtcc7217 import PelagibacterUbiqueHtcc7217
-from .corynebacteriumtuscaniense import CorynebacteriumTuscaniense
-from .oligellaurethralis import OligellaUrethralis
-from .veillonellamontpellierensis import VeillonellaMontpellierensis
-from .prevotellabuccalisdnf00985 import PrevotellaBuccalisDnf00985
-from .endolissoclinumfaulkneril5 import EndolissoclinumFaulkneriL5
-from .shuttleworthiaspmsx8b import ShuttleworthiaSpMsx8b
-from .bacillussimplex import BacillusSimplex
-from .shewanellaspana3 import ShewanellaSpAna3
-from .streptococcusanginosusdora7 import StreptococcusAnginosusDora7
-from .varibaculumcambriensedora20 import VaribaculumCambrienseDora20
-from .corynebacteriumglycinophilum import CorynebacteriumGlycinophilum
-from .staphylococcussimulans import StaphylococcusSimulans
-from .flavobacteriumbeibuense import FlavobacteriumBeibuense
-from .shewanellaspecsmb14101 import ShewanellaSpEcsmb14101
-from .betaproteobacteriabacteriummola814 import BetaproteobacteriaBacteriumMola814
-from .sinorhizobiumamericanum import SinorhizobiumAmericanum
-from .vagococcuslutrae import VagococcusLutrae
-from .brevibacilluspanacihumi import BrevibacillusPanacihumi
-from .fusobacteriumnucleatumw1481 import FusobacteriumNucleatumW1481
-from .sediminibacterspheli10 import SediminibacterSpHeli10
-from .selenomonasspf0429 import SelenomonasSpF0429
-from .selenomonasspf0473 import SelenomonasSpF0473
-from .selenomonasspfobrc9 import SelenomonasSpFobrc9
-from .serratiaspatcc39006 import SerratiaSpAtcc39006
-from .sphingobacteriumsp21 import SphingobacteriumSp21
-from .lachnospiraceaebacteriumac2028 import LachnospiraceaeBacteriumAc2028
-from .lachnospiraceaebacteriumac3007 import LachnospiraceaeBacteriumAc3007
-from .lachnospiraceaebacteriumma2020 import LachnospiraceaeBacteriumMa2020
-from .lachnospiraceaebacteriummc2017 import LachnospiraceaeBacteriumMc2017
-from .acholeplasmaequifetale import AcholeplasmaEquifetale
-from .acholeplasmahippikon import AcholeplasmaHippikon
-from .acholeplasmamodicum import AcholeplasmaModicum
-from .acidiphiliumangustum import AcidiphiliumAngustum
-from .acidocellafacilis import AcidocellaFacilis
-from .alkaliphilustransvaalensis import AlkaliphilusTransvaalensis
-from .anaerovibriolipolyticus import AnaerovibrioLipolyticus
-from .bacillusbogoriensis import BacillusBogoriensis
-from .bartonellaelizabethae import BartonellaElizabethae
-from .bilophilawadsworthiaatcc49260 import BilophilaWadsworthiaAtcc49260
-from .crocinitomixcatalasitica import CrocinitomixCatalasitica
-from .eubacteriumcellulosolvensld2006 import EubacteriumCellulosolvensLd2006
-from .eubacteriumdesmolans import EubacteriumDesmolans
-from .facklamiasourekii import FacklamiaSourekii
-from .fusobacteriumperfoetens import FusobacteriumPerfoetens
-from .helicobacterpametensis import HelicobacterPametensis
-from .legionellafairfieldensis import LegionellaFairfieldensis
-from .legionellasainthelensi import LegionellaSainthelensi
-from .mycobacteriumgenavense import MycobacteriumGenavense
-from .prolixibacterbellariivorans import ProlixibacterBellariivorans
-from .shewanellaspyqh10 import ShewanellaSpYqh10
-from .clostridiummangenotii import ClostridiumMangenotii
-from .salegentibacterspheli6 import SalegentibacterSpHeli6
-from .salinarchaeumspharchtbsk1 import SalinarchaeumSpHarchtbsk1
-from .sandarakinorhabdusspaap62 import SandarakinorhabdusSpAap62
-from .sediminibacteriumspor53 import SediminibacteriumSpOr53
-from .selenomonasspf0430 import SelenomonasSpF0430
-from .selenomonasspfobrc6 import SelenomonasSpFobrc6
-from .selenomonasspnd2010 import SelenomonasSpNd2010
-from .serratiaspm24t3 import SerratiaSpM24t3
-from .lachnospiraceaebacteriumc6a11 import LachnospiraceaeBacteriumC6a11
-from .lachnospiraceaebacteriumfe2018 import LachnospiraceaeBacteriumFe2018
-from .lachnospiraceaebacteriummd2004 import LachnospiraceaeBacteriumMd2004
-from .lachnospiraceaebacteriumnc2004 import LachnospiraceaeBacteriumNc2004
-from .lachnospiraceaebacteriumnd2006 import LachnospiraceaeBacteriumNd2006
-from .lachnospiraceaebacteriump6a3 import LachnospiraceaeBacteriumP6a3
-from .lachnospiraceaebacteriump6b14 import LachnospiraceaeBacteriumP6b14
-from .lachnospiraceaebacteriumv9d3004 import LachnospiraceaeBacteriumV9d3004
-from .lachnospiraceaebacteriumysb2008 import LachnospiraceaeBacteriumYsb2008
-from .propionibacteriaceaebacteriump6a17 import PropionibacteriaceaeBacteriumP6a17
-from .ruminococcaceaebacteriumab4001 import RuminococcaceaeBacteriumAb4001
-from .butyrivibrioproteoclasticusp6b7 import ButyrivibrioProteoclasticusP6b7
-from .clostridiumlundense import ClostridiumLundense
-from .kandleriavitulina import KandleriaVitulina
-from .lachnospiramultiparalb2003 import LachnospiraMultiparaLb2003
-from .mitsuokellajalaludinii import MitsuokellaJalaludinii
-from .prevotellabrevis import PrevotellaBrevis
-from .proteiniclasticumruminis import ProteiniclasticumRuminis
-from .ruminococcusflavefaciensma2007 import RuminococcusFlavefaciensMa2007
-from .sharpeaazabuensis import SharpeaAzabuensis
-from .succinivibriodextrinosolvens import SuccinivibrioDextrinosolvens
-from .sulfitobacterguttiformis import SulfitobacterGuttiformis
-from .rhizobialesbacteriumyim77505 import RhizobialesBacteriumYim77505
-from .gammaproteobacteriabacteriummola455 import GammaproteobacteriaBacteriumMola455
-from .silicibactersptrichch4b import SilicibacterSpTrichch4b
-from .sinorhizobiumspccbau05631 import SinorhizobiumSpCcbau05631
-from .sphingobacteriumspaccc05744 import SphingobacteriumSpAccc05744
-from .sphingobacteriumsph1ai import SphingobacteriumSpH1ai
-from .sphingobiumspba1 import SphingobiumSpBa1
-from .clostridiumbotulinum202f import ClostridiumBotulinum202f
-from .clostridiumbaratii import ClostridiumBaratii
-from .porticoccushydrocarbonoclasticus import PorticoccusHydrocarbonoclasticus
-from .polycyclovoransalgicola import PolycyclovoransAlgicola
-from .algiphilusaromaticivorans import AlgiphilusAromaticivorans
-from .microbacteriumparaoxydansdh1b import MicrobacteriumParaoxydansDh1b
-from .micromonosporaparva import MicromonosporaParva
-from .paracoccusyeei import ParacoccusYeei
-from .borreliapersica import BorreliaPersica
-from .sphingobiumspc100 import SphingobiumSpC100
-from .pseudomonasmandeliipd30 import PseudomonasMandeliiPd30
-from .sphingobiumspsyk6 import SphingobiumSpSyk6
-from .phaeobactergallaeciensis import PhaeobacterGallaeciensis
-from .sphingobiumspyl23 import SphingobiumSpYl23
-from .lactobacilluscaseidsm20011 import LactobacillusCaseiDsm20011
-from .lactobacillusfarraginis import LactobacillusFarraginis
-from .lactobacillusfuchuensis import LactobacillusFuchuensis
-from .lactobacillusgallinarum import LactobacillusGallinarum
-from .lactobacillushamsteri import LactobacillusHamsteri
-from .lactobacillushayakitensis import LactobacillusHayakitensis
-from .lactobacillushominis import LactobacillusHominis
-from .lactobacilluskitasatonis import LactobacillusKitasatonis
-from .lactobacillusnodensis import LactobacillusNodensis
-from .lactobacillusotakiensis import LactobacillusOtakiensis
-from .lactobacilluspasteurii import LactobacillusPasteurii
-from .lactobacillussucicola import LactobacillusSucicola
-from .lactobacillussuebicus import LactobacillusSuebicus
-from .lactobacillusvaginalis import LactobacillusVaginalis
-from .lactobacillusversmoldensis import LactobacillusVersmoldensis
-from .lactobacilluszeae import LactobacillusZeae
-from .leifsoniaaquatica import LeifsoniaAquatica
-from .luteimonashuabeiensis import LuteimonasHuabeiensis
-from .advenellakashmirensisw13003 import AdvenellaKashmirensisW13003
-from .hepatoplasmacrinochetorum import HepatoplasmaCrinochetorum
-from .rhodococcusrhodochrous import RhodococcusRhodochrous
-from .stenotrophomonasmaltophilia5bai2 import StenotrophomonasMaltophilia5bai2
-from .sphingobacteriumspml3w import SphingobacteriumSpMl3w
-from .magnetospirillumgryphiswaldense import MagnetospirillumGryphiswaldense
-from .rhizobiumetlimimosae import RhizobiumEtliMimosae
-from .komagataeibacterrhaeticus import KomagataeibacterRhaeticus
-from .mannheimiavarigenausmarc1261 import MannheimiaVarigenaUsmarc1261
-from .rikenellaceaebacteriumm3 import RikenellaceaeBacteriumM3
-from .mannheimiavarigenausmarc1296 import MannheimiaVarigenaUsmarc1296
-from .dyadobactertibetensis import DyadobacterTibetensis
-from .burkholderiapseudomalleiabcpw111 import BurkholderiaPseudomalleiAbcpw111
-from .bifidobacteriummoukalabense import BifidobacteriumMoukalabense
-from .rhodococcuspyridinivorans import RhodococcusPyridinivorans
-from .criblamydiasequanensis import CriblamydiaSequanensis
-from .ochrobactrumrhizosphaerae import OchrobactrumRhizosphaerae
-from .bifidobacteriumpullorum import BifidobacteriumPullorum
-from .bifidobacteriummongoliense import BifidobacteriumMongoliense
-from .bifidobacteriumactinocoloniiforme import BifidobacteriumActinocoloniiforme
-from .bifidobacteriumbohemicum import BifidobacteriumBohemicum
-from .bifidobacteriumbiavatii import BifidobacteriumBiavatii
-from .bifidobacteriumcallitrichos import BifidobacteriumCallitrichos
-from .bifidobacteriumreuteri import BifidobacteriumReuteri
-from .castellanielladefragrans import CastellaniellaDefragrans
-from .pseudomonasnitroreducenshbp1 import PseudomonasNitroreducensHbp1
-from .sphingomonassp3524zxx import SphingomonasSp3524zxx
-from .escherichiaalbertiikf1 import EscherichiaAlbertiiKf1
-from .streptomycesscopuliridis import StreptomycesScopuliridis
-from .mycobacteriumaromaticivorans import MycobacteriumAromaticivorans
-from .pseudomonascichorii import PseudomonasCichorii
-from .serratiafonticolarb25 import SerratiaFonticolaRb25
-from .arcobactercibarius import ArcobacterCibarius
-from .myroidesodoratimimus import MyroidesOdoratimimus
-from .sulfitobactersp20gpm1509m import SulfitobacterSp20gpm1509m
-from .yersiniaenterocoliticalc20 import YersiniaEnterocoliticaLc20
-from .clostridiumnovyibnctc9691 import ClostridiumNovyiBNctc9691
-from .clostridiumbotulinumcdbkt12695 import ClostridiumBotulinumCdBkt12695
-from .aquimarinamacrocephali import AquimarinaMacrocephali
-from .sporolactobacillusterrae import SporolactobacillusTerrae
-from .brevibacillusborstelensis import BrevibacillusBorstelensis
-from .bacillusflexus import BacillusFlexus
-from .sphingobiumspap49 import SphingobiumSpAp49
-from .sphingomonassp37zxx import SphingomonasSp37zxx
-from .xylellafastidiosapls229 import XylellaFastidiosaPls229
-from .sphingomonasspkc8 import SphingomonasSpKc8
-from .pedobacterborealis import PedobacterBorealis
-from .aeromonashydrophilayl17 import AeromonasHydrophilaYl17
-from .tomitellabiformata import TomitellaBiformata
-from .streptomycesspcnt372 import StreptomycesSpCnt372
-from .halobellusrufus import HalobellusRufus
-from .spirochaetaspl21rpuld2 import SpirochaetaSpL21rpuld2
-from .staphylococcusspal1 import StaphylococcusSpAl1
-from .staphylococcussphgb0015 import StaphylococcusSpHgb0015
-from .streptococcussp73h25ap import StreptococcusSp73h25ap
-from .streptococcusspc150 import StreptococcusSpC150
-from .streptococcusspf0418 import StreptococcusSpF0418
-from .streptococcussphsism1 import StreptococcusSpHsism1
-from .streptococcusspm334 import StreptococcusSpM334
-from .streptococcusspvt162 import StreptococcusSpVt162
-from .streptomycesspaa0539 import StreptomycesSpAa0539
-from .streptomycesspbolea5 import StreptomycesSpBolea5
-from .streptomycesspcnr698 import StreptomycesSpCnr698
-from .clostridialesbacteriumdri13 import ClostridialesBacteriumDri13
-from .carnobacteriumalterfunditum import CarnobacteriumAlterfunditum
-from .carnobacteriumdivergens import CarnobacteriumDivergens
-from .carnobacteriumfunditum import CarnobacteriumFunditum
-from .carnobacteriumgallinarum import CarnobacteriumGallinarum
-from .carnobacteriummobile import CarnobacteriumMobile
-from .carnobacteriumpleistocenium import CarnobacteriumPleistocenium
-from .kitasatosporaazatica import KitasatosporaAzatica
-from .kitasatosporamediocidica import KitasatosporaMediocidica
-from .lachnospiraceaebacteriumac2029 import LachnospiraceaeBacteriumAc2029
-from .roseivivaxisoporae import RoseivivaxIsoporae
-from .scytonemahofmanni import ScytonemaHofmanni
-from .streptacidiphilusoryzae import StreptacidiphilusOryzae
-from .streptomycesyeochonensis import StreptomycesYeochonensis
-from .thermustengchongensis import ThermusTengchongensis
-from .roseivivaxhalodurans import RoseivivaxHalodurans
-from .flavobacteriumsuccinicans import FlavobacteriumSuccinicans
-from .streptomycesspe14 import StreptomycesSpE14
-from .corynebacteriumfalsenii import CorynebacteriumFalsenii
-from .streptomycessp142mfcol31 import StreptomycesSp142mfcol31
-from .streptomycesspaa4 import StreptomycesSpAa4
-from .streptomycesspc import StreptomycesSpC
-from .streptomycesspcny243 import StreptomycesSpCny243
-from .haladaptatuscibarius import HaladaptatusCibarius
-from .flavobacteriumaquatile import FlavobacteriumAquatile
-from .schleiferiathermophila import SchleiferiaThermophila
-from .streptomycesspfxanac1 import StreptomycesSpFxanac1
-from .pseudomonaspseudoalcaligenesad6 import PseudomonasPseudoalcaligenesAd6
-from .flavobacteriumchungangense import FlavobacteriumChungangense
-from .streptomycesspgxt6 import StreptomycesSpGxt6
-from .sphingomonasspmm1 import SphingomonasSpMm1
-from .streptomycessphmica12 import StreptomycesSpHmica12
-from .photobacteriumphosphoreum import PhotobacteriumPhosphoreum
-from .halapricumsalinum import HalapricumSalinum
-from .helicobacterrodentium import HelicobacterRodentium
-from .acetobacteraceti1023 import AcetobacterAceti1023
-from .hylemonellagracilisniagara import HylemonellaGracilisNiagara
-from .streptomycesspmg1 import StreptomycesSpMg1
-from .comamonadaceaebacteriumh1 import ComamonadaceaeBacteriumH1
-from .listeriaceaebacteriumfsla50209 import ListeriaceaeBacteriumFsla50209
-from .nitrososphaeraevergladensis import NitrososphaeraEvergladensis
-from .streptococcusspf0407 import StreptococcusSpF0407
-from .streptococcussphph0090 import StreptococcusSpHph0090
-from .streptococcusspsk140 import StreptococcusSpSk140
-from .streptomycessp303mfcol52 import StreptomycesSp303mfcol52
-from .streptomycesspamel2xe9 import StreptomycesSpAmel2xe9
-from .streptomycesspcnh099 import StreptomycesSpCnh099
-from .streptomycesspmspmpm5 import StreptomycesSpMspmpm5
-from .actibacteriumatlanticum import ActibacteriumAtlanticum
-from .sphingomonasspatcc31555 import SphingomonasSpAtcc31555
-from .sphingomonasspfukuswis1 import SphingomonasSpFukuswis1
-from .sphingomonasspmn802worker import SphingomonasSpMn802worker
-from .sphingomonassppamc26605 import SphingomonasSpPamc26605
-from .sphingomonassppamc26617 import SphingomonasSpPamc26617
-from .sphingomonassppr090111t3t6a import SphingomonasSpPr090111t3t6a
-from .sphingomonassprit328 import SphingomonasSpRit328
-from .sphingomonassps17 import SphingomonasSpS17
-from .sphingomonasspska58 import SphingomonasSpSka58
-from .sphingomonasspunc305mfcol52 import SphingomonasSpUnc305mfcol52
-from .sphingomonastaxi import SphingomonasTaxi
-from .sphingopyxissplc363 import SphingopyxisSpLc363
-from .sphingopyxissplc81 import SphingopyxisSpLc81
-from .sphingopyxisspmc1 import SphingopyxisSpMc1
-from .sphingopyxisspmwb1 import SphingopyxisSpMwb1
-from .spiribacterspuahsp71 import SpiribacterSpUahsp71
-from .spirochaetaspjc230 import SpirochaetaSpJc230
-from .sporosarcinaspd27 import SporosarcinaSpD27
-from .sporosarcinaspeur3222 import SporosarcinaSpEur3222
-from .staphylococcusspe463 import StaphylococcusSpE463
-from .streptococcussp2136faa import StreptococcusSp2136faa
-from .streptococcusspacc21 import StreptococcusSpAcc21
-from .streptococcusspcm6 import StreptococcusSpCm6
-from .streptococcusspf0442 import StreptococcusSpF0442
-from .streptococcusspm143 import StreptococcusSpM143
-from .streptococcusspsk643 import StreptococcusSpSk643
-from .streptomycessp351mftsu51 import StreptomycesSp351mftsu51
-from .streptomycesspatexabd23 import StreptomycesSpAtexabd23
-from .streptomycesspcnt318 import StreptomycesSpCnt318
-from .sulfuricurvumsprifrc1 import SulfuricurvumSpRifrc1
-from .synechococcusspbl107 import SynechococcusSpBl107
-from .synechococcusspcc9311 import SynechococcusSpCc9311
-from .synechococcussppcc7502 import SynechococcusSpPcc7502
-from .synechococcusspwh7803 import SynechococcusSpWh7803
-from .mollicutesbacteriumhr1 import MollicutesBacteriumHr1
-from .synechococcusspnkbg15041c import SynechococcusSpNkbg15041c
-from .thalassobiumspr2a62 import ThalassobiumSpR2a62
-from .sphingobacteriaceaebacteriumdw12 import SphingobacteriaceaeBacteriumDw12
-from .streptomycesspnrrls1777 import StreptomycesSpNrrls1777
-from .streptomycesspnrrls646 import StreptomycesSpNrrls646
-from .streptomycesspr1ns10 import StreptomycesSpR1ns10
-from .streptomycessptaa204 import StreptomycesSpTaa204
-from .sulfitobacterspmm124 import SulfitobacterSpMm124
-from .sulfurospirillumspmes import SulfurospirillumSpMes
-from .synechococcusspcc9605 import SynechococcusSpCc9605
-from .synechococcussppcc6312 import SynechococcusSpPcc6312
-from .synechococcusspwh8109 import SynechococcusSpWh8109
-from .deinococcusphoenicis import DeinococcusPhoenicis
-from .synechococcusspwh7805 import SynechococcusSpWh7805
-from .peptostreptococcaceaebacteriumva2 import PeptostreptococcaceaeBacteriumVa2
-from .streptomycesspnrrlf5135 import StreptomycesSpNrrlf5135
-from .streptomycesspnrrlf6677 import StreptomycesSpNrrlf6677
-from .streptomycesspnrrls237 import StreptomycesSpNrrls237
-from .streptomycesspnrrls87 import StreptomycesSpNrrls87
-from .streptomycesspnrrlwc3773 import StreptomycesSpNrrlwc3773
-from .streptomycessptaa486 import StreptomycesSpTaa486
-from .sulfitobacterspnb68 import SulfitobacterSpNb68
-from .sulfurospirillumspscadc import SulfurospirillumSpScadc
-from .synechococcusspcc9616 import SynechococcusSpCc9616
-from .synechococcussppcc7002 import SynechococcusSpPcc7002
-from .synechococcusspwh8016 import SynechococcusSpWh8016
-from .zetaproteobacteriabacteriumtag1 import ZetaproteobacteriaBacteriumTag1
-from .streptomycesspnrrls474 import StreptomycesSpNrrls474
-from .streptomycessppstaah124 import StreptomycesSpPstaah124
-from .streptomycesspurha0041 import StreptomycesSpUrha0041
-from .sulfitobacterspnb77 import SulfitobacterSpNb77
-from .sulfurovumspar import SulfurovumSpAr
-from .synechococcusspcc9902 import SynechococcusSpCc9902
-from .synechococcussppcc7335 import SynechococcusSpPcc7335
-from .synechococcusspwh8102 import SynechococcusSpWh8102
-from .gammaproteobacteriabacteriummfb021 import GammaproteobacteriaBacteriumMfb021
-from .tatumellaspnml063099 import TatumellaSpNml063099
-from .listeriaceaebacteriumfsla50281 import ListeriaceaeBacteriumFsla50281
-from .streptomycesspnrrls340 import StreptomycesSpNrrls340
-from .streptomycesspnrrlwc3626 import StreptomycesSpNrrlwc3626
-from .streptomycesspspb78 import StreptomycesSpSpb78
-from .subdoligranulumsp4354a2faa import SubdoligranulumSp4354a2faa
-from .sulfurihydrogenibiumspyo3aop1 import SulfurihydrogenibiumSpYo3aop1
-from .synechococcusspja33ab import SynechococcusSpJa33ab
-from .synechococcusspkordi52 import SynechococcusSpKordi52
-from .thalassotaleaspnd16a import ThalassotaleaSpNd16a
-from .bacteriumuasb270 import BacteriumUasb270
-from .streptomycessplappah108 import StreptomycesSpLappah108
-from .streptomycessplappah95 import StreptomycesSpLappah95
-from .streptomycesspnrrlb24720 import StreptomycesSpNrrlb24720
-from .streptomycesspnrrlf2890 import StreptomycesSpNrrlf2890
-from .streptomycesspnrrlf5053 import StreptomycesSpNrrlf5053
-from .streptomycesspnrrlf5123 import StreptomycesSpNrrlf5123
-from .streptomycesspnrrlf525 import StreptomycesSpNrrlf525
-from .streptomycesspnrrls118 import StreptomycesSpNrrls118
-from .streptomycesspnrrls337 import StreptomycesSpNrrls337
-from .streptomycesspnrrls920 import StreptomycesSpNrrls920
-from .streptomycesspsirexaae import StreptomycesSpSirexaae
-from .sulfitobactersph3 import SulfitobacterSpH3
-from .sulfurimonasspast10 import SulfurimonasSpAst10
-from .synechococcusspcb0101 import SynechococcusSpCb0101
-from .synechococcusspkordi100 import SynechococcusSpKordi100
-from .synechococcussprcc307 import SynechococcusSpRcc307
-from .actinobacteriumacamd5 import ActinobacteriumAcamd5
-from .streptomycesspnrrlf2580 import StreptomycesSpNrrlf2580
-from .streptomycesspnrrlf5008 import StreptomycesSpNrrlf5008
-from .streptomycesspnrrlf5065 import StreptomycesSpNrrlf5065
-from .streptomycesspnrrlf5126 import StreptomycesSpNrrlf5126
-from .streptomycesspnrrlf5630 import StreptomycesSpNrrlf5630
-from .streptomycesspnrrls149 import StreptomycesSpNrrls149
-from .streptomycesspnrrls37 import StreptomycesSpNrrls37
-from .streptomycesspnrrlwc3742 import StreptomycesSpNrrlwc3742
-from .streptomycessptaa040 import StreptomycesSpTaa040
-from .sulfitobacterspee36 import SulfitobacterSpEe36
-from .sulfuricurvumspmlsb import SulfuricurvumSpMlsb
-from .sulfurovumspnbc371 import SulfurovumSpNbc371
-from .synechococcusspja23ba import SynechococcusSpJa23ba
-from .synechococcussppcc7336 import SynechococcusSpPcc7336
-from .synergistessp31syn1 import SynergistesSp31syn1
-from .porphyromonadaceaecot184oh4590 import PorphyromonadaceaeCot184oh4590
-from .synechococcusspkordi49 import SynechococcusSpKordi49
-from .synechococcussprs9916 import SynechococcusSpRs9916
-from .synechococcussprs9917 import SynechococcusSpRs9917
-from .synechococcusspwh5701 import SynechococcusSpWh5701
-from .thiomicrospiraspkp2 import ThiomicrospiraSpKp2
-from .thiomicrospiraspmilost1 import ThiomicrospiraSpMilost1
-from .thiorhodococcusspak35 import ThiorhodococcusSpAk35
-from .tolumonasspbrl61 import TolumonasSpBrl61
-from .treponemaspjc4 import TreponemaSpJc4
-from .tsukamurellasp1534 import TsukamurellaSp1534
-from .veillonellaspf0412 import VeillonellaSpF0412
-from .verrucomicrobiumspbvorr034 import VerrucomicrobiumSpBvorr034
-from .vibriogenomosp import VibrioGenomosp
-from .virgibacillusspvm5 import VirgibacillusSpVm5
-from .wolbachiaspooc import WolbachiaSpOoc
-from .xanthobactersp126 import XanthobacterSp126
-from .xanthomonasspnyagatare import XanthomonasSpNyagatare
-from .synechocystissppcc6714 import SynechocystisSpPcc6714
-from .weeksellaspff8 import WeeksellaSpFf8
-from .wigglesworthiaglossinidiaspgmo import WigglesworthiaGlossinidiaSpGmo
-from .xenococcussppcc7305 import XenococcusSpPcc7305
-from .thioalkalivibriospale6 import ThioalkalivibrioSpAle6
-from .thioalkalivibriospalj11 import ThioalkalivibrioSpAlj11
-from .thioalkalivibriospalj16 import ThioalkalivibrioSpAlj16
-from .thioalkalivibriospalj24 import ThioalkalivibrioSpAlj24
-from .thioalkalivibriospalmg11 import ThioalkalivibrioSpAlmg11
-from .thioalkalivibriospk90mix import ThioalkalivibrioSpK90mix
-from .synechocystissppcc6803 import SynechocystisSpPcc6803
-from .synechocystissppcc7509 import SynechocystisSpPcc7509
-from .tenacibaculumsp47agom205m import TenacibaculumSp47agom205m
-from .terracoccussp273mftsu31 import TerracoccusSp273mftsu31
-from .thalassospiraaustralica import ThalassospiraAustralica
-from .thaumarchaeotaspscgcab629i23 import ThaumarchaeotaSpScgcAb629i23
-from .thermococcussp4557 import ThermococcusSp4557
-from .thermococcusspam4 import ThermococcusSpAm4
-from .thermocrinisspgbs import ThermocrinisSpGbs
-from .thermofilumsp1910b import ThermofilumSp1910b
-from .thermogemmatisporasppm5 import ThermogemmatisporaSpPm5
-from .thermomicrobialesspki4 import ThermomicrobialesSpKi4
-from .thermotogaspmc24 import ThermotogaSpMc24
-from .thermusspccbus3uf1 import ThermusSpCcbus3uf1
-from .thermusspyim77409 import ThermusSpYim77409
-from .thioalkalivibriospakl11 import ThioalkalivibrioSpAkl11
-from .thioalkalivibriospakl19 import ThioalkalivibrioSpAkl19
-from .thioalkalivibriospald1 import ThioalkalivibrioSpAld1
-from .thioalkalivibriospale19 import ThioalkalivibrioSpAle19
-from .thioalkalivibriospale31 import ThioalkalivibrioSpAle31
-from .thioalkalivibriospalj7 import ThioalkalivibrioSpAlj7
-from .thioalkalivibriospaljt import ThioalkalivibrioSpAljt
-from .thioalkalivibriospalr1721 import ThioalkalivibrioSpAlr1721
-from .thioalkalivibriospalsr1 import ThioalkalivibrioSpAlsr1
-from .thioalkalivibriosphk1 import ThioalkalivibrioSpHk1
-from .thioclavasp13d2w2 import ThioclavaSp13d2w2
-from .thioclavaspdt234 import ThioclavaSpDt234
-from .thiomicrospiraspmilost2 import ThiomicrospiraSpMilost2
-from .thiomonasspfbcd import ThiomonasSpFbcd
-from .thiorhodovibriosp970 import ThiorhodovibrioSp970
-from .treponemaspc6a8 import TreponemaSpC6a8
-from .treponemaspomz838 import TreponemaSpOmz838
-from .veillonellaspas16 import VeillonellaSpAs16
-from .veillonellaspf0422 import VeillonellaSpF0422
-from .verrucomicrobiumspbvorr106 import VerrucomicrobiumSpBvorr106
-from .wigglesworthiaglossinidiaspgbr import WigglesworthiaGlossinidiaSpGbr
-from .atelocyanobacteriumthalassasio64986 import AtelocyanobacteriumThalassaSio64986
-from .caenorhabditistropicalis import CaenorhabditisTropicalis
-from .janthinobacteriumagaricidamnosum import JanthinobacteriumAgaricidamnosum
-from .mollicutesbacteriumhr2 import MollicutesBacteriumHr2
-from .rickettsialesbacteriumac37b import RickettsialesBacteriumAc37b
-from .wolbachiaspbma import WolbachiaSpBma
-from .wolbachiaspculex import WolbachiaSpCulex
-from .wolbachiaspdme import WolbachiaSpDme
-from .wolbachiaspdsi import WolbachiaSpDsi
 
 __all__ = [
 	"PseudomonasAeruginosa", "BurkholderiaCepacia", "PseudomonasOleovorans",
@@ -6668,4 +1699,7 @@ __all__ = [
 	"CaenorhabditisTropicalis", "JanthinobacteriumAgaricidamnosum", "MollicutesBacteriumHr2",
 	"RickettsialesBacteriumAc37b", "WolbachiaSpBma", "WolbachiaSpCulex", "WolbachiaSpDme",
 	"WolbachiaSpDsi",
-]
\ No newline at end of file
+]
+
+# Names of the graphs available in this sub-module.
+AVAILABLE_GRAPHS = frozenset(__all__)
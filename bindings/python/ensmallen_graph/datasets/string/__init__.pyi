@@ -0,0 +1,5112 @@
+"""Type stubs of the methods to retrieve the graphs from STRING repository."""
+from typing import Dict, FrozenSet, List
+
+from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+from ..graph_retrieval_method import GraphRetrievalMethod
+
+AVAILABLE_GRAPHS: FrozenSet[str]
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = ...,
+    **kwargs: Dict
+) -> Dict[str, EnsmallenGraph]: ...
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = ...,
+    **kwargs: Dict
+) -> None: ...
+
+AbiotrophiaDefectiva: GraphRetrievalMethod
+AcaricomesPhytoseiuli: GraphRetrievalMethod
+AcaryochlorisMarina: GraphRetrievalMethod
+AccumulibacterPhosphatis: GraphRetrievalMethod
+AccumulibacterSpBa93: GraphRetrievalMethod
+AcetivibrioCellulolyticus: GraphRetrievalMethod
+AcetobacterAceti1023: GraphRetrievalMethod
+AcetobacterAcetiAtcc23746: GraphRetrievalMethod
+AcetobacterMalorum: GraphRetrievalMethod
+AcetobacterNitrogenifigens: GraphRetrievalMethod
+AcetobacterOkinawensis: GraphRetrievalMethod
+AcetobacterPasteurianus3p3: GraphRetrievalMethod
+AcetobacterPasteurianusIfo328301: GraphRetrievalMethod
+AcetobacteraceaeBacteriumAt5844: GraphRetrievalMethod
+AcetobacteriumWoodii: GraphRetrievalMethod
+AcetohalobiumArabaticum: GraphRetrievalMethod
+AcetonemaLongum: GraphRetrievalMethod
+AcholeplasmaAxanthum: GraphRetrievalMethod
+AcholeplasmaEquifetale: GraphRetrievalMethod
+AcholeplasmaGranularum: GraphRetrievalMethod
+AcholeplasmaHippikon: GraphRetrievalMethod
+AcholeplasmaLaidlawii: GraphRetrievalMethod
+AcholeplasmaModicum: GraphRetrievalMethod
+AchromobacterArsenitoxydans: GraphRetrievalMethod
+AchromobacterInsuavis: GraphRetrievalMethod
+AchromobacterPiechaudiiAtcc43553: GraphRetrievalMethod
+AchromobacterPiechaudiiHle: GraphRetrievalMethod
+AchromobacterSpRta: GraphRetrievalMethod
+AchromobacterXylosoxidansA8: GraphRetrievalMethod
+AchromobacterXylosoxidansNbrc15126: GraphRetrievalMethod
+AcidaminococcusFermentans: GraphRetrievalMethod
+AcidaminococcusIntestini: GraphRetrievalMethod
+AcidianusHospitalis: GraphRetrievalMethod
+AcidilobusSaccharovorans: GraphRetrievalMethod
+AcidimicrobiumFerrooxidans: GraphRetrievalMethod
+AcidiphiliumAngustum: GraphRetrievalMethod
+AcidiphiliumCryptum: GraphRetrievalMethod
+AcidithiobacillusCaldus: GraphRetrievalMethod
+AcidithiobacillusFerrivorans: GraphRetrievalMethod
+AcidithiobacillusFerrooxidansAtcc23270: GraphRetrievalMethod
+AcidithiobacillusFerrooxidansAtcc53993: GraphRetrievalMethod
+AcidithiobacillusThiooxidans: GraphRetrievalMethod
+AcidobacteriaBacteriumKbs146: GraphRetrievalMethod
+AcidobacteriaceaeBacteriumKbs83: GraphRetrievalMethod
+AcidobacteriaceaeBacteriumKbs89: GraphRetrievalMethod
+AcidobacteriaceaeBacteriumKbs96: GraphRetrievalMethod
+AcidobacteriaceaeBacteriumTaa166: GraphRetrievalMethod
+AcidobacteriumCapsulatum: GraphRetrievalMethod
+AcidobacteriumSpPmmr2: GraphRetrievalMethod
+AcidocellaFacilis: GraphRetrievalMethod
+AcidothermusCellulolyticus: GraphRetrievalMethod
+AcidovoraxCitrulli: GraphRetrievalMethod
+AcidovoraxEbreus: GraphRetrievalMethod
+AcidovoraxSpJhl9: GraphRetrievalMethod
+AcidovoraxSpJs42: GraphRetrievalMethod
+AcidovoraxSpKks102: GraphRetrievalMethod
+AcidovoraxSpMrs7: GraphRetrievalMethod
+AciduliprofundumBoonei: GraphRetrievalMethod
+AciduliprofundumSpMar08339: GraphRetrievalMethod
+AcinetobacterBaumannii: GraphRetrievalMethod
+AcinetobacterBeijerinckii: GraphRetrievalMethod
+AcinetobacterBereziniae: GraphRetrievalMethod
+AcinetobacterBohemicus: GraphRetrievalMethod
+AcinetobacterBouvetii: GraphRetrievalMethod
+AcinetobacterBrisouii: GraphRetrievalMethod
+AcinetobacterCalcoaceticus: GraphRetrievalMethod
+AcinetobacterGerneri: GraphRetrievalMethod
+AcinetobacterGuillouiae: GraphRetrievalMethod
+AcinetobacterGyllenbergii: GraphRetrievalMethod
+AcinetobacterHaemolyticus: GraphRetrievalMethod
+AcinetobacterIndicus: GraphRetrievalMethod
+AcinetobacterJohnsonii: GraphRetrievalMethod
+AcinetobacterJunii: GraphRetrievalMethod
+AcinetobacterLwoffiiNctc5866: GraphRetrievalMethod
+AcinetobacterLwoffiiSh145: GraphRetrievalMethod
+AcinetobacterLwoffiiWj10621: GraphRetrievalMethod
+AcinetobacterNectaris: GraphRetrievalMethod
+AcinetobacterOleivorans: GraphRetrievalMethod
+AcinetobacterRadioresistens: GraphRetrievalMethod
+AcinetobacterRudis: GraphRetrievalMethod
+AcinetobacterSoli: GraphRetrievalMethod
+AcinetobacterSpAdp1: GraphRetrievalMethod
+AcinetobacterSpAnc3789: GraphRetrievalMethod
+AcinetobacterSpAnc3862: GraphRetrievalMethod
+AcinetobacterSpAnc4105: GraphRetrievalMethod
+AcinetobacterSpAtcc27244: GraphRetrievalMethod
+AcinetobacterSpCip102129: GraphRetrievalMethod
+AcinetobacterSpCip562: GraphRetrievalMethod
+AcinetobacterSpCipa165: GraphRetrievalMethod
+AcinetobacterSpHr7: GraphRetrievalMethod
+AcinetobacterSpNctc7422: GraphRetrievalMethod
+AcinetobacterSpNiph2100: GraphRetrievalMethod
+AcinetobacterSpNiph758: GraphRetrievalMethod
+AcinetobacterSpNiph809: GraphRetrievalMethod
+AcinetobacterSpNiph899: GraphRetrievalMethod
+AcinetobacterSpNiph973: GraphRetrievalMethod
+AcinetobacterSpP838: GraphRetrievalMethod
+AcinetobacterSpRuh2624: GraphRetrievalMethod
+AcinetobacterSpVer3: GraphRetrievalMethod
+AcinetobacterTandoii: GraphRetrievalMethod
+AcinetobacterTjernbergiae: GraphRetrievalMethod
+AcinetobacterTowneri: GraphRetrievalMethod
+AcinetobacterUrsingii: GraphRetrievalMethod
+AcinetobacterVenetianus: GraphRetrievalMethod
+AcromyrmexEchinatior: GraphRetrievalMethod
+ActibacteriumAtlanticum: GraphRetrievalMethod
+ActinoalloteichusCyanogriseus: GraphRetrievalMethod
+ActinobacillusCapsulatus: GraphRetrievalMethod
+ActinobacillusMinor202: GraphRetrievalMethod
+ActinobacillusMinorNm305: GraphRetrievalMethod
+ActinobacillusPleuropneumoniae14074: GraphRetrievalMethod
+ActinobacillusPleuropneumoniae5bL20: GraphRetrievalMethod
+ActinobacillusSuccinogenes: GraphRetrievalMethod
+ActinobacillusSuis: GraphRetrievalMethod
+ActinobacteriumAcamd5: GraphRetrievalMethod
+ActinobacteriumLlx17: GraphRetrievalMethod
+ActinobacteriumPhsc20c1: GraphRetrievalMethod
+ActinobaculumMassiliae: GraphRetrievalMethod
+ActinobaculumSchaalii: GraphRetrievalMethod
+ActinobaculumSpF0552: GraphRetrievalMethod
+ActinobaculumUrinale: GraphRetrievalMethod
+ActinocatenisporaSera: GraphRetrievalMethod
+ActinokineosporaEnzanensis: GraphRetrievalMethod
+ActinokineosporaSpEg49: GraphRetrievalMethod
+ActinomaduraAtramentaria: GraphRetrievalMethod
+ActinomaduraFlavalba: GraphRetrievalMethod
+ActinomaduraMadurae: GraphRetrievalMethod
+ActinomycesCardiffensis: GraphRetrievalMethod
+ActinomycesColeocanis: GraphRetrievalMethod
+ActinomycesDentalis: GraphRetrievalMethod
+ActinomycesEuropaeus: GraphRetrievalMethod
+ActinomycesGeorgiae: GraphRetrievalMethod
+ActinomycesGraevenitzii: GraphRetrievalMethod
+ActinomycesIsraelii: GraphRetrievalMethod
+ActinomycesMassiliensis: GraphRetrievalMethod
+ActinomycesNaeslundii: GraphRetrievalMethod
+ActinomycesNeuiiBvs029a5: GraphRetrievalMethod
+ActinomycesNeuiiDsm8576: GraphRetrievalMethod
+ActinomycesOdontolyticus: GraphRetrievalMethod
+ActinomycesSpF0310: GraphRetrievalMethod
+ActinomycesSpF0311: GraphRetrievalMethod
+ActinomycesSpF0330: GraphRetrievalMethod
+ActinomycesSpF0332: GraphRetrievalMethod
+ActinomycesSpF0337: GraphRetrievalMethod
+ActinomycesSpF0384: GraphRetrievalMethod
+ActinomycesSpF0386: GraphRetrievalMethod
+ActinomycesSpF0400: GraphRetrievalMethod
+ActinomycesSpHpa0247: GraphRetrievalMethod
+ActinomycesSpIcm39: GraphRetrievalMethod
+ActinomycesSpIcm47: GraphRetrievalMethod
+ActinomycesSpPh3: GraphRetrievalMethod
+ActinomycesSpS4c9: GraphRetrievalMethod
+ActinomycesSpS6spd3: GraphRetrievalMethod
+ActinomycesSuimastitidis: GraphRetrievalMethod
+ActinomycesTimonensis: GraphRetrievalMethod
+ActinomycesTuricensis: GraphRetrievalMethod
+ActinomycesUrogenitalisDsm15434: GraphRetrievalMethod
+ActinomycesUrogenitalisS6c4: GraphRetrievalMethod
+ActinomycesVaccimaxillae: GraphRetrievalMethod
+ActinomycesViscosus: GraphRetrievalMethod
+ActinomycetosporaChiangmaiensis: GraphRetrievalMethod
+ActinoplanesFriuliensis: GraphRetrievalMethod
+ActinoplanesGlobisporus: GraphRetrievalMethod
+ActinoplanesMissouriensis: GraphRetrievalMethod
+ActinoplanesSpN902109: GraphRetrievalMethod
+ActinoplanesSpSe50110: GraphRetrievalMethod
+ActinoplanesSubtropicus: GraphRetrievalMethod
+ActinoplanesUtahensis: GraphRetrievalMethod
+ActinopolymorphaAlba: GraphRetrievalMethod
+ActinopolysporaErythraea: GraphRetrievalMethod
+ActinopolysporaHalophila: GraphRetrievalMethod
+ActinopolysporaMortivallis: GraphRetrievalMethod
+ActinosporangiumSpNrrlb3428: GraphRetrievalMethod
+ActinosynnemaMirum: GraphRetrievalMethod
+AcyrthosiphonPisum: GraphRetrievalMethod
+AdhaeribacterAquaticus: GraphRetrievalMethod
+AdlercreutziaEquolifaciens: GraphRetrievalMethod
+AdvenellaKashmirensisW13003: GraphRetrievalMethod
+AdvenellaMimigardefordensis: GraphRetrievalMethod
+AedesAegypti: GraphRetrievalMethod
+AegilopsTauschii: GraphRetrievalMethod
+AequorivitaCapsosiphonis: GraphRetrievalMethod
+AequorivitaSublithincola: GraphRetrievalMethod
+AerococcusUrinae: GraphRetrievalMethod
+AerococcusViridansAtcc11563: GraphRetrievalMethod
+AerococcusViridansLl1: GraphRetrievalMethod
+AeromicrobiumMarinum: GraphRetrievalMethod
+AeromicrobiumMassiliense: GraphRetrievalMethod
+AeromonasDiversa: GraphRetrievalMethod
+AeromonasHydrophilaAtcc7966: GraphRetrievalMethod
+AeromonasHydrophilaYl17: GraphRetrievalMethod
+AeromonasSalmonicida: GraphRetrievalMethod
+AeromonasSpAe122: GraphRetrievalMethod
+AeromonasVeronii: GraphRetrievalMethod
+AeropyrumCamini: GraphRetrievalMethod
+AeropyrumPernix: GraphRetrievalMethod
+AestuariibacterSalexigens: GraphRetrievalMethod
+AestuariimicrobiumKwangyangense: GraphRetrievalMethod
+AfifellaPfennigii: GraphRetrievalMethod
+AfipiaBirgiae: GraphRetrievalMethod
+AfipiaBroomeae: GraphRetrievalMethod
+AfipiaFelis: GraphRetrievalMethod
+AfipiaSp1nls2: GraphRetrievalMethod
+AfipiaSpOhsuic4: GraphRetrievalMethod
+AfipiaSpP5210: GraphRetrievalMethod
+AgaricusBisporus: GraphRetrievalMethod
+AggregatibacterActinomycetemcomitansD7s1: GraphRetrievalMethod
+AggregatibacterActinomycetemcomitansHk1651: GraphRetrievalMethod
+AggregatibacterActinomycetemcomitansRhaa1: GraphRetrievalMethod
+AggregatibacterAphrophilus: GraphRetrievalMethod
+AgrobacteriumAlbertimagni: GraphRetrievalMethod
+AgrobacteriumFabrum: GraphRetrievalMethod
+AgrobacteriumRadiobacter: GraphRetrievalMethod
+AgrobacteriumRhizogenes: GraphRetrievalMethod
+AgrobacteriumSpH133: GraphRetrievalMethod
+AgrobacteriumTumefaciensCcnwgs0286: GraphRetrievalMethod
+AgrobacteriumTumefaciensCherry: GraphRetrievalMethod
+AgrobacteriumVitis: GraphRetrievalMethod
+AgrococcusLahaulensis: GraphRetrievalMethod
+AgromycesItalicus: GraphRetrievalMethod
+AgromycesSubbeticus: GraphRetrievalMethod
+AhrensiaSp13gom1096m: GraphRetrievalMethod
+AhrensiaSpR2a130: GraphRetrievalMethod
+AiluropodaMelanoleuca: GraphRetrievalMethod
+AkkermansiaMuciniphila: GraphRetrievalMethod
+AlbugoLaibachii: GraphRetrievalMethod
+AlcaligenesFaecalis: GraphRetrievalMethod
+AlcanivoraxBorkumensis: GraphRetrievalMethod
+AlcanivoraxDieselolei: GraphRetrievalMethod
+AlcanivoraxHongdengensis: GraphRetrievalMethod
+AlcanivoraxJadensis: GraphRetrievalMethod
+AlcanivoraxSp19m6: GraphRetrievalMethod
+AlcanivoraxSp43bgom46m: GraphRetrievalMethod
+AlcanivoraxSpDg881: GraphRetrievalMethod
+AlcanivoraxSpP2s70: GraphRetrievalMethod
+AlgicolaSagamiensis: GraphRetrievalMethod
+AlgiphilusAromaticivorans: GraphRetrievalMethod
+AlgoriphagusMachipongonensis: GraphRetrievalMethod
+AlgoriphagusMannitolivorans: GraphRetrievalMethod
+AlgoriphagusMarincolaDsm16067: GraphRetrievalMethod
+AlgoriphagusMarincolaHl49: GraphRetrievalMethod
+AlgoriphagusVanfongensis: GraphRetrievalMethod
+AliagarivoransTaiwanensis: GraphRetrievalMethod
+AlicycliphilusDenitrificansBc: GraphRetrievalMethod
+AlicycliphilusDenitrificansK601: GraphRetrievalMethod
+AlicyclobacillusAcidocaldariusDsm446: GraphRetrievalMethod
+AlicyclobacillusAcidocaldariusTc41: GraphRetrievalMethod
+AlicyclobacillusAcidoterrestris: GraphRetrievalMethod
+AlicyclobacillusContaminans: GraphRetrievalMethod
+AlicyclobacillusHerbarius: GraphRetrievalMethod
+AlicyclobacillusMacrosporangiidus: GraphRetrievalMethod
+AlicyclobacillusPohliae: GraphRetrievalMethod
+AlicyclobacillusPomorum: GraphRetrievalMethod
+AliihoefleaSp2ww: GraphRetrievalMethod
+AliivibrioSalmonicida: GraphRetrievalMethod
+AlishewanellaAgri: GraphRetrievalMethod
+AlishewanellaJeotgali: GraphRetrievalMethod
+AlistipesFinegoldii: GraphRetrievalMethod
+AlistipesIndistinctus: GraphRetrievalMethod
+AlistipesMarseilloanorexicus: GraphRetrievalMethod
+AlistipesOnderdonkii: GraphRetrievalMethod
+AlistipesPutredinis: GraphRetrievalMethod
+AlistipesSenegalensis: GraphRetrievalMethod
+AlistipesSp627: GraphRetrievalMethod
+AlistipesSpHgb5: GraphRetrievalMethod
+AlkalibacteriumSpAk22: GraphRetrievalMethod
+AlkaliflexusImshenetskii: GraphRetrievalMethod
+AlkalilimnicolaEhrlichii: GraphRetrievalMethod
+AlkaliphilusMetalliredigens: GraphRetrievalMethod
+AlkaliphilusOremlandii: GraphRetrievalMethod
+AlkaliphilusTransvaalensis: GraphRetrievalMethod
+AlkanindigesIllinoisensis: GraphRetrievalMethod
+AlligatorMississippiensis: GraphRetrievalMethod
+AlligatorSinensis: GraphRetrievalMethod
+AllobaculumStercoricanis: GraphRetrievalMethod
+AllochromatiumVinosum: GraphRetrievalMethod
+AllofustisSeminis: GraphRetrievalMethod
+AlloiococcusOtitis: GraphRetrievalMethod
+AllokutzneriaAlbata: GraphRetrievalMethod
+AllomycesMacrogynus: GraphRetrievalMethod
+AlloprevotellaRava: GraphRetrievalMethod
+AlloscardoviaOmnicolens: GraphRetrievalMethod
+AlphaProteobacteriumBal199: GraphRetrievalMethod
+AlphaProteobacteriumHimb114: GraphRetrievalMethod
+AlphaProteobacteriumHimb5: GraphRetrievalMethod
+AlphaProteobacteriumHimb59: GraphRetrievalMethod
+AlphaProteobacteriumImcc14465: GraphRetrievalMethod
+AlphaProteobacteriumJlt2015: GraphRetrievalMethod
+AlphaProteobacteriumL41a: GraphRetrievalMethod
+AlphaProteobacteriumMa2: GraphRetrievalMethod
+AlphaProteobacteriumMf105b01: GraphRetrievalMethod
+AlphaProteobacteriumRs24: GraphRetrievalMethod
+AlphaproteobacteriumSar116: GraphRetrievalMethod
+AlteromonadalesBacteriumTw7: GraphRetrievalMethod
+AlteromonasAustralica: GraphRetrievalMethod
+AlteromonasMacleodiiBlack: GraphRetrievalMethod
+AlteromonasMacleodiiDeep: GraphRetrievalMethod
+AlteromonasSpAlt199: GraphRetrievalMethod
+AlteromonasSpLor: GraphRetrievalMethod
+AlteromonasSpSn2: GraphRetrievalMethod
+AltibacterLentus: GraphRetrievalMethod
+AlysiellaCrassa: GraphRetrievalMethod
+AmborellaTrichopoda: GraphRetrievalMethod
+AminicenantesBacteriumAaa252a02: GraphRetrievalMethod
+AminiphilusCircumscriptus: GraphRetrievalMethod
+AminobacterSpJ41: GraphRetrievalMethod
+AminobacteriumColombiense: GraphRetrievalMethod
+AminobacteriumMobile: GraphRetrievalMethod
+AminomonasPaucivorans: GraphRetrievalMethod
+AmmonifexDegensii: GraphRetrievalMethod
+AmoebophilusAsiaticus: GraphRetrievalMethod
+AmorphusCoralli: GraphRetrievalMethod
+AmphibacillusJilinensis: GraphRetrievalMethod
+AmphibacillusXylanus: GraphRetrievalMethod
+AmphimedonQueenslandica: GraphRetrievalMethod
+AmphriteaJaponica: GraphRetrievalMethod
+AmycolatopsisBalhimycina: GraphRetrievalMethod
+AmycolatopsisBenzoatilytica: GraphRetrievalMethod
+AmycolatopsisJaponica: GraphRetrievalMethod
+AmycolatopsisJejuensis: GraphRetrievalMethod
+AmycolatopsisMediterranei: GraphRetrievalMethod
+AmycolatopsisMethanolica: GraphRetrievalMethod
+AmycolatopsisNigrescens: GraphRetrievalMethod
+AmycolatopsisOrientalis: GraphRetrievalMethod
+AmycolatopsisRifamycinica: GraphRetrievalMethod
+AmycolatopsisVancoresmycina: GraphRetrievalMethod
+AmycolicicoccusSubflavus: GraphRetrievalMethod
+AnabaenaCylindrica: GraphRetrievalMethod
+AnabaenaSp90: GraphRetrievalMethod
+AnabaenaSpPcc7108: GraphRetrievalMethod
+AnabaenaVariabilis: GraphRetrievalMethod
+AnaeroarcusBurkinensis: GraphRetrievalMethod
+AnaerobaculumHydrogeniformans: GraphRetrievalMethod
+AnaerobaculumMobile: GraphRetrievalMethod
+AnaerobiospirillumSucciniciproducens: GraphRetrievalMethod
+AnaerococcusHydrogenalis: GraphRetrievalMethod
+AnaerococcusLactolyticusAtcc51172: GraphRetrievalMethod
+AnaerococcusLactolyticusS7113: GraphRetrievalMethod
+AnaerococcusPrevotiiAcs065vcol13: GraphRetrievalMethod
+AnaerococcusPrevotiiDsm20548: GraphRetrievalMethod
+AnaerococcusSenegalensis: GraphRetrievalMethod
+AnaerococcusSp9402080: GraphRetrievalMethod
+AnaerococcusSpPh9: GraphRetrievalMethod
+AnaerococcusTetradius: GraphRetrievalMethod
+AnaerococcusVaginalis: GraphRetrievalMethod
+AnaerofustisStercorihominis: GraphRetrievalMethod
+AnaeroglobusGeminatus: GraphRetrievalMethod
+AnaerolineaThermophila: GraphRetrievalMethod
+AnaeromyxobacterDehalogenans: GraphRetrievalMethod
+AnaeromyxobacterSpFw1095: GraphRetrievalMethod
+AnaerophagaThermohalophila: GraphRetrievalMethod
+AnaerosalibacterSpNd1: GraphRetrievalMethod
+AnaerostipesCaccae: GraphRetrievalMethod
+AnaerotruncusColihominis: GraphRetrievalMethod
+AnaerotruncusSpG3: GraphRetrievalMethod
+AnaerovibrioLipolyticus: GraphRetrievalMethod
+AnaerovibrioSpRm50: GraphRetrievalMethod
+AnaerovoraxOdorimutans: GraphRetrievalMethod
+AnaplasmaCentrale: GraphRetrievalMethod
+AnaplasmaMarginaleFlorida: GraphRetrievalMethod
+AnaplasmaMarginaleMaries: GraphRetrievalMethod
+AnaplasmaPhagocytophilum: GraphRetrievalMethod
+AnditaleaAndensis: GraphRetrievalMethod
+AndreprevotiaChitinilytica: GraphRetrievalMethod
+AneurinibacillusAneurinilyticus: GraphRetrievalMethod
+AnolisCarolinensis: GraphRetrievalMethod
+AnophelesDarlingi: GraphRetrievalMethod
+AnophelesGambiae: GraphRetrievalMethod
+AnoxybacillusFlavithermusAk1: GraphRetrievalMethod
+AnoxybacillusFlavithermusTno09006: GraphRetrievalMethod
+AnoxybacillusFlavithermusWk1: GraphRetrievalMethod
+AnoxybacillusFlavithermusYunnanensis: GraphRetrievalMethod
+AnoxybacillusGonensis: GraphRetrievalMethod
+AnoxybacillusTepidamans: GraphRetrievalMethod
+AphanomycesInvadans: GraphRetrievalMethod
+ApisMellifera: GraphRetrievalMethod
+AplysiaCalifornica: GraphRetrievalMethod
+AquabacteriumSpNj1: GraphRetrievalMethod
+AquamicrobiumDefluvii: GraphRetrievalMethod
+AquaspirillumSerpens: GraphRetrievalMethod
+AquifexAeolicus: GraphRetrievalMethod
+AquilegiaCoerulea: GraphRetrievalMethod
+AquilunaSpImcc13023: GraphRetrievalMethod
+AquimarinaAgarilytica: GraphRetrievalMethod
+AquimarinaMacrocephali: GraphRetrievalMethod
+AquimarinaMegaterium: GraphRetrievalMethod
+AquimarinaMuelleri: GraphRetrievalMethod
+AquimarinaSp22iis11z7: GraphRetrievalMethod
+AquimarinaSpSw150: GraphRetrievalMethod
+ArabidopsisLyrata: GraphRetrievalMethod
+ArabidopsisThaliana: GraphRetrievalMethod
+ArabisAlpina: GraphRetrievalMethod
+ArcanobacteriumHaemolyticum: GraphRetrievalMethod
+ArcanobacteriumSpS3pf19: GraphRetrievalMethod
+ArchaeoglobusFulgidus: GraphRetrievalMethod
+ArchaeoglobusProfundus: GraphRetrievalMethod
+ArchaeoglobusSulfaticallidus: GraphRetrievalMethod
+ArchaeoglobusVeneficus: GraphRetrievalMethod
+ArcobacterButzleriEd1: GraphRetrievalMethod
+ArcobacterButzleriRm4018: GraphRetrievalMethod
+ArcobacterCibarius: GraphRetrievalMethod
+ArcobacterNitrofigilis: GraphRetrievalMethod
+ArcobacterSpAf1028: GraphRetrievalMethod
+ArcobacterSpAf1440: GraphRetrievalMethod
+ArcobacterSpL: GraphRetrievalMethod
+ArcticibacterSvalbardensis: GraphRetrievalMethod
+ArenibacterAlgicola: GraphRetrievalMethod
+ArenibacterCertesii: GraphRetrievalMethod
+ArenibacterLatericius: GraphRetrievalMethod
+ArenimonasComposti: GraphRetrievalMethod
+ArenimonasMalthae: GraphRetrievalMethod
+ArenimonasMetalli: GraphRetrievalMethod
+ArenimonasOryziterrae: GraphRetrievalMethod
+ArenitaleaLutea: GraphRetrievalMethod
+AromatoleumAromaticum: GraphRetrievalMethod
+ArsenicicoccusBolidensis: GraphRetrievalMethod
+ArsenophonusEndosymbiont: GraphRetrievalMethod
+ArthrobacterArilaitensis: GraphRetrievalMethod
+ArthrobacterAurescens: GraphRetrievalMethod
+ArthrobacterCastelli: GraphRetrievalMethod
+ArthrobacterChlorophenolicus: GraphRetrievalMethod
+ArthrobacterGangotriensis: GraphRetrievalMethod
+ArthrobacterGlobiformis: GraphRetrievalMethod
+ArthrobacterNicotinovorans: GraphRetrievalMethod
+ArthrobacterPhenanthrenivorans: GraphRetrievalMethod
+ArthrobacterSanguinis: GraphRetrievalMethod
+ArthrobacterSp135mfcol51: GraphRetrievalMethod
+ArthrobacterSp161mfsha21: GraphRetrievalMethod
+ArthrobacterSp162mfsha11: GraphRetrievalMethod
+ArthrobacterSp31y: GraphRetrievalMethod
+ArthrobacterSp35w: GraphRetrievalMethod
+ArthrobacterSp9mfcol31: GraphRetrievalMethod
+ArthrobacterSpA3: GraphRetrievalMethod
+ArthrobacterSpAkyn10: GraphRetrievalMethod
+ArthrobacterSpBr18: GraphRetrievalMethod
+ArthrobacterSpFb24: GraphRetrievalMethod
+ArthrobacterSpH14: GraphRetrievalMethod
+ArthrobacterSpM2012083: GraphRetrievalMethod
+ArthrobacterSpMan2: GraphRetrievalMethod
+ArthrobacterSpPao19: GraphRetrievalMethod
+ArthrobacterSpTb23: GraphRetrievalMethod
+ArthrobacterSpUnc362mftsu51: GraphRetrievalMethod
+ArthrobotrysOligospora: GraphRetrievalMethod
+ArthrodermaBenhamiae: GraphRetrievalMethod
+ArthrodermaOtae: GraphRetrievalMethod
+ArthromitusSpSfbmousejapan: GraphRetrievalMethod
+ArthromitusSpSfbmousenl: GraphRetrievalMethod
+ArthromitusSpSfbratyit: GraphRetrievalMethod
+ArthrospiraPlatensisC1: GraphRetrievalMethod
+ArthrospiraPlatensisNies39: GraphRetrievalMethod
+AsaiaPlatycodiSf21: GraphRetrievalMethod
+AspergillusClavatus: GraphRetrievalMethod
+AspergillusFlavus: GraphRetrievalMethod
+AspergillusFumigatus: GraphRetrievalMethod
+AspergillusKawachii: GraphRetrievalMethod
+AspergillusNidulans: GraphRetrievalMethod
+AspergillusNiger: GraphRetrievalMethod
+AspergillusOryzae: GraphRetrievalMethod
+AspergillusTerreus: GraphRetrievalMethod
+AsticcacaulisBenevestitus: GraphRetrievalMethod
+AsticcacaulisBiprosthecum: GraphRetrievalMethod
+AsticcacaulisExcentricus: GraphRetrievalMethod
+AsticcacaulisSpAc402: GraphRetrievalMethod
+AsticcacaulisSpAc460: GraphRetrievalMethod
+AsticcacaulisSpAc466: GraphRetrievalMethod
+AstyanaxMexicanus: GraphRetrievalMethod
+AtelocyanobacteriumThalassaSio64986: GraphRetrievalMethod
+AtopobacterPhocae: GraphRetrievalMethod
+AtopobiumParvulum: GraphRetrievalMethod
+AtopobiumRimae: GraphRetrievalMethod
+AtopobiumSpBs2: GraphRetrievalMethod
+AtopobiumSpBv3ac4: GraphRetrievalMethod
+AtopobiumSpF0209: GraphRetrievalMethod
+AtopobiumSpF0494: GraphRetrievalMethod
+AtopobiumVaginaeDsm15829: GraphRetrievalMethod
+AtopobiumVaginaePb189t14: GraphRetrievalMethod
+AtopococcusTabaci: GraphRetrievalMethod
+AttaCephalotes: GraphRetrievalMethod
+AureimonasUreilytica: GraphRetrievalMethod
+AureispiraSpCcbqb1: GraphRetrievalMethod
+AureococcusAnophagefferens: GraphRetrievalMethod
+AuriculariaDelicata: GraphRetrievalMethod
+AustwickiaChelonae: GraphRetrievalMethod
+AuxenochlorellaProtothecoides: GraphRetrievalMethod
+AvibacteriumParagallinarum221: GraphRetrievalMethod
+AvibacteriumParagallinarum72: GraphRetrievalMethod
+AzoarcusSpBh72: GraphRetrievalMethod
+AzoarcusSpKh32c: GraphRetrievalMethod
+AzobacteroidesPseudotrichonymphae: GraphRetrievalMethod
+AzorhizobiumCaulinodans: GraphRetrievalMethod
+AzorhizobiumDoebereinerae: GraphRetrievalMethod
+AzospirillumHalopraeferens: GraphRetrievalMethod
+AzotobacterVinelandii: GraphRetrievalMethod
+AzovibrioRestrictus: GraphRetrievalMethod
+BabelaMassiliensis: GraphRetrievalMethod
+BabesiaBovis: GraphRetrievalMethod
+BabesiaEqui: GraphRetrievalMethod
+BacillusAidingensis: GraphRetrievalMethod
+BacillusAkibai: GraphRetrievalMethod
+BacillusAlcalophilus: GraphRetrievalMethod
+BacillusAmyloliquefaciens: GraphRetrievalMethod
+BacillusAnthracisAmes: GraphRetrievalMethod
+BacillusAnthracisSterne: GraphRetrievalMethod
+BacillusAtrophaeus: GraphRetrievalMethod
+BacillusBataviensis: GraphRetrievalMethod
+BacillusBogoriensis: GraphRetrievalMethod
+BacillusBoroniphilus: GraphRetrievalMethod
+BacillusCellulosilyticus: GraphRetrievalMethod
+BacillusCereus: GraphRetrievalMethod
+BacillusChagannorensis: GraphRetrievalMethod
+BacillusCibi: GraphRetrievalMethod
+BacillusClausii: GraphRetrievalMethod
+BacillusCoagulans26: GraphRetrievalMethod
+BacillusCoagulans36d1: GraphRetrievalMethod
+BacillusCoahuilensis: GraphRetrievalMethod
+BacillusCytotoxicus: GraphRetrievalMethod
+BacillusEndophyticus: GraphRetrievalMethod
+BacillusFirmus: GraphRetrievalMethod
+BacillusFlexus: GraphRetrievalMethod
+BacillusFordii: GraphRetrievalMethod
+BacillusGaemokensis: GraphRetrievalMethod
+BacillusGelatini: GraphRetrievalMethod
+BacillusHalodurans: GraphRetrievalMethod
+BacillusLehensis: GraphRetrievalMethod
+BacillusLicheniformis: GraphRetrievalMethod
+BacillusMacauensis: GraphRetrievalMethod
+BacillusManliponensis: GraphRetrievalMethod
+BacillusMassilioanorexius: GraphRetrievalMethod
+BacillusMassiliosenegalensis: GraphRetrievalMethod
+BacillusMegateriumMsp201: GraphRetrievalMethod
+BacillusMegateriumQmB1551: GraphRetrievalMethod
+BacillusMethanolicusMga3: GraphRetrievalMethod
+BacillusMethanolicusPb1: GraphRetrievalMethod
+BacillusMojavensis: GraphRetrievalMethod
+BacillusMycoides: GraphRetrievalMethod
+BacillusOceanisediminis: GraphRetrievalMethod
+BacillusOkhensis: GraphRetrievalMethod
+BacillusPseudofirmus: GraphRetrievalMethod
+BacillusPsychrosaccharolyticus: GraphRetrievalMethod
+BacillusPumilus: GraphRetrievalMethod
+BacillusSelenitireducens: GraphRetrievalMethod
+BacillusSimplex: GraphRetrievalMethod
+BacillusSmithii: GraphRetrievalMethod
+BacillusSonorensis: GraphRetrievalMethod
+BacillusSp123mfchir2: GraphRetrievalMethod
+BacillusSp1nla3e: GraphRetrievalMethod
+BacillusSp2a57ct2: GraphRetrievalMethod
+BacillusSp37ma: GraphRetrievalMethod
+BacillusSpDw54: GraphRetrievalMethod
+BacillusSpEb01: GraphRetrievalMethod
+BacillusSpFf3: GraphRetrievalMethod
+BacillusSpFf4: GraphRetrievalMethod
+BacillusSpG2: GraphRetrievalMethod
+BacillusSpJ33: GraphRetrievalMethod
+BacillusSpJ37: GraphRetrievalMethod
+BacillusSpJce: GraphRetrievalMethod
+BacillusSpJcm19046: GraphRetrievalMethod
+BacillusSpKw12: GraphRetrievalMethod
+BacillusSpL1: GraphRetrievalMethod
+BacillusSpM313: GraphRetrievalMethod
+BacillusSpMb2021: GraphRetrievalMethod
+BacillusSpMt2: GraphRetrievalMethod
+BacillusSpNsp222: GraphRetrievalMethod
+BacillusSpSjs: GraphRetrievalMethod
+BacillusSpTs2: GraphRetrievalMethod
+BacillusSpUnc438cl73tsus30: GraphRetrievalMethod
+BacillusSubtilis: GraphRetrievalMethod
+BacillusThermoamylovorans: GraphRetrievalMethod
+BacillusTimonensis: GraphRetrievalMethod
+BacillusVietnamensis: GraphRetrievalMethod
+BacillusVireti: GraphRetrievalMethod
+BacillusWeihenstephanensis: GraphRetrievalMethod
+BacillusXiamenensis: GraphRetrievalMethod
+BacteriovoraxMarinus: GraphRetrievalMethod
+BacteriovoraxSpBal6x: GraphRetrievalMethod
+BacteriovoraxSpBsw11iv: GraphRetrievalMethod
+BacteriovoraxSpSeq25v: GraphRetrievalMethod
+BacteriumSpJkg1: GraphRetrievalMethod
+BacteriumSpLf3: GraphRetrievalMethod
+BacteriumSpMs4: GraphRetrievalMethod
+BacteriumSpOl1: GraphRetrievalMethod
+BacteriumUasb270: GraphRetrievalMethod
+BacteroidaceaeBacteriumMs4: GraphRetrievalMethod
+BacteroidesBarnesiae: GraphRetrievalMethod
+BacteroidesCaccae: GraphRetrievalMethod
+BacteroidesCellulosilyticus: GraphRetrievalMethod
+BacteroidesClarus: GraphRetrievalMethod
+BacteroidesCoprocola: GraphRetrievalMethod
+BacteroidesCoprophilus: GraphRetrievalMethod
+BacteroidesCoprosuis: GraphRetrievalMethod
+BacteroidesDorei: GraphRetrievalMethod
+BacteroidesEggerthii: GraphRetrievalMethod
+BacteroidesFaecis: GraphRetrievalMethod
+BacteroidesFinegoldii: GraphRetrievalMethod
+BacteroidesFluxus: GraphRetrievalMethod
+BacteroidesFragilis3112: GraphRetrievalMethod
+BacteroidesFragilisNctc9343: GraphRetrievalMethod
+BacteroidesGraminisolvens: GraphRetrievalMethod
+BacteroidesHelcogenes: GraphRetrievalMethod
+BacteroidesIntestinalis: GraphRetrievalMethod
+BacteroidesMassiliensisB84634: GraphRetrievalMethod
+BacteroidesMassiliensisDnlkv3: GraphRetrievalMethod
+BacteroidesNordii: GraphRetrievalMethod
+BacteroidesOleiciplenus: GraphRetrievalMethod
+BacteroidesOvatus: GraphRetrievalMethod
+BacteroidesPectinophilus: GraphRetrievalMethod
+BacteroidesPlebeius: GraphRetrievalMethod
+BacteroidesPyogenesDsm20611: GraphRetrievalMethod
+BacteroidesPyogenesJcm10003: GraphRetrievalMethod
+BacteroidesSalanitronis: GraphRetrievalMethod
+BacteroidesSalyersiae: GraphRetrievalMethod
+BacteroidesSpD20: GraphRetrievalMethod
+BacteroidesSpGa6a2: GraphRetrievalMethod
+BacteroidesStercorirosoris: GraphRetrievalMethod
+BacteroidesStercoris: GraphRetrievalMethod
+BacteroidesThetaiotaomicron: GraphRetrievalMethod
+BacteroidesUniformis: GraphRetrievalMethod
+BacteroidesVulgatus: GraphRetrievalMethod
+BacteroidesXylanisolvens: GraphRetrievalMethod
+BacteroidetesBacteriumScgcAaa027n21: GraphRetrievalMethod
+BacteroidetesF0058: GraphRetrievalMethod
+BalaenopteraAcutorostrata: GraphRetrievalMethod
+BalneolaVulgaris: GraphRetrievalMethod
+BarnesiellaIntestinihominis: GraphRetrievalMethod
+BarnesiellaViscericola: GraphRetrievalMethod
+BartonellaAlsatica: GraphRetrievalMethod
+BartonellaAustralis: GraphRetrievalMethod
+BartonellaBacilliformis: GraphRetrievalMethod
+BartonellaBirtlesii: GraphRetrievalMethod
+BartonellaBovis: GraphRetrievalMethod
+BartonellaClarridgeiae: GraphRetrievalMethod
+BartonellaDoshiae: GraphRetrievalMethod
+BartonellaElizabethae: GraphRetrievalMethod
+BartonellaGrahamii: GraphRetrievalMethod
+BartonellaHenselae: GraphRetrievalMethod
+BartonellaKoehlerae: GraphRetrievalMethod
+BartonellaMelophagi: GraphRetrievalMethod
+BartonellaQuintana: GraphRetrievalMethod
+BartonellaRattaustraliani: GraphRetrievalMethod
+BartonellaRattimassiliensis: GraphRetrievalMethod
+BartonellaRochalimae: GraphRetrievalMethod
+BartonellaSchoenbuchensis: GraphRetrievalMethod
+BartonellaSenegalensis: GraphRetrievalMethod
+BartonellaSpDb56: GraphRetrievalMethod
+BartonellaSpR4: GraphRetrievalMethod
+BartonellaTamiae: GraphRetrievalMethod
+BartonellaTaylorii: GraphRetrievalMethod
+BartonellaTribocorum: GraphRetrievalMethod
+BartonellaVinsoniiArupensis: GraphRetrievalMethod
+BartonellaVinsoniiBerkhoffii: GraphRetrievalMethod
+BartonellaWashoensis: GraphRetrievalMethod
+BasileaPsittacipulmonis: GraphRetrievalMethod
+BathycoccusPrasinos: GraphRetrievalMethod
+BatrachochytriumDendrobatidis: GraphRetrievalMethod
+BaudoiniaCompniacensis: GraphRetrievalMethod
+BaumanniaCicadellinicola: GraphRetrievalMethod
+BavariicoccusSeileri: GraphRetrievalMethod
+BdellovibrioBacteriovorusHd100: GraphRetrievalMethod
+BdellovibrioBacteriovorusW: GraphRetrievalMethod
+BdellovibrioExovorus: GraphRetrievalMethod
+BeauveriaBassiana: GraphRetrievalMethod
+BeggiatoaAlba: GraphRetrievalMethod
+BeijerinckiaIndica: GraphRetrievalMethod
+BeijerinckiaMobilis: GraphRetrievalMethod
+BelliellaBaltica: GraphRetrievalMethod
+BelnapiaMoabensis: GraphRetrievalMethod
+BergeyellaZoohelcum: GraphRetrievalMethod
+BetaProteobacteriumCb: GraphRetrievalMethod
+BetaProteobacteriumKb13: GraphRetrievalMethod
+BetaVulgaris: GraphRetrievalMethod
+BetaproteobacteriaBacteriumMola814: GraphRetrievalMethod
+BeutenbergiaCavernae: GraphRetrievalMethod
+BhargavaeaCecembensis: GraphRetrievalMethod
+BibersteiniaTrehalosi: GraphRetrievalMethod
+BifidobacteriumActinocoloniiforme: GraphRetrievalMethod
+BifidobacteriumAdolescentis: GraphRetrievalMethod
+BifidobacteriumAngulatum: GraphRetrievalMethod
+BifidobacteriumAnimalis: GraphRetrievalMethod
+BifidobacteriumAsteroides: GraphRetrievalMethod
+BifidobacteriumBiavatii: GraphRetrievalMethod
+BifidobacteriumBifidumNcimb41171: GraphRetrievalMethod
+BifidobacteriumBifidumPrl2010: GraphRetrievalMethod
+BifidobacteriumBohemicum: GraphRetrievalMethod
+BifidobacteriumBombi: GraphRetrievalMethod
+BifidobacteriumBreve: GraphRetrievalMethod
+BifidobacteriumCallitrichos: GraphRetrievalMethod
+BifidobacteriumCatenulatum: GraphRetrievalMethod
+BifidobacteriumChoerinum: GraphRetrievalMethod
+BifidobacteriumCoryneforme: GraphRetrievalMethod
+BifidobacteriumCrudilactis: GraphRetrievalMethod
+BifidobacteriumCuniculi: GraphRetrievalMethod
+BifidobacteriumDentium: GraphRetrievalMethod
+BifidobacteriumGallicum: GraphRetrievalMethod
+BifidobacteriumGallinarum: GraphRetrievalMethod
+BifidobacteriumLongum: GraphRetrievalMethod
+BifidobacteriumMagnum: GraphRetrievalMethod
+BifidobacteriumMerycicum: GraphRetrievalMethod
+BifidobacteriumMinimum: GraphRetrievalMethod
+BifidobacteriumMongoliense: GraphRetrievalMethod
+BifidobacteriumMoukalabense: GraphRetrievalMethod
+BifidobacteriumPseudocatenulatum: GraphRetrievalMethod
+BifidobacteriumPseudolongum: GraphRetrievalMethod
+BifidobacteriumPseudolongumGlobosum: GraphRetrievalMethod
+BifidobacteriumPsychraerophilum: GraphRetrievalMethod
+BifidobacteriumPullorum: GraphRetrievalMethod
+BifidobacteriumReuteri: GraphRetrievalMethod
+BifidobacteriumRuminantium: GraphRetrievalMethod
+BifidobacteriumScardovii: GraphRetrievalMethod
+BifidobacteriumSp7101: GraphRetrievalMethod
+BifidobacteriumSpA11: GraphRetrievalMethod
+BifidobacteriumStellenboschense: GraphRetrievalMethod
+BifidobacteriumSubtile: GraphRetrievalMethod
+BifidobacteriumThermophilum: GraphRetrievalMethod
+BifidobacteriumTsurumiense: GraphRetrievalMethod
+BigelowiellaNatans: GraphRetrievalMethod
+BilophilaWadsworthia316: GraphRetrievalMethod
+BilophilaWadsworthiaAtcc49260: GraphRetrievalMethod
+BipolarisMaydis: GraphRetrievalMethod
+BipolarisOryzae: GraphRetrievalMethod
+BipolarisSorokiniana: GraphRetrievalMethod
+BipolarisZeicola: GraphRetrievalMethod
+BizioniaArgentinensis: GraphRetrievalMethod
+BlastococcusMassiliensis: GraphRetrievalMethod
+BlastococcusSaxobsidens: GraphRetrievalMethod
+BlastococcusSpUrhd0036: GraphRetrievalMethod
+BlastomonasSpAap53: GraphRetrievalMethod
+BlastomycesDermatitidis: GraphRetrievalMethod
+BlastopirellulaMarina: GraphRetrievalMethod
+BlattabacteriumSpBge: GraphRetrievalMethod
+BlattabacteriumSpBgi: GraphRetrievalMethod
+BlattabacteriumSpBpaa: GraphRetrievalMethod
+BlattabacteriumSpBplan: GraphRetrievalMethod
+BlattabacteriumSpCpu: GraphRetrievalMethod
+BlattabacteriumSpMadar: GraphRetrievalMethod
+BlattabacteriumSpNci: GraphRetrievalMethod
+BlautiaHansenii: GraphRetrievalMethod
+BlautiaHydrogenotrophica: GraphRetrievalMethod
+BlautiaProducta: GraphRetrievalMethod
+BlautiaWexlerae: GraphRetrievalMethod
+BlochmanniaFloridanus: GraphRetrievalMethod
+BlochmanniaPennsylvanicus: GraphRetrievalMethod
+BlumeriaGraminis: GraphRetrievalMethod
+BoecheraStricta: GraphRetrievalMethod
+BombusImpatiens: GraphRetrievalMethod
+BombyxMori: GraphRetrievalMethod
+BordetellaAvium: GraphRetrievalMethod
+BordetellaBronchiseptica: GraphRetrievalMethod
+BordetellaHinzii: GraphRetrievalMethod
+BordetellaHolmesii: GraphRetrievalMethod
+BordetellaPertussis18323: GraphRetrievalMethod
+BordetellaPertussisTohama: GraphRetrievalMethod
+BordetellaPetrii: GraphRetrievalMethod
+BordetellaSpFb8: GraphRetrievalMethod
+BordetellaTrematum: GraphRetrievalMethod
+BorreliaAfzelii: GraphRetrievalMethod
+BorreliaAnserina: GraphRetrievalMethod
+BorreliaBissettii: GraphRetrievalMethod
+BorreliaCoriaceae: GraphRetrievalMethod
+BorreliaDuttonii: GraphRetrievalMethod
+BorreliaGarinii: GraphRetrievalMethod
+BorreliaHermsii: GraphRetrievalMethod
+BorreliaMiyamotoi: GraphRetrievalMethod
+BorreliaParkeri: GraphRetrievalMethod
+BorreliaPersica: GraphRetrievalMethod
+BorreliaSpielmanii: GraphRetrievalMethod
+BorreliaTuricatae: GraphRetrievalMethod
+BorreliaValaisianaTom4006: GraphRetrievalMethod
+BorreliaValaisianaVs116: GraphRetrievalMethod
+BosMutus: GraphRetrievalMethod
+BosTaurus: GraphRetrievalMethod
+BoseaSp117: GraphRetrievalMethod
+BoseaSpLc85: GraphRetrievalMethod
+BoseaSpUnc402clcol: GraphRetrievalMethod
+BotrytisCinerea: GraphRetrievalMethod
+BrachybacteriumFaecium: GraphRetrievalMethod
+BrachybacteriumParaconglomeratum: GraphRetrievalMethod
+BrachybacteriumPhenoliresistens: GraphRetrievalMethod
+BrachybacteriumSquillarum: GraphRetrievalMethod
+BrachymonasChironomi: GraphRetrievalMethod
+BrachypodiumDistachyon: GraphRetrievalMethod
+BrachyspiraHampsonii: GraphRetrievalMethod
+BrachyspiraHyodysenteriae: GraphRetrievalMethod
+BrachyspiraIntermedia: GraphRetrievalMethod
+BrachyspiraMurdochii: GraphRetrievalMethod
+BrachyspiraPilosicoli: GraphRetrievalMethod
+BradyrhizobiaceaeBacteriumSg6c: GraphRetrievalMethod
+BradyrhizobiumDiazoefficiens: GraphRetrievalMethod
+BradyrhizobiumElkaniiUsda76: GraphRetrievalMethod
+BradyrhizobiumElkaniiWsm1741: GraphRetrievalMethod
+BradyrhizobiumElkaniiWsm2783: GraphRetrievalMethod
+BradyrhizobiumGenosp: GraphRetrievalMethod
+BradyrhizobiumJaponicum22: GraphRetrievalMethod
+BradyrhizobiumJaponicumIn8p8: GraphRetrievalMethod
+BradyrhizobiumJaponicumUsda124: GraphRetrievalMethod
+BradyrhizobiumJaponicumUsda6: GraphRetrievalMethod
+BradyrhizobiumOligotrophicum: GraphRetrievalMethod
+BradyrhizobiumSpAi1a2: GraphRetrievalMethod
+BradyrhizobiumSpArr65: GraphRetrievalMethod
+BradyrhizobiumSpBtai1: GraphRetrievalMethod
+BradyrhizobiumSpCp53: GraphRetrievalMethod
+BradyrhizobiumSpDfci1: GraphRetrievalMethod
+BradyrhizobiumSpDoa9: GraphRetrievalMethod
+BradyrhizobiumSpEc33: GraphRetrievalMethod
+BradyrhizobiumSpOhsuiii: GraphRetrievalMethod
+BradyrhizobiumSpOrs278: GraphRetrievalMethod
+BradyrhizobiumSpS23321: GraphRetrievalMethod
+BradyrhizobiumSpThb2: GraphRetrievalMethod
+BradyrhizobiumSpTv2a2: GraphRetrievalMethod
+BradyrhizobiumSpUrha0002: GraphRetrievalMethod
+BradyrhizobiumSpUrhd0069: GraphRetrievalMethod
+BradyrhizobiumSpWsm1253: GraphRetrievalMethod
+BradyrhizobiumSpWsm1743: GraphRetrievalMethod
+BradyrhizobiumSpWsm2793: GraphRetrievalMethod
+BradyrhizobiumSpWsm3983: GraphRetrievalMethod
+BranchiostomaFloridae: GraphRetrievalMethod
+BrassicaOleracea: GraphRetrievalMethod
+BrassicaRapa: GraphRetrievalMethod
+BrenneriaSpEnid312: GraphRetrievalMethod
+BrevibacillusBorstelensis: GraphRetrievalMethod
+BrevibacillusBrevisNbrc100599: GraphRetrievalMethod
+BrevibacillusBrevisX23: GraphRetrievalMethod
+BrevibacillusLaterosporusDsm25: GraphRetrievalMethod
+BrevibacillusLaterosporusLmg15441: GraphRetrievalMethod
+BrevibacillusMassiliensis: GraphRetrievalMethod
+BrevibacillusPanacihumi: GraphRetrievalMethod
+BrevibacteriumCasei: GraphRetrievalMethod
+BrevibacteriumLinens: GraphRetrievalMethod
+BrevibacteriumMassiliense: GraphRetrievalMethod
+BrevibacteriumMcbrellneri: GraphRetrievalMethod
+BrevibacteriumSenegalense: GraphRetrievalMethod
+BrevibacteriumSpVcm10: GraphRetrievalMethod
+BrevundimonasAveniformis: GraphRetrievalMethod
+BrevundimonasBacteroides: GraphRetrievalMethod
+BrevundimonasDiminuta4704: GraphRetrievalMethod
+BrevundimonasNaejangsanensis: GraphRetrievalMethod
+BrevundimonasSpBal3: GraphRetrievalMethod
+BrevundimonasSubvibrioides: GraphRetrievalMethod
+BrucellaMelitensis: GraphRetrievalMethod
+BryobacterAggregatus: GraphRetrievalMethod
+BubalusBubalis: GraphRetrievalMethod
+BuchneraAphidicolaAk: GraphRetrievalMethod
+BuchneraAphidicolaAps: GraphRetrievalMethod
+BuchneraAphidicolaBcc: GraphRetrievalMethod
+BuchneraAphidicolaBp: GraphRetrievalMethod
+BuchneraAphidicolaCtu: GraphRetrievalMethod
+BuchneraAphidicolaG002: GraphRetrievalMethod
+BuchneraAphidicolaSg: GraphRetrievalMethod
+BuchneraAphidicolaUa: GraphRetrievalMethod
+BudviciaAquatica: GraphRetrievalMethod
+BulleidiaExtructa: GraphRetrievalMethod
+BurkholderiaAcidipaludis: GraphRetrievalMethod
+BurkholderiaAmbifaria: GraphRetrievalMethod
+BurkholderiaBannensis: GraphRetrievalMethod
+BurkholderiaBryophila: GraphRetrievalMethod
+BurkholderiaCenocepacia: GraphRetrievalMethod
+BurkholderiaCepacia: GraphRetrievalMethod
+BurkholderiaDilworthii: GraphRetrievalMethod
+BurkholderiaFerrariae: GraphRetrievalMethod
+BurkholderiaGladioli: GraphRetrievalMethod
+BurkholderiaGlumae: GraphRetrievalMethod
+BurkholderiaGrimmiae: GraphRetrievalMethod
+BurkholderiaMallei: GraphRetrievalMethod
+BurkholderiaMimosarum: GraphRetrievalMethod
+BurkholderiaMultivorans: GraphRetrievalMethod
+BurkholderiaNodosa: GraphRetrievalMethod
+BurkholderiaOklahomensis: GraphRetrievalMethod
+BurkholderiaPhenoliruptrix: GraphRetrievalMethod
+BurkholderiaPhymatum: GraphRetrievalMethod
+BurkholderiaPhytofirmans: GraphRetrievalMethod
+BurkholderiaPseudomalleiAbcpw111: GraphRetrievalMethod
+BurkholderiaPseudomalleiK96243: GraphRetrievalMethod
+BurkholderiaRhizoxinica: GraphRetrievalMethod
+BurkholderiaSacchari: GraphRetrievalMethod
+BurkholderiaSordidicola: GraphRetrievalMethod
+BurkholderiaSp9120: GraphRetrievalMethod
+BurkholderiaSpCcge1001: GraphRetrievalMethod
+BurkholderiaSpCcge1002: GraphRetrievalMethod
+BurkholderiaSpCcge1003: GraphRetrievalMethod
+BurkholderiaSpJpy347: GraphRetrievalMethod
+BurkholderiaSpK24: GraphRetrievalMethod
+BurkholderiaSpLig30: GraphRetrievalMethod
+BurkholderiaSpMp1: GraphRetrievalMethod
+BurkholderiaSpWsm2230: GraphRetrievalMethod
+BurkholderiaSpYi23: GraphRetrievalMethod
+BurkholderiaTerrae: GraphRetrievalMethod
+BurkholderiaVietnamiensis: GraphRetrievalMethod
+BurkholderiaXenovorans: GraphRetrievalMethod
+BurkholderiaceaeSpMortierella: GraphRetrievalMethod
+BurkholderialesBacterium1147: GraphRetrievalMethod
+BurkholderialesBacteriumJoshi001: GraphRetrievalMethod
+BursaphelenchusXylophilus: GraphRetrievalMethod
+ButtiauxellaAgrestis: GraphRetrievalMethod
+ButyricicoccusPullicaecorum: GraphRetrievalMethod
+ButyricimonasSynergistica: GraphRetrievalMethod
+ButyrivibrioCrossotus: GraphRetrievalMethod
+ButyrivibrioFibrisolvensNd3005: GraphRetrievalMethod
+ButyrivibrioProteoclasticusB316: GraphRetrievalMethod
+ButyrivibrioProteoclasticusP6b7: GraphRetrievalMethod
+ButyrivibrioSpAe2015: GraphRetrievalMethod
+ButyrivibrioSpAe3004: GraphRetrievalMethod
+ButyrivibrioSpAe3006: GraphRetrievalMethod
+ButyrivibrioSpAe3009: GraphRetrievalMethod
+ButyrivibrioSpFc2001: GraphRetrievalMethod
+ButyrivibrioSpFcs014: GraphRetrievalMethod
+ButyrivibrioSpLc3010: GraphRetrievalMethod
+ButyrivibrioSpMc2013: GraphRetrievalMethod
+ButyrivibrioSpMc2021: GraphRetrievalMethod
+ButyrivibrioSpNc3005: GraphRetrievalMethod
+ButyrivibrioSpVcb2006: GraphRetrievalMethod
+ButyrivibrioSpVcd2006: GraphRetrievalMethod
+ButyrivibrioSpWcd2001: GraphRetrievalMethod
+ButyrivibrioSpWcd3002: GraphRetrievalMethod
+ButyrivibrioSpXbb1001: GraphRetrievalMethod
+ButyrivibrioSpXpd2006: GraphRetrievalMethod
+ByssochlamysSpectabilis: GraphRetrievalMethod
+CaedibacterAcanthamoebae: GraphRetrievalMethod
+CaenispirillumSalinarum: GraphRetrievalMethod
+CaenorhabditisBrenneri: GraphRetrievalMethod
+CaenorhabditisBriggsae: GraphRetrievalMethod
+CaenorhabditisElegans: GraphRetrievalMethod
+CaenorhabditisJaponica: GraphRetrievalMethod
+CaenorhabditisRemanei: GraphRetrievalMethod
+CaenorhabditisTropicalis: GraphRetrievalMethod
+CaldalkalibacillusThermarum: GraphRetrievalMethod
+CaldanaerobacterSubterraneus: GraphRetrievalMethod
+CaldanaerobiusPolysaccharolyticus: GraphRetrievalMethod
+CaldicellulosiruptorBescii: GraphRetrievalMethod
+CaldicellulosiruptorHydrothermalis: GraphRetrievalMethod
+CaldicellulosiruptorKristjanssonii: GraphRetrievalMethod
+CaldicellulosiruptorObsidiansis: GraphRetrievalMethod
+CaldicellulosiruptorOwensensis: GraphRetrievalMethod
+CaldicellulosiruptorSaccharolyticus: GraphRetrievalMethod
+CaldicoprobacterOshimai: GraphRetrievalMethod
+CaldilineaAerophila: GraphRetrievalMethod
+CaldimonasManganoxidans: GraphRetrievalMethod
+CaldisericumExile: GraphRetrievalMethod
+CaldisphaeraLagunensis: GraphRetrievalMethod
+CalditerrivibrioNitroreducens: GraphRetrievalMethod
+CaldithrixAbyssi: GraphRetrievalMethod
+CaldivirgaMaquilingensis: GraphRetrievalMethod
+CallithrixJacchus: GraphRetrievalMethod
+CaloramatorAustralicus: GraphRetrievalMethod
+CaloramatorSpAld01: GraphRetrievalMethod
+CalothrixSp3363: GraphRetrievalMethod
+CalothrixSpPcc6303: GraphRetrievalMethod
+CalothrixSpPcc7103: GraphRetrievalMethod
+CalothrixSpPcc7507: GraphRetrievalMethod
+CamelinaSativa: GraphRetrievalMethod
+CampylobacterColi76339: GraphRetrievalMethod
+CampylobacterConcisus13826: GraphRetrievalMethod
+CampylobacterConcisusAtcc51562: GraphRetrievalMethod
+CampylobacterCuniculorum: GraphRetrievalMethod
+CampylobacterFetus8240: GraphRetrievalMethod
+CampylobacterFetusTestudinum: GraphRetrievalMethod
+CampylobacterFetusVenerealis: GraphRetrievalMethod
+CampylobacterGracilis: GraphRetrievalMethod
+CampylobacterHominis: GraphRetrievalMethod
+CampylobacterJejuni414: GraphRetrievalMethod
+CampylobacterJejuni81176: GraphRetrievalMethod
+CampylobacterJejuniNctc11168: GraphRetrievalMethod
+CampylobacterLari: GraphRetrievalMethod
+CampylobacterRectus: GraphRetrievalMethod
+CampylobacterShowaeCsunswcd: GraphRetrievalMethod
+CampylobacterShowaeRm3277: GraphRetrievalMethod
+CampylobacterSp1485e: GraphRetrievalMethod
+CampylobacterSpCit045: GraphRetrievalMethod
+CampylobacterSpMit975078: GraphRetrievalMethod
+CampylobacterSputorum: GraphRetrievalMethod
+CampylobacterUpsaliensis: GraphRetrievalMethod
+CampylobacterUreolyticus: GraphRetrievalMethod
+CandidaAlbicans: GraphRetrievalMethod
+CandidaDubliniensis: GraphRetrievalMethod
+CandidaGlabrata: GraphRetrievalMethod
+CandidaMaltosa: GraphRetrievalMethod
+CandidaOrthopsilosis: GraphRetrievalMethod
+CandidaParapsilosis: GraphRetrievalMethod
+CandidaTenuis: GraphRetrievalMethod
+CandidaTropicalis: GraphRetrievalMethod
+CandidateDivisionTm6: GraphRetrievalMethod
+CandidateDivisionZixi: GraphRetrievalMethod
+CanisLupus: GraphRetrievalMethod
+CapnocytophagaCanimorsus: GraphRetrievalMethod
+CapnocytophagaCynodegmi: GraphRetrievalMethod
+CapnocytophagaGingivalis: GraphRetrievalMethod
+CapnocytophagaGranulosa: GraphRetrievalMethod
+CapnocytophagaOchraceaDsm7271: GraphRetrievalMethod
+CapnocytophagaOchraceaF0287: GraphRetrievalMethod
+CapnocytophagaSpF0087: GraphRetrievalMethod
+CapnocytophagaSpF0234: GraphRetrievalMethod
+CapnocytophagaSpF0381: GraphRetrievalMethod
+CapnocytophagaSpF0382: GraphRetrievalMethod
+CapnocytophagaSpF0517: GraphRetrievalMethod
+CapnocytophagaSputigena: GraphRetrievalMethod
+CaproniaCoronata: GraphRetrievalMethod
+CaproniaEpimyces: GraphRetrievalMethod
+CapsasporaOwczarzaki: GraphRetrievalMethod
+CapsellaGrandiflora: GraphRetrievalMethod
+CapsellaRubella: GraphRetrievalMethod
+CarboxydothermusHydrogenoformans: GraphRetrievalMethod
+CardiniumEndosymbiontCbtq1: GraphRetrievalMethod
+CardiniumEndosymbiontCeper1: GraphRetrievalMethod
+CaricaPapaya: GraphRetrievalMethod
+CarnimonasNigrificans: GraphRetrievalMethod
+CarnobacteriumAlterfunditum: GraphRetrievalMethod
+CarnobacteriumDivergens: GraphRetrievalMethod
+CarnobacteriumFunditum: GraphRetrievalMethod
+CarnobacteriumGallinarum: GraphRetrievalMethod
+CarnobacteriumMaltaromaticum: GraphRetrievalMethod
+CarnobacteriumMobile: GraphRetrievalMethod
+CarnobacteriumPleistocenium: GraphRetrievalMethod
+CarnobacteriumSp174: GraphRetrievalMethod
+CarnobacteriumSpWn1359: GraphRetrievalMethod
+CastellaniellaDefragrans: GraphRetrievalMethod
+CatellicoccusMarimammalium: GraphRetrievalMethod
+CatelliglobosisporaKoreensis: GraphRetrievalMethod
+CatenovulumAgarivoransDs2: GraphRetrievalMethod
+CatenulisporaAcidiphila: GraphRetrievalMethod
+CatenuloplanesJaponicus: GraphRetrievalMethod
+CatonellaMorbi: GraphRetrievalMethod
+CaulobacterCrescentusCb15: GraphRetrievalMethod
+CaulobacterCrescentusOr37: GraphRetrievalMethod
+CaulobacterHenricii: GraphRetrievalMethod
+CaulobacterSegnis: GraphRetrievalMethod
+CaulobacterSpK31: GraphRetrievalMethod
+CaulobacterSpUnc358mftsu51: GraphRetrievalMethod
+CaulobacteraceaeBacteriumPmmr1: GraphRetrievalMethod
+CaviaPorcellus: GraphRetrievalMethod
+CedeceaNeteri: GraphRetrievalMethod
+CeleribacterBaekdonensis: GraphRetrievalMethod
+CellulomonasFimi: GraphRetrievalMethod
+CellulomonasFlavigena: GraphRetrievalMethod
+CellulomonasMassiliensis: GraphRetrievalMethod
+CellulomonasSpHzm: GraphRetrievalMethod
+CellulomonasSpKrmcy2: GraphRetrievalMethod
+CellulomonasSpUrhe0023: GraphRetrievalMethod
+CellulophagaAlgicola: GraphRetrievalMethod
+CellulophagaBaltica: GraphRetrievalMethod
+CellulophagaLytica: GraphRetrievalMethod
+CellulosimicrobiumCellulans: GraphRetrievalMethod
+CellvibrioGilvus: GraphRetrievalMethod
+CellvibrioJaponicus: GraphRetrievalMethod
+CellvibrioMixtus: GraphRetrievalMethod
+CellvibrioSpBr: GraphRetrievalMethod
+CentipedaPeriodontii: GraphRetrievalMethod
+CeratitisCapitata: GraphRetrievalMethod
+CesiribacterAndamanensis: GraphRetrievalMethod
+CetobacteriumSomerae: GraphRetrievalMethod
+ChaetomiumGlobosum: GraphRetrievalMethod
+ChaetomiumThermophilum: GraphRetrievalMethod
+ChamaesiphonMinutus: GraphRetrievalMethod
+ChelativoransSpBnc1: GraphRetrievalMethod
+ChelativoransSpJ32: GraphRetrievalMethod
+ChelatococcusSpGw1: GraphRetrievalMethod
+CheloniaMydas: GraphRetrievalMethod
+ChinchillaLanigera: GraphRetrievalMethod
+ChitinivibrioAlkaliphilus: GraphRetrievalMethod
+ChitinophagaPinensis: GraphRetrievalMethod
+ChlamydiaAvium: GraphRetrievalMethod
+ChlamydiaGallinacea: GraphRetrievalMethod
+ChlamydiaMuridarum: GraphRetrievalMethod
+ChlamydiaPsittaci10139811: GraphRetrievalMethod
+ChlamydiaPsittaci6bc: GraphRetrievalMethod
+ChlamydiaSpDiamant: GraphRetrievalMethod
+ChlamydiaSpRubis: GraphRetrievalMethod
+ChlamydiaSuis: GraphRetrievalMethod
+ChlamydiaTrachomatis: GraphRetrievalMethod
+ChlamydomonasReinhardtii: GraphRetrievalMethod
+ChlamydophilaAbortus: GraphRetrievalMethod
+ChlamydophilaCaviae: GraphRetrievalMethod
+ChlamydophilaFelis: GraphRetrievalMethod
+ChlamydophilaPecorum: GraphRetrievalMethod
+ChlamydophilaPneumoniaeAr39: GraphRetrievalMethod
+ChlamydophilaPneumoniaeCwl029: GraphRetrievalMethod
+ChlamydophilaPneumoniaeTw183: GraphRetrievalMethod
+ChlorellaVariabilis: GraphRetrievalMethod
+ChlorobaculumParvum: GraphRetrievalMethod
+ChlorobiumChlorochromatii: GraphRetrievalMethod
+ChlorobiumLimicola: GraphRetrievalMethod
+ChlorobiumLuteolum: GraphRetrievalMethod
+ChlorobiumPhaeobacteroidesBs1: GraphRetrievalMethod
+ChlorobiumPhaeobacteroidesDsm266: GraphRetrievalMethod
+ChlorobiumPhaeovibrioides: GraphRetrievalMethod
+ChlorobiumSpGbchlb: GraphRetrievalMethod
+ChlorobiumTepidum: GraphRetrievalMethod
+ChlorocebusSabaeus: GraphRetrievalMethod
+ChloroflexusAggregans: GraphRetrievalMethod
+ChloroflexusAurantiacus: GraphRetrievalMethod
+ChloroflexusSpMsg: GraphRetrievalMethod
+ChloroflexusSpY3961: GraphRetrievalMethod
+ChlorogloeopsisFritschii: GraphRetrievalMethod
+ChloroherpetonThalassium: GraphRetrievalMethod
+ChondromycesApiculatus: GraphRetrievalMethod
+ChromobacteriumViolaceum: GraphRetrievalMethod
+ChromohalobacterSalexigens: GraphRetrievalMethod
+ChroococcidiopsisThermalis: GraphRetrievalMethod
+ChrysemysPicta: GraphRetrievalMethod
+ChryseobacteriumAntarcticum: GraphRetrievalMethod
+ChryseobacteriumCaeni: GraphRetrievalMethod
+ChryseobacteriumDaeguense: GraphRetrievalMethod
+ChryseobacteriumFormosense: GraphRetrievalMethod
+ChryseobacteriumGleum: GraphRetrievalMethod
+ChryseobacteriumGregarium: GraphRetrievalMethod
+ChryseobacteriumHispalense: GraphRetrievalMethod
+ChryseobacteriumIndologenes: GraphRetrievalMethod
+ChryseobacteriumLuteum: GraphRetrievalMethod
+ChryseobacteriumOranimense: GraphRetrievalMethod
+ChryseobacteriumPalustre: GraphRetrievalMethod
+ChryseobacteriumPiperi: GraphRetrievalMethod
+ChryseobacteriumSoli: GraphRetrievalMethod
+ChryseobacteriumSpCf284: GraphRetrievalMethod
+ChryseobacteriumSpJm1: GraphRetrievalMethod
+ChryseobacteriumVrystaatense: GraphRetrievalMethod
+ChrysiogenesArsenatis: GraphRetrievalMethod
+ChrysochlorisAsiatica: GraphRetrievalMethod
+ChthoniobacterFlavus: GraphRetrievalMethod
+ChthonomonasCalidirosea: GraphRetrievalMethod
+CicerArietinum: GraphRetrievalMethod
+CionaIntestinalis: GraphRetrievalMethod
+CionaSavignyi: GraphRetrievalMethod
+CitreicellaSp357: GraphRetrievalMethod
+CitreicellaSpSe45: GraphRetrievalMethod
+CitricoccusSpCh26a: GraphRetrievalMethod
+CitrobacterAmalonaticus: GraphRetrievalMethod
+CitrobacterFarmeri: GraphRetrievalMethod
+CitrobacterRodentium: GraphRetrievalMethod
+CitrobacterSedlakii: GraphRetrievalMethod
+CitrobacterSp302: GraphRetrievalMethod
+CitrobacterSpS77: GraphRetrievalMethod
+CitrobacterYoungae: GraphRetrievalMethod
+CitromicrobiumBathyomarinum: GraphRetrievalMethod
+CitromicrobiumSpJlt1363: GraphRetrievalMethod
+CitrusClementina: GraphRetrievalMethod
+CitrusSinensis: GraphRetrievalMethod
+CladophialophoraCarrionii: GraphRetrievalMethod
+CladophialophoraPsammophila: GraphRetrievalMethod
+CladophialophoraYegresii: GraphRetrievalMethod
+ClavibacterMichiganensisNcppb382: GraphRetrievalMethod
+ClavibacterMichiganensisSepedonicus: GraphRetrievalMethod
+ClavicepsPurpurea: GraphRetrievalMethod
+CloacimonasAcidaminovorans: GraphRetrievalMethod
+ClostridiaceaeBacteriumL21thd2: GraphRetrievalMethod
+ClostridialesBacterium1747faa: GraphRetrievalMethod
+ClostridialesBacterium9400853: GraphRetrievalMethod
+ClostridialesBacterium9401234: GraphRetrievalMethod
+ClostridialesBacterium9403326: GraphRetrievalMethod
+ClostridialesBacteriumDri13: GraphRetrievalMethod
+ClostridialesBacteriumF0540: GraphRetrievalMethod
+ClostridialesBacteriumNk3b98: GraphRetrievalMethod
+ClostridialesBacteriumS714: GraphRetrievalMethod
+ClostridialesBacteriumVe20208: GraphRetrievalMethod
+ClostridialesBacteriumVe20209: GraphRetrievalMethod
+ClostridialesBacteriumVe20213: GraphRetrievalMethod
+ClostridialesBacteriumVe20214: GraphRetrievalMethod
+ClostridialesBacteriumVe20218: GraphRetrievalMethod
+ClostridialesBacteriumVe20221: GraphRetrievalMethod
+ClostridialesGenomosp: GraphRetrievalMethod
+ClostridiisalibacterPaucivorans: GraphRetrievalMethod
+ClostridiumAcetobutylicum: GraphRetrievalMethod
+ClostridiumAcidurici: GraphRetrievalMethod
+ClostridiumAlgidicarnis: GraphRetrievalMethod
+ClostridiumAminophilum: GraphRetrievalMethod
+ClostridiumAnorexicamassiliense: GraphRetrievalMethod
+ClostridiumArbusti: GraphRetrievalMethod
+ClostridiumBaratii: GraphRetrievalMethod
+ClostridiumBeijerinckii: GraphRetrievalMethod
+ClostridiumBifermentans: GraphRetrievalMethod
+ClostridiumBolteae: GraphRetrievalMethod
+ClostridiumBotulinum202f: GraphRetrievalMethod
+ClostridiumBotulinumA2Kyoto: GraphRetrievalMethod
+ClostridiumBotulinumBkt015925: GraphRetrievalMethod
+ClostridiumBotulinumCdBkt12695: GraphRetrievalMethod
+ClostridiumBotulinumD1873: GraphRetrievalMethod
+ClostridiumBotulinumE1Bont: GraphRetrievalMethod
+ClostridiumBotulinumNctc2916: GraphRetrievalMethod
+ClostridiumButyricum: GraphRetrievalMethod
+ClostridiumCadaveris: GraphRetrievalMethod
+ClostridiumCarboxidivorans: GraphRetrievalMethod
+ClostridiumCelatum: GraphRetrievalMethod
+ClostridiumCellulolyticum: GraphRetrievalMethod
+ClostridiumCellulovorans: GraphRetrievalMethod
+ClostridiumCitroniae: GraphRetrievalMethod
+ClostridiumClariflavum: GraphRetrievalMethod
+ClostridiumClostridioforme: GraphRetrievalMethod
+ClostridiumColicanis: GraphRetrievalMethod
+ClostridiumDrakei: GraphRetrievalMethod
+ClostridiumHiranonis: GraphRetrievalMethod
+ClostridiumHylemonae: GraphRetrievalMethod
+ClostridiumInnocuum: GraphRetrievalMethod
+ClostridiumIntestinale: GraphRetrievalMethod
+ClostridiumJosui: GraphRetrievalMethod
+ClostridiumKluyveri: GraphRetrievalMethod
+ClostridiumLentocellum: GraphRetrievalMethod
+ClostridiumLeptum: GraphRetrievalMethod
+ClostridiumLitorale: GraphRetrievalMethod
+ClostridiumLjungdahlii: GraphRetrievalMethod
+ClostridiumLundense: GraphRetrievalMethod
+ClostridiumMangenotii: GraphRetrievalMethod
+ClostridiumMethylpentosum: GraphRetrievalMethod
+ClostridiumNovyiBNctc9691: GraphRetrievalMethod
+ClostridiumNovyiNt: GraphRetrievalMethod
+ClostridiumOrbiscindens: GraphRetrievalMethod
+ClostridiumPapyrosolvens: GraphRetrievalMethod
+ClostridiumParaputrificum: GraphRetrievalMethod
+ClostridiumPasteurianumBc1: GraphRetrievalMethod
+ClostridiumPasteurianumDsm525: GraphRetrievalMethod
+ClostridiumPerfringensAtcc13124: GraphRetrievalMethod
+ClostridiumSaccharobutylicum: GraphRetrievalMethod
+ClostridiumSaccharogumia: GraphRetrievalMethod
+ClostridiumSaccharolyticumWm1: GraphRetrievalMethod
+ClostridiumSaccharoperbutylacetonicum: GraphRetrievalMethod
+ClostridiumScindens: GraphRetrievalMethod
+ClostridiumSenegalense: GraphRetrievalMethod
+ClostridiumSordellii: GraphRetrievalMethod
+ClostridiumSp01: GraphRetrievalMethod
+ClostridiumSp12: GraphRetrievalMethod
+ClostridiumSp7243faa: GraphRetrievalMethod
+ClostridiumSpAdety: GraphRetrievalMethod
+ClostridiumSpAsbs410: GraphRetrievalMethod
+ClostridiumSpAsf356: GraphRetrievalMethod
+ClostridiumSpAsf502: GraphRetrievalMethod
+ClostridiumSpAtcc29733: GraphRetrievalMethod
+ClostridiumSpBnl1100: GraphRetrievalMethod
+ClostridiumSpCl2: GraphRetrievalMethod
+ClostridiumSpCl6: GraphRetrievalMethod
+ClostridiumSpD5: GraphRetrievalMethod
+ClostridiumSpDlviii: GraphRetrievalMethod
+ClostridiumSpHgf2: GraphRetrievalMethod
+ClostridiumSpHmp27: GraphRetrievalMethod
+ClostridiumSpJcc: GraphRetrievalMethod
+ClostridiumSpKle1755: GraphRetrievalMethod
+ClostridiumSpKnhs205: GraphRetrievalMethod
+ClostridiumSpKnhs209: GraphRetrievalMethod
+ClostridiumSpKnhs214: GraphRetrievalMethod
+ClostridiumSpL250: GraphRetrievalMethod
+ClostridiumSpLf2: GraphRetrievalMethod
+ClostridiumSpM240: GraphRetrievalMethod
+ClostridiumSpMaddingley: GraphRetrievalMethod
+ClostridiumSpMste9: GraphRetrievalMethod
+ClostridiumSpSy8519: GraphRetrievalMethod
+ClostridiumSpiroforme: GraphRetrievalMethod
+ClostridiumSporosphaeroides: GraphRetrievalMethod
+ClostridiumStercorarium: GraphRetrievalMethod
+ClostridiumSticklandii: GraphRetrievalMethod
+ClostridiumSulfidigenes: GraphRetrievalMethod
+ClostridiumSymbiosumWal14163: GraphRetrievalMethod
+ClostridiumSymbiosumWal14673: GraphRetrievalMethod
+ClostridiumTermitidis: GraphRetrievalMethod
+ClostridiumTetanomorphum: GraphRetrievalMethod
+ClostridiumTyrobutyricum: GraphRetrievalMethod
+ClostridiumUltunense: GraphRetrievalMethod
+ClostridiumViride: GraphRetrievalMethod
+CobetiaCrustatorum: GraphRetrievalMethod
+CobetiaMarina: GraphRetrievalMethod
+CoccidioidesImmitis: GraphRetrievalMethod
+CoccidioidesPosadasii: GraphRetrievalMethod
+CoccomyxaSubellipsoidea: GraphRetrievalMethod
+CohnellaLaeviribosi: GraphRetrievalMethod
+ColeofasciculusChthonoplastes: GraphRetrievalMethod
+ColletotrichumFioriniae: GraphRetrievalMethod
+ColletotrichumGloeosporioides: GraphRetrievalMethod
+ColletotrichumGraminicola: GraphRetrievalMethod
+ColletotrichumHigginsianum: GraphRetrievalMethod
+ColletotrichumOrbiculare: GraphRetrievalMethod
+ColletotrichumSublineola: GraphRetrievalMethod
+CollimonasFungivorans: GraphRetrievalMethod
+CollinsellaIntestinalis: GraphRetrievalMethod
+CollinsellaSp4847faa: GraphRetrievalMethod
+CollinsellaStercoris: GraphRetrievalMethod
+CollinsellaTanakaei: GraphRetrievalMethod
+ColumbaLivia: GraphRetrievalMethod
+ColwelliaPiezophila: GraphRetrievalMethod
+ColwelliaPsychrerythraea: GraphRetrievalMethod
+ComamonadaceaeBacteriumH1: GraphRetrievalMethod
+ComamonasAquatica: GraphRetrievalMethod
+ComamonasGranuli: GraphRetrievalMethod
+ComamonasTestosteroniCnb2: GraphRetrievalMethod
+ComamonasTestosteroniKf1: GraphRetrievalMethod
+CommensalibacterIntestini: GraphRetrievalMethod
+CommensalibacterSpMx01: GraphRetrievalMethod
+ConchiformibiusKuhniae: GraphRetrievalMethod
+ConchiformibiusSteedae: GraphRetrievalMethod
+ConexibacterWoeseiDsm14684: GraphRetrievalMethod
+ConexibacterWoeseiIso977n: GraphRetrievalMethod
+CongregibacterLitoralis: GraphRetrievalMethod
+ConiophoraPuteana: GraphRetrievalMethod
+ConiosporiumApollinis: GraphRetrievalMethod
+CoprinopsisCinerea: GraphRetrievalMethod
+CoprobacillusSp291: GraphRetrievalMethod
+CoprobacterFastidiosus: GraphRetrievalMethod
+CoprococcusEutactus: GraphRetrievalMethod
+CoprothermobacterPlatensis: GraphRetrievalMethod
+CoprothermobacterProteolyticus: GraphRetrievalMethod
+CoraliomargaritaAkajimensis: GraphRetrievalMethod
+CorallococcusCoralloides: GraphRetrievalMethod
+CordycepsMilitaris: GraphRetrievalMethod
+CoriobacteriaceaeBacteriumBv3ac1: GraphRetrievalMethod
+CoriobacteriaceaeBacteriumGd5: GraphRetrievalMethod
+CoriobacteriumGlomerans: GraphRetrievalMethod
+CorynebacteriumAccolens: GraphRetrievalMethod
+CorynebacteriumAmmoniagenes: GraphRetrievalMethod
+CorynebacteriumAmycolatum: GraphRetrievalMethod
+CorynebacteriumArgentoratense: GraphRetrievalMethod
+CorynebacteriumAtypicum: GraphRetrievalMethod
+CorynebacteriumAurimucosum: GraphRetrievalMethod
+CorynebacteriumCallunae: GraphRetrievalMethod
+CorynebacteriumCapitovis: GraphRetrievalMethod
+CorynebacteriumCasei: GraphRetrievalMethod
+CorynebacteriumCaspium: GraphRetrievalMethod
+CorynebacteriumCiconiae: GraphRetrievalMethod
+CorynebacteriumDiphtheriae: GraphRetrievalMethod
+CorynebacteriumDoosanense: GraphRetrievalMethod
+CorynebacteriumDurum: GraphRetrievalMethod
+CorynebacteriumEfficiens: GraphRetrievalMethod
+CorynebacteriumFalsenii: GraphRetrievalMethod
+CorynebacteriumFreiburgense: GraphRetrievalMethod
+CorynebacteriumFreneyi: GraphRetrievalMethod
+CorynebacteriumGenitalium: GraphRetrievalMethod
+CorynebacteriumGlucuronolyticum: GraphRetrievalMethod
+CorynebacteriumGlutamicum: GraphRetrievalMethod
+CorynebacteriumGlycinophilum: GraphRetrievalMethod
+CorynebacteriumHalotolerans: GraphRetrievalMethod
+CorynebacteriumImitans: GraphRetrievalMethod
+CorynebacteriumJeikeium: GraphRetrievalMethod
+CorynebacteriumKroppenstedtii: GraphRetrievalMethod
+CorynebacteriumLipophiloflavum: GraphRetrievalMethod
+CorynebacteriumLubricantis: GraphRetrievalMethod
+CorynebacteriumMaris: GraphRetrievalMethod
+CorynebacteriumMassiliense: GraphRetrievalMethod
+CorynebacteriumMastitidis: GraphRetrievalMethod
+CorynebacteriumMatruchotii: GraphRetrievalMethod
+CorynebacteriumNuruki: GraphRetrievalMethod
+CorynebacteriumPilosum: GraphRetrievalMethod
+CorynebacteriumPropinquum: GraphRetrievalMethod
+CorynebacteriumPseudogenitalium: GraphRetrievalMethod
+CorynebacteriumPseudotuberculosis: GraphRetrievalMethod
+CorynebacteriumPyruviciproducens: GraphRetrievalMethod
+CorynebacteriumResistens: GraphRetrievalMethod
+CorynebacteriumSpAtcc6931: GraphRetrievalMethod
+CorynebacteriumSpGd7: GraphRetrievalMethod
+CorynebacteriumSpJcb: GraphRetrievalMethod
+CorynebacteriumSpKpl1859: GraphRetrievalMethod
+CorynebacteriumSpKpl1860: GraphRetrievalMethod
+CorynebacteriumSpKpl1989: GraphRetrievalMethod
+CorynebacteriumSpKpl2004: GraphRetrievalMethod
+CorynebacteriumSputi: GraphRetrievalMethod
+CorynebacteriumStriatum: GraphRetrievalMethod
+CorynebacteriumTerpenotabidum: GraphRetrievalMethod
+CorynebacteriumTimonense: GraphRetrievalMethod
+CorynebacteriumTuscaniense: GraphRetrievalMethod
+CorynebacteriumUlcerans: GraphRetrievalMethod
+CorynebacteriumUlceribovis: GraphRetrievalMethod
+CorynebacteriumUrealyticum: GraphRetrievalMethod
+CorynebacteriumVariabile: GraphRetrievalMethod
+CorynebacteriumVitaeruminis: GraphRetrievalMethod
+CoxiellaBurnetii: GraphRetrievalMethod
+CriblamydiaSequanensis: GraphRetrievalMethod
+CricetulusGriseus: GraphRetrievalMethod
+CrinaliumEpipsammum: GraphRetrievalMethod
+CroceibacterAtlanticus: GraphRetrievalMethod
+CrocinitomixCatalasitica: GraphRetrievalMethod
+CronobacterCondimenti: GraphRetrievalMethod
+CryobacteriumRoopkundense: GraphRetrievalMethod
+CryptobacteriumCurtum: GraphRetrievalMethod
+CryptococcusGattii: GraphRetrievalMethod
+CryptococcusNeoformans: GraphRetrievalMethod
+CryptosporidiumMuris: GraphRetrievalMethod
+CucumisMelo: GraphRetrievalMethod
+CucumisSativus: GraphRetrievalMethod
+CulexQuinquefasciatus: GraphRetrievalMethod
+CupriavidusMetallidurans: GraphRetrievalMethod
+CupriavidusSpAmp6: GraphRetrievalMethod
+CupriavidusSpBis7: GraphRetrievalMethod
+CupriavidusTaiwanensis: GraphRetrievalMethod
+CurtobacteriumSpS6: GraphRetrievalMethod
+CyanidioschyzonMerolae: GraphRetrievalMethod
+CyanobacteriumAponinum: GraphRetrievalMethod
+CyanobacteriumSpPcc7702: GraphRetrievalMethod
+CyanobacteriumStanieri: GraphRetrievalMethod
+CyanobiumGracile: GraphRetrievalMethod
+CyanobiumSpCaciam14: GraphRetrievalMethod
+CyanobiumSpPcc7001: GraphRetrievalMethod
+CyanotheceSpAtcc51142: GraphRetrievalMethod
+CyanotheceSpCcy0110: GraphRetrievalMethod
+CyanotheceSpPcc7424: GraphRetrievalMethod
+CyanotheceSpPcc7425: GraphRetrievalMethod
+CyanotheceSpPcc7822: GraphRetrievalMethod
+CyanotheceSpPcc8801: GraphRetrievalMethod
+CyclobacteriaceaeBacteriumAk24: GraphRetrievalMethod
+CyclobacteriumMarinum: GraphRetrievalMethod
+CyclobacteriumQasimii: GraphRetrievalMethod
+CycloclasticusZancles: GraphRetrievalMethod
+CylindrospermopsisRaciborskii: GraphRetrievalMethod
+CylindrospermumStagnale: GraphRetrievalMethod
+CynoglossusSemilaevis: GraphRetrievalMethod
+CyphellophoraEuropaea: GraphRetrievalMethod
+CystobacterFuscus: GraphRetrievalMethod
+CytophagaAurantiaca: GraphRetrievalMethod
+CytophagaFermentans: GraphRetrievalMethod
+CytophagaHutchinsonii: GraphRetrievalMethod
+DactylellinaHaptotyla: GraphRetrievalMethod
+DactylococcopsisSalina: GraphRetrievalMethod
+DactylosporangiumAurantiacum: GraphRetrievalMethod
+DanausPlexippus: GraphRetrievalMethod
+DanioRerio: GraphRetrievalMethod
+DaphniaPulex: GraphRetrievalMethod
+DasaniaMarina: GraphRetrievalMethod
+DasypusNovemcinctus: GraphRetrievalMethod
+DebaryomycesHansenii: GraphRetrievalMethod
+DechloromonasAgitata: GraphRetrievalMethod
+DechloromonasAromatica: GraphRetrievalMethod
+DechlorosomaSuillum: GraphRetrievalMethod
+DeferribacterDesulfuricans: GraphRetrievalMethod
+DeferrisomaCamini: GraphRetrievalMethod
+DefluviimonasSp20v17: GraphRetrievalMethod
+DehalobacterSpCf: GraphRetrievalMethod
+DehalobacterSpFth1: GraphRetrievalMethod
+DehalococcoidesMccartyi195: GraphRetrievalMethod
+DehalococcoidesMccartyiCbdb1: GraphRetrievalMethod
+DehalococcoidesMccartyiVs: GraphRetrievalMethod
+DehalogenimonasLykanthroporepellens: GraphRetrievalMethod
+DeinococcusApachensis: GraphRetrievalMethod
+DeinococcusAquatilis: GraphRetrievalMethod
+DeinococcusDeserti: GraphRetrievalMethod
+DeinococcusFrigens: GraphRetrievalMethod
+DeinococcusGeothermalis: GraphRetrievalMethod
+DeinococcusGobiensis: GraphRetrievalMethod
+DeinococcusMaricopensis: GraphRetrievalMethod
+DeinococcusMarmoris: GraphRetrievalMethod
+DeinococcusMisasensis: GraphRetrievalMethod
+DeinococcusPeraridilitoris: GraphRetrievalMethod
+DeinococcusPhoenicis: GraphRetrievalMethod
+DeinococcusPimensis: GraphRetrievalMethod
+DeinococcusProteolyticus: GraphRetrievalMethod
+DeinococcusRadiodurans: GraphRetrievalMethod
+DeinococcusSp2009: GraphRetrievalMethod
+DeinococcusSpRl: GraphRetrievalMethod
+DeinococcusSpYim77859: GraphRetrievalMethod
+DeinococcusWulumuqiensis: GraphRetrievalMethod
+DelftiaAcidovorans: GraphRetrievalMethod
+DemetriaTerragena: GraphRetrievalMethod
+DenitrovibrioAcetiphilus: GraphRetrievalMethod
+DermabacterSpHfh0086: GraphRetrievalMethod
+DermacoccusNishinomiyaensis: GraphRetrievalMethod
+DermacoccusSpEllin185: GraphRetrievalMethod
+DesmosporaSp8437: GraphRetrievalMethod
+DesulfarculusBaarsii: GraphRetrievalMethod
+DesulfatibacillumAlkenivorans: GraphRetrievalMethod
+DesulfitobacteriumDehalogenans: GraphRetrievalMethod
+DesulfitobacteriumDichloroeliminans: GraphRetrievalMethod
+DesulfitobacteriumHafniense: GraphRetrievalMethod
+DesulfitobacteriumMetallireducens: GraphRetrievalMethod
+DesulfobaccaAcetoxidans: GraphRetrievalMethod
+DesulfobacterCurvatus: GraphRetrievalMethod
+DesulfobacterPostgatei: GraphRetrievalMethod
+DesulfobacteriumAutotrophicum: GraphRetrievalMethod
+DesulfobaculaSpTs: GraphRetrievalMethod
+DesulfobulbusJaponicus: GraphRetrievalMethod
+DesulfocapsaSulfexigens: GraphRetrievalMethod
+DesulfococcusMultivorans: GraphRetrievalMethod
+DesulfococcusOleovorans: GraphRetrievalMethod
+DesulfocurvusVexinensis: GraphRetrievalMethod
+DesulfohalobiumRetbaense: GraphRetrievalMethod
+DesulfomicrobiumBaculatum: GraphRetrievalMethod
+DesulfomonileTiedjei: GraphRetrievalMethod
+DesulfonatronospiraThiodismutans: GraphRetrievalMethod
+DesulfonatronovibrioHydrogenovorans: GraphRetrievalMethod
+DesulfonauticusSpA7a: GraphRetrievalMethod
+DesulforegulaConservatrix: GraphRetrievalMethod
+DesulforudisAudaxviator: GraphRetrievalMethod
+DesulfosarcinaSpBus5: GraphRetrievalMethod
+DesulfospiraJoergensenii: GraphRetrievalMethod
+DesulfosporosinusAcidiphilus: GraphRetrievalMethod
+DesulfosporosinusMeridiei: GraphRetrievalMethod
+DesulfosporosinusOrientis: GraphRetrievalMethod
+DesulfosporosinusSpHmp52: GraphRetrievalMethod
+DesulfosporosinusSpOt: GraphRetrievalMethod
+DesulfosporosinusYoungiae: GraphRetrievalMethod
+DesulfotaleaPsychrophila: GraphRetrievalMethod
+DesulfotomaculumAcetoxidans: GraphRetrievalMethod
+DesulfotomaculumAlcoholivorax: GraphRetrievalMethod
+DesulfotomaculumAlkaliphilum: GraphRetrievalMethod
+DesulfotomaculumCarboxydivorans: GraphRetrievalMethod
+DesulfotomaculumGibsoniae: GraphRetrievalMethod
+DesulfotomaculumGuttoideum: GraphRetrievalMethod
+DesulfotomaculumHydrothermale: GraphRetrievalMethod
+DesulfotomaculumKuznetsovii: GraphRetrievalMethod
+DesulfotomaculumNigrificans: GraphRetrievalMethod
+DesulfotomaculumReducens: GraphRetrievalMethod
+DesulfotomaculumRuminis: GraphRetrievalMethod
+DesulfotomaculumThermocisternum: GraphRetrievalMethod
+DesulfovibrioAcrylicus: GraphRetrievalMethod
+DesulfovibrioAespoeensis: GraphRetrievalMethod
+DesulfovibrioAfricanus: GraphRetrievalMethod
+DesulfovibrioAlaskensis: GraphRetrievalMethod
+DesulfovibrioAlcoholivorans: GraphRetrievalMethod
+DesulfovibrioAlkalitolerans: GraphRetrievalMethod
+DesulfovibrioAminophilus: GraphRetrievalMethod
+DesulfovibrioBastinii: GraphRetrievalMethod
+DesulfovibrioDesulfuricansAtcc27774: GraphRetrievalMethod
+DesulfovibrioDesulfuricansDsm642: GraphRetrievalMethod
+DesulfovibrioDesulfuricansNd132: GraphRetrievalMethod
+DesulfovibrioFrigidus: GraphRetrievalMethod
+DesulfovibrioFructosivorans: GraphRetrievalMethod
+DesulfovibrioGigas: GraphRetrievalMethod
+DesulfovibrioHydrothermalis: GraphRetrievalMethod
+DesulfovibrioLongus: GraphRetrievalMethod
+DesulfovibrioMagneticusIfrc170: GraphRetrievalMethod
+DesulfovibrioMagneticusRs1: GraphRetrievalMethod
+DesulfovibrioOxyclinae: GraphRetrievalMethod
+DesulfovibrioPiezophilus: GraphRetrievalMethod
+DesulfovibrioPiger: GraphRetrievalMethod
+DesulfovibrioSalexigens: GraphRetrievalMethod
+DesulfovibrioSp31syn3: GraphRetrievalMethod
+DesulfovibrioSp6146afaa: GraphRetrievalMethod
+DesulfovibrioSpFw1012b: GraphRetrievalMethod
+DesulfovibrioSpL21syrab: GraphRetrievalMethod
+DesulfovibrioSpU5l: GraphRetrievalMethod
+DesulfovibrioSpX2: GraphRetrievalMethod
+DesulfovibrioVulgarisHildenborough: GraphRetrievalMethod
+DesulfovibrioVulgarisMiyazaki: GraphRetrievalMethod
+DesulfovirgulaThermocuniculi: GraphRetrievalMethod
+DesulfurellaAcetivorans: GraphRetrievalMethod
+DesulfurispirillumIndicum: GraphRetrievalMethod
+DesulfurisporaThermophila: GraphRetrievalMethod
+DesulfurivibrioAlkaliphilus: GraphRetrievalMethod
+DesulfurobacteriumSpTc51: GraphRetrievalMethod
+DesulfurobacteriumThermolithotrophum: GraphRetrievalMethod
+DesulfurococcusFermentans: GraphRetrievalMethod
+DesulfurococcusKamchatkensis: GraphRetrievalMethod
+DesulfurococcusMucosus: GraphRetrievalMethod
+DesulfuromonasSpTf: GraphRetrievalMethod
+DethiobacterAlkaliphilus: GraphRetrievalMethod
+DethiosulfovibrioPeptidovorans: GraphRetrievalMethod
+DevosiaSp172e8: GraphRetrievalMethod
+DevosiaSpLc5: GraphRetrievalMethod
+DialisterInvisus: GraphRetrievalMethod
+DialisterMicraerophilus: GraphRetrievalMethod
+DialisterMicroaerophilus: GraphRetrievalMethod
+DialisterSuccinatiphilus: GraphRetrievalMethod
+DichelobacterNodosus: GraphRetrievalMethod
+DickeyaDadantii3937: GraphRetrievalMethod
+DickeyaDadantiiEch586: GraphRetrievalMethod
+DickeyaDadantiiEch703: GraphRetrievalMethod
+DickeyaSp2b12: GraphRetrievalMethod
+DickeyaSpDw0440: GraphRetrievalMethod
+DickeyaSpNcppb569: GraphRetrievalMethod
+DickeyaZeae: GraphRetrievalMethod
+DictyoglomusThermophilum: GraphRetrievalMethod
+DictyoglomusTurgidum: GraphRetrievalMethod
+DictyosteliumDiscoideum: GraphRetrievalMethod
+DictyosteliumPurpureum: GraphRetrievalMethod
+DietziaAlimentaria: GraphRetrievalMethod
+DietziaSpUcdthp: GraphRetrievalMethod
+DinoroseobacterShibae: GraphRetrievalMethod
+DiplosphaeraColitermitum: GraphRetrievalMethod
+DokdoniaSp4h375: GraphRetrievalMethod
+DokdoniaSpMed134: GraphRetrievalMethod
+DokdoniaSpPro95: GraphRetrievalMethod
+DolosigranulumPigrum: GraphRetrievalMethod
+DonghicolaXiamenensis: GraphRetrievalMethod
+DongiaSpUrhe0060: GraphRetrievalMethod
+DoreaFormicigenerans4653afaa: GraphRetrievalMethod
+DoreaFormicigeneransAtcc27755: GraphRetrievalMethod
+DoreaLongicatenaAgr2136: GraphRetrievalMethod
+DoreaLongicatenaDsm13814: GraphRetrievalMethod
+DoreaSp52: GraphRetrievalMethod
+DraconibacteriumOrientale: GraphRetrievalMethod
+DrosophilaAnanassae: GraphRetrievalMethod
+DrosophilaErecta: GraphRetrievalMethod
+DrosophilaGrimshawi: GraphRetrievalMethod
+DrosophilaMelanogaster: GraphRetrievalMethod
+DrosophilaMojavensis: GraphRetrievalMethod
+DrosophilaPersimilis: GraphRetrievalMethod
+DrosophilaPseudoobscura: GraphRetrievalMethod
+DrosophilaVirilis: GraphRetrievalMethod
+DrosophilaWillistoni: GraphRetrievalMethod
+DrosophilaYakuba: GraphRetrievalMethod
+DyadobacterAlkalitolerans: GraphRetrievalMethod
+DyadobacterFermentans: GraphRetrievalMethod
+DyadobacterTibetensis: GraphRetrievalMethod
+DyellaGinsengisoli: GraphRetrievalMethod
+DysgonomonasGadei: GraphRetrievalMethod
+DysgonomonasMossii: GraphRetrievalMethod
+EchinicolaPacifica: GraphRetrievalMethod
+EchinicolaVietnamensis: GraphRetrievalMethod
+EchinococcusMultilocularis: GraphRetrievalMethod
+EchinopsTelfairi: GraphRetrievalMethod
+EctocarpusSiliculosus: GraphRetrievalMethod
+EctothiorhodospiraSpPhs1: GraphRetrievalMethod
+EdwardsiellaHoshinae: GraphRetrievalMethod
+EdwardsiellaTardaAtcc15947: GraphRetrievalMethod
+EggerthellaLenta: GraphRetrievalMethod
+EggerthellaSpYy7918: GraphRetrievalMethod
+EggerthiaCatenaformis: GraphRetrievalMethod
+EhrlichiaCanis: GraphRetrievalMethod
+EhrlichiaChaffeensis: GraphRetrievalMethod
+EhrlichiaRuminantium: GraphRetrievalMethod
+EhrlichiaSpHf: GraphRetrievalMethod
+EikenellaCorrodensAtcc23834: GraphRetrievalMethod
+ElephantulusEdwardii: GraphRetrievalMethod
+ElioraeaTepidiphila: GraphRetrievalMethod
+ElizabethkingiaAnophelis: GraphRetrievalMethod
+ElizabethkingiaMeningoseptica: GraphRetrievalMethod
+ElizabethkingiaMiricola: GraphRetrievalMethod
+EmilianiaHuxleyi: GraphRetrievalMethod
+EmpedobacterBrevis: GraphRetrievalMethod
+EmticiciaOligotrophica: GraphRetrievalMethod
+EndocarponPusillum: GraphRetrievalMethod
+EndolissoclinumFaulkneriL2: GraphRetrievalMethod
+EndolissoclinumFaulkneriL5: GraphRetrievalMethod
+EndosymbiontOfAcanthamoeba: GraphRetrievalMethod
+EndosymbiontOfTevnia: GraphRetrievalMethod
+EndozoicomonasElysicola: GraphRetrievalMethod
+EndozoicomonasMontiporae: GraphRetrievalMethod
+EndozoicomonasNumazuensis: GraphRetrievalMethod
+EnhydrobacterAerosaccus: GraphRetrievalMethod
+EnhygromyxaSalina: GraphRetrievalMethod
+EnormaMassiliensis: GraphRetrievalMethod
+EnsiferSojae: GraphRetrievalMethod
+EnsiferSpBr816: GraphRetrievalMethod
+EnsiferSpTw10: GraphRetrievalMethod
+EnsiferSpWsm1721: GraphRetrievalMethod
+EntamoebaDispar: GraphRetrievalMethod
+EntamoebaHistolytica: GraphRetrievalMethod
+EnterobacterAerogenes: GraphRetrievalMethod
+EnterobacterAsburiaeLf7a: GraphRetrievalMethod
+EnterobacterCloacaeAtcc13047: GraphRetrievalMethod
+EnterobacterCloacaeEcwsu1: GraphRetrievalMethod
+EnterobacterCloacaeJd6301: GraphRetrievalMethod
+EnterobacterLignolyticus: GraphRetrievalMethod
+EnterobacterSp638: GraphRetrievalMethod
+EnterobacterSpR4368: GraphRetrievalMethod
+EnterobacteriaceaeBacteriumB14: GraphRetrievalMethod
+EnterobacteriaceaeBacteriumLsjc7: GraphRetrievalMethod
+EnterobacteriaceaeBacteriumStrain: GraphRetrievalMethod
+EnterococcusAsini: GraphRetrievalMethod
+EnterococcusAvium: GraphRetrievalMethod
+EnterococcusCaccae: GraphRetrievalMethod
+EnterococcusCasseliflavus: GraphRetrievalMethod
+EnterococcusCecorum: GraphRetrievalMethod
+EnterococcusColumbae: GraphRetrievalMethod
+EnterococcusDispar: GraphRetrievalMethod
+EnterococcusDurans: GraphRetrievalMethod
+EnterococcusFaecalis13sdw01: GraphRetrievalMethod
+EnterococcusFaecalisAtcc29212: GraphRetrievalMethod
+EnterococcusFaecalisV583: GraphRetrievalMethod
+EnterococcusFaeciumC68: GraphRetrievalMethod
+EnterococcusFaeciumNrrlb2354: GraphRetrievalMethod
+EnterococcusGallinarum: GraphRetrievalMethod
+EnterococcusGilvus: GraphRetrievalMethod
+EnterococcusHaemoperoxidus: GraphRetrievalMethod
+EnterococcusHirae: GraphRetrievalMethod
+EnterococcusItalicus: GraphRetrievalMethod
+EnterococcusMalodoratus: GraphRetrievalMethod
+EnterococcusMoraviensis: GraphRetrievalMethod
+EnterococcusMundtii: GraphRetrievalMethod
+EnterococcusPallens: GraphRetrievalMethod
+EnterococcusPhoeniculicola: GraphRetrievalMethod
+EnterococcusRaffinosus: GraphRetrievalMethod
+EnterococcusSaccharolyticus: GraphRetrievalMethod
+EnterococcusSulfureus: GraphRetrievalMethod
+EnterococcusVillorum: GraphRetrievalMethod
+EnterorhabdusCaecimuris: GraphRetrievalMethod
+EnterorhabdusMucosicola: GraphRetrievalMethod
+EnterovibrioCalviensis: GraphRetrievalMethod
+EnterovibrioNorvegicus: GraphRetrievalMethod
+EpilithonimonasLactis: GraphRetrievalMethod
+EpilithonimonasSpFh1: GraphRetrievalMethod
+EpilithonimonasTenax: GraphRetrievalMethod
+EptesicusFuscus: GraphRetrievalMethod
+EremococcusColeocolaAcs139vcol8: GraphRetrievalMethod
+EremococcusColeocolaDsm15696: GraphRetrievalMethod
+EremotheciumCymbalariae: GraphRetrievalMethod
+EremotheciumGossypii: GraphRetrievalMethod
+ErinaceusEuropaeus: GraphRetrievalMethod
+ErwiniaAmylovora: GraphRetrievalMethod
+ErwiniaBillingiae: GraphRetrievalMethod
+ErwiniaPyrifoliae: GraphRetrievalMethod
+ErwiniaTasmaniensis: GraphRetrievalMethod
+ErwiniaTypographi: GraphRetrievalMethod
+ErysipelatoclostridiumRamosum: GraphRetrievalMethod
+ErysipelothrixRhusiopathiae: GraphRetrievalMethod
+ErysipelothrixTonsillarum: GraphRetrievalMethod
+ErysipelotrichaceaeBacterium3153: GraphRetrievalMethod
+ErysipelotrichaceaeBacterium5254faa: GraphRetrievalMethod
+ErysipelotrichaceaeBacteriumNk3d112: GraphRetrievalMethod
+ErythrantheGuttata: GraphRetrievalMethod
+ErythrobacterLitoralis: GraphRetrievalMethod
+ErythrobacterLongus: GraphRetrievalMethod
+ErythrobacterSpJl475: GraphRetrievalMethod
+ErythrobacterSpNap1: GraphRetrievalMethod
+ErythrobacterSpSd21: GraphRetrievalMethod
+ErythrobacterVulgaris: GraphRetrievalMethod
+EscherichiaAlbertiiKf1: GraphRetrievalMethod
+EscherichiaAlbertiiTw07627: GraphRetrievalMethod
+EscherichiaColi536: GraphRetrievalMethod
+EscherichiaColiAtcc8739: GraphRetrievalMethod
+EscherichiaColiBl21: GraphRetrievalMethod
+EscherichiaColiCft073: GraphRetrievalMethod
+EscherichiaColiK12Mg1655: GraphRetrievalMethod
+EscherichiaColiK12W3110: GraphRetrievalMethod
+EscherichiaColiO157h7: GraphRetrievalMethod
+EscherichiaHermannii: GraphRetrievalMethod
+EscherichiaSpTw09308: GraphRetrievalMethod
+EscherichiaVulneris: GraphRetrievalMethod
+EsoxLucius: GraphRetrievalMethod
+EthanoligenensHarbinense: GraphRetrievalMethod
+EubacteriumAcidaminophilum: GraphRetrievalMethod
+EubacteriumBrachy: GraphRetrievalMethod
+EubacteriumCellulosolvens6: GraphRetrievalMethod
+EubacteriumCellulosolvensLd2006: GraphRetrievalMethod
+EubacteriumDesmolans: GraphRetrievalMethod
+EubacteriumDolichum: GraphRetrievalMethod
+EubacteriumEligens: GraphRetrievalMethod
+EubacteriumHallii: GraphRetrievalMethod
+EubacteriumInfirmum: GraphRetrievalMethod
+EubacteriumLimosum: GraphRetrievalMethod
+EubacteriumNodatum: GraphRetrievalMethod
+EubacteriumPlexicaudatum: GraphRetrievalMethod
+EubacteriumRamulus: GraphRetrievalMethod
+EubacteriumSaphenum: GraphRetrievalMethod
+EubacteriumSp142: GraphRetrievalMethod
+EubacteriumSpAb3007: GraphRetrievalMethod
+EubacteriumSulci: GraphRetrievalMethod
+EubacteriumVentriosum: GraphRetrievalMethod
+EubacteriumXylanophilum: GraphRetrievalMethod
+EubacteriumYurii: GraphRetrievalMethod
+EucalyptusGrandis: GraphRetrievalMethod
+EudoraeaAdriatica: GraphRetrievalMethod
+EutremaSalsugineum: GraphRetrievalMethod
+EutypaLata: GraphRetrievalMethod
+EwingellaAmericana: GraphRetrievalMethod
+ExiguobacteriumAntarcticum: GraphRetrievalMethod
+ExiguobacteriumMarinum: GraphRetrievalMethod
+ExiguobacteriumOxidotolerans: GraphRetrievalMethod
+ExiguobacteriumPavilionensis: GraphRetrievalMethod
+ExiguobacteriumSibiricum: GraphRetrievalMethod
+ExiguobacteriumSpAb2: GraphRetrievalMethod
+ExiguobacteriumSpAt1b: GraphRetrievalMethod
+ExiguobacteriumSpMh3: GraphRetrievalMethod
+ExiguobacteriumUndae: GraphRetrievalMethod
+ExophialaDermatitidis: GraphRetrievalMethod
+FacklamiaHominis: GraphRetrievalMethod
+FacklamiaIgnava: GraphRetrievalMethod
+FacklamiaLanguida: GraphRetrievalMethod
+FacklamiaSourekii: GraphRetrievalMethod
+FaecalibacteriumPrausnitziiA2165: GraphRetrievalMethod
+FaecalibacteriumPrausnitziiKle1255: GraphRetrievalMethod
+FaecalibacteriumPrausnitziiL26: GraphRetrievalMethod
+FaecalibacteriumPrausnitziiSl33: GraphRetrievalMethod
+FaecalicoccusPleomorphus: GraphRetrievalMethod
+FalsirhodobacterSpAlg1: GraphRetrievalMethod
+FangiaHongkongensis: GraphRetrievalMethod
+FelisCatus: GraphRetrievalMethod
+FerrimicrobiumAcidiphilum: GraphRetrievalMethod
+FerrimonasBalearica: GraphRetrievalMethod
+FerrimonasFuttsuensis: GraphRetrievalMethod
+FerriphaselusSpR1: GraphRetrievalMethod
+FerroglobusPlacidus: GraphRetrievalMethod
+FervidicoccusFontis: GraphRetrievalMethod
+FervidobacteriumIslandicum: GraphRetrievalMethod
+FervidobacteriumNodosum: GraphRetrievalMethod
+FervidobacteriumPennivorans: GraphRetrievalMethod
+FibrellaAestuarina: GraphRetrievalMethod
+FibrisomaLimi: GraphRetrievalMethod
+FibrobacterSuccinogenes: GraphRetrievalMethod
+FicedulaAlbicollis: GraphRetrievalMethod
+FilamentousCyanobacterium: GraphRetrievalMethod
+FilifactorAlocis: GraphRetrievalMethod
+FimbriimonasGinsengisoli: GraphRetrievalMethod
+FinegoldiaMagnaAtcc29328: GraphRetrievalMethod
+FinegoldiaMagnaAtcc53516: GraphRetrievalMethod
+FirmicutesBacteriumAsf500: GraphRetrievalMethod
+FirmicutesBacteriumM102: GraphRetrievalMethod
+FischerellaMuscicola: GraphRetrievalMethod
+FischerellaSpPcc9339: GraphRetrievalMethod
+FischerellaSpPcc9431: GraphRetrievalMethod
+FischerellaSpPcc9605: GraphRetrievalMethod
+FischerellaThermalis: GraphRetrievalMethod
+FlaviramulusIchthyoenteri: GraphRetrievalMethod
+FlavobacteriaBacteriumBal38: GraphRetrievalMethod
+FlavobacteriaBacteriumMs0242a: GraphRetrievalMethod
+FlavobacteriaceaeBacterium351910: GraphRetrievalMethod
+FlavobacteriaceaeBacteriumHqm9: GraphRetrievalMethod
+FlavobacteriaceaeBacteriumS85: GraphRetrievalMethod
+FlavobacterialesBacteriumAlc1: GraphRetrievalMethod
+FlavobacteriumAntarcticum: GraphRetrievalMethod
+FlavobacteriumAquatile: GraphRetrievalMethod
+FlavobacteriumBeibuense: GraphRetrievalMethod
+FlavobacteriumBranchiophilum: GraphRetrievalMethod
+FlavobacteriumChungangense: GraphRetrievalMethod
+FlavobacteriumColumnare: GraphRetrievalMethod
+FlavobacteriumDaejeonense: GraphRetrievalMethod
+FlavobacteriumEnshiense: GraphRetrievalMethod
+FlavobacteriumFilum: GraphRetrievalMethod
+FlavobacteriumFrigidarium: GraphRetrievalMethod
+FlavobacteriumFrigoris: GraphRetrievalMethod
+FlavobacteriumHydatis: GraphRetrievalMethod
+FlavobacteriumIndicum: GraphRetrievalMethod
+FlavobacteriumJohnsoniae: GraphRetrievalMethod
+FlavobacteriumLimnosediminis: GraphRetrievalMethod
+FlavobacteriumPsychrophilum: GraphRetrievalMethod
+FlavobacteriumReichenbachii: GraphRetrievalMethod
+FlavobacteriumRivuli: GraphRetrievalMethod
+FlavobacteriumSaliperosum: GraphRetrievalMethod
+FlavobacteriumSasangense: GraphRetrievalMethod
+FlavobacteriumSoli: GraphRetrievalMethod
+FlavobacteriumSp83: GraphRetrievalMethod
+FlavobacteriumSpAcam123: GraphRetrievalMethod
+FlavobacteriumSpCf136: GraphRetrievalMethod
+FlavobacteriumSpEm1308: GraphRetrievalMethod
+FlavobacteriumSpEm1321: GraphRetrievalMethod
+FlavobacteriumSpF52: GraphRetrievalMethod
+FlavobacteriumSpFl: GraphRetrievalMethod
+FlavobacteriumSpKjj: GraphRetrievalMethod
+FlavobacteriumSpWg21: GraphRetrievalMethod
+FlavobacteriumSubsaxonicum: GraphRetrievalMethod
+FlavobacteriumSuccinicans: GraphRetrievalMethod
+FlavobacteriumSuncheonense: GraphRetrievalMethod
+FlectobacillusMajor: GraphRetrievalMethod
+FlexibacterLitoralis: GraphRetrievalMethod
+FlexistipesSinusarabici: GraphRetrievalMethod
+FlexithrixDorotheae: GraphRetrievalMethod
+FluoribacterDumoffii: GraphRetrievalMethod
+FluviicolaTaffensis: GraphRetrievalMethod
+FodinicurvataFenggangensis: GraphRetrievalMethod
+FodinicurvataSediminis: GraphRetrievalMethod
+FomitiporiaMediterranea: GraphRetrievalMethod
+FomitopsisPinicola: GraphRetrievalMethod
+FonticulaAlba: GraphRetrievalMethod
+FormosaAgariphila: GraphRetrievalMethod
+FormosaSpAk20: GraphRetrievalMethod
+FragariaVesca: GraphRetrievalMethod
+FrancisellaNoatunensis: GraphRetrievalMethod
+FrancisellaPhilomiragia: GraphRetrievalMethod
+FrancisellaSpFsc1006: GraphRetrievalMethod
+FrancisellaSpTx077308: GraphRetrievalMethod
+FrancisellaSpW121067: GraphRetrievalMethod
+FrancisellaTularensisHolarctica: GraphRetrievalMethod
+FrancisellaTularensisNovicida: GraphRetrievalMethod
+FrancisellaTularensisSchus4: GraphRetrievalMethod
+FrankiaAlni: GraphRetrievalMethod
+FrankiaSpBcu110501: GraphRetrievalMethod
+FrankiaSpBmg512: GraphRetrievalMethod
+FrankiaSpCci3: GraphRetrievalMethod
+FrankiaSpCn3: GraphRetrievalMethod
+FrankiaSpEan1pec: GraphRetrievalMethod
+FrankiaSpEui1c: GraphRetrievalMethod
+FrankiaSpIso899: GraphRetrievalMethod
+FrankiaSpQa3: GraphRetrievalMethod
+FrankiaSymbiont: GraphRetrievalMethod
+FrateuriaAurantia: GraphRetrievalMethod
+FructobacillusFructosus: GraphRetrievalMethod
+FukomysDamarensis: GraphRetrievalMethod
+FulvimarinaPelagi: GraphRetrievalMethod
+FulvivirgaImtechensis: GraphRetrievalMethod
+FusariumFujikuroi: GraphRetrievalMethod
+FusariumGraminearum: GraphRetrievalMethod
+FusariumOxysporum: GraphRetrievalMethod
+FusariumPseudograminearum: GraphRetrievalMethod
+FusariumVerticillioides: GraphRetrievalMethod
+FusobacteriumGonidiaformans: GraphRetrievalMethod
+FusobacteriumHwasookii: GraphRetrievalMethod
+FusobacteriumMortiferum: GraphRetrievalMethod
+FusobacteriumNecrophorumD12: GraphRetrievalMethod
+FusobacteriumNecrophorumFunduliforme: GraphRetrievalMethod
+FusobacteriumNucleatumAnimalis: GraphRetrievalMethod
+FusobacteriumNucleatumAtcc25586: GraphRetrievalMethod
+FusobacteriumNucleatumPolymorphum: GraphRetrievalMethod
+FusobacteriumNucleatumVincentii3136a2: GraphRetrievalMethod
+FusobacteriumNucleatumVincentii4113: GraphRetrievalMethod
+FusobacteriumNucleatumW1481: GraphRetrievalMethod
+FusobacteriumPerfoetens: GraphRetrievalMethod
+FusobacteriumPeriodonticum: GraphRetrievalMethod
+FusobacteriumRussii: GraphRetrievalMethod
+FusobacteriumSpF0437: GraphRetrievalMethod
+FusobacteriumUlcerans: GraphRetrievalMethod
+FusobacteriumVarium: GraphRetrievalMethod
+GadusMorhua: GraphRetrievalMethod
+GaeumannomycesGraminis: GraphRetrievalMethod
+GalbibacterMarinus: GraphRetrievalMethod
+GaldieriaSulphuraria: GraphRetrievalMethod
+GaleopterusVariegatus: GraphRetrievalMethod
+GallaecimonasXiamenensis: GraphRetrievalMethod
+GallibacteriumAnatis: GraphRetrievalMethod
+GallibacteriumGenomosp: GraphRetrievalMethod
+GallionellaCapsiferriformans: GraphRetrievalMethod
+GallusGallus: GraphRetrievalMethod
+GammaproteobacteriaBacteriumBdw918: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHdn1: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHimb30: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHimb55: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHtcc2080: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHtcc2143: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHtcc2148: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHtcc2207: GraphRetrievalMethod
+GammaproteobacteriaBacteriumHtcc5015: GraphRetrievalMethod
+GammaproteobacteriaBacteriumImcc3088: GraphRetrievalMethod
+GammaproteobacteriaBacteriumMfb021: GraphRetrievalMethod
+GammaproteobacteriaBacteriumMola455: GraphRetrievalMethod
+GammaproteobacteriaBacteriumNor53: GraphRetrievalMethod
+GammaproteobacteriaBacteriumWg36: GraphRetrievalMethod
+GardnerellaVaginalis101: GraphRetrievalMethod
+GardnerellaVaginalis6119v5: GraphRetrievalMethod
+GasterosteusAculeatus: GraphRetrievalMethod
+GayadomonasJoobiniege: GraphRetrievalMethod
+GeitlerinemaSpPcc7407: GraphRetrievalMethod
+GelidibacterMesophilus: GraphRetrievalMethod
+GemellaBergeriae: GraphRetrievalMethod
+GemellaCuniculi: GraphRetrievalMethod
+GemellaHaemolysansAtcc10379: GraphRetrievalMethod
+GemellaHaemolysansM341: GraphRetrievalMethod
+GemellaMorbillorum: GraphRetrievalMethod
+GemellaSanguinis: GraphRetrievalMethod
+GeminicoccusRoseus: GraphRetrievalMethod
+GeminocystisHerdmanii: GraphRetrievalMethod
+GemmataSpIil30: GraphRetrievalMethod
+GemmatimonadetesBacteriumKbs708: GraphRetrievalMethod
+GemmatimonasAurantiaca: GraphRetrievalMethod
+GemmatimonasSpAp64: GraphRetrievalMethod
+GemmobacterNectariphilus: GraphRetrievalMethod
+GeobacillusCaldoxylosilyticus: GraphRetrievalMethod
+GeobacillusKaustophilus: GraphRetrievalMethod
+GeobacillusSpG1w1: GraphRetrievalMethod
+GeobacillusSpJf8: GraphRetrievalMethod
+GeobacillusSpWch70: GraphRetrievalMethod
+GeobacillusStearothermophilus: GraphRetrievalMethod
+GeobacillusThermodenitrificans: GraphRetrievalMethod
+GeobacillusThermoglucosidasius: GraphRetrievalMethod
+GeobacillusVulcani: GraphRetrievalMethod
+GeobacterBemidjiensis: GraphRetrievalMethod
+GeobacterDaltonii: GraphRetrievalMethod
+GeobacterLovleyi: GraphRetrievalMethod
+GeobacterMetallireducens: GraphRetrievalMethod
+GeobacterSpM18: GraphRetrievalMethod
+GeobacterSpM21: GraphRetrievalMethod
+GeobacterSulfurreducens: GraphRetrievalMethod
+GeodermatophilaceaeBacteriumUrha0031: GraphRetrievalMethod
+GeodermatophilaceaeBacteriumUrhb0048: GraphRetrievalMethod
+GeodermatophilusObscurus: GraphRetrievalMethod
+GeoglobusAcetivorans: GraphRetrievalMethod
+GeomicrobiumSpJcm19037: GraphRetrievalMethod
+GeomicrobiumSpJcm19038: GraphRetrievalMethod
+GeopsychrobacterElectrodiphilus: GraphRetrievalMethod
+GeothrixFermentans: GraphRetrievalMethod
+GeovibrioSpL21acebes: GraphRetrievalMethod
+GiardiaIntestinalis: GraphRetrievalMethod
+GilliamellaApicola: GraphRetrievalMethod
+GillisiaLimnaea: GraphRetrievalMethod
+GillisiaSpCal575: GraphRetrievalMethod
+GillisiaSpHeli29: GraphRetrievalMethod
+GilvimarinusChinensis: GraphRetrievalMethod
+GlaciecolaArctica: GraphRetrievalMethod
+GlaciecolaLipolytica: GraphRetrievalMethod
+GlaciecolaMesophila: GraphRetrievalMethod
+GlaciecolaNitratireducens: GraphRetrievalMethod
+GlaciecolaPsychrophila: GraphRetrievalMethod
+GlaciecolaPunicea: GraphRetrievalMethod
+GlaciecolaSp4h37ye5: GraphRetrievalMethod
+GlaciecolaSpHtcc2999: GraphRetrievalMethod
+GlaciibacterSuperstes: GraphRetrievalMethod
+GlareaLozoyensis: GraphRetrievalMethod
+GloeobacterKilaueensis: GraphRetrievalMethod
+GloeobacterViolaceus: GraphRetrievalMethod
+GloeocapsaSpPcc73106: GraphRetrievalMethod
+GloeocapsaSpPcc7428: GraphRetrievalMethod
+GloeophyllumTrabeum: GraphRetrievalMethod
+GlomeribacterGigasporarum: GraphRetrievalMethod
+GluconacetobacterDiazotrophicus: GraphRetrievalMethod
+GluconobacterFrateurii: GraphRetrievalMethod
+GluconobacterMorbifer: GraphRetrievalMethod
+GluconobacterOxydans621h: GraphRetrievalMethod
+GluconobacterOxydansH24: GraphRetrievalMethod
+GlycineMax: GraphRetrievalMethod
+GlycomycesArizonensis: GraphRetrievalMethod
+GlycomycesSpNrrlb16210: GraphRetrievalMethod
+GordoniaAichiensis: GraphRetrievalMethod
+GordoniaAlkanivorans: GraphRetrievalMethod
+GordoniaAmarae: GraphRetrievalMethod
+GordoniaAmicalis: GraphRetrievalMethod
+GordoniaBronchialis: GraphRetrievalMethod
+GordoniaEffusa: GraphRetrievalMethod
+GordoniaHirsuta: GraphRetrievalMethod
+GordoniaKroppenstedtii: GraphRetrievalMethod
+GordoniaMalaquae: GraphRetrievalMethod
+GordoniaNeofelifaecis: GraphRetrievalMethod
+GordoniaParaffinivorans: GraphRetrievalMethod
+GordoniaPolyisoprenivorans: GraphRetrievalMethod
+GordoniaRhizosphera: GraphRetrievalMethod
+GordoniaShandongensis: GraphRetrievalMethod
+GordoniaSihwensis: GraphRetrievalMethod
+GordoniaSoli: GraphRetrievalMethod
+GordoniaSpKtr9: GraphRetrievalMethod
+GordoniaSputi: GraphRetrievalMethod
+GordoniaTerrae: GraphRetrievalMethod
+GorillaGorilla: GraphRetrievalMethod
+GossypiumRaimondii: GraphRetrievalMethod
+GracilibacillusBoraciitolerans: GraphRetrievalMethod
+GracilibacillusHalophilus: GraphRetrievalMethod
+GracilibacillusLacisalsi: GraphRetrievalMethod
+GracilimonasTropica: GraphRetrievalMethod
+GramellaEchinicola: GraphRetrievalMethod
+GramellaForsetii: GraphRetrievalMethod
+GranulibacterBethesdensis: GraphRetrievalMethod
+GranulicatellaAdiacens: GraphRetrievalMethod
+GranulicatellaElegans: GraphRetrievalMethod
+GranulicellaMallensis: GraphRetrievalMethod
+GranulicellaTundricola: GraphRetrievalMethod
+GranulicoccusPhenolivorans: GraphRetrievalMethod
+GregarinaNiphandrodes: GraphRetrievalMethod
+GrimontiaHollisae: GraphRetrievalMethod
+GrimontiaIndica: GraphRetrievalMethod
+GrosmanniaClavigera: GraphRetrievalMethod
+GryllotalpicolaGinsengisoli: GraphRetrievalMethod
+GuillardiaTheta: GraphRetrievalMethod
+GulosibacterMolinativorax: GraphRetrievalMethod
+HaematobacterMassiliensis: GraphRetrievalMethod
+HaemophilusDucreyi: GraphRetrievalMethod
+HaemophilusHaemolyticusM19501: GraphRetrievalMethod
+HaemophilusHaemolyticusM21621: GraphRetrievalMethod
+HaemophilusHaemolyticusM21639: GraphRetrievalMethod
+HaemophilusInfluenzae: GraphRetrievalMethod
+HaemophilusParainfluenzae: GraphRetrievalMethod
+HaemophilusParaphrohaemolyticus: GraphRetrievalMethod
+HaemophilusSomnus: GraphRetrievalMethod
+HaemophilusSpFf7: GraphRetrievalMethod
+HaemophilusSputorum: GraphRetrievalMethod
+HafniaAlvei: GraphRetrievalMethod
+HahellaChejuensis: GraphRetrievalMethod
+HahellaGanghwensis: GraphRetrievalMethod
+HaladaptatusCibarius: GraphRetrievalMethod
+HaladaptatusPaucihalophilus: GraphRetrievalMethod
+HalalkalibacillusHalophilus: GraphRetrievalMethod
+HalalkalicoccusJeotgali: GraphRetrievalMethod
+HalanaerobiumHydrogeniformans: GraphRetrievalMethod
+HalanaerobiumPraevalens: GraphRetrievalMethod
+HalanaerobiumSaccharolyticum: GraphRetrievalMethod
+HalapricumSalinum: GraphRetrievalMethod
+HalarchaeumAcidiphilum: GraphRetrievalMethod
+HaliaeetusLeucocephalus: GraphRetrievalMethod
+HaliangiumOchraceum: GraphRetrievalMethod
+HalieaRubra: GraphRetrievalMethod
+HalieaSalexigens: GraphRetrievalMethod
+HaliscomenobacterHydrossis: GraphRetrievalMethod
+Haloarchaeon3a1dgr: GraphRetrievalMethod
+HaloarculaHispanica: GraphRetrievalMethod
+HaloarculaJaponica: GraphRetrievalMethod
+HaloarculaMarismortui: GraphRetrievalMethod
+HalobacillusDabanensis: GraphRetrievalMethod
+HalobacillusHalophilus: GraphRetrievalMethod
+HalobacillusKuroshimensis: GraphRetrievalMethod
+HalobacillusSpBab2008: GraphRetrievalMethod
+HalobacteriumSpDl1: GraphRetrievalMethod
+HalobacteroidesHalobius: GraphRetrievalMethod
+HalobellusRufus: GraphRetrievalMethod
+HalobiformaLacisalsi: GraphRetrievalMethod
+HalobiformaNitratireducens: GraphRetrievalMethod
+HalobonumTyrrellensis: GraphRetrievalMethod
+HalococcusHamelinensis: GraphRetrievalMethod
+HalococcusMorrhuae: GraphRetrievalMethod
+HalococcusSp197a: GraphRetrievalMethod
+HalococcusThailandensis: GraphRetrievalMethod
+HaloferacalesArchaeonDl31: GraphRetrievalMethod
+HaloferaxMediterranei: GraphRetrievalMethod
+HaloferaxMucosum: GraphRetrievalMethod
+HaloferaxVolcanii: GraphRetrievalMethod
+HaloferulaSpBvorr071: GraphRetrievalMethod
+HalogeometricumBorinquense: GraphRetrievalMethod
+HaloglycomycesAlbus: GraphRetrievalMethod
+HalogranumSalarium: GraphRetrievalMethod
+HalomicrobiumMukohataei: GraphRetrievalMethod
+HalomonasAlkaliantarctica: GraphRetrievalMethod
+HalomonasAnticariensis: GraphRetrievalMethod
+HalomonasElongata: GraphRetrievalMethod
+HalomonasHalocynthiae: GraphRetrievalMethod
+HalomonasJeotgali: GraphRetrievalMethod
+HalomonasLutea: GraphRetrievalMethod
+HalomonasSalina: GraphRetrievalMethod
+HalomonasSp23gom1509m: GraphRetrievalMethod
+HalomonasSpBjgmmb45: GraphRetrievalMethod
+HalomonasSpGfaj1: GraphRetrievalMethod
+HalomonasSpHl48: GraphRetrievalMethod
+HalomonasSpKo116: GraphRetrievalMethod
+HalomonasSpPbn3: GraphRetrievalMethod
+HalomonasSpTd01: GraphRetrievalMethod
+HalomonasSpTg39a: GraphRetrievalMethod
+HalomonasXinjiangensis: GraphRetrievalMethod
+HalomonasZhanjiangensis: GraphRetrievalMethod
+HalonatronumSaccharophilum: GraphRetrievalMethod
+HalonotiusSpJ07hn4: GraphRetrievalMethod
+HalopigerSalifodinae: GraphRetrievalMethod
+HalopigerSpIih2: GraphRetrievalMethod
+HalopigerSpIih3: GraphRetrievalMethod
+HalopigerXanaduensis: GraphRetrievalMethod
+HaloplanusNatans: GraphRetrievalMethod
+HaloplasmaContractile: GraphRetrievalMethod
+HaloquadratumWalsbyiDsm16790: GraphRetrievalMethod
+HaloquadratumWalsbyiJ07hqw2: GraphRetrievalMethod
+HalorhabdusTiamatea: GraphRetrievalMethod
+HalorhabdusUtahensis: GraphRetrievalMethod
+HalorhodospiraHalophila: GraphRetrievalMethod
+HalorubrumEzzemoulense: GraphRetrievalMethod
+HalorubrumHalophilum: GraphRetrievalMethod
+HalorubrumLacusprofundi: GraphRetrievalMethod
+HalorubrumSaccharovorum: GraphRetrievalMethod
+HalosarcinaPallida: GraphRetrievalMethod
+HalosimplexCarlsbadense: GraphRetrievalMethod
+HalostagnicolaLarsenii: GraphRetrievalMethod
+HaloterrigenaLimicola: GraphRetrievalMethod
+HaloterrigenaSalina: GraphRetrievalMethod
+HaloterrigenaTurkmenica: GraphRetrievalMethod
+HalotheceSpPcc7418: GraphRetrievalMethod
+HalothermothrixOrenii: GraphRetrievalMethod
+HalothiobacillusNeapolitanus: GraphRetrievalMethod
+HalovivaxRuber: GraphRetrievalMethod
+HalyomorphaHalys: GraphRetrievalMethod
+HamadaeaTsunoensis: GraphRetrievalMethod
+HamiltonellaDefensa: GraphRetrievalMethod
+HammondiaHammondi: GraphRetrievalMethod
+HaplochromisBurtoni: GraphRetrievalMethod
+HelcococcusKunzii: GraphRetrievalMethod
+HelcococcusSueciensis: GraphRetrievalMethod
+HelicobacterAcinonychis: GraphRetrievalMethod
+HelicobacterBilis: GraphRetrievalMethod
+HelicobacterBizzozeronii: GraphRetrievalMethod
+HelicobacterCanadensis: GraphRetrievalMethod
+HelicobacterCanis: GraphRetrievalMethod
+HelicobacterCetorumMit007128: GraphRetrievalMethod
+HelicobacterCetorumMit995656: GraphRetrievalMethod
+HelicobacterCinaediCcug18818: GraphRetrievalMethod
+HelicobacterCinaediPagu611: GraphRetrievalMethod
+HelicobacterFelis: GraphRetrievalMethod
+HelicobacterFennelliae: GraphRetrievalMethod
+HelicobacterHepaticus: GraphRetrievalMethod
+HelicobacterMacacae: GraphRetrievalMethod
+HelicobacterMustelae: GraphRetrievalMethod
+HelicobacterPametensis: GraphRetrievalMethod
+HelicobacterPullorum: GraphRetrievalMethod
+HelicobacterPylori26695: GraphRetrievalMethod
+HelicobacterPyloriJ99: GraphRetrievalMethod
+HelicobacterPyloriSa213a: GraphRetrievalMethod
+HelicobacterPyloriSouthafrica7: GraphRetrievalMethod
+HelicobacterRodentium: GraphRetrievalMethod
+HelicobacterSpMit016451: GraphRetrievalMethod
+HelicobacterSpMit115569: GraphRetrievalMethod
+HelicobacterSuis: GraphRetrievalMethod
+HelicobacterTrogontum: GraphRetrievalMethod
+HelicobacterWinghamensis: GraphRetrievalMethod
+HeliconiusMelpomene: GraphRetrievalMethod
+HeliobacteriumModesticaldum: GraphRetrievalMethod
+HelleaBalneolensis: GraphRetrievalMethod
+HelobdellaRobusta: GraphRetrievalMethod
+HenriciellaMarina: GraphRetrievalMethod
+HepatobacterPenaei: GraphRetrievalMethod
+HepatoplasmaCrinochetorum: GraphRetrievalMethod
+HerbaspirillumFrisingense: GraphRetrievalMethod
+HerbaspirillumMassiliense: GraphRetrievalMethod
+HerbaspirillumSeropedicae: GraphRetrievalMethod
+HerbaspirillumSpCf444: GraphRetrievalMethod
+HerbaspirillumSpGw103: GraphRetrievalMethod
+HerbaspirillumSpYr522: GraphRetrievalMethod
+HerbidosporaCretacea: GraphRetrievalMethod
+HerminiimonasArsenicoxydans: GraphRetrievalMethod
+HerpetosiphonAurantiacus: GraphRetrievalMethod
+HeterobasidionIrregulare: GraphRetrievalMethod
+HeterocephalusGlaber: GraphRetrievalMethod
+HippeaAlviniae: GraphRetrievalMethod
+HippeaJasoniae: GraphRetrievalMethod
+HippeaMaritima: GraphRetrievalMethod
+HippeaSpKm1: GraphRetrievalMethod
+HirschiaBaltica: GraphRetrievalMethod
+HirschiaMaritima: GraphRetrievalMethod
+HistoplasmaCapsulatum: GraphRetrievalMethod
+HoefleaPhototrophica: GraphRetrievalMethod
+HoefleaSp108: GraphRetrievalMethod
+HoefleaSpBal378: GraphRetrievalMethod
+HoldemanellaBiformis: GraphRetrievalMethod
+HoldemaniaFiliformis: GraphRetrievalMethod
+HoldemaniaMassiliensis: GraphRetrievalMethod
+HolophagaFoetida: GraphRetrievalMethod
+HolosporaObtusa: GraphRetrievalMethod
+HomoSapiens: GraphRetrievalMethod
+HordeumVulgare: GraphRetrievalMethod
+HumibacterAlbus: GraphRetrievalMethod
+HyaloperonosporaArabidopsidis: GraphRetrievalMethod
+HydraVulgaris: GraphRetrievalMethod
+HydrogenobacterThermophilus: GraphRetrievalMethod
+HydrogenobaculumSpHo: GraphRetrievalMethod
+HydrogenobaculumSpY04aas1: GraphRetrievalMethod
+HylemonellaGracilisAtcc19624: GraphRetrievalMethod
+HylemonellaGracilisNiagara: GraphRetrievalMethod
+HymenobacterNorwichensis: GraphRetrievalMethod
+HymenobacterSpApr13: GraphRetrievalMethod
+HymenobacterSwuensis: GraphRetrievalMethod
+HyperthermusButylicus: GraphRetrievalMethod
+HyphomicrobiumDenitrificans1nes1: GraphRetrievalMethod
+HyphomicrobiumDenitrificansAtcc51888: GraphRetrievalMethod
+HyphomicrobiumSpMc1: GraphRetrievalMethod
+HyphomicrobiumZavarzinii: GraphRetrievalMethod
+HyphomonasAdhaerens: GraphRetrievalMethod
+HyphomonasJannaschiana: GraphRetrievalMethod
+HyphomonasJohnsonii: GraphRetrievalMethod
+HyphomonasNeptunium: GraphRetrievalMethod
+HyphomonasOceanitis: GraphRetrievalMethod
+HyphomonasPolymorpha: GraphRetrievalMethod
+HyphomonasSp22ii122f38: GraphRetrievalMethod
+HyphomonasSp25b141: GraphRetrievalMethod
+HyphomonasSpBhbn044: GraphRetrievalMethod
+HyphomonasSpCy54118: GraphRetrievalMethod
+HyphomonasSpL53140: GraphRetrievalMethod
+HyphomonasSpT16b2: GraphRetrievalMethod
+IchthyophthiriusMultifiliis: GraphRetrievalMethod
+IctidomysTridecemlineatus: GraphRetrievalMethod
+IdiomarinaLoihiensis: GraphRetrievalMethod
+IdiomarinaSalinarum: GraphRetrievalMethod
+IdiomarinaSpA28l: GraphRetrievalMethod
+IdiomarinaSpMccc1a10513: GraphRetrievalMethod
+IdiomarinaXiamenensis: GraphRetrievalMethod
+IgnatzschineriaLarvae: GraphRetrievalMethod
+IgnavibacteriumAlbum: GraphRetrievalMethod
+IgnicoccusHospitalis: GraphRetrievalMethod
+IlumatobacterCoccineus: GraphRetrievalMethod
+IlyobacterPolytropus: GraphRetrievalMethod
+ImtechellaHalotolerans: GraphRetrievalMethod
+IndibacterAlkaliphilus: GraphRetrievalMethod
+IntestinibacterBartlettii: GraphRetrievalMethod
+IntestinimonasButyriciproducens: GraphRetrievalMethod
+IntrasporangiaceaeBacteriumUrhb0013: GraphRetrievalMethod
+IntrasporangiumCalvum: GraphRetrievalMethod
+IntrasporangiumOryzae: GraphRetrievalMethod
+IsoptericolaVariabilis: GraphRetrievalMethod
+IsosphaeraPallida: GraphRetrievalMethod
+JaculusJaculus: GraphRetrievalMethod
+JanibacterHoylei: GraphRetrievalMethod
+JanibacterSpHtcc2649: GraphRetrievalMethod
+JannaschiaSpCcs1: GraphRetrievalMethod
+JanthinobacteriumAgaricidamnosum: GraphRetrievalMethod
+JanthinobacteriumLividum: GraphRetrievalMethod
+JanthinobacteriumSpHh01: GraphRetrievalMethod
+JanthinobacteriumSpMarseille: GraphRetrievalMethod
+JejuiaPallidilutea: GraphRetrievalMethod
+JeotgalicoccusMarinus: GraphRetrievalMethod
+JeotgalicoccusPsychrophilus: GraphRetrievalMethod
+JeotgalicoccusSp13mg44air: GraphRetrievalMethod
+JohnsonellaIgnava: GraphRetrievalMethod
+JonesiaDenitrificans: GraphRetrievalMethod
+JonesiaQuinghaiensis: GraphRetrievalMethod
+JonquetellaAnthropiDsm22815: GraphRetrievalMethod
+JonquetellaAnthropiE333e1: GraphRetrievalMethod
+JoostellaMarina: GraphRetrievalMethod
+KaistiaGranuli: GraphRetrievalMethod
+KallipygaMassiliensis: GraphRetrievalMethod
+KamptonemaFormosum: GraphRetrievalMethod
+KandleriaVitulina: GraphRetrievalMethod
+KangiellaAquimarina: GraphRetrievalMethod
+KangiellaKoreensis: GraphRetrievalMethod
+KazachstaniaAfricana: GraphRetrievalMethod
+KazachstaniaNaganishii: GraphRetrievalMethod
+KetogulonicigeniumVulgare: GraphRetrievalMethod
+KiloniellaLaminariae: GraphRetrievalMethod
+KineococcusRadiotolerans: GraphRetrievalMethod
+KineosphaeraLimosa: GraphRetrievalMethod
+KineosporiaAurantiaca: GraphRetrievalMethod
+KinetoplastibacteriumBlastocrithidii: GraphRetrievalMethod
+KinetoplastibacteriumCrithidii: GraphRetrievalMethod
+KinetoplastibacteriumDesouzaii: GraphRetrievalMethod
+KinetoplastibacteriumGalatii: GraphRetrievalMethod
+KinetoplastibacteriumOncopeltii: GraphRetrievalMethod
+KingellaKingae: GraphRetrievalMethod
+KitasatosporaArboriphila: GraphRetrievalMethod
+KitasatosporaAzatica: GraphRetrievalMethod
+KitasatosporaCheerisanensis: GraphRetrievalMethod
+KitasatosporaMediocidica: GraphRetrievalMethod
+KitasatosporaSetae: GraphRetrievalMethod
+KlebsiellaOxytoca: GraphRetrievalMethod
+KlebsiellaPneumoniae: GraphRetrievalMethod
+KluyveraAscorbata: GraphRetrievalMethod
+KluyveromycesLactis: GraphRetrievalMethod
+KnoelliaAerolata: GraphRetrievalMethod
+KnoelliaFlava: GraphRetrievalMethod
+KnoelliaSinensis: GraphRetrievalMethod
+KnoelliaSubterranea: GraphRetrievalMethod
+KocuriaMarina: GraphRetrievalMethod
+KocuriaPolaris: GraphRetrievalMethod
+KocuriaRhizophilaDc2201: GraphRetrievalMethod
+KocuriaRhizophilaP74: GraphRetrievalMethod
+KomagataeibacterMedellinensis: GraphRetrievalMethod
+KomagataeibacterRhaeticus: GraphRetrievalMethod
+KomagataeibacterXylinus: GraphRetrievalMethod
+KomagataellaPastoris: GraphRetrievalMethod
+KorarchaeumCryptofilum: GraphRetrievalMethod
+KordiaAlgicida: GraphRetrievalMethod
+KordiimonasGwangyangensis: GraphRetrievalMethod
+KoribacterVersatilis: GraphRetrievalMethod
+KosmotogaOlearia: GraphRetrievalMethod
+KozakiaBaliensis: GraphRetrievalMethod
+KribbellaCatacumbae: GraphRetrievalMethod
+KribbellaFlavida: GraphRetrievalMethod
+KtedonobacterRacemifer: GraphRetrievalMethod
+KurthiaHuakuii: GraphRetrievalMethod
+KurthiaMassiliensis: GraphRetrievalMethod
+KurthiaSpDielmo: GraphRetrievalMethod
+KurthiaSpJc8e: GraphRetrievalMethod
+KushneriaAurantia: GraphRetrievalMethod
+KutzneriaAlbida: GraphRetrievalMethod
+KutzneriaSp744: GraphRetrievalMethod
+KyrpidiaTusciae: GraphRetrievalMethod
+KytococcusSedentarius: GraphRetrievalMethod
+LabrenziaAggregata: GraphRetrievalMethod
+LaceyellaSacchari: GraphRetrievalMethod
+LachanceaThermotolerans: GraphRetrievalMethod
+LachnoanaerobaculumSaburreumDsm3986: GraphRetrievalMethod
+LachnoanaerobaculumSaburreumF0468: GraphRetrievalMethod
+LachnoanaerobaculumSpMsx33: GraphRetrievalMethod
+LachnobacteriumBovis: GraphRetrievalMethod
+LachnoclostridiumPhytofermentans: GraphRetrievalMethod
+LachnospiraMultiparaAtcc19207: GraphRetrievalMethod
+LachnospiraMultiparaLb2003: GraphRetrievalMethod
+LachnospiraceaeBacterium101: GraphRetrievalMethod
+LachnospiraceaeBacterium1456faa: GraphRetrievalMethod
+LachnospiraceaeBacterium2146faa: GraphRetrievalMethod
+LachnospiraceaeBacterium284: GraphRetrievalMethod
+LachnospiraceaeBacterium31: GraphRetrievalMethod
+LachnospiraceaeBacterium3146faa: GraphRetrievalMethod
+LachnospiraceaeBacterium3157faact1: GraphRetrievalMethod
+LachnospiraceaeBacterium32: GraphRetrievalMethod
+LachnospiraceaeBacterium9143bfaa: GraphRetrievalMethod
+LachnospiraceaeBacteriumA2: GraphRetrievalMethod
+LachnospiraceaeBacteriumA4: GraphRetrievalMethod
+LachnospiraceaeBacteriumAc2028: GraphRetrievalMethod
+LachnospiraceaeBacteriumAc2029: GraphRetrievalMethod
+LachnospiraceaeBacteriumAc2031: GraphRetrievalMethod
+LachnospiraceaeBacteriumAc3007: GraphRetrievalMethod
+LachnospiraceaeBacteriumC6a11: GraphRetrievalMethod
+LachnospiraceaeBacteriumCoe1: GraphRetrievalMethod
+LachnospiraceaeBacteriumF0431: GraphRetrievalMethod
+LachnospiraceaeBacteriumFe2018: GraphRetrievalMethod
+LachnospiraceaeBacteriumM181: GraphRetrievalMethod
+LachnospiraceaeBacteriumMa2020: GraphRetrievalMethod
+LachnospiraceaeBacteriumMc2017: GraphRetrievalMethod
+LachnospiraceaeBacteriumMd2004: GraphRetrievalMethod
+LachnospiraceaeBacteriumNc2004: GraphRetrievalMethod
+LachnospiraceaeBacteriumNd2006: GraphRetrievalMethod
+LachnospiraceaeBacteriumNk4a136: GraphRetrievalMethod
+LachnospiraceaeBacteriumNk4a144: GraphRetrievalMethod
+LachnospiraceaeBacteriumNk4a179: GraphRetrievalMethod
+LachnospiraceaeBacteriumP6a3: GraphRetrievalMethod
+LachnospiraceaeBacteriumP6b14: GraphRetrievalMethod
+LachnospiraceaeBacteriumV9d3004: GraphRetrievalMethod
+LachnospiraceaeBacteriumYsb2008: GraphRetrievalMethod
+LachnospiraceaeF0167: GraphRetrievalMethod
+LacinutrixSp5h374: GraphRetrievalMethod
+LacinutrixSpPamc27137: GraphRetrievalMethod
+LacticigeniumNaphtae: GraphRetrievalMethod
+LactobacillusAcidophilus30sc: GraphRetrievalMethod
+LactobacillusAcidophilusNcfm: GraphRetrievalMethod
+LactobacillusAmylolyticus: GraphRetrievalMethod
+LactobacillusAnimalis: GraphRetrievalMethod
+LactobacillusAntri: GraphRetrievalMethod
+LactobacillusApodemi: GraphRetrievalMethod
+LactobacillusBrevisAtcc367: GraphRetrievalMethod
+LactobacillusBuchneriAtcc11577: GraphRetrievalMethod
+LactobacillusBuchneriCd034: GraphRetrievalMethod
+LactobacillusBuchneriNrrlb30929: GraphRetrievalMethod
+LactobacillusCaseiBl23: GraphRetrievalMethod
+LactobacillusCaseiDsm20011: GraphRetrievalMethod
+LactobacillusCeti: GraphRetrievalMethod
+LactobacillusColeohominis: GraphRetrievalMethod
+LactobacillusComposti: GraphRetrievalMethod
+LactobacillusCoryniformisKctc3167: GraphRetrievalMethod
+LactobacillusCrispatus: GraphRetrievalMethod
+LactobacillusCurieae: GraphRetrievalMethod
+LactobacillusCurvatus: GraphRetrievalMethod
+LactobacillusDelbrueckii2038: GraphRetrievalMethod
+LactobacillusDelbrueckiiAtcc11842: GraphRetrievalMethod
+LactobacillusEquicursoris: GraphRetrievalMethod
+LactobacillusFabifermentans: GraphRetrievalMethod
+LactobacillusFarciminis: GraphRetrievalMethod
+LactobacillusFarraginis: GraphRetrievalMethod
+LactobacillusFermentumIfo3956: GraphRetrievalMethod
+LactobacillusFlorum: GraphRetrievalMethod
+LactobacillusFructivorans: GraphRetrievalMethod
+LactobacillusFuchuensis: GraphRetrievalMethod
+LactobacillusGallinarum: GraphRetrievalMethod
+LactobacillusGasseri: GraphRetrievalMethod
+LactobacillusHamsteri: GraphRetrievalMethod
+LactobacillusHarbinensis: GraphRetrievalMethod
+LactobacillusHayakitensis: GraphRetrievalMethod
+LactobacillusHelveticusCnrz32: GraphRetrievalMethod
+LactobacillusHelveticusDpc4571: GraphRetrievalMethod
+LactobacillusHominis: GraphRetrievalMethod
+LactobacillusIners: GraphRetrievalMethod
+LactobacillusIngluviei: GraphRetrievalMethod
+LactobacillusJensenii1153chn: GraphRetrievalMethod
+LactobacillusJensenii272chn: GraphRetrievalMethod
+LactobacillusJohnsonii: GraphRetrievalMethod
+LactobacillusKefiranofaciens: GraphRetrievalMethod
+LactobacillusKitasatonis: GraphRetrievalMethod
+LactobacillusKunkeei: GraphRetrievalMethod
+LactobacillusMalefermentans: GraphRetrievalMethod
+LactobacillusMurinus: GraphRetrievalMethod
+LactobacillusNamurensis: GraphRetrievalMethod
+LactobacillusNodensis: GraphRetrievalMethod
+LactobacillusOrisF0423: GraphRetrievalMethod
+LactobacillusOrisPb013t23: GraphRetrievalMethod
+LactobacillusOryzae: GraphRetrievalMethod
+LactobacillusOtakiensis: GraphRetrievalMethod
+LactobacillusParabrevis: GraphRetrievalMethod
+LactobacillusParafarraginis: GraphRetrievalMethod
+LactobacillusParaplantarum: GraphRetrievalMethod
+LactobacillusPasteurii: GraphRetrievalMethod
+LactobacillusPentosus: GraphRetrievalMethod
+LactobacillusPlantarum: GraphRetrievalMethod
+LactobacillusPsittaci: GraphRetrievalMethod
+LactobacillusReuteri10023: GraphRetrievalMethod
+LactobacillusReuteriDsm20016: GraphRetrievalMethod
+LactobacillusRhamnosus: GraphRetrievalMethod
+LactobacillusRossiae: GraphRetrievalMethod
+LactobacillusRuminisAtcc27782: GraphRetrievalMethod
+LactobacillusSakei: GraphRetrievalMethod
+LactobacillusSanfranciscensis: GraphRetrievalMethod
+LactobacillusShenzhenensis: GraphRetrievalMethod
+LactobacillusSpAsf360: GraphRetrievalMethod
+LactobacillusSpWkb10: GraphRetrievalMethod
+LactobacillusSpWkb8: GraphRetrievalMethod
+LactobacillusSucicola: GraphRetrievalMethod
+LactobacillusSuebicus: GraphRetrievalMethod
+LactobacillusUltunensis: GraphRetrievalMethod
+LactobacillusVaginalis: GraphRetrievalMethod
+LactobacillusVersmoldensis: GraphRetrievalMethod
+LactobacillusVini: GraphRetrievalMethod
+LactobacillusZeae: GraphRetrievalMethod
+LactococcusGarvieaeDcc43: GraphRetrievalMethod
+LactococcusGarvieaeI113: GraphRetrievalMethod
+LactococcusGarvieaeLg2: GraphRetrievalMethod
+LactococcusLactisCremoris: GraphRetrievalMethod
+LactococcusLactisIl1403: GraphRetrievalMethod
+LactococcusRaffinolactis: GraphRetrievalMethod
+LaribacterHongkongensis: GraphRetrievalMethod
+LarimichthysCrocea: GraphRetrievalMethod
+LatimeriaChalumnae: GraphRetrievalMethod
+LautropiaMirabilis: GraphRetrievalMethod
+LawsoniaIntracellularis: GraphRetrievalMethod
+LeadbetterellaByssophila: GraphRetrievalMethod
+LebetimonasSpJs170: GraphRetrievalMethod
+LechevalieriaAerocolonigenes: GraphRetrievalMethod
+LeclerciaAdecarboxylata: GraphRetrievalMethod
+LeersiaPerrieri: GraphRetrievalMethod
+LeeuwenhoekiellaBlandensis: GraphRetrievalMethod
+LeeuwenhoekiellaSpHeli48: GraphRetrievalMethod
+LeeuwenhoekiellaSpMar2009132: GraphRetrievalMethod
+LegionellaAnisa: GraphRetrievalMethod
+LegionellaDrancourtii: GraphRetrievalMethod
+LegionellaFairfieldensis: GraphRetrievalMethod
+LegionellaLansingensis: GraphRetrievalMethod
+LegionellaLongbeachae: GraphRetrievalMethod
+LegionellaMassiliensis: GraphRetrievalMethod
+LegionellaMoravica: GraphRetrievalMethod
+LegionellaOakridgensis: GraphRetrievalMethod
+LegionellaPneumophilaParis: GraphRetrievalMethod
+LegionellaPneumophilaPhiladelphia: GraphRetrievalMethod
+LegionellaSainthelensi: GraphRetrievalMethod
+LegionellaShakespearei: GraphRetrievalMethod
+LeifsoniaAquatica: GraphRetrievalMethod
+LeifsoniaRubra: GraphRetrievalMethod
+LeifsoniaSp109: GraphRetrievalMethod
+LeifsoniaXyliCtcb07: GraphRetrievalMethod
+LeifsoniaXyliCynodontis: GraphRetrievalMethod
+LeishmaniaInfantum: GraphRetrievalMethod
+LeishmaniaMajor: GraphRetrievalMethod
+LeishmaniaPanamensis: GraphRetrievalMethod
+LeisingeraAquimarina: GraphRetrievalMethod
+LeisingeraCaerulea: GraphRetrievalMethod
+LeisingeraDaeponensis: GraphRetrievalMethod
+LeisingeraSpAng1: GraphRetrievalMethod
+LeminorellaGrimontii: GraphRetrievalMethod
+LentibacillusJeotgali: GraphRetrievalMethod
+LentisphaeraAraneosa: GraphRetrievalMethod
+LentzeaAlbidocapillata: GraphRetrievalMethod
+LepisosteusOculatus: GraphRetrievalMethod
+LeptolyngbyaBoryana: GraphRetrievalMethod
+LeptolyngbyaSpHeron: GraphRetrievalMethod
+LeptolyngbyaSpJsc1: GraphRetrievalMethod
+LeptolyngbyaSpKiost1: GraphRetrievalMethod
+LeptolyngbyaSpPcc6406: GraphRetrievalMethod
+LeptolyngbyaSpPcc7375: GraphRetrievalMethod
+LeptolyngbyaSpPcc7376: GraphRetrievalMethod
+LeptonychotesWeddellii: GraphRetrievalMethod
+LeptosphaeriaMaculans: GraphRetrievalMethod
+LeptospirillumFerrooxidans: GraphRetrievalMethod
+LeptothrixCholodnii: GraphRetrievalMethod
+LeptotrichiaBuccalis: GraphRetrievalMethod
+LeptotrichiaGoodfellowii: GraphRetrievalMethod
+LeptotrichiaHofstadii: GraphRetrievalMethod
+LeptotrichiaShahii: GraphRetrievalMethod
+LeptotrichiaSpF0557: GraphRetrievalMethod
+LeptotrichiaSpF0581: GraphRetrievalMethod
+LeptotrichiaSpW9775: GraphRetrievalMethod
+LeptotrichiaTrevisanii: GraphRetrievalMethod
+LeptotrichiaWadei: GraphRetrievalMethod
+LeucobacterChironomi: GraphRetrievalMethod
+LeucobacterChromiiresistens: GraphRetrievalMethod
+LeucobacterSalsicius: GraphRetrievalMethod
+LeucobacterSpPh1c: GraphRetrievalMethod
+LeuconostocCarnosum: GraphRetrievalMethod
+LeuconostocCitreum: GraphRetrievalMethod
+LeuconostocFallax: GraphRetrievalMethod
+LeuconostocGasicomitatum: GraphRetrievalMethod
+LeuconostocGelidumJb7: GraphRetrievalMethod
+LeuconostocGelidumKctc3527: GraphRetrievalMethod
+LeuconostocKimchii: GraphRetrievalMethod
+LeuconostocLactis: GraphRetrievalMethod
+LeuconostocMesenteroides: GraphRetrievalMethod
+LeuconostocPseudomesenteroides: GraphRetrievalMethod
+LeucothrixMucor: GraphRetrievalMethod
+LewinellaCohaerens: GraphRetrievalMethod
+LewinellaPersica: GraphRetrievalMethod
+LiberibacterAmericanus: GraphRetrievalMethod
+LiberibacterAsiaticusGxpsy: GraphRetrievalMethod
+LiberibacterAsiaticusPsy62: GraphRetrievalMethod
+LiberibacterCrescens: GraphRetrievalMethod
+LiberibacterSolanacearum: GraphRetrievalMethod
+LimnohabitansSpRim28: GraphRetrievalMethod
+LimnohabitansSpRim47: GraphRetrievalMethod
+LinumUsitatissimum: GraphRetrievalMethod
+LipotesVexillifer: GraphRetrievalMethod
+ListeriaGrayi: GraphRetrievalMethod
+ListeriaInnocua: GraphRetrievalMethod
+ListeriaIvanoviiLondoniensis: GraphRetrievalMethod
+ListeriaIvanoviiPam55: GraphRetrievalMethod
+ListeriaMonocytogenesEgde: GraphRetrievalMethod
+ListeriaMonocytogenesScott: GraphRetrievalMethod
+ListeriaSeeligeri12b: GraphRetrievalMethod
+ListeriaWeihenstephanensis: GraphRetrievalMethod
+ListeriaWelshimeri: GraphRetrievalMethod
+ListeriaceaeBacteriumFsla50209: GraphRetrievalMethod
+ListeriaceaeBacteriumFsla50281: GraphRetrievalMethod
+LoaLoa: GraphRetrievalMethod
+LodderomycesElongisporus: GraphRetrievalMethod
+LoktanellaCinnabarina: GraphRetrievalMethod
+LoktanellaHongkongensis: GraphRetrievalMethod
+LoktanellaVestfoldensisSka53: GraphRetrievalMethod
+LongisporaAlbida: GraphRetrievalMethod
+LonsdaleaQuercina: GraphRetrievalMethod
+LoxodontaAfricana: GraphRetrievalMethod
+LuminiphilusSyltensis: GraphRetrievalMethod
+LuteibacterSp9135: GraphRetrievalMethod
+LuteibacterSp9143: GraphRetrievalMethod
+LuteimonasHuabeiensis: GraphRetrievalMethod
+LuteimonasSpJ29: GraphRetrievalMethod
+LutibaculumBaratangense: GraphRetrievalMethod
+LyngbyaSpPcc8106: GraphRetrievalMethod
+LysinibacillusFusiformis: GraphRetrievalMethod
+LysinibacillusManganicus: GraphRetrievalMethod
+LysinibacillusMassiliensis: GraphRetrievalMethod
+LysinibacillusOdysseyi: GraphRetrievalMethod
+LysinibacillusSinduriensis: GraphRetrievalMethod
+LysinibacillusSpBf4: GraphRetrievalMethod
+LysinibacillusSphaericusOt4b31: GraphRetrievalMethod
+LysinibacillusVarians: GraphRetrievalMethod
+LysinimicrobiumMangrovi: GraphRetrievalMethod
+LysobacterAntibioticus: GraphRetrievalMethod
+LysobacterArseniciresistens: GraphRetrievalMethod
+LysobacterConcretionis: GraphRetrievalMethod
+LysobacterDaejeonensis: GraphRetrievalMethod
+LysobacterDefluvii: GraphRetrievalMethod
+LysobacterDokdonensis: GraphRetrievalMethod
+MacacaFascicularis: GraphRetrievalMethod
+MacacaMulatta: GraphRetrievalMethod
+MacrococcusCaseolyticus: GraphRetrievalMethod
+MacrophominaPhaseolina: GraphRetrievalMethod
+MacropusEugenii: GraphRetrievalMethod
+MagnaportheOryzae: GraphRetrievalMethod
+MagnaporthiopsisPoae: GraphRetrievalMethod
+MagnetococcusMarinus: GraphRetrievalMethod
+MagnetospirillumGryphiswaldense: GraphRetrievalMethod
+MagnetospirillumSpSo1: GraphRetrievalMethod
+MahellaAustraliensis: GraphRetrievalMethod
+MalusDomestica: GraphRetrievalMethod
+MangrovibacterSpMfb070: GraphRetrievalMethod
+MangrovimonasYunxiaonensis: GraphRetrievalMethod
+ManihotEsculenta: GraphRetrievalMethod
+MannheimiaHaemolyticaBovine: GraphRetrievalMethod
+MannheimiaHaemolyticaM42548: GraphRetrievalMethod
+MannheimiaSucciniciproducens: GraphRetrievalMethod
+MannheimiaVarigenaUsmarc1261: GraphRetrievalMethod
+MannheimiaVarigenaUsmarc1296: GraphRetrievalMethod
+MaribacterForsetii: GraphRetrievalMethod
+MaribacterSpHeli7: GraphRetrievalMethod
+MaribacterSpHtcc2170: GraphRetrievalMethod
+MaribiusSpMola401: GraphRetrievalMethod
+MaricaulisMaris: GraphRetrievalMethod
+MaricaulisSpJl2009: GraphRetrievalMethod
+MarichromatiumPurpuratum: GraphRetrievalMethod
+MarinilabiliaSalmonicolor: GraphRetrievalMethod
+MarinimicrobiumAgarilyticum: GraphRetrievalMethod
+MariniradiusSaccharolyticus: GraphRetrievalMethod
+MarinithermusHydrothermalis: GraphRetrievalMethod
+MarinitogaPiezophila: GraphRetrievalMethod
+MarinobacterAdhaerens: GraphRetrievalMethod
+MarinobacterAlgicola: GraphRetrievalMethod
+MarinobacterDaepoensis: GraphRetrievalMethod
+MarinobacterHydrocarbonoclasticus: GraphRetrievalMethod
+MarinobacterLipolyticusBf04cf4: GraphRetrievalMethod
+MarinobacterLipolyticusSm19: GraphRetrievalMethod
+MarinobacterNanhaiticus: GraphRetrievalMethod
+MarinobacterSantoriniensis: GraphRetrievalMethod
+MarinobacterSpElb17: GraphRetrievalMethod
+MarinobacterSpEs1: GraphRetrievalMethod
+MarinobacterSpHl58: GraphRetrievalMethod
+MarinobacterSpMctg268: GraphRetrievalMethod
+MarinobacteriumLitorale: GraphRetrievalMethod
+MarinobacteriumSpAk27: GraphRetrievalMethod
+MarinobacteriumStanieri: GraphRetrievalMethod
+MarinomonasMediterranea: GraphRetrievalMethod
+MarinomonasPosidonica: GraphRetrievalMethod
+MarinomonasSpD104: GraphRetrievalMethod
+MarinomonasSpMwyl1: GraphRetrievalMethod
+MarinomonasUshuaiensis: GraphRetrievalMethod
+MarinospirillumInsulare: GraphRetrievalMethod
+MarinospirillumMinutulum: GraphRetrievalMethod
+MariprofundusFerrooxydans: GraphRetrievalMethod
+MaritimibacterAlkaliphilus: GraphRetrievalMethod
+MarivirgaTractuosa: GraphRetrievalMethod
+MarmoricolaAequoreus: GraphRetrievalMethod
+MarmoricolaSpUrhb0036: GraphRetrievalMethod
+MarssoninaBrunnea: GraphRetrievalMethod
+MartelellaMediterranea: GraphRetrievalMethod
+MarvinbryantiaFormatexigens: GraphRetrievalMethod
+MassiliaConsociata: GraphRetrievalMethod
+MassiliaSp9096: GraphRetrievalMethod
+MassiliaSpLc238: GraphRetrievalMethod
+MassiliaTimonae: GraphRetrievalMethod
+MastigocladopsisRepens: GraphRetrievalMethod
+MaylandiaZebra: GraphRetrievalMethod
+MedicagoTruncatula: GraphRetrievalMethod
+MegamonasHypermegale: GraphRetrievalMethod
+MegamonasRupellensis: GraphRetrievalMethod
+MeganemaPerideroedes: GraphRetrievalMethod
+MegasphaeraElsdenii: GraphRetrievalMethod
+MegasphaeraGenomosp: GraphRetrievalMethod
+MegasphaeraMicronuciformis: GraphRetrievalMethod
+MegasphaeraSpBv3c161: GraphRetrievalMethod
+MegasphaeraSpNm10: GraphRetrievalMethod
+MegasphaeraSpNp3: GraphRetrievalMethod
+MegasphaeraSpUpii135e: GraphRetrievalMethod
+MeiothermusCerbereus: GraphRetrievalMethod
+MeiothermusChliarophilus: GraphRetrievalMethod
+MeiothermusRuber: GraphRetrievalMethod
+MeiothermusRufus: GraphRetrievalMethod
+MeiothermusSilvanus: GraphRetrievalMethod
+MeiothermusTaiwanensis: GraphRetrievalMethod
+MeiothermusTimidus: GraphRetrievalMethod
+MelampsoraLaricipopulina: GraphRetrievalMethod
+MelioribacterRoseus: GraphRetrievalMethod
+MesoaciditogaLauensis: GraphRetrievalMethod
+MesocricetusAuratus: GraphRetrievalMethod
+MesoflavibacterZeaxanthDsm18436: GraphRetrievalMethod
+MesoflavibacterZeaxanthS86: GraphRetrievalMethod
+MesoniaMobilis: GraphRetrievalMethod
+MesoplasmaFlorum: GraphRetrievalMethod
+MesorhizobiumAmorphae: GraphRetrievalMethod
+MesorhizobiumAustralicum: GraphRetrievalMethod
+MesorhizobiumCiceriBiovar: GraphRetrievalMethod
+MesorhizobiumLotiCj3sym: GraphRetrievalMethod
+MesorhizobiumLotiMaff303099: GraphRetrievalMethod
+MesorhizobiumLotiR88b: GraphRetrievalMethod
+MesorhizobiumLotiUsda3471: GraphRetrievalMethod
+MesorhizobiumMetallidurans: GraphRetrievalMethod
+MesorhizobiumOpportunistum: GraphRetrievalMethod
+MesorhizobiumSpL2c084a000: GraphRetrievalMethod
+MesorhizobiumSpLnjc398b00: GraphRetrievalMethod
+MesorhizobiumSpNbimcp2c3: GraphRetrievalMethod
+MesorhizobiumSpStm4661: GraphRetrievalMethod
+MesorhizobiumSpUrha0056: GraphRetrievalMethod
+MesorhizobiumSpUrhc0008: GraphRetrievalMethod
+MesorhizobiumSpWsm3224: GraphRetrievalMethod
+MesorhizobiumSpWsm3626: GraphRetrievalMethod
+MesotogaPrima: GraphRetrievalMethod
+MetallosphaeraCuprina: GraphRetrievalMethod
+MetallosphaeraSedula: GraphRetrievalMethod
+MetallosphaeraYellowstonensis: GraphRetrievalMethod
+MetarhiziumAcridum: GraphRetrievalMethod
+MetarhiziumRobertsii: GraphRetrievalMethod
+MetascardoviaCriceti: GraphRetrievalMethod
+MethanobacteriumArcticum: GraphRetrievalMethod
+MethanobacteriumLacus: GraphRetrievalMethod
+MethanobacteriumPaludis: GraphRetrievalMethod
+MethanobacteriumSpMaddingley: GraphRetrievalMethod
+MethanobrevibacterRuminantium: GraphRetrievalMethod
+MethanobrevibacterSmithiiAtcc35061: GraphRetrievalMethod
+MethanobrevibacterSpAbm4: GraphRetrievalMethod
+MethanocaldococcusFervens: GraphRetrievalMethod
+MethanocaldococcusInfernus: GraphRetrievalMethod
+MethanocaldococcusJannaschii: GraphRetrievalMethod
+MethanocaldococcusSpFs40622: GraphRetrievalMethod
+MethanocaldococcusVulcanius: GraphRetrievalMethod
+MethanocellaArvoryzae: GraphRetrievalMethod
+MethanocellaConradii: GraphRetrievalMethod
+MethanocellaPaludicola: GraphRetrievalMethod
+MethanococcusAeolicus: GraphRetrievalMethod
+MethanococcusMaripaludisC5: GraphRetrievalMethod
+MethanococcusMaripaludisC6: GraphRetrievalMethod
+MethanococcusMaripaludisC7: GraphRetrievalMethod
+MethanococcusMaripaludisS2: GraphRetrievalMethod
+MethanococcusVannielii: GraphRetrievalMethod
+MethanococcusVoltae: GraphRetrievalMethod
+MethanocorpusculumLabreanum: GraphRetrievalMethod
+MethanoculleusMarisnigri: GraphRetrievalMethod
+MethanolobusPsychrophilus: GraphRetrievalMethod
+MethanomethylophilusAlvus: GraphRetrievalMethod
+MethanomicrobiumMobile: GraphRetrievalMethod
+MethanoplanusPetrolearius: GraphRetrievalMethod
+MethanoregulaBoonei: GraphRetrievalMethod
+MethanoregulaFormicica: GraphRetrievalMethod
+MethanosarcinaBarkeri: GraphRetrievalMethod
+MethanosarcinaMazei: GraphRetrievalMethod
+MethanosphaeraStadtmanae: GraphRetrievalMethod
+MethanosphaerulaPalustris: GraphRetrievalMethod
+MethanospirillumHungatei: GraphRetrievalMethod
+MethanothermococcusOkinawensis: GraphRetrievalMethod
+MethanothermococcusThermolithotrophicus: GraphRetrievalMethod
+MethylacidiphilumFumariolicum: GraphRetrievalMethod
+MethylacidiphilumInfernorum: GraphRetrievalMethod
+MethylibiumPetroleiphilum: GraphRetrievalMethod
+MethylobacillusFlagellatus: GraphRetrievalMethod
+MethylobacillusGlycogenes: GraphRetrievalMethod
+MethylobacterTundripaludum: GraphRetrievalMethod
+MethylobacteriumExtorquensAm1: GraphRetrievalMethod
+MethylobacteriumExtorquensPa1: GraphRetrievalMethod
+MethylobacteriumNodulans: GraphRetrievalMethod
+MethylobacteriumOryzae: GraphRetrievalMethod
+MethylobacteriumPopuli: GraphRetrievalMethod
+MethylobacteriumRadiotolerans: GraphRetrievalMethod
+MethylobacteriumSp10: GraphRetrievalMethod
+MethylobacteriumSp446: GraphRetrievalMethod
+MethylobacteriumSp77: GraphRetrievalMethod
+MethylobacteriumSp88a: GraphRetrievalMethod
+MethylobacteriumSpGxf4: GraphRetrievalMethod
+MethylobacteriumSpMb200: GraphRetrievalMethod
+MethylocapsaAcidiphila: GraphRetrievalMethod
+MethylocapsaAurea: GraphRetrievalMethod
+MethylocellaSilvestris: GraphRetrievalMethod
+MethylococcusCapsulatus: GraphRetrievalMethod
+MethylocystisParvus: GraphRetrievalMethod
+MethylocystisSpAtcc49242: GraphRetrievalMethod
+MethylocystisSpSb2: GraphRetrievalMethod
+MethylocystisSpSc2: GraphRetrievalMethod
+MethyloferulaStellata: GraphRetrievalMethod
+MethyloglobulusMorosus: GraphRetrievalMethod
+MethylohalobiusCrimeensis: GraphRetrievalMethod
+MethylomicrobiumAlbum: GraphRetrievalMethod
+MethylomirabilisOxyfera: GraphRetrievalMethod
+MethylomonasMethanica: GraphRetrievalMethod
+MethylophagaAminisulfidivorans: GraphRetrievalMethod
+MethylophagaFrappieri: GraphRetrievalMethod
+MethylophagaLonarensis: GraphRetrievalMethod
+MethylophagaNitratireducenticrescens: GraphRetrievalMethod
+MethylophilaceaeBacterium11: GraphRetrievalMethod
+MethylophilusMethylotrophus: GraphRetrievalMethod
+MethylophilusSp5: GraphRetrievalMethod
+MethylophilusSpOh31: GraphRetrievalMethod
+MethylopilaSp73b: GraphRetrievalMethod
+MethylopilaSpM107: GraphRetrievalMethod
+MethylosinusSpLw3: GraphRetrievalMethod
+MethylosinusSpLw4: GraphRetrievalMethod
+MethylosinusSpPw1: GraphRetrievalMethod
+MethylosinusTrichosporium: GraphRetrievalMethod
+MethyloteneraMobilis13: GraphRetrievalMethod
+MethyloteneraMobilisJlw8: GraphRetrievalMethod
+MethyloteneraSp73s: GraphRetrievalMethod
+MethyloteneraSpL2l1: GraphRetrievalMethod
+MethyloteneraVersatilis: GraphRetrievalMethod
+MethyloversatilisUniversalisFam5: GraphRetrievalMethod
+MethylovorusGlucosetrophus: GraphRetrievalMethod
+MeyerozymaGuilliermondii: GraphRetrievalMethod
+MicavibrioAeruginosavorusArl13: GraphRetrievalMethod
+MicrobacteriumGubbeenense: GraphRetrievalMethod
+MicrobacteriumIndicum: GraphRetrievalMethod
+MicrobacteriumLuticocti: GraphRetrievalMethod
+MicrobacteriumOleivorans: GraphRetrievalMethod
+MicrobacteriumParaoxydans77mftsu32: GraphRetrievalMethod
+MicrobacteriumParaoxydansDh1b: GraphRetrievalMethod
+MicrobacteriumProfundi: GraphRetrievalMethod
+MicrobacteriumSp292mf: GraphRetrievalMethod
+MicrobacteriumSpC448: GraphRetrievalMethod
+MicrobacteriumSpCrk20: GraphRetrievalMethod
+MicrobacteriumSpCrk32: GraphRetrievalMethod
+MicrobacteriumSpKrocy2: GraphRetrievalMethod
+MicrobacteriumSpMrs1: GraphRetrievalMethod
+MicrobacteriumSpUnccl10: GraphRetrievalMethod
+MicrobacteriumSpUrha0036: GraphRetrievalMethod
+MicrobacteriumTestaceum: GraphRetrievalMethod
+MicrobacteriumYannicii: GraphRetrievalMethod
+MicrobulbiferAgarilyticus: GraphRetrievalMethod
+MicrobulbiferSpHz11: GraphRetrievalMethod
+MicrobulbiferVariabilis: GraphRetrievalMethod
+MicrochaeteSpPcc7126: GraphRetrievalMethod
+MicrococcusLuteusNctc2665: GraphRetrievalMethod
+MicrocoleusSpPcc7113: GraphRetrievalMethod
+MicrocoleusVaginatus: GraphRetrievalMethod
+MicrocystisAeruginosa: GraphRetrievalMethod
+MicrolunatusPhosphovorus: GraphRetrievalMethod
+MicromonasPusilla: GraphRetrievalMethod
+MicromonasSpRcc299: GraphRetrievalMethod
+MicromonosporaAurantiaca: GraphRetrievalMethod
+MicromonosporaChokoriensis: GraphRetrievalMethod
+MicromonosporaLupini: GraphRetrievalMethod
+MicromonosporaParva: GraphRetrievalMethod
+MicromonosporaSpAtcc39149: GraphRetrievalMethod
+MicroplitisDemolitor: GraphRetrievalMethod
+MicroscillaMarina: GraphRetrievalMethod
+MicrosporumGypseum: GraphRetrievalMethod
+MicrotetrasporaGlauca: GraphRetrievalMethod
+MicrothrixParvicella: GraphRetrievalMethod
+MicrotusOchrogaster: GraphRetrievalMethod
+MicrovirgaAerilata: GraphRetrievalMethod
+MicrovirgaFlocculans: GraphRetrievalMethod
+MicrovirgaLotononidis: GraphRetrievalMethod
+MicrovirgaLupini: GraphRetrievalMethod
+MillerozymaFarinosa: GraphRetrievalMethod
+MitsuokellaJalaludinii: GraphRetrievalMethod
+MitsuokellaMultacida: GraphRetrievalMethod
+MitsuokellaSpW9106: GraphRetrievalMethod
+MixiaOsmundae: GraphRetrievalMethod
+MnemiopsisLeidyi: GraphRetrievalMethod
+MobilicoccusPelagius: GraphRetrievalMethod
+MobiluncusCurtisiiAtcc35241: GraphRetrievalMethod
+MobiluncusCurtisiiAtcc43063: GraphRetrievalMethod
+MobiluncusMulieris281: GraphRetrievalMethod
+MobiluncusMulierisAtcc35243: GraphRetrievalMethod
+ModestobacterMarinus: GraphRetrievalMethod
+MogibacteriumSpCm50: GraphRetrievalMethod
+MollicutesBacteriumHr1: GraphRetrievalMethod
+MollicutesBacteriumHr2: GraphRetrievalMethod
+MoniliophthoraRoreri: GraphRetrievalMethod
+MonodelphisDomestica: GraphRetrievalMethod
+MonosigaBrevicollis: GraphRetrievalMethod
+MooreaProducens: GraphRetrievalMethod
+MoorellaThermoacetica: GraphRetrievalMethod
+MoranellaEndobia: GraphRetrievalMethod
+MoraxellaBoevrei: GraphRetrievalMethod
+MoraxellaBovoculi: GraphRetrievalMethod
+MoraxellaCaprae: GraphRetrievalMethod
+MoraxellaCatarrhalis: GraphRetrievalMethod
+MoraxellaMacacae: GraphRetrievalMethod
+MorganellaMorganii: GraphRetrievalMethod
+MoritellaDasanensis: GraphRetrievalMethod
+MoritellaMarina: GraphRetrievalMethod
+MortierellaVerticillata: GraphRetrievalMethod
+MorusNotabilis: GraphRetrievalMethod
+MucilaginibacterPaludis: GraphRetrievalMethod
+MucispirillumSchaedleri: GraphRetrievalMethod
+MucorCircinelloides: GraphRetrievalMethod
+MuricaudaRuestringensis: GraphRetrievalMethod
+MuricaudaSpMar201075: GraphRetrievalMethod
+MusMusculus: GraphRetrievalMethod
+MusaAcuminata: GraphRetrievalMethod
+MuscaDomestica: GraphRetrievalMethod
+MustelaPutorius: GraphRetrievalMethod
+MyceliophthoraThermophila: GraphRetrievalMethod
+MycetocolaSaprophilus: GraphRetrievalMethod
+MycobacteriumAbscessus: GraphRetrievalMethod
+MycobacteriumAromaticivorans: GraphRetrievalMethod
+MycobacteriumAsiaticum: GraphRetrievalMethod
+MycobacteriumAviumAvium: GraphRetrievalMethod
+MycobacteriumAviumParatuberculosis: GraphRetrievalMethod
+MycobacteriumChubuense: GraphRetrievalMethod
+MycobacteriumColombiense: GraphRetrievalMethod
+MycobacteriumCosmeticum: GraphRetrievalMethod
+MycobacteriumGenavense: GraphRetrievalMethod
+MycobacteriumGilvum: GraphRetrievalMethod
+MycobacteriumHassiacum: GraphRetrievalMethod
+MycobacteriumIntracellulare: GraphRetrievalMethod
+MycobacteriumIranicum: GraphRetrievalMethod
+MycobacteriumKansasii732: GraphRetrievalMethod
+MycobacteriumKansasiiAtcc12478: GraphRetrievalMethod
+MycobacteriumLeprae: GraphRetrievalMethod
+MycobacteriumMageritense: GraphRetrievalMethod
+MycobacteriumMarinum: GraphRetrievalMethod
+MycobacteriumNeoaurum: GraphRetrievalMethod
+MycobacteriumParascrofulaceum: GraphRetrievalMethod
+MycobacteriumPhlei: GraphRetrievalMethod
+MycobacteriumRhodesiaeJs60: GraphRetrievalMethod
+MycobacteriumRhodesiaeNbb3: GraphRetrievalMethod
+MycobacteriumRufum: GraphRetrievalMethod
+MycobacteriumSepticum: GraphRetrievalMethod
+MycobacteriumSmegmatisJs623: GraphRetrievalMethod
+MycobacteriumSmegmatisMc2155: GraphRetrievalMethod
+MycobacteriumSp141: GraphRetrievalMethod
+MycobacteriumSp155: GraphRetrievalMethod
+MycobacteriumSp360mftsu51: GraphRetrievalMethod
+MycobacteriumSpJdm601: GraphRetrievalMethod
+MycobacteriumSpJls: GraphRetrievalMethod
+MycobacteriumSpUmwgj: GraphRetrievalMethod
+MycobacteriumSpUmwwy: GraphRetrievalMethod
+MycobacteriumSpUnc280mftsu51: GraphRetrievalMethod
+MycobacteriumSpUrhb0044: GraphRetrievalMethod
+MycobacteriumSpUrhd0025: GraphRetrievalMethod
+MycobacteriumThermoresistibile: GraphRetrievalMethod
+MycobacteriumTriplex: GraphRetrievalMethod
+MycobacteriumTuberculosisH37ra: GraphRetrievalMethod
+MycobacteriumTuberculosisH37rv: GraphRetrievalMethod
+MycobacteriumTusciae: GraphRetrievalMethod
+MycobacteriumUlcerans: GraphRetrievalMethod
+MycobacteriumVaccae: GraphRetrievalMethod
+MycobacteriumVanbaalenii: GraphRetrievalMethod
+MycobacteriumVulneris: GraphRetrievalMethod
+MycoplasmaAgalactiae: GraphRetrievalMethod
+MycoplasmaAlkalescens: GraphRetrievalMethod
+MycoplasmaAlligatoris: GraphRetrievalMethod
+MycoplasmaAnatis: GraphRetrievalMethod
+MycoplasmaArginini: GraphRetrievalMethod
+MycoplasmaArthritidis: GraphRetrievalMethod
+MycoplasmaAuris: GraphRetrievalMethod
+MycoplasmaBovigenitalium: GraphRetrievalMethod
+MycoplasmaBovis: GraphRetrievalMethod
+MycoplasmaBovoculi: GraphRetrievalMethod
+MycoplasmaCalifornicum: GraphRetrievalMethod
+MycoplasmaCanis: GraphRetrievalMethod
+MycoplasmaColumbinum: GraphRetrievalMethod
+MycoplasmaConjunctivae: GraphRetrievalMethod
+MycoplasmaCrocodyli: GraphRetrievalMethod
+MycoplasmaCynos: GraphRetrievalMethod
+MycoplasmaFermentans: GraphRetrievalMethod
+MycoplasmaGallisepticumF: GraphRetrievalMethod
+MycoplasmaGallisepticumS6: GraphRetrievalMethod
+MycoplasmaGenitalium: GraphRetrievalMethod
+MycoplasmaGirerdii: GraphRetrievalMethod
+MycoplasmaHaemofelis: GraphRetrievalMethod
+MycoplasmaHominis: GraphRetrievalMethod
+MycoplasmaHyopneumoniae232: GraphRetrievalMethod
+MycoplasmaHyopneumoniaeJ: GraphRetrievalMethod
+MycoplasmaHyorhinisGdl1: GraphRetrievalMethod
+MycoplasmaHyorhinisSk76: GraphRetrievalMethod
+MycoplasmaIowae: GraphRetrievalMethod
+MycoplasmaLeachii: GraphRetrievalMethod
+MycoplasmaMobile: GraphRetrievalMethod
+MycoplasmaMycoides: GraphRetrievalMethod
+MycoplasmaOvipneumoniae: GraphRetrievalMethod
+MycoplasmaPenetrans: GraphRetrievalMethod
+MycoplasmaPneumoniae: GraphRetrievalMethod
+MycoplasmaPulmonis: GraphRetrievalMethod
+MycoplasmaPutrefaciensKs1: GraphRetrievalMethod
+MycoplasmaPutrefaciensMput9231: GraphRetrievalMethod
+MycoplasmaSpG5847: GraphRetrievalMethod
+MycoplasmaSynoviae: GraphRetrievalMethod
+MycoplasmaYeatsii: GraphRetrievalMethod
+MycosphaerellaPini: GraphRetrievalMethod
+MyotisBrandtii: GraphRetrievalMethod
+MyotisDavidii: GraphRetrievalMethod
+MyotisLucifugus: GraphRetrievalMethod
+MyroidesInjenensis: GraphRetrievalMethod
+MyroidesOdoratimimus: GraphRetrievalMethod
+MyroidesOdoratus: GraphRetrievalMethod
+MyxococcusFulvus: GraphRetrievalMethod
+MyxococcusSp: GraphRetrievalMethod
+MyxococcusStipitatus: GraphRetrievalMethod
+MyxococcusXanthus: GraphRetrievalMethod
+MyxosarcinaSpGi1: GraphRetrievalMethod
+NaegleriaGruberi: GraphRetrievalMethod
+NafulsellaTurpanensis: GraphRetrievalMethod
+NakamurellaMultipartita: GraphRetrievalMethod
+NannospalaxGalili: GraphRetrievalMethod
+NasoniaVitripennis: GraphRetrievalMethod
+NatranaerobiusThermophilus: GraphRetrievalMethod
+NatrialbaAsiatica: GraphRetrievalMethod
+NatrialbaMagadii: GraphRetrievalMethod
+NatrinemaAltunense: GraphRetrievalMethod
+NatrinemaPallidum: GraphRetrievalMethod
+NatrinemaPellirubrum: GraphRetrievalMethod
+NatrinemaSpJ72: GraphRetrievalMethod
+NatronobacteriumGregoryi: GraphRetrievalMethod
+NatronococcusAmylolyticus: GraphRetrievalMethod
+NatronococcusOccultus: GraphRetrievalMethod
+NatronolimnobiusInnermongolicus: GraphRetrievalMethod
+NatronomonasMoolapensis: GraphRetrievalMethod
+NatronomonasPharaonis: GraphRetrievalMethod
+NatronorubrumBangense: GraphRetrievalMethod
+NatronorubrumSulfidifaciens: GraphRetrievalMethod
+NatronorubrumTibetense: GraphRetrievalMethod
+NaumovozymaCastellii: GraphRetrievalMethod
+NaumovozymaDairenensis: GraphRetrievalMethod
+NautiliaProfundicola: GraphRetrievalMethod
+NectriaHaematococca: GraphRetrievalMethod
+NeisseriaCinerea: GraphRetrievalMethod
+NeisseriaFlavescensNrl30031h210: GraphRetrievalMethod
+NeisseriaFlavescensSk114: GraphRetrievalMethod
+NeisseriaLactamica: GraphRetrievalMethod
+NeisseriaMucosaAtcc25996: GraphRetrievalMethod
+NeisseriaMucosaC102: GraphRetrievalMethod
+NeisseriaPolysaccharea: GraphRetrievalMethod
+NeisseriaSicca: GraphRetrievalMethod
+NeisseriaSpF0314: GraphRetrievalMethod
+NeisseriaSubflava: GraphRetrievalMethod
+NeisseriaWeaveri: GraphRetrievalMethod
+NelumboNucifera: GraphRetrievalMethod
+NematostellaVectensis: GraphRetrievalMethod
+NeofusicoccumParvum: GraphRetrievalMethod
+NeolamprologusBrichardi: GraphRetrievalMethod
+NeorhizobiumGalegaeOfficinalis: GraphRetrievalMethod
+NeorhizobiumGalegaeOrientalis: GraphRetrievalMethod
+NeorickettsiaRisticii: GraphRetrievalMethod
+NeorickettsiaSennetsu: GraphRetrievalMethod
+NeosartoryaFischeri: GraphRetrievalMethod
+NeosporaCaninum: GraphRetrievalMethod
+NeptuniibacterCaesariensis: GraphRetrievalMethod
+NeptunomonasJaponica: GraphRetrievalMethod
+NesterenkoniaAlba: GraphRetrievalMethod
+NesterenkoniaSpF: GraphRetrievalMethod
+NesterenkoniaSpNp1: GraphRetrievalMethod
+NeurosporaCrassa: GraphRetrievalMethod
+NeurosporaTetrasperma: GraphRetrievalMethod
+NevskiaRamosa: GraphRetrievalMethod
+NevskiaSoli: GraphRetrievalMethod
+NiabellaAurantiaca: GraphRetrievalMethod
+NiabellaSoli: GraphRetrievalMethod
+NiastellaKoreensis: GraphRetrievalMethod
+NicotianaSylvestris: GraphRetrievalMethod
+NicotianaTomentosiformis: GraphRetrievalMethod
+NipponiaNippon: GraphRetrievalMethod
+NitratifractorSalsuginis: GraphRetrievalMethod
+NitratireductorAquibiodomus: GraphRetrievalMethod
+NitratireductorBasaltis: GraphRetrievalMethod
+NitratireductorIndicus: GraphRetrievalMethod
+NitratireductorPacificus: GraphRetrievalMethod
+NitratiruptorSpSb1552: GraphRetrievalMethod
+NitrobacterHamburgensis: GraphRetrievalMethod
+NitrobacterWinogradskyi: GraphRetrievalMethod
+NitrococcusMobilis: GraphRetrievalMethod
+NitrosococcusHalophilus: GraphRetrievalMethod
+NitrosococcusOceani: GraphRetrievalMethod
+NitrosococcusWatsonii: GraphRetrievalMethod
+NitrosomonasCryotolerans: GraphRetrievalMethod
+NitrosomonasEuropaea: GraphRetrievalMethod
+NitrosomonasEutropha: GraphRetrievalMethod
+NitrosomonasSpAl212: GraphRetrievalMethod
+NitrosomonasSpIs79a3: GraphRetrievalMethod
+NitrosopumilusMaritimus: GraphRetrievalMethod
+NitrosopumilusSpAr2: GraphRetrievalMethod
+NitrososphaeraEvergladensis: GraphRetrievalMethod
+NitrosospiraBriensis: GraphRetrievalMethod
+NitrosospiraMultiformis: GraphRetrievalMethod
+NitrosospiraSpApg3: GraphRetrievalMethod
+NitrospinaSpAb629b18: GraphRetrievalMethod
+NitrospiraDefluvii: GraphRetrievalMethod
+NocardiaAobensis: GraphRetrievalMethod
+NocardiaAsteroides: GraphRetrievalMethod
+NocardiaBrasiliensis: GraphRetrievalMethod
+NocardiaBrevicatena: GraphRetrievalMethod
+NocardiaCarnea: GraphRetrievalMethod
+NocardiaConcava: GraphRetrievalMethod
+NocardiaCyriacigeorgica: GraphRetrievalMethod
+NocardiaExalbida: GraphRetrievalMethod
+NocardiaFarcinica: GraphRetrievalMethod
+NocardiaHigoensis: GraphRetrievalMethod
+NocardiaJiangxiensis: GraphRetrievalMethod
+NocardiaNiigatensis: GraphRetrievalMethod
+NocardiaNova: GraphRetrievalMethod
+NocardiaOtitidiscaviarum: GraphRetrievalMethod
+NocardiaPneumoniae: GraphRetrievalMethod
+NocardiaRhamnosiphila: GraphRetrievalMethod
+NocardiaSp348mftsu51: GraphRetrievalMethod
+NocardiaSpBmg111209: GraphRetrievalMethod
+NocardiaSpBmg51109: GraphRetrievalMethod
+NocardiaSpCny236: GraphRetrievalMethod
+NocardiaTakedensis: GraphRetrievalMethod
+NocardiaTestacea: GraphRetrievalMethod
+NocardiaTransvalensis: GraphRetrievalMethod
+NocardiaVeterana: GraphRetrievalMethod
+NocardioidaceaeBacteriumBroad1: GraphRetrievalMethod
+NocardioidesHalotolerans: GraphRetrievalMethod
+NocardioidesSpCf8: GraphRetrievalMethod
+NocardioidesSpIso805n: GraphRetrievalMethod
+NocardioidesSpJ54: GraphRetrievalMethod
+NocardioidesSpJs614: GraphRetrievalMethod
+NocardiopsisAlba: GraphRetrievalMethod
+NocardiopsisBaichengensis: GraphRetrievalMethod
+NocardiopsisDassonvillei: GraphRetrievalMethod
+NocardiopsisGanjiahuensis: GraphRetrievalMethod
+NocardiopsisKunsanensis: GraphRetrievalMethod
+NocardiopsisPotens: GraphRetrievalMethod
+NocardiopsisPrasina: GraphRetrievalMethod
+NocardiopsisSpCnt312: GraphRetrievalMethod
+NocardiopsisValliformis: GraphRetrievalMethod
+NocardiopsisXinjiangensis: GraphRetrievalMethod
+NodosilineaNodulosa: GraphRetrievalMethod
+NodulariaSpumigena: GraphRetrievalMethod
+NomascusLeucogenys: GraphRetrievalMethod
+NonlabensDokdonensis: GraphRetrievalMethod
+NonlabensSediminis: GraphRetrievalMethod
+NonlabensUlvanivorans: GraphRetrievalMethod
+NonomuraeaCoxensis: GraphRetrievalMethod
+NosocomiicoccusSpNp2: GraphRetrievalMethod
+NostocAzollae: GraphRetrievalMethod
+NostocPunctiforme: GraphRetrievalMethod
+NostocSpPcc7107: GraphRetrievalMethod
+NostocSpPcc7120: GraphRetrievalMethod
+NostocSpPcc7524: GraphRetrievalMethod
+NovispirillumItersonii: GraphRetrievalMethod
+NovosphingobiumAcidiphilum: GraphRetrievalMethod
+NovosphingobiumAromaticivorans: GraphRetrievalMethod
+NovosphingobiumLindaniclasticum: GraphRetrievalMethod
+NovosphingobiumNitrogenifigens: GraphRetrievalMethod
+NovosphingobiumPentaromativorans: GraphRetrievalMethod
+NovosphingobiumResinovorum: GraphRetrievalMethod
+NovosphingobiumSpAp12: GraphRetrievalMethod
+NovosphingobiumSpPp1y: GraphRetrievalMethod
+NovosphingobiumSpRr217: GraphRetrievalMethod
+NovosphingobiumTardaugens: GraphRetrievalMethod
+OceanibaculumIndicum: GraphRetrievalMethod
+OceanibulbusIndolifex: GraphRetrievalMethod
+OceanicaulisAlexandrii: GraphRetrievalMethod
+OceanicaulisSpHl87: GraphRetrievalMethod
+OceanicaulisSpHtcc2633: GraphRetrievalMethod
+OceanicolaBatsensis: GraphRetrievalMethod
+OceanicolaGranulosus: GraphRetrievalMethod
+OceanicolaNanhaiensis: GraphRetrievalMethod
+OceanicolaSp22iis11g: GraphRetrievalMethod
+OceanicolaSpHl35: GraphRetrievalMethod
+OceanicolaSpMctg156: GraphRetrievalMethod
+OceanimonasSmirnovii: GraphRetrievalMethod
+OceanimonasSpGk1: GraphRetrievalMethod
+OceaniovalibusGuishaninsula: GraphRetrievalMethod
+OceanithermusProfundus: GraphRetrievalMethod
+OceanobacillusIheyensis: GraphRetrievalMethod
+OceanobacillusKimchii: GraphRetrievalMethod
+OceanobacillusManasiensis: GraphRetrievalMethod
+OceanobacillusMassiliensis: GraphRetrievalMethod
+OceanobacillusPicturae: GraphRetrievalMethod
+OceanobacillusSpS5: GraphRetrievalMethod
+OchotonaPrinceps: GraphRetrievalMethod
+OchrobactrumAnthropi: GraphRetrievalMethod
+OchrobactrumRhizosphaerae: GraphRetrievalMethod
+OctadecabacterAntarcticus: GraphRetrievalMethod
+OctadecabacterArcticus: GraphRetrievalMethod
+OctodonDegus: GraphRetrievalMethod
+OdobenusRosmarus: GraphRetrievalMethod
+OdoribacterLaneus: GraphRetrievalMethod
+OdoribacterSplanchnicus: GraphRetrievalMethod
+OdyssellaThessalonicensis: GraphRetrievalMethod
+OenococcusKitaharae: GraphRetrievalMethod
+OenococcusOeni: GraphRetrievalMethod
+OerskoviaTurbata: GraphRetrievalMethod
+OgataeaParapolymorpha: GraphRetrievalMethod
+OligellaUreolytica: GraphRetrievalMethod
+OligellaUrethralis: GraphRetrievalMethod
+OligotrophaCarboxidovorans: GraphRetrievalMethod
+OlivibacterSitiensis: GraphRetrievalMethod
+OlleyaMarilimosa: GraphRetrievalMethod
+OlleyaSpVcsm12: GraphRetrievalMethod
+OlsenellaProfusa: GraphRetrievalMethod
+OlsenellaSpF0356: GraphRetrievalMethod
+OlsenellaUli: GraphRetrievalMethod
+OphiocordycepsSinensis: GraphRetrievalMethod
+OphiostomaPiceae: GraphRetrievalMethod
+OpitutaceaeBacteriumTav5: GraphRetrievalMethod
+OpitutusTerrae: GraphRetrievalMethod
+OrcinusOrca: GraphRetrievalMethod
+OreniaMarismortui: GraphRetrievalMethod
+OreochromisNiloticus: GraphRetrievalMethod
+OribacteriumParvum: GraphRetrievalMethod
+OribacteriumSinus: GraphRetrievalMethod
+OribacteriumSpF0262: GraphRetrievalMethod
+OribacteriumSpF0263: GraphRetrievalMethod
+OribacteriumSpF0425: GraphRetrievalMethod
+OribacteriumSpFc2011: GraphRetrievalMethod
+OribacteriumSpNk2b42: GraphRetrievalMethod
+OribacteriumSpP6a1: GraphRetrievalMethod
+OrientiaTsutsugamushi: GraphRetrievalMethod
+OrnithinibacillusScapharcae: GraphRetrievalMethod
+OrnithinimicrobiumPekingense: GraphRetrievalMethod
+OrnithobacteriumRhinotracheale: GraphRetrievalMethod
+OrnithorhynchusAnatinus: GraphRetrievalMethod
+OrycteropusAfer: GraphRetrievalMethod
+OryctolagusCuniculus: GraphRetrievalMethod
+OryzaBarthii: GraphRetrievalMethod
+OryzaBrachyantha: GraphRetrievalMethod
+OryzaGlaberrima: GraphRetrievalMethod
+OryzaGlumipatula: GraphRetrievalMethod
+OryzaMeridionalis: GraphRetrievalMethod
+OryzaNivara: GraphRetrievalMethod
+OryzaPunctata: GraphRetrievalMethod
+OryzaRufipogon: GraphRetrievalMethod
+OryzaSativa: GraphRetrievalMethod
+OryziasLatipes: GraphRetrievalMethod
+OscillatoriaAcuminata: GraphRetrievalMethod
+OscillatoriaNigroviridis: GraphRetrievalMethod
+OscillatoriaSpPcc10802: GraphRetrievalMethod
+OscillatorialesCyanobacterium: GraphRetrievalMethod
+OscillibacterRuminantium: GraphRetrievalMethod
+OscillibacterSp13: GraphRetrievalMethod
+OscillibacterSpEr4: GraphRetrievalMethod
+OscillibacterSpKle1728: GraphRetrievalMethod
+OscillibacterValericigenes: GraphRetrievalMethod
+OscillochlorisTrichoides: GraphRetrievalMethod
+OstreococcusLucimarinus: GraphRetrievalMethod
+OstreococcusTauri: GraphRetrievalMethod
+OtolemurGarnettii: GraphRetrievalMethod
+OvisAries: GraphRetrievalMethod
+OwenweeksiaHongkongensis: GraphRetrievalMethod
+OxalobacterFormigenesHoxbls: GraphRetrievalMethod
+OxalobacterFormigenesOxcc13: GraphRetrievalMethod
+PaenibacillaceaeBacteriumG5: GraphRetrievalMethod
+PaenibacillusAlginolyticus: GraphRetrievalMethod
+PaenibacillusAlvei: GraphRetrievalMethod
+PaenibacillusBorealis: GraphRetrievalMethod
+PaenibacillusCurdlanolyticus: GraphRetrievalMethod
+PaenibacillusDaejeonensis: GraphRetrievalMethod
+PaenibacillusDarwinianus: GraphRetrievalMethod
+PaenibacillusDurus: GraphRetrievalMethod
+PaenibacillusElgii: GraphRetrievalMethod
+PaenibacillusFonticola: GraphRetrievalMethod
+PaenibacillusGinsengihumi: GraphRetrievalMethod
+PaenibacillusGraminis: GraphRetrievalMethod
+PaenibacillusLactis: GraphRetrievalMethod
+PaenibacillusLarvae: GraphRetrievalMethod
+PaenibacillusMassiliensis: GraphRetrievalMethod
+PaenibacillusOdorifer: GraphRetrievalMethod
+PaenibacillusPeoriae: GraphRetrievalMethod
+PaenibacillusPini: GraphRetrievalMethod
+PaenibacillusPolymyxaE681: GraphRetrievalMethod
+PaenibacillusPolymyxaM1: GraphRetrievalMethod
+PaenibacillusPolymyxaSc2: GraphRetrievalMethod
+PaenibacillusSabinae: GraphRetrievalMethod
+PaenibacillusSanguinis: GraphRetrievalMethod
+PaenibacillusSenegalensis: GraphRetrievalMethod
+PaenibacillusSpA9: GraphRetrievalMethod
+PaenibacillusSpD14: GraphRetrievalMethod
+PaenibacillusSpFslh70357: GraphRetrievalMethod
+PaenibacillusSpFslh70737: GraphRetrievalMethod
+PaenibacillusSpFslh7689: GraphRetrievalMethod
+PaenibacillusSpFslp40081: GraphRetrievalMethod
+PaenibacillusSpFslr50345: GraphRetrievalMethod
+PaenibacillusSpFslr70273: GraphRetrievalMethod
+PaenibacillusSpFslr70331: GraphRetrievalMethod
+PaenibacillusSpFslr7277: GraphRetrievalMethod
+PaenibacillusSpGd11: GraphRetrievalMethod
+PaenibacillusSpHw567: GraphRetrievalMethod
+PaenibacillusSpJ14: GraphRetrievalMethod
+PaenibacillusSpJdr2: GraphRetrievalMethod
+PaenibacillusSpMaepy2: GraphRetrievalMethod
+PaenibacillusSpMst1: GraphRetrievalMethod
+PaenibacillusSpOsyse: GraphRetrievalMethod
+PaenibacillusSpTca20: GraphRetrievalMethod
+PaenibacillusSpUnc451mf: GraphRetrievalMethod
+PaenibacillusTerrae: GraphRetrievalMethod
+PaenibacillusTerrigena: GraphRetrievalMethod
+PaenibacillusWynnii: GraphRetrievalMethod
+PaenirhodobacterEnshiensis: GraphRetrievalMethod
+PaenisporosarcinaSpHgh0030: GraphRetrievalMethod
+PaenisporosarcinaSpTg14: GraphRetrievalMethod
+PalaeococcusPacificus: GraphRetrievalMethod
+PaludibacterPropionicigenes: GraphRetrievalMethod
+PanPaniscus: GraphRetrievalMethod
+PanTroglodytes: GraphRetrievalMethod
+PandoraeaPnomenusa: GraphRetrievalMethod
+PandoraeaSpSd62: GraphRetrievalMethod
+PanicumVirgatum: GraphRetrievalMethod
+PannonibacterPhragmitetus: GraphRetrievalMethod
+PantheraTigris: GraphRetrievalMethod
+PantholopsHodgsonii: GraphRetrievalMethod
+PantoeaAgglomerans: GraphRetrievalMethod
+PantoeaAnanatisAj13355: GraphRetrievalMethod
+PantoeaAnanatisLmg20103: GraphRetrievalMethod
+PantoeaRwandensis: GraphRetrievalMethod
+PantoeaSpA4: GraphRetrievalMethod
+PantoeaSpAb: GraphRetrievalMethod
+PantoeaSpAt9b: GraphRetrievalMethod
+PantoeaSpImh: GraphRetrievalMethod
+PantoeaSpPsnih1: GraphRetrievalMethod
+PantoeaSpPsnih2: GraphRetrievalMethod
+PantoeaSpSc1: GraphRetrievalMethod
+PantoeaStewartii: GraphRetrievalMethod
+PantoeaVagans: GraphRetrievalMethod
+PapioAnubis: GraphRetrievalMethod
+ParabacteroidesDistasonis: GraphRetrievalMethod
+ParabacteroidesGordonii: GraphRetrievalMethod
+ParabacteroidesJohnsonii: GraphRetrievalMethod
+ParabacteroidesMerdae: GraphRetrievalMethod
+ParabacteroidesSpAsf519: GraphRetrievalMethod
+ParacaedibacterAcanthamoebae: GraphRetrievalMethod
+ParacaedibacterSymbiosus: GraphRetrievalMethod
+ParachlamydiaAcanthamoebae: GraphRetrievalMethod
+ParacoccidioidesBrasiliensis: GraphRetrievalMethod
+ParacoccidioidesSpLutzii: GraphRetrievalMethod
+ParacoccusAminophilus: GraphRetrievalMethod
+ParacoccusDenitrificans: GraphRetrievalMethod
+ParacoccusHalophilus: GraphRetrievalMethod
+ParacoccusPantotrophus: GraphRetrievalMethod
+ParacoccusSp4681: GraphRetrievalMethod
+ParacoccusSpJ39: GraphRetrievalMethod
+ParacoccusSpN5: GraphRetrievalMethod
+ParacoccusSpPamc22219: GraphRetrievalMethod
+ParacoccusSpTrp: GraphRetrievalMethod
+ParacoccusVersutus: GraphRetrievalMethod
+ParacoccusYeei: GraphRetrievalMethod
+ParacoccusZeaxanthinifaciens: GraphRetrievalMethod
+ParameciumTetraurelia: GraphRetrievalMethod
+ParaoerskoviaMarina: GraphRetrievalMethod
+ParaprevotellaClara: GraphRetrievalMethod
+ParaprevotellaXylaniphila: GraphRetrievalMethod
+ParascardoviaDenticolensDsm10105: GraphRetrievalMethod
+ParascardoviaDenticolensIpla20019: GraphRetrievalMethod
+ParastagonosporaNodorum: GraphRetrievalMethod
+ParasutterellaExcrementihominis: GraphRetrievalMethod
+ParvibaculumLavamentivorans: GraphRetrievalMethod
+ParvimonasMicra: GraphRetrievalMethod
+ParvimonasSpF0440: GraphRetrievalMethod
+ParvularculaBermudensis: GraphRetrievalMethod
+ParvularculaOceani: GraphRetrievalMethod
+PasteurellaBettyae: GraphRetrievalMethod
+PasteurellaMultocida: GraphRetrievalMethod
+PasteurellaPneumotropica: GraphRetrievalMethod
+PatulibacterAmericanus: GraphRetrievalMethod
+PatulibacterMinatonensis: GraphRetrievalMethod
+PaucisalibacillusSpEb02: GraphRetrievalMethod
+PectobacteriumAtrosepticum: GraphRetrievalMethod
+PectobacteriumBetavasculorum: GraphRetrievalMethod
+PectobacteriumCarotovorumOdoriferum: GraphRetrievalMethod
+PectobacteriumCarotovorumPc1: GraphRetrievalMethod
+PectobacteriumSpScc3193: GraphRetrievalMethod
+PectobacteriumWasabiae: GraphRetrievalMethod
+PediculusHumanus: GraphRetrievalMethod
+PediococcusAcidilacticiDsm20284: GraphRetrievalMethod
+PediococcusClaussenii: GraphRetrievalMethod
+PediococcusPentosaceus: GraphRetrievalMethod
+PedobacterBorealis: GraphRetrievalMethod
+PedobacterHeparinus: GraphRetrievalMethod
+PedobacterOryzae: GraphRetrievalMethod
+PedobacterSaltans: GraphRetrievalMethod
+PedobacterSpBal39: GraphRetrievalMethod
+PedobacterSpR2019: GraphRetrievalMethod
+PedobacterSpV48: GraphRetrievalMethod
+PelagibacaBermudensis: GraphRetrievalMethod
+PelagibacterSpHtcc7211: GraphRetrievalMethod
+PelagibacterSpImcc9063: GraphRetrievalMethod
+PelagibacterUbiqueHimb058: GraphRetrievalMethod
+PelagibacterUbiqueHimb083: GraphRetrievalMethod
+PelagibacterUbiqueHtcc1062: GraphRetrievalMethod
+PelagibacterUbiqueHtcc7214: GraphRetrievalMethod
+PelagibacterUbiqueHtcc7217: GraphRetrievalMethod
+PelagibacterUbiqueHtcc8051: GraphRetrievalMethod
+PelagibacterUbiqueHtcc9022: GraphRetrievalMethod
+PelagibacteriumHalotolerans: GraphRetrievalMethod
+PelobacterCarbinolicus: GraphRetrievalMethod
+PelobacterPropionicus: GraphRetrievalMethod
+PelodictyonPhaeoclathratiforme: GraphRetrievalMethod
+PelodiscusSinensis: GraphRetrievalMethod
+PelosinusFermentans: GraphRetrievalMethod
+PelosinusSpUfo1: GraphRetrievalMethod
+PelotomaculumThermopropionicum: GraphRetrievalMethod
+PenicilliumDigitatum: GraphRetrievalMethod
+PenicilliumOxalicum: GraphRetrievalMethod
+PenicilliumRubens: GraphRetrievalMethod
+PeptoclostridiumDifficile630: GraphRetrievalMethod
+PeptoclostridiumDifficileCd160: GraphRetrievalMethod
+PeptoniphilusDuerdenii: GraphRetrievalMethod
+PeptoniphilusGrossensis: GraphRetrievalMethod
+PeptoniphilusHarei: GraphRetrievalMethod
+PeptoniphilusIndolicus: GraphRetrievalMethod
+PeptoniphilusLacrimalis: GraphRetrievalMethod
+PeptoniphilusRhinitidis: GraphRetrievalMethod
+PeptoniphilusSenegalensis: GraphRetrievalMethod
+PeptoniphilusSpBv3c26: GraphRetrievalMethod
+PeptoniphilusSpChdc: GraphRetrievalMethod
+PeptoniphilusSpF0131: GraphRetrievalMethod
+PeptoniphilusSpF0436: GraphRetrievalMethod
+PeptoniphilusTimonensis: GraphRetrievalMethod
+PeptostreptococcaceaeBacteriumCm5: GraphRetrievalMethod
+PeptostreptococcaceaeBacteriumVa2: GraphRetrievalMethod
+PeptostreptococcaceaeBacteriumW5053: GraphRetrievalMethod
+PeptostreptococcusAnaerobius653l: GraphRetrievalMethod
+PeptostreptococcusAnaerobiusVpi4330: GraphRetrievalMethod
+PeptostreptococcusSpMv1: GraphRetrievalMethod
+PeptostreptococcusStomatis: GraphRetrievalMethod
+PerlucidibacaPiscinae: GraphRetrievalMethod
+PeromyscusManiculatus: GraphRetrievalMethod
+PersephonellaMarina: GraphRetrievalMethod
+PersephonellaSpIf05l8: GraphRetrievalMethod
+PersephonellaSpKm09lau8: GraphRetrievalMethod
+PestalotiopsisFici: GraphRetrievalMethod
+PetrotogaMobilis: GraphRetrievalMethod
+PhaeobacterGallaeciensis: GraphRetrievalMethod
+PhaeobacterInhibens: GraphRetrievalMethod
+PhaeodactylumTricornutum: GraphRetrievalMethod
+PhaeospirillumFulvum: GraphRetrievalMethod
+PhaeospirillumMolischianum: GraphRetrievalMethod
+PhascolarctobacteriumSpCag207: GraphRetrievalMethod
+PhascolarctobacteriumSpCag266: GraphRetrievalMethod
+PhascolarctobacteriumSuccinatutens: GraphRetrievalMethod
+PhaseolusVulgaris: GraphRetrievalMethod
+PhenylobacteriumZucineum: GraphRetrievalMethod
+PhoenixDactylifera: GraphRetrievalMethod
+PhotobacteriumAngustum: GraphRetrievalMethod
+PhotobacteriumAphoticum: GraphRetrievalMethod
+PhotobacteriumDamselae: GraphRetrievalMethod
+PhotobacteriumLeiognathiLrivu41: GraphRetrievalMethod
+PhotobacteriumLeiognathiMandapamensis: GraphRetrievalMethod
+PhotobacteriumPhosphoreum: GraphRetrievalMethod
+PhotobacteriumProfundum: GraphRetrievalMethod
+PhotodesmusBlepharus: GraphRetrievalMethod
+PhotodesmusKatoptron: GraphRetrievalMethod
+PhotorhabdusAsymbiotica: GraphRetrievalMethod
+PhotorhabdusLuminescens: GraphRetrievalMethod
+PhycicoccusJejuensis: GraphRetrievalMethod
+PhycisphaeraMikurensis: GraphRetrievalMethod
+PhyllobacteriumSpUnc302mfcol52: GraphRetrievalMethod
+PhyllobacteriumSpYr531: GraphRetrievalMethod
+PhyscomitrellaPatens: GraphRetrievalMethod
+PhytophthoraInfestans: GraphRetrievalMethod
+PhytophthoraKernoviae: GraphRetrievalMethod
+PhytophthoraParasitica: GraphRetrievalMethod
+PhytophthoraRamorum: GraphRetrievalMethod
+PhytophthoraSojae: GraphRetrievalMethod
+PhytoplasmaAsterYellows: GraphRetrievalMethod
+PhytoplasmaAustraliense: GraphRetrievalMethod
+PhytoplasmaMali: GraphRetrievalMethod
+PhytoplasmaOnionYellows: GraphRetrievalMethod
+PhytoplasmaPeanutWitchesbroom: GraphRetrievalMethod
+PhytoplasmaWheatBlue: GraphRetrievalMethod
+PichiaKudriavzevii: GraphRetrievalMethod
+PicrophilusTorridus: GraphRetrievalMethod
+PimelobacterSimplex: GraphRetrievalMethod
+PirellulaStaleyi: GraphRetrievalMethod
+PiriformosporaIndica: GraphRetrievalMethod
+PlanctomycesBrasiliensis: GraphRetrievalMethod
+PlanctomycesLimnophilus: GraphRetrievalMethod
+PlanctomycesMaris: GraphRetrievalMethod
+PlanctomyceteKsu1: GraphRetrievalMethod
+PlanktomarinaTemperata: GraphRetrievalMethod
+PlanktothrixAgardhii: GraphRetrievalMethod
+PlanococcusAntarcticus: GraphRetrievalMethod
+PlanococcusDonghaensis: GraphRetrievalMethod
+PlanococcusSpPamc21323: GraphRetrievalMethod
+PlanomicrobiumGlaciei: GraphRetrievalMethod
+PlasmodiumBerghei: GraphRetrievalMethod
+PlasmodiumChabaudi: GraphRetrievalMethod
+PlasmodiumCynomolgi: GraphRetrievalMethod
+PlasmodiumFalciparum: GraphRetrievalMethod
+PlasmodiumKnowlesi: GraphRetrievalMethod
+PlasmodiumVinckei: GraphRetrievalMethod
+PlasmodiumVivax: GraphRetrievalMethod
+PlautiaStali: GraphRetrievalMethod
+PleomorphomonasKoreensis: GraphRetrievalMethod
+PleomorphomonasOryzae: GraphRetrievalMethod
+PlesiocystisPacifica: GraphRetrievalMethod
+PleurocapsaSpPcc7319: GraphRetrievalMethod
+PleurocapsaSpPcc7327: GraphRetrievalMethod
+PluralibacterGergoviae: GraphRetrievalMethod
+PneumocystisJirovecii: GraphRetrievalMethod
+PneumocystisMurina: GraphRetrievalMethod
+PodosporaAnserina: GraphRetrievalMethod
+PoeciliaFormosa: GraphRetrievalMethod
+PoeciliaReticulata: GraphRetrievalMethod
+PolaribacterIrgensii: GraphRetrievalMethod
+PolaribacterSpHel13349: GraphRetrievalMethod
+PolaribacterSpHel185: GraphRetrievalMethod
+PolaribacterSpHeli88: GraphRetrievalMethod
+PolaribacterSpMed152: GraphRetrievalMethod
+PolaromonasNaphthalenivorans: GraphRetrievalMethod
+PolaromonasSpCg912: GraphRetrievalMethod
+PolaromonasSpJs666: GraphRetrievalMethod
+PolycyclovoransAlgicola: GraphRetrievalMethod
+PolymorphumGilvum: GraphRetrievalMethod
+PolynucleobacterNecessariusAsymbioticus: GraphRetrievalMethod
+PolynucleobacterNecessariusStir1: GraphRetrievalMethod
+PongoAbelii: GraphRetrievalMethod
+PontibacillusChungwhensis: GraphRetrievalMethod
+PontibacillusHalophilus: GraphRetrievalMethod
+PontibacillusLitoralis: GraphRetrievalMethod
+PontibacillusMarinus: GraphRetrievalMethod
+PontibacillusYanchengensis: GraphRetrievalMethod
+PonticaulisKoreensis: GraphRetrievalMethod
+PopulusTrichocarpa: GraphRetrievalMethod
+PorphyrobacterCryptus: GraphRetrievalMethod
+PorphyrobacterSpAap82: GraphRetrievalMethod
+PorphyrobacterSpHl46: GraphRetrievalMethod
+PorphyromonadaceaeCot184oh4590: GraphRetrievalMethod
+PorphyromonasAsaccharolytica: GraphRetrievalMethod
+PorphyromonasBennonis: GraphRetrievalMethod
+PorphyromonasCangingivalis: GraphRetrievalMethod
+PorphyromonasCanoris: GraphRetrievalMethod
+PorphyromonasCatoniae: GraphRetrievalMethod
+PorphyromonasCrevioricanis: GraphRetrievalMethod
+PorphyromonasEndodontalis: GraphRetrievalMethod
+PorphyromonasGingivalisAtcc33277: GraphRetrievalMethod
+PorphyromonasGingivalisW83: GraphRetrievalMethod
+PorphyromonasGingivicanis: GraphRetrievalMethod
+PorphyromonasGulae: GraphRetrievalMethod
+PorphyromonasLevii: GraphRetrievalMethod
+PorphyromonasMacacae: GraphRetrievalMethod
+PorphyromonasSomerae: GraphRetrievalMethod
+PorphyromonasSpCot239oh1446: GraphRetrievalMethod
+PorphyromonasSpCot290oh860: GraphRetrievalMethod
+PorphyromonasSpKle1280: GraphRetrievalMethod
+PorphyromonasSpW7784: GraphRetrievalMethod
+PorphyromonasUenonis603: GraphRetrievalMethod
+PorticoccusHydrocarbonoclasticus: GraphRetrievalMethod
+PrauserellaRugosa: GraphRetrievalMethod
+PrevotellaAlbensis: GraphRetrievalMethod
+PrevotellaAmnii: GraphRetrievalMethod
+PrevotellaAurantiaca: GraphRetrievalMethod
+PrevotellaBergensis: GraphRetrievalMethod
+PrevotellaBiviaDnf00188: GraphRetrievalMethod
+PrevotellaBiviaJcvihmp010: GraphRetrievalMethod
+PrevotellaBrevis: GraphRetrievalMethod
+PrevotellaBuccaeAtcc33574: GraphRetrievalMethod
+PrevotellaBuccalisAtcc35310: GraphRetrievalMethod
+PrevotellaBuccalisDnf00985: GraphRetrievalMethod
+PrevotellaCopri: GraphRetrievalMethod
+PrevotellaCorporis: GraphRetrievalMethod
+PrevotellaDentalis: GraphRetrievalMethod
+PrevotellaDenticola: GraphRetrievalMethod
+PrevotellaDisiensFb03509an: GraphRetrievalMethod
+PrevotellaDisiensJcm6334: GraphRetrievalMethod
+PrevotellaEnoeca: GraphRetrievalMethod
+PrevotellaFalsenii: GraphRetrievalMethod
+PrevotellaFusca: GraphRetrievalMethod
+PrevotellaHisticola: GraphRetrievalMethod
+PrevotellaLoescheii: GraphRetrievalMethod
+PrevotellaMaculosa: GraphRetrievalMethod
+PrevotellaMarshii: GraphRetrievalMethod
+PrevotellaMelaninogenica: GraphRetrievalMethod
+PrevotellaMicans: GraphRetrievalMethod
+PrevotellaMultiformis: GraphRetrievalMethod
+PrevotellaMultisaccharivorax: GraphRetrievalMethod
+PrevotellaNigrescens: GraphRetrievalMethod
+PrevotellaOralisAtcc33269: GraphRetrievalMethod
+PrevotellaOralisHga0225: GraphRetrievalMethod
+PrevotellaOrisC735: GraphRetrievalMethod
+PrevotellaOrisDsm18711: GraphRetrievalMethod
+PrevotellaOulorumF0390: GraphRetrievalMethod
+PrevotellaOulorumJcm14966: GraphRetrievalMethod
+PrevotellaPallens: GraphRetrievalMethod
+PrevotellaPaludivivens: GraphRetrievalMethod
+PrevotellaPleuritidis: GraphRetrievalMethod
+PrevotellaRuminicola: GraphRetrievalMethod
+PrevotellaSalivae: GraphRetrievalMethod
+PrevotellaScopos: GraphRetrievalMethod
+PrevotellaShahii: GraphRetrievalMethod
+PrevotellaSp10: GraphRetrievalMethod
+PrevotellaSpAgr2160: GraphRetrievalMethod
+PrevotellaSpC561: GraphRetrievalMethod
+PrevotellaSpF0040: GraphRetrievalMethod
+PrevotellaSpF0091: GraphRetrievalMethod
+PrevotellaSpF0108: GraphRetrievalMethod
+PrevotellaSpF0295: GraphRetrievalMethod
+PrevotellaSpF0472: GraphRetrievalMethod
+PrevotellaSpHun102: GraphRetrievalMethod
+PrevotellaSpMa2016: GraphRetrievalMethod
+PrevotellaSpP6b1: GraphRetrievalMethod
+PrevotellaSpS718: GraphRetrievalMethod
+PrevotellaSpS7Ms2: GraphRetrievalMethod
+PrevotellaStercorea: GraphRetrievalMethod
+PrevotellaTannerae: GraphRetrievalMethod
+PrevotellaTimonensis4401737: GraphRetrievalMethod
+PrevotellaTimonensisCris5cb1: GraphRetrievalMethod
+PrevotellaVeroralisDsm19559: GraphRetrievalMethod
+PrevotellaVeroralisF0319: GraphRetrievalMethod
+ProchlorococcusMarinusAs9601: GraphRetrievalMethod
+ProchlorococcusMarinusCcmp1375: GraphRetrievalMethod
+ProchlorococcusMarinusGp2: GraphRetrievalMethod
+ProchlorococcusMarinusMit9107: GraphRetrievalMethod
+ProchlorococcusMarinusMit9201: GraphRetrievalMethod
+ProchlorococcusMarinusMit9211: GraphRetrievalMethod
+ProchlorococcusMarinusMit9215: GraphRetrievalMethod
+ProchlorococcusMarinusMit9301: GraphRetrievalMethod
+ProchlorococcusMarinusMit9302: GraphRetrievalMethod
+ProchlorococcusMarinusMit9312: GraphRetrievalMethod
+ProchlorococcusMarinusMit9313: GraphRetrievalMethod
+ProchlorococcusMarinusMit9314: GraphRetrievalMethod
+ProchlorococcusMarinusMit9322: GraphRetrievalMethod
+ProchlorococcusMarinusMit9515: GraphRetrievalMethod
+ProchlorococcusMarinusNatl1a: GraphRetrievalMethod
+ProchlorococcusMarinusPastoris: GraphRetrievalMethod
+ProchlorococcusMarinusSb: GraphRetrievalMethod
+ProchlorococcusSpMit0601: GraphRetrievalMethod
+ProchlorococcusSpMit0602: GraphRetrievalMethod
+ProchlorococcusSpMit0604: GraphRetrievalMethod
+ProchlorococcusSpMit0701: GraphRetrievalMethod
+ProchlorococcusSpMit0801: GraphRetrievalMethod
+ProchlorococcusSpScb241528o2: GraphRetrievalMethod
+ProchlorococcusSpScb245a520k10: GraphRetrievalMethod
+ProchlorothrixHollandica: GraphRetrievalMethod
+ProfftellaArmatura: GraphRetrievalMethod
+ProlixibacterBellariivorans: GraphRetrievalMethod
+PromicromonosporaKroppenstedtii: GraphRetrievalMethod
+PropionibacteriaceaeBacteriumP6a17: GraphRetrievalMethod
+PropionibacteriumAcidifaciens: GraphRetrievalMethod
+PropionibacteriumAcidipropionici: GraphRetrievalMethod
+PropionibacteriumAcnesHl037pa2: GraphRetrievalMethod
+PropionibacteriumAcnesKpa171202: GraphRetrievalMethod
+PropionibacteriumAcnesSk182bjcvi: GraphRetrievalMethod
+PropionibacteriumAvidum: GraphRetrievalMethod
+PropionibacteriumFreudenreichii: GraphRetrievalMethod
+PropionibacteriumGranulosum: GraphRetrievalMethod
+PropionibacteriumJensenii: GraphRetrievalMethod
+PropionibacteriumPropionicum: GraphRetrievalMethod
+PropionibacteriumSpF0372: GraphRetrievalMethod
+PropionibacteriumThoenii: GraphRetrievalMethod
+PropionimicrobiumSpBv2f7: GraphRetrievalMethod
+ProsthecochlorisAestuarii: GraphRetrievalMethod
+ProteiniclasticumRuminis: GraphRetrievalMethod
+ProteiniphilumAcetatigenes: GraphRetrievalMethod
+ProteocatellaSphenisci: GraphRetrievalMethod
+ProteusMirabilis: GraphRetrievalMethod
+ProteusPenneri: GraphRetrievalMethod
+ProteusVulgaris: GraphRetrievalMethod
+ProtochlamydiaAmoebophila: GraphRetrievalMethod
+ProvidenciaAlcalifaciens: GraphRetrievalMethod
+ProvidenciaBurhodogranariea: GraphRetrievalMethod
+ProvidenciaRettgeriDmel1: GraphRetrievalMethod
+ProvidenciaRettgeriDsm1131: GraphRetrievalMethod
+ProvidenciaRustigianii: GraphRetrievalMethod
+ProvidenciaStuartii: GraphRetrievalMethod
+PrunusMume: GraphRetrievalMethod
+PrunusPersica: GraphRetrievalMethod
+PseudaminobacterSalicylatoxidans: GraphRetrievalMethod
+PseudanabaenaSpPcc6802: GraphRetrievalMethod
+PseudanabaenaSpPcc7367: GraphRetrievalMethod
+PseudoalteromonasAgarivorans: GraphRetrievalMethod
+PseudoalteromonasAtlantica: GraphRetrievalMethod
+PseudoalteromonasCitrea: GraphRetrievalMethod
+PseudoalteromonasHaloplanktisAnt505: GraphRetrievalMethod
+PseudoalteromonasHaloplanktisAtcc14393: GraphRetrievalMethod
+PseudoalteromonasHaloplanktisTac125: GraphRetrievalMethod
+PseudoalteromonasHaloplanktisTb64: GraphRetrievalMethod
+PseudoalteromonasLuteoviolacea: GraphRetrievalMethod
+PseudoalteromonasRubra: GraphRetrievalMethod
+PseudoalteromonasRuthenica: GraphRetrievalMethod
+PseudoalteromonasSpBsw20308: GraphRetrievalMethod
+PseudoalteromonasSpOcn003: GraphRetrievalMethod
+PseudoalteromonasSpSm9913: GraphRetrievalMethod
+PseudoalteromonasSpongiae: GraphRetrievalMethod
+PseudoalteromonasTunicata: GraphRetrievalMethod
+PseudobacteroidesCellulosolvens: GraphRetrievalMethod
+PseudobutyrivibrioRuminisAd2017: GraphRetrievalMethod
+PseudobutyrivibrioRuminisCf1b: GraphRetrievalMethod
+PseudobutyrivibrioSpLb2011: GraphRetrievalMethod
+PseudobutyrivibrioSpMd2005: GraphRetrievalMethod
+PseudocercosporaFijiensis: GraphRetrievalMethod
+PseudoclavibacterSoli: GraphRetrievalMethod
+PseudoflavonifractorCapillosus: GraphRetrievalMethod
+PseudogulbenkianiaFerrooxidans: GraphRetrievalMethod
+PseudogulbenkianiaSpNh8b: GraphRetrievalMethod
+PseudogymnoascusDestructans: GraphRetrievalMethod
+PseudomonasAeruginosa: GraphRetrievalMethod
+PseudomonasAlcaligenesNbrc14159: GraphRetrievalMethod
+PseudomonasAlkylphenolia: GraphRetrievalMethod
+PseudomonasBrassicacearum: GraphRetrievalMethod
+PseudomonasCaeni: GraphRetrievalMethod
+PseudomonasChlororaphis: GraphRetrievalMethod
+PseudomonasCichorii: GraphRetrievalMethod
+PseudomonasCorrugata: GraphRetrievalMethod
+PseudomonasCremoricolorata: GraphRetrievalMethod
+PseudomonasDenitrificans: GraphRetrievalMethod
+PseudomonasEntomophila: GraphRetrievalMethod
+PseudomonasExtremaustralis: GraphRetrievalMethod
+PseudomonasFlectens: GraphRetrievalMethod
+PseudomonasFluorescensF113: GraphRetrievalMethod
+PseudomonasFluorescensHk44: GraphRetrievalMethod
+PseudomonasFluorescensNcimb11764: GraphRetrievalMethod
+PseudomonasFluorescensNz007: GraphRetrievalMethod
+PseudomonasFluorescensPf01: GraphRetrievalMethod
+PseudomonasFluorescensQ287: GraphRetrievalMethod
+PseudomonasFluorescensSbw25: GraphRetrievalMethod
+PseudomonasFragi: GraphRetrievalMethod
+PseudomonasFulva: GraphRetrievalMethod
+PseudomonasKnackmussii: GraphRetrievalMethod
+PseudomonasLutea: GraphRetrievalMethod
+PseudomonasLuteola: GraphRetrievalMethod
+PseudomonasMandelii36mfcvi11: GraphRetrievalMethod
+PseudomonasMandeliiPd30: GraphRetrievalMethod
+PseudomonasMendocinaEgdaq5: GraphRetrievalMethod
+PseudomonasMendocinaNk01: GraphRetrievalMethod
+PseudomonasMendocinaYmp: GraphRetrievalMethod
+PseudomonasMoraviensis: GraphRetrievalMethod
+PseudomonasMosselii: GraphRetrievalMethod
+PseudomonasNitroreducensHbp1: GraphRetrievalMethod
+PseudomonasNitroreducensTx1: GraphRetrievalMethod
+PseudomonasOleovorans: GraphRetrievalMethod
+PseudomonasParafulva: GraphRetrievalMethod
+PseudomonasPelagia: GraphRetrievalMethod
+PseudomonasPoae: GraphRetrievalMethod
+PseudomonasProtegensCha0: GraphRetrievalMethod
+PseudomonasProtegensPf5: GraphRetrievalMethod
+PseudomonasPseudoalcaligenesAd6: GraphRetrievalMethod
+PseudomonasPseudoalcaligenesCect5344: GraphRetrievalMethod
+PseudomonasPseudoalcaligenesKf707: GraphRetrievalMethod
+PseudomonasPsychrophila: GraphRetrievalMethod
+PseudomonasPsychrotolerans: GraphRetrievalMethod
+PseudomonasPutidaCsv86: GraphRetrievalMethod
+PseudomonasPutidaF1: GraphRetrievalMethod
+PseudomonasPutidaGb1: GraphRetrievalMethod
+PseudomonasPutidaKt2440: GraphRetrievalMethod
+PseudomonasPutidaMtcc5279: GraphRetrievalMethod
+PseudomonasPutidaNbrc14164: GraphRetrievalMethod
+PseudomonasPutidaS16: GraphRetrievalMethod
+PseudomonasPutidaW619: GraphRetrievalMethod
+PseudomonasResinovoransDsm21078: GraphRetrievalMethod
+PseudomonasResinovoransNbrc106553: GraphRetrievalMethod
+PseudomonasRhizosphaerae: GraphRetrievalMethod
+PseudomonasSimiae: GraphRetrievalMethod
+PseudomonasSp20bn: GraphRetrievalMethod
+PseudomonasSpAnt303: GraphRetrievalMethod
+PseudomonasSpBay1663: GraphRetrievalMethod
+PseudomonasSpCf149: GraphRetrievalMethod
+PseudomonasSpChol1: GraphRetrievalMethod
+PseudomonasSpG5: GraphRetrievalMethod
+PseudomonasSpGm21: GraphRetrievalMethod
+PseudomonasSpH2: GraphRetrievalMethod
+PseudomonasSpHys: GraphRetrievalMethod
+PseudomonasSpLz4w: GraphRetrievalMethod
+PseudomonasSpM1: GraphRetrievalMethod
+PseudomonasSpM47t1: GraphRetrievalMethod
+PseudomonasSpMl96: GraphRetrievalMethod
+PseudomonasSpRit357: GraphRetrievalMethod
+PseudomonasSpRl: GraphRetrievalMethod
+PseudomonasSpS9: GraphRetrievalMethod
+PseudomonasSpTkp: GraphRetrievalMethod
+PseudomonasSpUrmo17wk12i8: GraphRetrievalMethod
+PseudomonasSpUw4: GraphRetrievalMethod
+PseudomonasSpVlb120: GraphRetrievalMethod
+PseudomonasStutzeriA1501: GraphRetrievalMethod
+PseudomonasStutzeriAtcc14405: GraphRetrievalMethod
+PseudomonasStutzeriCcug29243: GraphRetrievalMethod
+PseudomonasStutzeriDsm10701: GraphRetrievalMethod
+PseudomonasStutzeriKos6: GraphRetrievalMethod
+PseudomonasStutzeriMf28: GraphRetrievalMethod
+PseudomonasStutzeriNf13: GraphRetrievalMethod
+PseudomonasStutzeriRch2: GraphRetrievalMethod
+PseudomonasStutzeriSdmlac: GraphRetrievalMethod
+PseudomonasStutzeriTs44: GraphRetrievalMethod
+PseudomonasSyringaeB728a: GraphRetrievalMethod
+PseudomonasSyringaeCc1417: GraphRetrievalMethod
+PseudomonasSyringaeCc1513: GraphRetrievalMethod
+PseudomonasSyringaeCc1557: GraphRetrievalMethod
+PseudomonasSyringaeMaculicola: GraphRetrievalMethod
+PseudomonasSyringaePhaseolicola: GraphRetrievalMethod
+PseudomonasSyringaeTomato: GraphRetrievalMethod
+PseudomonasTaeanensis: GraphRetrievalMethod
+PseudonocardiaAcaciae: GraphRetrievalMethod
+PseudonocardiaAsaccharolytica: GraphRetrievalMethod
+PseudonocardiaAutotrophica: GraphRetrievalMethod
+PseudonocardiaDioxanivorans: GraphRetrievalMethod
+PseudophaeobacterArcticus: GraphRetrievalMethod
+PseudopodocesHumilis: GraphRetrievalMethod
+PseudoramibacterAlactolyticus: GraphRetrievalMethod
+PseudovibrioSpFobeg1: GraphRetrievalMethod
+PseudoxanthomonasSpGw2: GraphRetrievalMethod
+PseudoxanthomonasSpadix: GraphRetrievalMethod
+PseudoxanthomonasSuwonensis111: GraphRetrievalMethod
+PseudoxanthomonasSuwonensisJ43: GraphRetrievalMethod
+PseudozymaBrasiliensis: GraphRetrievalMethod
+PseudozymaFlocculosa: GraphRetrievalMethod
+PseudozymaHubeiensis: GraphRetrievalMethod
+PsychrobacterAquaticus: GraphRetrievalMethod
+PsychrobacterArcticus: GraphRetrievalMethod
+PsychrobacterCryohalolentis: GraphRetrievalMethod
+PsychrobacterLutiphocae: GraphRetrievalMethod
+PsychrobacterPhenylpyruvicus: GraphRetrievalMethod
+PsychrobacterSp1501: GraphRetrievalMethod
+PsychrobacterSpJcm18900: GraphRetrievalMethod
+PsychrobacterSpPamc21119: GraphRetrievalMethod
+PsychrobacterSpPrwf1: GraphRetrievalMethod
+PsychrobacterSpTb15: GraphRetrievalMethod
+PsychrobacterSpTb67: GraphRetrievalMethod
+PsychroflexusGondwanensis: GraphRetrievalMethod
+PsychroflexusTorquis: GraphRetrievalMethod
+PsychroflexusTropicus: GraphRetrievalMethod
+PsychromonasIngrahamii: GraphRetrievalMethod
+PsychromonasOssibalaenae: GraphRetrievalMethod
+PsychromonasSpCnpt3: GraphRetrievalMethod
+PsychroserpensBurtonensis: GraphRetrievalMethod
+PsychroserpensSpPamc27130: GraphRetrievalMethod
+PteropusAlecto: GraphRetrievalMethod
+PteropusVampyrus: GraphRetrievalMethod
+PucciniaGraminis: GraphRetrievalMethod
+PunctulariaStrigosozonata: GraphRetrievalMethod
+PundamiliaNyererei: GraphRetrievalMethod
+PuniceispirillumMarinum: GraphRetrievalMethod
+PusillimonasNoertemannii: GraphRetrievalMethod
+PusillimonasSpT77: GraphRetrievalMethod
+PyramidobacterPiscolens: GraphRetrievalMethod
+PyrenophoraTeres: GraphRetrievalMethod
+PyrenophoraTriticirepentis: GraphRetrievalMethod
+PyrobaculumAerophilum: GraphRetrievalMethod
+PyrobaculumCalidifontis: GraphRetrievalMethod
+PyrobaculumIslandicum: GraphRetrievalMethod
+PyrobaculumNeutrophilum: GraphRetrievalMethod
+PyrobaculumOguniense: GraphRetrievalMethod
+PyrobaculumSp1860: GraphRetrievalMethod
+PyrococcusAbyssi: GraphRetrievalMethod
+PyrococcusFuriosus: GraphRetrievalMethod
+PyrococcusHorikoshii: GraphRetrievalMethod
+PyrococcusSpNa2: GraphRetrievalMethod
+PyrococcusSpSt04: GraphRetrievalMethod
+PyrococcusYayanosii: GraphRetrievalMethod
+PyrolobusFumarii: GraphRetrievalMethod
+PyronemaOmphalodes: GraphRetrievalMethod
+PyrusXBretschneideri: GraphRetrievalMethod
+PythiumIrregulare: GraphRetrievalMethod
+PythiumIwayamai: GraphRetrievalMethod
+PythiumUltimum: GraphRetrievalMethod
+PythiumVexans: GraphRetrievalMethod
+PythonBivittatus: GraphRetrievalMethod
+RahnellaAquatilisCip7865: GraphRetrievalMethod
+RahnellaAquatilisHx2: GraphRetrievalMethod
+RahnellaSpY9602: GraphRetrievalMethod
+RalstoniaEutrophaH16: GraphRetrievalMethod
+RalstoniaEutrophaJmp134: GraphRetrievalMethod
+RalstoniaPickettii12j: GraphRetrievalMethod
+RalstoniaPickettiiDtp0602: GraphRetrievalMethod
+RalstoniaSolanacearumGmi1000: GraphRetrievalMethod
+RalstoniaSolanacearumPo82: GraphRetrievalMethod
+RalstoniaSolanacearumPsi07: GraphRetrievalMethod
+RalstoniaSpAu1208: GraphRetrievalMethod
+RalstoniaSpPba: GraphRetrievalMethod
+RamlibacterTataouinensis: GraphRetrievalMethod
+RaoultellaOrnithinolytica: GraphRetrievalMethod
+RaphidiopsisBrookii: GraphRetrievalMethod
+RathayibacterToxicus: GraphRetrievalMethod
+RattusNorvegicus: GraphRetrievalMethod
+RegiellaInsecticola: GraphRetrievalMethod
+RenibacteriumSalmoninarum: GraphRetrievalMethod
+ReyranellaMassiliensis: GraphRetrievalMethod
+RheinheimeraBaltica: GraphRetrievalMethod
+RheinheimeraPerlucida: GraphRetrievalMethod
+RheinheimeraSpA13l: GraphRetrievalMethod
+RhinopithecusRoxellana: GraphRetrievalMethod
+RhizobialesBacteriumYim77505: GraphRetrievalMethod
+RhizobiumAlamii: GraphRetrievalMethod
+RhizobiumEtliCfn42: GraphRetrievalMethod
+RhizobiumEtliCiat652: GraphRetrievalMethod
+RhizobiumEtliMimosae: GraphRetrievalMethod
+RhizobiumGallicum: GraphRetrievalMethod
+RhizobiumGiardinii: GraphRetrievalMethod
+RhizobiumGrahamii: GraphRetrievalMethod
+RhizobiumLarrymoorei: GraphRetrievalMethod
+RhizobiumLeguminosarum248: GraphRetrievalMethod
+RhizobiumLeguminosarum3841: GraphRetrievalMethod
+RhizobiumLeguminosarumCb782: GraphRetrievalMethod
+RhizobiumLeguminosarumGb30: GraphRetrievalMethod
+RhizobiumLeguminosarumWsm2304: GraphRetrievalMethod
+RhizobiumLeucaenae: GraphRetrievalMethod
+RhizobiumMesoamericanum: GraphRetrievalMethod
+RhizobiumMongolense: GraphRetrievalMethod
+RhizobiumRubi: GraphRetrievalMethod
+RhizobiumSelenitireducens: GraphRetrievalMethod
+RhizobiumSp2mfcol31: GraphRetrievalMethod
+RhizobiumSpCcge510: GraphRetrievalMethod
+RhizobiumSpCf080: GraphRetrievalMethod
+RhizobiumSpCf097: GraphRetrievalMethod
+RhizobiumSpCf122: GraphRetrievalMethod
+RhizobiumSpCf394: GraphRetrievalMethod
+RhizobiumSpIbun: GraphRetrievalMethod
+RhizobiumSpLpu83: GraphRetrievalMethod
+RhizobiumSpOk494: GraphRetrievalMethod
+RhizobiumSpR1200b2: GraphRetrievalMethod
+RhizobiumSpYr295: GraphRetrievalMethod
+RhizobiumSpYr519: GraphRetrievalMethod
+RhizobiumSpYs1r: GraphRetrievalMethod
+RhizobiumSullae: GraphRetrievalMethod
+RhizobiumTropici: GraphRetrievalMethod
+RhizobiumUndicola: GraphRetrievalMethod
+RhizobiumVignae: GraphRetrievalMethod
+RhizophagusIrregularis: GraphRetrievalMethod
+RhizopusDelemar: GraphRetrievalMethod
+RhodanobacterDenitrificans: GraphRetrievalMethod
+RhodanobacterFulvus: GraphRetrievalMethod
+RhodanobacterSpathiphylli: GraphRetrievalMethod
+RhodanobacterThiooxydans: GraphRetrievalMethod
+RhodniusProlixus: GraphRetrievalMethod
+RhodobacterCapsulatus: GraphRetrievalMethod
+RhodobacterSpSw2: GraphRetrievalMethod
+RhodobacterSphaeroides241: GraphRetrievalMethod
+RhodobacterSphaeroidesAtcc17025: GraphRetrievalMethod
+RhodobacteraceaeBacteriumHimb11: GraphRetrievalMethod
+RhodobacteraceaeBacteriumHtcc2083: GraphRetrievalMethod
+RhodobacteraceaeBacteriumHtcc2150: GraphRetrievalMethod
+RhodobacteraceaeBacteriumKlh11: GraphRetrievalMethod
+RhodobacteralesBacteriumHtcc2255: GraphRetrievalMethod
+RhodobacteralesBacteriumY4i: GraphRetrievalMethod
+RhodococcusDefluvii: GraphRetrievalMethod
+RhodococcusEqui: GraphRetrievalMethod
+RhodococcusErythropolis: GraphRetrievalMethod
+RhodococcusFascians: GraphRetrievalMethod
+RhodococcusJostii: GraphRetrievalMethod
+RhodococcusOpacus: GraphRetrievalMethod
+RhodococcusPyridinivorans: GraphRetrievalMethod
+RhodococcusRhodnii: GraphRetrievalMethod
+RhodococcusRhodochrous: GraphRetrievalMethod
+RhodococcusRuber: GraphRetrievalMethod
+RhodococcusSpAw25m09: GraphRetrievalMethod
+RhodococcusSpUnc23mfcrub11: GraphRetrievalMethod
+RhodococcusSpUnc363mftsu51: GraphRetrievalMethod
+RhodococcusTriatomae: GraphRetrievalMethod
+RhodoferaxFerrireducens: GraphRetrievalMethod
+RhodoferaxSaidenbachensis: GraphRetrievalMethod
+RhodolunaLacicola: GraphRetrievalMethod
+RhodomicrobiumVannielii: GraphRetrievalMethod
+RhodonellumPsychrophilum: GraphRetrievalMethod
+RhodopirellulaBaltica: GraphRetrievalMethod
+RhodopirellulaSpSwk7: GraphRetrievalMethod
+RhodopseudomonasPalustrisBisa53: GraphRetrievalMethod
+RhodopseudomonasPalustrisBisb18: GraphRetrievalMethod
+RhodopseudomonasPalustrisBisb5: GraphRetrievalMethod
+RhodopseudomonasPalustrisCga009: GraphRetrievalMethod
+RhodopseudomonasPalustrisDx1: GraphRetrievalMethod
+RhodopseudomonasPalustrisHaa2: GraphRetrievalMethod
+RhodospirillalesBacteriumUrhd0088: GraphRetrievalMethod
+RhodospirillumCentenum: GraphRetrievalMethod
+RhodospirillumPhotometricum: GraphRetrievalMethod
+RhodospirillumRubrum: GraphRetrievalMethod
+RhodosporidiumToruloides: GraphRetrievalMethod
+RhodothermusMarinus: GraphRetrievalMethod
+RhodovibrioSalinarum: GraphRetrievalMethod
+RhodovulumSpNi22: GraphRetrievalMethod
+RhodovulumSpPh10: GraphRetrievalMethod
+RhodovulumSulfidophilum: GraphRetrievalMethod
+RicheliaIntracellularis: GraphRetrievalMethod
+RicinusCommunis: GraphRetrievalMethod
+RickettsiaAkari: GraphRetrievalMethod
+RickettsiaAustralis: GraphRetrievalMethod
+RickettsiaBelliiOsu85389: GraphRetrievalMethod
+RickettsiaBelliiRml369c: GraphRetrievalMethod
+RickettsiaCanadensis: GraphRetrievalMethod
+RickettsiaFelis: GraphRetrievalMethod
+RickettsiaHelvetica: GraphRetrievalMethod
+RickettsiaProwazekii: GraphRetrievalMethod
+RickettsiaRickettsii: GraphRetrievalMethod
+RickettsiaSibirica: GraphRetrievalMethod
+RickettsiaTamurae: GraphRetrievalMethod
+RickettsiaTyphi: GraphRetrievalMethod
+RickettsialesBacteriumAc37b: GraphRetrievalMethod
+RickettsiellaGrylli: GraphRetrievalMethod
+RiemerellaAnatipestifer: GraphRetrievalMethod
+RiemerellaColumbina: GraphRetrievalMethod
+RiesiaPediculicola: GraphRetrievalMethod
+RikenellaMicrofusus: GraphRetrievalMethod
+RikenellaceaeBacteriumM3: GraphRetrievalMethod
+RivulariaSpPcc7116: GraphRetrievalMethod
+RobiginitaleaBiformata: GraphRetrievalMethod
+RobiginitomaculumAntarcticum: GraphRetrievalMethod
+RobinsoniellaPeoriensis: GraphRetrievalMethod
+RoseburiaHominis: GraphRetrievalMethod
+RoseburiaInulinivorans: GraphRetrievalMethod
+RoseibacteriumElongatum: GraphRetrievalMethod
+RoseibiumSpTrichskd4: GraphRetrievalMethod
+RoseiflexusCastenholzii: GraphRetrievalMethod
+RoseiflexusSpRs1: GraphRetrievalMethod
+RoseivivaxHalodurans: GraphRetrievalMethod
+RoseivivaxIsoporae: GraphRetrievalMethod
+RoseivivaxSp22iis10s: GraphRetrievalMethod
+RoseobacterDenitrificans: GraphRetrievalMethod
+RoseobacterLitoralis: GraphRetrievalMethod
+RoseobacterSpAzwk3b: GraphRetrievalMethod
+RoseobacterSpCcs2: GraphRetrievalMethod
+RoseobacterSpGai101: GraphRetrievalMethod
+RoseobacterSpMed193: GraphRetrievalMethod
+RoseobacterSpSk20926: GraphRetrievalMethod
+RoseomonasAerilata: GraphRetrievalMethod
+RoseomonasGilardii: GraphRetrievalMethod
+RoseomonasSpB5: GraphRetrievalMethod
+RoseovariusMucosus: GraphRetrievalMethod
+RoseovariusNubinhibens: GraphRetrievalMethod
+RoseovariusSp217: GraphRetrievalMethod
+RoseovariusSpMctg156: GraphRetrievalMethod
+RoseovariusSpTm1035: GraphRetrievalMethod
+RothiaDentocariosa: GraphRetrievalMethod
+RothiaMucilaginosa: GraphRetrievalMethod
+RuaniaAlbidiflava: GraphRetrievalMethod
+RubidibacterLacunae: GraphRetrievalMethod
+RubritaleaMarina: GraphRetrievalMethod
+RubritepidaFlocculans: GraphRetrievalMethod
+RubrivivaxBenzoatilyticus: GraphRetrievalMethod
+RubrivivaxGelatinosus: GraphRetrievalMethod
+RubrobacterRadiotolerans: GraphRetrievalMethod
+RubrobacterXylanophilus: GraphRetrievalMethod
+RudaeaCellulosilytica: GraphRetrievalMethod
+RudanellaLutea: GraphRetrievalMethod
+RuegeriaConchae: GraphRetrievalMethod
+RuegeriaHalocynthiae: GraphRetrievalMethod
+RuegeriaPomeroyi: GraphRetrievalMethod
+RuegeriaSpR11: GraphRetrievalMethod
+RuegeriaSpTm1040: GraphRetrievalMethod
+RuminiclostridiumThermocellum: GraphRetrievalMethod
+RuminobacterSpRm87: GraphRetrievalMethod
+RuminococcaceaeBacteriumAb4001: GraphRetrievalMethod
+RuminococcaceaeBacteriumAe2021: GraphRetrievalMethod
+RuminococcaceaeBacteriumD16: GraphRetrievalMethod
+RuminococcusAlbus7: GraphRetrievalMethod
+RuminococcusAlbus8: GraphRetrievalMethod
+RuminococcusAlbusAd2013: GraphRetrievalMethod
+RuminococcusBicirculans: GraphRetrievalMethod
+RuminococcusCallidus: GraphRetrievalMethod
+RuminococcusFlavefaciens007c: GraphRetrievalMethod
+RuminococcusFlavefaciensAe3010: GraphRetrievalMethod
+RuminococcusFlavefaciensFd1: GraphRetrievalMethod
+RuminococcusFlavefaciensMa2007: GraphRetrievalMethod
+RuminococcusGauvreauii: GraphRetrievalMethod
+RuminococcusGnavus: GraphRetrievalMethod
+RuminococcusLactaris: GraphRetrievalMethod
+RuminococcusObeumAtcc29174: GraphRetrievalMethod
+RuminococcusSp5139bfaa: GraphRetrievalMethod
+RuminococcusSpFc2018: GraphRetrievalMethod
+RuminococcusSpHun007: GraphRetrievalMethod
+RuminococcusSpNk3a76: GraphRetrievalMethod
+RuminococcusTorquesAtcc27756: GraphRetrievalMethod
+RunellaSlithyformis: GraphRetrievalMethod
+RuthiaMagnifica: GraphRetrievalMethod
+SaccharibacillusKuerlensis: GraphRetrievalMethod
+SaccharibacterFloricola: GraphRetrievalMethod
+SaccharibacterSpAm169: GraphRetrievalMethod
+SaccharomonosporaAzurea: GraphRetrievalMethod
+SaccharomonosporaCyanea: GraphRetrievalMethod
+SaccharomonosporaGlauca: GraphRetrievalMethod
+SaccharomonosporaMarina: GraphRetrievalMethod
+SaccharomonosporaSpCnq490: GraphRetrievalMethod
+SaccharomonosporaViridis: GraphRetrievalMethod
+SaccharomonosporaXinjiangensis: GraphRetrievalMethod
+SaccharomycesCerevisiae: GraphRetrievalMethod
+SaccharophagusDegradans: GraphRetrievalMethod
+SaccharopolysporaErythraea: GraphRetrievalMethod
+SaccharopolysporaRectivirgula: GraphRetrievalMethod
+SaccharopolysporaSpinosa: GraphRetrievalMethod
+SaccharospirillumImpatiens: GraphRetrievalMethod
+SaccharothrixEspanaensis: GraphRetrievalMethod
+SaccharothrixSpNrrlb16314: GraphRetrievalMethod
+SaccharothrixSyringae: GraphRetrievalMethod
+SaccoglossusKowalevskii: GraphRetrievalMethod
+SagittulaStellata: GraphRetrievalMethod
+SaimiriBoliviensis: GraphRetrievalMethod
+SalegentibacterSpHeli6: GraphRetrievalMethod
+SalimicrobiumSpMj3: GraphRetrievalMethod
+SalinarchaeumSpHarchtbsk1: GraphRetrievalMethod
+SalinarimonasRosea: GraphRetrievalMethod
+SalinibacterRuber: GraphRetrievalMethod
+SalinicoccusAlbus: GraphRetrievalMethod
+SalinicoccusCarnicancri: GraphRetrievalMethod
+SalinimicrobiumTerrae: GraphRetrievalMethod
+SalinimonasChungwhensis: GraphRetrievalMethod
+SalinisphaeraHydrothermalis: GraphRetrievalMethod
+SalinisphaeraShabanensis: GraphRetrievalMethod
+SalinisporaArenicola: GraphRetrievalMethod
+SalinisporaPacifica: GraphRetrievalMethod
+SalinisporaTropica: GraphRetrievalMethod
+SalipigerMucosus: GraphRetrievalMethod
+SalisaetaLonga: GraphRetrievalMethod
+SalmonellaBongoriN26808: GraphRetrievalMethod
+SalmonellaBongoriNctc12419: GraphRetrievalMethod
+SalmonellaEntericaCt18: GraphRetrievalMethod
+SalmonellaEntericaTyphimurium: GraphRetrievalMethod
+SalpingoecaRosetta: GraphRetrievalMethod
+SalsuginibacillusKocurii: GraphRetrievalMethod
+SandarakinorhabdusLimnophila: GraphRetrievalMethod
+SandarakinorhabdusSpAap62: GraphRetrievalMethod
+SanguibacterKeddieii: GraphRetrievalMethod
+SaprolegniaDiclina: GraphRetrievalMethod
+SaprospiraGrandis: GraphRetrievalMethod
+SarcophilusHarrisii: GraphRetrievalMethod
+ScalinduaBrodae: GraphRetrievalMethod
+ScardoviaInopinata: GraphRetrievalMethod
+ScardoviaWiggsiae: GraphRetrievalMethod
+ScheffersomycesStipitis: GraphRetrievalMethod
+SchistosomaMansoni: GraphRetrievalMethod
+SchizophyllumCommune: GraphRetrievalMethod
+SchizosaccharomycesCryophilus: GraphRetrievalMethod
+SchizosaccharomycesJaponicus: GraphRetrievalMethod
+SchizosaccharomycesOctosporus: GraphRetrievalMethod
+SchizosaccharomycesPombe: GraphRetrievalMethod
+SchleiferiaThermophila: GraphRetrievalMethod
+SchlesneriaPaludicola: GraphRetrievalMethod
+SchmidhempeliaBombi: GraphRetrievalMethod
+SciscionellaSpSe31: GraphRetrievalMethod
+SclerotiniaSclerotiorum: GraphRetrievalMethod
+ScytonemaHofmanni: GraphRetrievalMethod
+SebaldellaTermitidis: GraphRetrievalMethod
+SedimentitaleaNanhaiensis: GraphRetrievalMethod
+SediminibacterSpHeli10: GraphRetrievalMethod
+SediminibacteriumSpC3: GraphRetrievalMethod
+SediminibacteriumSpOr53: GraphRetrievalMethod
+SediminimonasQiaohouensis: GraphRetrievalMethod
+SegetibacterKoreensis: GraphRetrievalMethod
+SegniliparusRotundus: GraphRetrievalMethod
+SegniliparusRugosus: GraphRetrievalMethod
+SelaginellaMoellendorffii: GraphRetrievalMethod
+SelenomonasBovis: GraphRetrievalMethod
+SelenomonasFlueggei: GraphRetrievalMethod
+SelenomonasInfelix: GraphRetrievalMethod
+SelenomonasNoxiaAtcc43541: GraphRetrievalMethod
+SelenomonasNoxiaF0398: GraphRetrievalMethod
+SelenomonasRuminantiumAb3002: GraphRetrievalMethod
+SelenomonasRuminantiumAc2024: GraphRetrievalMethod
+SelenomonasRuminantiumAtcc12561: GraphRetrievalMethod
+SelenomonasRuminantiumLactilytica: GraphRetrievalMethod
+SelenomonasSp67h29bp: GraphRetrievalMethod
+SelenomonasSpAe3005: GraphRetrievalMethod
+SelenomonasSpF0426: GraphRetrievalMethod
+SelenomonasSpF0429: GraphRetrievalMethod
+SelenomonasSpF0430: GraphRetrievalMethod
+SelenomonasSpF0473: GraphRetrievalMethod
+SelenomonasSpFobrc6: GraphRetrievalMethod
+SelenomonasSpFobrc9: GraphRetrievalMethod
+SelenomonasSpNd2010: GraphRetrievalMethod
+SelenomonasSputigena: GraphRetrievalMethod
+SenegalimassiliaAnaerobia: GraphRetrievalMethod
+SerinicoccusMarinus: GraphRetrievalMethod
+SerinicoccusProfundi: GraphRetrievalMethod
+SerpulaLacrymans: GraphRetrievalMethod
+SerratiaFonticolaAuap2c: GraphRetrievalMethod
+SerratiaFonticolaRb25: GraphRetrievalMethod
+SerratiaGrimesii: GraphRetrievalMethod
+SerratiaMarcescensDb11: GraphRetrievalMethod
+SerratiaMarcescensFgi94: GraphRetrievalMethod
+SerratiaPlymuthica: GraphRetrievalMethod
+SerratiaProteamaculans: GraphRetrievalMethod
+SerratiaSpAg1: GraphRetrievalMethod
+SerratiaSpAtcc39006: GraphRetrievalMethod
+SerratiaSpDd3: GraphRetrievalMethod
+SerratiaSpH1n: GraphRetrievalMethod
+SerratiaSpM24t3: GraphRetrievalMethod
+SerratiaSymbiotica: GraphRetrievalMethod
+SetariaItalica: GraphRetrievalMethod
+SetosphaeriaTurcica: GraphRetrievalMethod
+SharpeaAzabuensis: GraphRetrievalMethod
+ShewanellaAmazonensis: GraphRetrievalMethod
+ShewanellaDenitrificans: GraphRetrievalMethod
+ShewanellaFrigidimarina: GraphRetrievalMethod
+ShewanellaHalifaxensis: GraphRetrievalMethod
+ShewanellaHaliotis: GraphRetrievalMethod
+ShewanellaLoihica: GraphRetrievalMethod
+ShewanellaMarina: GraphRetrievalMethod
+ShewanellaOneidensis: GraphRetrievalMethod
+ShewanellaPealeana: GraphRetrievalMethod
+ShewanellaPiezotolerans: GraphRetrievalMethod
+ShewanellaPutrefaciens: GraphRetrievalMethod
+ShewanellaSediminis: GraphRetrievalMethod
+ShewanellaSpAna3: GraphRetrievalMethod
+ShewanellaSpEcsmb14101: GraphRetrievalMethod
+ShewanellaSpYqh10: GraphRetrievalMethod
+ShewanellaViolacea: GraphRetrievalMethod
+ShewanellaWaksmanii: GraphRetrievalMethod
+ShewanellaWoodyi: GraphRetrievalMethod
+ShigellaFlexneri: GraphRetrievalMethod
+ShimazuellaKribbensis: GraphRetrievalMethod
+ShimwelliaBlattae: GraphRetrievalMethod
+ShinellaSpDd12: GraphRetrievalMethod
+ShuttleworthiaSatelles: GraphRetrievalMethod
+ShuttleworthiaSpMsx8b: GraphRetrievalMethod
+SideroxydansLithotrophicus: GraphRetrievalMethod
+SilanimonasLenta: GraphRetrievalMethod
+SilicibacterLacuscaerulensis: GraphRetrievalMethod
+SilicibacterSpTrichch4b: GraphRetrievalMethod
+SimiduiaAgarivorans: GraphRetrievalMethod
+SimkaniaNegevensis: GraphRetrievalMethod
+SimonsiellaMuelleri: GraphRetrievalMethod
+SimplicispiraPsychrophila: GraphRetrievalMethod
+SingulisphaeraAcidiphila: GraphRetrievalMethod
+SinorhizobiumAmericanum: GraphRetrievalMethod
+SinorhizobiumArboris: GraphRetrievalMethod
+SinorhizobiumFrediiHh103: GraphRetrievalMethod
+SinorhizobiumFrediiNgr234: GraphRetrievalMethod
+SinorhizobiumFrediiUsda257: GraphRetrievalMethod
+SinorhizobiumMedicae: GraphRetrievalMethod
+SinorhizobiumMeliloti: GraphRetrievalMethod
+SinorhizobiumSpCcbau05631: GraphRetrievalMethod
+SlackiaExigua: GraphRetrievalMethod
+SlackiaHeliotrinireducens: GraphRetrievalMethod
+SlackiaPiriformis: GraphRetrievalMethod
+SmaragdicoccusNiigatensis: GraphRetrievalMethod
+SnodgrassellaAlvi: GraphRetrievalMethod
+SodalisGlossinidius: GraphRetrievalMethod
+SodalisPierantonius: GraphRetrievalMethod
+SolanumLycopersicum: GraphRetrievalMethod
+SolanumTuberosum: GraphRetrievalMethod
+SolemyaVelum: GraphRetrievalMethod
+SolibacillusSilvestris: GraphRetrievalMethod
+SolibacterUsitatus: GraphRetrievalMethod
+SolimonasFlava: GraphRetrievalMethod
+SolimonasSoli: GraphRetrievalMethod
+SolimonasVariicoloris: GraphRetrievalMethod
+SolirubrobacteralesBacteriumUrhd0059: GraphRetrievalMethod
+SolitaleaCanadensis: GraphRetrievalMethod
+SolobacteriumMooreiDsm22971: GraphRetrievalMethod
+SolobacteriumMooreiF0204: GraphRetrievalMethod
+SorangiumCellulosumSo01572: GraphRetrievalMethod
+SorangiumCellulosumSoCe56: GraphRetrievalMethod
+SordariaMacrospora: GraphRetrievalMethod
+SorexAraneus: GraphRetrievalMethod
+SorghumBicolor: GraphRetrievalMethod
+SpathasporaPassalidarum: GraphRetrievalMethod
+SphaerobacterThermophilus: GraphRetrievalMethod
+SphaerochaetaCoccoides: GraphRetrievalMethod
+SphaerochaetaGlobosa: GraphRetrievalMethod
+SphaerochaetaPleomorpha: GraphRetrievalMethod
+SphaeroformaArctica: GraphRetrievalMethod
+SphaerotilusNatans: GraphRetrievalMethod
+SphaerulinaMusiva: GraphRetrievalMethod
+SphingobacteriaceaeBacteriumDw12: GraphRetrievalMethod
+SphingobacteriumAntarcticus: GraphRetrievalMethod
+SphingobacteriumPaucimobilis: GraphRetrievalMethod
+SphingobacteriumSp21: GraphRetrievalMethod
+SphingobacteriumSpAccc05744: GraphRetrievalMethod
+SphingobacteriumSpH1ai: GraphRetrievalMethod
+SphingobacteriumSpMl3w: GraphRetrievalMethod
+SphingobacteriumSpiritivorum: GraphRetrievalMethod
+SphingobiumBaderi: GraphRetrievalMethod
+SphingobiumChlorophenolicum: GraphRetrievalMethod
+SphingobiumHerbicidovorans: GraphRetrievalMethod
+SphingobiumJaponicumUt26s: GraphRetrievalMethod
+SphingobiumLactosutens: GraphRetrievalMethod
+SphingobiumSpAp49: GraphRetrievalMethod
+SphingobiumSpBa1: GraphRetrievalMethod
+SphingobiumSpC100: GraphRetrievalMethod
+SphingobiumSpSyk6: GraphRetrievalMethod
+SphingobiumSpYl23: GraphRetrievalMethod
+SphingobiumUmmariense: GraphRetrievalMethod
+SphingobiumXenophagum: GraphRetrievalMethod
+SphingobiumYanoikuyae: GraphRetrievalMethod
+SphingomonasAstaxanthinifaciens: GraphRetrievalMethod
+SphingomonasEchinoides: GraphRetrievalMethod
+SphingomonasElodea: GraphRetrievalMethod
+SphingomonasMelonis: GraphRetrievalMethod
+SphingomonasParapaucimobilis: GraphRetrievalMethod
+SphingomonasPaucimobilis: GraphRetrievalMethod
+SphingomonasPhyllosphaerae52: GraphRetrievalMethod
+SphingomonasPhyllosphaeraeFa2: GraphRetrievalMethod
+SphingomonasSanxanigenens: GraphRetrievalMethod
+SphingomonasSp3524zxx: GraphRetrievalMethod
+SphingomonasSp37zxx: GraphRetrievalMethod
+SphingomonasSpAtcc31555: GraphRetrievalMethod
+SphingomonasSpFukuswis1: GraphRetrievalMethod
+SphingomonasSpKc8: GraphRetrievalMethod
+SphingomonasSpMm1: GraphRetrievalMethod
+SphingomonasSpMn802worker: GraphRetrievalMethod
+SphingomonasSpPamc26605: GraphRetrievalMethod
+SphingomonasSpPamc26617: GraphRetrievalMethod
+SphingomonasSpPr090111t3t6a: GraphRetrievalMethod
+SphingomonasSpRit328: GraphRetrievalMethod
+SphingomonasSpS17: GraphRetrievalMethod
+SphingomonasSpSka58: GraphRetrievalMethod
+SphingomonasSpUnc305mfcol52: GraphRetrievalMethod
+SphingomonasTaxi: GraphRetrievalMethod
+SphingomonasWittichii: GraphRetrievalMethod
+SphingopyxisAlaskensis: GraphRetrievalMethod
+SphingopyxisBaekryungensis: GraphRetrievalMethod
+SphingopyxisSpLc363: GraphRetrievalMethod
+SphingopyxisSpLc81: GraphRetrievalMethod
+SphingopyxisSpMc1: GraphRetrievalMethod
+SphingopyxisSpMwb1: GraphRetrievalMethod
+SpiribacterSalinus: GraphRetrievalMethod
+SpiribacterSpUahsp71: GraphRetrievalMethod
+SpirillosporaAlbida: GraphRetrievalMethod
+SpirochaetaAfricana: GraphRetrievalMethod
+SpirochaetaBajacaliforniensis: GraphRetrievalMethod
+SpirochaetaSmaragdinae: GraphRetrievalMethod
+SpirochaetaSpJc230: GraphRetrievalMethod
+SpirochaetaSpL21rpuld2: GraphRetrievalMethod
+SpirochaetaThermophila: GraphRetrievalMethod
+SpiroplasmaApis: GraphRetrievalMethod
+SpiroplasmaChrysopicola: GraphRetrievalMethod
+SpiroplasmaCulicicola: GraphRetrievalMethod
+SpiroplasmaDiminutum: GraphRetrievalMethod
+SpiroplasmaMelliferum: GraphRetrievalMethod
+SpiroplasmaMirum: GraphRetrievalMethod
+SpiroplasmaSabaudiense: GraphRetrievalMethod
+SpiroplasmaSyrphidicola: GraphRetrievalMethod
+SpiroplasmaTaiwanense: GraphRetrievalMethod
+SpirosomaLinguale: GraphRetrievalMethod
+SpirosomaLuteum: GraphRetrievalMethod
+SpirosomaPanaciterrae: GraphRetrievalMethod
+SpirosomaSpitsbergense: GraphRetrievalMethod
+SpirulinaSubsalsa: GraphRetrievalMethod
+SpizellomycesPunctatus: GraphRetrievalMethod
+SpongiibacterTropicus: GraphRetrievalMethod
+SporichthyaPolymorpha: GraphRetrievalMethod
+SporisoriumReilianum: GraphRetrievalMethod
+SporocytophagaMyxococcoides: GraphRetrievalMethod
+SporolactobacillusLaevolacticus: GraphRetrievalMethod
+SporolactobacillusTerrae: GraphRetrievalMethod
+SporolactobacillusVineae: GraphRetrievalMethod
+SporomusaOvata: GraphRetrievalMethod
+SporosarcinaNewyorkensis: GraphRetrievalMethod
+SporosarcinaSpD27: GraphRetrievalMethod
+SporosarcinaSpEur3222: GraphRetrievalMethod
+SporosarcinaUreae: GraphRetrievalMethod
+SporothrixSchenckii: GraphRetrievalMethod
+StackebrandtiaNassauensis: GraphRetrievalMethod
+StanieriaCyanosphaera: GraphRetrievalMethod
+StaphylococcusAgnetis: GraphRetrievalMethod
+StaphylococcusAureus: GraphRetrievalMethod
+StaphylococcusCapitis: GraphRetrievalMethod
+StaphylococcusCaprae: GraphRetrievalMethod
+StaphylococcusCarnosus: GraphRetrievalMethod
+StaphylococcusChromogenes: GraphRetrievalMethod
+StaphylococcusEpidermidisAtcc12228: GraphRetrievalMethod
+StaphylococcusEpidermidisRp62a: GraphRetrievalMethod
+StaphylococcusEquorum: GraphRetrievalMethod
+StaphylococcusHaemolyticus: GraphRetrievalMethod
+StaphylococcusHominisC80: GraphRetrievalMethod
+StaphylococcusHominisSk119: GraphRetrievalMethod
+StaphylococcusIntermedius: GraphRetrievalMethod
+StaphylococcusLentus: GraphRetrievalMethod
+StaphylococcusLugdunensisHku0901: GraphRetrievalMethod
+StaphylococcusLugdunensisN920143: GraphRetrievalMethod
+StaphylococcusMassiliensis: GraphRetrievalMethod
+StaphylococcusPettenkoferi: GraphRetrievalMethod
+StaphylococcusPseudintermedius: GraphRetrievalMethod
+StaphylococcusSaprophyticus: GraphRetrievalMethod
+StaphylococcusSciuri: GraphRetrievalMethod
+StaphylococcusSimulans: GraphRetrievalMethod
+StaphylococcusSpAl1: GraphRetrievalMethod
+StaphylococcusSpE463: GraphRetrievalMethod
+StaphylococcusSpHgb0015: GraphRetrievalMethod
+StaphylococcusVitulinus: GraphRetrievalMethod
+StaphylococcusWarneriL37603: GraphRetrievalMethod
+StaphylococcusWarneriSg1: GraphRetrievalMethod
+StaphylococcusXylosus: GraphRetrievalMethod
+StaphylothermusHellenicus: GraphRetrievalMethod
+StaphylothermusMarinus: GraphRetrievalMethod
+StarkeyaNovella: GraphRetrievalMethod
+StegastesPartitus: GraphRetrievalMethod
+StenotrophomonasMaltophilia5bai2: GraphRetrievalMethod
+StenotrophomonasMaltophiliaK279a: GraphRetrievalMethod
+StenotrophomonasMaltophiliaPml168: GraphRetrievalMethod
+StenotrophomonasMaltophiliaR5513: GraphRetrievalMethod
+StenoxybacterAcetivorans: GraphRetrievalMethod
+StereumHirsutum: GraphRetrievalMethod
+StigmatellaAurantiaca: GraphRetrievalMethod
+StomatobaculumLongum: GraphRetrievalMethod
+StoquefichusMassiliensis: GraphRetrievalMethod
+StreptacidiphilusAlbus: GraphRetrievalMethod
+StreptacidiphilusCarbonis: GraphRetrievalMethod
+StreptacidiphilusJeojiense: GraphRetrievalMethod
+StreptacidiphilusJiangxiensis: GraphRetrievalMethod
+StreptacidiphilusNeutrinimicus: GraphRetrievalMethod
+StreptacidiphilusOryzae: GraphRetrievalMethod
+StreptacidiphilusRugosus: GraphRetrievalMethod
+StreptobacillusMoniliformis: GraphRetrievalMethod
+StreptococcusAgalactiaeLmg14747: GraphRetrievalMethod
+StreptococcusAgalactiaeNem316: GraphRetrievalMethod
+StreptococcusAnginosusC1051: GraphRetrievalMethod
+StreptococcusAnginosusC238: GraphRetrievalMethod
+StreptococcusAnginosusDora7: GraphRetrievalMethod
+StreptococcusAnginosusF0211: GraphRetrievalMethod
+StreptococcusAnginosusSk52: GraphRetrievalMethod
+StreptococcusAustralis: GraphRetrievalMethod
+StreptococcusCaballi: GraphRetrievalMethod
+StreptococcusCanis: GraphRetrievalMethod
+StreptococcusCastoreus: GraphRetrievalMethod
+StreptococcusConstellatusPharyngisC1050: GraphRetrievalMethod
+StreptococcusConstellatusPharyngisSk1060: GraphRetrievalMethod
+StreptococcusCriceti: GraphRetrievalMethod
+StreptococcusCristatus: GraphRetrievalMethod
+StreptococcusDentisani7746: GraphRetrievalMethod
+StreptococcusDentisani7747: GraphRetrievalMethod
+StreptococcusDevriesei: GraphRetrievalMethod
+StreptococcusDidelphis: GraphRetrievalMethod
+StreptococcusDownei: GraphRetrievalMethod
+StreptococcusDysgalactiaeAtcc27957: GraphRetrievalMethod
+StreptococcusDysgalactiaeEquisimilis: GraphRetrievalMethod
+StreptococcusEntericus: GraphRetrievalMethod
+StreptococcusEqui: GraphRetrievalMethod
+StreptococcusEquinus: GraphRetrievalMethod
+StreptococcusFerus: GraphRetrievalMethod
+StreptococcusGordonii: GraphRetrievalMethod
+StreptococcusHenryi: GraphRetrievalMethod
+StreptococcusIctaluri: GraphRetrievalMethod
+StreptococcusInfantarius: GraphRetrievalMethod
+StreptococcusInfantisAtcc700779: GraphRetrievalMethod
+StreptococcusInfantisSk1076: GraphRetrievalMethod
+StreptococcusInfantisSk970: GraphRetrievalMethod
+StreptococcusInfantisX: GraphRetrievalMethod
+StreptococcusIniae: GraphRetrievalMethod
+StreptococcusIntermedius: GraphRetrievalMethod
+StreptococcusMacacae: GraphRetrievalMethod
+StreptococcusMacedonicus: GraphRetrievalMethod
+StreptococcusMarimammalium: GraphRetrievalMethod
+StreptococcusMassiliensis: GraphRetrievalMethod
+StreptococcusMerionis: GraphRetrievalMethod
+StreptococcusMinor: GraphRetrievalMethod
+StreptococcusMitis2F0392: GraphRetrievalMethod
+StreptococcusMitis2Sk95: GraphRetrievalMethod
+StreptococcusMitisAtcc6249: GraphRetrievalMethod
+StreptococcusMitisB6: GraphRetrievalMethod
+StreptococcusMitisNctc12261: GraphRetrievalMethod
+StreptococcusMitisSk1080: GraphRetrievalMethod
+StreptococcusMitisSk321: GraphRetrievalMethod
+StreptococcusMitisSk564: GraphRetrievalMethod
+StreptococcusMitisSk569: GraphRetrievalMethod
+StreptococcusMitisSk579: GraphRetrievalMethod
+StreptococcusMitisSk597: GraphRetrievalMethod
+StreptococcusMutansGs5: GraphRetrievalMethod
+StreptococcusMutansUa159: GraphRetrievalMethod
+StreptococcusOligofermentans: GraphRetrievalMethod
+StreptococcusOralisAtcc35037: GraphRetrievalMethod
+StreptococcusOralisAtcc49296: GraphRetrievalMethod
+StreptococcusOralisSk1074: GraphRetrievalMethod
+StreptococcusOralisSk255: GraphRetrievalMethod
+StreptococcusOralisUo5: GraphRetrievalMethod
+StreptococcusOrisratti: GraphRetrievalMethod
+StreptococcusOvis: GraphRetrievalMethod
+StreptococcusParasanguinisAtcc903: GraphRetrievalMethod
+StreptococcusParasanguinisFw213: GraphRetrievalMethod
+StreptococcusParauberisKctc11537: GraphRetrievalMethod
+StreptococcusParauberisNcfd2020: GraphRetrievalMethod
+StreptococcusPeroris: GraphRetrievalMethod
+StreptococcusPlurextorum: GraphRetrievalMethod
+StreptococcusPneumoniaeD39: GraphRetrievalMethod
+StreptococcusPneumoniaeR6: GraphRetrievalMethod
+StreptococcusPneumoniaeTigr4: GraphRetrievalMethod
+StreptococcusPorci: GraphRetrievalMethod
+StreptococcusPorcinus: GraphRetrievalMethod
+StreptococcusPseudopneumoniae: GraphRetrievalMethod
+StreptococcusPseudoporcinus: GraphRetrievalMethod
+StreptococcusPyogenes: GraphRetrievalMethod
+StreptococcusRatti: GraphRetrievalMethod
+StreptococcusSalivarius57i: GraphRetrievalMethod
+StreptococcusSanguinisSk1057: GraphRetrievalMethod
+StreptococcusSanguinisSk355: GraphRetrievalMethod
+StreptococcusSanguinisSk36: GraphRetrievalMethod
+StreptococcusSanguinisSk49: GraphRetrievalMethod
+StreptococcusSinensis: GraphRetrievalMethod
+StreptococcusSp2136faa: GraphRetrievalMethod
+StreptococcusSp73h25ap: GraphRetrievalMethod
+StreptococcusSpAcc21: GraphRetrievalMethod
+StreptococcusSpC150: GraphRetrievalMethod
+StreptococcusSpCm6: GraphRetrievalMethod
+StreptococcusSpF0407: GraphRetrievalMethod
+StreptococcusSpF0418: GraphRetrievalMethod
+StreptococcusSpF0442: GraphRetrievalMethod
+StreptococcusSpHph0090: GraphRetrievalMethod
+StreptococcusSpHsism1: GraphRetrievalMethod
+StreptococcusSpM143: GraphRetrievalMethod
+StreptococcusSpM334: GraphRetrievalMethod
+StreptococcusSpSk140: GraphRetrievalMethod
+StreptococcusSpSk643: GraphRetrievalMethod
+StreptococcusSpVt162: GraphRetrievalMethod
+StreptococcusSuis05zyh33: GraphRetrievalMethod
+StreptococcusSuis22083: GraphRetrievalMethod
+StreptococcusSuis865192: GraphRetrievalMethod
+StreptococcusSuisEa183292: GraphRetrievalMethod
+StreptococcusSuisR61: GraphRetrievalMethod
+StreptococcusSuisYs72: GraphRetrievalMethod
+StreptococcusThermophilusLmd9: GraphRetrievalMethod
+StreptococcusThermophilusLmg18311: GraphRetrievalMethod
+StreptococcusThoraltensis: GraphRetrievalMethod
+StreptococcusTigurinus1366: GraphRetrievalMethod
+StreptococcusTigurinusAz3a: GraphRetrievalMethod
+StreptococcusUberis: GraphRetrievalMethod
+StreptococcusUrinalis228597: GraphRetrievalMethod
+StreptococcusUrinalisFb127cna2: GraphRetrievalMethod
+StreptococcusVestibularis: GraphRetrievalMethod
+StreptomycesAcidiscabies: GraphRetrievalMethod
+StreptomycesAlboflavus: GraphRetrievalMethod
+StreptomycesAlbulus: GraphRetrievalMethod
+StreptomycesAlbusAlbus: GraphRetrievalMethod
+StreptomycesAlbusJ1074: GraphRetrievalMethod
+StreptomycesAtroolivaceus: GraphRetrievalMethod
+StreptomycesAuratus: GraphRetrievalMethod
+StreptomycesAureocirculatus: GraphRetrievalMethod
+StreptomycesAureofaciens: GraphRetrievalMethod
+StreptomycesAvermitilis: GraphRetrievalMethod
+StreptomycesAvicenniae: GraphRetrievalMethod
+StreptomycesBicolor: GraphRetrievalMethod
+StreptomycesBikiniensis: GraphRetrievalMethod
+StreptomycesBingchenggensis: GraphRetrievalMethod
+StreptomycesCalifornicus: GraphRetrievalMethod
+StreptomycesCatenulae: GraphRetrievalMethod
+StreptomycesCattleya: GraphRetrievalMethod
+StreptomycesCelluloflavus: GraphRetrievalMethod
+StreptomycesCellulosae: GraphRetrievalMethod
+StreptomycesChartreusis: GraphRetrievalMethod
+StreptomycesClavuligerus: GraphRetrievalMethod
+StreptomycesCoelicolor: GraphRetrievalMethod
+StreptomycesCollinus: GraphRetrievalMethod
+StreptomycesDavawensis: GraphRetrievalMethod
+StreptomycesDurhamensis: GraphRetrievalMethod
+StreptomycesFlavidovirens: GraphRetrievalMethod
+StreptomycesFlavochromogenes: GraphRetrievalMethod
+StreptomycesFlavovariabilis: GraphRetrievalMethod
+StreptomycesFradiae: GraphRetrievalMethod
+StreptomycesFulvissimus: GraphRetrievalMethod
+StreptomycesFulvoviolaceus: GraphRetrievalMethod
+StreptomycesGalbus: GraphRetrievalMethod
+StreptomycesGhanaensis: GraphRetrievalMethod
+StreptomycesGlaucescens: GraphRetrievalMethod
+StreptomycesGriseoaurantiacus: GraphRetrievalMethod
+StreptomycesGriseoflavus: GraphRetrievalMethod
+StreptomycesGriseofuscus: GraphRetrievalMethod
+StreptomycesGriseoluteus: GraphRetrievalMethod
+StreptomycesGriseorubens: GraphRetrievalMethod
+StreptomycesGriseus: GraphRetrievalMethod
+StreptomycesHalstedii: GraphRetrievalMethod
+StreptomycesHygroscopicus: GraphRetrievalMethod
+StreptomycesIakyrus: GraphRetrievalMethod
+StreptomycesKatrae: GraphRetrievalMethod
+StreptomycesLavenduligriseus: GraphRetrievalMethod
+StreptomycesLydicus: GraphRetrievalMethod
+StreptomycesMegasporus: GraphRetrievalMethod
+StreptomycesMobaraensis: GraphRetrievalMethod
+StreptomycesMutabilis: GraphRetrievalMethod
+StreptomycesNiger: GraphRetrievalMethod
+StreptomycesNiveus: GraphRetrievalMethod
+StreptomycesOlindensis: GraphRetrievalMethod
+StreptomycesOlivaceus: GraphRetrievalMethod
+StreptomycesPratensis: GraphRetrievalMethod
+StreptomycesPristinaespiralis: GraphRetrievalMethod
+StreptomycesPurpeofuscus: GraphRetrievalMethod
+StreptomycesPurpureus: GraphRetrievalMethod
+StreptomycesPyridomyceticus: GraphRetrievalMethod
+StreptomycesRapamycinicus: GraphRetrievalMethod
+StreptomycesResistomycificus: GraphRetrievalMethod
+StreptomycesRoseoverticillatus: GraphRetrievalMethod
+StreptomycesScabiei: GraphRetrievalMethod
+StreptomycesScabrisporus: GraphRetrievalMethod
+StreptomycesSclerotialus: GraphRetrievalMethod
+StreptomycesScopuliridis: GraphRetrievalMethod
+StreptomycesSeoulensis: GraphRetrievalMethod
+StreptomycesSomaliensis: GraphRetrievalMethod
+StreptomycesSp142mfcol31: GraphRetrievalMethod
+StreptomycesSp303mfcol52: GraphRetrievalMethod
+StreptomycesSp351mftsu51: GraphRetrievalMethod
+StreptomycesSpAa0539: GraphRetrievalMethod
+StreptomycesSpAa4: GraphRetrievalMethod
+StreptomycesSpAmel2xe9: GraphRetrievalMethod
+StreptomycesSpAtexabd23: GraphRetrievalMethod
+StreptomycesSpBolea5: GraphRetrievalMethod
+StreptomycesSpC: GraphRetrievalMethod
+StreptomycesSpCnh099: GraphRetrievalMethod
+StreptomycesSpCnr698: GraphRetrievalMethod
+StreptomycesSpCnt318: GraphRetrievalMethod
+StreptomycesSpCnt372: GraphRetrievalMethod
+StreptomycesSpCny243: GraphRetrievalMethod
+StreptomycesSpE14: GraphRetrievalMethod
+StreptomycesSpFxanac1: GraphRetrievalMethod
+StreptomycesSpGxt6: GraphRetrievalMethod
+StreptomycesSpHmica12: GraphRetrievalMethod
+StreptomycesSpLappah108: GraphRetrievalMethod
+StreptomycesSpLappah95: GraphRetrievalMethod
+StreptomycesSpMg1: GraphRetrievalMethod
+StreptomycesSpMspmpm5: GraphRetrievalMethod
+StreptomycesSpNrrlb24720: GraphRetrievalMethod
+StreptomycesSpNrrlf2580: GraphRetrievalMethod
+StreptomycesSpNrrlf2890: GraphRetrievalMethod
+StreptomycesSpNrrlf5008: GraphRetrievalMethod
+StreptomycesSpNrrlf5053: GraphRetrievalMethod
+StreptomycesSpNrrlf5065: GraphRetrievalMethod
+StreptomycesSpNrrlf5123: GraphRetrievalMethod
+StreptomycesSpNrrlf5126: GraphRetrievalMethod
+StreptomycesSpNrrlf5135: GraphRetrievalMethod
+StreptomycesSpNrrlf525: GraphRetrievalMethod
+StreptomycesSpNrrlf5630: GraphRetrievalMethod
+StreptomycesSpNrrlf6677: GraphRetrievalMethod
+StreptomycesSpNrrls118: GraphRetrievalMethod
+StreptomycesSpNrrls149: GraphRetrievalMethod
+StreptomycesSpNrrls1777: GraphRetrievalMethod
+StreptomycesSpNrrls237: GraphRetrievalMethod
+StreptomycesSpNrrls337: GraphRetrievalMethod
+StreptomycesSpNrrls340: GraphRetrievalMethod
+StreptomycesSpNrrls37: GraphRetrievalMethod
+StreptomycesSpNrrls474: GraphRetrievalMethod
+StreptomycesSpNrrls646: GraphRetrievalMethod
+StreptomycesSpNrrls87: GraphRetrievalMethod
+StreptomycesSpNrrls920: GraphRetrievalMethod
+StreptomycesSpNrrlwc3626: GraphRetrievalMethod
+StreptomycesSpNrrlwc3742: GraphRetrievalMethod
+StreptomycesSpNrrlwc3773: GraphRetrievalMethod
+StreptomycesSpPstaah124: GraphRetrievalMethod
+StreptomycesSpR1ns10: GraphRetrievalMethod
+StreptomycesSpSirexaae: GraphRetrievalMethod
+StreptomycesSpSpb78: GraphRetrievalMethod
+StreptomycesSpTaa040: GraphRetrievalMethod
+StreptomycesSpTaa204: GraphRetrievalMethod
+StreptomycesSpTaa486: GraphRetrievalMethod
+StreptomycesSpUrha0041: GraphRetrievalMethod
+StreptomycesSulphureus: GraphRetrievalMethod
+StreptomycesSviceus: GraphRetrievalMethod
+StreptomycesThermolilacinus: GraphRetrievalMethod
+StreptomycesToyocaensis: GraphRetrievalMethod
+StreptomycesVarsoviensis: GraphRetrievalMethod
+StreptomycesVenezuelae: GraphRetrievalMethod
+StreptomycesViolaceusniger: GraphRetrievalMethod
+StreptomycesViolens: GraphRetrievalMethod
+StreptomycesVirginiae: GraphRetrievalMethod
+StreptomycesViridochromogenes: GraphRetrievalMethod
+StreptomycesViridosporus: GraphRetrievalMethod
+StreptomycesVitaminophilus: GraphRetrievalMethod
+StreptomycesWedmorensis: GraphRetrievalMethod
+StreptomycesXylophagus: GraphRetrievalMethod
+StreptomycesYeochonensis: GraphRetrievalMethod
+StreptosporangiumAmethystogenes: GraphRetrievalMethod
+StreptosporangiumRoseum: GraphRetrievalMethod
+StrigamiaMaritima: GraphRetrievalMethod
+StrongylocentrotusPurpuratus: GraphRetrievalMethod
+StrongyloidesRatti: GraphRetrievalMethod
+SubdoligranulumSp4354a2faa: GraphRetrievalMethod
+SubdoligranulumVariabile: GraphRetrievalMethod
+SuccinatimonasHippei: GraphRetrievalMethod
+SuccinimonasAmylolytica: GraphRetrievalMethod
+SuccinispiraMobilis: GraphRetrievalMethod
+SuccinivibrioDextrinosolvens: GraphRetrievalMethod
+SulfitobacterDonghicola: GraphRetrievalMethod
+SulfitobacterGuttiformis: GraphRetrievalMethod
+SulfitobacterMediterraneus: GraphRetrievalMethod
+SulfitobacterSp20gpm1509m: GraphRetrievalMethod
+SulfitobacterSpEe36: GraphRetrievalMethod
+SulfitobacterSpH3: GraphRetrievalMethod
+SulfitobacterSpMm124: GraphRetrievalMethod
+SulfitobacterSpNb68: GraphRetrievalMethod
+SulfitobacterSpNb77: GraphRetrievalMethod
+SulfobacillusAcidophilus: GraphRetrievalMethod
+SulfolobusAcidocaldarius: GraphRetrievalMethod
+SulfolobusIslandicus: GraphRetrievalMethod
+SulfolobusSolfataricus: GraphRetrievalMethod
+SulfolobusTokodaii: GraphRetrievalMethod
+SulfuricellaDenitrificans: GraphRetrievalMethod
+SulfuricurvumKujiense: GraphRetrievalMethod
+SulfuricurvumSpMlsb: GraphRetrievalMethod
+SulfuricurvumSpRifrc1: GraphRetrievalMethod
+SulfurihydrogenibiumAzorense: GraphRetrievalMethod
+SulfurihydrogenibiumSpYo3aop1: GraphRetrievalMethod
+SulfurihydrogenibiumSubterraneum: GraphRetrievalMethod
+SulfurimonasAutotrophica: GraphRetrievalMethod
+SulfurimonasDenitrificans: GraphRetrievalMethod
+SulfurimonasGotlandica: GraphRetrievalMethod
+SulfurimonasSpAst10: GraphRetrievalMethod
+SulfurospirillumArcachonense: GraphRetrievalMethod
+SulfurospirillumBarnesii: GraphRetrievalMethod
+SulfurospirillumDeleyianum: GraphRetrievalMethod
+SulfurospirillumMultivorans: GraphRetrievalMethod
+SulfurospirillumSpMes: GraphRetrievalMethod
+SulfurospirillumSpScadc: GraphRetrievalMethod
+SulfurovumSpAr: GraphRetrievalMethod
+SulfurovumSpNbc371: GraphRetrievalMethod
+SusScrofa: GraphRetrievalMethod
+SutterellaWadsworthensis2159bfaa: GraphRetrievalMethod
+SutterellaWadsworthensis3145b: GraphRetrievalMethod
+SutterellaWadsworthensisHga0223: GraphRetrievalMethod
+SymbiobacterMobilis: GraphRetrievalMethod
+SymbiobacteriumThermophilum: GraphRetrievalMethod
+SynechococcusElongatusPcc6301: GraphRetrievalMethod
+SynechococcusElongatusPcc7942: GraphRetrievalMethod
+SynechococcusSpBl107: GraphRetrievalMethod
+SynechococcusSpCb0101: GraphRetrievalMethod
+SynechococcusSpCc9311: GraphRetrievalMethod
+SynechococcusSpCc9605: GraphRetrievalMethod
+SynechococcusSpCc9616: GraphRetrievalMethod
+SynechococcusSpCc9902: GraphRetrievalMethod
+SynechococcusSpJa23ba: GraphRetrievalMethod
+SynechococcusSpJa33ab: GraphRetrievalMethod
+SynechococcusSpKordi100: GraphRetrievalMethod
+SynechococcusSpKordi49: GraphRetrievalMethod
+SynechococcusSpKordi52: GraphRetrievalMethod
+SynechococcusSpNkbg15041c: GraphRetrievalMethod
+SynechococcusSpPcc6312: GraphRetrievalMethod
+SynechococcusSpPcc7002: GraphRetrievalMethod
+SynechococcusSpPcc7335: GraphRetrievalMethod
+SynechococcusSpPcc7336: GraphRetrievalMethod
+SynechococcusSpPcc7502: GraphRetrievalMethod
+SynechococcusSpRcc307: GraphRetrievalMethod
+SynechococcusSpRs9916: GraphRetrievalMethod
+SynechococcusSpRs9917: GraphRetrievalMethod
+SynechococcusSpWh5701: GraphRetrievalMethod
+SynechococcusSpWh7803: GraphRetrievalMethod
+SynechococcusSpWh7805: GraphRetrievalMethod
+SynechococcusSpWh8016: GraphRetrievalMethod
+SynechococcusSpWh8102: GraphRetrievalMethod
+SynechococcusSpWh8109: GraphRetrievalMethod
+SynechocystisSpPcc6714: GraphRetrievalMethod
+SynechocystisSpPcc6803: GraphRetrievalMethod
+SynechocystisSpPcc7509: GraphRetrievalMethod
+SynergistesJonesii: GraphRetrievalMethod
+SynergistesSp31syn1: GraphRetrievalMethod
+SyntrophobacterFumaroxidans: GraphRetrievalMethod
+SyntrophobotulusGlycolicus: GraphRetrievalMethod
+SyntrophomonasWolfei: GraphRetrievalMethod
+SyntrophorhabdusAromaticivorans: GraphRetrievalMethod
+SyntrophothermusLipocalidus: GraphRetrievalMethod
+SyntrophusAciditrophicus: GraphRetrievalMethod
+TakifuguRubripes: GraphRetrievalMethod
+TalaromycesMarneffei: GraphRetrievalMethod
+TalaromycesStipitatus: GraphRetrievalMethod
+TannerellaForsythia: GraphRetrievalMethod
+TaphrinaDeformans: GraphRetrievalMethod
+TarenayaHassleriana: GraphRetrievalMethod
+TarsiusSyrichta: GraphRetrievalMethod
+TatumellaMorbirosei: GraphRetrievalMethod
+TatumellaPtyseos: GraphRetrievalMethod
+TatumellaSpNml063099: GraphRetrievalMethod
+TaylorellaAsinigenitalis: GraphRetrievalMethod
+TaylorellaEquigenitalis: GraphRetrievalMethod
+TenacibaculumMaritimum: GraphRetrievalMethod
+TenacibaculumSp47agom205m: GraphRetrievalMethod
+TepidanaerobacterAcetatoxydans: GraphRetrievalMethod
+TepidiphilusMargaritifer: GraphRetrievalMethod
+TerasakiellaPusilla: GraphRetrievalMethod
+TeredinibacterTurneraeT7901: GraphRetrievalMethod
+TeredinibacterTurneraeT7902: GraphRetrievalMethod
+TerracoccusSp273mftsu31: GraphRetrievalMethod
+TerribacillusAidingensis: GraphRetrievalMethod
+TerriglobusRoseus: GraphRetrievalMethod
+TerriglobusSaanensis: GraphRetrievalMethod
+TetragenococcusHalophilus: GraphRetrievalMethod
+TetragenococcusMuriaticus: GraphRetrievalMethod
+TetrahymenaThermophila: GraphRetrievalMethod
+TetranychusUrticae: GraphRetrievalMethod
+TetrapisisporaBlattae: GraphRetrievalMethod
+TetrapisisporaPhaffii: GraphRetrievalMethod
+TetrasphaeraElongata: GraphRetrievalMethod
+ThalassiosiraOceanica: GraphRetrievalMethod
+ThalassiosiraPseudonana: GraphRetrievalMethod
+ThalassobacterArenae: GraphRetrievalMethod
+ThalassobacterStenotrophicus: GraphRetrievalMethod
+ThalassobiumSpR2a62: GraphRetrievalMethod
+ThalassolituusOleivorans: GraphRetrievalMethod
+ThalassospiraAustralica: GraphRetrievalMethod
+ThalassospiraProfundimaris: GraphRetrievalMethod
+ThalassospiraXiamenensis: GraphRetrievalMethod
+ThalassotaleaSpNd16a: GraphRetrievalMethod
+ThaueraLinaloolentis: GraphRetrievalMethod
+ThaueraSp27: GraphRetrievalMethod
+ThaueraSp63: GraphRetrievalMethod
+ThaueraSpMz1t: GraphRetrievalMethod
+ThaueraTerpenica: GraphRetrievalMethod
+ThaumarchaeotaSpScgcAb629i23: GraphRetrievalMethod
+ThecamonasTrahens: GraphRetrievalMethod
+TheileriaAnnulata: GraphRetrievalMethod
+TheileriaOrientalis: GraphRetrievalMethod
+TheileriaParva: GraphRetrievalMethod
+TheobromaCacao: GraphRetrievalMethod
+ThermacetogeniumPhaeum: GraphRetrievalMethod
+ThermaerobacterMarianensis: GraphRetrievalMethod
+ThermaerobacterSubterraneus: GraphRetrievalMethod
+ThermanaerovibrioAcidaminovorans: GraphRetrievalMethod
+ThermanaerovibrioVelox: GraphRetrievalMethod
+ThermicanusAegyptius: GraphRetrievalMethod
+ThermincolaPotens: GraphRetrievalMethod
+ThermithiobacillusTepidarius: GraphRetrievalMethod
+ThermoactinomycesDaqus: GraphRetrievalMethod
+ThermoanaerobacterItalicus: GraphRetrievalMethod
+ThermoanaerobacterKivui: GraphRetrievalMethod
+ThermoanaerobacterPseudethanolicus: GraphRetrievalMethod
+ThermoanaerobacterWiegelii: GraphRetrievalMethod
+ThermoanaerobacteriumSaccharolyticum: GraphRetrievalMethod
+ThermoanaerobacteriumThermosaccharolyticum: GraphRetrievalMethod
+ThermoanaerobacteriumXylanolyticum: GraphRetrievalMethod
+ThermobacillusComposti: GraphRetrievalMethod
+ThermobaculumTerrenum: GraphRetrievalMethod
+ThermobifidaFusca: GraphRetrievalMethod
+ThermobisporaBispora: GraphRetrievalMethod
+ThermobrachiumCelere: GraphRetrievalMethod
+ThermococcusBarophilus: GraphRetrievalMethod
+ThermococcusGammatolerans: GraphRetrievalMethod
+ThermococcusKodakarensis: GraphRetrievalMethod
+ThermococcusNautili: GraphRetrievalMethod
+ThermococcusOnnurineus: GraphRetrievalMethod
+ThermococcusSibiricus: GraphRetrievalMethod
+ThermococcusSp4557: GraphRetrievalMethod
+ThermococcusSpAm4: GraphRetrievalMethod
+ThermococcusZilligii: GraphRetrievalMethod
+ThermocrinisAlbus: GraphRetrievalMethod
+ThermocrinisRuber: GraphRetrievalMethod
+ThermocrinisSpGbs: GraphRetrievalMethod
+ThermodesulfatatorAtlanticus: GraphRetrievalMethod
+ThermodesulfatatorIndicus: GraphRetrievalMethod
+ThermodesulfobacteriumCommune: GraphRetrievalMethod
+ThermodesulfobacteriumGeofontis: GraphRetrievalMethod
+ThermodesulfobacteriumHveragerdense: GraphRetrievalMethod
+ThermodesulfobacteriumHydrogeniphilum: GraphRetrievalMethod
+ThermodesulfobacteriumThermophilum: GraphRetrievalMethod
+ThermodesulfobiumNarugense: GraphRetrievalMethod
+ThermodesulfovibrioThiophilus: GraphRetrievalMethod
+ThermodesulfovibrioYellowstonii: GraphRetrievalMethod
+ThermofilumPendens: GraphRetrievalMethod
+ThermofilumSp1910b: GraphRetrievalMethod
+ThermogemmatisporaSpPm5: GraphRetrievalMethod
+ThermogladiusCellulolyticus: GraphRetrievalMethod
+ThermomicrobialesSpKi4: GraphRetrievalMethod
+ThermomicrobiumRoseum: GraphRetrievalMethod
+ThermomonasFusca: GraphRetrievalMethod
+ThermomonosporaCurvata: GraphRetrievalMethod
+ThermonemaRossianum: GraphRetrievalMethod
+ThermophagusXiamenensis: GraphRetrievalMethod
+ThermoplasmaAcidophilum: GraphRetrievalMethod
+ThermoplasmaVolcanium: GraphRetrievalMethod
+ThermoplasmatalesArchaeon: GraphRetrievalMethod
+ThermoproteusTenax: GraphRetrievalMethod
+ThermoproteusUzoniensis: GraphRetrievalMethod
+ThermosediminibacterOceani: GraphRetrievalMethod
+ThermosinusCarboxydivorans: GraphRetrievalMethod
+ThermosiphoAfricanus: GraphRetrievalMethod
+ThermosiphoMelanesiensis: GraphRetrievalMethod
+ThermosphaeraAggregans: GraphRetrievalMethod
+ThermosynechococcusElongatus: GraphRetrievalMethod
+ThermotogaHypogea: GraphRetrievalMethod
+ThermotogaLettingae: GraphRetrievalMethod
+ThermotogaMaritima: GraphRetrievalMethod
+ThermotogaNeapolitana: GraphRetrievalMethod
+ThermotogaPetrophila: GraphRetrievalMethod
+ThermotogaSpMc24: GraphRetrievalMethod
+ThermotogaThermarum: GraphRetrievalMethod
+ThermovibrioAmmonificans: GraphRetrievalMethod
+ThermovirgaLienii: GraphRetrievalMethod
+ThermusAntranikianii: GraphRetrievalMethod
+ThermusAquaticus: GraphRetrievalMethod
+ThermusCaliditerrae: GraphRetrievalMethod
+ThermusIgniterrae: GraphRetrievalMethod
+ThermusIslandicus: GraphRetrievalMethod
+ThermusOshimai: GraphRetrievalMethod
+ThermusScotoductus: GraphRetrievalMethod
+ThermusSpCcbus3uf1: GraphRetrievalMethod
+ThermusSpYim77409: GraphRetrievalMethod
+ThermusTengchongensis: GraphRetrievalMethod
+ThermusThermophilusHb27: GraphRetrievalMethod
+ThermusThermophilusHb8: GraphRetrievalMethod
+ThielaviaTerrestris: GraphRetrievalMethod
+ThioalkalimicrobiumAerophilum: GraphRetrievalMethod
+ThioalkalimicrobiumCyclicum: GraphRetrievalMethod
+ThioalkalivibrioNitratireducens: GraphRetrievalMethod
+ThioalkalivibrioSpAkl11: GraphRetrievalMethod
+ThioalkalivibrioSpAkl19: GraphRetrievalMethod
+ThioalkalivibrioSpAld1: GraphRetrievalMethod
+ThioalkalivibrioSpAle19: GraphRetrievalMethod
+ThioalkalivibrioSpAle31: GraphRetrievalMethod
+ThioalkalivibrioSpAle6: GraphRetrievalMethod
+ThioalkalivibrioSpAlj11: GraphRetrievalMethod
+ThioalkalivibrioSpAlj16: GraphRetrievalMethod
+ThioalkalivibrioSpAlj24: GraphRetrievalMethod
+ThioalkalivibrioSpAlj7: GraphRetrievalMethod
+ThioalkalivibrioSpAljt: GraphRetrievalMethod
+ThioalkalivibrioSpAlmg11: GraphRetrievalMethod
+ThioalkalivibrioSpAlr1721: GraphRetrievalMethod
+ThioalkalivibrioSpAlsr1: GraphRetrievalMethod
+ThioalkalivibrioSpHk1: GraphRetrievalMethod
+ThioalkalivibrioSpK90mix: GraphRetrievalMethod
+ThioalkalivibrioSulfidiphilus: GraphRetrievalMethod
+ThioalkalivibrioThiocyanodenitrificans: GraphRetrievalMethod
+ThioalkalivibrioThiocyanoxidansArh2: GraphRetrievalMethod
+ThioalkalivibrioThiocyanoxidansArh4: GraphRetrievalMethod
+ThiobacillusDenitrificansAtcc25259: GraphRetrievalMethod
+ThiobacillusDenitrificansDsm12475: GraphRetrievalMethod
+ThiobacillusThioparus: GraphRetrievalMethod
+ThiocapsaMarina: GraphRetrievalMethod
+ThioclavaDalianensis: GraphRetrievalMethod
+ThioclavaPacifica: GraphRetrievalMethod
+ThioclavaSp13d2w2: GraphRetrievalMethod
+ThioclavaSpDt234: GraphRetrievalMethod
+ThiocystisViolascens: GraphRetrievalMethod
+ThioflavicoccusMobilis: GraphRetrievalMethod
+ThiomicrospiraArctica: GraphRetrievalMethod
+ThiomicrospiraCrunogena: GraphRetrievalMethod
+ThiomicrospiraKuenenii: GraphRetrievalMethod
+ThiomicrospiraPelophila: GraphRetrievalMethod
+ThiomicrospiraSpKp2: GraphRetrievalMethod
+ThiomicrospiraSpMilost1: GraphRetrievalMethod
+ThiomicrospiraSpMilost2: GraphRetrievalMethod
+ThiomonasArsenitoxydans: GraphRetrievalMethod
+ThiomonasIntermedia: GraphRetrievalMethod
+ThiomonasSpFbcd: GraphRetrievalMethod
+ThiorhodococcusDrewsii: GraphRetrievalMethod
+ThiorhodococcusSpAk35: GraphRetrievalMethod
+ThiorhodospiraSibirica: GraphRetrievalMethod
+ThiorhodovibrioSp970: GraphRetrievalMethod
+ThiothrixDisciformis: GraphRetrievalMethod
+ThiothrixFlexilis: GraphRetrievalMethod
+ThiothrixLacustris: GraphRetrievalMethod
+ThiothrixNivea: GraphRetrievalMethod
+TimonellaSenegalensis: GraphRetrievalMethod
+TistrellaMobilis: GraphRetrievalMethod
+TogniniaMinima: GraphRetrievalMethod
+TolumonasAuensis: GraphRetrievalMethod
+TolumonasSpBrl61: GraphRetrievalMethod
+TomitellaBiformata: GraphRetrievalMethod
+TorulasporaDelbrueckii: GraphRetrievalMethod
+ToxoplasmaGondii: GraphRetrievalMethod
+TrabulsiellaGuamensis: GraphRetrievalMethod
+TremellaMesenterica: GraphRetrievalMethod
+TreponemaAzotonutricium: GraphRetrievalMethod
+TreponemaBrennaborense: GraphRetrievalMethod
+TreponemaBryantii: GraphRetrievalMethod
+TreponemaCaldaria: GraphRetrievalMethod
+TreponemaDenticola: GraphRetrievalMethod
+TreponemaLecithinolyticum: GraphRetrievalMethod
+TreponemaMaltophilum: GraphRetrievalMethod
+TreponemaMedium: GraphRetrievalMethod
+TreponemaPallidum: GraphRetrievalMethod
+TreponemaPhagedenis: GraphRetrievalMethod
+TreponemaPrimitiaZas2: GraphRetrievalMethod
+TreponemaPutidum: GraphRetrievalMethod
+TreponemaSaccharophilum: GraphRetrievalMethod
+TreponemaSocranskiiParedis: GraphRetrievalMethod
+TreponemaSocranskiiVpidr56br1116: GraphRetrievalMethod
+TreponemaSpC6a8: GraphRetrievalMethod
+TreponemaSpJc4: GraphRetrievalMethod
+TreponemaSpOmz838: GraphRetrievalMethod
+TreponemaSuccinifaciens: GraphRetrievalMethod
+TreponemaVincentii: GraphRetrievalMethod
+TriboliumCastaneum: GraphRetrievalMethod
+TrichechusManatus: GraphRetrievalMethod
+TrichinellaSpiralis: GraphRetrievalMethod
+TrichodermaAtroviride: GraphRetrievalMethod
+TrichodermaReesei: GraphRetrievalMethod
+TrichodermaVirens: GraphRetrievalMethod
+TrichodesmiumErythraeum: GraphRetrievalMethod
+TrichomonasVaginalis: GraphRetrievalMethod
+TrichophytonEquinum: GraphRetrievalMethod
+TrichophytonRubrum: GraphRetrievalMethod
+TrichoplaxAdhaerens: GraphRetrievalMethod
+TrichosporonAsahii: GraphRetrievalMethod
+TriticumAestivum: GraphRetrievalMethod
+TriticumUrartu: GraphRetrievalMethod
+TropherymaWhipplei: GraphRetrievalMethod
+TrueperaRadiovictrix: GraphRetrievalMethod
+TrypanosomaBrucei: GraphRetrievalMethod
+TrypanosomaCruzi: GraphRetrievalMethod
+TsukamurellaPaurometabola: GraphRetrievalMethod
+TsukamurellaSp1534: GraphRetrievalMethod
+TuberMelanosporum: GraphRetrievalMethod
+TuberibacillusCalidus: GraphRetrievalMethod
+TumebacillusFlagellatus: GraphRetrievalMethod
+TupaiaChinensis: GraphRetrievalMethod
+TuricellaOtitidis: GraphRetrievalMethod
+TuricibacterSanguinis: GraphRetrievalMethod
+TursiopsTruncatus: GraphRetrievalMethod
+TyzzerellaNexilis: GraphRetrievalMethod
+UliginosibacteriumGangwonense: GraphRetrievalMethod
+UncinocarpusReesii: GraphRetrievalMethod
+UreaplasmaDiversum: GraphRetrievalMethod
+UreaplasmaParvum: GraphRetrievalMethod
+UreaplasmaUrealyticum: GraphRetrievalMethod
+UreibacillusThermosphaericus: GraphRetrievalMethod
+UrsusMaritimus: GraphRetrievalMethod
+UstilagoHordei: GraphRetrievalMethod
+UstilagoMaydis: GraphRetrievalMethod
+VagococcusLutrae: GraphRetrievalMethod
+VanderwaltozymaPolyspora: GraphRetrievalMethod
+VaribaculumCambrienseDora20: GraphRetrievalMethod
+VaribaculumCambrienseDsm15806: GraphRetrievalMethod
+VariovoraxParadoxus110b: GraphRetrievalMethod
+VariovoraxParadoxusEps: GraphRetrievalMethod
+VariovoraxParadoxusS110: GraphRetrievalMethod
+VeillonellaAtypicaAcs049vsch6: GraphRetrievalMethod
+VeillonellaAtypicaKon: GraphRetrievalMethod
+VeillonellaDispar: GraphRetrievalMethod
+VeillonellaMagna: GraphRetrievalMethod
+VeillonellaMontpellierensis: GraphRetrievalMethod
+VeillonellaParvula: GraphRetrievalMethod
+VeillonellaRatti: GraphRetrievalMethod
+VeillonellaSpAs16: GraphRetrievalMethod
+VeillonellaSpF0412: GraphRetrievalMethod
+VeillonellaSpF0422: GraphRetrievalMethod
+VerminephrobacterEiseniae: GraphRetrievalMethod
+VerrucomicrobiaBacteriumLp2a: GraphRetrievalMethod
+VerrucomicrobiaeBacteriumDg1235: GraphRetrievalMethod
+VerrucomicrobiumSpBvorr034: GraphRetrievalMethod
+VerrucomicrobiumSpBvorr106: GraphRetrievalMethod
+VerrucomicrobiumSpinosum: GraphRetrievalMethod
+VerrucosisporaMaris: GraphRetrievalMethod
+VerticilliumAlfalfae: GraphRetrievalMethod
+VerticilliumDahliae: GraphRetrievalMethod
+VesicomyosociusOkutanii: GraphRetrievalMethod
+VibrioAlginolyticus40b: GraphRetrievalMethod
+VibrioAlginolyticusNbrc15630: GraphRetrievalMethod
+VibrioAnguillarum: GraphRetrievalMethod
+VibrioAzureus: GraphRetrievalMethod
+VibrioBrasiliensis: GraphRetrievalMethod
+VibrioBreoganii: GraphRetrievalMethod
+VibrioCaribbeanicus: GraphRetrievalMethod
+VibrioCholeraeO1: GraphRetrievalMethod
+VibrioCholeraeO395: GraphRetrievalMethod
+VibrioCoralliilyticus: GraphRetrievalMethod
+VibrioCyclitrophicus: GraphRetrievalMethod
+VibrioDiazotrophicus: GraphRetrievalMethod
+VibrioEzurae: GraphRetrievalMethod
+VibrioFischeri: GraphRetrievalMethod
+VibrioGenomosp: GraphRetrievalMethod
+VibrioHalioticoli: GraphRetrievalMethod
+VibrioJasicida: GraphRetrievalMethod
+VibrioKanaloae: GraphRetrievalMethod
+VibrioMetschnikovii: GraphRetrievalMethod
+VibrioMimicus: GraphRetrievalMethod
+VibrioNavarrensis: GraphRetrievalMethod
+VibrioNigripulchritudo: GraphRetrievalMethod
+VibrioOrientalis: GraphRetrievalMethod
+VibrioParahaemolyticus: GraphRetrievalMethod
+VibrioProteolyticus: GraphRetrievalMethod
+VibrioRumoiensis: GraphRetrievalMethod
+VibrioScophthalmi: GraphRetrievalMethod
+VibrioSinaloensis: GraphRetrievalMethod
+VibrioSpEjy3: GraphRetrievalMethod
+VibrioSpEr1a: GraphRetrievalMethod
+VibrioSpN418: GraphRetrievalMethod
+VibrioSpRc586: GraphRetrievalMethod
+VibrioSplendidus: GraphRetrievalMethod
+VibrioTasmaniensis: GraphRetrievalMethod
+VibrioTubiashii: GraphRetrievalMethod
+VibrioVulnificus: GraphRetrievalMethod
+VirgibacillusAlimentarius: GraphRetrievalMethod
+VirgibacillusHalodenitrificans: GraphRetrievalMethod
+VirgibacillusSpVm5: GraphRetrievalMethod
+ViridibacillusArenosi: GraphRetrievalMethod
+VitisVinifera: GraphRetrievalMethod
+VitreoscillaStercoraria: GraphRetrievalMethod
+VolvoxCarteri: GraphRetrievalMethod
+VulcanisaetaDistributa: GraphRetrievalMethod
+VulcanisaetaMoutnovskia: GraphRetrievalMethod
+WaddliaChondrophila: GraphRetrievalMethod
+WallemiaIchthyophaga: GraphRetrievalMethod
+WallemiaSebi: GraphRetrievalMethod
+WeeksellaSpFf8: GraphRetrievalMethod
+WeeksellaVirosa: GraphRetrievalMethod
+WeissellaCibaria: GraphRetrievalMethod
+WeissellaConfusa: GraphRetrievalMethod
+WeissellaHalotolerans: GraphRetrievalMethod
+WeissellaHellenica: GraphRetrievalMethod
+WeissellaKoreensis: GraphRetrievalMethod
+WeissellaOryzae: GraphRetrievalMethod
+WeissellaParamesenteroides: GraphRetrievalMethod
+WenxiniaMarina: GraphRetrievalMethod
+WickerhamomycesCiferrii: GraphRetrievalMethod
+WigglesworthiaGlossinidiaSpGbr: GraphRetrievalMethod
+WigglesworthiaGlossinidiaSpGmo: GraphRetrievalMethod
+WinogradskyellaPsychrotolerans: GraphRetrievalMethod
+WohlfahrtiimonasChitiniclastica: GraphRetrievalMethod
+WolbachiaSpBma: GraphRetrievalMethod
+WolbachiaSpCulex: GraphRetrievalMethod
+WolbachiaSpDme: GraphRetrievalMethod
+WolbachiaSpDsi: GraphRetrievalMethod
+WolbachiaSpOoc: GraphRetrievalMethod
+WolinellaSuccinogenes: GraphRetrievalMethod
+WoodsholeaMaritima: GraphRetrievalMethod
+XanthobacterAutotrophicus: GraphRetrievalMethod
+XanthobacterSp126: GraphRetrievalMethod
+XanthobacteraceaeBacterium501b: GraphRetrievalMethod
+XanthomonasAlbilineans: GraphRetrievalMethod
+XanthomonasArboricola: GraphRetrievalMethod
+XanthomonasAxonopodisCitri: GraphRetrievalMethod
+XanthomonasAxonopodisPhaseoli: GraphRetrievalMethod
+XanthomonasAxonopodisVasculorum: GraphRetrievalMethod
+XanthomonasCampestrisCampestris: GraphRetrievalMethod
+XanthomonasCampestrisMusacearum: GraphRetrievalMethod
+XanthomonasCampestrisVesicatoria: GraphRetrievalMethod
+XanthomonasCassavae: GraphRetrievalMethod
+XanthomonasFragariae: GraphRetrievalMethod
+XanthomonasFuscans: GraphRetrievalMethod
+XanthomonasHortorum: GraphRetrievalMethod
+XanthomonasOryzaeOryzicola: GraphRetrievalMethod
+XanthomonasOryzaePxo99a: GraphRetrievalMethod
+XanthomonasSpNyagatare: GraphRetrievalMethod
+XanthomonasTranslucens: GraphRetrievalMethod
+XanthomonasVesicatoria: GraphRetrievalMethod
+XenococcusSpPcc7305: GraphRetrievalMethod
+XenophilusAzovorans: GraphRetrievalMethod
+XenopusTropicalis: GraphRetrievalMethod
+XenorhabdusBovienii: GraphRetrievalMethod
+XenorhabdusNematophila: GraphRetrievalMethod
+XiphophorusMaculatus: GraphRetrievalMethod
+XylanimonasCellulosilytica: GraphRetrievalMethod
+XylellaFastidiosa9a5c: GraphRetrievalMethod
+XylellaFastidiosaPls229: GraphRetrievalMethod
+YaniellaHalotolerans: GraphRetrievalMethod
+YarrowiaLipolytica: GraphRetrievalMethod
+YersiniaAldovae: GraphRetrievalMethod
+YersiniaEnterocolitica8081: GraphRetrievalMethod
+YersiniaEnterocoliticaLc20: GraphRetrievalMethod
+YersiniaFrederiksenii: GraphRetrievalMethod
+YersiniaIntermedia: GraphRetrievalMethod
+YersiniaKristensenii: GraphRetrievalMethod
+YersiniaMassiliensis: GraphRetrievalMethod
+YersiniaPestisCo92: GraphRetrievalMethod
+YersiniaPseudotuberculosis: GraphRetrievalMethod
+YersiniaRuckeri: GraphRetrievalMethod
+YoungiibacterFragilis: GraphRetrievalMethod
+ZavarzinellaFormosa: GraphRetrievalMethod
+ZeaMays: GraphRetrievalMethod
+ZetaproteobacteriaBacteriumTag1: GraphRetrievalMethod
+ZhouiaAmylolytica: GraphRetrievalMethod
+ZimmermannellaFaecalis: GraphRetrievalMethod
+ZobelliaUliginosa: GraphRetrievalMethod
+ZootermopsisNevadensis: GraphRetrievalMethod
+ZunongwangiaProfunda: GraphRetrievalMethod
+ZygosaccharomycesRouxii: GraphRetrievalMethod
+ZymomonasMobilisAtcc10988: GraphRetrievalMethod
+ZymomonasMobilisPomaceae: GraphRetrievalMethod
+ZymomonasMobilisZm4: GraphRetrievalMethod
+ZymophilusRaffinosivorans: GraphRetrievalMethod
+ZymoseptoriaTritici: GraphRetrievalMethod
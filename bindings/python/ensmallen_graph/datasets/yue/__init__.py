@@ -1,5 +1,7 @@
 """This sub-module offers methods to automatically retrieve the graphs from Yue repository."""
+from typing import Dict, List, TYPE_CHECKING
 
+from ..parallel_graph_retrieval import load_many_graphs, prefetch_graphs
 from .stringppi import StringPPI
 from .ctddda import CTDDDA
 from .drugbankddi import DrugBankDDI
@@ -8,7 +10,84 @@ from .mashupppi import MashupPPI
 from .node2vecppi import node2vecPPI
 from .clintermcooc import ClinTermCOOC
 
+if TYPE_CHECKING:
+    from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = None,
+    **kwargs: Dict
+) -> Dict[str, "EnsmallenGraph"]:
+    """Return dictionary with the requested graphs, retrieved in parallel.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to retrieve, for instance `["StringPPI"]`.
+    max_workers: int = None,
+        Number of threads to use.
+        By default, one per graph up to the number of available CPUs.
+    **kwargs: Dict,
+        The kwargs to pass to each graph retrieval method.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+
+    Returns
+    -------------------
+    Dictionary with the retrieved graphs, by graph name.
+    """
+    return load_many_graphs(
+        {
+            graph_name: globals()[graph_name]
+            for graph_name in __all__
+        },
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = 6,
+    **kwargs: Dict
+):
+    """Download the files of the requested graphs in parallel.
+
+    The graphs are not built: the following calls to their retrieval
+    methods will find their files already in the cache path.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to download, for instance `["StringPPI"]`.
+    max_workers: int = 6,
+        Number of concurrent downloads.
+    **kwargs: Dict,
+        The kwargs to pass to each graph download, such as the cache path.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+    """
+    prefetch_graphs(
+        "yue",
+        AVAILABLE_GRAPHS,
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
 __all__ = [
 	"StringPPI", "CTDDDA", "DrugBankDDI", "NDFRTDDA", "MashupPPI", "node2vecPPI",
 	"ClinTermCOOC",
-]
\ No newline at end of file
+]
+
+# Names of the graphs available in this sub-module.
+AVAILABLE_GRAPHS = frozenset(__all__)
@@ -0,0 +1,84 @@
+"""Fixtures to test the automatic retrieval of graphs, without downloading or building them.
+
+The downloader and the compiled extension are replaced by stubs counting
+the downloads and the built graphs.
+"""
+import sys
+import threading
+import time
+import types
+import pytest
+from ensmallen_graph.datasets import automatic_graph_retrieval, clear_cache
+
+
+class FakeGraph:
+    """Graph returned by the stubbed extension."""
+
+
+class FakeExtension:
+    """Stub of the compiled extension, recording the built graphs."""
+
+    def __init__(self):
+        self.built = []
+        self.delay = 0
+        self.failures = 0
+        self.lock = threading.Lock()
+        self.building = 0
+        self.max_building = 0
+
+    def from_unsorted_csv(self, **kwargs):
+        with self.lock:
+            self.building += 1
+            self.max_building = max(self.max_building, self.building)
+        try:
+            time.sleep(self.delay)
+            with self.lock:
+                if self.failures > 0:
+                    self.failures -= 1
+                    raise RuntimeError("Unable to build the graph.")
+                self.built.append(kwargs)
+            return FakeGraph()
+        finally:
+            with self.lock:
+                self.building -= 1
+
+
+@pytest.fixture
+def extension(monkeypatch):
+    """Return the stubbed extension, with an empty in-memory cache."""
+    extension = FakeExtension()
+    module = types.ModuleType("ensmallen_graph.ensmallen_graph")
+    module.EnsmallenGraph = types.SimpleNamespace(
+        from_unsorted_csv=extension.from_unsorted_csv
+    )
+    monkeypatch.setitem(sys.modules, "ensmallen_graph.ensmallen_graph", module)
+    clear_cache()
+    yield extension
+    clear_cache()
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Return the list of the stubbed downloads, to be filled by them."""
+    downloads = []
+    monkeypatch.setattr(
+        automatic_graph_retrieval.BaseDownloader,
+        "download",
+        lambda self, urls, paths: downloads.append(urls)
+    )
+    monkeypatch.setattr(automatic_graph_retrieval, "DOWNLOAD_RETRY_DELAY", 0)
+    return downloads
+
+
+@pytest.fixture
+def retrieve(extension, downloads, tmp_path):
+    """Return function retrieving the requested STRING graph with the stubs."""
+    def retrieve(graph_name="HomoSapiens", cache_path=tmp_path, **kwargs):
+        return automatic_graph_retrieval.AutomaticallyRetrievedGraph(
+            graph_name=graph_name,
+            dataset="string",
+            verbose=0,
+            cache_path=str(cache_path),
+            **kwargs
+        )()
+    return retrieve
@@ -0,0 +1,21 @@
+"""Test the names of the graphs available in the dataset sub-modules."""
+import pytest
+from ensmallen_graph.datasets import kghub, linqs, networkrepository, string, yue
+
+
+@pytest.mark.parametrize("dataset", [kghub, linqs, networkrepository, string, yue])
+def test_available_graphs(dataset):
+    """Test that every available graph can be retrieved from its sub-module."""
+    assert isinstance(dataset.AVAILABLE_GRAPHS, frozenset)
+    assert dataset.AVAILABLE_GRAPHS == frozenset(dataset.__all__)
+    for graph_name in sorted(dataset.AVAILABLE_GRAPHS)[:10]:
+        assert graph_name in dir(dataset)
+        assert callable(getattr(dataset, graph_name))
+
+
+def test_unavailable_graph():
+    """Test that unavailable graphs are missing attributes."""
+    assert "NotAGraph" not in string.AVAILABLE_GRAPHS
+    assert not hasattr(string, "NotAGraph")
+    with pytest.raises(AttributeError):
+        string.NotAGraph  # pylint: disable=pointless-statement
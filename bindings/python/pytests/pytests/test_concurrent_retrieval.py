@@ -0,0 +1,53 @@
+"""Test that graphs requested concurrently are built once."""
+import threading
+import pytest
+from ensmallen_graph.datasets import automatic_graph_retrieval
+
+
+def retrieve_concurrently(retrieve, threads_number):
+    """Return the graphs retrieved by the given number of threads."""
+    graphs = []
+
+    def target():
+        try:
+            graphs.append(retrieve())
+        except RuntimeError:
+            pass
+
+    threads = [threading.Thread(target=target) for _ in range(threads_number)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return graphs
+
+
+def test_concurrent_retrieval(extension, retrieve):
+    """Test that a graph requested concurrently is built once."""
+    extension.delay = 0.1
+    graphs = retrieve_concurrently(retrieve, 8)
+    assert len(graphs) == 8
+    assert all(graph is graphs[0] for graph in graphs)
+    assert len(extension.built) == 1
+
+
+def test_failed_retrieval(extension, retrieve):
+    """Test that a failed build does not block the following requests."""
+    extension.failures = 1
+    with pytest.raises(RuntimeError):
+        retrieve()
+    assert not automatic_graph_retrieval._retrieving_graphs_locks
+    retrieve()
+    assert len(extension.built) == 1
+    assert not automatic_graph_retrieval._retrieving_graphs_locks
+
+
+def test_concurrent_failed_retrieval(extension, retrieve):
+    """Test that the requests waiting for a failed build build the graph once."""
+    extension.delay = 0.1
+    extension.failures = 1
+    graphs = retrieve_concurrently(retrieve, 6)
+    assert len(graphs) == 5
+    assert all(graph is graphs[0] for graph in graphs)
+    assert len(extension.built) == 1
+    assert extension.max_building == 1
@@ -0,0 +1,66 @@
+"""Test the download of the graph files into the cache path."""
+import os
+import pytest
+import requests
+from ensmallen_graph.datasets import automatic_graph_retrieval
+
+
+@pytest.fixture
+def attempts(monkeypatch):
+    """Return the list of the download attempts and the errors they raise."""
+    attempts = []
+    errors = []
+
+    def download(self, urls, paths):
+        attempts.append(self._target_directory)
+        if errors:
+            with open(os.path.join(self._target_directory, "partial"), "w") as f:
+                f.write("partial")
+            raise errors.pop(0)
+        for path in paths:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("complete")
+
+    monkeypatch.setattr(automatic_graph_retrieval.BaseDownloader, "download", download)
+    return attempts, errors
+
+
+def test_download_retries(retrieve, attempts, tmp_path):
+    """Test that only the transient download errors are retried."""
+    attempts, errors = attempts
+    errors.extend([requests.ConnectionError(), requests.Timeout()])
+    retrieve(cache_path=tmp_path / "transient")
+    assert len(attempts) == 3
+    attempts.clear()
+    errors.extend([requests.ConnectionError()] * 3)
+    with pytest.raises(requests.ConnectionError):
+        retrieve(cache_path=tmp_path / "unavailable")
+    assert len(attempts) == automatic_graph_retrieval.DOWNLOAD_ATTEMPTS
+    attempts.clear()
+    errors.append(ValueError("Not found."))
+    with pytest.raises(ValueError):
+        retrieve(cache_path=tmp_path / "missing")
+    assert len(attempts) == 1
+
+
+def test_complete_download(retrieve, attempts, tmp_path):
+    """Test that the files appear in the cache path once downloaded."""
+    attempts, _ = attempts
+    retrieve()
+    retrieve(cache=False)
+    assert len(attempts) == 1
+    assert os.listdir(tmp_path) == ["HomoSapiens"]
+    assert not os.path.exists(os.path.join(tmp_path, "HomoSapiens", "partial"))
+
+
+def test_failed_download(retrieve, attempts, tmp_path):
+    """Test that a failed download leaves nothing in the cache path."""
+    attempts, errors = attempts
+    errors.append(ValueError("Not found."))
+    with pytest.raises(ValueError):
+        retrieve()
+    assert os.listdir(tmp_path) == []
+    retrieve()
+    assert len(attempts) == 2
+    assert os.listdir(tmp_path) == ["HomoSapiens"]
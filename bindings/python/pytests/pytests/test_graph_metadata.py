@@ -0,0 +1,42 @@
+"""Test the statistics of the graphs parsed from their reports."""
+from ensmallen_graph.datasets import GraphMetadata, string
+
+
+def test_graph_metadata():
+    """Test that the graph report is parsed into typed statistics."""
+    metadata = string.HomoSapiens.metadata
+    assert isinstance(metadata, GraphMetadata)
+    assert isinstance(metadata.name, str)
+    assert isinstance(metadata.directed, bool)
+    assert isinstance(metadata.nodes_number, int)
+    assert metadata.nodes_number > 0
+    assert isinstance(metadata.density, float)
+
+
+def test_report_parsing():
+    """Test that the report values are converted to the fields types."""
+    report = {
+        "name": "Graph",
+        "directed": "false",
+        "has_weights": "true",
+        "has_node_types": "false",
+        "has_edge_types": "false",
+        "nodes_number": "3",
+        "edges_number": "4",
+        "undirected_edges_number": "2",
+        "unique_node_types_number": "0",
+        "unique_edge_types_number": "0",
+        "self_loops_number": "0",
+        "self_loops_rate": "0.0",
+        "singletons": "1",
+        "min_degree": "0",
+        "max_degree": "2",
+        "degree_mean": "1.3",
+        "density": "0.6",
+        "ignored_statistic": "1",
+    }
+    metadata = GraphMetadata.from_report(report)
+    assert metadata.directed is False
+    assert metadata.has_weights is True
+    assert metadata.nodes_number == 3
+    assert metadata.degree_mean == 1.3
@@ -0,0 +1,66 @@
+"""Test the in-memory cache of the retrieved graphs."""
+import gc
+from ensmallen_graph.datasets import automatic_graph_retrieval, clear_cache, string
+
+
+def test_cache_hit(extension, retrieve):
+    """Test that graphs still referenced are returned again."""
+    graph = retrieve()
+    assert retrieve() is graph
+    assert len(extension.built) == 1
+
+
+def test_cache_miss(extension, retrieve, tmp_path):
+    """Test that graphs are built again when requested differently."""
+    graph = retrieve()
+    assert retrieve(directed=True) is not graph
+    assert retrieve(cache_path=tmp_path / "other") is not graph
+    assert retrieve(graph_name="MusMusculus") is not graph
+    assert len(extension.built) == 4
+
+
+def test_clear_cache(extension, retrieve):
+    """Test that clearing the cache builds the graphs again."""
+    graph = retrieve()
+    other_graph = retrieve(graph_name="MusMusculus")
+    clear_cache()
+    assert retrieve() is not graph
+    assert retrieve(graph_name="MusMusculus") is not other_graph
+    assert len(extension.built) == 4
+
+
+def test_released_graphs(extension, retrieve, monkeypatch):
+    """Test that only the recently used graphs outlive their references."""
+    retrieve()
+    gc.collect()
+    retrieve()
+    assert len(extension.built) == 2
+    monkeypatch.setattr(automatic_graph_retrieval, "RETRIEVED_GRAPHS_CACHE_SIZE", 1)
+    graph_id = id(retrieve())
+    gc.collect()
+    assert id(retrieve()) == graph_id
+    retrieve(graph_name="MusMusculus")
+    gc.collect()
+    retrieve()
+    assert len(extension.built) == 5
+
+
+def test_uncached_retrieval(extension, retrieve):
+    """Test that disabling the cache builds a new graph on every call."""
+    graph = retrieve()
+    assert retrieve(cache=False) is not graph
+    assert retrieve(cache=False) is not graph
+    assert retrieve() is graph
+    assert len(extension.built) == 3
+
+
+def test_graph_cache_clear(extension, retrieve):
+    """Test that clearing the cache of a graph leaves the other graphs."""
+    graph = retrieve()
+    other_graph = retrieve(graph_name="MusMusculus")
+    string.HomoSapiens.cache_clear()
+    assert retrieve() is not graph
+    assert retrieve(graph_name="MusMusculus") is other_graph
+    clear_cache(graph_name="MusMusculus", dataset="string")
+    assert retrieve(graph_name="MusMusculus") is not other_graph
+    assert len(extension.built) == 4
@@ -0,0 +1,34 @@
+"""Test the retrieval of several graphs in parallel."""
+import pytest
+from ensmallen_graph.datasets import string
+
+
+def test_load_many(extension, downloads, tmp_path):
+    """Test that the requested graphs are retrieved."""
+    graph_retrieval_method = string.HomoSapiens
+    graphs = string.load_many(
+        ["HomoSapiens", "MusMusculus"],
+        cache_path=str(tmp_path)
+    )
+    assert set(graphs) == {"HomoSapiens", "MusMusculus"}
+    assert len(extension.built) == 2
+    assert string.HomoSapiens is graph_retrieval_method
+
+
+def test_load_unavailable_graph(extension, downloads, tmp_path):
+    """Test that unavailable graphs are rejected before retrieving any graph."""
+    with pytest.raises(ValueError):
+        string.load_many(["HomoSapiens", "NotAGraph"], cache_path=str(tmp_path))
+    assert not extension.built
+    assert not downloads
+
+
+def test_load_repeated_graphs(extension, downloads, tmp_path):
+    """Test that graphs requested more than once are retrieved once."""
+    graphs = string.load_many(
+        ["HomoSapiens", "MusMusculus", "HomoSapiens"],
+        cache_path=str(tmp_path),
+        cache=False
+    )
+    assert set(graphs) == {"HomoSapiens", "MusMusculus"}
+    assert len(extension.built) == 2
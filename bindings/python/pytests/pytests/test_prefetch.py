@@ -0,0 +1,27 @@
+"""Test the download of several graphs in parallel without building them."""
+import pytest
+from ensmallen_graph.datasets import linqs, string
+
+
+def test_prefetch(extension, downloads, tmp_path):
+    """Test that prefetching downloads the graphs without building them."""
+    string.prefetch(
+        ["HomoSapiens", "MusMusculus", "HomoSapiens"],
+        cache_path=str(tmp_path)
+    )
+    assert len(downloads) == 2
+    assert not extension.built
+
+
+def test_prefetch_without_callbacks(extension, downloads, tmp_path):
+    """Test that prefetching graphs with callbacks only downloads them."""
+    linqs.prefetch(["Cora"], cache_path=str(tmp_path))
+    assert len(downloads) == 1
+    assert not extension.built
+
+
+def test_prefetch_unavailable_graph(extension, downloads, tmp_path):
+    """Test that unavailable graphs are rejected before downloading any graph."""
+    with pytest.raises(ValueError):
+        string.prefetch(["HomoSapiens", "NotAGraph"], cache_path=str(tmp_path))
+    assert not downloads
@@ -0,0 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+from .utils import load_hpo, load_pathway
+
+
+def test_threaded_loading():
+    """Test that graphs built concurrently match the sequentially built ones.
+
+    The CSV parsing releases the GIL, so the graphs are actually built in
+    parallel by the threads.
+    """
+    loaders = [load_hpo, load_pathway] * 4
+    expected = [loader() for loader in loaders]
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        graphs = list(executor.map(lambda loader: loader(), loaders))
+    for graph, expected_graph in zip(graphs, expected):
+        assert graph.get_nodes_number() == expected_graph.get_nodes_number()
+        assert graph.get_edges_number() == expected_graph.get_edges_number()
+        assert hash(graph) == hash(expected_graph)
@@ -150,14 +150,17 @@ impl EnsmallenGraph {
         let (edges, nodes, name, directed_edge_list) =
             pe!(build_csv_file_reader(edge_path, py_kwargs))?;
 
+        // The graph is built without touching any Python object, so we can
+        // release the GIL and let other Python threads run in the meantime.
+        let gil = pyo3::Python::acquire_gil();
         Ok(EnsmallenGraph {
-            graph: pe!(Graph::from_unsorted_csv(
+            graph: pe!(gil.python().allow_threads(|| Graph::from_unsorted_csv(
                 edges,
                 nodes,
                 directed,
                 directed_edge_list,
                 name,
-            ))?,
+            )))?,
         })
     }
 
@@ -310,8 +313,11 @@ impl EnsmallenGraph {
         let (edges, nodes, name, directed_edge_list) =
             pe!(build_csv_file_reader(edge_path, py_kwargs))?;
 
+        // The graph is built without touching any Python object, so we can
+        // release the GIL and let other Python threads run in the meantime.
+        let gil = pyo3::Python::acquire_gil();
         Ok(EnsmallenGraph {
-            graph: pe!(Graph::from_sorted_csv(
+            graph: pe!(gil.python().allow_threads(|| Graph::from_sorted_csv(
                 edges,
                 nodes,
                 directed,
@@ -319,7 +325,7 @@ impl EnsmallenGraph {
                 edges_number,
                 nodes_number,
                 name
-            ))?,
+            )))?,
         })
     }
 }
@@ -2,7 +2,7 @@ use graph::{Graph, NodeT};
 use numpy::{PyArray1, PyArray2};
 use pyo3::prelude::*;
 
-#[pyclass]
+#[pyclass(weakref)]
 #[derive(Clone)]
 pub(crate) struct EnsmallenGraph {
     pub(crate) graph: Graph,
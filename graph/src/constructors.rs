@@ -244,6 +244,31 @@ pub(crate) fn parse_sorted_edges<'a>(
         }))
 }
 
+/// Returns iterator over the given edge and, if required, its reversed edge.
+///
+/// The reversed edge is only added for undirected graphs loaded from an
+/// undirected edge list, and never for self-loops. No vector is allocated
+/// for each edge, as it would be when collecting the edges with a vec!.
+///
+/// # Arguments
+///
+/// * `tuple`: Result<Quadruple, String> - The edge to yield.
+/// * `directed`: bool - Whether the graph is directed.
+/// * `directed_edge_list`: bool - Whether the edge list is directed.
+fn with_reversed_edge(
+    tuple: Result<Quadruple, String>,
+    directed: bool,
+    directed_edge_list: bool,
+) -> impl Iterator<Item = Result<Quadruple, String>> {
+    let reversed_edge = match &tuple {
+        Ok((src, dst, edt, weight)) if !directed && src != dst && !directed_edge_list => {
+            Some(Ok((*dst, *src, *edt, *weight)))
+        }
+        _ => None,
+    };
+    std::iter::once(tuple).chain(reversed_edge)
+}
+
 pub(crate) fn parse_unsorted_quadruples(
     mut edges: Vec<Quadruple>,
     verbose: bool,
@@ -267,16 +292,7 @@ pub(crate) fn parse_integer_unsorted_edges<'a>(
     verbose: bool,
 ) -> Result<(usize, impl Iterator<Item = Result<Quadruple, String>> + 'a), String> {
     let edge_quadruples: Vec<Quadruple> = edges_iter
-        .flat_map(|tuple| match tuple {
-            Ok((src, dst, edt, weight)) => {
-                if !directed && src != dst && !directed_edge_list {
-                    vec![Ok((src, dst, edt, weight)), Ok((dst, src, edt, weight))]
-                } else {
-                    vec![Ok((src, dst, edt, weight))]
-                }
-            }
-            Err(e) => vec![Err(e)],
-        })
+        .flat_map(|tuple| with_reversed_edge(tuple, directed, directed_edge_list))
         .collect::<Result<Vec<Quadruple>, String>>()?;
 
     Ok(parse_unsorted_quadruples(edge_quadruples, verbose))
@@ -315,16 +331,7 @@ pub(crate) fn parse_string_unsorted_edges<'a>(
                 Box::new(edges_iter.map_ok(|(src, dst, _, weight)| (src, dst, None, weight)))
             };
         let edge_quadruples: Vec<Quadruple> = edges_iter
-            .flat_map(|tuple| match tuple {
-                Ok((src, dst, edt, weight)) => {
-                    if !directed && src != dst && !directed_edge_list {
-                        vec![Ok((src, dst, edt, weight)), Ok((dst, src, edt, weight))]
-                    } else {
-                        vec![Ok((src, dst, edt, weight))]
-                    }
-                }
-                Err(e) => vec![Err(e)],
-            })
+            .flat_map(|tuple| with_reversed_edge(tuple, directed, directed_edge_list))
             .collect::<Result<Vec<Quadruple>, String>>()?;
 
         parse_unsorted_quadruples(edge_quadruples, verbose)
@@ -70,11 +70,29 @@ impl CSVFileReader {
     }
 
     /// Read the whole file and return how many rows it has.
+    ///
+    /// The newlines are counted directly on the buffered bytes, without
+    /// decoding and allocating each line as a string.
     pub(crate) fn count_rows(&self) -> usize {
+        let mut reader = BufReader::new(File::open(&self.path).unwrap());
+        let mut rows_number = 0;
+        let mut last_byte = b'\n';
+        loop {
+            let buffer = reader.fill_buf().unwrap();
+            if buffer.is_empty() {
+                break;
+            }
+            rows_number += buffer.iter().filter(|&&byte| byte == b'\n').count();
+            last_byte = buffer[buffer.len() - 1];
+            let consumed = buffer.len();
+            reader.consume(consumed);
+        }
+        // The last line is counted even when not terminated by a newline.
+        if last_byte != b'\n' {
+            rows_number += 1;
+        }
         std::cmp::min(
-            BufReader::new(File::open(&self.path).unwrap())
-                .lines()
-                .count(),
+            rows_number,
             self.max_rows_number.unwrap_or(u64::MAX) as usize
         )
     }
@@ -878,6 +878,24 @@ class GraphRepository:
         ---------------------
         Formatted model of init file.
         """
+        method_names = self.add_tabs(self.format_lines(" ".join([
+            '"{}",'.format(graph_method_name)
+            for graph_method_name in graph_method_names
+        ])))
+
+        if not self.has_graph_retrieval_files():
+            with open(
+                "{}/models/lazy_init_file_model.py".format(
+                    os.path.dirname(os.path.abspath(__file__))),
+                "r"
+            ) as f:
+                return f.read().format(
+                    method_names=method_names,
+                    first_method_name=graph_method_names[0],
+                    repository_package_name=self.repository_package_name,
+                    repository_name=self.get_formatted_repository_name()
+                )
+
         import_pattern = "from .{graph_file_name} import {graph_method_name}"
         imports = "\n".join([
             import_pattern.format(
@@ -889,10 +907,6 @@ class GraphRepository:
                 graph_file_names
             )
         ])
-        method_names = self.add_tabs(self.format_lines(" ".join([
-            '"{}",'.format(graph_method_name)
-            for graph_method_name in graph_method_names
-        ])))
 
         with open(
             "{}/models/init_file_model.py".format(
@@ -902,9 +916,49 @@ class GraphRepository:
             return f.read().format(
                 imports=imports,
                 method_names=method_names,
+                first_method_name=graph_method_names[0],
+                repository_package_name=self.repository_package_name,
+                repository_name=self.get_formatted_repository_name()
+            )
+
+    def format_init_stub_file(self, graph_method_names: List[str]) -> str:
+        """Return formatted type stubs of the lazily built init file.
+
+        Parameters
+        ---------------------
+        graph_method_names: List[str],
+            Names of the methods made available by the init file.
+
+        Returns
+        ---------------------
+        Formatted model of the init stub file.
+        """
+        # The graphs are made available as retrieval method instances,
+        # which also offer their metadata, download and cache_clear.
+        stub_pattern = "{graph_method_name}: GraphRetrievalMethod"
+        method_stubs = "\n".join([
+            stub_pattern.format(graph_method_name=graph_method_name)
+            for graph_method_name in sorted(set(graph_method_names))
+        ])
+        with open(
+            "{}/models/lazy_init_stub_model.pyi".format(
+                os.path.dirname(os.path.abspath(__file__))),
+            "r"
+        ) as f:
+            return f.read().format(
+                method_stubs=method_stubs,
                 repository_name=self.get_formatted_repository_name()
             )
 
+    def has_graph_retrieval_files(self) -> bool:
+        """Return whether each graph is retrieved from its own module.
+
+        When this is false, no module is written for the graphs: their
+        retrieval methods are built on first access by the init file,
+        and their documentation is rendered from the stored metadata.
+        """
+        return True
+
     def build_all(self):
         """Build graph retrieval methods."""
         graph_method_names = []
@@ -913,42 +967,58 @@ class GraphRepository:
             "bindings/python/ensmallen_graph/datasets",
             self.repository_package_name,
         )
-        for graph_report_path in tqdm(
-            glob("{}/*.json.gz".format(self.build_graph_reports_directory())),
+        graphs_data = [
+            compress_json.load(graph_report_path)
+            for graph_report_path in tqdm(
+                glob("{}/*.json.gz".format(self.build_graph_reports_directory())),
+                desc="Loading graph reports for {}".format(self.name),
+                leave=False
+            )
+        ]
+        # All the method names are checked before writing any file, so that
+        # an invalid name does not leave the datasets partially rebuilt.
+        for graph_data in graphs_data:
+            graph_method_name = self.build_stored_graph_name(
+                graph_data["graph_name"]
+            )
+            if not graph_method_name.isidentifier():
+                raise ValueError(
+                    (
+                        "The method name `{}` built for the graph `{}` "
+                        "is not a valid Python identifier."
+                    ).format(graph_method_name, graph_data["graph_name"])
+                )
+        for graph_data in tqdm(
+            graphs_data,
             desc="Building graph retrieval methods for {}".format(self.name),
             leave=False
         ):
-            graph_data = compress_json.load(graph_report_path)
-            graph_retrieval_file = self.format_graph_retrieval_file(
-                graph_name=graph_data["graph_name"],
-                report=self.format_report(
-                    graph_data["graph_textual_report"],
-                    graph_data["datetime"]
-                ),
-                references=graph_data["citations"],
+            graph_method_name = self.build_stored_graph_name(
+                graph_data["graph_name"]
             )
-            target_path = os.path.join(
-                target_directory_path,
-                "{}.py".format(
-                    self.build_stored_graph_name(
-                        graph_data["graph_name"]).lower()
+            if self.has_graph_retrieval_files():
+                graph_retrieval_file = self.format_graph_retrieval_file(
+                    graph_name=graph_data["graph_name"],
+                    report=self.format_report(
+                        graph_data["graph_textual_report"],
+                        graph_data["datetime"]
+                    ),
+                    references=graph_data["citations"],
                 )
-            )
-            graph_method_names.append(
-                self.build_stored_graph_name(graph_data["graph_name"])
-            )
-            graph_file_names.append(
-                self.build_stored_graph_name(graph_data["graph_name"]).lower()
-            )
+                target_path = os.path.join(
+                    target_directory_path,
+                    "{}.py".format(graph_method_name.lower())
+                )
+                os.makedirs(target_directory_path, exist_ok=True)
+                with open(target_path, "w") as f:
+                    f.write(graph_retrieval_file)
+            graph_method_names.append(graph_method_name)
+            graph_file_names.append(graph_method_name.lower())
             target_json_path = os.path.join(
                 target_directory_path,
-                "{}.json.gz".format(
-                    self.build_stored_graph_name(graph_data["graph_name"])
-                )
+                "{}.json.gz".format(graph_method_name)
             )
             os.makedirs(target_directory_path, exist_ok=True)
-            with open(target_path, "w") as f:
-                f.write(graph_retrieval_file)
             compress_json.dump(graph_data, target_json_path)
         init_path = os.path.join(
             target_directory_path,
@@ -959,3 +1029,6 @@ class GraphRepository:
                 graph_method_names,
                 graph_file_names
             ))
+        if not self.has_graph_retrieval_files():
+            with open("{}i".format(init_path), "w") as f:
+                f.write(self.format_init_stub_file(graph_method_names))
@@ -1,28 +1,19 @@
-"""
-This file offers the methods to automatically retrieve the graph {graph_name}.
-
-The graph is automatically retrieved from the {repository_name} repository. 
-
-{description}
-
-{report}
-
-{references}
-
-{usage_example}
-"""
-from typing import Dict
+"""This file offers the methods to automatically retrieve the graph {graph_name}."""
+from typing import Dict, TYPE_CHECKING
 {imports}
 from ..automatic_graph_retrieval import AutomaticallyRetrievedGraph
-from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+if TYPE_CHECKING:
+    from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
 
 
 def {graph_method_name}(
     directed: bool = False,
     verbose: int = 2,
-    cache_path: str = "graphs/{repository_package_name}",
+    cache_path: str = None,
+    cache: bool = True,
     **additional_graph_kwargs: Dict
-) -> EnsmallenGraph:
+) -> "EnsmallenGraph":
     """Return new instance of the {graph_name} graph.
 
     The graph is automatically retrieved from the {repository_name} repository. 
@@ -37,8 +28,13 @@ def {graph_method_name}(
     verbose: int = 2,
         Wether to show loading bars during the retrieval and building
         of the graph.
-    cache_path: str = "graphs",
+    cache_path: str = None,
         Where to store the downloaded graphs.
+        By default, the graphs are stored in `graphs/{repository_package_name}`.
+    cache: bool = True,
+        Wether to return the instance of the graph already retrieved
+        with the same parameters, if any. Disable it to get a new
+        instance, for instance to modify it in place with `enable`.
     additional_graph_kwargs: Dict,
         Additional graph kwargs.
 
@@ -58,5 +54,6 @@ def {graph_method_name}(
         directed=directed,
         verbose=verbose,
         cache_path=cache_path,
+        cache=cache,
         additional_graph_kwargs=additional_graph_kwargs{callbacks_data}
     )()
@@ -0,0 +1,130 @@
+"""This sub-module offers methods to automatically retrieve the graphs from {repository_name} repository.
+
+The graph retrieval methods are built on first access from the names
+listed in `__all__` and the metadata stored alongside this file.
+"""
+from typing import Dict, List, TYPE_CHECKING
+
+from ..graph_retrieval_method import GraphRetrievalMethod
+from ..parallel_graph_retrieval import load_many_graphs, prefetch_graphs
+
+if TYPE_CHECKING:
+    from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+
+
+def __getattr__(name: str) -> GraphRetrievalMethod:
+    """Return the method to retrieve the graph with the given name.
+
+    Parameters
+    -------------------
+    name: str,
+        The name of the graph retrieval method, for instance `"{first_method_name}"`.
+
+    Raises
+    -------------------
+    AttributeError,
+        If the requested graph is not available.
+
+    Returns
+    -------------------
+    The method to retrieve the requested graph.
+    """
+    if name not in AVAILABLE_GRAPHS:
+        raise AttributeError(
+            "module {{!r}} has no attribute {{!r}}".format(__name__, name)
+        )
+    graph_retrieval_method = GraphRetrievalMethod(
+        graph_method_name=name,
+        dataset="{repository_package_name}",
+        repository_name="{repository_name}"
+    )
+    # We store the method in the module so that the following accesses
+    # do not go through this function anymore.
+    globals()[name] = graph_retrieval_method
+    return graph_retrieval_method
+
+
+def __dir__() -> List[str]:
+    """Return the names available in this module."""
+    return sorted(set(globals()) | AVAILABLE_GRAPHS)
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = None,
+    **kwargs: Dict
+) -> Dict[str, "EnsmallenGraph"]:
+    """Return dictionary with the requested graphs, retrieved in parallel.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to retrieve, for instance `["{first_method_name}"]`.
+    max_workers: int = None,
+        Number of threads to use.
+        By default, one per graph up to the number of available CPUs.
+    **kwargs: Dict,
+        The kwargs to pass to each graph retrieval method.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+
+    Returns
+    -------------------
+    Dictionary with the retrieved graphs, by graph name.
+    """
+    return load_many_graphs(
+        {{
+            # The methods already built are looked up in the module, so
+            # that they are not replaced by new instances.
+            graph_name: globals().get(graph_name) or __getattr__(graph_name)
+            for graph_name in graph_names
+            if graph_name in AVAILABLE_GRAPHS
+        }},
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = 6,
+    **kwargs: Dict
+):
+    """Download the files of the requested graphs in parallel.
+
+    The graphs are not built: the following calls to their retrieval
+    methods will find their files already in the cache path.
+
+    Parameters
+    -------------------
+    graph_names: List[str],
+        The names of the graphs to download, for instance `["{first_method_name}"]`.
+    max_workers: int = 6,
+        Number of concurrent downloads.
+    **kwargs: Dict,
+        The kwargs to pass to each graph download, such as the cache path.
+
+    Raises
+    -------------------
+    ValueError,
+        If any of the requested graphs is not available.
+    """
+    prefetch_graphs(
+        "{repository_package_name}",
+        AVAILABLE_GRAPHS,
+        graph_names,
+        max_workers=max_workers,
+        **kwargs
+    )
+
+
+__all__ = [
+{method_names}
+]
+
+# Names of the graphs available in this sub-module.
+AVAILABLE_GRAPHS = frozenset(__all__)
@@ -0,0 +1,23 @@
+"""Type stubs of the methods to retrieve the graphs from {repository_name} repository."""
+from typing import Dict, FrozenSet, List
+
+from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
+from ..graph_retrieval_method import GraphRetrievalMethod
+
+AVAILABLE_GRAPHS: FrozenSet[str]
+
+
+def load_many(
+    graph_names: List[str],
+    max_workers: int = ...,
+    **kwargs: Dict
+) -> Dict[str, EnsmallenGraph]: ...
+
+
+def prefetch(
+    graph_names: List[str],
+    max_workers: int = ...,
+    **kwargs: Dict
+) -> None: ...
+
+{method_stubs}
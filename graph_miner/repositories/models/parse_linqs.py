@@ -1,13 +1,16 @@
 """Methods to parse the incidence matrix from LINQS."""
 import re
 import os
+from typing import TYPE_CHECKING
 import pandas as pd
 import numpy as np
-from ensmallen_graph import EnsmallenGraph
 from tqdm.auto import tqdm
 
+if TYPE_CHECKING:
+    from ...ensmallen_graph import EnsmallenGraph  # pylint: disable=import-error
 
-def get_words_data(graph: EnsmallenGraph) -> pd.DataFrame:
+
+def get_words_data(graph: "EnsmallenGraph") -> pd.DataFrame:
     """Return dataframe with words features.
     
     Parameters
@@ -50,6 +50,15 @@ class NetworkRepositoryGraphRepository(GraphRepository):
         """Return formatted repository name."""
         return "NetworkRepository"
 
+    def has_graph_retrieval_files(self) -> bool:
+        """Return whether each graph is retrieved from its own module.
+
+        The NetworkRepository graphs are over a thousand and their retrieval
+        methods only differ by the graph name, so these are built on first
+        access.
+        """
+        return False
+
     def get_graph_name(self, graph_data) -> str:
         """Return built graph name.
 
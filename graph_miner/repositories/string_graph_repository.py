@@ -139,6 +139,14 @@ class StringGraphRepository(GraphRepository):
             "weights_column": "combined_score",
         }
 
+    def has_graph_retrieval_files(self) -> bool:
+        """Return whether each graph is retrieved from its own module.
+
+        The STRING graphs are thousands and their retrieval methods only
+        differ by the graph name, so these are built on first access.
+        """
+        return False
+
     def get_graph_list(self) -> List[str]:
         """Return list of graph names."""
         return [